@@ -14,7 +14,8 @@ import sys
 from datetime import datetime, timedelta, timezone
 from typing import List, Optional
 
-from fastapi import APIRouter, HTTPException, Query, Response
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from zoneinfo import ZoneInfo
 
@@ -119,6 +120,7 @@ class CallRecordResponse(BaseModel):
     caller_audio_format: str = "ulaw"
     codec_alignment_ok: bool = True
     barge_in_count: int = 0
+    latency_trace: dict = {}
     created_at: Optional[str] = None
 
 
@@ -129,6 +131,7 @@ class CallListResponse(BaseModel):
     page: int
     page_size: int
     total_pages: int
+    next_cursor: Optional[str] = None
 
 
 class CallStatsResponse(BaseModel):
@@ -152,6 +155,27 @@ class CallStatsResponse(BaseModel):
     active_calls: int = 0
 
 
+class CallSearchResult(BaseModel):
+    """A call matching a transcript search."""
+    call: CallRecordSummaryResponse
+    score: float
+    snippet: str
+    turn_index: int
+    role: Optional[str] = None
+    kind: str = "turn"
+    match_count: int = 1
+
+
+class CallSearchResponse(BaseModel):
+    """Response model for transcript search results."""
+    query: str
+    results: List[CallSearchResult]
+    total: int
+    page: int
+    page_size: int
+    total_pages: int
+
+
 class FilterOptionsResponse(BaseModel):
     """Response model for filter dropdown options."""
     providers: List[str] = []
@@ -213,6 +237,7 @@ def _record_to_response(record) -> CallRecordResponse:
         caller_audio_format=record.caller_audio_format,
         codec_alignment_ok=record.codec_alignment_ok,
         barge_in_count=record.barge_in_count,
+        latency_trace=getattr(record, "latency_trace", None) or {},
         created_at=record.created_at.isoformat() if record.created_at else None,
     )
 
@@ -256,17 +281,20 @@ async def list_calls(
     max_duration: Optional[float] = Query(None, description="Maximum duration in seconds"),
     order_by: str = Query("start_time", description="Column to order by"),
     order_dir: str = Query("DESC", description="Order direction (ASC/DESC)"),
+    cursor: Optional[str] = Query(None, description="Keyset cursor from a previous response (start_time order only)"),
 ):
     """
     List call history records with pagination and filtering.
+
+    When ordering by start_time, responses carry a ``next_cursor``; passing it back as
+    ``cursor`` fetches the following page by keyset instead of OFFSET, which stays fast at
+    any depth.
     """
     store = _get_call_history_store()
     
     parsed_start = _parse_datetime_param(start_date, end_of_day_if_date_only=False)
     parsed_end = _parse_datetime_param(end_date, end_of_day_if_date_only=True)
-    
-    # Get total count (with all filters for accurate pagination)
-    total = await store.count(
+    filters = dict(
         start_date=parsed_start,
         end_date=parsed_end,
         caller_number=caller_number,
@@ -280,26 +308,35 @@ async def list_calls(
         max_duration=max_duration,
     )
     
-    # Get paginated records
-    offset = (page - 1) * page_size
-    records = await store.list(
-        limit=page_size,
-        offset=offset,
-        start_date=parsed_start,
-        end_date=parsed_end,
-        caller_number=caller_number,
-        caller_name=caller_name,
-        provider_name=provider_name,
-        pipeline_name=pipeline_name,
-        context_name=context_name,
-        outcome=outcome,
-        has_tool_calls=has_tool_calls,
-        min_duration=min_duration,
-        max_duration=max_duration,
-        order_by=order_by,
-        order_dir=order_dir,
-        include_details=False,
-    )
+    # Get total count (with all filters for accurate pagination)
+    total = await store.count(**filters)
+    
+    next_cursor = None
+    if cursor:
+        try:
+            records, next_cursor = await store.list_page(
+                limit=page_size,
+                cursor=cursor,
+                order_dir=order_dir,
+                include_details=False,
+                **filters,
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+    else:
+        # Get paginated records
+        offset = (page - 1) * page_size
+        records = await store.list(
+            limit=page_size,
+            offset=offset,
+            order_by=order_by,
+            order_dir=order_dir,
+            include_details=False,
+            **filters,
+        )
+        if order_by == "start_time" and len(records) == page_size and records[-1].start_time:
+            from src.core.call_history import encode_cursor
+            next_cursor = encode_cursor(records[-1].start_time.isoformat(), records[-1].id)
     
     total_pages = (total + page_size - 1) // page_size if total > 0 else 1
     
@@ -309,6 +346,7 @@ async def list_calls(
         page=page,
         page_size=page_size,
         total_pages=total_pages,
+        next_cursor=next_cursor,
     )
 
 
@@ -377,6 +415,74 @@ async def get_filter_options():
     )
 
 
+@router.get("/calls/search", response_model=CallSearchResponse)
+async def search_calls(
+    q: str = Query(..., min_length=1, description="Words to find in transcripts/tool calls (term* for prefix)"),
+    page: int = Query(1, ge=1, description="Page number"),
+    page_size: int = Query(20, ge=1, le=100, description="Items per page"),
+    start_date: Optional[str] = Query(None, description="Filter by start date (ISO format)"),
+    end_date: Optional[str] = Query(None, description="Filter by end date (ISO format)"),
+    caller_number: Optional[str] = Query(None, description="Filter by caller number (partial match)"),
+    caller_name: Optional[str] = Query(None, description="Filter by caller name (partial match)"),
+    provider_name: Optional[str] = Query(None, description="Filter by provider"),
+    pipeline_name: Optional[str] = Query(None, description="Filter by pipeline"),
+    context_name: Optional[str] = Query(None, description="Filter by context"),
+    outcome: Optional[str] = Query(None, description="Filter by outcome"),
+    has_tool_calls: Optional[bool] = Query(None, description="Filter calls with tool executions"),
+    min_duration: Optional[float] = Query(None, description="Minimum duration in seconds"),
+    max_duration: Optional[float] = Query(None, description="Maximum duration in seconds"),
+):
+    """
+    Full-text search over call transcripts and tool calls.
+
+    Results are ranked by relevance (one entry per call) and include a highlighted snippet of
+    the best-matching turn. Accepts the same filters as the call list.
+    """
+    store = _get_call_history_store()
+    
+    parsed_start = _parse_datetime_param(start_date, end_of_day_if_date_only=False)
+    parsed_end = _parse_datetime_param(end_date, end_of_day_if_date_only=True)
+    
+    hits, total = await store.search_transcripts(
+        q,
+        limit=page_size,
+        offset=(page - 1) * page_size,
+        start_date=parsed_start,
+        end_date=parsed_end,
+        caller_number=caller_number,
+        caller_name=caller_name,
+        provider_name=provider_name,
+        pipeline_name=pipeline_name,
+        context_name=context_name,
+        outcome=outcome,
+        has_tool_calls=has_tool_calls,
+        min_duration=min_duration,
+        max_duration=max_duration,
+    )
+    
+    total_pages = (total + page_size - 1) // page_size if total > 0 else 1
+    
+    return CallSearchResponse(
+        query=q,
+        results=[
+            CallSearchResult(
+                call=_record_to_summary_response(hit.record),
+                score=hit.score,
+                snippet=hit.snippet,
+                turn_index=hit.turn_index,
+                role=hit.role,
+                kind=hit.kind,
+                match_count=hit.match_count,
+            )
+            for hit in hits
+        ],
+        total=total,
+        page=page,
+        page_size=page_size,
+        total_pages=total_pages,
+    )
+
+
 @router.get("/calls/{record_id}", response_model=CallRecordResponse)
 async def get_call(record_id: str):
     """
@@ -450,6 +556,60 @@ async def bulk_delete_calls(
     return {"status": "deleted", "count": deleted, "before": cutoff.isoformat()}
 
 
+# Rows fetched per keyset page while streaming exports; bounds export memory.
+_EXPORT_BATCH_SIZE = 500
+
+_CSV_HEADER = [
+    "ID", "Call ID", "Caller Number", "Caller Name",
+    "Start Time", "End Time", "Duration (s)",
+    "Provider", "Pipeline", "Context", "Outcome",
+    "Transfer Destination", "Error Message",
+    "Tool Calls", "Avg Latency (ms)", "Max Latency (ms)",
+    "Total Turns", "Barge-ins"
+]
+
+
+def _record_to_csv_row(r) -> list:
+    return [
+        r.id, r.call_id, r.caller_number or "", r.caller_name or "",
+        r.start_time.isoformat() if r.start_time else "",
+        r.end_time.isoformat() if r.end_time else "",
+        round(r.duration_seconds, 2),
+        r.provider_name, r.pipeline_name or "", r.context_name or "", r.outcome,
+        r.transfer_destination or "", r.error_message or "",
+        len(r.tool_calls), round(r.avg_turn_latency_ms, 2), round(r.max_turn_latency_ms, 2),
+        r.total_turns, r.barge_in_count
+    ]
+
+
+async def _stream_csv(records):
+    """Yield CSV text one keyset batch at a time."""
+    output = io.StringIO()
+    writer = csv.writer(output)
+    writer.writerow(_CSV_HEADER)
+    pending = 0
+    async for r in records:
+        writer.writerow(_record_to_csv_row(r))
+        pending += 1
+        if pending >= _EXPORT_BATCH_SIZE:
+            yield output.getvalue()
+            output.seek(0)
+            output.truncate(0)
+            pending = 0
+    yield output.getvalue()
+
+
+async def _stream_json(records):
+    """Yield a JSON document record by record; total_records is emitted once the count is known."""
+    yield '{\n  "exported_at": ' + json.dumps(datetime.now().isoformat()) + ',\n  "records": ['
+    total = 0
+    async for r in records:
+        prefix = "\n    " if total == 0 else ",\n    "
+        yield prefix + json.dumps(_record_to_response(r).model_dump())
+        total += 1
+    yield ("\n  ]" if total else "]") + f',\n  "total_records": {total}\n}}\n'
+
+
 @router.get("/calls/export/csv")
 async def export_calls_csv(
     start_date: Optional[str] = Query(None, description="Filter by start date (ISO format)"),
@@ -466,16 +626,17 @@ async def export_calls_csv(
 ):
     """
     Export call records as CSV with all filters matching the UI.
+
+    Rows are streamed as they are fetched (keyset pagination), so there is no record cap
+    and memory stays constant regardless of history size.
     """
     store = _get_call_history_store()
     
     parsed_start = _parse_datetime_param(start_date, end_of_day_if_date_only=False)
     parsed_end = _parse_datetime_param(end_date, end_of_day_if_date_only=True)
     
-    # Get all matching records (limit to 10000 for safety)
-    records = await store.list(
-        limit=10000,
-        offset=0,
+    records = store.iter_records(
+        batch_size=_EXPORT_BATCH_SIZE,
         start_date=parsed_start,
         end_date=parsed_end,
         caller_number=caller_number,
@@ -490,39 +651,10 @@ async def export_calls_csv(
         include_details=True,
     )
     
-    # Generate CSV
-    output = io.StringIO()
-    writer = csv.writer(output)
-    
-    # Header
-    writer.writerow([
-        "ID", "Call ID", "Caller Number", "Caller Name",
-        "Start Time", "End Time", "Duration (s)",
-        "Provider", "Pipeline", "Context", "Outcome",
-        "Transfer Destination", "Error Message",
-        "Tool Calls", "Avg Latency (ms)", "Max Latency (ms)",
-        "Total Turns", "Barge-ins"
-    ])
-    
-    # Data rows
-    for r in records:
-        writer.writerow([
-            r.id, r.call_id, r.caller_number or "", r.caller_name or "",
-            r.start_time.isoformat() if r.start_time else "",
-            r.end_time.isoformat() if r.end_time else "",
-            round(r.duration_seconds, 2),
-            r.provider_name, r.pipeline_name or "", r.context_name or "", r.outcome,
-            r.transfer_destination or "", r.error_message or "",
-            len(r.tool_calls), round(r.avg_turn_latency_ms, 2), round(r.max_turn_latency_ms, 2),
-            r.total_turns, r.barge_in_count
-        ])
-    
-    csv_content = output.getvalue()
-    
     filename = f"call_history_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
     
-    return Response(
-        content=csv_content,
+    return StreamingResponse(
+        _stream_csv(records),
         media_type="text/csv",
         headers={"Content-Disposition": f"attachment; filename={filename}"}
     )
@@ -544,16 +676,16 @@ async def export_calls_json(
 ):
     """
     Export call records as JSON with all filters matching the UI.
+
+    The document is streamed record by record; ``total_records`` follows the records array.
     """
     store = _get_call_history_store()
     
     parsed_start = _parse_datetime_param(start_date, end_of_day_if_date_only=False)
     parsed_end = _parse_datetime_param(end_date, end_of_day_if_date_only=True)
     
-    # Get all matching records (limit to 10000 for safety)
-    records = await store.list(
-        limit=10000,
-        offset=0,
+    records = store.iter_records(
+        batch_size=_EXPORT_BATCH_SIZE,
         start_date=parsed_start,
         end_date=parsed_end,
         caller_number=caller_number,
@@ -568,19 +700,10 @@ async def export_calls_json(
         include_details=True,
     )
     
-    # Convert to JSON-serializable format
-    data = {
-        "exported_at": datetime.now().isoformat(),
-        "total_records": len(records),
-        "records": [_record_to_response(r).model_dump() for r in records]
-    }
-    
-    json_content = json.dumps(data, indent=2)
-    
     filename = f"call_history_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
     
-    return Response(
-        content=json_content,
+    return StreamingResponse(
+        _stream_json(records),
         media_type="application/json",
         headers={"Content-Disposition": f"attachment; filename={filename}"}
     )
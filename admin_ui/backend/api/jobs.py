@@ -0,0 +1,88 @@
+"""
+Post-call job queue API endpoints.
+
+Read/repair view over the engine's durable post-call jobs (summary/transcript
+emails, webhooks) stored in the Call History database:
+- Job list with state/kind/call filters + per-state counts
+- Retry a dead-lettered job (fresh attempt budget) or delete a finished one
+
+The engine picks retried jobs up on its next poll; nothing here sends directly.
+"""
+
+import logging
+import os
+import sys
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException, Query
+
+# Add project root to path for imports (mirrors calls.py)
+project_root = os.environ.get("PROJECT_ROOT", "/app/project")
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/jobs", tags=["jobs"])
+
+_STATES = ("pending", "running", "done", "dead")
+
+
+def _get_job_store():
+    try:
+        from src.core.post_call_jobs import get_post_call_job_store
+    except ImportError as e:
+        logger.error("Failed to import post_call_jobs module: %s", e)
+        raise HTTPException(status_code=500, detail="Post-call job module not available")
+    store = get_post_call_job_store()
+    if not store.enabled:
+        raise HTTPException(status_code=503, detail="Post-call jobs unavailable (CALL_HISTORY_ENABLED=false)")
+    return store
+
+
+def _redact_job(job: dict) -> dict:
+    """Drop request headers from webhook payloads (they may carry resolved credentials)."""
+    payload = job.get("payload")
+    if isinstance(payload, dict) and isinstance(payload.get("headers"), dict):
+        job["payload"] = {**payload, "headers": {k: "***" for k in payload["headers"]}}
+    return job
+
+
+@router.get("")
+async def list_jobs(
+    page: int = Query(1, ge=1),
+    page_size: int = Query(50, ge=1, le=200),
+    state: Optional[str] = Query(None),
+    kind: Optional[str] = Query(None),
+    call_id: Optional[str] = Query(None),
+):
+    if state and state not in _STATES:
+        raise HTTPException(status_code=400, detail=f"state must be one of {', '.join(_STATES)}")
+    store = _get_job_store()
+    result = await store.list_jobs(state=state, kind=kind, call_id=call_id, page=page, page_size=page_size)
+    result["jobs"] = [_redact_job(j) for j in result["jobs"]]
+    return result
+
+
+@router.get("/stats")
+async def job_stats():
+    store = _get_job_store()
+    return await store.stats()
+
+
+@router.post("/{job_id}/retry")
+async def retry_job(job_id: str):
+    store = _get_job_store()
+    ok = await store.retry(job_id)
+    if not ok:
+        raise HTTPException(status_code=400, detail="Only dead-lettered jobs can be retried")
+    return {"ok": True}
+
+
+@router.delete("/{job_id}")
+async def delete_job(job_id: str):
+    store = _get_job_store()
+    ok = await store.delete(job_id)
+    if not ok:
+        raise HTTPException(status_code=400, detail="Job not found or currently running")
+    return {"ok": True}
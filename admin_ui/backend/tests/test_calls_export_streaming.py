@@ -0,0 +1,49 @@
+import csv
+import io
+import json
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+PROJECT_ROOT = BACKEND_ROOT.parents[1]
+sys.path.insert(0, str(BACKEND_ROOT))
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from api.calls import _EXPORT_BATCH_SIZE, _stream_csv, _stream_json  # noqa: E402
+from src.core.call_history import CallRecord  # noqa: E402
+
+
+async def _records(n: int):
+    for i in range(n):
+        yield CallRecord(
+            call_id=f"call-{i}",
+            start_time=datetime(2026, 1, 1, tzinfo=timezone.utc),
+            tool_calls=[{"name": "transfer", "params": "{\"target\": \"6000\"}"}],
+        )
+
+
+async def _collect(stream) -> list:
+    return [chunk async for chunk in stream]
+
+
+@pytest.mark.asyncio
+async def test_csv_export_streams_in_batches() -> None:
+    chunks = await _collect(_stream_csv(_records(_EXPORT_BATCH_SIZE * 2 + 3)))
+    assert len(chunks) == 3
+    rows = list(csv.reader(io.StringIO("".join(chunks))))
+    assert rows[0][0] == "ID"
+    assert len(rows) == _EXPORT_BATCH_SIZE * 2 + 4
+    assert rows[1][1] == "call-0"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("count", [0, 1, 3])
+async def test_json_export_streams_valid_document(count: int) -> None:
+    body = json.loads("".join(await _collect(_stream_json(_records(count)))))
+    assert body["total_records"] == count
+    assert [r["call_id"] for r in body["records"]] == [f"call-{i}" for i in range(count)]
+    if count:
+        assert body["records"][0]["tool_calls"][0]["params"] == {"target": "6000"}
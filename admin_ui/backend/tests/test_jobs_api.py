@@ -0,0 +1,48 @@
+import sys
+from pathlib import Path
+
+import pytest
+from fastapi import HTTPException
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+PROJECT_ROOT = BACKEND_ROOT.parents[1]
+sys.path.insert(0, str(BACKEND_ROOT))
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from api import jobs  # noqa: E402
+from src.core.post_call_jobs import PostCallJobStore  # noqa: E402
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    monkeypatch.setenv("CALL_HISTORY_ENABLED", "true")
+    store = PostCallJobStore(db_path=str(tmp_path / "call_history.db"))
+    monkeypatch.setattr(jobs, "_get_job_store", lambda: store)
+    return store
+
+
+@pytest.mark.asyncio
+async def test_list_jobs_redacts_webhook_headers(store) -> None:
+    store.enqueue_sync(
+        "webhook",
+        {"name": "crm", "url": "https://crm.example.com/hook", "headers": {"Authorization": "Bearer x"}},
+        idempotency_key="k1",
+        call_id="call-1",
+    )
+    body = await jobs.list_jobs(page=1, page_size=50, state=None, kind=None, call_id=None)
+    assert body["total"] == 1
+    assert body["jobs"][0]["payload"]["headers"] == {"Authorization": "***"}
+    assert (await jobs.job_stats())["by_state"]["pending"] == 1
+
+
+@pytest.mark.asyncio
+async def test_only_dead_jobs_can_be_retried(store) -> None:
+    job_id = store.enqueue_sync("email", {}, idempotency_key="k2")["id"]
+    with pytest.raises(HTTPException) as exc:
+        await jobs.retry_job(job_id)
+    assert exc.value.status_code == 400
+
+    store.claim_sync(limit=1, lease_seconds=60)
+    store.fail_sync(job_id, "SMTPDataError", retry_in_seconds=None)
+    assert await jobs.retry_job(job_id) == {"ok": True}
+    assert (await jobs.list_jobs(page=1, page_size=50, state="pending", kind=None, call_id=None))["total"] == 1
@@ -6,6 +6,7 @@ import AppShell from './components/layout/AppShell';
 import Dashboard from './pages/Dashboard';
 import CallHistoryPage from './pages/CallHistoryPage';
 import CallSchedulingPage from './pages/CallSchedulingPage';
+import PostCallJobsPage from './pages/PostCallJobsPage';
 import axios from 'axios';
 
 // Auth
@@ -138,6 +139,7 @@ function App() {
                                             <Route path="/" element={<Dashboard />} />
                                             <Route path="/history" element={<CallHistoryPage />} />
                                             <Route path="/scheduling" element={<CallSchedulingPage />} />
+                                            <Route path="/jobs" element={<PostCallJobsPage />} />
 
                                             {/* Core Configuration */}
                                             <Route path="/providers" element={<ProvidersPage />} />
@@ -24,6 +24,7 @@ import {
     ArrowUpCircle,
     Phone,
     CalendarClock,
+    Send,
     LogOut,
     Lock
 } from 'lucide-react';
@@ -78,6 +79,7 @@ const Sidebar = () => {
                     <SidebarItem to="/" icon={LayoutDashboard} label="Dashboard" end />
                     <SidebarItem to="/history" icon={Phone} label="Call History" />
                     <SidebarItem to="/scheduling" icon={CalendarClock} label="Call Scheduling" />
+                    <SidebarItem to="/jobs" icon={Send} label="Post-Call Jobs" />
                     <SidebarItem to="/wizard" icon={Zap} label="Setup Wizard" />
                 </SidebarGroup>
 
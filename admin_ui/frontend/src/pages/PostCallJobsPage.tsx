@@ -0,0 +1,216 @@
+import React, { useEffect, useState } from 'react';
+import axios from 'axios';
+import { toast } from 'sonner';
+import { RefreshCw, RotateCcw, Trash2 } from 'lucide-react';
+import { useConfirmDialog } from '../hooks/useConfirmDialog';
+
+interface PostCallJob {
+    id: string;
+    kind: string;
+    call_id: string | null;
+    state: 'pending' | 'running' | 'done' | 'dead';
+    attempts: number;
+    max_attempts: number;
+    next_run_at_utc: string;
+    last_error: string | null;
+    created_at_utc: string;
+    finished_at_utc: string | null;
+    payload: Record<string, any>;
+}
+
+const STATES = ['', 'pending', 'running', 'done', 'dead'];
+
+const STATE_CLASS: Record<string, string> = {
+    pending: 'bg-blue-500/10 text-blue-500',
+    running: 'bg-yellow-500/10 text-yellow-600',
+    done: 'bg-green-500/10 text-green-600',
+    dead: 'bg-red-500/10 text-red-500',
+};
+
+const formatDate = (value: string | null) => (value ? new Date(value).toLocaleString() : '-');
+
+const describe = (job: PostCallJob) => {
+    if (job.kind === 'email') {
+        return `${job.payload?.log_label || 'Email'} → ${job.payload?.recipient || '-'}`;
+    }
+    if (job.kind === 'webhook') {
+        return `${job.payload?.name || 'webhook'} ${job.payload?.method || 'POST'}`;
+    }
+    return job.kind;
+};
+
+const PostCallJobsPage = () => {
+    const { confirm } = useConfirmDialog();
+    const [jobs, setJobs] = useState<PostCallJob[]>([]);
+    const [counts, setCounts] = useState<Record<string, number>>({});
+    const [state, setState] = useState('');
+    const [page, setPage] = useState(1);
+    const [total, setTotal] = useState(0);
+    const [loading, setLoading] = useState(false);
+    const pageSize = 50;
+
+    const fetchJobs = async () => {
+        setLoading(true);
+        try {
+            const [list, stats] = await Promise.all([
+                axios.get('/api/jobs', { params: { page, page_size: pageSize, state: state || undefined } }),
+                axios.get('/api/jobs/stats'),
+            ]);
+            setJobs(list.data.jobs);
+            setTotal(list.data.total);
+            setCounts(stats.data.by_state || {});
+        } catch (err) {
+            console.error('Failed to fetch post-call jobs', err);
+            toast.error('Failed to load post-call jobs');
+        } finally {
+            setLoading(false);
+        }
+    };
+
+    useEffect(() => {
+        fetchJobs();
+        const interval = setInterval(fetchJobs, 5000);
+        return () => clearInterval(interval);
+    }, [state, page]);
+
+    const retryJob = async (id: string) => {
+        try {
+            await axios.post(`/api/jobs/${id}/retry`);
+            toast.success('Job queued for retry');
+            fetchJobs();
+        } catch (err) {
+            toast.error('Failed to retry job');
+        }
+    };
+
+    const deleteJob = async (id: string) => {
+        const confirmed = await confirm({
+            title: 'Delete Job',
+            description: 'Delete this post-call job? It will not be sent.',
+            confirmText: 'Delete',
+            variant: 'destructive'
+        });
+        if (!confirmed) return;
+        try {
+            await axios.delete(`/api/jobs/${id}`);
+            fetchJobs();
+        } catch (err) {
+            toast.error('Failed to delete job');
+        }
+    };
+
+    return (
+        <div className="space-y-6">
+            <div className="flex justify-between items-center">
+                <div>
+                    <h1 className="text-2xl font-bold">Post-Call Jobs</h1>
+                    <p className="text-sm text-muted-foreground">
+                        Summary/transcript emails and webhooks sent after hangup, with retries and dead-lettering.
+                    </p>
+                </div>
+                <div className="flex items-center gap-2">
+                    <select
+                        className="p-2 rounded border border-input bg-background text-sm"
+                        value={state}
+                        onChange={e => { setState(e.target.value); setPage(1); }}
+                    >
+                        {STATES.map(s => (
+                            <option key={s} value={s}>{s ? `${s} (${counts[s] ?? 0})` : 'All states'}</option>
+                        ))}
+                    </select>
+                    <button onClick={fetchJobs} className="p-2 hover:bg-accent rounded-md" title="Refresh">
+                        <RefreshCw className={`w-4 h-4 ${loading ? 'animate-spin' : ''}`} />
+                    </button>
+                </div>
+            </div>
+
+            <div className="bg-card border rounded-lg overflow-x-auto">
+                <table className="w-full min-w-[900px]">
+                    <thead className="bg-muted/50">
+                        <tr>
+                            <th className="text-left px-4 py-3 text-sm font-medium">Job</th>
+                            <th className="text-left px-4 py-3 text-sm font-medium">Call</th>
+                            <th className="text-left px-4 py-3 text-sm font-medium">State</th>
+                            <th className="text-left px-4 py-3 text-sm font-medium">Attempts</th>
+                            <th className="text-left px-4 py-3 text-sm font-medium">Created</th>
+                            <th className="text-left px-4 py-3 text-sm font-medium">Next run / finished</th>
+                            <th className="text-left px-4 py-3 text-sm font-medium">Last error</th>
+                            <th className="text-center px-4 py-3 text-sm font-medium w-24">Actions</th>
+                        </tr>
+                    </thead>
+                    <tbody className="divide-y divide-border">
+                        {jobs.length === 0 && (
+                            <tr>
+                                <td colSpan={8} className="px-4 py-6 text-center text-sm text-muted-foreground">No jobs</td>
+                            </tr>
+                        )}
+                        {jobs.map(job => (
+                            <tr key={job.id} className="hover:bg-muted/30">
+                                <td className="px-4 py-3 text-sm">{describe(job)}</td>
+                                <td className="px-4 py-3 text-sm font-mono">{job.call_id || '-'}</td>
+                                <td className="px-4 py-3">
+                                    <span className={`px-2 py-0.5 rounded text-xs font-medium ${STATE_CLASS[job.state] || ''}`}>
+                                        {job.state}
+                                    </span>
+                                </td>
+                                <td className="px-4 py-3 text-sm">{job.attempts} / {job.max_attempts}</td>
+                                <td className="px-4 py-3 text-sm">{formatDate(job.created_at_utc)}</td>
+                                <td className="px-4 py-3 text-sm">
+                                    {formatDate(job.state === 'pending' ? job.next_run_at_utc : job.finished_at_utc)}
+                                </td>
+                                <td className="px-4 py-3 text-sm text-muted-foreground max-w-xs truncate" title={job.last_error || ''}>
+                                    {job.last_error || '-'}
+                                </td>
+                                <td className="px-4 py-3 text-center w-24">
+                                    {job.state === 'dead' && (
+                                        <button
+                                            onClick={() => retryJob(job.id)}
+                                            className="p-2 hover:bg-accent rounded"
+                                            title="Retry"
+                                        >
+                                            <RotateCcw className="w-4 h-4" />
+                                        </button>
+                                    )}
+                                    {job.state !== 'running' && (
+                                        <button
+                                            onClick={() => deleteJob(job.id)}
+                                            className="p-2 hover:bg-destructive/10 rounded text-destructive"
+                                            title="Delete"
+                                        >
+                                            <Trash2 className="w-4 h-4" />
+                                        </button>
+                                    )}
+                                </td>
+                            </tr>
+                        ))}
+                    </tbody>
+                </table>
+            </div>
+
+            <div className="flex items-center justify-between">
+                <div className="text-sm text-muted-foreground">
+                    {total} job{total === 1 ? '' : 's'}
+                </div>
+                <div className="flex items-center gap-2">
+                    <button
+                        onClick={() => setPage(p => Math.max(1, p - 1))}
+                        disabled={page === 1}
+                        className="px-3 py-1 text-sm border rounded disabled:opacity-50"
+                    >
+                        Previous
+                    </button>
+                    <span className="text-sm">Page {page}</span>
+                    <button
+                        onClick={() => setPage(p => p + 1)}
+                        disabled={page * pageSize >= total}
+                        className="px-3 py-1 text-sm border rounded disabled:opacity-50"
+                    >
+                        Next
+                    </button>
+                </div>
+            </div>
+        </div>
+    );
+};
+
+export default PostCallJobsPage;
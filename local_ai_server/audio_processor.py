@@ -5,9 +5,20 @@ import os
 import subprocess
 import tempfile
 
+import numpy as np
+
 from constants import ULAW_SAMPLE_RATE
 
 
+def _ulaw_decode_table() -> np.ndarray:
+    codes = ~np.arange(256, dtype=np.int32) & 0xFF
+    magnitude = (((codes & 0x0F) << 3) + 0x84) << ((codes & 0x70) >> 4)
+    return np.where(codes & 0x80, 0x84 - magnitude, magnitude - 0x84).astype("<i2")
+
+
+_ULAW_TO_PCM16 = _ulaw_decode_table()
+
+
 class AudioProcessor:
     """Handles audio format conversions for MVP uLaw 8kHz pipeline."""
 
@@ -70,6 +81,11 @@ class AudioProcessor:
             logging.error("Audio resampling failed: %s", exc)
             return input_data
 
+    @staticmethod
+    def ulaw_to_pcm16(ulaw_data: bytes) -> bytes:
+        """Decode G.711 µ-law to PCM16 little-endian at the same sample rate."""
+        return _ULAW_TO_PCM16[np.frombuffer(ulaw_data, dtype=np.uint8)].tobytes()
+
     @staticmethod
     def convert_to_ulaw_8k(input_data: bytes, input_rate: int) -> bytes:
         """Convert audio to uLaw 8kHz format for ARI playback (blocking)."""
@@ -78,6 +78,23 @@ class LocalAIConfig:
     kokoro_api_key: str = ""
     kokoro_api_model: str = "model"
 
+    # Off-loop TTS synthesis (tts_executor): thread workers, plus optional preloaded
+    # worker processes for the Python-heavy Kokoro/MeloTTS backends.
+    tts_threads: int = 2
+    tts_process_workers: int = 0
+
+    # Supervisor mode (supervisor.py): "" = single process, "4" = one shared pool,
+    # "stt=4,llm=1,tts=2" = per-stage pools behind the ws_port front door.
+    workers: str = ""
+    worker_base_port: int = 0
+    worker_preload: bool = True
+
+    # switch_model strategy (model_manager.py): "blue_green" loads changed models next to
+    # the running ones and flips new sessions over; "in_place" tears down and reloads.
+    model_swap: str = "blue_green"
+    swap_memory_headroom_mb: int = 512
+    swap_drain_timeout_sec: float = 900.0
+
     stt_idle_ms: int = 5000
 
     @classmethod
@@ -156,6 +173,14 @@ class LocalAIConfig:
             kokoro_api_base_url=(os.getenv("KOKORO_API_BASE_URL", "") or "").strip(),
             kokoro_api_key=(os.getenv("KOKORO_API_KEY", "") or "").strip(),
             kokoro_api_model=(os.getenv("KOKORO_API_MODEL", "model") or "model").strip(),
+            tts_threads=max(1, int(os.getenv("LOCAL_TTS_THREADS", "2"))),
+            tts_process_workers=max(0, int(os.getenv("LOCAL_TTS_PROCESS_WORKERS", "0"))),
+            workers=(os.getenv("LOCAL_AI_WORKERS", "") or "").strip(),
+            worker_base_port=int(os.getenv("LOCAL_AI_WORKER_BASE_PORT", "0") or 0),
+            worker_preload=_parse_bool(os.getenv("LOCAL_AI_WORKER_PRELOAD", "1"), True),
+            model_swap=(os.getenv("LOCAL_AI_MODEL_SWAP", "blue_green") or "blue_green").strip().lower(),
+            swap_memory_headroom_mb=max(0, int(os.getenv("LOCAL_AI_SWAP_MEMORY_HEADROOM_MB", "512"))),
+            swap_drain_timeout_sec=float(os.getenv("LOCAL_AI_SWAP_DRAIN_TIMEOUT_SEC", "900")),
             stt_idle_ms=int(os.getenv("LOCAL_STT_IDLE_MS", "5000")),
         )
 
@@ -26,6 +26,8 @@ SUPPORTED_MODES = {"full", "stt", "llm", "tts"}
 DEFAULT_MODE = "full"
 ULAW_SAMPLE_RATE = 8000
 PCM16_TARGET_RATE = 16000
+# TTS requests up to this many characters (greetings, short prompts) get queue priority.
+TTS_SHORT_TEXT_CHARS = 60
 
 
 def _normalize_text(value: str) -> str:
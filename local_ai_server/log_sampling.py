@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import os
+from time import monotonic
+from typing import Any, Dict
+
+# Per-frame audio logs (LOCAL_DEBUG=1) are sampled: the first N frames per call and
+# callsite, then every M-th, capped at RATE lines/sec per callsite. This keeps debug
+# logging bounded however many calls share the server.
+_FIRST = int(os.getenv("LOCAL_DEBUG_LOG_FIRST", "3"))
+_EVERY = int(os.getenv("LOCAL_DEBUG_LOG_EVERY", "250"))
+_RATE = float(os.getenv("LOCAL_DEBUG_LOG_RATE", "20"))
+_BURST = 50.0
+_MAX_KEYS = 4096
+
+
+class FrameLogSampler:
+    """First-N-then-every-M sampling plus a token bucket, per callsite."""
+
+    def __init__(self, *, first: int = _FIRST, every: int = _EVERY, rate: float = _RATE, burst: float = _BURST):
+        self.first = first
+        self.every = every
+        self.rate = rate
+        self.burst = burst
+        self._counts: Dict[str, Dict[Any, int]] = {}
+        self._buckets: Dict[str, list] = {}
+
+    def allow(self, site: str, key: Any = None) -> bool:
+        counts = self._counts.get(site)
+        if counts is None:
+            counts = self._counts[site] = {}
+        count = counts.get(key, 0) + 1
+        if count == 1 and len(counts) >= _MAX_KEYS:
+            counts.clear()
+        counts[key] = count
+        if count > self.first and (self.every <= 0 or count % self.every):
+            return False
+        now = monotonic()
+        bucket = self._buckets.get(site)
+        if bucket is None:
+            bucket = self._buckets[site] = [self.burst, now]
+        tokens = min(self.burst, bucket[0] + (now - bucket[1]) * self.rate)
+        bucket[1] = now
+        if tokens < 1.0:
+            bucket[0] = tokens
+            return False
+        bucket[0] = tokens - 1.0
+        return True
+
+    def forget(self, key: Any) -> None:
+        for counts in self._counts.values():
+            counts.pop(key, None)
+
+
+audio_log = FrameLogSampler()
@@ -1,10 +1,7 @@
 from __future__ import annotations
 
-import asyncio
-
-from server import main as run_server
+from server import run as run_server
 
 
 if __name__ == "__main__":
-    asyncio.run(run_server())
-
+    run_server()
@@ -1,52 +1,365 @@
 from __future__ import annotations
 
+import asyncio
 import logging
-from typing import Any, Dict
+import os
+from time import monotonic, time
+from typing import Any, Dict, Iterable, List, Optional, Set
 
 from capabilities import detect_capabilities
 from control_plane import apply_switch_model_request
+from config import LocalAIConfig
 from status_builder import build_status_response
 
+STAGES = ("stt", "llm", "tts")
+
+# Config fields that change what a stage loads. Anything else (temperature, max_tokens,
+# prompts, idle timers) is read per request and only needs _apply_config.
+STAGE_CONFIG_FIELDS: Dict[str, tuple] = {
+    "stt": (
+        "stt_backend",
+        "stt_model_path",
+        "sherpa_model_path",
+        "faster_whisper_model",
+        "faster_whisper_device",
+        "faster_whisper_compute",
+        "faster_whisper_language",
+        "whisper_cpp_model_path",
+        "whisper_cpp_language",
+        "kroko_url",
+        "kroko_api_key",
+        "kroko_language",
+        "kroko_model_path",
+        "kroko_embedded",
+        "kroko_port",
+    ),
+    "llm": (
+        "llm_model_path",
+        "llm_threads",
+        "llm_context",
+        "llm_batch",
+        "llm_gpu_layers",
+        "llm_use_mlock",
+    ),
+    "tts": (
+        "tts_backend",
+        "tts_model_path",
+        "melotts_voice",
+        "melotts_device",
+        "melotts_speed",
+        "kokoro_voice",
+        "kokoro_mode",
+        "kokoro_lang",
+        "kokoro_model_path",
+        "kokoro_api_base_url",
+        "kokoro_api_key",
+        "kokoro_api_model",
+        "tts_process_workers",
+    ),
+}
+
+# Server attributes holding a stage's loaded models (and the locks/executor guarding
+# them). A generation that reuses a stage shares these objects with its predecessor.
+STAGE_MODEL_ATTRS: Dict[str, tuple] = {
+    "stt": (
+        "stt_model",
+        "kroko_backend",
+        "sherpa_backend",
+        "faster_whisper_backend",
+        "whisper_cpp_backend",
+        "_faster_whisper_lock",
+    ),
+    "llm": ("llm_model", "_llm_lock"),
+    "tts": ("tts_model", "kokoro_backend", "melotts_backend", "tts_executor"),
+}
+
+_DRAIN_POLL_SEC = 0.5
+
+
+def stages_to_reload(old: LocalAIConfig, new: LocalAIConfig) -> List[str]:
+    return [
+        stage
+        for stage in STAGES
+        if any(getattr(old, name) != getattr(new, name) for name in STAGE_CONFIG_FIELDS[stage])
+    ]
+
+
+def model_handles(generations: Iterable[Any]) -> Set[int]:
+    """ids of the model objects held by ``generations`` (never freed while referenced)."""
+    handles: Set[int] = set()
+    for generation in generations:
+        for attrs in STAGE_MODEL_ATTRS.values():
+            for attr in attrs:
+                obj = getattr(generation, attr, None)
+                if obj is not None:
+                    handles.add(id(obj))
+    return handles
+
+
+def _path_bytes(path: Optional[str]) -> int:
+    if not path:
+        return 0
+    try:
+        if os.path.isfile(path):
+            return os.path.getsize(path)
+        total = 0
+        for root, _dirs, files in os.walk(path):
+            for name in files:
+                try:
+                    total += os.path.getsize(os.path.join(root, name))
+                except OSError:
+                    pass
+        return total
+    except OSError:
+        return 0
+
+
+def estimate_load_bytes(config: LocalAIConfig, stages: Iterable[str]) -> int:
+    """Rough resident size of the models ``stages`` will load: their files on disk."""
+    total = 0
+    for stage in stages:
+        if stage == "stt":
+            backend = config.stt_backend
+            if backend == "sherpa":
+                total += _path_bytes(config.sherpa_model_path)
+            elif backend == "kroko":
+                total += _path_bytes(config.kroko_model_path) if config.kroko_embedded else 0
+            elif backend == "faster_whisper":
+                # A model name resolves to the HF cache; only local paths can be measured.
+                total += _path_bytes(config.faster_whisper_model)
+            elif backend == "whisper_cpp":
+                total += _path_bytes(config.whisper_cpp_model_path)
+            else:
+                total += _path_bytes(config.stt_model_path)
+        elif stage == "llm":
+            if config.runtime_mode != "minimal":
+                total += _path_bytes(config.llm_model_path)
+        elif stage == "tts":
+            if config.tts_backend == "kokoro" and config.kokoro_mode == "local":
+                # Each TTS worker process holds its own copy (tts_executor).
+                total += _path_bytes(config.kokoro_model_path) * (1 + config.tts_process_workers)
+            elif config.tts_backend == "piper":
+                total += _path_bytes(config.tts_model_path)
+    return total
+
+
+def _read_int(path: str) -> Optional[int]:
+    try:
+        with open(path, "r", encoding="utf-8") as handle:
+            raw = handle.read().strip()
+    except OSError:
+        return None
+    return int(raw) if raw.isdigit() else None
+
+
+def available_memory_bytes() -> Optional[int]:
+    """Memory the process can still allocate: MemAvailable, capped by the cgroup limit."""
+    available: Optional[int] = None
+    try:
+        with open("/proc/meminfo", "r", encoding="utf-8") as handle:
+            for line in handle:
+                if line.startswith("MemAvailable:"):
+                    available = int(line.split()[1]) * 1024
+                    break
+    except (OSError, ValueError, IndexError):
+        pass
+    for limit_file, usage_file in (
+        ("/sys/fs/cgroup/memory.max", "/sys/fs/cgroup/memory.current"),
+        ("/sys/fs/cgroup/memory/memory.limit_in_bytes", "/sys/fs/cgroup/memory/memory.usage_in_bytes"),
+    ):
+        limit, usage = _read_int(limit_file), _read_int(usage_file)
+        # cgroup v1 reports "no limit" as a huge page-aligned number.
+        if limit is not None and usage is not None and limit < (1 << 60):
+            headroom = max(0, limit - usage)
+            available = headroom if available is None else min(available, headroom)
+            break
+    return available
+
+
+def _mb(value: int) -> int:
+    return int(value / (1024 * 1024))
+
 
 class ModelManager:
     def __init__(self, server: Any):
         self._server = server
 
+    def _active(self) -> Any:
+        return self._server.front.active
+
     async def switch_model(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        dry_run = bool(data.get("dry_run", False))
-        new_config, changed = apply_switch_model_request(self._server.config, data)
-
-        if not changed:
-            return {
-                "type": "switch_response",
-                "status": "no_change",
-                "message": "No valid model parameters provided",
-            }
+        front = self._server.front
+        async with front.swap_lock:
+            current = front.active
+            dry_run = bool(data.get("dry_run", False))
+            new_config, changed = apply_switch_model_request(current.config, data)
+
+            if not changed:
+                return {
+                    "type": "switch_response",
+                    "status": "no_change",
+                    "message": "No valid model parameters provided",
+                }
+
+            logging.info("📝 Configuration updated: %s", ", ".join(changed))
+            if dry_run:
+                self._apply_in_place(current, new_config)
+                logging.info("🧪 SWITCH MODEL DRY-RUN - Skipping reload_models()")
+                return {
+                    "type": "switch_response",
+                    "status": "success",
+                    "message": f"Models switched (dry_run): {', '.join(changed)}",
+                    "changed": changed,
+                }
+
+            stages = [] if current.mock_models else stages_to_reload(current.config, new_config)
+            reason = self._in_place_reason(current, new_config, stages)
+            if reason:
+                logging.info("🔄 MODEL SWAP - Reloading in place (%s)", reason)
+                self._apply_in_place(current, new_config)
+                await current.reload_models()
+                return {
+                    "type": "switch_response",
+                    "status": "success",
+                    "message": f"Models switched and reloaded: {', '.join(changed)}",
+                    "changed": changed,
+                    "strategy": "in_place",
+                }
+            return await self._blue_green(current, new_config, changed, stages)
+
+    @staticmethod
+    def _apply_in_place(server: Any, config: LocalAIConfig) -> None:
+        server.config = config
+        server._apply_config(server.config)
+        server.buffer_timeout_ms = server.config.stt_idle_ms
 
-        self._server.config = new_config
-        self._server._apply_config(self._server.config)
-        self._server.buffer_timeout_ms = self._server.config.stt_idle_ms
+    @staticmethod
+    def _in_place_reason(current: Any, new_config: LocalAIConfig, stages: List[str]) -> Optional[str]:
+        if current.config.model_swap == "in_place":
+            return "LOCAL_AI_MODEL_SWAP=in_place"
+        if (
+            "stt" in stages
+            and current.stt_backend == "kroko"
+            and current.kroko_embedded
+            and new_config.stt_backend == "kroko"
+            and new_config.kroko_embedded
+            and new_config.kroko_port == current.kroko_port
+        ):
+            return f"embedded Kroko server already owns port {current.kroko_port}"
+        return None
 
-        logging.info("📝 Configuration updated: %s", ", ".join(changed))
-        if dry_run:
-            logging.info("🧪 SWITCH MODEL DRY-RUN - Skipping reload_models()")
+    async def _blue_green(
+        self,
+        current: Any,
+        new_config: LocalAIConfig,
+        changed: List[str],
+        stages: List[str],
+    ) -> Dict[str, Any]:
+        """Load ``stages`` next to the running models, verify them, then flip new sessions."""
+        front = current.front
+        required = estimate_load_bytes(new_config, stages)
+        available = available_memory_bytes()
+        headroom = new_config.swap_memory_headroom_mb * 1024 * 1024
+        if required and available is not None and required + headroom > available:
+            message = (
+                f"Model swap refused: loading {', '.join(stages)} next to the running models needs "
+                f"~{_mb(required)} MB but only {_mb(available)} MB is available "
+                f"(headroom {new_config.swap_memory_headroom_mb} MB). "
+                "Free memory or set LOCAL_AI_MODEL_SWAP=in_place."
+            )
+            logging.error("❌ %s", message)
+            front.last_swap = {"status": "refused", "stages": stages, "at_epoch_ms": int(time() * 1000)}
+            return {"type": "switch_response", "status": "error", "message": message, "changed": changed}
+
+        logging.info(
+            "🔀 MODEL SWAP - Shadow-loading generation %s (reload: %s, ~%s MB)",
+            current.generation + 1,
+            ", ".join(stages) or "none",
+            _mb(required),
+        )
+        started = monotonic()
+        shadow = current.new_generation(new_config, reuse=[s for s in STAGES if s not in stages])
+        try:
+            errors = await shadow.load_stages(stages)
+        except Exception as exc:
+            errors = {"load": str(exc)}
+        load_ms = round((monotonic() - started) * 1000.0, 1)
+        if errors:
+            await shadow.release_models(keep=model_handles([current, *front.retired]))
+            detail = "; ".join(f"{stage}: {error}" for stage, error in errors.items())
+            message = f"Model swap aborted, still serving previous models ({detail})"
+            logging.error("❌ %s", message)
+            front.last_swap = {
+                "status": "aborted",
+                "stages": stages,
+                "load_ms": load_ms,
+                "at_epoch_ms": int(time() * 1000),
+            }
+            return {"type": "switch_response", "status": "error", "message": message, "changed": changed}
+
+        front.active = shadow
+        front.retired.append(current)
+        draining = len(current.connections)
+        front.last_swap = {
+            "status": "success",
+            "generation": shadow.generation,
+            "stages": stages,
+            "load_ms": load_ms,
+            "at_epoch_ms": int(time() * 1000),
+        }
+        logging.info(
+            "✅ MODEL SWAP - Generation %s active after %.0f ms; generation %s draining %s connection(s)",
+            shadow.generation,
+            load_ms,
+            current.generation,
+            draining,
+        )
+        if draining:
+            task = asyncio.create_task(self._drain(current))
+            front.drain_tasks.add(task)
+            task.add_done_callback(front.drain_tasks.discard)
         else:
-            await self._server.reload_models()
+            await self._retire(current)
 
         return {
             "type": "switch_response",
             "status": "success",
-            "message": (
-                f"Models switched (dry_run): {', '.join(changed)}"
-                if dry_run
-                else f"Models switched and reloaded: {', '.join(changed)}"
-            ),
+            "message": f"Models switched and reloaded: {', '.join(changed)}",
             "changed": changed,
+            "strategy": "blue_green",
+            "generation": shadow.generation,
+            "draining_connections": draining,
         }
 
+    async def _drain(self, old: Any) -> None:
+        """Wait for ``old``'s sessions to end (closing stragglers at the timeout), then free it."""
+        timeout = old.front.active.config.swap_drain_timeout_sec
+        deadline = monotonic() + timeout
+        while old.connections and monotonic() < deadline:
+            await asyncio.sleep(_DRAIN_POLL_SEC)
+        if old.connections:
+            logging.warning(
+                "⏱️ MODEL SWAP - Generation %s still has %s connection(s) after %.0fs; closing them",
+                old.generation,
+                len(old.connections),
+                timeout,
+            )
+            await asyncio.gather(
+                *(websocket.close(1012, "model swap") for websocket in list(old.connections)),
+                return_exceptions=True,
+            )
+        await self._retire(old)
+
+    async def _retire(self, old: Any) -> None:
+        front = old.front
+        if old in front.retired:
+            front.retired.remove(old)
+        # Keep anything still shared with the active or another draining generation.
+        await old.release_models(keep=model_handles([front.active, *front.retired]))
+        logging.info("🗑️ MODEL SWAP - Generation %s released", old.generation)
+
     def status(self) -> Dict[str, Any]:
-        return build_status_response(self._server)
+        return build_status_response(self._active())
 
     def capabilities(self) -> Dict[str, Any]:
-        return detect_capabilities(self._server.config)
-
+        return detect_capabilities(self._active().config)
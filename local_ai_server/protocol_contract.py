@@ -7,6 +7,10 @@ This module is intentionally dependency-light:
 
 This is used as a refactor safety net: we freeze the external WS contract and
 make it easy to diff/validate while moving internal code across modules.
+
+It also declares the versioned binary audio frame (see "Binary audio frames" in
+docs/local-ai-server/PROTOCOL.md) that replaces base64-in-JSON audio once a client
+negotiates it. The engine keeps a byte-compatible copy in src/audio/local_ai_frames.py.
 """
 
 from __future__ import annotations
@@ -14,7 +18,10 @@ from __future__ import annotations
 import argparse
 import json
 import os
-from typing import Any, Dict, Optional
+import struct
+import zlib
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
 
 
 PROTOCOL_SCHEMA: Dict[str, Any] = {
@@ -195,6 +202,9 @@ PROTOCOL_SCHEMA: Dict[str, Any] = {
                 "status": {"enum": ["success", "no_change", "error"]},
                 "message": {"type": "string"},
                 "changed": {"type": "array", "items": {"type": "string"}},
+                "strategy": {"enum": ["blue_green", "in_place"]},
+                "generation": {"type": "integer", "minimum": 1},
+                "draining_connections": {"type": "integer", "minimum": 0},
             },
             "additionalProperties": True,
         },
@@ -254,22 +264,39 @@ PROTOCOL_SCHEMA: Dict[str, Any] = {
                 "call_id": {"type": "string"},
                 "request_id": {"type": "string"},
                 "encoding": {"type": "string"},
+                "priority": {"enum": ["high", "normal", "low"]},
+            },
+            "additionalProperties": True,
+        },
+        "BargeInRequest": {
+            "type": "object",
+            "required": ["type"],
+            "properties": {
+                "type": {"const": "barge_in"},
+                "call_id": {"type": "string"},
             },
             "additionalProperties": True,
         },
         "TTSResponse": {
             "type": "object",
-            "required": ["type", "text", "call_id", "audio_data", "encoding", "sample_rate_hz", "byte_length"],
+            "required": ["type", "text", "call_id", "encoding", "sample_rate_hz", "byte_length"],
             "properties": {
                 "type": {"const": "tts_response"},
                 "text": {"type": "string"},
                 "call_id": {"type": "string"},
                 "audio_data": {"type": "string"},
+                "audio_transport": {"const": "frame"},
+                "frame_seq": {"type": "integer"},
                 "encoding": {"type": "string"},
                 "sample_rate_hz": {"type": "integer"},
                 "byte_length": {"type": "integer"},
                 "request_id": {"type": "string"},
             },
+            # Audio is inline (base64) unless the connection negotiated binary frames.
+            "oneOf": [
+                {"required": ["audio_data"]},
+                {"required": ["audio_transport", "frame_seq"]},
+            ],
             "additionalProperties": True,
         },
         "AudioFrameRequest": {
@@ -285,6 +312,62 @@ PROTOCOL_SCHEMA: Dict[str, Any] = {
             },
             "additionalProperties": True,
         },
+        "NegotiateRequest": {
+            "type": "object",
+            "required": ["type"],
+            "properties": {
+                "type": {"const": "negotiate"},
+                "binary_frames": {
+                    "type": "object",
+                    "properties": {
+                        "versions": {"type": "array", "items": {"type": "integer"}},
+                        "codecs": {"type": "array", "items": {"enum": ["pcm16le", "mulaw"]}},
+                    },
+                    "additionalProperties": True,
+                },
+                "multiplex": {"type": "boolean"},
+            },
+            "additionalProperties": True,
+        },
+        "NegotiateResponse": {
+            "type": "object",
+            "required": ["type", "binary_frames", "multiplex"],
+            "properties": {
+                "type": {"const": "negotiate_response"},
+                "binary_frames": {
+                    "type": ["object", "null"],
+                    "required": ["version", "codecs", "header_bytes"],
+                    "properties": {
+                        "version": {"type": "integer"},
+                        "codecs": {"type": "array", "items": {"enum": ["pcm16le", "mulaw"]}},
+                        "header_bytes": {"type": "integer"},
+                    },
+                },
+                "multiplex": {"type": "boolean"},
+            },
+            "additionalProperties": True,
+        },
+        "CallEndRequest": {
+            "type": "object",
+            "required": ["type", "call_id"],
+            "properties": {
+                "type": {"const": "call_end"},
+                "call_id": {"type": "string"},
+            },
+            "additionalProperties": True,
+        },
+        "ErrorResponse": {
+            "type": "object",
+            "required": ["type", "error"],
+            "properties": {
+                "type": {"const": "error"},
+                "error": {"type": "string"},
+                "call_id": {"type": "string"},
+                "request_id": {"type": "string"},
+                "details": {"type": "object"},
+            },
+            "additionalProperties": True,
+        },
         "STTResult": {
             "type": "object",
             "required": ["type", "text", "call_id", "mode", "is_final", "is_partial"],
@@ -333,13 +416,117 @@ PROTOCOL_SCHEMA: Dict[str, Any] = {
         {"$ref": "#/$defs/LLMResponse"},
         {"$ref": "#/$defs/TTSRequest"},
         {"$ref": "#/$defs/TTSResponse"},
+        {"$ref": "#/$defs/BargeInRequest"},
         {"$ref": "#/$defs/AudioFrameRequest"},
         {"$ref": "#/$defs/STTResult"},
         {"$ref": "#/$defs/TTSAudioMetadata"},
+        {"$ref": "#/$defs/NegotiateRequest"},
+        {"$ref": "#/$defs/NegotiateResponse"},
+        {"$ref": "#/$defs/CallEndRequest"},
+        {"$ref": "#/$defs/ErrorResponse"},
     ],
 }
 
 
+# ---------------------------------------------------------------------------
+# Binary audio frames
+# ---------------------------------------------------------------------------
+#
+# A frame is one binary WebSocket message: a fixed 16-byte big-endian header followed
+# by raw audio. Only sent after both sides agreed on it via "negotiate"; JSON stays in
+# use for every control message.
+#
+#   version u8 | kind u8 | codec u8 | flags u8 | rate_hz u32 | call_hash u32 | seq u32
+
+FRAME_VERSIONS = (1,)
+FRAME_HEADER = struct.Struct("!BBBBIII")
+
+FRAME_KIND_AUDIO = 1  # client -> server: caller audio for STT
+FRAME_KIND_TTS_AUDIO = 2  # server -> client: synthesized audio
+
+FRAME_CODECS = {"pcm16le": 1, "mulaw": 2}
+FRAME_CODEC_NAMES = {value: name for name, value in FRAME_CODECS.items()}
+
+FRAME_FLAG_END = 0x01  # last frame of a TTS response
+FRAME_FLAG_RESPONSE = 0x02  # answers a tts_request; a tts_response with frame_seq follows
+
+
+def call_hash(call_id: str) -> int:
+    """32-bit id a frame uses to name its call (CRC-32 of the UTF-8 call_id)."""
+    return zlib.crc32((call_id or "").encode("utf-8")) & 0xFFFFFFFF
+
+
+@dataclass(frozen=True)
+class AudioFrame:
+    kind: int
+    codec: str
+    rate_hz: int
+    call_hash: int
+    seq: int
+    flags: int
+    payload: bytes
+
+    @property
+    def end(self) -> bool:
+        return bool(self.flags & FRAME_FLAG_END)
+
+    @property
+    def response(self) -> bool:
+        return bool(self.flags & FRAME_FLAG_RESPONSE)
+
+
+def encode_frame(
+    kind: int,
+    payload: bytes,
+    *,
+    call_hash: int,
+    seq: int,
+    codec: str = "pcm16le",
+    rate_hz: int = 16000,
+    flags: int = 0,
+    version: int = FRAME_VERSIONS[-1],
+) -> bytes:
+    header = FRAME_HEADER.pack(
+        version, kind, FRAME_CODECS[codec], flags, rate_hz, call_hash, seq & 0xFFFFFFFF
+    )
+    return header + payload
+
+
+def decode_frame(data: bytes) -> AudioFrame:
+    """Parse a binary frame; raises ValueError if it is not a supported v1 frame."""
+    if len(data) < FRAME_HEADER.size:
+        raise ValueError(f"frame shorter than its {FRAME_HEADER.size}-byte header")
+    version, kind, codec, flags, rate_hz, hashed, seq = FRAME_HEADER.unpack_from(data)
+    if version not in FRAME_VERSIONS:
+        raise ValueError(f"unsupported frame version {version}")
+    if codec not in FRAME_CODEC_NAMES:
+        raise ValueError(f"unknown frame codec {codec}")
+    return AudioFrame(
+        kind=kind,
+        codec=FRAME_CODEC_NAMES[codec],
+        rate_hz=rate_hz,
+        call_hash=hashed,
+        seq=seq,
+        flags=flags,
+        payload=bytes(data[FRAME_HEADER.size:]),
+    )
+
+
+def negotiate_binary_frames(offer: Any) -> Optional[Dict[str, Any]]:
+    """Pick the highest frame version both sides support, or None to stay on JSON audio."""
+    if not isinstance(offer, dict):
+        return None
+    versions = [v for v in offer.get("versions") or [] if v in FRAME_VERSIONS]
+    if not versions:
+        return None
+    codecs: List[str] = [c for c in offer.get("codecs") or ["pcm16le"] if c in FRAME_CODECS]
+    return {
+        "version": max(versions),
+        "codecs": codecs or ["pcm16le"],
+        "header_bytes": FRAME_HEADER.size,
+    }
+
+
 def _optional_jsonschema_validator() -> Optional[Any]:
     try:
         import jsonschema  # type: ignore
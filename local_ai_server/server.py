@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import base64
+import io
 import json
 import logging
 import os
@@ -15,7 +16,7 @@ import wave
 import urllib.request
 import urllib.error
 from time import monotonic, time
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
 
 from websockets.exceptions import ConnectionClosed, ConnectionClosedError, ConnectionClosedOK
 try:
@@ -44,6 +45,7 @@ from constants import (
     DEFAULT_MODE,
     ULAW_SAMPLE_RATE,
     PCM16_TARGET_RATE,
+    TTS_SHORT_TEXT_CHARS,
     _normalize_text,
 )
 from optional_imports import VoskModel, KaldiRecognizer, Llama, PiperVoice
@@ -51,8 +53,16 @@ from optional_imports import VoskModel, KaldiRecognizer, Llama, PiperVoice
 
 from session import SessionContext
 from config import LocalAIConfig
-from model_manager import ModelManager
+from protocol_contract import (
+    FRAME_FLAG_END,
+    FRAME_FLAG_RESPONSE,
+    FRAME_KIND_TTS_AUDIO,
+    call_hash,
+    encode_frame,
+)
+from model_manager import STAGE_MODEL_ATTRS, ModelManager
 from ws_protocol import WebSocketProtocol
+from supervisor import Supervisor, parse_worker_pools
 
 
 class _LegacyKrokoSTTBackend:
@@ -152,7 +162,7 @@ class _LegacyKrokoSTTBackend:
 
         try:
             await ws.send(float32_audio)
-            if DEBUG_AUDIO_FLOW:
+            if DEBUG_AUDIO_FLOW and audio_log.allow("kroko_send"):
                 logging.debug(
                     "🎤 KROKO - Sent %d bytes PCM16 → %d bytes float32",
                     len(pcm16_audio),
@@ -177,7 +187,7 @@ class _LegacyKrokoSTTBackend:
             msg = await asyncio.wait_for(ws.recv(), timeout=timeout)
             data = json.loads(msg)
 
-            if DEBUG_AUDIO_FLOW:
+            if DEBUG_AUDIO_FLOW and audio_log.allow("kroko_recv"):
                 logging.debug("🎤 KROKO - Received: %s", data)
 
             return data
@@ -707,8 +717,22 @@ class _LegacyAudioProcessor:
 
 # Backends and audio processor are maintained in separate modules for easier development.
 from stt_backends import KrokoSTTBackend, SherpaONNXSTTBackend
-from tts_backends import KokoroTTSBackend
+from tts_backends import (
+    KokoroTTSBackend,
+    init_worker_backend,
+    synthesize_ulaw,
+    worker_ready,
+    worker_synthesize_ulaw,
+)
+from tts_executor import (
+    PRIORITY_HIGH,
+    PRIORITY_NORMAL,
+    TTSCancelledError,
+    TTSExecutor,
+    parse_priority,
+)
 from audio_processor import AudioProcessor
+from log_sampling import audio_log
 
 
 class LocalAIServer:
@@ -747,8 +771,27 @@ class LocalAIServer:
         self.kokoro_backend: Optional[KokoroTTSBackend] = None
         self.melotts_backend: Optional["MeloTTSBackend"] = None
         self._apply_config(self.config)
+        # Blocking TTS synthesis runs here, never on the event loop (see tts_executor).
+        self.tts_executor = TTSExecutor(
+            threads=self.config.tts_threads,
+            process_workers=self.config.tts_process_workers,
+        )
         self.model_manager = ModelManager(self)
         self.ws_protocol = WebSocketProtocol(self)
+        # Set in supervisor workers (LOCAL_AI_WORKERS), e.g. "stt-0".
+        self.worker_name: Optional[str] = None
+
+        # Blue/green model swaps (model_manager): every server object is one model
+        # generation. The one passed to serve() is the front; it routes new connections
+        # to ``active`` while ``retired`` generations drain their sessions.
+        self.front: "LocalAIServer" = self
+        self.active: "LocalAIServer" = self
+        self.retired: List["LocalAIServer"] = []
+        self.generation = 1
+        self.connections: Set[Any] = set()
+        self.swap_lock = asyncio.Lock()
+        self.drain_tasks: Set[asyncio.Task] = set()
+        self.last_swap: Optional[Dict[str, Any]] = None
 
         # Audio buffering for STT (20ms chunks need to be buffered for effective STT)
         self.audio_buffer = b""
@@ -1398,10 +1441,13 @@ class LocalAIServer:
             if self.fail_fast:
                 raise
 
-    async def run_startup_latency_check(self) -> None:
-        """Run a lightweight LLM inference at startup to log baseline latency."""
+    async def run_startup_latency_check(self) -> Optional[float]:
+        """Run a lightweight LLM inference at startup to log baseline latency.
+
+        Returns the latency in ms, or None if no model is loaded or the inference failed.
+        """
         if not self.llm_model:
-            return
+            return None
 
         try:
             session = SessionContext(call_id="startup-latency")
@@ -1467,12 +1513,14 @@ class LocalAIServer:
                 raw_tokens,
                 truncated,
             )
+            return latency_ms
         except Exception as exc:  # pragma: no cover - best-effort metric
             logging.warning(
                 "🤖 LLM STARTUP LATENCY CHECK FAILED: %s",
                 exc,
                 exc_info=True,
             )
+            return None
 
     async def _load_tts_model(self):
         """Load TTS model based on configured backend (piper, kokoro, or melotts)."""
@@ -1482,6 +1530,36 @@ class LocalAIServer:
             await self._load_melotts_backend()
         else:
             await self._load_piper_backend()
+        await self._configure_tts_process_pool()
+
+    async def _configure_tts_process_pool(self) -> None:
+        """Start preloaded TTS worker processes for Kokoro/MeloTTS (LOCAL_TTS_PROCESS_WORKERS>0).
+
+        Piper (ONNX) releases the GIL and stays on the thread pool. The in-process backend
+        is kept as the fallback if the workers fail to start or die.
+        """
+        kind: Optional[str] = None
+        kwargs: Dict[str, Any] = {}
+        if self.tts_backend == "kokoro" and self.kokoro_backend is not None:
+            kind = "kokoro"
+            kwargs = {
+                "voice": self.kokoro_backend.voice,
+                "lang_code": self.kokoro_backend.lang_code,
+                "model_path": self.kokoro_backend.model_path,
+            }
+        elif self.tts_backend == "melotts" and self.melotts_backend is not None:
+            kind = "melotts"
+            kwargs = {
+                "voice": self.melotts_backend.voice,
+                "device": self.melotts_backend.device,
+                "speed": self.melotts_backend.speed,
+            }
+        await self.tts_executor.configure_process_pool(
+            kind,
+            initializer=init_worker_backend,
+            initargs=(kind, kwargs),
+            warmup=worker_ready,
+        )
 
     async def _load_piper_backend(self):
         """Load Piper TTS model with 22kHz support."""
@@ -1657,31 +1735,103 @@ class LocalAIServer:
         finally:
             self.kroko_backend = None
 
+    def after_fork(self, worker_name: str) -> None:
+        """Reset per-process state in a supervisor worker forked after model load."""
+        self.worker_name = worker_name
+        self._llm_lock = asyncio.Lock()
+        self._faster_whisper_lock = asyncio.Lock()
+        self.swap_lock = asyncio.Lock()
+        self.tts_executor = TTSExecutor(
+            threads=self.config.tts_threads,
+            process_workers=self.config.tts_process_workers,
+        )
+        # The embedded Kroko server belongs to the supervisor; workers only connect to it.
+        if self.kroko_backend is not None:
+            self.kroko_backend._subprocess = None
+
+    def new_generation(self, config: LocalAIConfig, reuse: Sequence[str]) -> "LocalAIServer":
+        """Build the next model generation for a blue/green swap.
+
+        Stages in ``reuse`` share this generation's loaded models (and the locks that
+        serialize them); the rest are loaded by ``load_stages``.
+        """
+        shadow = type(self)(config)
+        shadow.front = self.front
+        shadow.generation = self.generation + 1
+        shadow.worker_name = self.worker_name
+        for stage in reuse:
+            for attr in STAGE_MODEL_ATTRS[stage]:
+                setattr(shadow, attr, getattr(self, attr))
+            if stage in self.startup_errors:
+                shadow.startup_errors[stage] = self.startup_errors[stage]
+            if stage in self.runtime_fallbacks:
+                shadow.runtime_fallbacks[stage] = self.runtime_fallbacks[stage]
+                if stage == "stt":
+                    shadow.faster_whisper_device = self.faster_whisper_device
+                    shadow.faster_whisper_compute = self.faster_whisper_compute
+                else:
+                    shadow.melotts_device = self.melotts_device
+        return shadow
+
+    async def load_stages(self, stages: Sequence[str]) -> Dict[str, str]:
+        """Load ``stages`` into this (not yet serving) generation; returns their load errors."""
+        for stage in stages:
+            self.startup_errors.pop(stage, None)
+        if "stt" in stages:
+            await self._load_stt_model()
+        if "llm" in stages:
+            if self.runtime_mode == "minimal":
+                self.llm_model = None
+            else:
+                await self._load_llm_model()
+                if self.llm_model is not None and await self.run_startup_latency_check() is None:
+                    self.startup_errors["llm"] = "startup latency check failed"
+        if "tts" in stages:
+            await self._load_tts_model()
+        return {stage: self.startup_errors[stage] for stage in stages if stage in self.startup_errors}
+
+    async def release_models(self, keep: Optional[Set[int]] = None) -> None:
+        """Free this generation's models, skipping objects whose id is in ``keep``.
+
+        Released ids are added to ``keep`` so a model shared by several generations is
+        only shut down once.
+        """
+        keep = set() if keep is None else keep
+
+        def _owned(obj: Any) -> bool:
+            if obj is None or id(obj) in keep:
+                return False
+            keep.add(id(obj))
+            return True
+
+        if _owned(self.tts_executor):
+            await self.tts_executor.shutdown()
+        if _owned(self.kroko_backend):
+            await self._cleanup_kroko_backend()
+        for attr in ("sherpa_backend", "kokoro_backend", "melotts_backend"):
+            backend = getattr(self, attr)
+            if _owned(backend):
+                try:
+                    backend.shutdown()
+                except Exception as exc:  # pragma: no cover
+                    logging.debug("%s shutdown failed: %s", attr, exc, exc_info=True)
+        for attrs in STAGE_MODEL_ATTRS.values():
+            for attr in attrs:
+                if attr in ("tts_executor", "_llm_lock", "_faster_whisper_lock"):
+                    continue
+                setattr(self, attr, None)
+
     async def shutdown(self) -> None:
-        """Best-effort cleanup on server shutdown."""
+        """Best-effort cleanup on server shutdown (every model generation)."""
         logging.info("🛑 Shutting down Local AI Server...")
-        await self._cleanup_kroko_backend()
-        if self.sherpa_backend:
-            try:
-                self.sherpa_backend.shutdown()
-            except Exception as exc:  # pragma: no cover
-                logging.debug("Sherpa backend shutdown failed: %s", exc, exc_info=True)
-            self.sherpa_backend = None
-        if self.kokoro_backend:
-            try:
-                self.kokoro_backend.shutdown()
-            except Exception as exc:  # pragma: no cover
-                logging.debug("Kokoro backend shutdown failed: %s", exc, exc_info=True)
-            self.kokoro_backend = None
-        if self.melotts_backend:
-            try:
-                self.melotts_backend.shutdown()
-            except Exception as exc:  # pragma: no cover
-                logging.debug("MeloTTS backend shutdown failed: %s", exc, exc_info=True)
-            self.melotts_backend = None
-        self.stt_model = None
-        self.tts_model = None
-        self.llm_model = None
+        front = self.front
+        for task in list(front.drain_tasks):
+            task.cancel()
+        released: Set[int] = set()
+        generations = [front.active, *front.retired, front]
+        for index, generation in enumerate(generations):
+            if generation not in generations[:index]:
+                await generation.release_models(keep=released)
 
     async def reload_models(self):
         """Hot reload all models without restarting the server"""
@@ -2020,146 +2170,206 @@ class LocalAIServer:
         session.llm_user_turns = trimmed_turns
         return prompt_text, prompt_tokens, truncated, raw_tokens
 
-    async def process_tts(self, text: str) -> bytes:
-        """Process TTS with 8kHz uLaw generation - routes to appropriate backend."""
-        if self.tts_backend == "kokoro":
-            return await self._process_tts_kokoro(text)
-        elif self.tts_backend == "melotts":
-            return await self._process_tts_melotts(text)
-        else:
-            return await self._process_tts_piper(text)
+    async def process_tts(
+        self,
+        text: str,
+        *,
+        session: Optional[SessionContext] = None,
+        call_id: Optional[str] = None,
+        priority: Any = None,
+    ) -> bytes:
+        """Process TTS with 8kHz uLaw generation - routes to appropriate backend.
+
+        Synthesis runs on ``tts_executor`` so other sessions' STT and websocket traffic keep
+        flowing. Returns empty audio if the session barges in or disconnects first.
+        """
+        job_priority = self._tts_priority(text, session, priority)
+        session_key = self._tts_session_key(session, call_id)
+        try:
+            if self.tts_backend == "kokoro":
+                return await self._process_tts_kokoro(text, job_priority, session_key)
+            elif self.tts_backend == "melotts":
+                return await self._process_tts_melotts(text, job_priority, session_key)
+            else:
+                return await self._process_tts_piper(text, job_priority, session_key)
+        except TTSCancelledError:
+            logging.info(
+                "🔇 TTS cancelled call_id=%s text_preview=%s",
+                session_key[1] if session_key else None,
+                text[:50],
+            )
+            return b""
+
+    def _tts_priority(self, text: str, session: Optional[SessionContext], requested: Any) -> int:
+        """Greetings, short prompts and the first reply after a barge-in jump the TTS queue.
 
-    async def _process_tts_melotts(self, text: str) -> bytes:
+        Priority only orders different calls; one call's requests are always synthesized
+        and answered in the order they arrived.
+        """
+        if session is None:
+            return parse_priority(requested)
+        urgent = (
+            session.tts_requests == 0
+            or session.tts_after_barge_in
+            or len(text) <= TTS_SHORT_TEXT_CHARS
+        )
+        session.tts_requests += 1
+        session.tts_after_barge_in = False
+        return parse_priority(requested, PRIORITY_HIGH if urgent else PRIORITY_NORMAL)
+
+    @staticmethod
+    def _tts_session_key(
+        session: Optional[SessionContext], call_id: Optional[str] = None
+    ) -> Optional[Tuple[int, str]]:
+        if session is None:
+            return None
+        call_id = call_id or session.call_id
+        session.tts_call_ids.add(call_id)
+        return (id(session), call_id)
+
+    def cancel_tts(
+        self, session: SessionContext, call_id: Optional[str] = None, *, barge_in: bool = False
+    ) -> int:
+        """Drop queued/running TTS for one call on this connection (all calls if ``call_id`` is None)."""
+        call_ids = [call_id] if call_id else list(session.tts_call_ids)
+        dropped = sum(
+            self.tts_executor.cancel_session((id(session), cid)) for cid in call_ids
+        )
+        if barge_in:
+            session.tts_after_barge_in = True
+        if dropped:
+            logging.info(
+                "🔇 TTS cancel call_ids=%s dropped=%s barge_in=%s", call_ids, dropped, barge_in
+            )
+        return dropped
+
+    async def _process_tts_melotts(
+        self, text: str, priority: int = PRIORITY_NORMAL, session_key: Any = None
+    ) -> bytes:
         """Process TTS using MeloTTS backend (44100Hz output)."""
         try:
-            if not self.melotts_backend:
+            backend = self.melotts_backend
+            if not backend:
                 logging.error("MeloTTS backend not initialized")
                 return b""
 
             logging.debug("🔊 TTS INPUT - MeloTTS generating audio for: '%s'", text)
 
-            # Get PCM16 audio at 44100Hz from MeloTTS
-            pcm16_data = self.melotts_backend.synthesize(text)
-            
-            if not pcm16_data:
+            # Synthesize at 44100Hz and convert to 8kHz uLaw off the event loop.
+            ulaw_data = await self.tts_executor.submit(
+                synthesize_ulaw,
+                backend,
+                text,
+                priority=priority,
+                session_key=session_key,
+                process_fn=worker_synthesize_ulaw,
+                # One torch model per backend: threads must take turns.
+                thread_safe=False,
+            )
+            if not ulaw_data:
                 logging.warning("⚠️ MeloTTS returned empty audio")
                 return b""
 
-            # Write to temp WAV file for conversion
-            with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as wav_file:
-                wav_path = wav_file.name
-
-            with wave.open(wav_path, "wb") as wav_file:
-                wav_file.setnchannels(1)
-                wav_file.setsampwidth(2)
-                wav_file.setframerate(44100)  # MeloTTS native rate
-                wav_file.writeframes(pcm16_data)
-
-            with open(wav_path, "rb") as wav_file:
-                wav_data = wav_file.read()
-
-            # Convert 44100Hz to 8kHz uLaw
-            ulaw_data = await asyncio.to_thread(
-                self.audio_processor.convert_to_ulaw_8k, wav_data, 44100
-            )
-            os.unlink(wav_path)
-
             logging.info("🔊 TTS RESULT - MeloTTS generated uLaw 8kHz audio: %s bytes", len(ulaw_data))
             return ulaw_data
 
+        except TTSCancelledError:
+            raise
         except Exception as exc:
             logging.error("MeloTTS processing failed: %s", exc, exc_info=True)
             return b""
 
-    async def _process_tts_piper(self, text: str) -> bytes:
+    def _synthesize_piper_ulaw(self, model, text: str) -> bytes:
+        """Blocking Piper synthesis (22kHz WAV) + uLaw conversion; runs on the TTS executor."""
+        buffer = io.BytesIO()
+        # Write WAV data either by letting Piper stream into the wave writer
+        # or by consuming a generator for backward compatibility.
+        with wave.open(buffer, "wb") as wav_file:
+            # Mono, 16-bit, 22.05 kHz (typical Piper voice rate)
+            wav_file.setnchannels(1)
+            wav_file.setsampwidth(2)
+            wav_file.setframerate(22050)
+            try:
+                # Newer Piper API: synthesize(text, wav_file)
+                model.synthesize(text, wav_file)
+            except TypeError:
+                # Fallback: older API returns a generator of frames
+                audio_generator = model.synthesize(text)
+                for chunk in audio_generator:
+                    if isinstance(chunk, (bytes, bytearray)):
+                        wav_file.writeframes(chunk)
+                    else:
+                        data = getattr(chunk, "audio_int16_bytes", None)
+                        if data:
+                            wav_file.writeframes(data)
+
+        return self.audio_processor.convert_to_ulaw_8k(buffer.getvalue(), 22050)
+
+    async def _process_tts_piper(
+        self, text: str, priority: int = PRIORITY_NORMAL, session_key: Any = None
+    ) -> bytes:
         """Process TTS using Piper backend (22kHz output)."""
         try:
-            if not self.tts_model:
+            model = self.tts_model
+            if not model:
                 logging.error("Piper TTS model not loaded")
                 return b""
 
             logging.debug("🔊 TTS INPUT - Generating 22kHz audio for: '%s'", text)
 
-            with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as wav_file:
-                wav_path = wav_file.name
-
-            # Write WAV data either by letting Piper stream into the wave writer
-            # or by consuming a generator for backward compatibility.
-            with wave.open(wav_path, "wb") as wav_file:
-                # Mono, 16-bit, 22.05 kHz (typical Piper voice rate)
-                wav_file.setnchannels(1)
-                wav_file.setsampwidth(2)
-                wav_file.setframerate(22050)
-                try:
-                    # Newer Piper API: synthesize(text, wav_file)
-                    self.tts_model.synthesize(text, wav_file)
-                except TypeError:
-                    # Fallback: older API returns a generator of frames
-                    audio_generator = self.tts_model.synthesize(text)
-                    for chunk in audio_generator:
-                        if isinstance(chunk, (bytes, bytearray)):
-                            wav_file.writeframes(chunk)
-                        else:
-                            data = getattr(chunk, "audio_int16_bytes", None)
-                            if data:
-                                wav_file.writeframes(data)
-
-            with open(wav_path, "rb") as wav_file:
-                wav_data = wav_file.read()
-
-            ulaw_data = await asyncio.to_thread(
-                self.audio_processor.convert_to_ulaw_8k, wav_data, 22050
-            )
-            os.unlink(wav_path)
+            # Piper's ONNX inference releases the GIL: thread pool only.
+            ulaw_data = await self.tts_executor.submit(
+                self._synthesize_piper_ulaw,
+                model,
+                text,
+                priority=priority,
+                session_key=session_key,
+            )
 
             logging.info("🔊 TTS RESULT - Piper generated uLaw 8kHz audio: %s bytes", len(ulaw_data))
             return ulaw_data
 
+        except TTSCancelledError:
+            raise
         except Exception as exc:
             logging.error("Piper TTS processing failed: %s", exc, exc_info=True)
             return b""
 
-    async def _process_tts_kokoro(self, text: str) -> bytes:
+    async def _process_tts_kokoro(
+        self, text: str, priority: int = PRIORITY_NORMAL, session_key: Any = None
+    ) -> bytes:
         """Process TTS using Kokoro backend (24kHz output)."""
         try:
             if self.kokoro_mode == "api":
-                return await self._process_tts_kokoro_api(text)
+                return await self._process_tts_kokoro_api(text, priority, session_key)
 
-            if not self.kokoro_backend:
+            backend = self.kokoro_backend
+            if not backend:
                 logging.error("Kokoro TTS backend not initialized")
                 return b""
 
             logging.debug("🔊 TTS INPUT - Generating 24kHz audio for: '%s'", text)
 
-            # Get PCM16 audio at 24kHz from Kokoro
-            pcm16_data = self.kokoro_backend.synthesize(text)
-            
-            if not pcm16_data:
+            # Synthesize at 24kHz and convert to 8kHz uLaw off the event loop.
+            ulaw_data = await self.tts_executor.submit(
+                synthesize_ulaw,
+                backend,
+                text,
+                priority=priority,
+                session_key=session_key,
+                process_fn=worker_synthesize_ulaw,
+                # One torch model per backend: threads must take turns.
+                thread_safe=False,
+            )
+            if not ulaw_data:
                 logging.warning("⚠️ Kokoro returned empty audio")
                 return b""
 
-            # Write to temp WAV file for conversion
-            with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as wav_file:
-                wav_path = wav_file.name
-
-            with wave.open(wav_path, "wb") as wav_file:
-                wav_file.setnchannels(1)
-                wav_file.setsampwidth(2)
-                wav_file.setframerate(24000)
-                wav_file.writeframes(pcm16_data)
-
-            with open(wav_path, "rb") as wav_file:
-                wav_data = wav_file.read()
-
-            # Convert 24kHz WAV to 8kHz uLaw
-            ulaw_data = await asyncio.to_thread(
-                self.audio_processor.convert_to_ulaw_8k, wav_data, 24000
-            )
-            os.unlink(wav_path)
-
             logging.info("🔊 TTS RESULT - Kokoro generated uLaw 8kHz audio: %s bytes", len(ulaw_data))
             return ulaw_data
 
+        except TTSCancelledError:
+            raise
         except Exception as exc:
             logging.error("Kokoro TTS processing failed: %s", exc, exc_info=True)
             return b""
@@ -2207,7 +2417,15 @@ class LocalAIServer:
         except Exception as e:
             raise RuntimeError(f"Kokoro Web API request failed: {e}") from e
 
-    async def _process_tts_kokoro_api(self, text: str) -> bytes:
+    def _kokoro_api_synthesize_ulaw(self, text: str) -> bytes:
+        wav_data = self._kokoro_api_speech_request(text)
+        if not wav_data:
+            return b""
+        return self.audio_processor.convert_to_ulaw_8k(wav_data, 24000)
+
+    async def _process_tts_kokoro_api(
+        self, text: str, priority: int = PRIORITY_NORMAL, session_key: Any = None
+    ) -> bytes:
         """Process TTS using Kokoro Web API, returning 8kHz µ-law bytes."""
         try:
             if not self.kokoro_api_base_url:
@@ -2221,18 +2439,21 @@ class LocalAIServer:
                 text,
             )
 
-            wav_data = await asyncio.to_thread(self._kokoro_api_speech_request, text)
-            if not wav_data:
-                return b""
-
-            ulaw_data = await asyncio.to_thread(
-                self.audio_processor.convert_to_ulaw_8k, wav_data, 24000
+            ulaw_data = await self.tts_executor.submit(
+                self._kokoro_api_synthesize_ulaw,
+                text,
+                priority=priority,
+                session_key=session_key,
             )
+            if not ulaw_data:
+                return b""
             logging.info(
                 "🔊 TTS RESULT - Kokoro API generated uLaw 8kHz audio: %s bytes",
                 len(ulaw_data),
             )
             return ulaw_data
+        except TTSCancelledError:
+            raise
         except Exception as exc:
             logging.error("Kokoro API TTS processing failed: %s", exc, exc_info=True)
             return b""
@@ -2638,8 +2859,8 @@ class LocalAIServer:
         except RuntimeError:
             session.last_audio_at = 0.0
         
-        # Calculate RMS to detect silent audio (only in debug mode)
-        if DEBUG_AUDIO_FLOW:
+        # Calculate RMS to detect silent audio (only in debug mode, sampled)
+        if DEBUG_AUDIO_FLOW and audio_log.allow("vosk_feed", session.call_id):
             try:
                 import struct
                 import math
@@ -2658,7 +2879,7 @@ class LocalAIServer:
 
         try:
             has_final = recognizer.AcceptWaveform(audio_bytes)
-            if DEBUG_AUDIO_FLOW:
+            if DEBUG_AUDIO_FLOW and audio_log.allow("vosk_processed", session.call_id):
                 logging.debug(
                     "🎤 VOSK PROCESSED call_id=%s has_final=%s",
                     session.call_id or "unknown",
@@ -2739,6 +2960,35 @@ class LocalAIServer:
             logging.warning("🌐 WS CLOSED - Failed to send binary payload (%s bytes)", len(data))
             return False
 
+    async def _send_tts_audio(
+        self, websocket, session: SessionContext, audio_bytes: bytes, *, response: bool = False
+    ) -> Optional[int]:
+        """Send synthesized µ-law audio; as a binary frame when the connection negotiated them.
+
+        Returns the frame seq (None when sent as a bare binary message).
+        """
+        connection = session.connection
+        if connection is None or connection.frames_version is None:
+            await self._send_bytes(websocket, audio_bytes)
+            return None
+        seq = session.frame_seq
+        session.frame_seq = (seq + 1) & 0xFFFFFFFF
+        frame = encode_frame(
+            FRAME_KIND_TTS_AUDIO,
+            audio_bytes or b"",
+            call_hash=call_hash(session.call_id),
+            seq=seq,
+            codec="mulaw",
+            rate_hz=ULAW_SAMPLE_RATE,
+            flags=FRAME_FLAG_END | (FRAME_FLAG_RESPONSE if response else 0),
+            version=connection.frames_version,
+        )
+        try:
+            await websocket.send(frame)
+        except ConnectionClosed:
+            logging.warning("🌐 WS CLOSED - Failed to send TTS frame (%s bytes)", len(frame))
+        return seq
+
     async def _emit_stt_result(
         self,
         websocket,
@@ -2840,7 +3090,7 @@ class LocalAIServer:
             if not await self._send_json(websocket, metadata):
                 return
         if audio_bytes:
-            await self._send_bytes(websocket, audio_bytes)
+            await self._send_tts_audio(websocket, session, audio_bytes)
 
     async def _handle_final_transcript(
         self,
@@ -3005,7 +3255,7 @@ class LocalAIServer:
             # Strip tool call markup before TTS to avoid speaking <tool_call>...</tool_call>
             tts_text = self._strip_tool_calls_for_tts(llm_response)
             if tts_text:
-                audio_response = await self.process_tts(tts_text)
+                audio_response = await self.process_tts(tts_text, session=session)
             else:
                 audio_response = b""  # No spoken text, just tool call
             await self._emit_tts_audio(
@@ -3079,7 +3329,7 @@ class LocalAIServer:
         if call_id:
             session.call_id = call_id
         
-        if DEBUG_AUDIO_FLOW:
+        if DEBUG_AUDIO_FLOW and audio_log.allow("payload", session.call_id):
             logging.debug(
                 "🎤 AUDIO PAYLOAD RECEIVED call_id=%s mode=%s request_id=%s",
                 call_id or "unknown",
@@ -3094,7 +3344,7 @@ class LocalAIServer:
                 return
             try:
                 audio_bytes = base64.b64decode(encoded_audio)
-                if DEBUG_AUDIO_FLOW:
+                if DEBUG_AUDIO_FLOW and audio_log.allow("decoded", session.call_id):
                     logging.debug(
                         "🎤 AUDIO DECODED call_id=%s bytes=%d base64_len=%d",
                         call_id or "unknown",
@@ -3106,18 +3356,19 @@ class LocalAIServer:
                 return
         else:
             audio_bytes = incoming_bytes
-            logging.info(
-                "🎤 AUDIO (binary) call_id=%s bytes=%d",
-                call_id or "unknown",
-                len(audio_bytes),
-            )
+            if DEBUG_AUDIO_FLOW and audio_log.allow("binary", session.call_id):
+                logging.debug(
+                    "🎤 AUDIO (binary) call_id=%s bytes=%d",
+                    session.call_id,
+                    len(audio_bytes),
+                )
 
         if not audio_bytes:
             logging.debug("Audio payload empty after decoding")
             return
 
         input_rate = int(data.get("rate", PCM16_TARGET_RATE))
-        if DEBUG_AUDIO_FLOW:
+        if DEBUG_AUDIO_FLOW and audio_log.allow("routing", session.call_id):
             logging.debug(
                 "🎤 ROUTING TO STT call_id=%s mode=%s bytes=%d rate=%d",
                 call_id or "unknown",
@@ -3203,6 +3454,7 @@ class LocalAIServer:
         websocket,
         session: SessionContext,
         data: Dict[str, Any],
+        after: Optional[asyncio.Task] = None,
     ) -> None:
         text = data.get("text", "").strip()
         call_id = data.get("call_id", session.call_id)
@@ -3222,7 +3474,12 @@ class LocalAIServer:
         if call_id:
             session.call_id = call_id
 
-        audio_response = await self.process_tts(text)
+        audio_response = await self.process_tts(
+            text, session=session, call_id=session.call_id, priority=data.get("priority")
+        )
+        if after is not None and not after.done():
+            # ``after`` is this session's previous tts_request: reply in request order.
+            await asyncio.wait({after})
         
         # Check if this is a direct TTS request (expects tts_response with base64)
         # vs streaming mode which uses binary frames
@@ -3231,16 +3488,25 @@ class LocalAIServer:
         if response_format == "json" or data.get("type") == "tts_request":
             # Send JSON response with base64-encoded audio for direct TTS calls
             # This is what LocalProvider.text_to_speech expects
-            audio_b64 = base64.b64encode(audio_response).decode("utf-8") if audio_response else ""
             response = {
                 "type": "tts_response",
                 "text": text,
                 "call_id": session.call_id,
-                "audio_data": audio_b64,
                 "encoding": "mulaw",
                 "sample_rate_hz": ULAW_SAMPLE_RATE,
                 "byte_length": len(audio_response or b""),
             }
+            if session.connection is not None and session.connection.frames_version is not None:
+                # Negotiated clients get the audio as a binary frame just before this
+                # message; frame_seq ties the two together.
+                response["audio_transport"] = "frame"
+                response["frame_seq"] = await self._send_tts_audio(
+                    websocket, session, audio_response, response=True
+                )
+            else:
+                response["audio_data"] = (
+                    base64.b64encode(audio_response).decode("utf-8") if audio_response else ""
+                )
             if request_id:
                 response["request_id"] = request_id
             await self._send_json(websocket, response)
@@ -3485,42 +3751,62 @@ class LocalAIServer:
         )
 
     async def handler(self, websocket):
-        return await self.ws_protocol.handler(websocket)
+        # A connection stays on the generation that was active when it opened, so a
+        # blue/green swap never changes models under a live call.
+        generation = self.front.active
+        generation.connections.add(websocket)
+        try:
+            return await generation.ws_protocol.handler(websocket)
+        finally:
+            generation.connections.discard(websocket)
+
+
+def _check_bind_security(config) -> None:
+    """Refuse to start when binding a non-loopback address without an auth token."""
+    # SECURITY: Default to localhost. Set LOCAL_WS_HOST=0.0.0.0 for remote access.
+    # If binding non-localhost, LOCAL_WS_AUTH_TOKEN should be set (enforced in handler).
+    host = config.ws_host
+
+    # SECURITY: Fail-closed for non-localhost bind without auth token
+    # Treat 0.0.0.0, ::, ::0, and any non-localhost as remote-accessible
+    auth_token = config.ws_auth_token
+
+    def is_loopback_address(addr: str) -> bool:
+        """Check if address is loopback (127.0.0.0/8, localhost, ::1)"""
+        if addr in ("localhost", "::1"):
+            return True
+        # Check IPv4 loopback range 127.0.0.0/8
+        if addr.startswith("127."):
+            return True
+        return False
+
+    is_loopback = is_loopback_address(host)
+
+    if not is_loopback and not auth_token:
+        logging.error(
+            "🚨 SECURITY: LOCAL_WS_HOST=%s (non-loopback) but LOCAL_WS_AUTH_TOKEN is not set. "
+            "Refusing to start - set LOCAL_WS_AUTH_TOKEN or bind to 127.0.0.1.",
+            host
+        )
+        sys.exit(1)
 
 
-async def main():
+async def main(server: Optional[LocalAIServer] = None, supervisor: Optional[Supervisor] = None):
     """Main server function"""
-    server = LocalAIServer()
+    server = server or LocalAIServer()
     try:
-        await server.initialize_models()
-
-        # SECURITY: Default to localhost. Set LOCAL_WS_HOST=0.0.0.0 for remote access.
-        # If binding non-localhost, LOCAL_WS_AUTH_TOKEN should be set (enforced in handler).
         host = server.config.ws_host
         port = server.config.ws_port
-        
-        # SECURITY: Fail-closed for non-localhost bind without auth token
-        # Treat 0.0.0.0, ::, ::0, and any non-localhost as remote-accessible
-        auth_token = server.config.ws_auth_token
-        
-        def is_loopback_address(addr: str) -> bool:
-            """Check if address is loopback (127.0.0.0/8, localhost, ::1)"""
-            if addr in ("localhost", "::1"):
-                return True
-            # Check IPv4 loopback range 127.0.0.0/8
-            if addr.startswith("127."):
-                return True
-            return False
-        
-        is_loopback = is_loopback_address(host)
-        
-        if not is_loopback and not auth_token:
-            logging.error(
-                "🚨 SECURITY: LOCAL_WS_HOST=%s (non-loopback) but LOCAL_WS_AUTH_TOKEN is not set. "
-                "Refusing to start - set LOCAL_WS_AUTH_TOKEN or bind to 127.0.0.1.",
-                host
-            )
-            sys.exit(1)
+        _check_bind_security(server.config)
+
+        if supervisor is not None:
+            await supervisor.run()
+            return
+        if parse_worker_pools(server.config.workers):
+            # Workers must be forked before an event loop is running; see run().
+            raise RuntimeError("LOCAL_AI_WORKERS is set: start the server with server.run()")
+
+        await server.initialize_models()
 
         async with serve(
             server.handler,
@@ -3541,5 +3827,17 @@ async def main():
         await server.shutdown()
 
 
+def run() -> None:
+    """Process entry point: start the worker fork server (if any) before the event loop."""
+    server = LocalAIServer()
+    _check_bind_security(server.config)
+    supervisor = None
+    worker_pools = parse_worker_pools(server.config.workers)
+    if worker_pools:
+        supervisor = Supervisor(server, worker_pools)
+        supervisor.start_fork_server()
+    asyncio.run(main(server, supervisor))
+
+
 if __name__ == "__main__":
-    asyncio.run(main())
+    run()
@@ -2,10 +2,11 @@ from __future__ import annotations
 
 import asyncio
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 
 from constants import DEFAULT_MODE
 from optional_imports import KaldiRecognizer
+from protocol_contract import call_hash
 
 
 @dataclass
@@ -32,4 +33,62 @@ class SessionContext:
     sherpa_stream: Optional[Any] = None
     # Optional auth state (enabled if LOCAL_WS_AUTH_TOKEN set)
     authenticated: bool = False
+    # TTS executor state: calls with synthesis submitted on this connection (for
+    # cancellation), plus what drives queue priority for the next request.
+    tts_call_ids: Set[str] = field(default_factory=set)
+    tts_tasks: Set[asyncio.Task] = field(default_factory=set)
+    tts_last_task: Optional[asyncio.Task] = None
+    tts_requests: int = 0
+    tts_after_barge_in: bool = False
+    # Binary frames: the connection this session belongs to and the next TTS frame seq.
+    connection: Optional["ConnectionContext"] = None
+    frame_seq: int = 0
+
+
+@dataclass
+class ConnectionContext:
+    """Per-websocket state negotiated via "negotiate": binary frames and call multiplexing.
+
+    Without multiplexing every message uses ``default``. With it, messages carrying a
+    ``call_id`` get their own SessionContext so several calls can share one connection.
+    """
+
+    default: SessionContext = field(default_factory=SessionContext)
+    frames_version: Optional[int] = None
+    frame_codecs: List[str] = field(default_factory=list)
+    multiplex: bool = False
+    calls: Dict[str, SessionContext] = field(default_factory=dict)
+    calls_by_hash: Dict[int, SessionContext] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        self.default.connection = self
+
+    def sessions(self) -> List[SessionContext]:
+        return [self.default, *self.calls.values()]
+
+    def session_for(self, call_id: Optional[str]) -> Optional[SessionContext]:
+        """Session owning ``call_id``, created on first use; None on a call-hash collision."""
+        if not self.multiplex or not call_id:
+            return self.default
+        session = self.calls.get(call_id)
+        if session is not None:
+            return session
+        hashed = call_hash(call_id)
+        if hashed in self.calls_by_hash:
+            return None
+        session = SessionContext(
+            call_id=call_id,
+            mode=self.default.mode,
+            authenticated=self.default.authenticated,
+            connection=self,
+        )
+        self.calls[call_id] = session
+        self.calls_by_hash[hashed] = session
+        return session
+
+    def remove_call(self, call_id: str) -> Optional[SessionContext]:
+        session = self.calls.pop(call_id, None)
+        if session is not None:
+            self.calls_by_hash.pop(call_hash(call_id), None)
+        return session
 
@@ -5,6 +5,20 @@ from typing import Any, Dict, Optional, Tuple
 
 from constants import DEBUG_AUDIO_FLOW, _level_name
 
+def _model_swap_status(server) -> Dict[str, Any]:
+    front = server.front
+    return {
+        "strategy": server.config.model_swap,
+        "generation": server.generation,
+        "connections": len(server.connections),
+        "draining": [
+            {"generation": retired.generation, "connections": len(retired.connections)}
+            for retired in front.retired
+        ],
+        "last_swap": front.last_swap,
+    }
+
+
 def _stt_status(server) -> Tuple[bool, Optional[str], Optional[str]]:
     if server.stt_backend == "vosk":
         loaded = server.mock_models or server.stt_model is not None
@@ -136,6 +150,9 @@ def build_status_response(server) -> Dict[str, Any]:
             "api_key_set": bool(server.kokoro_api_key),
         },
         "gpu": gpu_status,
+        "tts_executor": server.tts_executor.stats(),
+        "process": {"pid": os.getpid(), "worker": getattr(server, "worker_name", None)},
+        "model_swap": _model_swap_status(server),
         "config": {
             "log_level": _level_name,
             "debug_audio": DEBUG_AUDIO_FLOW,
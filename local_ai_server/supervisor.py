@@ -0,0 +1,839 @@
+"""
+Multi-worker mode for local_ai_server (LOCAL_AI_WORKERS).
+
+One process serving every session shares a single event loop and GIL, and llama-cpp /
+Faster-Whisper inference is serialized by per-process locks. In supervisor mode a fork server loads the
+models once and forks worker processes that inherit them copy-on-write (GGUF/ONNX weights
+are mmap'd, so the pages stay shared), while the supervisor serves the public port as a
+front door:
+
+- The fork server is forked by ``Supervisor.start_fork_server`` before the supervisor
+  starts its event loop, and never runs one while it forks: workers are never copied
+  from a process with a running loop and executor threads. It reports worker exits to
+  the supervisor, which asks it to restart them.
+
+- Workers are grouped in per-stage pools (``stt=4,llm=1,tts=2``) or one shared pool
+  (``4``). Audio/``set_mode`` go to the STT pool, ``llm_request`` to the LLM pool,
+  ``tts_request`` to the TTS pool. A ``full``-mode session runs its whole turn in the
+  STT-pool worker that receives its audio.
+- Per connection and pool, the worker is chosen by rendezvous hashing on ``call_id``, so
+  a call (and its reconnects) keeps landing on the same worker while it is up.
+- ``status``/``capabilities`` are answered with an aggregate of every worker;
+  ``switch_model``/``reload_*`` are broadcast so workers never diverge.
+- ``negotiate`` is answered by the front door and replayed to each worker a session
+  opens, so binary audio frames pass straight through. Call multiplexing is declined:
+  calls sharing one client connection could not each keep their own worker.
+
+The front door is a plain websocket relay rather than SO_REUSEPORT: the kernel would
+balance connections, but could neither keep a call on one worker nor aggregate status.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import hashlib
+import itertools
+import json
+import logging
+import os
+import re
+import select
+import signal
+import socket
+from dataclasses import dataclass, replace
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Set, Tuple
+
+from websockets.exceptions import ConnectionClosed
+
+try:
+    from websockets.asyncio.client import connect  # websockets>=15
+    from websockets.asyncio.server import serve
+except Exception:  # pragma: no cover - local dev fallback
+    from websockets.client import connect  # websockets<15
+    from websockets.server import serve
+
+STAGES = ("stt", "llm", "tts")
+ANY_POOL = "any"
+
+# Answered by the front door (fan-out to workers) instead of a session's worker.
+CONTROL_TYPES = {
+    "status": "status_response",
+    "capabilities": "capabilities_response",
+    "switch_model": "switch_response",
+    "reload_models": "reload_response",
+    "reload_llm": "reload_response",
+    "backends": "backends_response",
+    "backend_schema": "backend_schema_response",
+}
+BROADCAST_TYPES = {"switch_model", "reload_models", "reload_llm"}
+_RELOAD_TIMEOUT_SEC = 900.0
+_CONTROL_TIMEOUT_SEC = 10.0
+_READY_TIMEOUT_SEC = 600.0
+
+_TYPE_PREFIX = re.compile(r'"type"\s*:\s*"([A-Za-z_]+)"')
+
+
+def parse_worker_pools(spec: str) -> Dict[str, int]:
+    """Parse LOCAL_AI_WORKERS: ``""``/``"1"`` (single process), ``"4"`` or ``"stt=4,llm=1,tts=2"``."""
+    spec = (spec or "").strip().lower()
+    if not spec:
+        return {}
+    if spec.isdigit():
+        count = int(spec)
+        return {ANY_POOL: count} if count > 1 else {}
+    pools: Dict[str, int] = {}
+    for part in spec.split(","):
+        name, sep, raw_count = part.partition("=")
+        name = name.strip()
+        if not sep or name not in STAGES + (ANY_POOL,) or not raw_count.strip().isdigit():
+            raise ValueError(
+                f"Invalid LOCAL_AI_WORKERS entry {part.strip()!r} "
+                "(expected e.g. '4' or 'stt=4,llm=1,tts=2')"
+            )
+        if int(raw_count) > 0:
+            pools[name] = int(raw_count)
+    return pools
+
+
+def stage_for_message(msg_type: Optional[str]) -> str:
+    """Pool stage a session message belongs to (binary audio is ``None`` -> stt)."""
+    if msg_type == "llm_request":
+        return "llm"
+    if msg_type == "tts_request":
+        return "tts"
+    return "stt"
+
+
+def _peek_type(message: str) -> Optional[str]:
+    # Clients put "type" first; avoid a full JSON parse of every base64 audio frame.
+    match = _TYPE_PREFIX.search(message, 0, 128)
+    if match:
+        return match.group(1)
+    try:
+        return (json.loads(message) or {}).get("type")
+    except (ValueError, AttributeError):
+        return None
+
+
+@dataclass
+class WorkerSpec:
+    pool: str
+    index: int
+    slot: int
+    port: int
+    pid: Optional[int] = None
+    ready: bool = False
+    restarts: int = 0
+
+    @property
+    def name(self) -> str:
+        return f"{self.pool}-{self.index}"
+
+    @property
+    def url(self) -> str:
+        return f"ws://127.0.0.1:{self.port}"
+
+
+def plan_workers(pools: Dict[str, int], base_port: int) -> Dict[str, List[WorkerSpec]]:
+    plan: Dict[str, List[WorkerSpec]] = {}
+    slot = itertools.count()
+    for pool in STAGES + (ANY_POOL,):
+        for index in range(pools.get(pool, 0)):
+            number = next(slot)
+            plan.setdefault(pool, []).append(
+                WorkerSpec(pool=pool, index=index, slot=number, port=base_port + number)
+            )
+    return plan
+
+
+def rank_workers(workers: Sequence[WorkerSpec], key: str) -> List[WorkerSpec]:
+    """Rendezvous (highest-random-weight) order: stable per key, minimal reshuffle on changes."""
+
+    def weight(worker: WorkerSpec) -> bytes:
+        return hashlib.blake2b(f"{key}|{worker.name}".encode(), digest_size=8).digest()
+
+    return sorted(workers, key=weight, reverse=True)
+
+
+def merge_status(results: Sequence[Tuple[WorkerSpec, Optional[Dict[str, Any]]]]) -> Dict[str, Any]:
+    answered = [(worker, resp) for worker, resp in results if resp]
+    workers = [
+        {
+            "name": worker.name,
+            "pool": worker.pool,
+            "port": worker.port,
+            "pid": worker.pid,
+            "ready": resp is not None,
+            "restarts": worker.restarts,
+            "degraded": bool(((resp or {}).get("config") or {}).get("degraded")),
+            "tts_queue_depth": ((resp or {}).get("tts_executor") or {}).get("queue_depth"),
+        }
+        for worker, resp in results
+    ]
+    if not answered:
+        return {
+            "type": "status_response",
+            "status": "error",
+            "message": "no local_ai_server workers responded",
+            "workers": workers,
+        }
+
+    merged = copy.deepcopy(answered[0][1])
+    for stage, info in (merged.get("models") or {}).items():
+        info["loaded"] = all(
+            bool(((resp.get("models") or {}).get(stage) or {}).get("loaded")) for _, resp in answered
+        )
+
+    executors = [resp.get("tts_executor") or {} for _, resp in answered]
+    if executors:
+        total = dict(executors[0])
+        for key in ("queue_depth", "running", "submitted", "completed", "failed", "cancelled"):
+            total[key] = sum(int(e.get(key) or 0) for e in executors)
+        total["max_queue_depth"] = max(int(e.get("max_queue_depth") or 0) for e in executors)
+        # Worst worker: percentiles don't add up across processes.
+        for key in ("service_time_ms", "queue_wait_ms"):
+            worst: Dict[str, Any] = {}
+            for e in executors:
+                for stat, value in (e.get(key) or {}).items():
+                    if value is not None and (worst.get(stat) is None or value > worst[stat]):
+                        worst[stat] = value
+            total[key] = worst
+        merged["tts_executor"] = total
+
+    config = merged.setdefault("config", {})
+    config["degraded"] = len(answered) < len(results) or any(
+        bool((resp.get("config") or {}).get("degraded")) for _, resp in answered
+    )
+    merged["workers"] = workers
+    return merged
+
+
+def merge_capabilities(results: Sequence[Tuple[WorkerSpec, Optional[Dict[str, Any]]]]) -> Dict[str, Any]:
+    answered = [resp for _, resp in results if resp]
+    capabilities: Dict[str, Any] = {}
+    for resp in answered:
+        for name, available in (resp.get("capabilities") or {}).items():
+            capabilities[name] = capabilities.get(name, True) and bool(available)
+    return {"type": "capabilities_response", "capabilities": capabilities, "workers": len(answered)}
+
+
+class _Upstream:
+    def __init__(self, worker: WorkerSpec, websocket: Any, pump: "asyncio.Task[None]"):
+        self.worker = worker
+        self.websocket = websocket
+        self.pump = pump
+
+
+class FrontDoor:
+    """Public websocket endpoint relaying sessions to supervisor workers."""
+
+    def __init__(
+        self,
+        pools: Dict[str, List[WorkerSpec]],
+        auth_token: str = "",
+        on_broadcast: Optional[Callable[[str], Awaitable[None]]] = None,
+    ):
+        self._pools = pools
+        self._auth_token = auth_token
+        self._on_broadcast = on_broadcast
+        self._ids = itertools.count(1)
+
+    def workers(self) -> List[WorkerSpec]:
+        return [worker for pool in self._pools.values() for worker in pool]
+
+    def pool_for(self, stage: str) -> str:
+        if stage in self._pools:
+            return stage
+        if ANY_POOL in self._pools:
+            return ANY_POOL
+        return next(pool for pool in STAGES if pool in self._pools)
+
+    async def handler(self, client) -> None:
+        conn_id = f"conn-{next(self._ids)}"
+        call_id: Optional[str] = None
+        auth_message: Optional[str] = None
+        negotiate_message: Optional[str] = None
+        authenticated = not self._auth_token
+        upstreams: Dict[str, _Upstream] = {}
+        try:
+            async for message in client:
+                if isinstance(message, (bytes, bytearray)):
+                    msg_type: Optional[str] = None
+                else:
+                    msg_type = _peek_type(message)
+
+                if msg_type == "auth":
+                    data = _loads(message)
+                    call_id = data.get("call_id") or call_id
+                    token = (data.get("auth_token") or data.get("token") or "").strip()
+                    authenticated = not self._auth_token or token == self._auth_token
+                    auth_message = message
+                    await client.send(
+                        json.dumps(
+                            {"type": "auth_response", "status": "ok"}
+                            if authenticated
+                            else {"type": "auth_response", "status": "error", "message": "invalid_auth_token"}
+                        )
+                    )
+                    continue
+
+                if msg_type == "negotiate" and authenticated:
+                    from protocol_contract import negotiate_binary_frames
+
+                    offer = _loads(message).get("binary_frames")
+                    negotiate_message = json.dumps({"type": "negotiate", "binary_frames": offer, "multiplex": False})
+                    # Workers already in use echo an identical negotiate_response.
+                    for upstream in list(upstreams.values()):
+                        await upstream.websocket.send(negotiate_message)
+                    await client.send(
+                        json.dumps(
+                            {
+                                "type": "negotiate_response",
+                                "binary_frames": negotiate_binary_frames(offer),
+                                "multiplex": False,
+                            }
+                        )
+                    )
+                    continue
+
+                if msg_type in CONTROL_TYPES:
+                    if not authenticated:
+                        await client.send(
+                            json.dumps(
+                                {"type": "auth_response", "status": "error", "message": "authentication_required"}
+                            )
+                        )
+                        continue
+                    await client.send(json.dumps(await self.control(msg_type, message)))
+                    continue
+
+                if msg_type in ("set_mode", "tts_request", "llm_request", "audio") and call_id is None:
+                    call_id = _loads(message).get("call_id") or None
+
+                if msg_type == "barge_in":
+                    # TTS may be running in the TTS pool or (full mode) in the STT worker.
+                    for upstream in list(upstreams.values()):
+                        await upstream.websocket.send(message)
+                    continue
+
+                pool = self.pool_for(stage_for_message(msg_type))
+                upstream = upstreams.get(pool)
+                if upstream is None or upstream.pump.done():
+                    upstream = await self._open_upstream(
+                        client, pool, call_id or conn_id, auth_message, negotiate_message
+                    )
+                    if upstream is None:
+                        await client.close(1011, "no local_ai_server worker available")
+                        return
+                    upstreams[pool] = upstream
+                await upstream.websocket.send(message)
+        except ConnectionClosed:
+            pass
+        finally:
+            for upstream in upstreams.values():
+                upstream.pump.cancel()
+                try:
+                    await upstream.websocket.close()
+                except Exception:
+                    pass
+
+    async def _open_upstream(
+        self,
+        client,
+        pool: str,
+        key: str,
+        auth_message: Optional[str],
+        negotiate_message: Optional[str] = None,
+    ) -> Optional[_Upstream]:
+        for worker in rank_workers([w for w in self._pools[pool] if w.ready], key):
+            try:
+                websocket = await connect(worker.url, max_size=None, ping_interval=60, ping_timeout=120)
+            except OSError as exc:
+                logging.warning("⚠️ Worker %s unreachable (%s); trying next", worker.name, exc)
+                worker.ready = False
+                continue
+            if auth_message is not None:
+                # Replay the client's auth; its reply was already sent by the front door.
+                await websocket.send(auth_message)
+                await asyncio.wait_for(websocket.recv(), _CONTROL_TIMEOUT_SEC)
+            if negotiate_message is not None:
+                await websocket.send(negotiate_message)
+                await asyncio.wait_for(websocket.recv(), _CONTROL_TIMEOUT_SEC)
+            pump = asyncio.create_task(self._pump(websocket, client, worker))
+            logging.debug("🔀 Routed %s (%s) to worker %s", key, pool, worker.name)
+            return _Upstream(worker, websocket, pump)
+        logging.error("❌ No ready worker in pool %s", pool)
+        return None
+
+    @staticmethod
+    async def _pump(upstream, client, worker: WorkerSpec) -> None:
+        try:
+            async for message in upstream:
+                await client.send(message)
+        except ConnectionClosed:
+            pass
+        # Worker went away mid-session: drop the client so it reconnects to a live worker.
+        if client.state.name == "OPEN":
+            logging.warning("⚠️ Worker %s closed a session; closing client connection", worker.name)
+            await client.close(1011, "local_ai_server worker restarted")
+
+    async def control(self, msg_type: str, message: str) -> Dict[str, Any]:
+        ready = [w for w in self.workers() if w.ready]
+        if msg_type in ("backends", "backend_schema"):
+            targets = ready[:1]
+        else:
+            targets = ready
+        timeout = _RELOAD_TIMEOUT_SEC if msg_type in BROADCAST_TYPES else _CONTROL_TIMEOUT_SEC
+        responses = await asyncio.gather(
+            *(self._ask(w, message, CONTROL_TYPES[msg_type], timeout) for w in targets)
+        )
+        results = list(zip(targets, responses))
+
+        if msg_type == "status":
+            offline = [(w, None) for w in self.workers() if not w.ready]
+            return merge_status(results + offline)
+        if msg_type == "capabilities":
+            return merge_capabilities(results)
+
+        answered = [resp for _, resp in results if resp]
+        if msg_type in BROADCAST_TYPES:
+            failed = [w.name for w, resp in results if not resp or resp.get("status") == "error"]
+            if failed or not answered:
+                return {
+                    "type": CONTROL_TYPES[msg_type],
+                    "status": "error",
+                    "message": f"{msg_type} failed on workers: {', '.join(failed) or 'none ready'}",
+                }
+            if self._on_broadcast is not None:
+                await self._on_broadcast(message)
+            response = dict(answered[0])
+            response["workers"] = len(answered)
+            return response
+        if answered:
+            return answered[0]
+        return {"type": CONTROL_TYPES[msg_type], "error": "no local_ai_server worker available"}
+
+    async def _ask(
+        self, worker: WorkerSpec, message: str, response_type: str, timeout: float
+    ) -> Optional[Dict[str, Any]]:
+        try:
+            async with connect(worker.url, max_size=None, open_timeout=5) as websocket:
+                if self._auth_token:
+                    await websocket.send(json.dumps({"type": "auth", "auth_token": self._auth_token}))
+                await websocket.send(message)
+                loop = asyncio.get_running_loop()
+                deadline = loop.time() + timeout
+                while True:
+                    reply = await asyncio.wait_for(websocket.recv(), max(0.0, deadline - loop.time()))
+                    if isinstance(reply, str):
+                        data = _loads(reply)
+                        if data.get("type") == response_type:
+                            return data
+        except Exception as exc:
+            logging.warning("⚠️ Worker %s did not answer %s: %s", worker.name, response_type, exc)
+            return None
+
+
+def _loads(message: Any) -> Dict[str, Any]:
+    try:
+        data = json.loads(message)
+    except (TypeError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+class _NullWebSocket:
+    """Sink for replies when the fork server replays a control message on itself."""
+
+    remote_address = ("supervisor", 0)
+
+    async def send(self, message: Any) -> None:
+        return None
+
+
+def _gpu_configured(server) -> bool:
+    return (
+        str(server.faster_whisper_device).lower() == "cuda"
+        or str(server.melotts_device).lower() == "cuda"
+        or int(server.llm_gpu_layers or 0) != 0
+    )
+
+
+async def run_worker(server, spec: WorkerSpec, *, preload: bool) -> None:
+    """Serve one worker's sessions on 127.0.0.1:<spec.port> (runs in the forked child)."""
+    server.after_fork(spec.name)
+    if preload:
+        await server._configure_tts_process_pool()
+    else:
+        if server.kroko_embedded:
+            # Each worker runs its own embedded Kroko server.
+            server.config = replace(server.config, kroko_port=server.config.kroko_port + spec.slot)
+            server._apply_config(server.config)
+        await server.initialize_models()
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(signum, stop.set)
+    try:
+        async with serve(
+            server.handler,
+            "127.0.0.1",
+            spec.port,
+            ping_interval=60,
+            ping_timeout=120,
+            max_size=None,
+            origins=None,
+        ):
+            logging.info("🧵 Worker %s (pid %s) serving on 127.0.0.1:%s", spec.name, os.getpid(), spec.port)
+            await stop.wait()
+    finally:
+        await server.shutdown()
+
+
+async def _preload_models(server) -> None:
+    await server.initialize_models()
+    # Worker processes of the TTS executor cannot be inherited; each worker starts its own.
+    await server.tts_executor.configure_process_pool(None)
+
+
+async def _apply_model_change(server, preload: bool, message: str) -> None:
+    """Mirror a broadcast model change in the fork server so restarted workers inherit it."""
+    from session import SessionContext
+
+    if not preload:
+        # Workers load their own models; the fork server only needs the new config.
+        data = _loads(message)
+        if data.get("type") == "switch_model":
+            data["dry_run"] = True
+            message = json.dumps(data)
+        elif data.get("type") != "reload_llm":
+            return
+        else:
+            path = data.get("llm_model_path") or data.get("model_path")
+            if path:
+                server.active.config = replace(server.active.config, llm_model_path=path)
+                server.active._apply_config(server.active.config)
+            return
+    try:
+        await server.ws_protocol.handle_json_message(
+            _NullWebSocket(), SessionContext(authenticated=True), message
+        )
+    finally:
+        # A blue/green switch leaves the new generation in ``active``; workers fork from it.
+        await server.active.tts_executor.configure_process_pool(None)
+
+
+def _send_line(sock: socket.socket, payload: Dict[str, Any]) -> None:
+    sock.sendall(json.dumps(payload).encode() + b"\n")
+
+
+def _run_worker_process(sock: socket.socket, server, spec: WorkerSpec, preload: bool) -> None:
+    """Body of a forked worker; never returns."""
+    code = 1
+    try:
+        sock.close()
+        signal.signal(signal.SIGINT, signal.SIG_DFL)
+        asyncio.run(run_worker(server, spec, preload=preload))
+        code = 0
+    except BaseException:
+        logging.exception("❌ Worker %s crashed", spec.name)
+    finally:
+        os._exit(code)
+
+
+def _serve_forks(sock: socket.socket, server, specs: Dict[str, WorkerSpec], preload: bool) -> None:
+    """Fork server main loop: fork workers on request and report their exits.
+
+    Runs without an event loop; ``asyncio.run`` is only used for model loads and changes,
+    and each of those loops is closed again before the next fork.
+    """
+    # Ctrl-C reaches the whole process group; shutdown is the supervisor's call.
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    if preload:
+        asyncio.run(_preload_models(server))
+    _send_line(sock, {"event": "ready"})
+    children: Set[int] = set()
+    pending = b""
+    try:
+        while True:
+            readable, _, _ = select.select([sock], [], [], 0.2)
+            if readable:
+                chunk = sock.recv(65536)
+                if not chunk:
+                    return  # supervisor gone
+                pending += chunk
+                while b"\n" in pending:
+                    line, pending = pending.split(b"\n", 1)
+                    command = _loads(line)
+                    if command.get("op") == "fork":
+                        spec = specs[command["worker"]]
+                        pid = os.fork()
+                        if pid == 0:
+                            _run_worker_process(sock, server.active, spec, preload)
+                        children.add(pid)
+                        _send_line(sock, {"event": "forked", "worker": spec.name, "pid": pid})
+                    elif command.get("op") == "apply":
+                        try:
+                            asyncio.run(_apply_model_change(server, preload, command["message"]))
+                        except Exception:
+                            logging.exception("❌ Fork server failed to apply a model change")
+                        _send_line(sock, {"event": "applied"})
+            for pid in list(children):
+                reaped, status = os.waitpid(pid, os.WNOHANG)
+                if reaped:
+                    children.discard(pid)
+                    _send_line(sock, {"event": "exited", "pid": pid, "status": status})
+    finally:
+        for pid in children:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+        try:
+            asyncio.run(server.shutdown())
+        except Exception:
+            logging.debug("Fork server shutdown failed", exc_info=True)
+
+
+class Supervisor:
+    """Runs the front door and keeps per-stage workers (forked by the fork server) alive."""
+
+    def __init__(self, server, pools: Dict[str, int]):
+        self._server = server
+        config = server.config
+        base_port = config.worker_base_port or config.ws_port + 1
+        self._plan = plan_workers(pools, base_port)
+        self._preload = bool(config.worker_preload)
+        if self._preload and _gpu_configured(server):
+            logging.warning(
+                "⚠️ GPU inference configured: CUDA contexts do not survive fork, "
+                "so each worker loads its own models (LOCAL_AI_WORKER_PRELOAD ignored)"
+            )
+            self._preload = False
+        self._stopping = False
+        self._restarts: Set[asyncio.Task] = set()
+        self._fork_server_pid: Optional[int] = None
+        self._sock: Optional[socket.socket] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._listener: Optional[asyncio.Task] = None
+        self._fork_server_ready: Optional[asyncio.Event] = None
+        self._forks: Dict[str, "asyncio.Future[int]"] = {}
+        self._applied: Optional["asyncio.Future[None]"] = None
+        self._apply_lock: Optional[asyncio.Lock] = None
+        # Exit statuses reported by the fork server, by worker pid.
+        self._exited: Dict[int, int] = {}
+
+    @property
+    def workers(self) -> List[WorkerSpec]:
+        return [worker for pool in self._plan.values() for worker in pool]
+
+    def start_fork_server(self) -> None:
+        """Fork the process that loads models and forks workers; call before any event loop runs."""
+        parent_sock, child_sock = socket.socketpair()
+        pid = os.fork()
+        if pid:
+            child_sock.close()
+            self._fork_server_pid = pid
+            self._sock = parent_sock
+            return
+        # Child: never return into the caller.
+        code = 1
+        try:
+            parent_sock.close()
+            specs = {worker.name: worker for worker in self.workers}
+            _serve_forks(child_sock, self._server, specs, self._preload)
+            code = 0
+        except BaseException:
+            logging.exception("❌ Worker fork server crashed")
+        finally:
+            os._exit(code)
+
+    async def run(self) -> None:
+        if self._sock is None:
+            raise RuntimeError("Supervisor.start_fork_server() must be called before the event loop starts")
+        config = self._server.config
+        logging.info(
+            "🧵 Supervisor mode: %s (preload=%s)",
+            ", ".join(f"{pool}={len(workers)}" for pool, workers in self._plan.items()),
+            self._preload,
+        )
+        stop = asyncio.Event()
+        self._fork_server_ready = asyncio.Event()
+        self._apply_lock = asyncio.Lock()
+        reader, self._writer = await asyncio.open_connection(sock=self._sock)
+        self._listener = asyncio.create_task(self._listen(reader, stop))
+        try:
+            await self._fork_server_ready.wait()
+            for worker in self.workers:
+                await self._spawn(worker)
+            await asyncio.gather(*(self._wait_ready(worker) for worker in self.workers))
+
+            front_door = FrontDoor(
+                self._plan, auth_token=config.ws_auth_token, on_broadcast=self._apply_locally
+            )
+            loop = asyncio.get_running_loop()
+            for signum in (signal.SIGTERM, signal.SIGINT):
+                loop.add_signal_handler(signum, stop.set)
+
+            watcher = asyncio.create_task(self._watch(stop))
+            try:
+                async with serve(
+                    front_door.handler,
+                    config.ws_host,
+                    config.ws_port,
+                    ping_interval=60,
+                    ping_timeout=120,
+                    max_size=None,
+                    origins=None,
+                ):
+                    logging.info(
+                        "🚀 Local AI Server front door on ws://%s:%s (%s workers)",
+                        config.ws_host,
+                        config.ws_port,
+                        len(self.workers),
+                    )
+                    await stop.wait()
+            finally:
+                self._stopping = True
+                watcher.cancel()
+                await self._stop_workers()
+        finally:
+            await self._stop_fork_server()
+
+    async def _listen(self, reader: asyncio.StreamReader, stop: asyncio.Event) -> None:
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+            event = _loads(line)
+            kind = event.get("event")
+            if kind == "ready":
+                self._fork_server_ready.set()
+            elif kind == "forked":
+                future = self._forks.pop(event.get("worker"), None)
+                if future is not None and not future.done():
+                    future.set_result(int(event["pid"]))
+            elif kind == "exited":
+                self._exited[int(event["pid"])] = int(event.get("status", -1))
+            elif kind == "applied":
+                if self._applied is not None and not self._applied.done():
+                    self._applied.set_result(None)
+        if not self._stopping:
+            logging.error("❌ Worker fork server exited; stopping supervisor")
+        for future in list(self._forks.values()) + [self._applied]:
+            if future is not None and not future.done():
+                future.set_exception(RuntimeError("worker fork server exited"))
+        self._fork_server_ready.set()
+        stop.set()
+
+    def _command(self, op: str, **fields: Any) -> None:
+        self._writer.write(json.dumps({"op": op, **fields}).encode() + b"\n")
+
+    async def _apply_locally(self, message: str) -> None:
+        """Mirror a broadcast model change in the fork server so restarted workers inherit it."""
+        async with self._apply_lock:
+            self._applied = asyncio.get_running_loop().create_future()
+            self._command("apply", message=message)
+            await self._applied
+
+    async def _spawn(self, worker: WorkerSpec) -> None:
+        worker.ready = False
+        future = asyncio.get_running_loop().create_future()
+        self._forks[worker.name] = future
+        self._command("fork", worker=worker.name)
+        try:
+            worker.pid = await future
+        except RuntimeError:
+            worker.pid = None
+
+    async def _wait_ready(self, worker: WorkerSpec) -> None:
+        deadline = asyncio.get_running_loop().time() + _READY_TIMEOUT_SEC
+        while asyncio.get_running_loop().time() < deadline:
+            if worker.pid is None or self._reap(worker) is not None:
+                return
+            try:
+                _, writer = await asyncio.open_connection("127.0.0.1", worker.port)
+            except OSError:
+                await asyncio.sleep(0.2)
+                continue
+            writer.close()
+            worker.ready = True
+            return
+        logging.error("❌ Worker %s did not start listening on port %s", worker.name, worker.port)
+
+    def _reap(self, worker: WorkerSpec) -> Optional[int]:
+        return self._exited.get(worker.pid) if worker.pid is not None else None
+
+    async def _watch(self, stop: asyncio.Event) -> None:
+        while not stop.is_set():
+            await asyncio.sleep(0.5)
+            for worker in self.workers:
+                if worker.pid is None or self._stopping:
+                    continue
+                status = self._exited.pop(worker.pid, None)
+                if status is None:
+                    continue
+                worker.ready = False
+                worker.pid = None
+                worker.restarts += 1
+                backoff = min(30.0, 0.5 * 2 ** min(worker.restarts, 6))
+                logging.error(
+                    "❌ Worker %s exited (status %s); restarting in %.1fs", worker.name, status, backoff
+                )
+                task = asyncio.create_task(self._restart(worker, backoff))
+                self._restarts.add(task)
+                task.add_done_callback(self._restarts.discard)
+
+    async def _restart(self, worker: WorkerSpec, delay: float) -> None:
+        await asyncio.sleep(delay)
+        if self._stopping:
+            return
+        await self._spawn(worker)
+        await self._wait_ready(worker)
+
+    async def _stop_workers(self) -> None:
+        running = [w for w in self.workers if w.pid is not None]
+        for worker in running:
+            try:
+                os.kill(worker.pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+        deadline = asyncio.get_running_loop().time() + 10.0
+        while running and asyncio.get_running_loop().time() < deadline:
+            running = [w for w in running if self._reap(w) is None]
+            await asyncio.sleep(0.1)
+        for worker in running:
+            logging.warning("⚠️ Worker %s ignored SIGTERM; killing", worker.name)
+            try:
+                os.kill(worker.pid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+
+    async def _stop_fork_server(self) -> None:
+        """Close the command socket (the fork server exits on EOF) and reap it."""
+        self._stopping = True
+        if self._writer is not None:
+            self._writer.close()
+        if self._listener is not None:
+            try:
+                await asyncio.wait_for(self._listener, 5.0)
+            except (asyncio.TimeoutError, asyncio.CancelledError):
+                self._listener.cancel()
+        pid, self._fork_server_pid = self._fork_server_pid, None
+        if pid is None:
+            return
+        deadline = asyncio.get_running_loop().time() + 10.0
+        while asyncio.get_running_loop().time() < deadline:
+            try:
+                if os.waitpid(pid, os.WNOHANG)[0]:
+                    return
+            except ChildProcessError:
+                return
+            await asyncio.sleep(0.1)
+        try:
+            os.kill(pid, signal.SIGKILL)
+            os.waitpid(pid, 0)
+        except (ProcessLookupError, ChildProcessError):
+            pass
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import io
 import logging
 import os
+import wave
 from typing import Optional
 
 
@@ -261,3 +263,52 @@ class MeloTTSBackend:
         self._initialized = False
         logging.info("🛑 MELOTTS - TTS shutdown")
 
+
+
+def pcm16_to_wav(pcm16_data: bytes, sample_rate: int) -> bytes:
+    """Wrap mono PCM16 in a WAV container (sox needs the header for conversion)."""
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(sample_rate)
+        wav_file.writeframes(pcm16_data)
+    return buffer.getvalue()
+
+
+def synthesize_ulaw(backend, text: str) -> bytes:
+    """Synthesize ``text`` with a Kokoro/MeloTTS backend and convert to 8kHz uLaw (blocking)."""
+    from audio_processor import AudioProcessor
+
+    pcm16_data = backend.synthesize(text)
+    if not pcm16_data:
+        return b""
+    return AudioProcessor.convert_to_ulaw_8k(
+        pcm16_to_wav(pcm16_data, backend.sample_rate), backend.sample_rate
+    )
+
+
+# Process-pool workers (see tts_executor.TTSExecutor): each worker process loads one
+# backend in its initializer and serves every synthesis request against it.
+_worker_backend = None
+
+_WORKER_BACKENDS = {
+    "kokoro": KokoroTTSBackend,
+    "melotts": MeloTTSBackend,
+}
+
+
+def init_worker_backend(kind: str, kwargs: dict) -> None:
+    global _worker_backend
+    backend = _WORKER_BACKENDS[kind](**kwargs)
+    if not backend.initialize():
+        raise RuntimeError(f"Failed to initialize {kind} TTS in worker process {os.getpid()}")
+    _worker_backend = backend
+
+
+def worker_ready() -> int:
+    return os.getpid()
+
+
+def worker_synthesize_ulaw(text: str) -> bytes:
+    return synthesize_ulaw(_worker_backend, text)
@@ -0,0 +1,362 @@
+from __future__ import annotations
+
+import asyncio
+import itertools
+import logging
+import multiprocessing
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from time import monotonic
+from typing import Any, Callable, Deque, Dict, List, Optional, Sequence
+
+PRIORITY_HIGH = 0
+PRIORITY_NORMAL = 1
+PRIORITY_LOW = 2
+
+_PRIORITY_NAMES = {"high": PRIORITY_HIGH, "normal": PRIORITY_NORMAL, "low": PRIORITY_LOW}
+
+# Number of recent service times kept for the p50/p95 figures in status.
+_SERVICE_WINDOW = 256
+
+
+def parse_priority(raw: Any, default: int = PRIORITY_NORMAL) -> int:
+    """Map a client-supplied priority ("high"/"normal"/"low" or 0-2) to a queue priority."""
+    if raw is None:
+        return default
+    if isinstance(raw, bool):
+        return default
+    if isinstance(raw, (int, float)):
+        return max(PRIORITY_HIGH, min(PRIORITY_LOW, int(raw)))
+    return _PRIORITY_NAMES.get(str(raw).strip().lower(), default)
+
+
+class TTSCancelledError(Exception):
+    """Raised to the waiter of a synthesis job dropped by ``cancel_session``."""
+
+
+@dataclass(order=True)
+class _Job:
+    priority: int
+    seq: int
+    fn: Callable[..., Any] = field(compare=False)
+    args: Sequence[Any] = field(compare=False)
+    process_fn: Optional[Callable[..., Any]] = field(compare=False)
+    session_key: Optional[str] = field(compare=False)
+    thread_safe: bool = field(compare=False)
+    future: "asyncio.Future[Any]" = field(compare=False)
+    enqueued_at: float = field(compare=False)
+
+
+class TTSExecutor:
+    """Priority-ordered, cancellable off-loop runner for blocking TTS synthesis.
+
+    Piper (ONNX) and sox conversions release the GIL, so they run on a thread pool. Kokoro
+    and MeloTTS spend much of their time in Python (phonemizer, torch glue); with
+    ``process_workers > 0`` their synthesis runs in worker processes that each preload the
+    model once, so one long sentence cannot starve the event loop or other sessions.
+
+    Jobs wait in per-pool priority queues (lower value first, FIFO within a priority) and
+    only reach a pool when a worker is free, so a greeting submitted behind a long answer
+    still goes next. Priority only orders different sessions: a session's jobs are FIFO
+    and only its oldest one is queued at a time, so one call's sentences are synthesized
+    in the order they were submitted. Jobs with ``thread_safe=False`` (one in-process
+    model shared by every thread) run one at a time. ``cancel_session`` drops a session's
+    queued jobs and discards the result of its running ones (a started synthesis cannot
+    be interrupted).
+    """
+
+    def __init__(self, threads: int = 2, process_workers: int = 0):
+        self.threads = max(1, int(threads))
+        self.process_workers = max(0, int(process_workers))
+        self._thread_pool: Optional[ThreadPoolExecutor] = None
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+        self._process_backend: Optional[str] = None
+        self._queues: Dict[str, "asyncio.PriorityQueue[_Job]"] = {}
+        self._dispatchers: List[asyncio.Task] = []
+        self._seq = itertools.count()
+        # Sessions with a job queued or running -> their later jobs, oldest first.
+        self._pending: Dict[Any, Deque[_Job]] = {}
+        self._serial_lock: Optional[asyncio.Lock] = None
+        self._running: Dict[int, _Job] = {}
+        self._service_times: Deque[float] = deque(maxlen=_SERVICE_WINDOW)
+        self._queue_waits: Deque[float] = deque(maxlen=_SERVICE_WINDOW)
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.cancelled = 0
+        self.max_queue_depth = 0
+
+    # ------------------------------------------------------------------ pools
+
+    def _ensure_started(self) -> None:
+        if self._thread_pool is None:
+            self._thread_pool = ThreadPoolExecutor(
+                max_workers=self.threads, thread_name_prefix="tts-synth"
+            )
+        if self._dispatchers:
+            return
+        loop = asyncio.get_running_loop()
+        self._queues = {
+            "thread": asyncio.PriorityQueue(),
+            "serial": asyncio.PriorityQueue(),
+            "process": asyncio.PriorityQueue(),
+        }
+        self._serial_lock = asyncio.Lock()
+        for _ in range(self.threads):
+            self._dispatchers.append(loop.create_task(self._dispatch("thread")))
+        self._dispatchers.append(loop.create_task(self._dispatch("serial")))
+        for _ in range(self.process_workers):
+            self._dispatchers.append(loop.create_task(self._dispatch("process")))
+
+    @property
+    def process_pool_active(self) -> bool:
+        return self._process_pool is not None
+
+    async def configure_process_pool(
+        self,
+        backend: Optional[str],
+        initializer: Optional[Callable[..., Any]] = None,
+        initargs: Sequence[Any] = (),
+        warmup: Optional[Callable[[], Any]] = None,
+    ) -> bool:
+        """(Re)start the process pool for ``backend``; ``None`` just tears it down.
+
+        Workers are spawned (not forked, torch/OpenMP state is not fork-safe) and warmed
+        up front so the model load happens at startup rather than on the first call.
+        Returns False and keeps synthesis on threads if the workers fail to start.
+        """
+        await self._shutdown_process_pool()
+        if backend is None or self.process_workers <= 0:
+            return False
+        pool = ProcessPoolExecutor(
+            max_workers=self.process_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=initializer,
+            initargs=tuple(initargs),
+        )
+        if warmup is not None:
+            loop = asyncio.get_running_loop()
+            try:
+                await asyncio.gather(
+                    *(loop.run_in_executor(pool, warmup) for _ in range(self.process_workers))
+                )
+            except Exception as exc:
+                logging.error(
+                    "❌ TTS process pool for %s failed to start, synthesizing on threads: %s",
+                    backend,
+                    exc,
+                )
+                pool.shutdown(wait=False, cancel_futures=True)
+                return False
+        self._process_pool = pool
+        self._process_backend = backend
+        logging.info(
+            "✅ TTS process pool ready (backend=%s, workers=%s)", backend, self.process_workers
+        )
+        return True
+
+    async def _shutdown_process_pool(self) -> None:
+        pool, self._process_pool = self._process_pool, None
+        self._process_backend = None
+        if pool is not None:
+            await asyncio.to_thread(pool.shutdown, True, cancel_futures=True)
+
+    async def shutdown(self) -> None:
+        for task in self._dispatchers:
+            task.cancel()
+        for task in self._dispatchers:
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self._dispatchers = []
+        for queue in self._queues.values():
+            while not queue.empty():
+                job = queue.get_nowait()
+                if not job.future.done():
+                    job.future.set_exception(TTSCancelledError("TTS executor shut down"))
+        self._queues = {}
+        for pending in self._pending.values():
+            for job in pending:
+                if not job.future.done():
+                    job.future.set_exception(TTSCancelledError("TTS executor shut down"))
+        self._pending = {}
+        await self._shutdown_process_pool()
+        if self._thread_pool is not None:
+            self._thread_pool.shutdown(wait=False, cancel_futures=True)
+            self._thread_pool = None
+
+    # ------------------------------------------------------------------- jobs
+
+    async def submit(
+        self,
+        fn: Callable[..., Any],
+        *args: Any,
+        priority: int = PRIORITY_NORMAL,
+        session_key: Optional[str] = None,
+        process_fn: Optional[Callable[..., Any]] = None,
+        thread_safe: bool = True,
+    ) -> Any:
+        """Run ``fn(*args)`` off the event loop and return its result.
+
+        ``process_fn`` is the picklable, module-level equivalent used when the process pool
+        is active; it runs against the worker's preloaded model. Pass ``thread_safe=False``
+        when ``fn`` uses a model that must not run on two threads at once. Raises
+        ``TTSCancelledError`` if the session is cancelled before the result is delivered.
+        """
+        self._ensure_started()
+        loop = asyncio.get_running_loop()
+        job = _Job(
+            priority=priority,
+            seq=next(self._seq),
+            fn=fn,
+            args=args,
+            process_fn=process_fn,
+            session_key=session_key,
+            thread_safe=thread_safe,
+            future=loop.create_future(),
+            enqueued_at=monotonic(),
+        )
+        if session_key is None:
+            self._enqueue(job)
+        elif session_key in self._pending:
+            self._pending[session_key].append(job)
+        else:
+            self._pending[session_key] = deque()
+            self._enqueue(job)
+        self.submitted += 1
+        self.max_queue_depth = max(self.max_queue_depth, self.queue_depth)
+        try:
+            return await job.future
+        except asyncio.CancelledError:
+            # Waiter went away (e.g. websocket closed): don't synthesize for nobody.
+            if not job.future.done():
+                job.future.cancel()
+            raise
+
+    def _enqueue(self, job: _Job) -> None:
+        if job.process_fn is not None and self._process_pool is not None:
+            pool = "process"
+        else:
+            pool = "thread" if job.thread_safe else "serial"
+        self._queues[pool].put_nowait(job)
+
+    def _release(self, job: _Job) -> None:
+        """``job`` left the pool: queue the next live job of its session, if any."""
+        pending = self._pending.get(job.session_key)
+        if pending is None:
+            return
+        while pending:
+            nxt = pending.popleft()
+            if not nxt.future.done():
+                self._enqueue(nxt)
+                return
+        del self._pending[job.session_key]
+
+    def cancel_session(self, session_key: str) -> int:
+        """Drop queued jobs and discard running results for ``session_key``."""
+        dropped = 0
+        for job in (
+            list(self._running.values())
+            + [job for queue in self._queues.values() for job in queue._queue]  # type: ignore[attr-defined]
+            + list(self._pending.get(session_key, ()))
+        ):
+            if job.session_key == session_key and not job.future.done():
+                job.future.set_exception(TTSCancelledError(f"TTS cancelled for {session_key}"))
+                dropped += 1
+        self.cancelled += dropped
+        return dropped
+
+    async def _dispatch(self, pool: str) -> None:
+        queue = self._queues[pool]
+        loop = asyncio.get_running_loop()
+        while True:
+            job = await queue.get()
+            if job.future.done():
+                # Cancelled while queued.
+                self._release(job)
+                continue
+            started = monotonic()
+            self._queue_waits.append(started - job.enqueued_at)
+            self._running[job.seq] = job
+            try:
+                try:
+                    if pool == "process" and self._process_pool is not None:
+                        result = await loop.run_in_executor(
+                            self._process_pool, job.process_fn, *job.args
+                        )
+                    else:
+                        result = await self._run_on_thread(job)
+                except BrokenProcessPool as exc:
+                    logging.error(
+                        "❌ TTS process pool broke (%s); falling back to thread synthesis", exc
+                    )
+                    self._process_pool = None
+                    self._process_backend = None
+                    result = await self._run_on_thread(job)
+            except asyncio.CancelledError:
+                if not job.future.done():
+                    job.future.set_exception(TTSCancelledError("TTS executor shut down"))
+                raise
+            except Exception as exc:
+                self.failed += 1
+                if not job.future.done():
+                    job.future.set_exception(exc)
+            else:
+                self.completed += 1
+                self._service_times.append(monotonic() - started)
+                if not job.future.done():
+                    job.future.set_result(result)
+            finally:
+                self._running.pop(job.seq, None)
+                self._release(job)
+
+    async def _run_on_thread(self, job: _Job) -> Any:
+        loop = asyncio.get_running_loop()
+        if job.thread_safe:
+            return await loop.run_in_executor(self._thread_pool, job.fn, *job.args)
+        # The "serial" dispatcher is the only other user of this lock; it matters when a
+        # broken process pool spills model jobs onto threads.
+        async with self._serial_lock:
+            return await loop.run_in_executor(self._thread_pool, job.fn, *job.args)
+
+    # ------------------------------------------------------------------ stats
+
+    @property
+    def queue_depth(self) -> int:
+        return sum(queue.qsize() for queue in self._queues.values()) + sum(
+            len(pending) for pending in self._pending.values()
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        def _ms(values: Sequence[float], q: float) -> Optional[float]:
+            if not values:
+                return None
+            ordered = sorted(values)
+            return round(ordered[min(len(ordered) - 1, int(len(ordered) * q))] * 1000.0, 1)
+
+        service = list(self._service_times)
+        waits = list(self._queue_waits)
+        return {
+            "threads": self.threads,
+            "process_workers": self.process_workers if self._process_pool is not None else 0,
+            "process_backend": self._process_backend,
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self.max_queue_depth,
+            "running": len(self._running),
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "failed": self.failed,
+            "cancelled": self.cancelled,
+            "service_time_ms": {
+                "avg": round(sum(service) / len(service) * 1000.0, 1) if service else None,
+                "p50": _ms(service, 0.5),
+                "p95": _ms(service, 0.95),
+            },
+            "queue_wait_ms": {
+                "p50": _ms(waits, 0.5),
+                "p95": _ms(waits, 0.95),
+            },
+        }
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 from dataclasses import replace
@@ -7,7 +8,9 @@ from dataclasses import replace
 from websockets.exceptions import ConnectionClosedError, ConnectionClosedOK
 
 from constants import DEFAULT_MODE, SUPPORTED_MODES
-from session import SessionContext
+from log_sampling import audio_log
+from protocol_contract import FRAME_KIND_AUDIO, decode_frame, negotiate_binary_frames
+from session import ConnectionContext, SessionContext
 
 
 class WebSocketProtocol:
@@ -33,6 +36,9 @@ class WebSocketProtocol:
                 session.call_id = call_id
             if not self._server.ws_auth_token or token == self._server.ws_auth_token:
                 session.authenticated = True
+                if session.connection is not None:
+                    for other in session.connection.sessions():
+                        other.authenticated = True
                 await self._server._send_json(websocket, {"type": "auth_response", "status": "ok"})
                 logging.info("🔐 WS AUTH - Authenticated session call_id=%s", session.call_id)
             else:
@@ -63,6 +69,37 @@ class WebSocketProtocol:
             )
             return
 
+        connection = session.connection
+        if msg_type == "negotiate" and connection is not None:
+            await self._negotiate(websocket, connection, data)
+            return
+
+        if msg_type == "call_end":
+            call_id = data.get("call_id")
+            ended = connection.remove_call(call_id) if connection is not None and call_id else None
+            if ended is not None:
+                self._close_session(ended)
+                logging.info("📴 CALL END - Released multiplexed call_id=%s", call_id)
+            return
+
+        if connection is not None and connection.multiplex:
+            target = connection.session_for(data.get("call_id"))
+            if target is None:
+                await self._server._send_json(
+                    websocket,
+                    {
+                        "type": "error",
+                        "error": "call_id collides with another call on this connection",
+                        "call_id": data.get("call_id"),
+                        "details": {
+                            "error_type": "invalid_request",
+                            "message": "Open a separate connection for this call",
+                        },
+                    },
+                )
+                return
+            session = target
+
         if msg_type == "set_mode":
             requested = data.get("mode", DEFAULT_MODE)
             if requested in SUPPORTED_MODES:
@@ -84,7 +121,21 @@ class WebSocketProtocol:
             return
 
         if msg_type == "tts_request":
-            await self._server._handle_tts_request(websocket, session, data)
+            # Synthesis can take seconds: keep reading so audio frames and barge_in
+            # messages on this connection are not stuck behind it. Each request waits for
+            # the previous one before replying, so a call's sentences arrive in order.
+            task = asyncio.create_task(
+                self._server._handle_tts_request(
+                    websocket, session, data, after=session.tts_last_task
+                )
+            )
+            session.tts_last_task = task
+            session.tts_tasks.add(task)
+            task.add_done_callback(session.tts_tasks.discard)
+            return
+
+        if msg_type == "barge_in":
+            self._server.cancel_tts(session, data.get("call_id"), barge_in=True)
             return
 
         if msg_type == "llm_request":
@@ -93,7 +144,7 @@ class WebSocketProtocol:
 
         if msg_type == "reload_models":
             logging.info("🔄 RELOAD REQUEST - Hot reloading all models...")
-            await self._server.reload_models()
+            await self._server.front.active.reload_models()
             await self._server._send_json(
                 websocket,
                 {
@@ -106,11 +157,13 @@ class WebSocketProtocol:
 
         if msg_type == "reload_llm":
             logging.info("🔄 LLM RELOAD REQUEST - Hot reloading LLM with optimizations...")
+            # Reloads always target the active generation, even from a draining session.
+            server = self._server.front.active
             requested_path = data.get("llm_model_path") or data.get("model_path")
             if requested_path:
-                self._server.config = replace(self._server.config, llm_model_path=requested_path)
-                self._server._apply_config(self._server.config)
-            await self._server.reload_llm_only()
+                server.config = replace(server.config, llm_model_path=requested_path)
+                server._apply_config(server.config)
+            await server.reload_llm_only()
             await self._server._send_json(
                 websocket,
                 {
@@ -118,8 +171,8 @@ class WebSocketProtocol:
                     "status": "success",
                     "message": (
                         "LLM model reloaded with optimizations (ctx="
-                        f"{self._server.llm_context}, batch={self._server.llm_batch}, temp={self._server.llm_temperature}, "
-                        f"max_tokens={self._server.llm_max_tokens})"
+                        f"{server.llm_context}, batch={server.llm_batch}, temp={server.llm_temperature}, "
+                        f"max_tokens={server.llm_max_tokens})"
                     ),
                 },
             )
@@ -221,7 +274,10 @@ class WebSocketProtocol:
                 len(message),
             )
             return
-        logging.info("🎵 AUDIO INPUT - Received binary audio: %s bytes", len(message))
+        connection = session.connection
+        if connection is not None and connection.frames_version is not None:
+            await self._handle_audio_frame(websocket, connection, message)
+            return
         await self._server._handle_audio_payload(
             websocket,
             session,
@@ -229,6 +285,57 @@ class WebSocketProtocol:
             incoming_bytes=message,
         )
 
+    async def _handle_audio_frame(self, websocket, connection: ConnectionContext, message: bytes) -> None:
+        try:
+            frame = decode_frame(message)
+        except ValueError as exc:
+            logging.warning("🎵 AUDIO FRAME - Dropping malformed frame (%s bytes): %s", len(message), exc)
+            return
+        if frame.kind != FRAME_KIND_AUDIO:
+            logging.warning("🎵 AUDIO FRAME - Dropping frame of unexpected kind %s", frame.kind)
+            return
+        session = connection.calls_by_hash.get(frame.call_hash) if connection.multiplex else None
+        if session is None:
+            if connection.calls:
+                logging.warning("🎵 AUDIO FRAME - No call for hash %08x; dropping frame", frame.call_hash)
+                return
+            session = connection.default
+        audio = frame.payload
+        if frame.codec == "mulaw":
+            audio = self._server.audio_processor.ulaw_to_pcm16(audio)
+        await self._server._handle_audio_payload(
+            websocket,
+            session,
+            data={"mode": session.mode, "rate": frame.rate_hz},
+            incoming_bytes=audio,
+        )
+
+    async def _negotiate(self, websocket, connection: ConnectionContext, data) -> None:
+        binary_frames = negotiate_binary_frames(data.get("binary_frames"))
+        connection.frames_version = binary_frames["version"] if binary_frames else None
+        connection.frame_codecs = binary_frames["codecs"] if binary_frames else []
+        connection.multiplex = bool(data.get("multiplex", False))
+        await self._server._send_json(
+            websocket,
+            {
+                "type": "negotiate_response",
+                "binary_frames": binary_frames,
+                "multiplex": connection.multiplex,
+            },
+        )
+        logging.info(
+            "🤝 NEGOTIATE - binary_frames=%s multiplex=%s",
+            connection.frames_version or "off",
+            connection.multiplex,
+        )
+
+    def _close_session(self, session: SessionContext) -> None:
+        self._server.cancel_tts(session)
+        for task in list(session.tts_tasks):
+            task.cancel()
+        self._server._reset_stt_session(session)
+        audio_log.forget(session.call_id)
+
     async def handler(self, websocket):
         logging.info("🔌 Client connected: %s", websocket.remote_address)
 
@@ -244,7 +351,8 @@ class WebSocketProtocol:
             )
             return
 
-        session = SessionContext()
+        connection = ConnectionContext()
+        session = connection.default
         try:
             async for message in websocket:
                 if isinstance(message, bytes):
@@ -258,5 +366,6 @@ class WebSocketProtocol:
         except Exception as exc:
             logging.error("❌ WebSocket handler error: %s", exc, exc_info=True)
         finally:
-            self._server._reset_stt_session(session)
+            for each in connection.sessions():
+                self._close_session(each)
             logging.debug("🔌 Connection closed: %s", websocket.remote_address)
@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Benchmark: AudioSocket egress, write + drain() per frame vs the coalescing egress writer.
+
+Opens C loopback AudioSocket connections to a local peer that plays Asterisk's
+part (reads TLV audio frames and timestamps them). Each call runs a pacer that
+wakes every tick and sends one or more 20 ms frames, then records:
+  - pacing jitter: how late each pacer tick woke up (p50/p99/max)
+  - write calls per frame: writer.write()/transport.write() calls, each of which is
+    an immediate send() syscall while the socket buffer has room
+  - delivery latency: frame age when the peer reads it (p50/p99), and the median
+    over the last second of the run ("final")
+  - dropped frames (egress only)
+
+Scenarios:
+  - paced:  one frame per 20 ms tick (steady streaming playback)
+  - burst:  --frames-per-tick frames per tick (pacer catching up, larger chunk_size_ms)
+  - stall:  paced, but the peer stops reading for --stall-seconds after one second
+            and then reads at real time again, like a channel playing the audio out.
+            Audio queued during the stall is latency the call never recovers unless
+            it is dropped. The peer's receive buffer (kept small, but still a few
+            seconds of audio on loopback) is invisible to any sender, so use stalls
+            longer than that.
+
+Modes:
+  - legacy: writer.write(frame) + await writer.drain() per frame (previous send_audio)
+  - egress: AudioSocketEgress.send(payload), coalesced flush, watermarks
+
+Usage:
+    python3 scripts/benchmarks/bench_audiosocket_egress.py
+    python3 scripts/benchmarks/bench_audiosocket_egress.py --calls 100 --seconds 5 --frames-per-tick 5
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import socket
+import struct
+import sys
+import time
+
+import structlog
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from src.audio.audiosocket_egress import AudioSocketEgress  # noqa: E402
+
+FRAME_SEC = 0.020
+STAMP = struct.Struct(">d")
+PEER_RCVBUF = 4096
+
+
+def _pct(values: list, q: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+class _Peer:
+    """Loopback stand-in for Asterisk: reads frames, optionally stalling and then pacing reads."""
+
+    def __init__(self, stall_from: float = 0.0, stall_until: float = 0.0) -> None:
+        self.stall_from = stall_from
+        self.stall_until = stall_until
+        self.received: list = []  # (arrival, latency_ms)
+        self.server = None
+
+    async def start(self) -> int:
+        sock = socket.socket()
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, PEER_RCVBUF)  # inherited by accepted sockets
+        sock.bind(("127.0.0.1", 0))
+        self.server = await asyncio.start_server(self._handle, sock=sock)
+        return sock.getsockname()[1]
+
+    async def stop(self) -> None:
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        next_read = 0.0
+        try:
+            while True:
+                now = time.perf_counter()
+                if self.stall_from <= now < self.stall_until:
+                    await asyncio.sleep(self.stall_until - now)
+                    next_read = self.stall_until
+                if now >= self.stall_until and self.stall_until:
+                    # Real-time playout after the stall: one frame per 20 ms, never faster.
+                    next_read = max(next_read, now) + FRAME_SEC
+                    await asyncio.sleep(max(0.0, next_read - FRAME_SEC - now))
+                header = await reader.readexactly(3)
+                payload = await reader.readexactly(int.from_bytes(header[1:], "big"))
+                now = time.perf_counter()
+                self.received.append((now, (now - STAMP.unpack_from(payload)[0]) * 1000.0))
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+
+class _CountingTransport:
+    """Forwards to the real transport, counting write() calls."""
+
+    def __init__(self, transport: asyncio.WriteTransport, counter: list) -> None:
+        self._transport = transport
+        self._counter = counter
+
+    def write(self, data) -> None:
+        self._counter[0] += 1
+        self._transport.write(data)
+
+    def get_write_buffer_size(self) -> int:
+        return self._transport.get_write_buffer_size()
+
+    def get_extra_info(self, name, default=None):
+        return self._transport.get_extra_info(name, default)
+
+    def is_closing(self) -> bool:
+        return self._transport.is_closing()
+
+
+async def _run(mode: str, scenario: str, calls: int, seconds: float, per_tick: int, frame_bytes: int, stall: float) -> dict:
+    tick = FRAME_SEC * per_tick
+    started = time.perf_counter()
+    stop_at = started + seconds
+    peer = _Peer(started + 1.0, started + 1.0 + stall) if scenario == "stall" else _Peer()
+    port = await peer.start()
+
+    conns = []
+    for _ in range(calls):
+        _, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.get_extra_info("socket").setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        conns.append(writer)
+
+    lateness: list = []
+    writes = [0]
+    sent = [0]
+    egresses = []
+    filler = bytes(frame_bytes - STAMP.size)
+
+    async def call(index: int, writer: asyncio.StreamWriter) -> None:
+        loop = asyncio.get_running_loop()
+        egress = None
+        if mode == "egress":
+            egress = AudioSocketEgress(_CountingTransport(writer.transport, writes), frame_ms=20)
+            egresses.append(egress)
+        deadline = loop.time() + tick * (index % 20) / 20
+        while time.perf_counter() < stop_at:
+            deadline += tick
+            await asyncio.sleep(max(0.0, deadline - loop.time()))
+            lateness.append((loop.time() - deadline) * 1000.0)
+            for _ in range(per_tick):
+                payload = STAMP.pack(time.perf_counter()) + filler
+                sent[0] += 1
+                if egress is not None:
+                    egress.send(payload)
+                    continue
+                writer.write(bytes([0x10]) + len(payload).to_bytes(2, "big") + payload)
+                writes[0] += 1
+                try:
+                    await writer.drain()
+                except ConnectionError:
+                    return
+
+    started_cpu = time.process_time()
+    await asyncio.gather(*(call(i, w) for i, w in enumerate(conns)))
+    cpu = time.process_time() - started_cpu
+    await asyncio.sleep(0.2)
+    for egress in egresses:
+        egress.close()
+    for writer in conns:
+        writer.close()
+    await peer.stop()
+
+    latencies = [lat for _, lat in peer.received]
+    final = [lat for at, lat in peer.received if at >= stop_at - 1.0]
+    return {
+        "sent": sent[0],
+        "writes_per_frame": writes[0] / max(1, sent[0]),
+        "jitter": (_pct(lateness, 0.50), _pct(lateness, 0.99), max(lateness, default=0.0)),
+        "latency": (_pct(latencies, 0.50), _pct(latencies, 0.99), _pct(final, 0.50)),
+        "dropped": sum(e.stats["dropped"] for e in egresses),
+        "cpu_s": cpu,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=50)
+    parser.add_argument("--seconds", type=float, default=4.0, help="duration of the paced and burst scenarios")
+    parser.add_argument("--frames-per-tick", type=int, default=5, help="frames per tick in the burst scenario")
+    parser.add_argument("--frame-bytes", type=int, default=640, help="payload bytes per 20 ms frame (640 = slin16)")
+    parser.add_argument("--stall-seconds", type=float, default=8.0, help="how long the peer stops reading")
+    parser.add_argument("--recover-seconds", type=float, default=8.0, help="real-time reading after the stall")
+    parser.add_argument("--scenarios", nargs="+", default=["paced", "burst", "stall"], choices=["paced", "burst", "stall"])
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.CRITICAL))
+
+    print(f"{args.calls} calls, {args.frame_bytes}-byte frames")
+    print(
+        f"{'scenario':<8} {'mode':<7} {'frames':>7} {'writes/frame':>12} {'jitter p50/p99/max ms':>22} "
+        f"{'latency p50/p99/final ms':>25} {'dropped':>8} {'cpu s':>6}"
+    )
+    for scenario in args.scenarios:
+        per_tick = args.frames_per_tick if scenario == "burst" else 1
+        seconds = 1.0 + args.stall_seconds + args.recover_seconds if scenario == "stall" else args.seconds
+        for mode in ("legacy", "egress"):
+            r = asyncio.run(_run(mode, scenario, args.calls, seconds, per_tick, args.frame_bytes, args.stall_seconds))
+            jitter = "{:.2f}/{:.2f}/{:.1f}".format(*r["jitter"])
+            latency = "{:.1f}/{:.1f}/{:.1f}".format(*r["latency"])
+            print(
+                f"{scenario:<8} {mode:<7} {r['sent']:>7} {r['writes_per_frame']:>12.2f} {jitter:>22} "
+                f"{latency:>25} {r['dropped']:>8} {r['cpu_s']:>6.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Call History deep pagination (OFFSET vs keyset) and export memory.
+
+Generates N synthetic call records (default 1,000,000) and measures:
+  - latency of fetching one 50-row page at increasing depths with LIMIT/OFFSET vs the
+    (start_time, id) keyset cursor used by CallHistoryStore.list_page
+  - peak Python memory of the legacy export (store.list(limit=10000) materialized, then
+    serialized) vs streaming every record through CallHistoryStore.iter_records
+
+Usage:
+    python3 scripts/benchmarks/bench_call_history_pagination.py
+    python3 scripts/benchmarks/bench_call_history_pagination.py --records 200000
+"""
+
+import argparse
+import asyncio
+import csv
+import io
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_call_history_stats import _populate  # noqa: E402
+from src.core.call_history import CallHistoryStore, encode_cursor  # noqa: E402
+
+PAGE_SIZE = 50
+
+
+def _csv_row(r) -> list:
+    return [r.id, r.call_id, r.caller_number or "", r.start_time.isoformat() if r.start_time else "",
+            round(r.duration_seconds, 2), r.provider_name, r.outcome, len(r.tool_calls)]
+
+
+async def _bench_depths(store: CallHistoryStore, db_path: str, records: int) -> None:
+    depths = [d for d in (0, 10_000, 100_000, 500_000, 900_000) if d < records]
+    conn = sqlite3.connect(db_path)
+    print(f"\n{'depth':>10}{'OFFSET (ms)':>14}{'keyset (ms)':>14}")
+    for depth in depths:
+        cursor = None
+        if depth:
+            # Position the cursor on the row just before the requested page (setup, not timed).
+            start_time, record_id = conn.execute(
+                "SELECT start_time, id FROM call_records ORDER BY start_time DESC, id DESC LIMIT 1 OFFSET ?",
+                (depth - 1,),
+            ).fetchone()
+            cursor = encode_cursor(start_time, record_id)
+
+        t0 = time.perf_counter()
+        await store.list(limit=PAGE_SIZE, offset=depth, include_details=False)
+        offset_ms = (time.perf_counter() - t0) * 1000.0
+
+        t0 = time.perf_counter()
+        await store.list_page(limit=PAGE_SIZE, cursor=cursor, include_details=False)
+        keyset_ms = (time.perf_counter() - t0) * 1000.0
+        print(f"{depth:>10,}{offset_ms:>14.1f}{keyset_ms:>14.1f}")
+    conn.close()
+
+
+async def _bench_export(store: CallHistoryStore) -> None:
+    sink = io.StringIO()
+
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    rows = await store.list(limit=10000, offset=0, include_details=True)
+    writer = csv.writer(sink)
+    for r in rows:
+        writer.writerow(_csv_row(r))
+    legacy_s = time.perf_counter() - t0
+    _, legacy_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    legacy_rows = len(rows)
+    del rows
+
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    streamed = 0
+    chunk = io.StringIO()
+    writer = csv.writer(chunk)
+    async for r in store.iter_records(batch_size=500, include_details=True):
+        writer.writerow(_csv_row(r))
+        streamed += 1
+        if streamed % 500 == 0:
+            chunk.seek(0)
+            chunk.truncate(0)  # stands in for handing the chunk to the HTTP response
+    stream_s = time.perf_counter() - t0
+    _, stream_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    # Timings include tracemalloc overhead; compare them only with each other.
+    print(f"\n{'export':<24}{'rows':>12}{'time (s)':>10}{'peak MiB':>10}")
+    print(f"{'legacy (10k cap)':<24}{legacy_rows:>12,}{legacy_s:>10.1f}{legacy_peak / 2**20:>10.1f}")
+    print(f"{'streamed (no cap)':<24}{streamed:>12,}{stream_s:>10.1f}{stream_peak / 2**20:>10.1f}")
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--records", type=int, default=1_000_000)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--db", help="SQLite path (default: temporary file)")
+    parser.add_argument("--skip-export", action="store_true", help="Only run the pagination depth benchmark")
+    args = parser.parse_args()
+
+    tmpdir = None
+    db_path = args.db
+    if not db_path:
+        tmpdir = tempfile.TemporaryDirectory(prefix="call-history-bench-")
+        db_path = os.path.join(tmpdir.name, "call_history.db")
+
+    os.environ["CALL_HISTORY_ENABLED"] = "true"
+    os.environ.setdefault("CALL_HISTORY_ROLLUPS_ENABLED", "false")
+    print(f"Populating {args.records:,} synthetic call records ...")
+    _populate(db_path, args.records, args.seed)
+    store = CallHistoryStore(db_path=db_path)
+
+    await _bench_depths(store, db_path, args.records)
+    if not args.skip_export:
+        await _bench_export(store)
+
+    if tmpdir:
+        tmpdir.cleanup()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Benchmark: transcript search via the FTS5 index vs LIKE over conversation_history JSON.
+
+Generates synthetic calls with varied multi-turn transcripts (default 125,000 calls x 8 turns
+= 1,000,000 turns), backfills the transcript index, then times
+CallHistoryStore.search_transcripts() against the equivalent
+``conversation_history LIKE '%term%'`` scan for rare, common and multi-word queries.
+
+Usage:
+    python3 scripts/benchmarks/bench_call_history_search.py
+    python3 scripts/benchmarks/bench_call_history_search.py --calls 20000 --turns 8
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from src.core.call_history import CallHistoryStore  # noqa: E402
+
+VOCABULARY = (
+    "hello thanks please account order delivery payment invoice appointment schedule tomorrow "
+    "morning afternoon address street support billing question problem help cancel change update "
+    "number email phone status shipping package week today yes no sure great okay speak agent"
+).split()
+RARE_TERMS = ["refund", "chargeback", "escalate", "complaint"]
+
+
+def _sentence(rnd: random.Random) -> str:
+    words = [rnd.choice(VOCABULARY) for _ in range(rnd.randint(6, 16))]
+    if rnd.random() < 0.01:
+        words.insert(rnd.randrange(len(words)), rnd.choice(RARE_TERMS))
+    return " ".join(words)
+
+
+def _populate(db_path: str, calls: int, turns: int, seed: int) -> None:
+    rnd = random.Random(seed)
+    now = datetime.now(timezone.utc)
+    conn = sqlite3.connect(db_path)
+    conn.execute(CallHistoryStore._CREATE_TABLE_SQL)
+    for sql in CallHistoryStore._CREATE_INDEXES_SQL:
+        conn.execute(sql)
+    batch = []
+    for i in range(calls):
+        start = now - timedelta(seconds=rnd.randint(0, 90 * 86400))
+        history = [
+            {"role": "user" if t % 2 else "assistant", "content": _sentence(rnd)} for t in range(turns)
+        ]
+        batch.append((
+            str(uuid.uuid4()), f"bench-{i}", f"+1555{rnd.randint(0, 9999):04d}", None,
+            start.isoformat(), (start + timedelta(seconds=60)).isoformat(), 60.0,
+            rnd.choice(["deepgram", "local", "openai_realtime"]), None, "{}", "default",
+            json.dumps(history), "completed", None, None, "[]",
+            300.0, 600.0, turns // 2, "ulaw", 1, 0, start.isoformat(),
+        ))
+        if len(batch) >= 20000:
+            conn.executemany("INSERT INTO call_records VALUES (" + ",".join("?" * 23) + ")", batch)
+            batch.clear()
+    if batch:
+        conn.executemany("INSERT INTO call_records VALUES (" + ",".join("?" * 23) + ")", batch)
+    conn.commit()
+    conn.close()
+
+
+def _like_search(db_path: str, term: str, limit: int) -> int:
+    conn = sqlite3.connect(db_path)
+    try:
+        conditions = " AND ".join("conversation_history LIKE ?" for _ in term.split())
+        params = [f"%{word}%" for word in term.split()]
+        conn.execute(
+            f"SELECT id FROM call_records WHERE {conditions} ORDER BY start_time DESC LIMIT ?",
+            [*params, limit],
+        ).fetchall()
+        return conn.execute(f"SELECT COUNT(*) FROM call_records WHERE {conditions}", params).fetchone()[0]
+    finally:
+        conn.close()
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=125_000)
+    parser.add_argument("--turns", type=int, default=8)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=11)
+    args = parser.parse_args()
+
+    tmpdir = tempfile.TemporaryDirectory(prefix="call-history-bench-")
+    db_path = os.path.join(tmpdir.name, "call_history.db")
+    os.environ["CALL_HISTORY_ENABLED"] = "true"
+    os.environ["CALL_HISTORY_ROLLUPS_ENABLED"] = "false"
+
+    print(f"Populating {args.calls:,} calls x {args.turns} turns = {args.calls * args.turns:,} turns ...")
+    _populate(db_path, args.calls, args.turns, args.seed)
+    t0 = time.perf_counter()
+    store = CallHistoryStore(db_path=db_path)  # first open backfills the transcript index
+    print(f"  transcript index backfill in {time.perf_counter() - t0:.1f}s")
+
+    print(f"\n{'query':<20}{'matches':>10}{'LIKE (ms)':>12}{'FTS5 (ms)':>12}{'speedup':>10}")
+    for term in ("refund", "chargeback", "billing", "refund payment"):
+        like_samples, fts_samples = [], []
+        matches = 0
+        for _ in range(args.repeat):
+            t0 = time.perf_counter()
+            matches = _like_search(db_path, term, 20)
+            like_samples.append((time.perf_counter() - t0) * 1000.0)
+            t0 = time.perf_counter()
+            _, total = await store.search_transcripts(term, limit=20)
+            fts_samples.append((time.perf_counter() - t0) * 1000.0)
+        like_ms, fts_ms = statistics.median(like_samples), statistics.median(fts_samples)
+        print(f"{term:<20}{matches:>10,}{like_ms:>12.1f}{fts_ms:>12.1f}{like_ms / max(fts_ms, 1e-6):>9.1f}x")
+        if total != matches:
+            print(f"  note: FTS matched {total:,} calls (terms must share a turn; LIKE matches anywhere in the call)")
+    print("\nFTS results are relevance-ranked; LIKE can stop after the newest 20 rows, so very common")
+    print("terms favour LIKE while rare terms (the usual investigation case) favour the index.")
+
+    tmpdir.cleanup()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
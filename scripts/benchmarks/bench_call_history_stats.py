@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Benchmark: /calls/stats aggregation from raw call_records vs pre-aggregated rollups.
+
+Generates N synthetic call records (default 1,000,000) spread over the last 90 days,
+backfills the rollup tables, then times CallHistoryStore.get_stats() through both paths
+for a full-range query and a typical 7-day dashboard window.
+
+Usage:
+    python3 scripts/benchmarks/bench_call_history_stats.py
+    python3 scripts/benchmarks/bench_call_history_stats.py --records 200000 --repeat 5
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from src.core.call_history import CallHistoryStore  # noqa: E402
+
+PROVIDERS = ["openai_realtime", "deepgram", "google_live", "local", "elevenlabs_agent"]
+PIPELINES = [None, None, "local_hybrid", "hybrid_support"]
+CONTEXTS = ["default", "sales", "support", "after_hours", None]
+OUTCOMES = ["completed"] * 6 + ["transferred", "transferred", "error", "abandoned"]
+TOOLS = ["transfer", "hangup_call", "send_email_summary", "check_extension_status"]
+
+
+def _populate(db_path: str, records: int, seed: int) -> None:
+    rnd = random.Random(seed)
+    now = datetime.now(timezone.utc)
+    conn = sqlite3.connect(db_path)
+    conn.execute(CallHistoryStore._CREATE_TABLE_SQL)
+    for sql in CallHistoryStore._CREATE_INDEXES_SQL:
+        conn.execute(sql)
+
+    batch = []
+    for i in range(records):
+        start = now - timedelta(seconds=rnd.randint(0, 90 * 86400))
+        duration = rnd.uniform(5, 600)
+        tool_calls = [{"name": rnd.choice(TOOLS)} for _ in range(rnd.choice([0, 0, 0, 1, 2]))]
+        history = [{"role": "user", "content": "hello"}, {"role": "assistant", "content": "hi there"}]
+        batch.append((
+            str(uuid.uuid4()), f"bench-{i}", f"+1555{rnd.randint(0, 4999):04d}", None,
+            start.isoformat(), (start + timedelta(seconds=duration)).isoformat(), duration,
+            rnd.choice(PROVIDERS), rnd.choice(PIPELINES), "{}", rnd.choice(CONTEXTS),
+            json.dumps(history), rnd.choice(OUTCOMES), None, None, json.dumps(tool_calls),
+            rnd.uniform(150, 1500), rnd.uniform(300, 3000), rnd.randint(1, 20),
+            "ulaw", 1, rnd.randint(0, 3), start.isoformat(),
+        ))
+        if len(batch) >= 50000:
+            conn.executemany("INSERT INTO call_records VALUES (" + ",".join("?" * 23) + ")", batch)
+            batch.clear()
+    if batch:
+        conn.executemany("INSERT INTO call_records VALUES (" + ",".join("?" * 23) + ")", batch)
+    conn.commit()
+    conn.close()
+
+
+async def _time_stats(store: CallHistoryStore, repeat: int, **kwargs) -> float:
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        await store.get_stats(**kwargs)
+        samples.append((time.perf_counter() - t0) * 1000.0)
+    return statistics.median(samples)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--records", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--db", help="SQLite path (default: temporary file)")
+    args = parser.parse_args()
+
+    tmpdir = None
+    db_path = args.db
+    if not db_path:
+        tmpdir = tempfile.TemporaryDirectory(prefix="call-history-bench-")
+        db_path = os.path.join(tmpdir.name, "call_history.db")
+
+    os.environ["CALL_HISTORY_ENABLED"] = "true"
+    print(f"Populating {args.records:,} synthetic call records ...")
+    t0 = time.perf_counter()
+    _populate(db_path, args.records, args.seed)
+    print(f"  populated in {time.perf_counter() - t0:.1f}s")
+
+    t0 = time.perf_counter()
+    store = CallHistoryStore(db_path=db_path)  # first open backfills rollups
+    print(f"  rollup backfill in {time.perf_counter() - t0:.1f}s")
+    conn = sqlite3.connect(db_path)
+    for table in ("call_rollups", "call_rollup_callers", "call_rollup_tools"):
+        print(f"  {table}: {conn.execute(f'SELECT COUNT(*) FROM {table}').fetchone()[0]:,} rows")
+    conn.close()
+
+    now = datetime.now(timezone.utc)
+    windows = {
+        "all time": {},
+        "last 7 days": {"start_date": now - timedelta(days=7), "end_date": now},
+    }
+    print(f"\n{'window':<14}{'raw (ms)':>12}{'rollup (ms)':>14}{'speedup':>10}")
+    for label, kwargs in windows.items():
+        raw_ms = await _time_stats(store, args.repeat, use_rollups=False, **kwargs)
+        rollup_ms = await _time_stats(store, args.repeat, use_rollups=True, **kwargs)
+        print(f"{label:<14}{raw_ms:>12.1f}{rollup_ms:>14.1f}{raw_ms / max(rollup_ms, 1e-6):>9.1f}x")
+
+    if tmpdir:
+        tmpdir.cleanup()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
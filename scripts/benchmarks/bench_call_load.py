@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Benchmark: N simultaneous calls through a real Engine, with no Asterisk and no models.
+
+Starts a fake ARI server, simulated AudioSocket / ExternalMedia RTP legs and a
+scripted local STT/LLM/TTS server (src/loadtest), runs the engine against them in a
+child process, and replays caller audio (WAV recordings, or seeded synthetic speech)
+into every call. Reports turn latency percentiles (and the engine's share of them
+after subtracting the scripted STT/LLM/TTS delays), agent-audio pacing jitter,
+dropped frames, and engine CPU and memory.
+
+Runs are deterministic for a given seed, audio and script, so a saved report can be
+used as a baseline: with --baseline the script exits 1 when a metric regressed.
+
+Usage:
+    python3 scripts/benchmarks/bench_call_load.py --calls 20
+    python3 scripts/benchmarks/bench_call_load.py --calls 50 --transport externalmedia --turns 5
+    python3 scripts/benchmarks/bench_call_load.py --audio caller1.wav caller2.wav --json report.json
+    python3 scripts/benchmarks/bench_call_load.py --calls 20 --baseline report.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+sys.path.insert(0, ROOT)
+
+from src.loadtest import AgentScript, LoadScenario, compare_reports, format_report, run_load  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=10)
+    parser.add_argument("--transport", choices=["audiosocket", "externalmedia"], default="audiosocket")
+    parser.add_argument("--turns", type=int, default=3)
+    parser.add_argument("--audio", nargs="*", default=[], help="caller turn recordings (WAV), replayed in order")
+    parser.add_argument("--utterance-ms", type=int, default=1200, help="synthetic caller turn length")
+    parser.add_argument("--arrival-ms", type=int, default=100, help="gap between call arrivals")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--config", default=os.path.join(ROOT, "config", "ai-agent.example.yaml"))
+    parser.add_argument("--llm-ms", type=int, default=AgentScript.llm_ms, help="scripted LLM delay")
+    parser.add_argument("--reply-ms", type=int, default=AgentScript.reply_ms, help="scripted reply length")
+    parser.add_argument("--engine-log-level", default="ERROR")
+    parser.add_argument("--json", help="write the report to this file")
+    parser.add_argument("--baseline", help="compare against a saved report; exit 1 on regression")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed relative regression")
+    args = parser.parse_args()
+
+    # The engine child runs from the repo root; resolve the caller's paths first.
+    audio = [os.path.abspath(path) for path in args.audio]
+    config_path = os.path.abspath(args.config)
+    os.chdir(ROOT)
+    scenario = LoadScenario(
+        calls=args.calls,
+        transport=args.transport,
+        turns=len(audio) if audio else args.turns,
+        audio=audio,
+        utterance_ms=args.utterance_ms,
+        arrival_ms=args.arrival_ms,
+        seed=args.seed,
+        config_path=config_path,
+        script=AgentScript(llm_ms=args.llm_ms, reply_ms=args.reply_ms),
+        engine_log_level=args.engine_log_level,
+    )
+    json_path = os.path.abspath(args.json) if args.json else None
+    baseline_path = os.path.abspath(args.baseline) if args.baseline else None
+    report = asyncio.run(run_load(scenario))
+    print(format_report(report))
+    if json_path:
+        with open(json_path, "w") as fh:
+            json.dump(report, fh, indent=2)
+    if baseline_path:
+        with open(baseline_path) as fh:
+            regressions = compare_reports(report, json.load(fh), args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Benchmark: engine cold start (time-to-providers-ready) and RSS, single provider vs full set.
+
+Each run is a fresh interpreter that imports the engine, loads the config, constructs
+Engine and runs its provider loading (the part of Engine.start() that depends on which
+providers are configured; ARI/transport startup is the same for every config).
+
+Scenarios:
+  - single: the example config with one context on openai_realtime as default_provider;
+            the other providers stay deferred (imported/built on first use)
+  - full:   every provider referenced by a context and every pipeline adapter family
+            imported, i.e. what each replica paid before providers were loaded lazily
+
+Usage:
+    python3 scripts/benchmarks/bench_cold_start.py
+    python3 scripts/benchmarks/bench_cold_start.py --runs 5 --config config/ai-agent.yaml
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+
+def _child(scenario: str, config_path: str) -> None:
+    started = time.perf_counter()
+    sys.path.insert(0, ROOT)
+    os.environ.setdefault("ASTERISK_ARI_USERNAME", "bench")
+    os.environ.setdefault("ASTERISK_ARI_PASSWORD", "bench")
+
+    import asyncio
+    import logging
+    import resource
+
+    import structlog
+
+    logging.disable(logging.CRITICAL)
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.CRITICAL))
+
+    from src.config import load_config
+    from src.core.plugins import PIPELINE_ADAPTERS, PROVIDERS
+    from src.engine import Engine
+
+    imported = time.perf_counter()
+    config = load_config(config_path)
+    agent_providers = [name for name in config.providers if name in PROVIDERS.names()]
+    if scenario == "single":
+        config.default_provider = "openai_realtime"
+        config.contexts = {"default": {"provider": "openai_realtime", "prompt": "You are helpful."}}
+    else:
+        config.default_provider = agent_providers[0]
+        config.contexts = {f"ctx_{name}": {"provider": name, "prompt": "You are helpful."} for name in agent_providers}
+        for adapter in PIPELINE_ADAPTERS.names():
+            PIPELINE_ADAPTERS.load(adapter)
+
+    async def start() -> dict:
+        engine = Engine(config)
+        await engine._load_providers()
+        return {
+            "built": sorted(dict.keys(engine.providers)),
+            "deferred": sorted(getattr(engine.providers, "deferred", {}) or ()),
+        }
+
+    providers = asyncio.run(start())
+    ready = time.perf_counter()
+    print(
+        json.dumps(
+            {
+                "import_ms": (imported - started) * 1000.0,
+                "ready_ms": (ready - started) * 1000.0,
+                "rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.0,
+                **providers,
+            }
+        )
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--config", default="config/ai-agent.example.yaml")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--child", choices=["single", "full"], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        _child(args.child, args.config)
+        return
+
+    print(f"config={args.config} runs={args.runs} (median)")
+    print(f"{'scenario':>9} {'import ms':>10} {'ready ms':>9} {'max rss MB':>11}  providers built / deferred")
+    scenarios = ("single", "full")
+    runs = {scenario: [] for scenario in scenarios}
+    # Interleave scenarios so machine drift (page cache, frequency) hits both equally.
+    for _ in range(args.runs):
+        for scenario in scenarios:
+            out = subprocess.run(
+                [sys.executable, os.path.abspath(__file__), "--child", scenario, "--config", args.config],
+                capture_output=True,
+                text=True,
+                check=True,
+                cwd=ROOT,
+            ).stdout
+            runs[scenario].append(json.loads(out.strip().splitlines()[-1]))
+    for scenario, results in runs.items():
+        median = {key: statistics.median(r[key] for r in results) for key in ("import_ms", "ready_ms", "rss_mb")}
+        last = results[-1]
+        print(
+            f"{scenario:>9} {median['import_ms']:>10.1f} {median['ready_ms']:>9.1f} {median['rss_mb']:>11.1f}  "
+            f"{','.join(last['built']) or '-'} / {','.join(last['deferred']) or '-'}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Benchmark: /reload latency and event-loop stall with C concurrent calls in flight.
+
+Each simulated call runs a 20 ms pacer on the engine's event loop and records how
+late it woke up (what StreamingPlaybackManager feels while the loop is busy). While
+they run, the config file is reloaded with one context prompt edited.
+
+Modes:
+  - full:        the previous handler: load_config, config hash and TransportOrchestrator
+                 rebuild all on the event loop
+  - incremental: Engine._reload: parse + diff + hash + orchestrator build in a worker
+                 thread, then apply only the changed sections on the loop
+
+Provider network handshakes are not part of either path (a prompt edit rebuilds no
+provider), so this isolates the config-processing cost.
+
+Usage:
+    python3 scripts/benchmarks/bench_config_reload.py
+    python3 scripts/benchmarks/bench_config_reload.py --calls 100 --reloads 20 --config config/ai-agent.yaml
+"""
+
+import argparse
+import asyncio
+import gc
+import logging
+import os
+import statistics
+import sys
+import tempfile
+import time
+import types
+
+import structlog
+import yaml
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+os.environ.setdefault("ASTERISK_ARI_USERNAME", "bench")
+os.environ.setdefault("ASTERISK_ARI_PASSWORD", "bench")
+
+import src.config  # noqa: E402
+from src.config import load_config  # noqa: E402
+from src.core.transport_orchestrator import TransportOrchestrator  # noqa: E402
+from src.engine import Engine  # noqa: E402
+
+FRAME_SEC = 0.020
+
+
+def _engine(config) -> Engine:
+    engine = Engine.__new__(Engine)
+    engine.config = config
+    engine.providers = {name: types.SimpleNamespace(config=cfg) for name, cfg in (config.providers or {}).items()}
+    engine.provider_factories = {}
+    engine.provider_alignment_issues = {}
+    engine.mcp_manager = None
+    engine._config_hash = engine._compute_config_hash()
+    engine.transport_orchestrator = TransportOrchestrator(config.model_dump())
+    return engine
+
+
+async def _full_reload(engine: Engine, path: str) -> None:
+    new_config = load_config(path)
+    engine.config = new_config
+    engine._config_hash = engine._compute_config_hash()
+    engine.transport_orchestrator = TransportOrchestrator(new_config.model_dump())
+    engine._bundle_cache().invalidate()
+
+
+async def _run(mode: str, calls: int, reloads: int, path: str, raw: dict, context: str) -> dict:
+    engine = _engine(load_config(path))
+    lateness: list = []
+    latencies: list = []
+    done = asyncio.Event()
+
+    async def pacer(index: int) -> None:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + FRAME_SEC * (index % 20) / 20
+        while not done.is_set():
+            deadline += FRAME_SEC
+            await asyncio.sleep(max(0.0, deadline - loop.time()))
+            lateness.append((loop.time() - deadline) * 1000.0)
+
+    async def reloader() -> None:
+        await asyncio.sleep(0.2)
+        for n in range(reloads):
+            # Edit one prompt so every reload has a real (small) diff.
+            raw["contexts"][context]["prompt"] = f"Prompt revision {mode} {n}."
+            with open(path, "w") as fh:
+                yaml.safe_dump(raw, fh)
+            started = time.perf_counter()
+            if mode == "full":
+                await _full_reload(engine, path)
+            else:
+                await engine._reload(started)
+            latencies.append((time.perf_counter() - started) * 1000.0)
+            await asyncio.sleep(0.1)
+        done.set()
+
+    await asyncio.gather(reloader(), *(pacer(i) for i in range(calls)))
+    lateness.sort()
+    return {
+        "reload_p50_ms": statistics.median(latencies),
+        "reload_max_ms": max(latencies),
+        "lag_p99_ms": lateness[int(len(lateness) * 0.99) - 1],
+        "lag_max_ms": lateness[-1],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--config", default="config/ai-agent.example.yaml")
+    parser.add_argument("--calls", type=int, default=100)
+    parser.add_argument("--reloads", type=int, default=10)
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.CRITICAL))
+
+    with open(args.config) as fh:
+        raw = yaml.safe_load(fh)
+    if not raw.get("contexts"):
+        raw["contexts"] = {"bench": {"prompt": "Prompt revision 0."}}
+    context = next(iter(raw["contexts"]))
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "ai-agent.yaml")
+        with open(path, "w") as fh:
+            yaml.safe_dump(raw, fh)
+        # Engine._reload loads the default path; point it at the scratch copy.
+        src.config.load_config = lambda: load_config(path)
+        print(f"config={args.config} calls={args.calls} reloads={args.reloads} (one prompt edited per reload)")
+        print(f"{'mode':>12} {'reload p50 ms':>14} {'reload max ms':>14} {'lag p99 ms':>11} {'lag max ms':>11}")
+        for mode in ("full", "incremental"):
+            # Start both modes from the same heap state so a gen-2 collection does not land in just one.
+            gc.collect()
+            r = asyncio.run(_run(mode, args.calls, args.reloads, path, raw, context))
+            print(
+                f"{mode:>12} {r['reload_p50_ms']:>14.2f} {r['reload_max_ms']:>14.2f} "
+                f"{r['lag_p99_ms']:>11.2f} {r['lag_max_ms']:>11.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
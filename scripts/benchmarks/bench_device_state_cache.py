@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Benchmark: check_extension_status answered by live ARI probes vs the device state cache.
+
+A stand-in ARI adds a fixed round-trip delay to every REST request and serializes
+requests through a small connection limit (like aiohttp's per-host pool against a busy
+Asterisk). N concurrent calls each ask for an extension's status; for each path it
+reports tool latency (p50/p99) and the number of ARI requests made, plus the ARI
+requests the cache spends per reconcile pass.
+
+Usage:
+    python3 scripts/benchmarks/bench_device_state_cache.py
+    python3 scripts/benchmarks/bench_device_state_cache.py --calls 200 --rtt-ms 8 --extensions 50
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import statistics
+import sys
+import time
+from urllib.parse import unquote
+
+import structlog
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from src.core.device_state_cache import DeviceStateCache, set_device_state_cache  # noqa: E402
+from src.tools.context import ToolExecutionContext  # noqa: E402
+from src.tools.telephony.check_extension_status import (  # noqa: E402
+    CheckExtensionStatusTool,
+    configured_device_state_ids,
+)
+
+
+class _ARI:
+    is_connected = True
+
+    def __init__(self, extensions: int, rtt_s: float, connections: int):
+        self.rtt_s = rtt_s
+        self.requests = 0
+        self.event_handlers = {}
+        self._slots = asyncio.Semaphore(connections)
+        self.endpoints = {
+            f"PJSIP/{2000 + i}": {"technology": "PJSIP", "resource": str(2000 + i), "state": "online", "channel_ids": []}
+            for i in range(extensions)
+        }
+
+    def add_event_handler(self, event_type, handler):
+        self.event_handlers.setdefault(event_type, []).append(handler)
+
+    async def send_command(self, method, resource, data=None, params=None):
+        self.requests += 1
+        async with self._slots:
+            await asyncio.sleep(self.rtt_s)
+        if resource == "endpoints":
+            return list(self.endpoints.values())
+        if resource.startswith("endpoints/"):
+            return self.endpoints.get(resource[len("endpoints/"):], {"message": "Endpoint not found"})
+        name = unquote(resource[len("deviceStates/"):])
+        return {"name": name, "state": "NOT_INUSE" if name in self.endpoints else "INVALID"}
+
+
+def _tools_config(extensions: int) -> dict:
+    return {"extensions": {"internal": {
+        str(2000 + i): {"name": f"Agent {i}", "dial_string": f"PJSIP/{2000 + i}"} for i in range(extensions)
+    }}}
+
+
+async def _run(ari: _ARI, calls: int, extensions: int) -> dict:
+    tool = CheckExtensionStatusTool()
+    config = {"tools": _tools_config(extensions)}
+
+    async def one(i: int) -> float:
+        context = ToolExecutionContext(call_id=f"c{i}", ari_client=ari, config=config)
+        started = time.perf_counter()
+        result = await tool.execute({"extension": str(2000 + i % extensions)}, context)
+        assert result["status"] == "success", result
+        return (time.perf_counter() - started) * 1000
+
+    ari.requests = 0
+    latencies = sorted(await asyncio.gather(*(one(i) for i in range(calls))))
+    return {
+        "p50": statistics.median(latencies),
+        "p99": latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))],
+        "requests": ari.requests,
+    }
+
+
+async def main_async(args) -> None:
+    ari = _ARI(args.extensions, args.rtt_ms / 1000.0, args.connections)
+    rows = [("live ARI probes", await _run(ari, args.calls, args.extensions))]
+
+    cache = DeviceStateCache(ari, reconcile_interval_sec=3600)
+    cache.track(configured_device_state_ids(_tools_config(args.extensions)))
+    ari.requests = 0
+    await cache.start()
+    while not cache.synced:
+        await asyncio.sleep(0.001)
+    reconcile_requests = ari.requests
+    set_device_state_cache(cache)
+    rows.append(("device state cache", await _run(ari, args.calls, args.extensions)))
+    set_device_state_cache(None)
+    await cache.stop()
+
+    print(
+        f"{args.calls} concurrent lookups over {args.extensions} extensions, "
+        f"{args.rtt_ms:.0f} ms ARI round trip, {args.connections} ARI connections"
+    )
+    print(f"\n{'path':<22} {'p50 ms':>9} {'p99 ms':>9} {'ARI reqs':>9}")
+    for name, r in rows:
+        print(f"{name:<22} {r['p50']:>9.2f} {r['p99']:>9.2f} {r['requests']:>9}")
+    print(f"\nreconcile pass: {reconcile_requests} ARI requests (every device_state_cache.reconcile_interval_sec)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=100)
+    parser.add_argument("--extensions", type=int, default=20)
+    parser.add_argument("--rtt-ms", type=float, default=5.0, help="delay per ARI REST request")
+    parser.add_argument("--connections", type=int, default=10, help="concurrent ARI requests")
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.CRITICAL))
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
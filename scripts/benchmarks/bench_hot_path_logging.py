@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Benchmark: per-frame logging overhead, plain structlog logger vs HotLogger governor.
+
+Replays C calls x F frames through one per-frame debug log (like "RTP audio routing
+check") with the engine's real logging setup, rendering JSON into a null stream.
+Reports µs of logging per frame and lines written, with LOG_LEVEL=info and debug.
+
+Usage:
+    python3 scripts/benchmarks/bench_hot_path_logging.py
+    python3 scripts/benchmarks/bench_hot_path_logging.py --calls 500 --frames 500
+"""
+
+import argparse
+import io
+import logging
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from src.logging_config import configure_logging, get_hot_logger, get_logger  # noqa: E402
+
+
+class _CountingSink(io.TextIOBase):
+    def __init__(self):
+        self.lines = 0
+
+    def write(self, text):
+        self.lines += text.count("\n")
+        return len(text)
+
+
+def _configure(level: str) -> _CountingSink:
+    os.environ["LOG_LEVEL"] = level
+    configure_logging()
+    sink = _CountingSink()
+    root = logging.getLogger()
+    for handler in root.handlers:
+        if isinstance(handler, logging.StreamHandler):
+            handler.setStream(sink)
+    return sink
+
+
+def _run(log, calls: int, frames: int) -> float:
+    call_ids = [f"call-{n}" for n in range(calls)]
+    started = time.perf_counter()
+    for frame in range(frames):
+        for call_id in call_ids:
+            log.debug(
+                "RTP audio routing check",
+                call_id=call_id,
+                pipeline_forced=False,
+                audio_capture_enabled=True,
+                frame_num=frame,
+            )
+    return (time.perf_counter() - started) / (calls * frames) * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=500, help="Concurrent calls")
+    parser.add_argument("--frames", type=int, default=200, help="Frames per call")
+    args = parser.parse_args()
+
+    print(f"{'level':<7}{'logger':<8}{'us/frame':>10}{'lines':>10}")
+    for level in ("info", "debug"):
+        for name in ("plain", "hot"):
+            sink = _configure(level)
+            log = get_logger(f"bench.{name}") if name == "plain" else get_hot_logger(f"bench.{name}")
+            us = _run(log, args.calls, args.frames)
+            print(f"{level:<7}{name:<8}{us:>10.2f}{sink.lines:>10}")
+
+
+if __name__ == "__main__":
+    main()
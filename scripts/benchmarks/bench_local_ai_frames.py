@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Benchmark: base64-in-JSON audio vs negotiated binary frames on the local_ai_server socket.
+
+Measures, for 20 ms PCM16 @ 16 kHz STT frames and µ-law TTS payloads:
+  - in-process: encode + decode cost per message (what each side pays on its event loop)
+  - loopback:   frames/sec and CPU seconds over a real websocket (client -> echo-less sink)
+  - bytes on the wire per message
+
+Usage:
+    python3 scripts/benchmarks/bench_local_ai_frames.py
+    python3 scripts/benchmarks/bench_local_ai_frames.py --messages 20000 --tts-seconds 4
+"""
+
+import argparse
+import asyncio
+import base64
+import json
+import os
+import sys
+import time
+
+import websockets
+from websockets.asyncio.server import serve
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from src.audio.local_ai_frames import (  # noqa: E402
+    FRAME_KIND_AUDIO,
+    FRAME_KIND_TTS_AUDIO,
+    call_hash,
+    decode_frame,
+    encode_frame,
+)
+
+CALL_ID = "1712345678.42"
+
+
+def _json_codec(kind: str, audio: bytes):
+    if kind == "stt":
+        def encode():
+            return json.dumps({
+                "type": "audio",
+                "data": base64.b64encode(audio).decode("ascii"),
+                "rate": 16000,
+                "format": "pcm16le",
+                "call_id": CALL_ID,
+                "mode": "stt",
+            })
+    else:
+        def encode():
+            return json.dumps({
+                "type": "tts_response",
+                "text": "x",
+                "call_id": CALL_ID,
+                "audio_data": base64.b64encode(audio).decode("ascii"),
+                "encoding": "mulaw",
+                "sample_rate_hz": 8000,
+                "byte_length": len(audio),
+            })
+
+    def decode(message):
+        data = json.loads(message)
+        return base64.b64decode(data.get("data") or data.get("audio_data"))
+
+    return encode, decode
+
+
+def _frame_codec(kind: str, audio: bytes):
+    hashed = call_hash(CALL_ID)
+    seq = iter(range(1 << 31))
+    if kind == "stt":
+        def encode():
+            return encode_frame(FRAME_KIND_AUDIO, audio, call_hash=hashed, seq=next(seq))
+    else:
+        def encode():
+            return encode_frame(
+                FRAME_KIND_TTS_AUDIO, audio, call_hash=hashed, seq=next(seq), codec="mulaw", rate_hz=8000, flags=1
+            )
+
+    def decode(message):
+        return decode_frame(message).payload
+
+    return encode, decode
+
+
+def _in_process(codec, messages: int) -> dict:
+    encode, decode = codec
+    sample = encode()
+    started_cpu = time.process_time()
+    started = time.perf_counter()
+    for _ in range(messages):
+        decode(encode())
+    elapsed = time.perf_counter() - started
+    return {
+        "us_per_msg": elapsed / messages * 1e6,
+        "cpu_s": time.process_time() - started_cpu,
+        "wire_bytes": len(sample.encode("utf-8") if isinstance(sample, str) else sample),
+    }
+
+
+async def _loopback(codec, messages: int) -> dict:
+    encode, decode = codec
+    done = asyncio.Event()
+    received = 0
+
+    async def sink(websocket):
+        nonlocal received
+        async for message in websocket:
+            decode(message)
+            received += 1
+            if received == messages:
+                done.set()
+
+    async with serve(sink, "127.0.0.1", 0, max_size=None) as server:
+        port = server.sockets[0].getsockname()[1]
+        async with websockets.connect(f"ws://127.0.0.1:{port}", max_size=None) as ws:
+            started_cpu = time.process_time()
+            started = time.perf_counter()
+            for _ in range(messages):
+                await ws.send(encode())
+            await done.wait()
+            elapsed = time.perf_counter() - started
+            cpu = time.process_time() - started_cpu
+    return {"msgs_per_s": messages / elapsed, "cpu_s": cpu}
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--messages", type=int, default=10000, help="Messages per STT measurement")
+    parser.add_argument("--tts-seconds", type=float, default=3.0, help="Length of one TTS reply (8 kHz µ-law)")
+    args = parser.parse_args()
+
+    cases = [
+        ("stt 20ms pcm16@16k", "stt", b"\x01\x02" * 320, args.messages),
+        (f"tts {args.tts_seconds:g}s mulaw@8k", "tts", b"\x7f" * int(8000 * args.tts_seconds),
+         max(100, args.messages // 20)),
+    ]
+    print(f"{'payload':<22}{'transport':<10}{'wire B':>9}{'us/msg':>9}{'msgs/s':>11}{'cpu s':>8}")
+    for label, kind, audio, messages in cases:
+        for name, factory in (("json+b64", _json_codec), ("frame", _frame_codec)):
+            local = _in_process(factory(kind, audio), messages)
+            wire = await _loopback(factory(kind, audio), messages)
+            print(
+                f"{label:<22}{name:<10}{local['wire_bytes']:>9}{local['us_per_msg']:>9.1f}"
+                f"{wire['msgs_per_s']:>11.0f}{wire['cpu_s']:>8.2f}"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
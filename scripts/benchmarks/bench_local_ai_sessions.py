@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Load generator: concurrent sessions a local_ai_server host sustains at a target p95 latency.
+
+Ramps the number of concurrent websocket sessions (1, 2, 4, ... or --step N) against a running
+local_ai_server (single process or LOCAL_AI_WORKERS supervisor) and measures, per session turn:
+  - tts: tts_request  -> tts_response
+  - llm: llm_request  -> llm_response
+  - stt: end of the utterance (last --wav frame, streamed in real time) -> final stt_result
+Each step runs for --duration seconds; the ramp stops at the first step whose p95 exceeds
+--target-p95-ms. The result is the largest session count that met the target.
+
+Usage:
+    python3 scripts/benchmarks/bench_local_ai_sessions.py --mode tts --target-p95-ms 1500
+    python3 scripts/benchmarks/bench_local_ai_sessions.py --mode stt --wav utterance16k.wav --max-sessions 32
+    LOCAL_AI_WORKERS=stt=4,llm=1,tts=2 python3 local_ai_server/main.py   # server under test
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import time
+import wave
+
+import websockets
+
+FRAME_MS = 20
+
+
+def _load_wav(path: str) -> bytes:
+    with wave.open(path, "rb") as wav_file:
+        if wav_file.getnchannels() != 1 or wav_file.getsampwidth() != 2 or wav_file.getframerate() != 16000:
+            raise SystemExit("--wav must be mono 16-bit PCM at 16 kHz")
+        return wav_file.readframes(wav_file.getnframes())
+
+
+async def _connect(args):
+    ws = await websockets.connect(args.url, max_size=None)
+    if args.auth_token:
+        await ws.send(json.dumps({"type": "auth", "auth_token": args.auth_token}))
+        await ws.recv()
+    return ws
+
+
+async def _recv_type(ws, expected: str, timeout: float) -> dict:
+    deadline = time.perf_counter() + timeout
+    while True:
+        message = await asyncio.wait_for(ws.recv(), max(0.0, deadline - time.perf_counter()))
+        if isinstance(message, str):
+            data = json.loads(message)
+            if data.get("type") == expected and (expected != "stt_result" or data.get("is_final")):
+                return data
+
+
+async def _session(index: int, args, audio: bytes, deadline: float, latencies: list, errors: list) -> None:
+    call_id = f"bench-{index}-{os.getpid()}"
+    try:
+        ws = await _connect(args)
+    except Exception as exc:
+        errors.append(str(exc))
+        return
+    try:
+        if args.mode == "stt":
+            await ws.send(json.dumps({"type": "set_mode", "mode": "stt", "call_id": call_id}))
+        frame_bytes = 16000 * 2 * FRAME_MS // 1000
+        while time.perf_counter() < deadline:
+            try:
+                if args.mode == "stt":
+                    next_frame = time.perf_counter()
+                    for offset in range(0, len(audio), frame_bytes):
+                        await ws.send(audio[offset:offset + frame_bytes])
+                        next_frame += FRAME_MS / 1000.0
+                        await asyncio.sleep(max(0.0, next_frame - time.perf_counter()))
+                    started = time.perf_counter()
+                    # Keep streaming silence so endpointing can fire, like a live caller.
+                    silence = b"\x00" * frame_bytes
+                    waiter = asyncio.create_task(_recv_type(ws, "stt_result", args.timeout))
+                    while not waiter.done():
+                        await ws.send(silence)
+                        await asyncio.sleep(FRAME_MS / 1000.0)
+                    await waiter
+                else:
+                    request = {"type": f"{args.mode}_request", "text": args.text, "call_id": call_id}
+                    started = time.perf_counter()
+                    await ws.send(json.dumps(request))
+                    await _recv_type(ws, f"{args.mode}_response", args.timeout)
+                latencies.append((time.perf_counter() - started) * 1000.0)
+            except (asyncio.TimeoutError, websockets.ConnectionClosed) as exc:
+                errors.append(type(exc).__name__)
+                if isinstance(exc, websockets.ConnectionClosed):
+                    return
+            await asyncio.sleep(args.gap)
+    finally:
+        await ws.close()
+
+
+async def _step(sessions: int, args, audio: bytes) -> dict:
+    latencies: list = []
+    errors: list = []
+    deadline = time.perf_counter() + args.duration
+    await asyncio.gather(*(_session(i, args, audio, deadline, latencies, errors) for i in range(sessions)))
+    latencies.sort()
+    return {
+        "sessions": sessions,
+        "turns": len(latencies),
+        "errors": len(errors),
+        "p50": statistics.median(latencies) if latencies else float("inf"),
+        "p95": latencies[max(0, int(len(latencies) * 0.95) - 1)] if latencies else float("inf"),
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", default=os.getenv("LOCAL_WS_URL", "ws://127.0.0.1:8765"))
+    parser.add_argument("--auth-token", default=os.getenv("LOCAL_WS_AUTH_TOKEN", ""))
+    parser.add_argument("--mode", choices=("tts", "llm", "stt"), default="tts")
+    parser.add_argument("--text", default="Thanks for calling, how can I help you today?",
+                        help="Text for tts/llm turns")
+    parser.add_argument("--wav", help="Utterance for stt turns (mono PCM16 @ 16 kHz)")
+    parser.add_argument("--target-p95-ms", type=float, default=1500.0)
+    parser.add_argument("--max-sessions", type=int, default=64)
+    parser.add_argument("--step", type=int, default=0, help="Add N sessions per step (default: double)")
+    parser.add_argument("--duration", type=float, default=30.0, help="Seconds per step")
+    parser.add_argument("--gap", type=float, default=0.5, help="Think time between a session's turns (s)")
+    parser.add_argument("--timeout", type=float, default=30.0, help="Per-turn timeout (s)")
+    args = parser.parse_args()
+
+    audio = b""
+    if args.mode == "stt":
+        if not args.wav:
+            raise SystemExit("--mode stt needs --wav")
+        audio = _load_wav(args.wav)
+
+    print(f"{args.mode} against {args.url}, target p95 {args.target_p95_ms:.0f} ms, {args.duration:.0f}s/step")
+    print(f"\n{'sessions':>9}{'turns':>8}{'errors':>8}{'p50 ms':>10}{'p95 ms':>10}")
+    best = 0
+    sessions = 1
+    while sessions <= args.max_sessions:
+        r = await _step(sessions, args, audio)
+        print(f"{r['sessions']:>9}{r['turns']:>8}{r['errors']:>8}{r['p50']:>10.0f}{r['p95']:>10.0f}")
+        if r["p95"] > args.target_p95_ms or r["errors"]:
+            break
+        best = sessions
+        sessions = sessions + args.step if args.step else sessions * 2
+
+    print(f"\nSessions/host at p95 <= {args.target_p95_ms:.0f} ms: {best}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
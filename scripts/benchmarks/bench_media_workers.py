@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Benchmark: 20 ms pacing jitter with provider audio DSP inline vs on media workers.
+
+Simulates C concurrent calls on one event loop. Every call runs:
+  - a pacer: sleeps to the next 20 ms boundary and records how late it woke up
+    (what StreamingPlaybackManager feels when the loop is busy)
+  - a provider feed: one PCM16 @ 24 kHz chunk per --chunk-ms, resampled to 8 kHz
+    with levels measured (the provider_out stage of on_provider_event)
+
+Modes:
+  - inline:  the stage runs on the event loop (default engine behaviour)
+  - thread:  MediaWorkerPool(mode="thread")
+  - process: MediaWorkerPool(mode="process")
+
+Usage:
+    python3 scripts/benchmarks/bench_media_workers.py
+    python3 scripts/benchmarks/bench_media_workers.py --calls 25 50 100 --seconds 5 --workers 2
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import statistics
+import sys
+import time
+
+import numpy as np
+import structlog
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from src.core.media_workers import MediaChain, MediaWorkerPool  # noqa: E402
+
+FRAME_SEC = 0.020
+
+
+def _chunks(count: int, chunk_ms: int) -> list:
+    rng = np.random.default_rng(11)
+    samples = 24000 * chunk_ms // 1000
+    audio = rng.normal(0.0, 3000.0, size=(count, samples)).clip(-32768, 32767).astype(np.int16)
+    return [row.tobytes() for row in audio]
+
+
+async def _run(mode: str, calls: int, seconds: float, chunk_ms: int, workers: int) -> dict:
+    pool = None
+    if mode != "inline":
+        pool = MediaWorkerPool(mode=mode, workers=workers)
+        await pool.start()
+    chains = {}
+    chunks = _chunks(16, chunk_ms)
+    lateness: list = []
+    stop_at = time.perf_counter() + seconds
+
+    async def pacer(index: int) -> None:
+        loop = asyncio.get_running_loop()
+        # Stagger calls across the frame so they do not all wake together.
+        deadline = loop.time() + FRAME_SEC * (index % 20) / 20
+        while time.perf_counter() < stop_at:
+            deadline += FRAME_SEC
+            await asyncio.sleep(max(0.0, deadline - loop.time()))
+            lateness.append((loop.time() - deadline) * 1000.0)
+
+    async def feed(index: int) -> None:
+        call_id = f"call-{index}"
+        chain = chains.setdefault(call_id, MediaChain())
+        n = index
+        await asyncio.sleep(chunk_ms / 1000.0 * (index % 10) / 10)
+        while time.perf_counter() < stop_at:
+            chunk = chunks[n % len(chunks)]
+            n += 1
+            if pool is None:
+                chain.provider_out(chunk, "slin16", 24000, 8000)
+            else:
+                await pool.provider_out(call_id, chunk, "slin16", 24000, 8000)
+            await asyncio.sleep(chunk_ms / 1000.0)
+
+    started_cpu = time.process_time()
+    try:
+        await asyncio.gather(*(pacer(i) for i in range(calls)), *(feed(i) for i in range(calls)))
+    finally:
+        if pool is not None:
+            await pool.close()
+    lateness.sort()
+    return {
+        "p50_ms": statistics.median(lateness),
+        "p99_ms": lateness[int(len(lateness) * 0.99) - 1],
+        "max_ms": lateness[-1],
+        "loop_cpu_s": time.process_time() - started_cpu,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, nargs="+", default=[10, 25, 50, 100])
+    parser.add_argument("--seconds", type=float, default=3.0)
+    parser.add_argument("--chunk-ms", type=int, default=200, help="provider chunk duration")
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--modes", nargs="+", default=["inline", "thread", "process"])
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.CRITICAL))
+
+    print(f"cpus={os.cpu_count()} workers={args.workers} chunk={args.chunk_ms} ms @ 24 kHz -> 8 kHz")
+    print(f"{'calls':>6} {'mode':>8} {'p50 ms':>8} {'p99 ms':>8} {'max ms':>8} {'loop cpu s':>11}")
+    for calls in args.calls:
+        for mode in args.modes:
+            r = asyncio.run(_run(mode, calls, args.seconds, args.chunk_ms, args.workers))
+            print(
+                f"{calls:>6} {mode:>8} {r['p50_ms']:>8.2f} {r['p99_ms']:>8.2f} {r['max_ms']:>8.2f} {r['loop_cpu_s']:>11.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Benchmark: event-loop lag and time-to-first-audio of file-based playback (downstream_mode: file).
+
+Simulates C concurrent calls that each play M responses of S seconds of μ-law through
+PlaybackManager against a fake ARI client, while a 1 ms ticker measures how late the event
+loop wakes up. Compares:
+  - legacy:    the previous behavior (blocking open().write() on the event loop)
+  - offloaded: writes on the PlaybackManager I/O pool, media cache disabled
+  - cached:    offloaded + content-hash cache (a share of responses are repeated prompts)
+  - segmented: offloaded + long responses split into 2 s chained sound files
+
+Usage:
+    python3 scripts/benchmarks/bench_playback_loop_lag.py
+    python3 scripts/benchmarks/bench_playback_loop_lag.py --calls 50 --seconds 12 --fsync
+    python3 scripts/benchmarks/bench_playback_loop_lag.py --write-latency-ms 5
+    python3 scripts/benchmarks/bench_playback_loop_lag.py --media-dir /mnt/asterisk_media/ai-generated
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+import structlog
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+import src.core.playback_manager as playback_module  # noqa: E402
+from src.core.models import CallSession  # noqa: E402
+from src.core.playback_manager import PlaybackManager  # noqa: E402
+from src.core.session_store import SessionStore  # noqa: E402
+
+
+class _FakeAri:
+    def __init__(self):
+        self.started = {}
+
+    async def play_media_on_bridge_with_id(self, bridge_id, media_uri, playback_id):
+        self.started[playback_id] = time.perf_counter()
+        return True
+
+
+class _LegacyPlaybackManager(PlaybackManager):
+    """Previous behavior: unique file per playback written synchronously on the loop."""
+
+    async def _create_audio_file(self, audio_bytes, playback_id):
+        file_path = os.path.join(self.media_dir, f"audio-{playback_id.replace(':', '-')}.ulaw")
+        playback_module._write_file(file_path, audio_bytes)
+        return file_path
+
+    async def _cleanup_audio_file(self, audio_file):
+        if os.path.exists(audio_file):
+            os.remove(audio_file)
+
+
+def _install_slow_writes(fsync: bool, latency_ms: float) -> None:
+    def _write_file(file_path, audio_bytes):
+        if latency_ms:
+            # Blocks whichever thread performs the write, like a slow shared mount would.
+            time.sleep(latency_ms / 1000.0)
+        with open(file_path, "wb") as f:
+            f.write(audio_bytes)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+
+    playback_module._write_file = _write_file
+
+
+async def _ticker(stop: asyncio.Event, lags: list) -> None:
+    interval = 0.001
+    while not stop.is_set():
+        t0 = time.perf_counter()
+        await asyncio.sleep(interval)
+        lags.append((time.perf_counter() - t0 - interval) * 1000.0)
+
+
+async def _run(variant: str, args, media_dir: str) -> dict:
+    store = SessionStore()
+    ari = _FakeAri()
+    kwargs = dict(media_cache_bytes=0, segment_seconds=0, cleanup_interval_sec=0.5)
+    if variant == "cached":
+        kwargs["media_cache_bytes"] = 64 * 1024 * 1024
+    if variant == "segmented":
+        kwargs["segment_seconds"] = 2.0
+    cls = _LegacyPlaybackManager if variant == "legacy" else PlaybackManager
+    manager = cls(store, ari, media_dir, **kwargs)
+
+    rng = random.Random(7)
+    size = int(args.seconds * 8000)
+    prompts = [rng.randbytes(size) for _ in range(4)]
+    # Pre-generate every response so the timed loop only does playback work.
+    responses = {
+        c: [rng.randbytes(size) if variant != "cached" or rng.random() >= args.repeat_share
+            else prompts[rng.randrange(len(prompts))] for _ in range(args.responses)]
+        for c in range(args.calls)
+    }
+    for c in range(args.calls):
+        await store.upsert_call(CallSession(call_id=f"call-{c}", caller_channel_id=f"chan-{c}",
+                                            bridge_id=f"bridge-{c}", provider_name="local"))
+
+    ttfa = []
+
+    async def _call(c: int) -> None:
+        call_rng = random.Random(c)
+        for audio in responses[c]:
+            await asyncio.sleep(call_rng.uniform(0.0, args.gap))
+            t0 = time.perf_counter()
+            playback_id = await manager.play_audio(f"call-{c}", audio, "response")
+            if playback_id:
+                ttfa.append((ari.started[playback_id] - t0) * 1000.0)
+                # Don't wait out the audio: just finish every segment so files are released.
+                while True:
+                    segment_id = manager._active_segment_id(playback_id)
+                    await manager.on_playback_finished(segment_id)
+                    if playback_id not in manager._chains:
+                        break
+
+    lags = []
+    stop = asyncio.Event()
+    ticker = asyncio.create_task(_ticker(stop, lags))
+    t0 = time.perf_counter()
+    await asyncio.gather(*(_call(c) for c in range(args.calls)))
+    elapsed = time.perf_counter() - t0
+    stop.set()
+    await ticker
+    await manager.close()
+
+    lags.sort()
+    ttfa.sort()
+    return {
+        "elapsed_s": elapsed,
+        "lag_p50": statistics.median(lags),
+        "lag_p99": lags[int(len(lags) * 0.99) - 1],
+        "lag_max": lags[-1],
+        "ttfa_p50": statistics.median(ttfa),
+        "ttfa_p99": ttfa[int(len(ttfa) * 0.99) - 1],
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=30, help="Concurrent calls")
+    parser.add_argument("--responses", type=int, default=20, help="Responses per call")
+    parser.add_argument("--seconds", type=float, default=8.0, help="Audio seconds per response")
+    parser.add_argument("--gap", type=float, default=0.2,
+                        help="Max random pause (s) between a call's responses (caller speaking)")
+    parser.add_argument("--repeat-share", type=float, default=0.3,
+                        help="Share of responses that repeat a common prompt (cached variant)")
+    parser.add_argument("--media-dir", default=None, help="Directory to write into (default: a temp dir)")
+    parser.add_argument("--fsync", action="store_true", help="fsync every write (durable mounts)")
+    parser.add_argument("--write-latency-ms", type=float, default=0.0,
+                        help="Extra blocking latency per file write (emulates NFS/overlay media mounts)")
+    args = parser.parse_args()
+
+    # Keep console logging out of the measurement.
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(40))
+    if args.fsync or args.write_latency_ms:
+        _install_slow_writes(args.fsync, args.write_latency_ms)
+
+    print(f"calls={args.calls} responses/call={args.responses} audio={args.seconds}s "
+          f"({int(args.seconds * 8000):,} bytes) fsync={args.fsync} write_latency={args.write_latency_ms}ms")
+    print(f"\n{'variant':<11}{'wall (s)':>10}{'lag p50':>10}{'lag p99':>10}{'lag max':>10}"
+          f"{'TTFA p50':>11}{'TTFA p99':>11}   (ms)")
+    for variant in ("legacy", "offloaded", "cached", "segmented"):
+        media_dir = args.media_dir or tempfile.mkdtemp(prefix="bench-playback-")
+        try:
+            r = await _run(variant, args, media_dir)
+        finally:
+            if not args.media_dir:
+                shutil.rmtree(media_dir, ignore_errors=True)
+        print(f"{variant:<11}{r['elapsed_s']:>10.2f}{r['lag_p50']:>10.2f}{r['lag_p99']:>10.2f}"
+              f"{r['lag_max']:>10.2f}{r['ttfa_p50']:>11.2f}{r['ttfa_p99']:>11.2f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
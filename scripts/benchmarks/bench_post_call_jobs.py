@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Benchmark: a burst of post-call emails, sent inline vs through the post-call job queue.
+
+A local SMTP stand-in adds a fixed delay to each new session's greeting, standing in for
+the TCP + TLS + AUTH handshake of a real relay. For N emails queued at once it reports:
+  - inline: one send task per email (the previous fire-and-forget path), new session each
+  - queued: durable jobs (post_call_jobs) drained by W workers over pooled SMTP sessions
+with wall time until every email is accepted, SMTP sessions opened, peak thread count,
+and the time until every send is handed off (tasks created / jobs persisted), per email.
+
+Usage:
+    python3 scripts/benchmarks/bench_post_call_jobs.py
+    python3 scripts/benchmarks/bench_post_call_jobs.py --emails 200 --workers 4 --handshake-ms 50
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import socketserver
+import sys
+import tempfile
+import threading
+import time
+
+import structlog
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from src.core.post_call_jobs import PostCallJobQueue, PostCallJobStore, set_post_call_queue  # noqa: E402
+from src.tools.business import smtp_client  # noqa: E402
+from src.tools.business.email_dispatcher import deliver_email, run_email_job, send_email  # noqa: E402
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self):
+        server = self.server
+        server.sessions += 1
+        time.sleep(server.handshake_s)
+        self.wfile.write(b"220 bench ESMTP\r\n")
+        for line in self.rfile:
+            verb = line[:4].upper()
+            if verb == b"DATA":
+                self.wfile.write(b"354 go ahead\r\n")
+                for data in self.rfile:
+                    if data == b".\r\n":
+                        break
+                server.accepted += 1
+                self.wfile.write(b"250 queued\r\n")
+            elif verb == b"QUIT":
+                self.wfile.write(b"221 bye\r\n")
+                return
+            elif verb in (b"EHLO", b"HELO"):
+                self.wfile.write(b"250 bench\r\n")
+            else:
+                self.wfile.write(b"250 ok\r\n")
+
+
+class _Server(socketserver.ThreadingTCPServer):
+    request_queue_size = 1024  # the default backlog of 5 would add SYN retransmits to the inline burst
+
+
+def _start_smtp(handshake_ms: float) -> socketserver.ThreadingTCPServer:
+    server = _Server(("127.0.0.1", 0), _Handler)
+    server.daemon_threads = True
+    server.handshake_s = handshake_ms / 1000.0
+    server.sessions = 0
+    server.accepted = 0
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def _email(i: int):
+    return {"from": "agent@example.com", "to": "ops@example.com", "subject": f"Call {i}", "text": "summary"}
+
+
+async def _peak_threads(stop: asyncio.Event, peak: list) -> None:
+    while not stop.is_set():
+        peak[0] = max(peak[0], threading.active_count())
+        await asyncio.sleep(0.002)
+
+
+async def _measure(server, emails: int, run) -> dict:
+    server.sessions = server.accepted = 0
+    stop, peak = asyncio.Event(), [threading.active_count()]
+    sampler = asyncio.create_task(_peak_threads(stop, peak))
+    started = time.perf_counter()
+    enqueue_s = await run()
+    while server.accepted < emails:
+        await asyncio.sleep(0.002)
+    wall_s = time.perf_counter() - started
+    stop.set()
+    await sampler
+    return {"wall_ms": wall_s * 1000, "sessions": server.sessions, "threads": peak[0], "handoff_ms": enqueue_s * 1000 / emails}
+
+
+async def main_async(args) -> None:
+    server = _start_smtp(args.handshake_ms)
+    os.environ.update({"SMTP_HOST": "127.0.0.1", "SMTP_PORT": str(server.server_address[1]), "SMTP_TLS_MODE": "none"})
+    smtp_client._limiter = smtp_client._SMTPRateLimiter(max_per_second=1e6)
+    # Default executor sized like a small container, as in production.
+    asyncio.get_running_loop().set_default_executor(
+        __import__("concurrent.futures").futures.ThreadPoolExecutor(max_workers=args.executor_threads)
+    )
+
+    async def inline():
+        os.environ["SMTP_POOL_SIZE"] = "0"
+        started = time.perf_counter()
+        tasks = [
+            asyncio.create_task(
+                send_email(email_data=_email(i), tool_config={"provider": "smtp"}, call_id=f"c{i}",
+                           log_label="Email summary", recipient="ops@example.com", dedupe=False)
+            )
+            for i in range(args.emails)
+        ]
+        enqueue_s = time.perf_counter() - started
+        await asyncio.gather(*tasks)
+        return enqueue_s
+
+    rows = [("inline, session per email", await _measure(server, args.emails, inline))]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["SMTP_POOL_SIZE"] = str(args.workers)
+        smtp_client.close_pool()
+        store = PostCallJobStore(db_path=os.path.join(tmp, "jobs.db"))
+        queue = PostCallJobQueue(store, workers=args.workers, poll_interval_sec=0.05)
+        queue.register("email", run_email_job)
+        await queue.start()
+        set_post_call_queue(queue)
+
+        async def queued():
+            # One producer task per hung-up call, as in the engine.
+            started = time.perf_counter()
+            await asyncio.gather(*(
+                deliver_email(email_data=_email(i), tool_config={"provider": "smtp"}, call_id=f"c{i}",
+                              log_label="Email summary", recipient="ops@example.com")
+                for i in range(args.emails)
+            ))
+            return time.perf_counter() - started
+
+        rows.append((f"queued, {args.workers} workers, pooled", await _measure(server, args.emails, queued)))
+        set_post_call_queue(None)
+        await queue.stop()
+        smtp_client.close_pool()
+    server.shutdown()
+
+    print(f"{args.emails} emails at once, {args.handshake_ms:.0f} ms SMTP session setup")
+    print(f"\n{'path':<32} {'wall ms':>9} {'sessions':>9} {'peak thr':>9} {'handoff ms':>11}")
+    for name, r in rows:
+        print(f"{name:<32} {r['wall_ms']:>9.0f} {r['sessions']:>9} {r['threads']:>9} {r['handoff_ms']:>11.2f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--emails", type=int, default=100)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--handshake-ms", type=float, default=40.0, help="delay per new SMTP session")
+    parser.add_argument("--executor-threads", type=int, default=32)
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.CRITICAL))
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Benchmark: config-derived call setup cost per StasisStart, rebuilt per call vs session bundles.
+
+For each call this runs the engine's own setup steps between StasisStart and the
+provider's session.update / first audio that depend only on configuration:
+  - transport negotiation (TransportOrchestrator.resolve_transport) for the context
+  - context bundle: in-call tool allowlist (incl. per-context HTTP tool registration)
+    and the context prompt, rendered for the caller
+  - provider tool schemas (the OpenAI Realtime / Deepgram adapters)
+  - the config dict given to tool execution
+  - the per-call provider config clone (always per call)
+
+Modes:
+  - rebuild: caches invalidated before every call (the previous per-call behaviour)
+  - bundles: session bundles + registry schema memo (built on the first call only)
+
+Network round trips (ARI, provider handshake) are not included; they are unchanged.
+
+Usage:
+    python3 scripts/benchmarks/bench_session_setup.py
+    python3 scripts/benchmarks/bench_session_setup.py --calls 1 100 1000 --config config/ai-agent.yaml
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+import types
+
+import structlog
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+os.environ.setdefault("ASTERISK_ARI_USERNAME", "bench")
+os.environ.setdefault("ASTERISK_ARI_PASSWORD", "bench")
+
+from src.config import load_config  # noqa: E402
+from src.core.models import CallSession  # noqa: E402
+from src.core.transport_orchestrator import TransportOrchestrator  # noqa: E402
+from src.engine import Engine  # noqa: E402
+from src.tools.adapters.deepgram import DeepgramToolAdapter  # noqa: E402
+from src.tools.adapters.openai import OpenAIToolAdapter  # noqa: E402
+from src.tools.registry import tool_registry  # noqa: E402
+
+
+def _engine(config) -> Engine:
+    engine = Engine.__new__(Engine)
+    engine.config = config
+    engine.providers = {name: types.SimpleNamespace(config=cfg) for name, cfg in (config.providers or {}).items()}
+    engine._config_hash = engine._compute_config_hash()
+    engine.transport_orchestrator = TransportOrchestrator(config.model_dump())
+    return engine
+
+
+def _setup_call(engine: Engine, n: int, provider_name: str, context: str, adapters) -> None:
+    session = CallSession(call_id=f"call-{n}", caller_channel_id=f"chan-{n}", caller_name="Bench", caller_number="1000")
+    provider = engine.providers.get(provider_name)
+    bundle = engine._session_bundle(session, provider_name, provider, {"AI_CONTEXT": context})
+    session.transport_profile = bundle.new_transport()
+    if bundle.context.prompt is not None:
+        bundle.context.prompt.render(engine._prompt_substitutions(session))
+    tools = list(bundle.context.in_call_tools or ())
+    for adapter in adapters:
+        adapter.get_tools_config(tools)
+    engine._config_snapshot()
+    engine._clone_config(getattr(provider, "config", None))
+
+
+def _run(engine: Engine, calls: int, mode: str, provider_name: str, context: str) -> float:
+    engine._bundle_cache().invalidate()
+    tool_registry._changed()
+    adapters = [OpenAIToolAdapter(tool_registry), DeepgramToolAdapter(tool_registry)]
+    started = time.perf_counter()
+    for n in range(calls):
+        if mode == "rebuild":
+            engine._bundle_cache().invalidate()
+            tool_registry._changed()
+        _setup_call(engine, n, provider_name, context, adapters)
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--config", default="config/ai-agent.example.yaml")
+    parser.add_argument("--calls", type=int, nargs="+", default=[1, 100, 1000])
+    parser.add_argument("--provider", default="openai_realtime")
+    parser.add_argument("--context", default=None, help="AI_CONTEXT (default: first context in the config)")
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.CRITICAL))
+
+    config = load_config(args.config)
+    tool_registry.initialize_default_tools()
+    if getattr(config, "tools", None):
+        tool_registry.initialize_http_tools_from_config(config.tools)
+    engine = _engine(config)
+    context = args.context or next(iter(config.contexts or {}), None)
+
+    print(f"config={args.config} provider={args.provider} context={context} tools={len(tool_registry.list_tools())}")
+    print(f"{'calls':>6} {'mode':>8} {'total ms':>10} {'us/call':>9}")
+    for calls in args.calls:
+        for mode in ("rebuild", "bundles"):
+            elapsed = _run(engine, calls, mode, args.provider, context)
+            print(f"{calls:>6} {mode:>8} {elapsed * 1000:>10.2f} {elapsed / calls * 1e6:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Benchmark: SessionStore lookups/sec under N concurrent calls.
+
+Every call runs its own task that resolves its session once per media frame, while
+a writer task keeps upserting sessions (state changes, gating) as a live engine does.
+Compares, per frame:
+  - locked:  the previous read path (take the store lock around the dict lookup)
+  - lockfree: await get_by_call_id (plain snapshot lookup)
+  - ref:     a cached SessionRef per stream (what the media path now uses)
+Also times count_active_outbound_calls: full scan (previous) vs secondary index.
+
+Usage:
+    python3 scripts/benchmarks/bench_session_store.py
+    python3 scripts/benchmarks/bench_session_store.py --calls 500 --frames 400
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import sys
+import time
+
+import structlog
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from src.core.models import CallSession  # noqa: E402
+from src.core.session_store import SessionStore  # noqa: E402
+
+
+async def _populate(calls: int) -> SessionStore:
+    store = SessionStore()
+    for n in range(calls):
+        await store.upsert_call(
+            CallSession(
+                call_id=f"call-{n}",
+                caller_channel_id=f"call-{n}",
+                provider_name="local" if n % 2 else "deepgram",
+                is_outbound=n % 3 == 0,
+                outbound_campaign_id=f"campaign-{n % 5}" if n % 3 == 0 else None,
+            )
+        )
+    return store
+
+
+async def _locked(store: SessionStore, call_id: str):
+    async with store._lock:
+        return store._sessions_by_call_id.get(call_id)
+
+
+async def _lookups(calls: int, frames: int, mode: str) -> float:
+    store = await _populate(calls)
+    stop = asyncio.Event()
+
+    async def writer() -> None:
+        n = 0
+        while not stop.is_set():
+            session = await store.get_by_call_id(f"call-{n % calls}")
+            session.status = "connected" if n % 2 else "streaming"
+            await store.upsert_call(session)
+            n += 1
+            await asyncio.sleep(0)
+
+    async def call(index: int) -> None:
+        call_id = f"call-{index}"
+        ref = store.ref(call_id)
+        for _ in range(frames):
+            if mode == "locked":
+                session = await _locked(store, call_id)
+            elif mode == "lockfree":
+                session = await store.get_by_call_id(call_id)
+            else:
+                session = ref.get()
+            assert session is not None
+            await asyncio.sleep(0)
+
+    writer_task = asyncio.create_task(writer())
+    started = time.perf_counter()
+    await asyncio.gather(*(call(index) for index in range(calls)))
+    elapsed = time.perf_counter() - started
+    stop.set()
+    await writer_task
+    return calls * frames / elapsed
+
+
+def _scan_outbound(store: SessionStore, campaign_id: str) -> int:
+    return sum(
+        1
+        for session in store._sessions_by_call_id.values()
+        if session.is_outbound and session.outbound_campaign_id == campaign_id
+    )
+
+
+async def _counts(calls: int, repeats: int) -> tuple:
+    store = await _populate(calls)
+    started = time.perf_counter()
+    for _ in range(repeats):
+        _scan_outbound(store, "campaign-1")
+    scan = (time.perf_counter() - started) / repeats * 1e6
+    started = time.perf_counter()
+    for _ in range(repeats):
+        await store.count_active_outbound_calls(campaign_id="campaign-1")
+    indexed = (time.perf_counter() - started) / repeats * 1e6
+    return scan, indexed
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, nargs="+", default=[50, 500], help="Concurrent calls to simulate")
+    parser.add_argument("--frames", type=int, default=200, help="Frames (lookups) per call")
+    args = parser.parse_args()
+
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING))
+    print(f"{'calls':>6}{'locked/s':>12}{'lockfree/s':>12}{'ref/s':>12}{'scan us':>10}{'index us':>10}")
+    for calls in args.calls:
+        rates = [await _lookups(calls, args.frames, mode) for mode in ("locked", "lockfree", "ref")]
+        scan, indexed = await _counts(calls, 2000)
+        print(f"{calls:>6}{rates[0]:>12.0f}{rates[1]:>12.0f}{rates[2]:>12.0f}{scan:>10.1f}{indexed:>10.2f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
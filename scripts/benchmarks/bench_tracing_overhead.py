@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Benchmark: cost of per-call latency tracing (src/core/tracing.py) on the event loop.
+
+Measures, with N calls traced at once:
+  - primitives: tracer.get(call_id), mark(), start_span()+end(), for a sampled call
+    and for a disabled/unsampled call (no-op trace)
+  - per turn: the hooks one pipeline turn records (VAD end of speech, STT final,
+    begin/end turn, LLM span, TTS span + first byte, one tool span, first frame)
+  - per call at hangup: finish() + summary for call history, on the event loop,
+    and OTLP/JSON serialization + file export, on the exporter thread
+  - the per-turn cost as a share of one 20 ms frame budget
+
+Usage:
+    python3 scripts/benchmarks/bench_tracing_overhead.py
+    python3 scripts/benchmarks/bench_tracing_overhead.py --calls 500 --turns 20
+"""
+
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import time
+
+import structlog
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from src.core.tracing import FileSpanExporter, Tracer  # noqa: E402
+
+FRAME_NS = 20_000_000
+
+
+def _per_op_ns(fn, iterations: int) -> float:
+    started = time.perf_counter_ns()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter_ns() - started) / iterations
+
+
+def _turn(tracer: Tracer, call_id: str) -> None:
+    # Hook sequence of one pipeline turn, as recorded by the engine.
+    tracer.get(call_id).mark("vad.end_of_speech")
+    tracer.get(call_id).mark("stt.final")
+    trace = tracer.get(call_id)
+    trace.begin_turn()
+    llm = trace.start_span("llm.generate")
+    llm.end()
+    tts = trace.start_span("tts.synthesize")
+    trace.mark("tts.first_byte", once=True)
+    tts.end()
+    with trace.span("tool.execute", tool="lookup"):
+        pass
+    trace.end_turn()
+    tracer.get(call_id).mark("audio.first_frame", once=True)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=200, help="calls traced at once")
+    parser.add_argument("--turns", type=int, default=12, help="turns per call")
+    parser.add_argument("--iterations", type=int, default=200_000)
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.CRITICAL))
+
+    n = args.iterations
+    print(f"{args.calls} calls traced concurrently, {args.turns} turns per call")
+
+    # Primitives on a sampled call (spans per call capped, so the cap is raised for the loop).
+    tracer = Tracer(max_spans_per_call=n * 3 + 64)
+    for i in range(args.calls):
+        tracer.start_call(f"call-{i}")
+    call_id = f"call-{args.calls // 2}"
+    trace = tracer.get(call_id)
+    trace.begin_turn()
+    rows = [
+        ("tracer.get(call_id)", _per_op_ns(lambda: tracer.get(call_id), n)),
+        ("mark()", _per_op_ns(lambda: trace.mark("stt.final"), n)),
+        ("mark(once=True), repeat", _per_op_ns(lambda: trace.mark("tts.first_byte", once=True), n)),
+        ("start_span() + end()", _per_op_ns(lambda: trace.start_span("tool.execute", tool="x").end(), n)),
+    ]
+    off = Tracer(enabled=False)
+    noop = off.start_call("call-off")
+    rows += [
+        ("disabled: get + mark()", _per_op_ns(lambda: off.get("call-off").mark("stt.final"), n)),
+        ("disabled: start_span() + end()", _per_op_ns(lambda: noop.start_span("tool.execute").end(), n)),
+    ]
+    print(f"\n{'primitive':<32} {'ns/op':>8}")
+    for name, ns in rows:
+        print(f"{name:<32} {ns:>8.0f}")
+
+    # Whole turns and hangup, with a file exporter, across all calls.
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "spans.jsonl")
+        exporter = FileSpanExporter(path)
+        tracer = Tracer(exporter=None)
+        call_ids = [f"call-{i}" for i in range(args.calls)]
+        for cid in call_ids:
+            tracer.start_call(cid)
+        started = time.perf_counter_ns()
+        for _ in range(args.turns):
+            for cid in call_ids:
+                _turn(tracer, cid)
+        turn_ns = (time.perf_counter_ns() - started) / (args.turns * len(call_ids))
+
+        traces = [tracer.get(cid) for cid in call_ids]
+        started = time.perf_counter_ns()
+        summaries = [tracer.finish_call(cid) for cid in call_ids]
+        finish_ns = (time.perf_counter_ns() - started) / len(call_ids)
+
+        started = time.perf_counter_ns()
+        for trace in traces:
+            exporter.export(trace.to_otlp())
+        export_ns = (time.perf_counter_ns() - started) / len(traces)
+        export_bytes = os.path.getsize(path) / len(traces)
+
+    spans = summaries[0]["spans"]
+    print(f"\n{'per call/turn':<32} {'µs':>8}")
+    print(f"{'one turn (9 hooks)':<32} {turn_ns / 1000:>8.1f}   {100.0 * turn_ns / FRAME_NS:.3f}% of a 20 ms frame")
+    print(f"{'finish + summary (loop)':<32} {finish_ns / 1000:>8.1f}   {spans} spans/call")
+    print(f"{'OTLP/JSON + file (exporter)':<32} {export_ns / 1000:>8.1f}   {export_bytes / 1024:.1f} KiB/call")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Enhanced VAD frames/sec, per-frame awaits vs batch mode (vad.batch_enabled).
+
+Simulates C concurrent calls, each producing one PCM16 @ 8 kHz frame per 20 ms tick.
+Ticks run back to back, so the results are the VAD capacity of one event loop:
+  - per-frame: process_frame scores each frame on its own (the default path)
+  - batch:     frames from one tick are scored together as one 2-D array
+
+Two drivers:
+  - scoring: one task hands a tick's frames over with process_batch (VAD cost only)
+  - tasks:   every call awaits process_frame from its own task, as the AudioSocket/RTP
+             handlers do (adds the task wake-ups the engine pays either way)
+
+Usage:
+    python3 scripts/benchmarks/bench_vad_batch.py
+    python3 scripts/benchmarks/bench_vad_batch.py --calls 50 200 500 --ticks 400 --no-webrtc
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import sys
+import time
+
+import numpy as np
+import structlog
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from src.core.vad_manager import EnhancedVADManager  # noqa: E402
+
+
+def _frames(calls: int, ticks: int) -> list:
+    rng = np.random.default_rng(7)
+    # Mix of line noise and speech-level bursts so smoothing and thresholds both move.
+    amplitude = rng.choice([60, 400, 2500, 8000], size=(ticks, calls, 1))
+    audio = rng.normal(0.0, 1.0, size=(ticks, calls, 160)) * amplitude
+    pcm = audio.clip(-32768, 32767).astype(np.int16)
+    return [[pcm[t, c].tobytes() for c in range(calls)] for t in range(ticks)]
+
+
+def _manager(batch: bool, webrtc: bool) -> EnhancedVADManager:
+    manager = EnhancedVADManager(adaptive_threshold_enabled=True, batch_enabled=batch)
+    if not webrtc:
+        manager.webrtc_vad = None
+    return manager
+
+
+def _result(calls: int, frames: list, elapsed: float, cpu: float) -> dict:
+    total = calls * len(frames)
+    return {"frames_per_s": total / elapsed, "us_per_frame": elapsed / total * 1e6, "cpu_s": cpu}
+
+
+async def _scoring(calls: int, frames: list, *, batch: bool, webrtc: bool) -> dict:
+    manager = _manager(batch, webrtc)
+    call_ids = [f"call-{n}" for n in range(calls)]
+    started_cpu = time.process_time()
+    started = time.perf_counter()
+    for tick in frames:
+        await manager.process_batch(list(zip(call_ids, tick, [8000] * calls)))
+    return _result(calls, frames, time.perf_counter() - started, time.process_time() - started_cpu)
+
+
+async def _tasks(calls: int, frames: list, *, batch: bool, webrtc: bool) -> dict:
+    manager = _manager(batch, webrtc)
+    call_ids = [f"call-{n}" for n in range(calls)]
+    gates = [asyncio.Event() for _ in frames]
+    done: asyncio.Queue = asyncio.Queue()
+
+    async def call(index: int) -> None:
+        for tick, gate in zip(frames, gates):
+            await gate.wait()
+            await manager.process_frame(call_ids[index], tick[index])
+            done.put_nowait(None)
+
+    tasks = [asyncio.create_task(call(index)) for index in range(calls)]
+    await asyncio.sleep(0)
+    started_cpu = time.process_time()
+    started = time.perf_counter()
+    for gate in gates:
+        gate.set()
+        for _ in range(calls):
+            await done.get()
+    elapsed = time.perf_counter() - started
+    cpu = time.process_time() - started_cpu
+    await asyncio.gather(*tasks)
+    return _result(calls, frames, elapsed, cpu)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, nargs="+", default=[50, 200, 500], help="Concurrent calls to simulate")
+    parser.add_argument("--ticks", type=int, default=250, help="20 ms frames per call (250 = 5 s of audio)")
+    parser.add_argument("--no-webrtc", action="store_true", help="Energy-only scoring (as without py-webrtcvad)")
+    args = parser.parse_args()
+
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING))
+    print(f"{'calls':>6}{'driver':>9}{'mode':>11}{'frames/s':>12}{'us/frame':>10}{'cpu s':>8}")
+    for calls in args.calls:
+        frames = _frames(calls, args.ticks)
+        for driver, run in (("scoring", _scoring), ("tasks", _tasks)):
+            for name, batch in (("per-frame", False), ("batch", True)):
+                result = await run(calls, frames, batch=batch, webrtc=not args.no_webrtc)
+                print(
+                    f"{calls:>6}{driver:>9}{name:>11}{result['frames_per_s']:>12.0f}"
+                    f"{result['us_per_frame']:>10.1f}{result['cpu_s']:>8.2f}"
+                )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
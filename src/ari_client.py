@@ -29,10 +29,21 @@ logger = get_logger(__name__)
 class ARIClient:
     """A client for interacting with the Asterisk REST Interface (ARI)."""
 
-    def __init__(self, username: str, password: str, base_url: str, app_name: str, ssl_verify: bool = True):
+    def __init__(
+        self,
+        username: str,
+        password: str,
+        base_url: str,
+        app_name: str,
+        ssl_verify: bool = True,
+        shard_app: Optional[str] = None,
+    ):
         self.username = username
         self.password = password
         self.app_name = app_name
+        # Sharded engines also subscribe to their own app; channels they originate enter it.
+        self.origination_app = shard_app or app_name
+        apps = app_name if not shard_app else f"{app_name},{shard_app}"
         self.http_url = base_url
         self.ssl_verify = ssl_verify
         # Determine WebSocket scheme based on HTTP scheme
@@ -44,7 +55,7 @@ class ARIClient:
             ws_host = base_url.replace("http://", "").split('/')[0]
         safe_username = quote(username)
         safe_password = quote(password)
-        self.ws_url = f"{ws_scheme}://{ws_host}/ari/events?api_key={safe_username}:{safe_password}&app={app_name}&subscribeAll=true&subscribe=ChannelAudioFrame"
+        self.ws_url = f"{ws_scheme}://{ws_host}/ari/events?api_key={safe_username}:{safe_password}&app={apps}&subscribeAll=true&subscribe=ChannelAudioFrame"
         self.websocket: Optional[ClientConnection] = None
         self.http_session: Optional[aiohttp.ClientSession] = None
         self.running = False
@@ -1097,7 +1108,7 @@ class ARIClient:
         """
         external_host_port = f"{external_host}:{external_port}"
         response = await self.create_external_media_channel(
-            app=self.app_name,
+            app=self.origination_app,
             external_host=external_host_port,
             format=fmt,
             direction=direction
@@ -0,0 +1,233 @@
+"""Per-connection AudioSocket egress writer.
+
+Outbound audio frames are packed as TLV records into one reusable buffer per
+connection and written with a single ``transport.write`` per flush instead of a
+write + ``drain()`` per frame. A flush runs at the end of the current event-loop
+iteration (or after ``coalesce_ms``), so frames produced within one pacing tick
+share a syscall.
+
+Backpressure is explicit. The queued audio (this writer's pending frames plus the
+transport's unsent bytes and, on Linux, the kernel send queue) is measured in
+frames against a high and a low watermark. Above the high watermark the writer stops handing data to the
+transport and keeps only the newest frames, up to the low watermark. Older
+pending audio is dropped as stale, so a slow peer costs dropped audio instead of
+ever-growing latency. Writing resumes once the transport has drained below the
+low watermark.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import struct
+from collections import deque
+from typing import Deque, Optional
+
+from prometheus_client import Counter
+
+from src.logging_config import get_logger
+
+try:  # Linux: bytes still in the socket's kernel send queue
+    import fcntl
+    import termios
+
+    _TIOCOUTQ: Optional[int] = getattr(termios, "TIOCOUTQ", None)
+except ImportError:  # pragma: no cover - non-POSIX
+    fcntl = None
+    _TIOCOUTQ = None
+
+logger = get_logger(__name__)
+
+TYPE_AUDIO = 0x10
+HEADER = struct.Struct(">BH")
+
+_EGRESS_WRITES = Counter(
+    "ai_agent_audiosocket_egress_writes_total",
+    "transport.write() calls made by AudioSocket egress writers (one per coalesced flush)",
+)
+_EGRESS_FRAMES = Counter(
+    "ai_agent_audiosocket_egress_frames_total",
+    "Audio frames written to AudioSocket peers",
+)
+_EGRESS_DROPPED = Counter(
+    "ai_agent_audiosocket_egress_dropped_frames_total",
+    "Stale outbound audio frames dropped while an AudioSocket peer was backpressured",
+)
+_EGRESS_CONGESTED = Counter(
+    "ai_agent_audiosocket_egress_congestion_events_total",
+    "Times an AudioSocket connection crossed the egress high watermark",
+)
+
+
+class AudioSocketEgress:
+    """Coalescing, watermark-aware writer for one AudioSocket connection."""
+
+    def __init__(
+        self,
+        transport: asyncio.WriteTransport,
+        *,
+        frame_ms: int = 20,
+        coalesce_ms: int = 0,
+        high_watermark_ms: int = 200,
+        low_watermark_ms: int = 100,
+        conn_id: str = "",
+        initial_capacity: int = 4096,
+    ) -> None:
+        self._transport = transport
+        self.conn_id = conn_id
+        frame_ms = max(1, int(frame_ms))
+        self.coalesce_sec = max(0, int(coalesce_ms)) / 1000.0
+        self.high_frames = max(1, math.ceil(int(high_watermark_ms) / frame_ms))
+        self.low_frames = max(1, min(self.high_frames, math.ceil(int(low_watermark_ms) / frame_ms)))
+        self._buf = bytearray(initial_capacity)
+        self._len = 0
+        self._frames: Deque[int] = deque()  # wire size of each pending frame, oldest first
+        self._wire_frame = 0  # wire size of the most recent frame
+        self._flush_handle: Optional[asyncio.Handle] = None
+        self._loop = asyncio.get_running_loop()
+        self._closed = False
+        # The kernel send queue absorbs a lot of audio before the transport buffers
+        # anything, so it is probed too, at most once per low-watermark interval
+        # (every flush while congested) to keep the extra ioctl rare.
+        self._sock_fd = self._socket_fd(transport)
+        self._probe_sec = self.low_frames * frame_ms / 1000.0
+        self._next_probe = 0.0
+        self._kernel_queued = 0
+        self.congested = False
+        self.stats = {"frames": 0, "writes": 0, "dropped": 0, "congestion_events": 0}
+
+    def send(self, payload: bytes) -> bool:
+        """Queue one audio frame; False once the connection is closing."""
+        if self._closed or self._transport.is_closing():
+            return False
+        size = HEADER.size + len(payload)
+        if self._len + size > len(self._buf):
+            self._buf.extend(bytes(max(size, len(self._buf))))
+        HEADER.pack_into(self._buf, self._len, TYPE_AUDIO, len(payload))
+        self._buf[self._len + HEADER.size : self._len + size] = payload
+        self._len += size
+        self._frames.append(size)
+        self._wire_frame = size
+        self._update_congestion()
+        if self.congested:
+            self._drop_stale()
+        self._schedule_flush()
+        return True
+
+    def flush(self, *, force: bool = False) -> None:
+        """Write pending frames now, unless the peer is backpressured (``force`` ignores that)."""
+        self._flush_handle = None
+        if self._closed or not self._len:
+            return
+        if self._transport.is_closing():
+            self._discard_pending()
+            return
+        self._update_congestion(probe=self.congested)
+        if self.congested and not force:
+            # Recheck once the transport has had a chance to drain.
+            self._schedule_flush(max(self.coalesce_sec, 0.02))
+            return
+        # One copy per flush: newer asyncio transports keep a reference to the
+        # data they could not send instead of copying it.
+        with memoryview(self._buf) as view:
+            data = bytes(view[: self._len])
+        self._transport.write(data)
+        frames = len(self._frames)
+        self._len = 0
+        self._frames.clear()
+        self.stats["writes"] += 1
+        self.stats["frames"] += frames
+        _EGRESS_WRITES.inc()
+        _EGRESS_FRAMES.inc(frames)
+
+    def close(self) -> None:
+        """Hand pending frames to the transport, then stop accepting new ones.
+
+        The tail of a prompt is written even while backpressured; closing the
+        transport afterwards still sends everything it buffered.
+        """
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        self.flush(force=True)
+        self._closed = True
+        self._discard_pending()
+
+    @property
+    def pending_frames(self) -> int:
+        return len(self._frames)
+
+    def queued_frames(self) -> int:
+        """Pending frames plus the unsent bytes below this writer, in frames."""
+        buffered = self._unsent_bytes()
+        if buffered and self._wire_frame:
+            return len(self._frames) + math.ceil(buffered / self._wire_frame)
+        return len(self._frames)
+
+    @staticmethod
+    def _socket_fd(transport: asyncio.WriteTransport) -> Optional[int]:
+        if _TIOCOUTQ is None:
+            return None
+        try:
+            sock = transport.get_extra_info("socket")
+            return sock.fileno() if sock is not None else None
+        except Exception:
+            return None
+
+    def _unsent_bytes(self, probe: bool = False) -> int:
+        buffered = self._transport.get_write_buffer_size()
+        if self._sock_fd is None:
+            return buffered
+        now = self._loop.time()
+        if probe or now >= self._next_probe:
+            self._next_probe = now + self._probe_sec
+            try:
+                raw = fcntl.ioctl(self._sock_fd, _TIOCOUTQ, b"\0\0\0\0")
+                self._kernel_queued = struct.unpack("i", raw)[0]
+            except OSError:
+                self._sock_fd = None
+                self._kernel_queued = 0
+        return buffered + self._kernel_queued
+
+    def _update_congestion(self, probe: bool = False) -> None:
+        buffered = self._unsent_bytes(probe)
+        transport_frames = math.ceil(buffered / self._wire_frame) if buffered and self._wire_frame else 0
+        if not self.congested and transport_frames >= self.high_frames:
+            self.congested = True
+            self.stats["congestion_events"] += 1
+            _EGRESS_CONGESTED.inc()
+            logger.debug(
+                "AudioSocket egress backpressured; dropping stale audio",
+                conn_id=self.conn_id,
+                unsent_bytes=buffered,
+            )
+        elif self.congested and transport_frames <= self.low_frames:
+            self.congested = False
+        if not self.congested and len(self._frames) > self.high_frames:
+            # Nothing is stuck in the transport, but pending audio outgrew the window
+            # (e.g. a long coalescing interval): keep the newest.
+            self._drop_stale(keep=self.high_frames)
+
+    def _drop_stale(self, keep: Optional[int] = None) -> None:
+        keep = self.low_frames if keep is None else keep
+        excess = len(self._frames) - keep
+        if excess <= 0:
+            return
+        cut = sum(self._frames.popleft() for _ in range(excess))
+        self._buf[: self._len - cut] = self._buf[cut : self._len]
+        self._len -= cut
+        self.stats["dropped"] += excess
+        _EGRESS_DROPPED.inc(excess)
+
+    def _discard_pending(self) -> None:
+        self._len = 0
+        self._frames.clear()
+
+    def _schedule_flush(self, delay: Optional[float] = None) -> None:
+        if self._flush_handle is not None:
+            return
+        delay = self.coalesce_sec if delay is None else delay
+        if delay > 0:
+            self._flush_handle = self._loop.call_later(delay, self.flush)
+        else:
+            self._flush_handle = self._loop.call_soon(self.flush)
@@ -16,6 +16,7 @@ from typing import Awaitable, Callable, Dict, Optional
 
 from prometheus_client import Counter, Gauge
 
+from src.audio.audiosocket_egress import AudioSocketEgress
 from src.logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -54,6 +55,10 @@ class AudioSocketServer:
         on_audio: Callable[[str, bytes], Awaitable[None]],
         on_disconnect: Optional[Callable[[str], Awaitable[None]]] = None,
         on_dtmf: Optional[Callable[[str, str], Awaitable[None]]] = None,
+        frame_ms: int = 20,
+        egress_coalesce_ms: int = 0,
+        egress_high_watermark_ms: int = 200,
+        egress_low_watermark_ms: int = 100,
     ) -> None:
         self.host = host
         self.port = port
@@ -65,6 +70,13 @@ class AudioSocketServer:
         self._server: Optional[asyncio.base_events.Server] = None
         self._connection_tasks: Dict[str, asyncio.Task[None]] = {}
         self._writers: Dict[str, asyncio.StreamWriter] = {}
+        self._egress: Dict[str, AudioSocketEgress] = {}
+        self._egress_options = {
+            "frame_ms": frame_ms,
+            "coalesce_ms": egress_coalesce_ms,
+            "high_watermark_ms": egress_high_watermark_ms,
+            "low_watermark_ms": egress_low_watermark_ms,
+        }
         self._conn_to_uuid: Dict[str, str] = {}
         self._lock = asyncio.Lock()
         self._first_audio_logged: Dict[str, bool] = {}
@@ -101,6 +113,9 @@ class AudioSocketServer:
             self._connection_tasks.clear()
             self._writers.clear()
             self._conn_to_uuid.clear()
+            for egress in self._egress.values():
+                egress.close()
+            self._egress.clear()
 
         for task in tasks:
             task.cancel()
@@ -141,6 +156,7 @@ class AudioSocketServer:
 
         async with self._lock:
             self._writers[conn_id] = writer
+            self._egress[conn_id] = AudioSocketEgress(writer.transport, conn_id=conn_id, **self._egress_options)
             _AUDIO_CONN_ACTIVE.inc()
 
         connection_task = asyncio.create_task(self._connection_loop(conn_id, reader, writer))
@@ -153,6 +169,7 @@ class AudioSocketServer:
             async with self._lock:
                 self._connection_tasks.pop(conn_id, None)
                 self._writers.pop(conn_id, None)
+                self._close_egress(conn_id)
                 self._conn_to_uuid.pop(conn_id, None)
                 with contextlib.suppress(ValueError):
                     _AUDIO_CONN_ACTIVE.dec()
@@ -180,13 +197,13 @@ class AudioSocketServer:
                             conn_id=conn_id,
                             msg_type=msg_type,
                         )
-                        await self._send_error(writer, b"missing-uuid")
+                        await self._send_error(conn_id, writer, b"missing-uuid")
                         return
 
                     uuid_str = self._decode_uuid(payload)
                     if not uuid_str:
                         logger.warning("Invalid UUID payload from AudioSocket client", conn_id=conn_id)
-                        await self._send_error(writer, b"invalid-uuid")
+                        await self._send_error(conn_id, writer, b"invalid-uuid")
                         return
 
                     ok = await self._on_uuid(conn_id, uuid_str)
@@ -196,7 +213,7 @@ class AudioSocketServer:
                             conn_id=conn_id,
                             uuid=uuid_str,
                         )
-                        await self._send_error(writer, b"uuid-rejected")
+                        await self._send_error(conn_id, writer, b"uuid-rejected")
                         return
 
                     async with self._lock:
@@ -246,6 +263,8 @@ class AudioSocketServer:
         except Exception as exc:  # noqa: BLE001
             logger.error("AudioSocket connection error", conn_id=conn_id, error=str(exc), exc_info=True)
         finally:
+            # Hand coalesced audio to the transport before closing it.
+            self._close_egress(conn_id)
             writer.close()
             with contextlib.suppress(Exception):
                 await writer.wait_closed()
@@ -253,23 +272,27 @@ class AudioSocketServer:
                 await self._on_disconnect(conn_id)
 
     async def send_audio(self, conn_id: str, audio_payload: bytes) -> bool:
-        """Send a PCM16 8k audio frame to the AudioSocket peer."""
-        async with self._lock:
-            writer = self._writers.get(conn_id)
-        if not writer:
+        """Queue an audio frame for the AudioSocket peer.
+
+        Frames go through the connection's egress writer, which coalesces writes
+        and drops stale audio under backpressure (see audiosocket_egress).
+        """
+        egress = self._egress.get(conn_id)
+        if not egress:
             logger.debug("Attempted to send audio on closed connection", conn_id=conn_id)
             return False
-
-        frame = bytes([TYPE_AUDIO]) + len(audio_payload).to_bytes(2, "big") + audio_payload
         try:
-            writer.write(frame)
-            await writer.drain()
+            if not egress.send(audio_payload):
+                return False
             _AUDIO_BYTES_TX.inc(len(audio_payload))
             return True
         except Exception as exc:  # noqa: BLE001
             logger.error("Failed to send audio over AudioSocket", conn_id=conn_id, error=str(exc), exc_info=True)
             return False
 
+    def get_egress(self, conn_id: str) -> Optional[AudioSocketEgress]:
+        return self._egress.get(conn_id)
+
     def get_connection_count(self) -> int:
         return len(self._writers)
 
@@ -280,6 +303,7 @@ class AudioSocketServer:
         """Proactively close a connection (used during call cleanup)."""
         async with self._lock:
             writer = self._writers.pop(conn_id, None)
+            self._close_egress(conn_id)
         if not writer:
             return
         writer.close()
@@ -289,9 +313,18 @@ class AudioSocketServer:
     # ------------------------------------------------------------------
     # Helpers
     # ------------------------------------------------------------------
-    async def _send_error(self, writer: asyncio.StreamWriter, message: bytes) -> None:
+    def _close_egress(self, conn_id: str) -> None:
+        egress = self._egress.pop(conn_id, None)
+        if egress:
+            egress.close()
+
+    async def _send_error(self, conn_id: str, writer: asyncio.StreamWriter, message: bytes) -> None:
         frame = bytes([TYPE_ERROR]) + len(message).to_bytes(2, "big") + message
         try:
+            # Audio still coalescing in the egress buffer goes out ahead of the error frame.
+            egress = self._egress.get(conn_id)
+            if egress:
+                egress.flush(force=True)
             writer.write(frame)
             await writer.drain()
         except Exception as e:
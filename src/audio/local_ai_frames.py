@@ -0,0 +1,113 @@
+"""
+Binary audio frames for the engine <-> local_ai_server WebSocket.
+
+Once a connection has negotiated them (``negotiate`` / ``negotiate_response``),
+audio travels as one binary message per chunk: a fixed 16-byte big-endian header
+followed by raw audio, instead of base64 inside JSON. Control messages stay JSON.
+
+    version u8 | kind u8 | codec u8 | flags u8 | rate_hz u32 | call_hash u32 | seq u32
+
+local_ai_server runs in its own container and does not import from ``src``, so the
+authoritative definition lives in ``local_ai_server/protocol_contract.py`` and this
+module mirrors it byte for byte (tests/test_local_ai_frames.py keeps them in sync).
+"""
+
+from __future__ import annotations
+
+import json
+import struct
+import zlib
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Optional
+
+FRAME_VERSION = 1
+FRAME_HEADER = struct.Struct("!BBBBIII")
+
+FRAME_KIND_AUDIO = 1  # engine -> server: caller audio for STT
+FRAME_KIND_TTS_AUDIO = 2  # server -> engine: synthesized audio
+
+FRAME_CODECS = {"pcm16le": 1, "mulaw": 2}
+FRAME_CODEC_NAMES = {value: name for name, value in FRAME_CODECS.items()}
+
+FRAME_FLAG_END = 0x01  # last frame of a TTS response
+FRAME_FLAG_RESPONSE = 0x02  # answers a tts_request; a tts_response with frame_seq follows
+
+
+def call_hash(call_id: str) -> int:
+    """32-bit id a frame uses to name its call (CRC-32 of the UTF-8 call_id)."""
+    return zlib.crc32((call_id or "").encode("utf-8")) & 0xFFFFFFFF
+
+
+@dataclass(frozen=True)
+class AudioFrame:
+    kind: int
+    codec: str
+    rate_hz: int
+    call_hash: int
+    seq: int
+    flags: int
+    payload: bytes
+
+    @property
+    def end(self) -> bool:
+        return bool(self.flags & FRAME_FLAG_END)
+
+    @property
+    def response(self) -> bool:
+        return bool(self.flags & FRAME_FLAG_RESPONSE)
+
+
+def encode_frame(
+    kind: int,
+    payload: bytes,
+    *,
+    call_hash: int,
+    seq: int,
+    codec: str = "pcm16le",
+    rate_hz: int = 16000,
+    flags: int = 0,
+    version: int = FRAME_VERSION,
+) -> bytes:
+    header = FRAME_HEADER.pack(
+        version, kind, FRAME_CODECS[codec], flags, rate_hz, call_hash, seq & 0xFFFFFFFF
+    )
+    return header + payload
+
+
+def decode_frame(data: bytes) -> AudioFrame:
+    """Parse a binary frame; raises ValueError if it is not a supported v1 frame."""
+    if len(data) < FRAME_HEADER.size:
+        raise ValueError(f"frame shorter than its {FRAME_HEADER.size}-byte header")
+    version, kind, codec, flags, rate_hz, hashed, seq = FRAME_HEADER.unpack_from(data)
+    if version != FRAME_VERSION:
+        raise ValueError(f"unsupported frame version {version}")
+    if codec not in FRAME_CODEC_NAMES:
+        raise ValueError(f"unknown frame codec {codec}")
+    return AudioFrame(
+        kind=kind,
+        codec=FRAME_CODEC_NAMES[codec],
+        rate_hz=rate_hz,
+        call_hash=hashed,
+        seq=seq,
+        flags=flags,
+        payload=bytes(data[FRAME_HEADER.size:]),
+    )
+
+
+def negotiate_message(*, multiplex: bool = False, codecs: Iterable[str] = ("pcm16le", "mulaw")) -> str:
+    """JSON ``negotiate`` offer. Servers that predate frames ignore it and stay on JSON audio."""
+    return json.dumps(
+        {
+            "type": "negotiate",
+            "binary_frames": {"versions": [FRAME_VERSION], "codecs": list(codecs)},
+            "multiplex": multiplex,
+        }
+    )
+
+
+def negotiated_version(response: Dict[str, Any]) -> Optional[int]:
+    """Frame version agreed in a ``negotiate_response`` (None = keep base64 JSON audio)."""
+    frames = response.get("binary_frames") if isinstance(response, dict) else None
+    if not isinstance(frames, dict) or frames.get("version") != FRAME_VERSION:
+        return None
+    return FRAME_VERSION
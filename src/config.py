@@ -12,7 +12,7 @@ from typing import Dict, Any, Optional, List
 import structlog
 
 # Import configuration helpers (AAVA-40 refactor)
-from src.config.loaders import resolve_config_path, load_yaml_with_env_expansion, load_yaml_with_local_override
+from src.config.loaders import resolve_config_path, load_yaml_with_env_expansion, load_yaml_with_local_override, parse_yaml
 from src.config.security import (
     inject_asterisk_credentials,
     inject_llm_config,
@@ -24,6 +24,8 @@ from src.config.defaults import (
     apply_externalmedia_defaults,
     apply_diagnostic_defaults,
     apply_barge_in_defaults,
+    apply_cluster_defaults,
+    apply_media_worker_defaults,
 )
 from src.config.normalization import normalize_pipelines, normalize_profiles, normalize_local_provider_tokens
 
@@ -74,6 +76,13 @@ class AudioSocketConfig(BaseModel):
     advertise_host: Optional[str] = Field(default=None)  # Advertise host: IP Asterisk connects to (defaults to host if not set)
     port: int = Field(default=8090)
     format: str = Field(default="ulaw")  # 'ulaw' or 'slin16'
+    # Outbound writer: frames queued within egress_coalesce_ms share one socket write
+    # (0 = flush at the end of each event-loop pass). Once more than
+    # egress_high_watermark_ms of audio is unsent, stale frames are dropped down to
+    # egress_low_watermark_ms instead of queueing behind a slow peer.
+    egress_coalesce_ms: int = Field(default=0)
+    egress_high_watermark_ms: int = Field(default=200)
+    egress_low_watermark_ms: int = Field(default=100)
 
 
 class LocalProviderConfig(BaseModel):
@@ -100,6 +109,14 @@ class LocalProviderConfig(BaseModel):
     # Increase if farewell gets cut off (typical farewells need 2-4 seconds)
     farewell_hangup_delay_sec: float = Field(default=5.0)
     chunk_ms: int = Field(default=200)
+    # Send/receive audio as binary frames instead of base64 JSON when local-ai-server
+    # supports them (negotiated per connection; older servers keep JSON audio).
+    binary_frames: bool = Field(default=True)
+    # Shared connections kept open to local-ai-server; calls multiplex logical
+    # channels over them when the server grants it. 0 = one socket per call.
+    pool_size: int = Field(default=2)
+    # Channels per pooled connection before new calls wait for capacity
+    pool_max_channels: int = Field(default=32)
     max_tokens: int = Field(default=150)
     temperature: float = Field(default=0.4)
     llm_model: Optional[str] = None
@@ -488,6 +505,9 @@ class VADConfig(BaseModel):
     confidence_threshold: float = 0.6
     adaptive_threshold_enabled: bool = True
     noise_adaptation_rate: float = 0.1
+    # Score frames from all calls that arrive in the same event-loop tick together
+    # (vectorized energy/thresholds); same results, less per-frame overhead at high call counts.
+    batch_enabled: bool = False
     
     # Utterance settings - optimized for real-time conversation
     min_utterance_duration_ms: int = 800
@@ -549,6 +569,54 @@ class HealthConfig(BaseModel):
     port: int = Field(default=15000)
 
 
+class ClusterConfig(BaseModel):
+    """Run several ai-engine processes against one Asterisk (ARI app sharding)."""
+    shard_count: int = Field(default=1, ge=1)
+    shard_index: int = Field(default=0, ge=0)
+    state_backend: str = Field(default="memory")  # memory | sqlite (shared by shards on one host)
+    state_db_path: str = Field(default="data/engine_state.db")
+    heartbeat_interval_sec: float = Field(default=2.0, gt=0)
+
+
+class MediaWorkersConfig(BaseModel):
+    """Run per-call DSP chains in worker processes/threads instead of on the event loop."""
+    enabled: bool = Field(default=False)
+    mode: str = Field(default="process")  # process | thread
+    workers: int = Field(default=2, ge=1)
+    ring_kb: int = Field(default=1024, ge=64)  # per direction, per worker (process mode)
+    stages: List[str] = Field(default_factory=lambda: ["provider_out"])  # provider_out | ingress
+
+
+class TracingConfig(BaseModel):
+    """Per-call latency tracing (turn waterfalls in call history, optional OTLP/JSON export)."""
+    enabled: bool = Field(default=True)
+    sample_rate: float = Field(default=1.0, ge=0.0, le=1.0)
+    max_spans_per_call: int = Field(default=512, ge=8)
+    exporter: str = Field(default="none")  # none | file | otlp_http
+    file_path: str = Field(default="data/traces/spans.jsonl")
+    otlp_endpoint: str = Field(default="http://127.0.0.1:4318")
+    queue_size: int = Field(default=256, ge=1)  # finished call traces awaiting export
+
+
+class PostCallJobsConfig(BaseModel):
+    """Durable post-call job queue (summary/transcript emails, webhooks) with retries and dead-lettering."""
+    enabled: bool = Field(default=True)
+    workers: int = Field(default=4, ge=1, le=64)
+    max_attempts: int = Field(default=6, ge=1)
+    backoff_base_sec: float = Field(default=5.0, ge=0.0)
+    backoff_max_sec: float = Field(default=900.0, ge=0.0)
+    poll_interval_sec: float = Field(default=2.0, gt=0.0)
+    lease_sec: float = Field(default=300.0, ge=1.0)  # renewed while a job runs; an unrenewed lease is reclaimed
+    retention_days: float = Field(default=7.0, ge=0.0)  # done jobs only; dead jobs are kept until retried/deleted
+
+
+class DeviceStateCacheConfig(BaseModel):
+    """In-memory extension device/endpoint state fed by ARI events (check_extension_status lookups)."""
+    enabled: bool = Field(default=True)
+    reconcile_interval_sec: float = Field(default=60.0, gt=0.0)
+    max_age_sec: float = Field(default=180.0, gt=0.0)  # older entries are misses (live ARI probe)
+
+
 class PipelineEntry(BaseModel):
     stt: str
     llm: str
@@ -632,6 +700,11 @@ class AppConfig(BaseModel):
     barge_in: Optional[BargeInConfig] = Field(default_factory=BargeInConfig)
     logging: Optional[LoggingConfig] = Field(default_factory=LoggingConfig)
     health: Optional[HealthConfig] = Field(default_factory=HealthConfig)
+    cluster: Optional[ClusterConfig] = Field(default_factory=ClusterConfig)
+    media_workers: Optional[MediaWorkersConfig] = Field(default_factory=MediaWorkersConfig)
+    tracing: Optional[TracingConfig] = Field(default_factory=TracingConfig)
+    post_call_jobs: Optional[PostCallJobsConfig] = Field(default_factory=PostCallJobsConfig)
+    device_state_cache: Optional[DeviceStateCacheConfig] = Field(default_factory=DeviceStateCacheConfig)
     pipelines: Dict[str, PipelineEntry] = Field(default_factory=dict)
     active_pipeline: Optional[str] = None
     # P1: profiles/contexts for transport orchestration
@@ -749,6 +822,8 @@ def load_config(path: str = "config/ai-agent.yaml") -> AppConfig:
     apply_externalmedia_defaults(config_data)
     apply_diagnostic_defaults(config_data)
     apply_barge_in_defaults(config_data)
+    apply_cluster_defaults(config_data)
+    apply_media_worker_defaults(config_data)
     
     # Phase 4: Normalize configuration
     normalize_pipelines(config_data)
@@ -798,7 +873,7 @@ def _merge_external_contexts(config_data: Dict[str, Any]) -> None:
                 with open(ctx_path, "r") as f:
                     raw = f.read()
                 raw = os.path.expandvars(raw)
-                ctx_data = yaml.safe_load(raw) or {}
+                ctx_data = parse_yaml(raw) or {}
             except Exception:
                 continue
 
@@ -49,6 +49,11 @@ LLMConfig = _parent_config.LLMConfig
 VADConfig = _parent_config.VADConfig
 StreamingConfig = _parent_config.StreamingConfig
 LoggingConfig = _parent_config.LoggingConfig
+ClusterConfig = _parent_config.ClusterConfig
+MediaWorkersConfig = _parent_config.MediaWorkersConfig
+TracingConfig = _parent_config.TracingConfig
+PostCallJobsConfig = _parent_config.PostCallJobsConfig
+DeviceStateCacheConfig = _parent_config.DeviceStateCacheConfig
 PipelineEntry = _parent_config.PipelineEntry
 AppConfig = _parent_config.AppConfig
 load_config = _parent_config.load_config
@@ -77,6 +82,11 @@ __all__ = [
     'VADConfig',
     'StreamingConfig',
     'LoggingConfig',
+    'ClusterConfig',
+    'MediaWorkersConfig',
+    'TracingConfig',
+    'PostCallJobsConfig',
+    'DeviceStateCacheConfig',
     'PipelineEntry',
     'AppConfig',
     'load_config',
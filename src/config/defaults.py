@@ -7,6 +7,8 @@ This module handles:
 - ExternalMedia RTP configuration defaults
 - Diagnostic settings (egress swap, force mulaw, attack ms, taps, logging)
 - Barge-in configuration with environment variable overrides
+- Cluster (ARI sharding) settings with environment variable overrides
+- Media worker (DSP offload) settings with environment variable overrides
 """
 
 import os
@@ -205,3 +207,75 @@ def apply_barge_in_defaults(config_data: Dict[str, Any]) -> None:
         pass
     
     config_data['barge_in'] = barge_cfg
+
+
+def apply_cluster_defaults(config_data: Dict[str, Any]) -> None:
+    """
+    Apply cluster (ARI sharding) settings with environment variable overrides.
+    
+    Each ai-engine process of a sharded deployment shares one YAML and differs only
+    in its shard index, so the per-process values come from the environment.
+    
+    Environment variables (optional overrides):
+    - AI_ENGINE_SHARD_COUNT: Number of engine processes (default: 1)
+    - AI_ENGINE_SHARD_INDEX: This process's shard, 0..count-1 (default: 0)
+    - AI_ENGINE_STATE_BACKEND: memory | sqlite (default: memory)
+    - AI_ENGINE_STATE_DB_PATH: SQLite file shared by shards (default: data/engine_state.db)
+    
+    Args:
+        config_data: Configuration dictionary to modify in-place
+        
+    Complexity: 3
+    """
+    cluster_cfg = config_data.get('cluster', {}) or {}
+    
+    try:
+        if 'AI_ENGINE_SHARD_COUNT' in os.environ:
+            cluster_cfg['shard_count'] = int(os.getenv('AI_ENGINE_SHARD_COUNT', '1'))
+        if 'AI_ENGINE_SHARD_INDEX' in os.environ:
+            cluster_cfg['shard_index'] = int(os.getenv('AI_ENGINE_SHARD_INDEX', '0'))
+    except ValueError:
+        # Ignore invalid integer conversions; keep YAML values
+        pass
+    
+    if os.getenv('AI_ENGINE_STATE_BACKEND', '').strip():
+        cluster_cfg['state_backend'] = os.getenv('AI_ENGINE_STATE_BACKEND').strip().lower()
+    if os.getenv('AI_ENGINE_STATE_DB_PATH', '').strip():
+        cluster_cfg['state_db_path'] = os.getenv('AI_ENGINE_STATE_DB_PATH').strip()
+    
+    config_data['cluster'] = cluster_cfg
+
+
+def apply_media_worker_defaults(config_data: Dict[str, Any]) -> None:
+    """
+    Apply media worker (per-call DSP offload) settings with environment variable overrides.
+    
+    Environment variables (optional overrides):
+    - MEDIA_WORKERS_ENABLED: Run DSP stages off the event loop (true/false, default: false)
+    - MEDIA_WORKERS_MODE: process | thread (default: process)
+    - MEDIA_WORKERS_COUNT: Number of workers (default: 2)
+    - MEDIA_WORKERS_STAGES: Comma-separated stages to offload (default: provider_out)
+    
+    Args:
+        config_data: Configuration dictionary to modify in-place
+        
+    Complexity: 4
+    """
+    workers_cfg = config_data.get('media_workers', {}) or {}
+    
+    if 'MEDIA_WORKERS_ENABLED' in os.environ:
+        workers_cfg['enabled'] = os.getenv('MEDIA_WORKERS_ENABLED', 'false').lower() in ('1', 'true', 'yes')
+    if os.getenv('MEDIA_WORKERS_MODE', '').strip():
+        workers_cfg['mode'] = os.getenv('MEDIA_WORKERS_MODE').strip().lower()
+    try:
+        if 'MEDIA_WORKERS_COUNT' in os.environ:
+            workers_cfg['workers'] = int(os.getenv('MEDIA_WORKERS_COUNT', '2'))
+    except ValueError:
+        # Ignore invalid integer conversions; keep YAML values
+        pass
+    if os.getenv('MEDIA_WORKERS_STAGES', '').strip():
+        workers_cfg['stages'] = [
+            stage.strip() for stage in os.getenv('MEDIA_WORKERS_STAGES').split(',') if stage.strip()
+        ]
+    
+    config_data['media_workers'] = workers_cfg
@@ -0,0 +1,103 @@
+"""
+Structured diff between two loaded configurations.
+
+Used by the engine's hot reload to rebuild only what changed. Top-level AppConfig
+fields are compared by value; the keyed sections (providers, pipelines, contexts,
+profiles, tools, in_call_tools) are additionally diffed per entry so a reload that
+touches one provider or one context does not rebuild the others.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Mapping, Tuple
+
+# Sections whose entries are named and can be rebuilt independently.
+KEYED_SECTIONS: Tuple[str, ...] = ("providers", "pipelines", "contexts", "profiles", "tools", "in_call_tools")
+
+
+@dataclass(frozen=True)
+class SectionDiff:
+    """Entries added, removed and changed within one keyed section."""
+
+    added: Tuple[str, ...] = ()
+    removed: Tuple[str, ...] = ()
+    changed: Tuple[str, ...] = ()
+
+    @property
+    def touched(self) -> Tuple[str, ...]:
+        """Entries that must be (re)built: added or changed."""
+        return self.added + self.changed
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.changed)
+
+
+@dataclass(frozen=True)
+class ConfigDiff:
+    """Top-level fields that differ, plus per-entry diffs for keyed sections."""
+
+    sections: Tuple[str, ...] = ()
+    keyed: Dict[str, SectionDiff] = field(default_factory=dict)
+
+    @property
+    def empty(self) -> bool:
+        return not self.sections
+
+    def changed(self, *sections: str) -> bool:
+        return any(section in self.sections for section in sections)
+
+    def section(self, name: str) -> SectionDiff:
+        return self.keyed.get(name) or SectionDiff()
+
+    def summary(self) -> List[str]:
+        """Human-readable lines for the /reload response."""
+        lines: List[str] = []
+        for name in self.sections:
+            keyed = self.keyed.get(name)
+            if not keyed:
+                lines.append(f"{name} changed")
+                continue
+            for label, names in (("added", keyed.added), ("removed", keyed.removed), ("changed", keyed.changed)):
+                if names:
+                    lines.append(f"{name} {label}: {', '.join(names)}")
+        return lines
+
+
+def _entry(value: Any) -> Any:
+    # Keyed sections hold plain dicts or pydantic models (e.g. PipelineEntry).
+    if hasattr(value, "model_dump"):
+        return value.model_dump()
+    return value
+
+
+def diff_section(old: Mapping[str, Any], new: Mapping[str, Any]) -> SectionDiff:
+    old = old or {}
+    new = new or {}
+    return SectionDiff(
+        added=tuple(name for name in new if name not in old),
+        removed=tuple(name for name in old if name not in new),
+        changed=tuple(name for name in new if name in old and _entry(old[name]) != _entry(new[name])),
+    )
+
+
+def diff_configs(old: Any, new: Any) -> ConfigDiff:
+    """
+    Compare two AppConfig instances field by field.
+
+    Args:
+        old: The live configuration
+        new: The freshly loaded configuration
+
+    Returns:
+        ConfigDiff listing changed top-level fields in declaration order
+    """
+    sections: List[str] = []
+    keyed: Dict[str, SectionDiff] = {}
+    for name in type(new).model_fields:
+        old_value = getattr(old, name, None)
+        new_value = getattr(new, name, None)
+        if old_value == new_value:
+            continue
+        sections.append(name)
+        if name in KEYED_SECTIONS:
+            keyed[name] = diff_section(old_value, new_value)
+    return ConfigDiff(sections=tuple(sections), keyed=keyed)
@@ -16,10 +16,18 @@ from pathlib import Path
 # Project root directory (parent of src/)
 _PROJ_DIR = Path(__file__).parent.parent.parent.resolve()
 
+# libyaml's C loader when PyYAML was built with it (same safe_load semantics, ~10x faster)
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 # Pattern to match ${VAR:-default} or ${VAR:=default} shell-style syntax
 _ENV_VAR_PATTERN = re.compile(r'\$\{([^}:]+)(:-|:=)?([^}]*)?\}')
 
 
+def parse_yaml(text: str):
+    """Equivalent of yaml.safe_load, using the C loader when available."""
+    return yaml.load(text, Loader=_YAML_LOADER)  # nosec B506 - SafeLoader/CSafeLoader
+
+
 def _expand_env_vars_with_defaults(text: str) -> str:
     """
     Expand environment variables with support for shell-style defaults.
@@ -113,7 +121,7 @@ def load_yaml_with_env_expansion(path: str) -> dict:
         config_str_expanded = _expand_env_vars_with_defaults(config_str)
         
         # Parse YAML
-        config_data = yaml.safe_load(config_str_expanded)
+        config_data = parse_yaml(config_str_expanded)
         
         return config_data if config_data is not None else {}
         
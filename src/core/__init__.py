@@ -6,7 +6,7 @@ management components that replace the dict soup in the original engine.
 """
 
 from .models import CallSession, PlaybackRef, ProviderSession, TransportConfig
-from .session_store import SessionStore
+from .session_store import SessionRef, SessionStore
 from .playback_manager import PlaybackManager
 from .conversation_coordinator import ConversationCoordinator
 
@@ -15,6 +15,7 @@ __all__ = [
     'PlaybackRef', 
     'ProviderSession',
     'TransportConfig',
+    'SessionRef',
     'SessionStore',
     'PlaybackManager',
     'ConversationCoordinator'
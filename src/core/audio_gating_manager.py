@@ -18,7 +18,10 @@ from typing import Dict, Optional, List, Tuple
 
 import structlog
 
+from src.logging_config import get_hot_logger, hot_path
+
 logger = structlog.get_logger(__name__)
+hot_log = get_hot_logger(__name__)
 
 
 @dataclass
@@ -107,6 +110,7 @@ class AudioGatingManager:
             passthrough_providers=[k for k, v in self._provider_configs.items() if not v.get('gating_enabled')]
         )
     
+    @hot_path
     async def should_forward_audio(
         self, 
         call_id: str, 
@@ -145,7 +149,7 @@ class AudioGatingManager:
         config = self._provider_configs.get(provider_name, {})
         if not config.get('gating_enabled', False):
             # Pass through for providers that don't need gating
-            logger.debug(
+            hot_log.debug(
                 "🔓 Audio pass-through (gating disabled)",
                 call_id=call_id,
                 provider=provider_name,
@@ -157,7 +161,7 @@ class AudioGatingManager:
         
         # Check if agent is currently speaking
         if state.agent_is_speaking:
-            logger.debug(
+            hot_log.debug(
                 "🚪 Audio gate CLOSED (agent speaking)",
                 call_id=call_id,
                 provider=provider_name,
@@ -169,7 +173,7 @@ class AudioGatingManager:
                     sample_rate = config.get('sample_rate', 8000)
                     vad_result = await self._vad.process_frame(call_id, audio_chunk, sample_rate)
                     
-                    logger.debug(
+                    hot_log.debug(
                         "🎤 VAD interrupt check",
                         call_id=call_id,
                         confidence=round(vad_result.confidence, 3),
@@ -198,7 +202,7 @@ class AudioGatingManager:
                         state.buffered_chunks.clear()
                         state.total_forwarded += len(buffered) + 1
                         
-                        logger.debug(
+                        hot_log.debug(
                             "📤 Flushing buffer on interrupt",
                             call_id=call_id,
                             buffer_size=len(buffered),
@@ -210,7 +214,7 @@ class AudioGatingManager:
                         state.buffered_chunks.append(audio_chunk)
                         state.total_buffered += 1
                         
-                        logger.debug(
+                        hot_log.debug(
                             "📦 Buffering audio (low VAD confidence - likely echo)",
                             call_id=call_id,
                             buffer_size=len(state.buffered_chunks),
@@ -233,7 +237,7 @@ class AudioGatingManager:
                 state.buffered_chunks.append(audio_chunk)
                 state.total_buffered += 1
                 
-                logger.debug(
+                hot_log.debug(
                     "📦 Buffering audio (no VAD available)",
                     call_id=call_id,
                     buffer_size=len(state.buffered_chunks),
@@ -243,14 +247,14 @@ class AudioGatingManager:
             else:
                 # Drop audio if configured not to buffer
                 state.total_dropped += 1
-                logger.debug(
+                hot_log.debug(
                     "🗑️ Dropping audio (no VAD, buffer disabled)",
                     call_id=call_id,
                 )
                 return False, None
         else:
             # Agent NOT speaking: forward all audio
-            logger.debug(
+            hot_log.debug(
                 "🔓 Audio gate OPEN (agent not speaking)",
                 call_id=call_id,
                 provider=provider_name,
@@ -5,6 +5,7 @@ Stores call records in SQLite for historical analysis and debugging.
 """
 
 import asyncio
+import base64
 import json
 import logging
 import os
@@ -14,7 +15,7 @@ import uuid
 from dataclasses import dataclass, field, asdict
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -61,6 +62,9 @@ class CallRecord:
     codec_alignment_ok: bool = True
     barge_in_count: int = 0
     
+    # Per-turn latency waterfall summary from core.tracing (debugging)
+    latency_trace: Dict[str, Any] = field(default_factory=dict)
+    
     # Metadata
     created_at: Optional[datetime] = field(default_factory=lambda: datetime.now(timezone.utc))
 
@@ -85,16 +89,182 @@ class CallRecord:
                     data[key] = None
         
         # Parse JSON strings for complex fields
-        for key in ['pipeline_components', 'conversation_history', 'tool_calls']:
+        for key in ['pipeline_components', 'conversation_history', 'tool_calls', 'latency_trace']:
             if data.get(key) and isinstance(data[key], str):
                 try:
                     data[key] = json.loads(data[key])
                 except json.JSONDecodeError:
                     data[key] = [] if key in ['conversation_history', 'tool_calls'] else {}
+        if not isinstance(data.get('latency_trace'), dict):
+            data['latency_trace'] = {}  # rows saved before the column existed
         
         return cls(**{k: v for k, v in data.items() if k in cls.__dataclass_fields__})
 
 
+@dataclass
+class TranscriptSearchHit:
+    """A call matching a transcript search, with its best-ranked matching turn."""
+    
+    record: CallRecord
+    score: float  # bm25 summed over the call's matching turns (lower is better)
+    snippet: str
+    turn_index: int
+    role: Optional[str]
+    kind: str  # turn | tool
+    match_count: int
+
+
+def encode_cursor(start_time: str, record_id: str) -> str:
+    """Encode a (start_time, id) keyset position as an opaque URL-safe cursor."""
+    raw = json.dumps([start_time, record_id], separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[str, str]:
+    """Decode a cursor produced by ``encode_cursor``. Raises ValueError if malformed."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        start_time, record_id = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except Exception as e:
+        raise ValueError(f"Invalid call history cursor: {cursor!r}") from e
+    return str(start_time), str(record_id)
+
+
+def _loads_list(value: Optional[str]) -> List[Any]:
+    """Parse a JSON list column, tolerating NULL/malformed values."""
+    try:
+        parsed = json.loads(value) if value else []
+    except (json.JSONDecodeError, TypeError):
+        return []
+    return parsed if isinstance(parsed, list) else []
+
+
+def _flatten_text(value: Any) -> str:
+    """Flatten strings, dicts and lists (e.g. tool arguments) into searchable text."""
+    if value is None:
+        return ""
+    if isinstance(value, str):
+        return value.strip()
+    if isinstance(value, dict):
+        return " ".join(
+            part for key, item in value.items() for part in (str(key), _flatten_text(item)) if part
+        )
+    if isinstance(value, (list, tuple)):
+        return " ".join(part for part in (_flatten_text(item) for item in value) if part)
+    return str(value)
+
+
+def to_fts_query(text: str) -> str:
+    """
+    Convert free text into a safe FTS5 MATCH expression.
+
+    Every whitespace-separated term is quoted (so FTS5 operators/punctuation in user input
+    cannot cause syntax errors) and terms are ANDed; a trailing ``*`` keeps prefix matching.
+    """
+    terms = []
+    for raw in (text or "").split():
+        prefix = raw.endswith("*")
+        term = raw.rstrip("*").replace('"', '""')
+        if term:
+            terms.append(f'"{term}"' + ("*" if prefix else ""))
+    return " ".join(terms)
+
+
+def _as_utc(value: datetime) -> datetime:
+    """Normalize a datetime to aware UTC (naive values are assumed to already be UTC)."""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def _floor_bucket(value: datetime, watermark: Optional[datetime]) -> datetime:
+    """Round down to the enclosing rollup bucket boundary (day before the watermark, else hour)."""
+    if watermark is not None and value < watermark:
+        return value.replace(hour=0, minute=0, second=0, microsecond=0)
+    return value.replace(minute=0, second=0, microsecond=0)
+
+
+def _ceil_bucket(value: datetime, watermark: Optional[datetime]) -> datetime:
+    """Round up to the next rollup bucket boundary (no-op when already aligned)."""
+    floor = _floor_bucket(value, watermark)
+    if floor == value:
+        return value
+    span = timedelta(days=1) if watermark is not None and value < watermark else timedelta(hours=1)
+    return floor + span
+
+
+def _ceil_day(value: datetime) -> datetime:
+    """Round up to the next UTC midnight (no-op when already aligned)."""
+    floor = value.replace(hour=0, minute=0, second=0, microsecond=0)
+    return value if floor == value else floor + timedelta(days=1)
+
+
+class _StatsAccumulator:
+    """Mergeable partial aggregate used to combine rollup buckets with raw edge rows."""
+
+    def __init__(self) -> None:
+        self.total_calls = 0
+        self.duration_count = 0
+        self.duration_sum = 0.0
+        self.duration_min: Optional[float] = None
+        self.duration_max: Optional[float] = None
+        self.latency_count = 0
+        self.latency_sum = 0.0
+        self.total_turns = 0
+        self.total_barge_ins = 0
+        self.calls_with_tools = 0
+        self.counts: Dict[str, Dict[Any, int]] = {
+            "outcomes": {}, "providers": {}, "pipelines": {}, "contexts": {},
+            "days": {}, "callers": {}, "tools": {},
+        }
+
+    def add_totals(
+        self, calls, duration_count, duration_sum, duration_min, duration_max,
+        latency_count, latency_sum, turns, barge_ins, calls_with_tools,
+    ) -> None:
+        self.total_calls += calls or 0
+        self.duration_count += duration_count or 0
+        self.duration_sum += duration_sum or 0.0
+        if duration_min is not None:
+            self.duration_min = duration_min if self.duration_min is None else min(self.duration_min, duration_min)
+        if duration_max is not None:
+            self.duration_max = duration_max if self.duration_max is None else max(self.duration_max, duration_max)
+        self.latency_count += latency_count or 0
+        self.latency_sum += latency_sum or 0.0
+        self.total_turns += turns or 0
+        self.total_barge_ins += barge_ins or 0
+        self.calls_with_tools += calls_with_tools or 0
+
+    def add_count(self, group: str, key: Any, count: int) -> None:
+        bucket = self.counts[group]
+        bucket[key] = bucket.get(key, 0) + count
+
+    def to_stats(self) -> Dict[str, Any]:
+        """Render in the same shape as ``CallHistoryStore._stats_from_records``."""
+        avg_duration = self.duration_sum / self.duration_count if self.duration_count else 0
+        avg_latency = self.latency_sum / self.latency_count if self.latency_count else 0
+        days = sorted(self.counts["days"].items(), key=lambda x: x[0] or "", reverse=True)[:30]
+        callers = sorted(self.counts["callers"].items(), key=lambda x: x[1], reverse=True)[:10]
+        return {
+            "total_calls": self.total_calls,
+            "avg_duration_seconds": round(avg_duration or 0, 2),
+            "max_duration_seconds": round(self.duration_max or 0, 2),
+            "min_duration_seconds": round(self.duration_min or 0, 2),
+            "total_duration_seconds": round(self.duration_sum or 0, 2),
+            "avg_latency_ms": round(avg_latency or 0, 2),
+            "total_turns": self.total_turns,
+            "total_barge_ins": self.total_barge_ins,
+            "outcomes": self.counts["outcomes"],
+            "providers": self.counts["providers"],
+            "pipelines": self.counts["pipelines"],
+            "contexts": self.counts["contexts"],
+            "calls_per_day": [{"date": day, "count": count} for day, count in days],
+            "top_callers": [{"number": number, "count": count} for number, count in callers],
+            "calls_with_tools": self.calls_with_tools,
+            "top_tools": dict(sorted(self.counts["tools"].items(), key=lambda x: x[1], reverse=True)[:10]),
+        }
+
+
 class CallHistoryStore:
     """SQLite-based call history storage."""
     
@@ -122,12 +292,14 @@ class CallHistoryStore:
         caller_audio_format TEXT,
         codec_alignment_ok INTEGER,
         barge_in_count INTEGER,
+        latency_trace TEXT,
         created_at TEXT DEFAULT CURRENT_TIMESTAMP
     )
     """
     
     _CREATE_INDEXES_SQL = [
         "CREATE INDEX IF NOT EXISTS idx_call_records_start_time ON call_records(start_time)",
+        "CREATE INDEX IF NOT EXISTS idx_call_records_start_time_id ON call_records(start_time, id)",
         "CREATE INDEX IF NOT EXISTS idx_call_records_caller_number ON call_records(caller_number)",
         "CREATE INDEX IF NOT EXISTS idx_call_records_outcome ON call_records(outcome)",
         "CREATE INDEX IF NOT EXISTS idx_call_records_provider ON call_records(provider_name)",
@@ -135,6 +307,139 @@ class CallHistoryStore:
         "CREATE INDEX IF NOT EXISTS idx_call_records_context ON call_records(context_name)",
     ]
 
+    # Pre-aggregated analytics rollups.
+    #
+    # Rollups mirror call_records exactly: every save() folds the record into its bucket, and
+    # deletes re-aggregate the affected buckets from the raw rows. Buckets are hourly; buckets
+    # older than the compaction watermark (call_rollup_meta.compacted_before) are merged into
+    # daily buckets to bound table size. Caller counts are always daily: they scale with distinct
+    # callers rather than call volume, so hourly buckets would not shrink them. Dimension columns
+    # use '' in place of NULL so they can participate in the primary key.
+    _ROLLUP_SCHEMA_VERSION = "1"
+
+    _CREATE_ROLLUP_TABLES_SQL = [
+        """
+        CREATE TABLE IF NOT EXISTS call_rollups (
+            bucket_start TEXT NOT NULL,
+            provider_name TEXT NOT NULL DEFAULT '',
+            pipeline_name TEXT NOT NULL DEFAULT '',
+            context_name TEXT NOT NULL DEFAULT '',
+            outcome TEXT NOT NULL DEFAULT '',
+            call_count INTEGER NOT NULL DEFAULT 0,
+            duration_count INTEGER NOT NULL DEFAULT 0,
+            duration_sum REAL NOT NULL DEFAULT 0,
+            duration_min REAL,
+            duration_max REAL,
+            latency_count INTEGER NOT NULL DEFAULT 0,
+            latency_sum REAL NOT NULL DEFAULT 0,
+            turns_sum INTEGER NOT NULL DEFAULT 0,
+            barge_in_sum INTEGER NOT NULL DEFAULT 0,
+            tool_call_count INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (bucket_start, provider_name, pipeline_name, context_name, outcome)
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS call_rollup_callers (
+            bucket_start TEXT NOT NULL,
+            caller_number TEXT NOT NULL,
+            call_count INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (bucket_start, caller_number)
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS call_rollup_tools (
+            bucket_start TEXT NOT NULL,
+            tool_name TEXT NOT NULL,
+            call_count INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (bucket_start, tool_name)
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS call_rollup_meta (
+            key TEXT PRIMARY KEY,
+            value TEXT
+        )
+        """,
+    ]
+
+    _ROLLUP_TABLES = ("call_rollups", "call_rollup_tools")
+
+    # Full-text transcript search.
+    #
+    # call_transcript_turns holds one row per conversation turn or tool call (name, arguments
+    # and result message flattened to text); call_transcripts_fts is an external-content FTS5
+    # index over it, kept in sync by triggers. save()/delete()/delete_before() maintain the
+    # turn rows.
+    _CREATE_SEARCH_TABLES_SQL = [
+        """
+        CREATE TABLE IF NOT EXISTS call_transcript_turns (
+            rowid INTEGER PRIMARY KEY,
+            record_id TEXT NOT NULL,
+            turn_index INTEGER NOT NULL,
+            role TEXT,
+            kind TEXT NOT NULL,
+            content TEXT NOT NULL
+        )
+        """,
+        "CREATE INDEX IF NOT EXISTS idx_call_transcript_turns_record ON call_transcript_turns(record_id)",
+        """
+        CREATE VIRTUAL TABLE IF NOT EXISTS call_transcripts_fts USING fts5(
+            content,
+            content='call_transcript_turns',
+            content_rowid='rowid',
+            tokenize='porter unicode61 remove_diacritics 2'
+        )
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS call_transcript_turns_ai AFTER INSERT ON call_transcript_turns BEGIN
+            INSERT INTO call_transcripts_fts(rowid, content) VALUES (new.rowid, new.content);
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS call_transcript_turns_ad AFTER DELETE ON call_transcript_turns BEGIN
+            INSERT INTO call_transcripts_fts(call_transcripts_fts, rowid, content)
+            VALUES ('delete', old.rowid, old.content);
+        END
+        """,
+    ]
+
+    _SEARCH_TABLES = ("call_transcripts_fts", "call_transcript_turns")
+
+    _INSERT_TRANSCRIPT_TURN_SQL = """
+        INSERT INTO call_transcript_turns (record_id, turn_index, role, kind, content) VALUES (?, ?, ?, ?, ?)
+    """
+
+    _UPSERT_ROLLUP_SQL = """
+        INSERT INTO call_rollups (
+            bucket_start, provider_name, pipeline_name, context_name, outcome,
+            call_count, duration_count, duration_sum, duration_min, duration_max,
+            latency_count, latency_sum, turns_sum, barge_in_sum, tool_call_count
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(bucket_start, provider_name, pipeline_name, context_name, outcome) DO UPDATE SET
+            call_count = call_count + excluded.call_count,
+            duration_count = duration_count + excluded.duration_count,
+            duration_sum = duration_sum + excluded.duration_sum,
+            duration_min = MIN(COALESCE(duration_min, excluded.duration_min),
+                               COALESCE(excluded.duration_min, duration_min)),
+            duration_max = MAX(COALESCE(duration_max, excluded.duration_max),
+                               COALESCE(excluded.duration_max, duration_max)),
+            latency_count = latency_count + excluded.latency_count,
+            latency_sum = latency_sum + excluded.latency_sum,
+            turns_sum = turns_sum + excluded.turns_sum,
+            barge_in_sum = barge_in_sum + excluded.barge_in_sum,
+            tool_call_count = tool_call_count + excluded.tool_call_count
+    """
+
+    _UPSERT_ROLLUP_CALLER_SQL = """
+        INSERT INTO call_rollup_callers (bucket_start, caller_number, call_count) VALUES (?, ?, ?)
+        ON CONFLICT(bucket_start, caller_number) DO UPDATE SET call_count = call_count + excluded.call_count
+    """
+
+    _UPSERT_ROLLUP_TOOL_SQL = """
+        INSERT INTO call_rollup_tools (bucket_start, tool_name, call_count) VALUES (?, ?, ?)
+        ON CONFLICT(bucket_start, tool_name) DO UPDATE SET call_count = call_count + excluded.call_count
+    """
+
     def __init__(self, db_path: Optional[str] = None):
         """
         Initialize call history store.
@@ -148,6 +453,9 @@ class CallHistoryStore:
         )
         self._retention_days = int(os.getenv("CALL_HISTORY_RETENTION_DAYS", "0"))
         self._enabled = os.getenv("CALL_HISTORY_ENABLED", "true").lower() in ("true", "1", "yes")
+        self._rollups_enabled = os.getenv("CALL_HISTORY_ROLLUPS_ENABLED", "true").lower() in ("true", "1", "yes")
+        self._rollup_hourly_days = int(os.getenv("CALL_HISTORY_ROLLUP_HOURLY_DAYS", "7"))
+        self._search_enabled = os.getenv("CALL_HISTORY_SEARCH_ENABLED", "true").lower() in ("true", "1", "yes")
         self._lock = threading.Lock()
         self._initialized = False
         
@@ -167,9 +475,14 @@ class CallHistoryStore:
                 try:
                     cursor = conn.cursor()
                     cursor.execute(self._CREATE_TABLE_SQL)
+                    self._migrate_columns(cursor)
                     for idx_sql in self._CREATE_INDEXES_SQL:
                         cursor.execute(idx_sql)
+                    for rollup_sql in self._CREATE_ROLLUP_TABLES_SQL:
+                        cursor.execute(rollup_sql)
                     conn.commit()
+                    self._init_rollups(conn)
+                    self._init_search_index(conn)
                     self._initialized = True
                     logger.info(f"Call history database initialized: {self._db_path}")
                 finally:
@@ -178,6 +491,13 @@ class CallHistoryStore:
             logger.error(f"Failed to initialize call history database: {e}", exc_info=True)
             self._enabled = False
     
+    @staticmethod
+    def _migrate_columns(cursor: sqlite3.Cursor) -> None:
+        """Add columns introduced after the table was first created."""
+        cols = {row[1] for row in cursor.execute("PRAGMA table_info(call_records)").fetchall()}
+        if "latency_trace" not in cols:
+            cursor.execute("ALTER TABLE call_records ADD COLUMN latency_trace TEXT")
+
     def _get_connection(self) -> sqlite3.Connection:
         """Get a database connection with WAL mode and busy timeout for multi-process safety."""
         conn = sqlite3.connect(self._db_path, timeout=30.0, check_same_thread=False)  # 30s busy timeout
@@ -188,6 +508,344 @@ class CallHistoryStore:
         conn.execute("PRAGMA busy_timeout=30000;")  # 30s in milliseconds
         conn.execute("PRAGMA foreign_keys=ON;")
         return conn
+
+    # ------------------------------------------------------------------
+    # Transcript search index
+    # ------------------------------------------------------------------
+
+    def _init_search_index(self, conn: sqlite3.Connection) -> None:
+        """Create the transcript search index, backfilling it from existing records on first use."""
+        cursor = conn.cursor()
+        if not self._search_enabled:
+            # Drop the index so it is rebuilt from scratch (not left stale) when re-enabled.
+            for table in self._SEARCH_TABLES:
+                cursor.execute(f"DROP TABLE IF EXISTS {table}")
+            conn.commit()
+            return
+
+        cursor.execute("BEGIN IMMEDIATE")
+        try:
+            cursor.execute(
+                "SELECT COUNT(*) FROM sqlite_master WHERE type = 'table' AND name = 'call_transcript_turns'"
+            )
+            needs_backfill = cursor.fetchone()[0] == 0
+            for sql in self._CREATE_SEARCH_TABLES_SQL:
+                cursor.execute(sql)
+            if needs_backfill:
+                indexed = 0
+                pending: List[tuple] = []
+                rows = conn.execute("SELECT id, conversation_history, tool_calls FROM call_records")
+                for record_id, history, tool_calls in rows:
+                    pending.extend(self._transcript_rows(record_id, _loads_list(history), _loads_list(tool_calls)))
+                    if len(pending) >= 5000:
+                        cursor.executemany(self._INSERT_TRANSCRIPT_TURN_SQL, pending)
+                        indexed += len(pending)
+                        pending.clear()
+                cursor.executemany(self._INSERT_TRANSCRIPT_TURN_SQL, pending)
+                indexed += len(pending)
+                logger.info(f"Call history transcript index backfilled ({indexed} turns)")
+            conn.commit()
+        except sqlite3.OperationalError as e:
+            # SQLite builds without FTS5: keep call history working, just without search.
+            conn.rollback()
+            self._search_enabled = False
+            logger.warning(f"Call history transcript search unavailable: {e}")
+        except Exception:
+            conn.rollback()
+            raise
+
+    @staticmethod
+    def _transcript_rows(
+        record_id: str,
+        conversation_history: List[Any],
+        tool_calls: List[Any],
+    ) -> List[tuple]:
+        """Flatten one record's transcript turns and tool calls into call_transcript_turns rows."""
+        rows = []
+        for index, turn in enumerate(conversation_history or []):
+            if not isinstance(turn, dict):
+                continue
+            content = _flatten_text(turn.get("content"))
+            if content:
+                rows.append((record_id, index, turn.get("role"), "turn", content))
+        for index, tool in enumerate(tool_calls or []):
+            if not isinstance(tool, dict):
+                continue
+            content = " ".join(
+                part for part in (
+                    _flatten_text(tool.get("name")),
+                    _flatten_text(tool.get("params")),
+                    _flatten_text(tool.get("message")),
+                ) if part
+            )
+            if content:
+                rows.append((record_id, index, "tool", "tool", content))
+        return rows
+
+    # ------------------------------------------------------------------
+    # Analytics rollups
+    # ------------------------------------------------------------------
+
+    def _init_rollups(self, conn: sqlite3.Connection) -> None:
+        """Backfill rollups on first use (or after they were disabled) and compact old buckets."""
+        cursor = conn.cursor()
+        if not self._rollups_enabled:
+            # Saves made while rollups are off are not folded in; force a rebuild when re-enabled.
+            cursor.execute("DELETE FROM call_rollup_meta WHERE key = 'schema_version'")
+            conn.commit()
+            return
+
+        cursor.execute("BEGIN IMMEDIATE")
+        try:
+            cursor.execute("SELECT value FROM call_rollup_meta WHERE key = 'schema_version'")
+            row = cursor.fetchone()
+            if not row or row[0] != self._ROLLUP_SCHEMA_VERSION:
+                self._rebuild_rollups(cursor)
+                cursor.execute(
+                    "INSERT OR REPLACE INTO call_rollup_meta (key, value) VALUES ('schema_version', ?)",
+                    (self._ROLLUP_SCHEMA_VERSION,),
+                )
+                cursor.execute("SELECT COALESCE(SUM(call_count), 0) FROM call_rollups")
+                logger.info(f"Call history rollups backfilled ({cursor.fetchone()[0]} calls)")
+            self._compact_rollups(cursor)
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+
+    @staticmethod
+    def _get_rollup_watermark(cursor: sqlite3.Cursor) -> str:
+        """Return the ISO day before which rollups are stored as daily buckets ('' if none)."""
+        cursor.execute("SELECT value FROM call_rollup_meta WHERE key = 'compacted_before'")
+        row = cursor.fetchone()
+        return (row[0] or "") if row else ""
+
+    @staticmethod
+    def _bucket_for(start_iso: str, watermark: str) -> str:
+        """Map a stored start_time string to its rollup bucket key (UTC ISO-8601)."""
+        if watermark and start_iso < watermark:
+            return start_iso[:10] + "T00:00:00+00:00"
+        return start_iso[:13] + ":00:00+00:00"
+
+    @staticmethod
+    def _bucket_end(bucket_start: str, watermark: str) -> str:
+        """Exclusive end of the bucket starting at ``bucket_start``."""
+        start = datetime.fromisoformat(bucket_start)
+        span = timedelta(days=1) if watermark and bucket_start < watermark else timedelta(hours=1)
+        return (start + span).isoformat()
+
+    def _bucket_sql(self) -> str:
+        """SQL expression equivalent to ``_bucket_for`` (takes the watermark as a parameter)."""
+        return (
+            "CASE WHEN start_time < ? THEN substr(start_time, 1, 10) || 'T00:00:00+00:00' "
+            "ELSE substr(start_time, 1, 13) || ':00:00+00:00' END"
+        )
+
+    def _apply_record_to_rollups(self, cursor: sqlite3.Cursor, record: CallRecord) -> None:
+        """Fold a freshly inserted record into its rollup bucket."""
+        start_iso = record.start_time.isoformat()
+        bucket = self._bucket_for(start_iso, self._get_rollup_watermark(cursor))
+        duration = record.duration_seconds
+        latency = record.avg_turn_latency_ms
+        cursor.execute(self._UPSERT_ROLLUP_SQL, (
+            bucket,
+            record.provider_name or "",
+            record.pipeline_name or "",
+            record.context_name or "",
+            record.outcome or "",
+            1,
+            1 if duration is not None else 0,
+            duration or 0.0,
+            duration,
+            duration,
+            1 if latency is not None else 0,
+            latency or 0.0,
+            record.total_turns or 0,
+            record.barge_in_count or 0,
+            1 if record.tool_calls else 0,
+        ))
+        if record.caller_number is not None:
+            caller_bucket = start_iso[:10] + "T00:00:00+00:00"
+            cursor.execute(self._UPSERT_ROLLUP_CALLER_SQL, (caller_bucket, record.caller_number, 1))
+        tool_counts: Dict[str, int] = {}
+        for tool in record.tool_calls or []:
+            if isinstance(tool, dict):
+                name = tool.get("name", "unknown")
+                tool_counts[name] = tool_counts.get(name, 0) + 1
+        for name, count in tool_counts.items():
+            cursor.execute(self._UPSERT_ROLLUP_TOOL_SQL, (bucket, name, count))
+
+    def _rebuild_rollups(
+        self,
+        cursor: sqlite3.Cursor,
+        range_start: Optional[str] = None,
+        range_end: Optional[str] = None,
+    ) -> None:
+        """
+        Re-aggregate rollups for bucket-aligned [range_start, range_end) from call_records.
+
+        Used for the initial backfill (no bounds) and to repair buckets after deletes.
+        """
+        watermark = self._get_rollup_watermark(cursor)
+        bucket_conditions = []
+        raw_conditions = []
+        params: List[Any] = []
+        if range_start:
+            bucket_conditions.append("bucket_start >= ?")
+            raw_conditions.append("start_time >= ?")
+            params.append(range_start)
+        if range_end:
+            bucket_conditions.append("bucket_start < ?")
+            raw_conditions.append("start_time < ?")
+            params.append(range_end)
+        bucket_where = " AND ".join(bucket_conditions) if bucket_conditions else "1=1"
+        raw_where = " AND ".join(raw_conditions) if raw_conditions else "1=1"
+
+        for table in self._ROLLUP_TABLES:
+            cursor.execute(f"DELETE FROM {table} WHERE {bucket_where}", params)
+
+        bucket_sql = self._bucket_sql()
+        cursor.execute(f"""
+            INSERT INTO call_rollups (
+                bucket_start, provider_name, pipeline_name, context_name, outcome,
+                call_count, duration_count, duration_sum, duration_min, duration_max,
+                latency_count, latency_sum, turns_sum, barge_in_sum, tool_call_count
+            )
+            SELECT
+                {bucket_sql},
+                COALESCE(provider_name, ''),
+                COALESCE(pipeline_name, ''),
+                COALESCE(context_name, ''),
+                COALESCE(outcome, ''),
+                COUNT(*),
+                COUNT(duration_seconds),
+                COALESCE(SUM(duration_seconds), 0),
+                MIN(duration_seconds),
+                MAX(duration_seconds),
+                COUNT(avg_turn_latency_ms),
+                COALESCE(SUM(avg_turn_latency_ms), 0),
+                COALESCE(SUM(total_turns), 0),
+                COALESCE(SUM(barge_in_count), 0),
+                SUM(CASE WHEN tool_calls != '[]' THEN 1 ELSE 0 END)
+            FROM call_records WHERE {raw_where}
+            GROUP BY 1, 2, 3, 4, 5
+        """, [watermark, *params])
+        # Caller buckets are daily, so widen the range to whole days.
+        caller_conditions = []
+        caller_raw_conditions = []
+        caller_params: List[Any] = []
+        if range_start:
+            caller_conditions.append("bucket_start >= ?")
+            caller_raw_conditions.append("start_time >= ?")
+            caller_params.append(range_start[:10] + "T00:00:00+00:00")
+        if range_end:
+            caller_conditions.append("bucket_start < ?")
+            caller_raw_conditions.append("start_time < ?")
+            caller_params.append(_ceil_day(datetime.fromisoformat(range_end)).isoformat())
+        caller_where = " AND ".join(caller_conditions) if caller_conditions else "1=1"
+        caller_raw_where = " AND ".join(caller_raw_conditions) if caller_raw_conditions else "1=1"
+        cursor.execute(f"DELETE FROM call_rollup_callers WHERE {caller_where}", caller_params)
+        cursor.execute(f"""
+            INSERT INTO call_rollup_callers (bucket_start, caller_number, call_count)
+            SELECT substr(start_time, 1, 10) || 'T00:00:00+00:00', caller_number, COUNT(*)
+            FROM call_records WHERE {caller_raw_where} AND caller_number IS NOT NULL
+            GROUP BY 1, 2
+        """, caller_params)
+
+        # Tool names live inside the tool_calls JSON; parse in Python (only rows with tools).
+        cursor.execute(
+            f"SELECT start_time, tool_calls FROM call_records WHERE {raw_where} AND tool_calls != '[]'",
+            params,
+        )
+        tool_counts: Dict[tuple, int] = {}
+        for start_iso, tool_calls in cursor.fetchall():
+            try:
+                tools = json.loads(tool_calls) if tool_calls else []
+            except (json.JSONDecodeError, TypeError):
+                continue
+            bucket = self._bucket_for(start_iso, watermark)
+            for tool in tools:
+                if isinstance(tool, dict):
+                    key = (bucket, tool.get("name", "unknown"))
+                    tool_counts[key] = tool_counts.get(key, 0) + 1
+        cursor.executemany(
+            self._UPSERT_ROLLUP_TOOL_SQL,
+            [(bucket, name, count) for (bucket, name), count in tool_counts.items()],
+        )
+
+    def _compact_rollups(self, cursor: sqlite3.Cursor) -> int:
+        """
+        Merge hourly buckets older than the hourly horizon into daily buckets.
+
+        Returns:
+            Number of hourly rollup rows folded into daily rows
+        """
+        if self._rollup_hourly_days <= 0:
+            return 0
+        horizon = datetime.now(timezone.utc) - timedelta(days=self._rollup_hourly_days)
+        new_watermark = horizon.replace(hour=0, minute=0, second=0, microsecond=0).isoformat()
+        old_watermark = self._get_rollup_watermark(cursor)
+        if old_watermark and new_watermark <= old_watermark:
+            return 0
+
+        conditions = ["bucket_start < ?"]
+        params: List[Any] = [new_watermark]
+        if old_watermark:
+            conditions.append("bucket_start >= ?")
+            params.append(old_watermark)
+        where = " AND ".join(conditions)
+        day_sql = "substr(bucket_start, 1, 10) || 'T00:00:00+00:00'"
+
+        cursor.execute(f"SELECT COUNT(*) FROM call_rollups WHERE {where}", params)
+        compacted = cursor.fetchone()[0]
+        cursor.execute(f"""
+            SELECT {day_sql}, provider_name, pipeline_name, context_name, outcome,
+                   SUM(call_count), SUM(duration_count), SUM(duration_sum),
+                   MIN(duration_min), MAX(duration_max),
+                   SUM(latency_count), SUM(latency_sum), SUM(turns_sum),
+                   SUM(barge_in_sum), SUM(tool_call_count)
+            FROM call_rollups WHERE {where}
+            GROUP BY 1, 2, 3, 4, 5
+        """, params)
+        rollup_rows = cursor.fetchall()
+        cursor.execute(f"""
+            SELECT {day_sql}, tool_name, SUM(call_count)
+            FROM call_rollup_tools WHERE {where} GROUP BY 1, 2
+        """, params)
+        tool_rows = cursor.fetchall()
+
+        for table in self._ROLLUP_TABLES:
+            cursor.execute(f"DELETE FROM {table} WHERE {where}", params)
+        cursor.executemany(self._UPSERT_ROLLUP_SQL, [tuple(r) for r in rollup_rows])
+        cursor.executemany(self._UPSERT_ROLLUP_TOOL_SQL, [tuple(r) for r in tool_rows])
+        cursor.execute(
+            "INSERT OR REPLACE INTO call_rollup_meta (key, value) VALUES ('compacted_before', ?)",
+            (new_watermark,),
+        )
+        return compacted
+
+    async def compact_rollups(self) -> int:
+        """
+        Compact hourly analytics rollups older than CALL_HISTORY_ROLLUP_HOURLY_DAYS into daily rollups.
+
+        Returns:
+            Number of hourly rollup rows compacted
+        """
+        if not self._enabled or not self._rollups_enabled:
+            return 0
+
+        def _compact_sync():
+            with self._lock:
+                conn = self._get_connection()
+                try:
+                    compacted = self._compact_rollups(conn.cursor())
+                    conn.commit()
+                    return compacted
+                finally:
+                    conn.close()
+
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, _compact_sync)
     
     async def save(self, record: CallRecord) -> bool:
         """
@@ -221,8 +879,8 @@ class CallHistoryStore:
                             provider_name, pipeline_name, pipeline_components, context_name,
                             conversation_history, outcome, transfer_destination, error_message,
                             tool_calls, avg_turn_latency_ms, max_turn_latency_ms, total_turns,
-                            caller_audio_format, codec_alignment_ok, barge_in_count, created_at
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                            caller_audio_format, codec_alignment_ok, barge_in_count, latency_trace, created_at
+                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                     """, (
                         record.id,
                         record.call_id,
@@ -246,8 +904,16 @@ class CallHistoryStore:
                         record.caller_audio_format,
                         1 if record.codec_alignment_ok else 0,
                         record.barge_in_count,
+                        json.dumps(record.latency_trace or {}),
                         record.created_at.isoformat() if record.created_at else None,
                     ))
+                    if self._rollups_enabled:
+                        self._apply_record_to_rollups(cursor, record)
+                    if self._search_enabled:
+                        cursor.executemany(
+                            self._INSERT_TRANSCRIPT_TURN_SQL,
+                            self._transcript_rows(record.id, record.conversation_history, record.tool_calls),
+                        )
                     conn.commit()
                     return True
                 except Exception as e:
@@ -317,6 +983,86 @@ class CallHistoryStore:
         loop = asyncio.get_event_loop()
         return await loop.run_in_executor(None, _get_sync)
     
+    _SUMMARY_COLUMNS = (
+        "id",
+        "call_id",
+        "caller_number",
+        "caller_name",
+        "start_time",
+        "end_time",
+        "duration_seconds",
+        "provider_name",
+        "pipeline_name",
+        "pipeline_components",
+        "context_name",
+        "outcome",
+        "transfer_destination",
+        "error_message",
+        "avg_turn_latency_ms",
+        "max_turn_latency_ms",
+        "total_turns",
+        "caller_audio_format",
+        "codec_alignment_ok",
+        "barge_in_count",
+        "created_at",
+    )
+
+    @staticmethod
+    def _build_filter_clause(
+        *,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        caller_number: Optional[str] = None,
+        caller_name: Optional[str] = None,
+        provider_name: Optional[str] = None,
+        pipeline_name: Optional[str] = None,
+        context_name: Optional[str] = None,
+        outcome: Optional[str] = None,
+        has_tool_calls: Optional[bool] = None,
+        min_duration: Optional[float] = None,
+        max_duration: Optional[float] = None,
+    ) -> Tuple[List[str], List[Any]]:
+        """Build WHERE conditions/params shared by list, count, list_page and iter_records."""
+        conditions = []
+        params: List[Any] = []
+        
+        if start_date:
+            conditions.append("start_time >= ?")
+            params.append(start_date.isoformat())
+        if end_date:
+            conditions.append("start_time <= ?")
+            params.append(end_date.isoformat())
+        if caller_number:
+            conditions.append("caller_number LIKE ?")
+            params.append(f"%{caller_number}%")
+        if caller_name:
+            conditions.append("caller_name LIKE ?")
+            params.append(f"%{caller_name}%")
+        if provider_name:
+            conditions.append("provider_name = ?")
+            params.append(provider_name)
+        if pipeline_name:
+            conditions.append("pipeline_name = ?")
+            params.append(pipeline_name)
+        if context_name:
+            conditions.append("context_name = ?")
+            params.append(context_name)
+        if outcome:
+            conditions.append("outcome = ?")
+            params.append(outcome)
+        if has_tool_calls is not None:
+            if has_tool_calls:
+                conditions.append("tool_calls IS NOT NULL AND tool_calls != '[]'")
+            else:
+                conditions.append("(tool_calls IS NULL OR tool_calls = '[]')")
+        if min_duration is not None:
+            conditions.append("duration_seconds >= ?")
+            params.append(min_duration)
+        if max_duration is not None:
+            conditions.append("duration_seconds <= ?")
+            params.append(max_duration)
+        return conditions, params
+
     async def list(
         self,
         limit: int = 50,
@@ -339,6 +1085,9 @@ class CallHistoryStore:
         """
         List call records with filtering and pagination.
         
+        OFFSET pagination gets slower the deeper the page; prefer ``list_page`` /
+        ``iter_records`` for deep pagination and exports.
+        
         Args:
             limit: Maximum records to return
             offset: Records to skip
@@ -368,44 +1117,19 @@ class CallHistoryStore:
                 conn = self._get_connection()
                 try:
                     # Build query with filters
-                    conditions = []
-                    params = []
-                    
-                    if start_date:
-                        conditions.append("start_time >= ?")
-                        params.append(start_date.isoformat())
-                    if end_date:
-                        conditions.append("start_time <= ?")
-                        params.append(end_date.isoformat())
-                    if caller_number:
-                        conditions.append("caller_number LIKE ?")
-                        params.append(f"%{caller_number}%")
-                    if caller_name:
-                        conditions.append("caller_name LIKE ?")
-                        params.append(f"%{caller_name}%")
-                    if provider_name:
-                        conditions.append("provider_name = ?")
-                        params.append(provider_name)
-                    if pipeline_name:
-                        conditions.append("pipeline_name = ?")
-                        params.append(pipeline_name)
-                    if context_name:
-                        conditions.append("context_name = ?")
-                        params.append(context_name)
-                    if outcome:
-                        conditions.append("outcome = ?")
-                        params.append(outcome)
-                    if has_tool_calls is not None:
-                        if has_tool_calls:
-                            conditions.append("tool_calls IS NOT NULL AND tool_calls != '[]'")
-                        else:
-                            conditions.append("(tool_calls IS NULL OR tool_calls = '[]')")
-                    if min_duration is not None:
-                        conditions.append("duration_seconds >= ?")
-                        params.append(min_duration)
-                    if max_duration is not None:
-                        conditions.append("duration_seconds <= ?")
-                        params.append(max_duration)
+                    conditions, params = self._build_filter_clause(
+                        start_date=start_date,
+                        end_date=end_date,
+                        caller_number=caller_number,
+                        caller_name=caller_name,
+                        provider_name=provider_name,
+                        pipeline_name=pipeline_name,
+                        context_name=context_name,
+                        outcome=outcome,
+                        has_tool_calls=has_tool_calls,
+                        min_duration=min_duration,
+                        max_duration=max_duration,
+                    )
                     
                     # Validate order_by to prevent SQL injection
                     valid_columns = [
@@ -418,32 +1142,8 @@ class CallHistoryStore:
                     
                     where_clause = " AND ".join(conditions) if conditions else "1=1"
 
-                    select_cols = "*"
-                    if not include_details:
-                        # Exclude transcript/tool payloads to keep list views fast and reduce exposure.
-                        select_cols = ", ".join([
-                            "id",
-                            "call_id",
-                            "caller_number",
-                            "caller_name",
-                            "start_time",
-                            "end_time",
-                            "duration_seconds",
-                            "provider_name",
-                            "pipeline_name",
-                            "pipeline_components",
-                            "context_name",
-                            "outcome",
-                            "transfer_destination",
-                            "error_message",
-                            "avg_turn_latency_ms",
-                            "max_turn_latency_ms",
-                            "total_turns",
-                            "caller_audio_format",
-                            "codec_alignment_ok",
-                            "barge_in_count",
-                            "created_at",
-                        ])
+                    # Exclude transcript/tool payloads to keep list views fast and reduce exposure.
+                    select_cols = "*" if include_details else ", ".join(self._SUMMARY_COLUMNS)
 
                     query = f"""
                         SELECT {select_cols} FROM call_records 
@@ -463,6 +1163,201 @@ class CallHistoryStore:
         loop = asyncio.get_event_loop()
         return await loop.run_in_executor(None, _list_sync)
     
+    async def list_page(
+        self,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        order_dir: str = "DESC",
+        include_details: bool = True,
+        **filters: Any,
+    ) -> Tuple[List[CallRecord], Optional[str]]:
+        """
+        Keyset-paginated listing ordered by (start_time, id).
+        
+        Unlike ``list(offset=...)`` the cost of a page does not grow with its depth: each page
+        seeks directly past the last (start_time, id) of the previous page using the composite
+        index.
+        
+        Args:
+            limit: Maximum records to return
+            cursor: Opaque cursor returned by the previous call (None for the first page)
+            order_dir: ASC or DESC
+            include_details: If False, excludes large payload fields (transcript/tool JSON)
+            **filters: Same filters as ``count`` (start_date, caller_number, outcome, ...)
+            
+        Returns:
+            Tuple of (records, next_cursor); next_cursor is None on the last page
+        """
+        if not self._enabled:
+            return [], None
+        
+        conditions, params = self._build_filter_clause(**filters)
+        safe_order_dir = order_dir.upper() if order_dir.upper() in ['ASC', 'DESC'] else 'DESC'
+        if cursor:
+            last_start, last_id = decode_cursor(cursor)
+            comparator = "<" if safe_order_dir == "DESC" else ">"
+            conditions.append(f"(start_time, id) {comparator} (?, ?)")
+            params.extend([last_start, last_id])
+        where_clause = " AND ".join(conditions) if conditions else "1=1"
+        select_cols = "*" if include_details else ", ".join(self._SUMMARY_COLUMNS)
+        query = f"""
+            SELECT {select_cols} FROM call_records
+            WHERE {where_clause}
+            ORDER BY start_time {safe_order_dir}, id {safe_order_dir}
+            LIMIT ?
+        """
+        params.append(limit)
+        
+        def _page_sync():
+            with self._lock:
+                conn = self._get_connection()
+                try:
+                    db_cursor = conn.cursor()
+                    db_cursor.execute(query, params)
+                    rows = db_cursor.fetchall()
+                    records = [CallRecord.from_dict(dict(row)) for row in rows]
+                    next_cursor = None
+                    if len(rows) == limit:
+                        next_cursor = encode_cursor(rows[-1]["start_time"], rows[-1]["id"])
+                    return records, next_cursor
+                finally:
+                    conn.close()
+        
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, _page_sync)
+    
+    async def iter_records(
+        self,
+        batch_size: int = 500,
+        order_dir: str = "DESC",
+        include_details: bool = True,
+        **filters: Any,
+    ) -> AsyncIterator[CallRecord]:
+        """
+        Stream every matching record without materializing the full result set.
+        
+        Fetches ``batch_size`` rows at a time via ``list_page``, so memory stays constant
+        regardless of history size.
+        """
+        cursor: Optional[str] = None
+        while True:
+            records, cursor = await self.list_page(
+                limit=batch_size,
+                cursor=cursor,
+                order_dir=order_dir,
+                include_details=include_details,
+                **filters,
+            )
+            for record in records:
+                yield record
+            if cursor is None:
+                return
+    
+    async def search_transcripts(
+        self,
+        query: str,
+        limit: int = 20,
+        offset: int = 0,
+        **filters: Any,
+    ) -> Tuple[List[TranscriptSearchHit], int]:
+        """
+        Full-text search over transcripts and tool calls, ranked by bm25.
+        
+        Returns one hit per call, ranked by the bm25 scores of all its matching turns combined,
+        with a highlighted snippet of its best-matching turn. Can be combined with the same
+        filters as ``count`` (start_date, provider_name, outcome, ...).
+        
+        Args:
+            query: Free-text query; all terms must occur in the same turn, ``term*`` matches by prefix
+            limit: Maximum calls to return
+            offset: Calls to skip
+            **filters: Call-level filters applied to the matching records
+            
+        Returns:
+            Tuple of (hits, total matching calls)
+        """
+        if not self._enabled or not self._search_enabled:
+            return [], 0
+        match = to_fts_query(query)
+        if not match:
+            return [], 0
+        
+        conditions, params = self._build_filter_clause(**filters)
+        where_clause = " AND ".join(conditions) if conditions else "1=1"
+        # Rank per call first (cheap: bm25 + rowids only); snippets are generated afterwards
+        # for the returned page only, since snippet() dominates cost on common terms.
+        per_call_cte = """
+            WITH matches AS MATERIALIZED (
+                SELECT t.record_id, t.rowid AS turn_rowid, bm25(call_transcripts_fts) AS score
+                FROM call_transcripts_fts
+                JOIN call_transcript_turns t ON t.rowid = call_transcripts_fts.rowid
+                WHERE call_transcripts_fts MATCH ?
+            ),
+            per_call AS (
+                -- Bare turn_rowid alongside MIN() resolves to the best-scoring turn.
+                SELECT record_id, MIN(score) AS best_score, turn_rowid,
+                       SUM(score) AS total_score, COUNT(*) AS match_count
+                FROM matches GROUP BY record_id
+            )
+        """
+        summary_cols = ", ".join(f"r.{col}" for col in self._SUMMARY_COLUMNS)
+        search_sql = f"""
+            {per_call_cte}
+            SELECT {summary_cols}, p.total_score AS match_score, p.turn_rowid AS match_turn_rowid,
+                   p.match_count AS match_count
+            FROM per_call p JOIN call_records r ON r.id = p.record_id
+            WHERE {where_clause}
+            ORDER BY p.total_score, r.start_time DESC
+            LIMIT ? OFFSET ?
+        """
+        count_sql = f"""
+            SELECT COUNT(*) FROM call_records r
+            WHERE r.id IN (
+                SELECT t.record_id FROM call_transcripts_fts
+                JOIN call_transcript_turns t ON t.rowid = call_transcripts_fts.rowid
+                WHERE call_transcripts_fts MATCH ?
+            ) AND {where_clause}
+        """
+        
+        def _search_sync():
+            with self._lock:
+                conn = self._get_connection()
+                try:
+                    cursor = conn.cursor()
+                    cursor.execute(search_sql, [match, *params, limit, offset])
+                    rows = [dict(row) for row in cursor.fetchall()]
+                    turns: Dict[int, sqlite3.Row] = {}
+                    if rows:
+                        rowids = [row["match_turn_rowid"] for row in rows]
+                        placeholders = ", ".join("?" for _ in rowids)
+                        cursor.execute(f"""
+                            SELECT t.rowid, t.turn_index, t.role, t.kind,
+                                   snippet(call_transcripts_fts, 0, '<mark>', '</mark>', '…', 16) AS snippet
+                            FROM call_transcripts_fts
+                            JOIN call_transcript_turns t ON t.rowid = call_transcripts_fts.rowid
+                            WHERE call_transcripts_fts MATCH ? AND call_transcripts_fts.rowid IN ({placeholders})
+                        """, [match, *rowids])
+                        turns = {turn["rowid"]: turn for turn in cursor.fetchall()}
+                    hits = []
+                    for data in rows:
+                        turn = turns.get(data["match_turn_rowid"])
+                        hits.append(TranscriptSearchHit(
+                            record=CallRecord.from_dict({k: data[k] for k in self._SUMMARY_COLUMNS}),
+                            score=data["match_score"],
+                            snippet=turn["snippet"] if turn else "",
+                            turn_index=turn["turn_index"] if turn else 0,
+                            role=turn["role"] if turn else None,
+                            kind=turn["kind"] if turn else "turn",
+                            match_count=data["match_count"],
+                        ))
+                    cursor.execute(count_sql, [match, *params])
+                    return hits, cursor.fetchone()[0]
+                finally:
+                    conn.close()
+        
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, _search_sync)
+    
     async def count(
         self,
         start_date: Optional[datetime] = None,
@@ -485,44 +1380,19 @@ class CallHistoryStore:
             with self._lock:
                 conn = self._get_connection()
                 try:
-                    conditions = []
-                    params = []
-                    
-                    if start_date:
-                        conditions.append("start_time >= ?")
-                        params.append(start_date.isoformat())
-                    if end_date:
-                        conditions.append("start_time <= ?")
-                        params.append(end_date.isoformat())
-                    if caller_number:
-                        conditions.append("caller_number LIKE ?")
-                        params.append(f"%{caller_number}%")
-                    if caller_name:
-                        conditions.append("caller_name LIKE ?")
-                        params.append(f"%{caller_name}%")
-                    if provider_name:
-                        conditions.append("provider_name = ?")
-                        params.append(provider_name)
-                    if pipeline_name:
-                        conditions.append("pipeline_name = ?")
-                        params.append(pipeline_name)
-                    if context_name:
-                        conditions.append("context_name = ?")
-                        params.append(context_name)
-                    if outcome:
-                        conditions.append("outcome = ?")
-                        params.append(outcome)
-                    if has_tool_calls is not None:
-                        if has_tool_calls:
-                            conditions.append("tool_calls IS NOT NULL AND tool_calls != '[]'")
-                        else:
-                            conditions.append("(tool_calls IS NULL OR tool_calls = '[]')")
-                    if min_duration is not None:
-                        conditions.append("duration_seconds >= ?")
-                        params.append(min_duration)
-                    if max_duration is not None:
-                        conditions.append("duration_seconds <= ?")
-                        params.append(max_duration)
+                    conditions, params = self._build_filter_clause(
+                        start_date=start_date,
+                        end_date=end_date,
+                        caller_number=caller_number,
+                        caller_name=caller_name,
+                        provider_name=provider_name,
+                        pipeline_name=pipeline_name,
+                        context_name=context_name,
+                        outcome=outcome,
+                        has_tool_calls=has_tool_calls,
+                        min_duration=min_duration,
+                        max_duration=max_duration,
+                    )
                     
                     where_clause = " AND ".join(conditions) if conditions else "1=1"
                     query = f"SELECT COUNT(*) FROM call_records WHERE {where_clause}"
@@ -546,9 +1416,18 @@ class CallHistoryStore:
                 conn = self._get_connection()
                 try:
                     cursor = conn.cursor()
+                    cursor.execute("SELECT start_time FROM call_records WHERE id = ?", (record_id,))
+                    row = cursor.fetchone()
+                    if self._search_enabled:
+                        cursor.execute("DELETE FROM call_transcript_turns WHERE record_id = ?", (record_id,))
                     cursor.execute("DELETE FROM call_records WHERE id = ?", (record_id,))
+                    deleted = cursor.rowcount > 0
+                    if deleted and self._rollups_enabled and row and row[0]:
+                        watermark = self._get_rollup_watermark(cursor)
+                        bucket = self._bucket_for(row[0], watermark)
+                        self._rebuild_rollups(cursor, bucket, self._bucket_end(bucket, watermark))
                     conn.commit()
-                    return cursor.rowcount > 0
+                    return deleted
                 finally:
                     conn.close()
         
@@ -565,12 +1444,23 @@ class CallHistoryStore:
                 conn = self._get_connection()
                 try:
                     cursor = conn.cursor()
-                    cursor.execute(
-                        "DELETE FROM call_records WHERE start_time < ?",
-                        (before_date.isoformat(),)
-                    )
+                    cutoff = before_date.isoformat()
+                    if self._search_enabled:
+                        cursor.execute("""
+                            DELETE FROM call_transcript_turns WHERE record_id IN (
+                                SELECT id FROM call_records WHERE start_time < ?
+                            )
+                        """, (cutoff,))
+                    cursor.execute("DELETE FROM call_records WHERE start_time < ?", (cutoff,))
+                    deleted = cursor.rowcount
+                    if self._rollups_enabled:
+                        # Everything before the cutoff's bucket is gone; re-aggregate what is
+                        # left of the bucket that straddles the cutoff.
+                        watermark = self._get_rollup_watermark(cursor)
+                        bucket = self._bucket_for(cutoff, watermark)
+                        self._rebuild_rollups(cursor, None, self._bucket_end(bucket, watermark))
                     conn.commit()
-                    return cursor.rowcount
+                    return deleted
                 finally:
                     conn.close()
         
@@ -581,161 +1471,381 @@ class CallHistoryStore:
         self,
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
+        use_rollups: Optional[bool] = None,
     ) -> Dict[str, Any]:
         """
         Get aggregate statistics for the dashboard.
         
+        Args:
+            start_date: Filter by start date (inclusive)
+            end_date: Filter by end date (inclusive)
+            use_rollups: Answer from pre-aggregated rollups (default: CALL_HISTORY_ROLLUPS_ENABLED).
+                Pass False to force aggregation over raw call_records.
+        
         Returns:
             Dictionary with stats: total_calls, avg_duration, outcomes, providers, etc.
         """
         if not self._enabled:
             return {}
         
+        if use_rollups is None:
+            use_rollups = self._rollups_enabled
+        use_rollups = use_rollups and self._rollups_enabled
+        
         def _stats_sync():
             with self._lock:
                 conn = self._get_connection()
                 try:
                     cursor = conn.cursor()
-                    
-                    # Build date filter
-                    date_filter = "1=1"
-                    params = []
-                    if start_date:
-                        date_filter += " AND start_time >= ?"
-                        params.append(start_date.isoformat())
-                    if end_date:
-                        date_filter += " AND start_time <= ?"
-                        params.append(end_date.isoformat())
-                    
-                    # Total calls and duration stats
-                    cursor.execute(f"""
-                        SELECT 
-                            COUNT(*) as total_calls,
-                            AVG(duration_seconds) as avg_duration,
-                            MAX(duration_seconds) as max_duration,
-                            MIN(duration_seconds) as min_duration,
-                            SUM(duration_seconds) as total_duration,
-                            AVG(avg_turn_latency_ms) as avg_latency,
-                            SUM(total_turns) as total_turns,
-                            SUM(barge_in_count) as total_barge_ins
-                        FROM call_records WHERE {date_filter}
-                    """, params)
-                    row = cursor.fetchone()
-                    stats = {
-                        "total_calls": row[0] or 0,
-                        "avg_duration_seconds": round(row[1] or 0, 2),
-                        "max_duration_seconds": round(row[2] or 0, 2),
-                        "min_duration_seconds": round(row[3] or 0, 2),
-                        "total_duration_seconds": round(row[4] or 0, 2),
-                        "avg_latency_ms": round(row[5] or 0, 2),
-                        "total_turns": row[6] or 0,
-                        "total_barge_ins": row[7] or 0,
-                    }
-                    
-                    # Outcome breakdown
-                    cursor.execute(f"""
-                        SELECT outcome, COUNT(*) as count
-                        FROM call_records WHERE {date_filter}
-                        GROUP BY outcome
-                    """, params)
-                    stats["outcomes"] = {row[0]: row[1] for row in cursor.fetchall()}
-                    
-                    # Provider usage
-                    cursor.execute(f"""
-                        SELECT provider_name, COUNT(*) as count
-                        FROM call_records WHERE {date_filter}
-                        GROUP BY provider_name
-                    """, params)
-                    stats["providers"] = {row[0]: row[1] for row in cursor.fetchall()}
-                    
-                    # Pipeline usage
-                    cursor.execute(f"""
-                        SELECT pipeline_name, COUNT(*) as count
-                        FROM call_records WHERE {date_filter} AND pipeline_name IS NOT NULL
-                        GROUP BY pipeline_name
-                    """, params)
-                    stats["pipelines"] = {row[0]: row[1] for row in cursor.fetchall()}
-                    
-                    # Context usage
-                    cursor.execute(f"""
-                        SELECT context_name, COUNT(*) as count
-                        FROM call_records WHERE {date_filter} AND context_name IS NOT NULL
-                        GROUP BY context_name
-                    """, params)
-                    stats["contexts"] = {row[0]: row[1] for row in cursor.fetchall()}
-                    
-                    # Calls per day (last 30 days)
-                    cursor.execute(f"""
-                        SELECT DATE(start_time) as day, COUNT(*) as count
-                        FROM call_records 
-                        WHERE {date_filter}
-                        GROUP BY DATE(start_time)
-                        ORDER BY day DESC
-                        LIMIT 30
-                    """, params)
-                    stats["calls_per_day"] = [
-                        {"date": row[0], "count": row[1]} 
-                        for row in cursor.fetchall()
-                    ]
-                    
-                    # Top callers
-                    cursor.execute(f"""
-                        SELECT caller_number, COUNT(*) as count
-                        FROM call_records 
-                        WHERE {date_filter} AND caller_number IS NOT NULL
-                        GROUP BY caller_number
-                        ORDER BY count DESC
-                        LIMIT 10
-                    """, params)
-                    stats["top_callers"] = [
-                        {"number": row[0], "count": row[1]} 
-                        for row in cursor.fetchall()
-                    ]
-                    
-                    # Tool usage stats
-                    cursor.execute(f"""
-                        SELECT COUNT(*) FROM call_records 
-                        WHERE {date_filter} AND tool_calls != '[]'
-                    """, params)
-                    stats["calls_with_tools"] = cursor.fetchone()[0]
-                    
-                    # Top tools aggregation (parse JSON tool_calls field)
-                    cursor.execute(f"""
-                        SELECT tool_calls FROM call_records 
-                        WHERE {date_filter} AND tool_calls != '[]'
-                    """, params)
-                    tool_counts: Dict[str, int] = {}
-                    for row in cursor.fetchall():
-                        try:
-                            tools = json.loads(row[0]) if row[0] else []
-                            for tool in tools:
-                                name = tool.get("name", "unknown")
-                                tool_counts[name] = tool_counts.get(name, 0) + 1
-                        except (json.JSONDecodeError, TypeError):
-                            pass
-                    stats["top_tools"] = dict(sorted(tool_counts.items(), key=lambda x: x[1], reverse=True)[:10])
-                    
-                    return stats
+                    if use_rollups:
+                        return self._stats_from_rollups(cursor, start_date, end_date)
+                    return self._stats_from_records(cursor, start_date, end_date)
                 finally:
                     conn.close()
         
         loop = asyncio.get_event_loop()
         return await loop.run_in_executor(None, _stats_sync)
     
+    def _stats_from_records(
+        self,
+        cursor: sqlite3.Cursor,
+        start_date: Optional[datetime],
+        end_date: Optional[datetime],
+    ) -> Dict[str, Any]:
+        """Aggregate dashboard stats directly from call_records (full-range scans)."""
+        # Build date filter
+        date_filter = "1=1"
+        params = []
+        if start_date:
+            date_filter += " AND start_time >= ?"
+            params.append(start_date.isoformat())
+        if end_date:
+            date_filter += " AND start_time <= ?"
+            params.append(end_date.isoformat())
+        
+        # Total calls and duration stats
+        cursor.execute(f"""
+            SELECT 
+                COUNT(*) as total_calls,
+                AVG(duration_seconds) as avg_duration,
+                MAX(duration_seconds) as max_duration,
+                MIN(duration_seconds) as min_duration,
+                SUM(duration_seconds) as total_duration,
+                AVG(avg_turn_latency_ms) as avg_latency,
+                SUM(total_turns) as total_turns,
+                SUM(barge_in_count) as total_barge_ins
+            FROM call_records WHERE {date_filter}
+        """, params)
+        row = cursor.fetchone()
+        stats = {
+            "total_calls": row[0] or 0,
+            "avg_duration_seconds": round(row[1] or 0, 2),
+            "max_duration_seconds": round(row[2] or 0, 2),
+            "min_duration_seconds": round(row[3] or 0, 2),
+            "total_duration_seconds": round(row[4] or 0, 2),
+            "avg_latency_ms": round(row[5] or 0, 2),
+            "total_turns": row[6] or 0,
+            "total_barge_ins": row[7] or 0,
+        }
+        
+        # Outcome breakdown
+        cursor.execute(f"""
+            SELECT outcome, COUNT(*) as count
+            FROM call_records WHERE {date_filter}
+            GROUP BY outcome
+        """, params)
+        stats["outcomes"] = {row[0]: row[1] for row in cursor.fetchall()}
+        
+        # Provider usage
+        cursor.execute(f"""
+            SELECT provider_name, COUNT(*) as count
+            FROM call_records WHERE {date_filter}
+            GROUP BY provider_name
+        """, params)
+        stats["providers"] = {row[0]: row[1] for row in cursor.fetchall()}
+        
+        # Pipeline usage
+        cursor.execute(f"""
+            SELECT pipeline_name, COUNT(*) as count
+            FROM call_records WHERE {date_filter} AND pipeline_name IS NOT NULL
+            GROUP BY pipeline_name
+        """, params)
+        stats["pipelines"] = {row[0]: row[1] for row in cursor.fetchall()}
+        
+        # Context usage
+        cursor.execute(f"""
+            SELECT context_name, COUNT(*) as count
+            FROM call_records WHERE {date_filter} AND context_name IS NOT NULL
+            GROUP BY context_name
+        """, params)
+        stats["contexts"] = {row[0]: row[1] for row in cursor.fetchall()}
+        
+        # Calls per day (last 30 days)
+        cursor.execute(f"""
+            SELECT DATE(start_time) as day, COUNT(*) as count
+            FROM call_records 
+            WHERE {date_filter}
+            GROUP BY DATE(start_time)
+            ORDER BY day DESC
+            LIMIT 30
+        """, params)
+        stats["calls_per_day"] = [
+            {"date": row[0], "count": row[1]} 
+            for row in cursor.fetchall()
+        ]
+        
+        # Top callers
+        cursor.execute(f"""
+            SELECT caller_number, COUNT(*) as count
+            FROM call_records 
+            WHERE {date_filter} AND caller_number IS NOT NULL
+            GROUP BY caller_number
+            ORDER BY count DESC
+            LIMIT 10
+        """, params)
+        stats["top_callers"] = [
+            {"number": row[0], "count": row[1]} 
+            for row in cursor.fetchall()
+        ]
+        
+        # Tool usage stats
+        cursor.execute(f"""
+            SELECT COUNT(*) FROM call_records 
+            WHERE {date_filter} AND tool_calls != '[]'
+        """, params)
+        stats["calls_with_tools"] = cursor.fetchone()[0]
+        
+        # Top tools aggregation (parse JSON tool_calls field)
+        cursor.execute(f"""
+            SELECT tool_calls FROM call_records 
+            WHERE {date_filter} AND tool_calls != '[]'
+        """, params)
+        tool_counts: Dict[str, int] = {}
+        for row in cursor.fetchall():
+            try:
+                tools = json.loads(row[0]) if row[0] else []
+                for tool in tools:
+                    name = tool.get("name", "unknown")
+                    tool_counts[name] = tool_counts.get(name, 0) + 1
+            except (json.JSONDecodeError, TypeError):
+                pass
+        stats["top_tools"] = dict(sorted(tool_counts.items(), key=lambda x: x[1], reverse=True)[:10])
+        
+        return stats
+    
+    def _stats_from_rollups(
+        self,
+        cursor: sqlite3.Cursor,
+        start_date: Optional[datetime],
+        end_date: Optional[datetime],
+    ) -> Dict[str, Any]:
+        """
+        Aggregate dashboard stats from rollup buckets.
+
+        Buckets fully inside the requested range are read from the rollup tables; the partial
+        buckets at either edge (at most one hour or one day each) are aggregated from
+        call_records via the start_time index, so results match ``_stats_from_records``.
+        """
+        watermark = self._get_rollup_watermark(cursor)
+        watermark_dt = datetime.fromisoformat(watermark) if watermark else None
+        start_utc = _as_utc(start_date) if start_date else None
+        end_utc = _as_utc(end_date) if end_date else None
+
+        body_start = _ceil_bucket(start_utc, watermark_dt) if start_utc else None
+        body_end = _floor_bucket(end_utc + timedelta(microseconds=1), watermark_dt) if end_utc else None
+
+        acc = _StatsAccumulator()
+        self._accumulate_caller_rollups(cursor, acc, start_utc, end_utc)
+        if body_start and body_end and body_start >= body_end:
+            # Range narrower than a bucket: raw rows only.
+            self._accumulate_raw_stats(cursor, acc, [
+                ("start_time >= ?", start_utc.isoformat()),
+                ("start_time <= ?", end_utc.isoformat()),
+            ])
+            return acc.to_stats()
+
+        if start_utc and body_start != start_utc:
+            self._accumulate_raw_stats(cursor, acc, [
+                ("start_time >= ?", start_utc.isoformat()),
+                ("start_time < ?", body_start.isoformat()),
+            ])
+        if end_utc:
+            self._accumulate_raw_stats(cursor, acc, [
+                ("start_time >= ?", body_end.isoformat()),
+                ("start_time <= ?", end_utc.isoformat()),
+            ])
+
+        conditions = []
+        params: List[Any] = []
+        if body_start:
+            conditions.append("bucket_start >= ?")
+            params.append(body_start.isoformat())
+        if body_end:
+            conditions.append("bucket_start < ?")
+            params.append(body_end.isoformat())
+        where = " AND ".join(conditions) if conditions else "1=1"
+
+        cursor.execute(f"""
+            SELECT SUM(call_count), SUM(duration_count), SUM(duration_sum),
+                   MIN(duration_min), MAX(duration_max),
+                   SUM(latency_count), SUM(latency_sum), SUM(turns_sum),
+                   SUM(barge_in_sum), SUM(tool_call_count)
+            FROM call_rollups WHERE {where}
+        """, params)
+        acc.add_totals(*cursor.fetchone())
+
+        cursor.execute(f"""
+            SELECT outcome, provider_name, pipeline_name, context_name, SUM(call_count)
+            FROM call_rollups WHERE {where}
+            GROUP BY 1, 2, 3, 4
+        """, params)
+        for outcome, provider, pipeline, context, count in cursor.fetchall():
+            acc.add_count("outcomes", outcome or None, count)
+            acc.add_count("providers", provider or None, count)
+            if pipeline:
+                acc.add_count("pipelines", pipeline, count)
+            if context:
+                acc.add_count("contexts", context, count)
+
+        cursor.execute(f"""
+            SELECT substr(bucket_start, 1, 10), SUM(call_count)
+            FROM call_rollups WHERE {where} GROUP BY 1
+        """, params)
+        for day, count in cursor.fetchall():
+            acc.add_count("days", day, count)
+
+        cursor.execute(f"""
+            SELECT tool_name, SUM(call_count)
+            FROM call_rollup_tools WHERE {where} GROUP BY 1
+        """, params)
+        for name, count in cursor.fetchall():
+            acc.add_count("tools", name, count)
+
+        return acc.to_stats()
+
+    @staticmethod
+    def _accumulate_caller_rollups(
+        cursor: sqlite3.Cursor,
+        acc: "_StatsAccumulator",
+        start_utc: Optional[datetime],
+        end_utc: Optional[datetime],
+    ) -> None:
+        """Fold caller counts into ``acc`` from daily caller buckets plus raw rows at partial-day edges."""
+        body_start = _ceil_day(start_utc) if start_utc else None
+        body_end = None
+        if end_utc:
+            body_end = (end_utc + timedelta(microseconds=1)).replace(hour=0, minute=0, second=0, microsecond=0)
+        raw_ranges = []
+        if body_start and body_end and body_start >= body_end:
+            raw_ranges.append([
+                ("start_time >= ?", start_utc.isoformat()),
+                ("start_time <= ?", end_utc.isoformat()),
+            ])
+        else:
+            if start_utc and body_start != start_utc:
+                raw_ranges.append([
+                    ("start_time >= ?", start_utc.isoformat()),
+                    ("start_time < ?", body_start.isoformat()),
+                ])
+            if end_utc:
+                raw_ranges.append([
+                    ("start_time >= ?", body_end.isoformat()),
+                    ("start_time <= ?", end_utc.isoformat()),
+                ])
+            conditions = []
+            params: List[Any] = []
+            if body_start:
+                conditions.append("bucket_start >= ?")
+                params.append(body_start.isoformat())
+            if body_end:
+                conditions.append("bucket_start < ?")
+                params.append(body_end.isoformat())
+            where = " AND ".join(conditions) if conditions else "1=1"
+            cursor.execute(f"""
+                SELECT caller_number, SUM(call_count)
+                FROM call_rollup_callers WHERE {where} GROUP BY 1
+            """, params)
+            for number, count in cursor.fetchall():
+                acc.add_count("callers", number, count)
+
+        for filters in raw_ranges:
+            where = " AND ".join(f[0] for f in filters)
+            cursor.execute(f"""
+                SELECT caller_number, COUNT(*) FROM call_records
+                WHERE {where} AND caller_number IS NOT NULL GROUP BY 1
+            """, [f[1] for f in filters])
+            for number, count in cursor.fetchall():
+                acc.add_count("callers", number, count)
+
+    @staticmethod
+    def _accumulate_raw_stats(
+        cursor: sqlite3.Cursor,
+        acc: "_StatsAccumulator",
+        filters: List[tuple],
+    ) -> None:
+        """Fold raw call_records matching ``filters`` (SQL fragment, param) into ``acc`` (callers excluded)."""
+        where = " AND ".join(f[0] for f in filters)
+        params = [f[1] for f in filters]
+
+        cursor.execute(f"""
+            SELECT COUNT(*), COUNT(duration_seconds), SUM(duration_seconds),
+                   MIN(duration_seconds), MAX(duration_seconds),
+                   COUNT(avg_turn_latency_ms), SUM(avg_turn_latency_ms), SUM(total_turns),
+                   SUM(barge_in_count), SUM(CASE WHEN tool_calls != '[]' THEN 1 ELSE 0 END)
+            FROM call_records WHERE {where}
+        """, params)
+        row = cursor.fetchone()
+        if not row[0]:
+            return
+        acc.add_totals(*row)
+
+        cursor.execute(f"""
+            SELECT outcome, provider_name, pipeline_name, context_name, DATE(start_time), COUNT(*)
+            FROM call_records WHERE {where}
+            GROUP BY 1, 2, 3, 4, 5
+        """, params)
+        for outcome, provider, pipeline, context, day, count in cursor.fetchall():
+            acc.add_count("outcomes", outcome, count)
+            acc.add_count("providers", provider, count)
+            if pipeline is not None:
+                acc.add_count("pipelines", pipeline, count)
+            if context is not None:
+                acc.add_count("contexts", context, count)
+            acc.add_count("days", day, count)
+
+        cursor.execute(
+            f"SELECT tool_calls FROM call_records WHERE {where} AND tool_calls != '[]'",
+            params,
+        )
+        for (tool_calls,) in cursor.fetchall():
+            try:
+                tools = json.loads(tool_calls) if tool_calls else []
+            except (json.JSONDecodeError, TypeError):
+                continue
+            for tool in tools:
+                if isinstance(tool, dict):
+                    acc.add_count("tools", tool.get("name", "unknown"), 1)
+    
     async def cleanup_old_records(self) -> int:
         """
-        Delete records older than retention period.
+        Delete records older than retention period and compact old analytics rollups.
         
         Returns:
             Number of records deleted
         """
-        if not self._enabled or self._retention_days <= 0:
+        if not self._enabled:
             return 0
         
-        cutoff = datetime.now() - timedelta(days=self._retention_days)
-        deleted = await self.delete_before(cutoff)
-        if deleted > 0:
-            logger.info(f"Cleaned up {deleted} old call history records (retention: {self._retention_days} days)")
+        deleted = 0
+        if self._retention_days > 0:
+            cutoff = datetime.now() - timedelta(days=self._retention_days)
+            deleted = await self.delete_before(cutoff)
+            if deleted > 0:
+                logger.info(f"Cleaned up {deleted} old call history records (retention: {self._retention_days} days)")
+        
+        compacted = await self.compact_rollups()
+        if compacted > 0:
+            logger.info(f"Compacted {compacted} hourly call history rollups into daily buckets")
         return deleted
     
     async def get_distinct_values(self, column: str) -> List[str]:
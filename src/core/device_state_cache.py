@@ -0,0 +1,340 @@
+"""
+Event-driven device/endpoint state cache.
+
+``check_extension_status`` used to answer every model request with live ARI
+round-trips (``GET endpoints/{tech}/{ext}`` + ``GET deviceStates/{name}``, more
+when the tech had to be detected), adding latency mid-conversation and scaling
+ARI load with call volume. The engine already receives ``DeviceStateChanged`` and
+``EndpointStateChange`` on its ``subscribeAll`` WebSocket; this cache keeps the
+latest of each so tool lookups are answered in memory.
+
+Freshness:
+- Events update entries as they arrive
+- A periodic reconcile (one ``GET endpoints`` + ``GET deviceStates/{name}`` per
+  tracked device) repairs anything missed and re-confirms unchanged entries
+- Entries not confirmed within ``max_age_sec``, and every lookup from an ARI
+  WebSocket drop until the reconcile after reconnecting, are misses: callers fall back to a live probe and ``store_*``
+  the result, which also adds the device to the reconcile set
+- After a reconcile the endpoint list is complete, so a lookup for an endpoint
+  that does not exist (e.g. SIP/2765 on a PJSIP-only box) is answered too
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any, Dict, Iterable, Optional, Set, Tuple
+from urllib.parse import quote
+
+import structlog
+from prometheus_client import Counter, Gauge
+
+logger = structlog.get_logger(__name__)
+
+_LOOKUPS_TOTAL = Counter(
+    "ai_agent_device_state_cache_lookups_total",
+    "Device/endpoint state lookups answered by the cache",
+    labelnames=("kind", "result"),  # kind: device | endpoint; result: hit | miss
+)
+_EVENTS_TOTAL = Counter(
+    "ai_agent_device_state_cache_events_total",
+    "ARI state events applied to the device state cache",
+    labelnames=("type",),
+)
+_CORRECTIONS_TOTAL = Counter(
+    "ai_agent_device_state_cache_corrections_total",
+    "Cache entries changed by reconcile (events missed or never received)",
+    labelnames=("kind",),
+)
+_RECONCILES_TOTAL = Counter(
+    "ai_agent_device_state_cache_reconciles_total",
+    "Device state cache reconcile passes by outcome",
+    labelnames=("outcome",),  # ok | error
+)
+_STALENESS_SECONDS = Gauge(
+    "ai_agent_device_state_cache_staleness_seconds",
+    "Age of the least recently confirmed tracked device state entry",
+)
+_ENTRIES = Gauge(
+    "ai_agent_device_state_cache_entries",
+    "Entries held by the device state cache",
+    labelnames=("kind",),
+)
+
+_HIT = "hit"
+_MISS = "miss"
+
+
+def device_key(name: str) -> str:
+    """Normalize a device state name ("pjsip/2765" -> "PJSIP/2765")."""
+    name = (name or "").strip()
+    tech, sep, resource = name.partition("/")
+    return f"{tech.upper()}{sep}{resource}" if sep else name
+
+
+def endpoint_key(tech: str, resource: str) -> str:
+    return f"{(tech or '').strip().upper()}/{(resource or '').strip()}"
+
+
+class DeviceStateCache:
+    """Latest ARI device and endpoint state, fed by events and reconciled periodically."""
+
+    def __init__(
+        self,
+        ari_client: Any,
+        *,
+        reconcile_interval_sec: float = 60.0,
+        max_age_sec: float = 180.0,
+        reconcile_concurrency: int = 8,
+    ):
+        self.ari_client = ari_client
+        self.reconcile_interval_sec = float(reconcile_interval_sec)
+        self.max_age_sec = float(max_age_sec)
+        self.reconcile_concurrency = max(1, int(reconcile_concurrency))
+        # key -> (state, confirmed_at monotonic)
+        self._devices: Dict[str, Tuple[str, float]] = {}
+        # key -> (Endpoint dict, confirmed_at monotonic)
+        self._endpoints: Dict[str, Tuple[Dict[str, Any], float]] = {}
+        self._tracked: Set[str] = set()
+        self._endpoints_listed_at: Optional[float] = None
+        self._resync = True  # events may have been missed: reconcile once ARI is connected
+        self._running = False
+        self._handlers_registered = False
+        self._task: Optional[asyncio.Task] = None
+        self._wake = asyncio.Event()
+
+    @classmethod
+    def from_config(cls, config: Any, ari_client: Any) -> Optional["DeviceStateCache"]:
+        """Build from the ``device_state_cache`` config section; None when disabled."""
+        if config is not None and not getattr(config, "enabled", True):
+            return None
+        if config is None:
+            return cls(ari_client)
+        return cls(
+            ari_client,
+            reconcile_interval_sec=config.reconcile_interval_sec,
+            max_age_sec=config.max_age_sec,
+        )
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    @property
+    def synced(self) -> bool:
+        """True once a reconcile has landed since start or the last ARI disconnect."""
+        return not self._resync
+
+    def _connected(self) -> bool:
+        connected = bool(getattr(self.ari_client, "is_connected", True))
+        if not connected:
+            self._resync = True
+        return connected
+
+    def _fresh(self, confirmed_at: float, now: float) -> bool:
+        return now - confirmed_at <= self.max_age_sec
+
+    def _usable(self) -> bool:
+        # Until the post-(re)connect reconcile lands, entries may predate missed events.
+        return self._connected() and not self._resync
+
+    def track(self, names: Iterable[str]) -> None:
+        """Add device state names to the reconcile set (configured extensions, probed devices)."""
+        for name in names:
+            key = device_key(name)
+            if key and "/" in key:
+                self._tracked.add(key)
+
+    # -- lookups -----------------------------------------------------------
+
+    def get_device_state(self, name: str) -> Optional[Dict[str, Any]]:
+        """``{"name", "state"}`` like ``GET deviceStates/{name}``, or None on a miss."""
+        key = device_key(name)
+        entry = self._devices.get(key)
+        now = time.monotonic()
+        if entry is None or not self._usable() or not self._fresh(entry[1], now):
+            _LOOKUPS_TOTAL.labels("device", _MISS).inc()
+            return None
+        _LOOKUPS_TOTAL.labels("device", _HIT).inc()
+        return {"name": key, "state": entry[0]}
+
+    def get_endpoint(self, tech: str, resource: str) -> Tuple[bool, Optional[Dict[str, Any]]]:
+        """
+        ``(known, endpoint)``. ``known`` is False on a miss (probe ARI); when True,
+        ``endpoint`` is the Endpoint dict, or None if ARI has no such endpoint.
+        """
+        key = endpoint_key(tech, resource)
+        now = time.monotonic()
+        if not self._usable():
+            _LOOKUPS_TOTAL.labels("endpoint", _MISS).inc()
+            return False, None
+        entry = self._endpoints.get(key)
+        if entry is not None and self._fresh(entry[1], now):
+            _LOOKUPS_TOTAL.labels("endpoint", _HIT).inc()
+            return True, dict(entry[0])
+        listed_at = self._endpoints_listed_at
+        if entry is None and listed_at is not None and self._fresh(listed_at, now):
+            _LOOKUPS_TOTAL.labels("endpoint", _HIT).inc()
+            return True, None
+        _LOOKUPS_TOTAL.labels("endpoint", _MISS).inc()
+        return False, None
+
+    # -- updates -----------------------------------------------------------
+
+    def store_device_state(self, name: str, state: str) -> None:
+        """Record a device state (from a live probe or reconcile) and track the device."""
+        key = device_key(name)
+        if not key or not state:
+            return
+        self._tracked.add(key)
+        self._devices[key] = (str(state).strip().upper(), time.monotonic())
+
+    def store_endpoint(self, endpoint: Dict[str, Any]) -> None:
+        tech = str(endpoint.get("technology", "") or "")
+        resource = str(endpoint.get("resource", "") or "")
+        if not tech or not resource:
+            return
+        self._endpoints[endpoint_key(tech, resource)] = (dict(endpoint), time.monotonic())
+
+    async def on_device_state_changed(self, event: Dict[str, Any]) -> None:
+        device = event.get("device_state") or {}
+        name, state = device.get("name"), device.get("state")
+        if not name or not state:
+            return
+        self._devices[device_key(name)] = (str(state).strip().upper(), time.monotonic())
+        _EVENTS_TOTAL.labels("DeviceStateChanged").inc()
+
+    async def on_endpoint_state_change(self, event: Dict[str, Any]) -> None:
+        endpoint = event.get("endpoint")
+        if not isinstance(endpoint, dict):
+            return
+        self.store_endpoint(endpoint)
+        _EVENTS_TOTAL.labels("EndpointStateChange").inc()
+
+    # -- reconcile ---------------------------------------------------------
+
+    async def reconcile(self) -> bool:
+        """Re-read endpoints and tracked device states from ARI. Returns False if ARI failed."""
+        try:
+            endpoints = await self.ari_client.send_command(method="GET", resource="endpoints")
+            if not isinstance(endpoints, list):
+                raise RuntimeError(f"unexpected endpoints response: {type(endpoints).__name__}")
+            now = time.monotonic()
+            listed: Dict[str, Tuple[Dict[str, Any], float]] = {}
+            for endpoint in endpoints:
+                if not isinstance(endpoint, dict) or "technology" not in endpoint or "resource" not in endpoint:
+                    continue
+                key = endpoint_key(endpoint["technology"], endpoint["resource"])
+                previous = self._endpoints.get(key)
+                if previous is not None and previous[0].get("state") != endpoint.get("state"):
+                    _CORRECTIONS_TOTAL.labels("endpoint").inc()
+                listed[key] = (dict(endpoint), now)
+            self._endpoints = listed
+            self._endpoints_listed_at = now
+
+            semaphore = asyncio.Semaphore(self.reconcile_concurrency)
+
+            async def _refresh(key: str) -> None:
+                async with semaphore:
+                    resp = await self.ari_client.send_command(
+                        method="GET", resource=f"deviceStates/{quote(key, safe='')}"
+                    )
+                state = str((resp or {}).get("state", "") or "").strip().upper() if isinstance(resp, dict) else ""
+                if not state:
+                    return
+                previous = self._devices.get(key)
+                if previous is not None and previous[0] != state:
+                    _CORRECTIONS_TOTAL.labels("device").inc()
+                self._devices[key] = (state, time.monotonic())
+
+            results = await asyncio.gather(*(_refresh(k) for k in sorted(self._tracked)), return_exceptions=True)
+            failed = [r for r in results if isinstance(r, BaseException)]
+            if failed:
+                logger.debug("Device state reconcile: some devices failed", failed=len(failed), error=str(failed[0]))
+        except Exception as exc:
+            _RECONCILES_TOTAL.labels("error").inc()
+            logger.debug("Device state reconcile failed", error=str(exc))
+            return False
+        finally:
+            self.update_metrics()
+        _RECONCILES_TOTAL.labels("ok").inc()
+        if self._connected():
+            self._resync = False
+        logger.debug("Device state cache reconciled", devices=len(self._tracked), endpoints=len(listed))
+        return True
+
+    def staleness_seconds(self) -> float:
+        """Seconds since the least recently confirmed tracked device was last confirmed."""
+        now = time.monotonic()
+        oldest = 0.0
+        for key in self._tracked:
+            entry = self._devices.get(key)
+            if entry is not None:
+                oldest = max(oldest, now - entry[1])
+        if self._endpoints_listed_at is not None:
+            oldest = max(oldest, now - self._endpoints_listed_at)
+        return oldest
+
+    def update_metrics(self) -> None:
+        _STALENESS_SECONDS.set(self.staleness_seconds())
+        _ENTRIES.labels("device").set(len(self._devices))
+        _ENTRIES.labels("endpoint").set(len(self._endpoints))
+
+    # -- lifecycle ---------------------------------------------------------
+
+    async def start(self) -> None:
+        if self._running:
+            return
+        if not self._handlers_registered:
+            self.ari_client.add_event_handler("DeviceStateChanged", self.on_device_state_changed)
+            self.ari_client.add_event_handler("EndpointStateChange", self.on_endpoint_state_change)
+            self._handlers_registered = True
+        self._running = True
+        self._task = asyncio.create_task(self._reconcile_loop(), name="device-state-reconcile")
+        logger.info(
+            "Device state cache started",
+            tracked=len(self._tracked),
+            reconcile_interval_sec=self.reconcile_interval_sec,
+        )
+
+    async def stop(self) -> None:
+        if not self._running:
+            return
+        self._running = False
+        self._wake.set()
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+    async def _reconcile_loop(self) -> None:
+        # Events are not delivered while the WebSocket is down, so reconcile as soon as it
+        # (re)connects, then every reconcile_interval_sec; retry failures sooner.
+        tick = min(self.reconcile_interval_sec, 1.0)
+        retry_sec = min(self.reconcile_interval_sec, 5.0)
+        next_run = 0.0
+        ok = True
+        while self._running:
+            if self._connected() and (time.monotonic() >= next_run or (self._resync and ok)):
+                ok = await self.reconcile()
+                next_run = time.monotonic() + (self.reconcile_interval_sec if ok else retry_sec)
+            else:
+                self.update_metrics()
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=tick)
+            except asyncio.TimeoutError:
+                pass
+
+
+_cache: Optional[DeviceStateCache] = None
+
+
+def get_device_state_cache() -> Optional[DeviceStateCache]:
+    """The engine's running cache, or None (tools then query ARI directly)."""
+    cache = _cache
+    return cache if cache is not None and cache.running else None
+
+
+def set_device_state_cache(cache: Optional[DeviceStateCache]) -> None:
+    global _cache
+    _cache = cache
@@ -0,0 +1,682 @@
+"""
+Shared, multiplexed WebSocket pool from ai-engine to local_ai_server.
+
+Without the pool every call opens its own socket per local component (STT, LLM,
+TTS, provider) and pays connect + auth + negotiate before the first byte of
+audio moves. The pool keeps a few authenticated, negotiated connections open
+and hands each call a lightweight ``LocalAIChannel`` on one of them:
+
+- Multiplexing: connections negotiate binary frames with ``multiplex: true``,
+  so one socket carries many calls. Outbound JSON is stamped with the channel's
+  ``call_id`` and frames carry its ``call_hash``; the connection's reader routes
+  inbound messages back by the same keys.
+- Backpressure: each connection holds at most ``max_channels_per_connection``
+  channels. When every connection is full and the pool is at ``size``,
+  ``open_channel`` waits for a channel to be released (or times out with
+  ``LocalAIPoolExhausted``). Each channel's inbound queue is bounded; a stalled
+  consumer loses its oldest messages instead of blocking every other call.
+- Health checks and failover: a background task pings every connection. A
+  connection that fails a ping or read is dropped at once, its channels raise
+  ``ConnectionClosedError`` on their next recv/send, and callers' existing
+  reconnect paths reopen a channel on a healthy connection.
+- Model swaps: local_ai_server keeps each connection on the model generation
+  that was active when it opened (blue/green swaps). The health loop asks every
+  connection for ``status``; once the server reports a newer generation, older
+  connections take no new channels, fresh ones replace them, and each old one
+  is closed as soon as its last channel is released.
+
+Servers that do not grant multiplexing (older local_ai_server builds, or the
+supervisor front door) get one dedicated connection per channel, which is the
+pre-pool behaviour with the same channel API.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import structlog
+import websockets
+from prometheus_client import Counter, Gauge, Histogram
+from websockets.exceptions import ConnectionClosed, ConnectionClosedError, ConnectionClosedOK
+from websockets.protocol import State
+
+from ..audio.local_ai_frames import FRAME_HEADER, call_hash, negotiate_message, negotiated_version
+
+logger = structlog.get_logger(__name__)
+
+_POOL_CONNECTIONS = Gauge(
+    "ai_agent_local_ai_pool_connections",
+    "Open pooled (multiplexed) connections to local_ai_server",
+)
+_POOL_CHANNELS = Gauge(
+    "ai_agent_local_ai_pool_channels",
+    "Per-call channels currently open on pooled local_ai_server connections",
+)
+_POOL_ACQUIRE_SECONDS = Histogram(
+    "ai_agent_local_ai_pool_acquire_seconds",
+    "Time to obtain a local_ai_server channel (includes connecting when the pool grows)",
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+)
+_POOL_FAILOVERS = Counter(
+    "ai_agent_local_ai_pool_failovers_total",
+    "Pooled local_ai_server connections dropped after a failed health check or read",
+)
+_POOL_DROPPED = Counter(
+    "ai_agent_local_ai_pool_dropped_messages_total",
+    "Inbound local_ai_server messages dropped because a channel queue was full",
+)
+
+_HASH_SLICE = slice(8, 12)  # call_hash field inside FRAME_HEADER
+_CLOSED_OK = object()
+_CLOSED_ERROR = object()
+
+
+class LocalAIPoolExhausted(RuntimeError):
+    """No channel capacity became free before the acquire timeout."""
+
+
+def _with_hash(frame: bytes, hashed: bytes) -> bytes:
+    return frame[: _HASH_SLICE.start] + hashed + frame[_HASH_SLICE.stop :]
+
+
+class LocalAIChannel:
+    """One call's logical connection; quacks like a websockets ``ClientConnection``.
+
+    ``send``/``recv``/``close``/``state``/``async for`` behave as they do on a
+    dedicated socket, so adapters and the provider use a channel unchanged.
+    When the same call opens several channels on one connection (STT and TTS
+    adapters, say) the extra ones get a suffixed wire id; the channel rewrites
+    ``call_id`` and frame hashes in both directions so callers never see it.
+    """
+
+    def __init__(
+        self,
+        pool: "LocalAIConnectionPool",
+        connection: "_PooledConnection",
+        call_id: str,
+        wire_id: str,
+        queue_max: int,
+    ):
+        self.call_id = call_id
+        self.wire_id = wire_id
+        self._pool = pool
+        self._connection = connection
+        self._queue: asyncio.Queue = asyncio.Queue(queue_max)
+        self._closed = False
+        self._translate = wire_id != call_id
+        self._wire_hash = call_hash(wire_id).to_bytes(4, "big")
+        self._call_hash = call_hash(call_id).to_bytes(4, "big")
+        self.dropped = 0
+
+    @property
+    def frames_version(self) -> Optional[int]:
+        return self._connection.frames_version
+
+    @property
+    def multiplexed(self) -> bool:
+        return self._connection.multiplex
+
+    @property
+    def state(self) -> State:
+        return State.CLOSED if self._closed else State.OPEN
+
+    async def send(self, message: Any) -> None:
+        if self._closed:
+            raise ConnectionClosedError(None, None)
+        if self._connection.multiplex:
+            if isinstance(message, str):
+                message = self._stamp(message)
+            elif self._translate:
+                message = _with_hash(message, self._wire_hash)
+        try:
+            await self._connection.websocket.send(message)
+        except ConnectionClosed:
+            self._pool._fail(self._connection)
+            raise
+
+    async def recv(self) -> Any:
+        item = await self._queue.get()
+        if item is _CLOSED_OK or item is _CLOSED_ERROR:
+            self._queue.put_nowait(item)  # later recv() calls fail the same way
+            if item is _CLOSED_OK:
+                raise ConnectionClosedOK(None, None)
+            raise ConnectionClosedError(None, None)
+        return item
+
+    def __aiter__(self) -> "LocalAIChannel":
+        return self
+
+    async def __anext__(self) -> Any:
+        try:
+            return await self.recv()
+        except ConnectionClosedOK:
+            raise StopAsyncIteration
+
+    async def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        self._put(_CLOSED_OK)
+        await self._pool._release(self)
+
+    def _stamp(self, message: str) -> str:
+        try:
+            data = json.loads(message)
+        except ValueError:
+            return message
+        if not isinstance(data, dict):
+            return message
+        data["call_id"] = self.wire_id
+        return json.dumps(data)
+
+    def _deliver_text(self, message: str, data: Optional[Dict[str, Any]]) -> None:
+        if self._translate and data is not None and data.get("call_id") == self.wire_id:
+            data["call_id"] = self.call_id
+            message = json.dumps(data)
+        self._put(message)
+
+    def _deliver_binary(self, message: bytes) -> None:
+        if self._translate:
+            message = _with_hash(message, self._call_hash)
+        self._put(message)
+
+    def _abort(self) -> None:
+        if not self._closed:
+            self._closed = True
+            self._put(_CLOSED_ERROR)
+
+    def _put(self, item: Any) -> None:
+        while True:
+            try:
+                self._queue.put_nowait(item)
+                return
+            except asyncio.QueueFull:
+                self._queue.get_nowait()
+                self.dropped += 1
+                self._pool.dropped_messages += 1
+                _POOL_DROPPED.inc()
+
+
+class _PooledConnection:
+    """One authenticated socket and the channels routed over it."""
+
+    def __init__(self, websocket: Any, *, multiplex: bool, frames_version: Optional[int]):
+        self.websocket = websocket
+        self.multiplex = multiplex
+        self.frames_version = frames_version
+        self.alive = True
+        # Model generation the server was serving when this socket opened; a stale
+        # connection is pinned to a retired generation and only drains.
+        self.generation: Optional[int] = None
+        self.stale = False
+        self.channels: Dict[str, LocalAIChannel] = {}
+        self.by_hash: Dict[int, LocalAIChannel] = {}
+        self.reader: Optional[asyncio.Task] = None
+
+    def attach(self, channel: LocalAIChannel) -> None:
+        self.channels[channel.wire_id] = channel
+        self.by_hash[call_hash(channel.wire_id)] = channel
+
+    def detach(self, channel: LocalAIChannel) -> bool:
+        if self.channels.get(channel.wire_id) is not channel:
+            return False
+        del self.channels[channel.wire_id]
+        self.by_hash.pop(call_hash(channel.wire_id), None)
+        return True
+
+
+class LocalAIConnectionPool:
+    """Keeps ``size`` multiplexed connections to one local_ai_server endpoint."""
+
+    def __init__(
+        self,
+        ws_url: str,
+        *,
+        auth_token: Optional[str] = None,
+        size: int = 2,
+        max_channels_per_connection: int = 32,
+        connect_timeout: float = 5.0,
+        acquire_timeout: float = 5.0,
+        health_interval_sec: float = 15.0,
+        channel_queue_max: int = 256,
+    ):
+        self.ws_url = ws_url
+        self.auth_token = (auth_token or "").strip()
+        self.size = max(1, int(size))
+        self.max_channels_per_connection = max(1, int(max_channels_per_connection))
+        self.connect_timeout = float(connect_timeout)
+        self.acquire_timeout = float(acquire_timeout)
+        self.health_interval_sec = float(health_interval_sec)
+        self.channel_queue_max = max(1, int(channel_queue_max))
+
+        self._connections: List[_PooledConnection] = []
+        self._dedicated: Set[_PooledConnection] = set()
+        # None = not probed yet; False = server declined, use dedicated connections
+        self._multiplex: Optional[bool] = None
+        self._opening = 0
+        self._capacity = asyncio.Event()
+        self._health_task: Optional[asyncio.Task] = None
+        self._closed = False
+        self._generation: Optional[int] = None
+
+        self.acquired = 0
+        self.acquire_waits = 0
+        self.failovers = 0
+        self.dropped_messages = 0
+        self.recycled = 0
+
+    # -- public API ---------------------------------------------------------
+
+    async def start(self) -> None:
+        """Warm the pool up to ``size`` connections; failures are logged, not raised."""
+        self._ensure_health_task()
+        await self._top_up()
+
+    async def open_channel(self, call_id: str, *, timeout: Optional[float] = None) -> LocalAIChannel:
+        if self._closed:
+            raise RuntimeError("local_ai_server connection pool is closed")
+        started = time.perf_counter()
+        wait = self.acquire_timeout if timeout is None else float(timeout)
+        try:
+            channel = await asyncio.wait_for(self._acquire(call_id), timeout=wait)
+        except asyncio.TimeoutError:
+            raise LocalAIPoolExhausted(
+                f"no local_ai_server channel for call {call_id} within {wait:.1f}s "
+                f"({self.size} connections x {self.max_channels_per_connection} channels busy)"
+            ) from None
+        finally:
+            _POOL_ACQUIRE_SECONDS.observe(time.perf_counter() - started)
+        self.acquired += 1
+        return channel
+
+    async def close(self) -> None:
+        self._closed = True
+        if self._health_task:
+            self._health_task.cancel()
+            self._health_task = None
+        for connection in list(self._connections) + list(self._dedicated):
+            self._fail(connection, failover=False)
+            try:
+                await connection.websocket.close()
+            except Exception:
+                pass
+
+    def stats(self) -> Dict[str, Any]:
+        channels = sum(len(c.channels) for c in self._connections)
+        stale = sum(1 for c in self._connections if c.stale)
+        capacity = self.size * self.max_channels_per_connection
+        return {
+            "url": self.ws_url,
+            "multiplex": self._multiplex,
+            "size": self.size,
+            "connections": len(self._connections) - stale,
+            "stale_connections": stale,
+            "generation": self._generation,
+            "dedicated_connections": len(self._dedicated),
+            "channels": channels,
+            "capacity": capacity,
+            "utilization": round(channels / capacity, 3) if capacity else 0.0,
+            "acquired_total": self.acquired,
+            "acquire_waits_total": self.acquire_waits,
+            "failovers_total": self.failovers,
+            "dropped_messages_total": self.dropped_messages,
+            "recycled_total": self.recycled,
+        }
+
+    # -- acquisition --------------------------------------------------------
+
+    async def _acquire(self, call_id: str) -> LocalAIChannel:
+        self._ensure_health_task()
+        waited = False
+        while True:
+            if self._multiplex is False:
+                connection = await self._connect(multiplex=False)
+                return self._attach(connection, call_id)
+            connection = self._pick(call_id)
+            if connection is not None:
+                return self._attach(connection, call_id)
+            if self._fresh_count() + self._opening < self.size:
+                connection = await self._grow()
+                if connection is not None and not connection.multiplex:
+                    return self._attach(connection, call_id)
+                continue
+            if not waited:
+                waited = True
+                self.acquire_waits += 1
+            capacity = self._capacity
+            await capacity.wait()
+
+    def _pick(self, call_id: str) -> Optional[_PooledConnection]:
+        best: Optional[_PooledConnection] = None
+        best_key: Tuple[int, int] = (0, 0)
+        for connection in self._connections:
+            load = len(connection.channels)
+            if not connection.alive or connection.stale or load >= self.max_channels_per_connection:
+                continue
+            # Prefer a connection this call is not already on, then the least loaded.
+            key = (1 if call_id in connection.channels else 0, load)
+            if best is None or key < best_key:
+                best, best_key = connection, key
+        return best
+
+    def _attach(self, connection: _PooledConnection, call_id: str) -> LocalAIChannel:
+        wire_id = call_id
+        suffix = 2
+        while wire_id in connection.channels or call_hash(wire_id) in connection.by_hash:
+            wire_id = f"{call_id}#{suffix}"
+            suffix += 1
+        channel = LocalAIChannel(self, connection, call_id, wire_id, self.channel_queue_max)
+        connection.attach(channel)
+        if connection.multiplex:
+            _POOL_CHANNELS.inc()
+        return channel
+
+    async def _release(self, channel: LocalAIChannel) -> None:
+        connection = channel._connection
+        if not connection.detach(channel):
+            return
+        if not connection.multiplex:
+            self._dedicated.discard(connection)
+            connection.alive = False
+            try:
+                await connection.websocket.close()
+            except Exception:
+                pass
+            return
+        _POOL_CHANNELS.dec()
+        self._signal_capacity()
+        if connection.alive:
+            try:
+                await connection.websocket.send(json.dumps({"type": "call_end", "call_id": channel.wire_id}))
+            except Exception:
+                logger.debug("call_end on pooled connection failed", call_id=channel.call_id, exc_info=True)
+        if connection.stale and not connection.channels:
+            self._recycle(connection)
+
+    def _signal_capacity(self) -> None:
+        self._capacity.set()
+        self._capacity = asyncio.Event()
+
+    def _fresh_count(self) -> int:
+        return sum(1 for connection in self._connections if not connection.stale)
+
+    # -- model generations --------------------------------------------------
+
+    def _note_generation(self, connection: _PooledConnection, generation: Any) -> None:
+        """Record the generation ``connection``'s server reports as active."""
+        if not isinstance(generation, int) or isinstance(generation, bool):
+            return  # servers without blue/green swaps
+        if connection.generation is None:
+            connection.generation = generation
+        if generation != self._generation:
+            previous, self._generation = self._generation, generation
+            if previous is not None:
+                logger.info(
+                    "local_ai_server model generation changed; recycling pooled connections",
+                    url=self.ws_url,
+                    generation=generation,
+                    previous=previous,
+                )
+        for other in list(self._connections):
+            if other.generation is not None and other.generation != generation:
+                self._mark_stale(other)
+
+    def _mark_stale(self, connection: _PooledConnection) -> None:
+        if connection.stale or not connection.alive:
+            return
+        connection.stale = True
+        if not connection.channels:
+            self._recycle(connection)
+        if not self._closed:
+            asyncio.ensure_future(self._top_up())
+
+    def _recycle(self, connection: _PooledConnection) -> None:
+        self.recycled += 1
+        logger.debug(
+            "Closing pooled local_ai_server connection on a retired generation",
+            url=self.ws_url,
+            generation=connection.generation,
+        )
+        self._fail(connection, failover=False)
+
+    # -- connections --------------------------------------------------------
+
+    async def _grow(self) -> Optional[_PooledConnection]:
+        self._opening += 1
+        try:
+            connection = await self._connect(multiplex=True)
+        finally:
+            self._opening -= 1
+        if connection.multiplex:
+            self._connections.append(connection)
+            _POOL_CONNECTIONS.inc()
+            self._note_generation(connection, connection.generation)
+            self._signal_capacity()
+        return connection
+
+    async def _connect(self, *, multiplex: bool) -> _PooledConnection:
+        websocket = await asyncio.wait_for(
+            websockets.connect(self.ws_url, ping_interval=None, ping_timeout=None, max_size=None),
+            timeout=self.connect_timeout,
+        )
+        try:
+            if self.auth_token:
+                await websocket.send(json.dumps({"type": "auth", "auth_token": self.auth_token}))
+                reply = json.loads(await asyncio.wait_for(websocket.recv(), timeout=self.connect_timeout))
+                if reply.get("type") != "auth_response" or reply.get("status") != "ok":
+                    raise RuntimeError(f"local_ai_server auth rejected: {reply}")
+            connection = await self._probe(websocket) if multiplex else None
+            if connection is None and multiplex:
+                # Declined: the probe socket already holds a frames agreement the
+                # consumer never saw, so its dedicated replacement starts clean.
+                await websocket.close()
+                return await self._connect(multiplex=False)
+            if connection is None:
+                # Dedicated: the reply is forwarded to the channel's consumer like
+                # on an unpooled socket, so do not wait for it here.
+                await websocket.send(negotiate_message())
+                connection = _PooledConnection(websocket, multiplex=False, frames_version=None)
+        except BaseException:
+            try:
+                await websocket.close()
+            except Exception:
+                pass
+            raise
+        if not connection.multiplex:
+            self._dedicated.add(connection)
+        connection.reader = asyncio.create_task(self._read_loop(connection))
+        return connection
+
+    async def _probe(self, websocket: Any) -> Optional[_PooledConnection]:
+        # A status request after the offer bounds the wait: servers that predate
+        # negotiation skip the offer and answer status_response straight away.
+        await websocket.send(negotiate_message(multiplex=True))
+        await websocket.send(json.dumps({"type": "status"}))
+        granted: Dict[str, Any] = {}
+        status: Dict[str, Any] = {}
+        while True:
+            raw = await asyncio.wait_for(websocket.recv(), timeout=self.connect_timeout)
+            if isinstance(raw, (bytes, bytearray)):
+                continue
+            reply = json.loads(raw)
+            if reply.get("type") == "negotiate_response":
+                granted = reply
+            elif reply.get("type") == "status_response":
+                status = reply
+                break
+        frames_version = negotiated_version(granted)
+        multiplex = bool(granted.get("multiplex")) and frames_version is not None
+        if self._multiplex is None or self._multiplex != multiplex:
+            logger.info(
+                "local_ai_server pool negotiated",
+                url=self.ws_url,
+                multiplex=multiplex,
+                binary_frames=frames_version,
+            )
+        self._multiplex = multiplex
+        if not multiplex:
+            return None
+        connection = _PooledConnection(websocket, multiplex=True, frames_version=frames_version)
+        connection.generation = _swap_generation(status)
+        return connection
+
+    async def _read_loop(self, connection: _PooledConnection) -> None:
+        try:
+            async for message in connection.websocket:
+                if connection.multiplex:
+                    self._route(connection, message)
+                    continue
+                channel = next(iter(connection.channels.values()), None)
+                if isinstance(message, str) and "negotiate_response" in message[:40]:
+                    connection.frames_version = negotiated_version(json.loads(message))
+                if channel is not None:
+                    channel._put(message)
+        except ConnectionClosed:
+            pass
+        except Exception:
+            logger.warning("local_ai_server pool reader failed", url=self.ws_url, exc_info=True)
+        finally:
+            self._fail(connection, failover=connection.multiplex and not self._closed)
+
+    def _route(self, connection: _PooledConnection, message: Any) -> None:
+        if isinstance(message, (bytes, bytearray)):
+            if len(message) < FRAME_HEADER.size:
+                return
+            channel = connection.by_hash.get(int.from_bytes(message[_HASH_SLICE], "big"))
+            if channel is not None:
+                channel._deliver_binary(message)
+            return
+        try:
+            data = json.loads(message)
+        except ValueError:
+            return
+        channel = connection.channels.get(data.get("call_id")) if isinstance(data, dict) else None
+        if channel is None and isinstance(data, dict) and data.get("type") == "status_response":
+            # Reply to the health loop's status request.
+            self._note_generation(connection, _swap_generation(data))
+            return
+        if channel is not None:
+            channel._deliver_text(message, data)
+        else:
+            logger.debug(
+                "Unrouted local_ai_server message on pooled connection",
+                message_type=data.get("type") if isinstance(data, dict) else None,
+            )
+
+    def _fail(self, connection: _PooledConnection, *, failover: bool = True) -> None:
+        if not connection.alive:
+            return
+        connection.alive = False
+        if connection in self._dedicated:
+            self._dedicated.discard(connection)
+        elif connection in self._connections:
+            self._connections.remove(connection)
+            _POOL_CONNECTIONS.dec()
+            _POOL_CHANNELS.dec(len(connection.channels))
+            if failover:
+                self.failovers += 1
+                _POOL_FAILOVERS.inc()
+                # Re-probe on the next connect: the server may have been swapped.
+                self._multiplex = None
+                logger.warning(
+                    "local_ai_server pooled connection lost; failing over its channels",
+                    url=self.ws_url,
+                    channels=len(connection.channels),
+                )
+        for channel in list(connection.channels.values()):
+            channel._abort()
+        connection.channels.clear()
+        connection.by_hash.clear()
+        if connection.reader is not None and connection.reader is not asyncio.current_task():
+            connection.reader.cancel()
+        self._signal_capacity()
+        if connection.websocket.state is not State.CLOSED:
+            asyncio.ensure_future(connection.websocket.close())
+
+    # -- health -------------------------------------------------------------
+
+    def _ensure_health_task(self) -> None:
+        if self._health_task is None and not self._closed and self.health_interval_sec > 0:
+            self._health_task = asyncio.create_task(self._health_loop())
+
+    async def _health_loop(self) -> None:
+        while not self._closed:
+            await asyncio.sleep(self.health_interval_sec)
+            for connection in list(self._connections):
+                try:
+                    pong = await connection.websocket.ping()
+                    await asyncio.wait_for(pong, timeout=self.connect_timeout)
+                except Exception as exc:
+                    logger.warning(
+                        "local_ai_server pooled connection failed health check",
+                        url=self.ws_url,
+                        error=str(exc) or type(exc).__name__,
+                    )
+                    self._fail(connection)
+                    continue
+                try:
+                    await connection.websocket.send(json.dumps({"type": "status"}))
+                except Exception:
+                    pass  # the next ping fails it
+            await self._top_up()
+
+    async def _top_up(self) -> None:
+        while (
+            not self._closed
+            and self._multiplex is not False
+            and self._fresh_count() + self._opening < self.size
+        ):
+            try:
+                connection = await self._grow()
+            except Exception as exc:
+                logger.debug("local_ai_server pool connect failed", url=self.ws_url, error=str(exc))
+                return
+            if not connection.multiplex:
+                await connection.websocket.close()
+                self._dedicated.discard(connection)
+                return
+
+
+def _swap_generation(status: Dict[str, Any]) -> Optional[int]:
+    swap = status.get("model_swap")
+    return swap.get("generation") if isinstance(swap, dict) else None
+
+
+_SHARED_POOLS: Dict[Tuple[str, str], LocalAIConnectionPool] = {}
+
+
+def shared_pool(provider_config: Any) -> Optional[LocalAIConnectionPool]:
+    """Process-wide pool for a ``LocalProviderConfig`` (None when ``pool_size`` is 0)."""
+    size = int(getattr(provider_config, "pool_size", 0) or 0)
+    ws_url = getattr(provider_config, "effective_ws_url", None) or getattr(provider_config, "ws_url", None)
+    if size <= 0 or not ws_url:
+        return None
+    auth_token = (getattr(provider_config, "auth_token", None) or "").strip()
+    key = (ws_url, auth_token)
+    pool = _SHARED_POOLS.get(key)
+    if pool is None:
+        connect_timeout = float(getattr(provider_config, "connect_timeout_sec", 5.0) or 5.0)
+        pool = LocalAIConnectionPool(
+            ws_url,
+            auth_token=auth_token,
+            size=size,
+            max_channels_per_connection=int(getattr(provider_config, "pool_max_channels", 32) or 32),
+            connect_timeout=connect_timeout,
+            acquire_timeout=connect_timeout,
+        )
+        _SHARED_POOLS[key] = pool
+    return pool
+
+
+def shared_pool_stats() -> List[Dict[str, Any]]:
+    return [pool.stats() for pool in _SHARED_POOLS.values()]
+
+
+async def close_shared_pools() -> None:
+    pools = list(_SHARED_POOLS.values())
+    _SHARED_POOLS.clear()
+    for pool in pools:
+        await pool.close()
@@ -0,0 +1,269 @@
+"""
+Event-loop instrumentation for ai-engine.
+
+RTP ingress, AudioSocket, provider websockets, streaming pacers, ARI and the health
+server all share one asyncio loop, so a single slow callback delays audio for every
+call. This module makes that visible:
+
+- ``LoopMonitor`` samples loop lag into a Prometheus histogram and times every loop
+  callback, attributing slow ones to the task/coroutine (or transport protocol) that ran.
+- ``timed_stage`` exports per-stage hot-path timings as Prometheus histograms.
+- ``collect_profile`` is a sampling profiler that returns collapsed stacks (the format
+  py-spy ``--format raw`` and flamegraph.pl/speedscope consume).
+
+asyncio's own debug mode (``loop.set_debug`` + ``slow_callback_duration``) reports the same
+slow callbacks but also enables coroutine origin tracking and extra checks on every call,
+which is too costly to leave on in production; timing ``Handle._run`` directly keeps the
+same threshold semantics at two ``perf_counter()`` calls per callback.
+"""
+
+import asyncio
+import asyncio.events
+import functools
+import os
+import sys
+import threading
+import time
+from collections import Counter as _Counter
+from typing import Any, Callable, Dict, Optional
+
+import structlog
+from prometheus_client import Counter, Histogram
+
+logger = structlog.get_logger(__name__)
+
+_LOOP_LAG_SECONDS = Histogram(
+    "ai_agent_event_loop_lag_seconds",
+    "How late the event loop woke up a periodic sampler sleep",
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.02, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5),
+)
+_SLOW_CALLBACKS_TOTAL = Counter(
+    "ai_agent_event_loop_slow_callbacks_total",
+    "Event loop callbacks that ran longer than the slow-callback threshold",
+    labelnames=("callback",),
+)
+_STAGE_SECONDS = Histogram(
+    "ai_agent_hot_path_stage_seconds",
+    "Wall time spent in per-frame audio hot-path stages",
+    buckets=(0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1),
+    labelnames=("stage",),
+)
+
+# Slow-callback warnings are rate limited per callback name (counts are always exported).
+_SLOW_LOG_INTERVAL_SEC = 10.0
+
+
+def timed_stage(stage: str) -> Callable:
+    """Decorate a coroutine function so each call is observed in ``ai_agent_hot_path_stage_seconds``."""
+    observe = _STAGE_SECONDS.labels(stage=stage).observe
+
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return await func(*args, **kwargs)
+            finally:
+                observe(time.perf_counter() - start)
+
+        return wrapper
+
+    return decorator
+
+
+def _innermost_frame(coro: Any):
+    """Follow a suspended coroutine's await chain to the frame it is parked in."""
+    frame = None
+    depth = 0
+    while coro is not None and depth < 64:
+        frame = getattr(coro, "cr_frame", None) or getattr(coro, "gi_frame", None) or frame
+        coro = getattr(coro, "cr_await", None) or getattr(coro, "gi_yieldfrom", None)
+        depth += 1
+    return frame
+
+
+def describe_callback(handle: asyncio.Handle) -> "tuple[str, Optional[str]]":
+    """Return ``(name, location)`` for a loop callback.
+
+    ``name`` is bounded (coroutine or callback qualname) and safe as a metric label;
+    ``location`` is where a task is now suspended, i.e. the await right after the slow code.
+    """
+    callback = getattr(handle, "_callback", None)
+    owner = getattr(callback, "__self__", None)
+    if isinstance(owner, asyncio.Task):
+        coro = owner.get_coro()
+        name = getattr(coro, "__qualname__", None) or repr(coro)
+        frame = _innermost_frame(coro)
+        location = None
+        if frame is not None:
+            location = f"{frame.f_code.co_name} ({_short_path(frame.f_code.co_filename)}:{frame.f_lineno})"
+        return name, location
+    name = getattr(callback, "__qualname__", None) or type(callback).__qualname__
+    # Transport read callbacks: the protocol's handler is the code that actually ran.
+    protocol = getattr(owner, "_protocol", None)
+    if protocol is not None:
+        name = f"{name}->{type(protocol).__qualname__}"
+    return name, None
+
+
+def _short_path(filename: str) -> str:
+    parts = filename.replace("\\", "/").rsplit("/", 2)
+    return "/".join(parts[-2:])
+
+
+class LoopMonitor:
+    """Loop-lag sampler and slow-callback detector for the engine's event loop.
+
+    Both are process-wide while started: the lag sampler is a task on the running loop and
+    slow-callback detection wraps ``asyncio.Handle._run``.
+    """
+
+    _installed: Optional["LoopMonitor"] = None
+    _original_run: Optional[Callable] = None
+
+    def __init__(
+        self,
+        interval_sec: Optional[float] = None,
+        slow_callback_sec: Optional[float] = None,
+        enabled: Optional[bool] = None,
+    ):
+        if enabled is None:
+            enabled = os.getenv("LOOP_MONITOR_ENABLED", "true").lower() in ("true", "1", "yes")
+        if interval_sec is None:
+            interval_sec = float(os.getenv("LOOP_LAG_SAMPLE_MS", "100")) / 1000.0
+        if slow_callback_sec is None:
+            slow_callback_sec = float(os.getenv("SLOW_CALLBACK_MS", "100")) / 1000.0
+        self.enabled = enabled
+        self.interval_sec = max(0.001, float(interval_sec))
+        self.slow_callback_sec = max(0.001, float(slow_callback_sec))
+        self.loop_thread_id: Optional[int] = None
+        self.max_lag_sec = 0.0
+        self.samples = 0
+        self.slow_callbacks: "_Counter[str]" = _Counter()
+        self._last_slow_log: Dict[str, float] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """Start sampling on the running loop and install slow-callback detection."""
+        if not self.enabled or self._task is not None:
+            return
+        self.loop_thread_id = threading.get_ident()
+        self._install_handle_hook()
+        self._task = asyncio.get_running_loop().create_task(self._sample_lag())
+        logger.info(
+            "Event loop monitor started",
+            lag_sample_ms=round(self.interval_sec * 1000, 1),
+            slow_callback_ms=round(self.slow_callback_sec * 1000, 1),
+        )
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self._uninstall_handle_hook()
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "samples": self.samples,
+            "max_lag_ms": round(self.max_lag_sec * 1000.0, 3),
+            "slow_callbacks": dict(self.slow_callbacks.most_common(20)),
+        }
+
+    async def _sample_lag(self) -> None:
+        interval = self.interval_sec
+        while True:
+            start = time.perf_counter()
+            await asyncio.sleep(interval)
+            lag = max(0.0, time.perf_counter() - start - interval)
+            _LOOP_LAG_SECONDS.observe(lag)
+            self.samples += 1
+            if lag > self.max_lag_sec:
+                self.max_lag_sec = lag
+
+    def _install_handle_hook(self) -> None:
+        cls = LoopMonitor
+        if cls._original_run is None:
+            cls._original_run = asyncio.events.Handle._run
+            original = cls._original_run
+
+            def _run(handle):
+                start = time.perf_counter()
+                try:
+                    return original(handle)
+                finally:
+                    elapsed = time.perf_counter() - start
+                    monitor = cls._installed
+                    if monitor is not None and elapsed >= monitor.slow_callback_sec:
+                        monitor._on_slow_callback(handle, elapsed)
+
+            asyncio.events.Handle._run = _run
+        cls._installed = self
+
+    def _uninstall_handle_hook(self) -> None:
+        cls = LoopMonitor
+        if cls._installed is not self:
+            return
+        cls._installed = None
+        if cls._original_run is not None:
+            asyncio.events.Handle._run = cls._original_run
+            cls._original_run = None
+
+    def _on_slow_callback(self, handle: asyncio.Handle, elapsed: float) -> None:
+        try:
+            name, location = describe_callback(handle)
+            self.slow_callbacks[name] += 1
+            _SLOW_CALLBACKS_TOTAL.labels(callback=name).inc()
+            now = time.monotonic()
+            if now - self._last_slow_log.get(name, 0.0) >= _SLOW_LOG_INTERVAL_SEC:
+                self._last_slow_log[name] = now
+                logger.warning(
+                    "Slow event loop callback",
+                    callback=name,
+                    suspended_at=location,
+                    duration_ms=round(elapsed * 1000.0, 1),
+                    total=self.slow_callbacks[name],
+                )
+        except Exception:
+            pass
+
+
+def collect_profile(
+    seconds: float,
+    *,
+    interval_sec: float = 0.005,
+    thread_id: Optional[int] = None,
+    lineno: bool = True,
+) -> str:
+    """Sample Python stacks for ``seconds`` and return collapsed stacks.
+
+    Blocking: run it in an executor. Each output line is ``thread;frame;...;leaf count``
+    with frames formatted as ``function (dir/file.py:line)`` like py-spy. Only
+    ``thread_id`` is sampled when given (e.g. the event loop thread); otherwise every
+    thread except the sampler itself.
+    """
+    me = threading.get_ident()
+    names = {t.ident: t.name for t in threading.enumerate()}
+    stacks: "_Counter[str]" = _Counter()
+    deadline = time.perf_counter() + max(0.0, seconds)
+    while True:
+        for ident, frame in sys._current_frames().items():
+            if ident == me or (thread_id is not None and ident != thread_id):
+                continue
+            frames = []
+            while frame is not None:
+                code = frame.f_code
+                if lineno:
+                    frames.append(f"{code.co_name} ({_short_path(code.co_filename)}:{frame.f_lineno})")
+                else:
+                    frames.append(f"{code.co_name} ({_short_path(code.co_filename)})")
+                frame = frame.f_back
+            frames.append(names.get(ident) or f"thread-{ident}")
+            stacks[";".join(reversed(frames))] += 1
+        if time.perf_counter() >= deadline:
+            break
+        time.sleep(interval_sec)
+    return "".join(f"{stack} {count}\n" for stack, count in stacks.most_common())
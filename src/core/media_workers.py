@@ -0,0 +1,593 @@
+"""
+Media workers: per-call DSP chains off the event loop (opt-in, ``media_workers:``).
+
+Inline, every audio transform for every call runs on the engine's event loop, so a
+burst of DSP for one call (a large provider chunk to resample, say) delays the 20 ms
+pacing of all the others. With media workers enabled, each call is pinned to one
+worker that owns its DSP state (resampler carry, etc.) and runs its chain; the loop
+keeps signalling and network I/O and awaits the result.
+
+Two worker kinds share the same chain (``MediaChain``):
+
+- ``process`` (default): worker processes. Frames and results travel through
+  shared-memory ring buffers (``ShmRing``, one each way per worker); ring positions
+  travel over pipes, which double as doorbells. Positions are only trusted after the
+  pipe read, so payload visibility never depends on the CPU's memory ordering.
+  Doorbells are coalesced per loop iteration, so many calls' frames share a syscall.
+- ``thread``: worker threads. Cheaper hops, but pure-Python/audioop DSP still holds
+  the GIL; useful when the work is numpy on large chunks.
+
+Per-call ordering holds because a call always maps to the same worker and each
+worker is FIFO. Stages are opt-in (``stages``): a 20 ms ingress frame costs a few
+microseconds inline, less than the hop, so only ``provider_out`` is offloaded by
+default.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import audioop
+import collections
+import multiprocessing
+import os
+import queue
+import struct
+import threading
+from multiprocessing import shared_memory
+from typing import Any, Deque, Dict, List, Optional, Sequence, Tuple
+
+import structlog
+
+from ..audio.resampler import resample_audio
+
+logger = structlog.get_logger(__name__)
+
+STAGES = ("ingress", "provider_out")
+
+OP_INGRESS = 1
+OP_PROVIDER_OUT = 2
+OP_FORGET = 3
+
+_ULAW_NAMES = ("ulaw", "mulaw", "g711_ulaw", "mu-law")
+_PCM_NAMES = ("linear16", "pcm16", "slin", "slin16")
+_ENC_PCM = 0
+_ENC_ULAW = 1
+_ENC_OTHER = 2
+
+_JOB = struct.Struct("<QIBBBxII")  # seq, slot, op, encoding, swap, rate, wire_rate
+_RESULT = struct.Struct("<QIii")  # seq, rate, rms, dc
+_BELL = struct.Struct("<QQ")  # producer head of my ring, consumer tail of the peer's ring
+_LEN = struct.Struct("<I")
+_WRAP = 0xFFFFFFFF
+
+
+class MediaWorkerError(RuntimeError):
+    """A media worker is gone; callers fall back to inline processing."""
+
+
+def _encoding_code(encoding: Optional[str]) -> int:
+    enc = (encoding or "").lower()
+    if enc in _ULAW_NAMES:
+        return _ENC_ULAW
+    if enc in _PCM_NAMES:
+        return _ENC_PCM
+    return _ENC_OTHER
+
+
+def _levels(pcm: bytes) -> Tuple[int, int]:
+    if not pcm:
+        return 0, 0
+    return audioop.rms(pcm, 2), audioop.avg(pcm, 2)
+
+
+def condition_ingress(audio: bytes, encoding: str, rate: int, swap: bool) -> Tuple[bytes, int, int, int]:
+    """
+    Wire audio -> DC-free PCM16-LE plus its (rms, dc) for ``transport_in`` diagnostics.
+
+    ``rate`` is the wire rate (μ-law is always 8 kHz). Returns (pcm, rate, rms, dc).
+    """
+    try:
+        if _encoding_code(encoding) == _ENC_ULAW:
+            pcm, rate = audioop.ulaw2lin(audio, 2), 8000
+        else:
+            pcm = audioop.byteswap(audio, 2) if swap else audio
+    except Exception:
+        pcm = b""
+    if pcm:
+        # Remove DC bias only; a stateful DC-block filter degraded levels over a call.
+        try:
+            mean = int(audioop.avg(pcm, 2))
+            if mean:
+                pcm = audioop.bias(pcm, 2, -mean)
+        except Exception:
+            pass
+    rms, dc = _levels(pcm)
+    return pcm, rate, rms, dc
+
+
+class MediaChain:
+    """One call's DSP state and stages; lives wherever the call's worker runs."""
+
+    __slots__ = ("provider_out_state",)
+
+    def __init__(self) -> None:
+        self.provider_out_state: Optional[tuple] = None
+
+    def provider_out(self, chunk: bytes, encoding: str, rate: int, wire_rate: int) -> Tuple[bytes, int, int, int]:
+        """
+        Provider audio -> (chunk, rate, rms, dc). Levels are measured on the provider's
+        own format (``provider_out`` diagnostics); PCM is resampled to ``wire_rate``
+        with this call's carry state.
+        """
+        code = _encoding_code(encoding)
+        try:
+            rms, dc = _levels(audioop.ulaw2lin(chunk, 2) if code == _ENC_ULAW else chunk)
+        except Exception:
+            rms, dc = 0, 0
+        if code == _ENC_PCM and rate and wire_rate and rate != wire_rate:
+            chunk, self.provider_out_state = resample_audio(chunk, rate, wire_rate, state=self.provider_out_state)
+            rate = wire_rate
+        return chunk, rate, rms, dc
+
+
+def _run(chains: Dict[int, MediaChain], slot: int, op: int, encoding: str, swap: bool, rate: int, wire_rate: int, payload: bytes):
+    """Execute one job; returns (payload, rate, rms, dc) or None for control ops."""
+    if op == OP_FORGET:
+        chains.pop(slot, None)
+        return None
+    if op == OP_INGRESS:
+        return condition_ingress(payload, encoding, rate, swap)
+    chain = chains.get(slot)
+    if chain is None:
+        chain = chains[slot] = MediaChain()
+    return chain.provider_out(payload, encoding, rate, wire_rate)
+
+
+# ---------------------------------------------------------------------------
+# Shared-memory ring
+# ---------------------------------------------------------------------------
+
+
+def _align(n: int) -> int:
+    return (n + 7) & ~7
+
+
+class ShmRing:
+    """
+    Single-producer/single-consumer record ring over a SharedMemory block.
+
+    Positions are monotonically increasing byte counters held by each side; the
+    producer learns the consumer's tail (and vice versa) from doorbell messages.
+    """
+
+    def __init__(self, size: int, name: Optional[str] = None) -> None:
+        """Create a ring of ``size`` bytes, or attach to ``name`` (same ``size``)."""
+        size = _align(max(4096, int(size)))
+        if name is None:
+            self.shm = shared_memory.SharedMemory(create=True, size=size)
+            self._owner = True
+        else:
+            self.shm = shared_memory.SharedMemory(name=name)
+            self._owner = False
+        self.capacity = size
+        self.max_record = size // 4
+        self.head = 0
+        self.tail = 0
+
+    @property
+    def name(self) -> str:
+        return self.shm.name
+
+    def try_put(self, parts: Sequence[bytes]) -> bool:
+        size = sum(len(p) for p in parts)
+        need = _align(_LEN.size + size)
+        if need > self.max_record:
+            raise ValueError(f"record of {size} bytes exceeds ring limit {self.max_record}")
+        offset = self.head % self.capacity
+        skip = self.capacity - offset if offset + need > self.capacity else 0
+        if self.head + skip + need - self.tail > self.capacity:
+            return False
+        buf = self.shm.buf
+        if skip:
+            _LEN.pack_into(buf, offset, _WRAP)
+            self.head += skip
+            offset = 0
+        _LEN.pack_into(buf, offset, size)
+        pos = offset + _LEN.size
+        for part in parts:
+            buf[pos:pos + len(part)] = part
+            pos += len(part)
+        self.head += need
+        return True
+
+    def get(self, limit: int) -> Optional[bytes]:
+        """Next record below producer position ``limit``, or None."""
+        if self.tail >= limit:
+            return None
+        buf = self.shm.buf
+        offset = self.tail % self.capacity
+        (size,) = _LEN.unpack_from(buf, offset)
+        if size == _WRAP:
+            self.tail += self.capacity - offset
+            offset = 0
+            (size,) = _LEN.unpack_from(buf, offset)
+        start = offset + _LEN.size
+        record = bytes(buf[start:start + size])
+        self.tail += _align(_LEN.size + size)
+        return record
+
+    def close(self) -> None:
+        try:
+            self.shm.close()
+            if self._owner:
+                self.shm.unlink()
+        except Exception:
+            pass
+
+
+def _read_bells(fd: int) -> Optional[List[Tuple[int, int]]]:
+    """
+    Pending doorbells on ``fd`` (None on EOF). Bells are written whole (< PIPE_BUF),
+    so reads always return a multiple of the message size.
+    """
+    try:
+        data = os.read(fd, _BELL.size * 512)
+    except BlockingIOError:
+        return []
+    if not data:
+        return None
+    return list(_BELL.iter_unpack(data))
+
+
+def _process_worker_main(jobs_name: str, results_name: str, ring_bytes: int, rx, tx) -> None:
+    """Worker process: run jobs from the jobs ring, publish results to the results ring."""
+    jobs = ShmRing(ring_bytes, name=jobs_name)
+    results = ShmRing(ring_bytes, name=results_name)
+    rx_fd, tx_fd = rx.fileno(), tx.fileno()
+    chains: Dict[int, MediaChain] = {}
+    jobs_limit = 0
+    encodings = {_ENC_PCM: "slin16", _ENC_ULAW: "ulaw", _ENC_OTHER: ""}
+    try:
+        while True:
+            bells = _read_bells(rx_fd)
+            if bells is None:
+                return
+            for head, tail in bells:
+                jobs_limit = max(jobs_limit, head)
+                results.tail = max(results.tail, tail)
+            while True:
+                record = jobs.get(jobs_limit)
+                if record is None:
+                    break
+                seq, slot, op, enc, swap, rate, wire_rate = _JOB.unpack_from(record)
+                try:
+                    out = _run(chains, slot, op, encodings[enc], bool(swap), rate, wire_rate, record[_JOB.size:])
+                except Exception:
+                    out = (b"", 0, -1, 0)  # rms=-1 marks a failed job
+                if out is None:
+                    continue
+                payload, out_rate, rms, dc = out
+                parts = (_RESULT.pack(seq, out_rate, rms, dc), payload)
+                while not results.try_put(parts):
+                    # Results ring full: publish what we have, wait for the engine to consume.
+                    os.write(tx_fd, _BELL.pack(results.head, jobs.tail))
+                    bells = _read_bells(rx_fd)
+                    if bells is None:
+                        return
+                    for head, tail in bells:
+                        jobs_limit = max(jobs_limit, head)
+                        results.tail = max(results.tail, tail)
+            os.write(tx_fd, _BELL.pack(results.head, jobs.tail))
+    except (BrokenPipeError, KeyboardInterrupt):
+        return
+    finally:
+        jobs.close()
+        results.close()
+        rx.close()
+        tx.close()
+
+
+class _ProcessWorker:
+    """Engine side of one worker process."""
+
+    def __init__(self, index: int, ring_bytes: int) -> None:
+        self.index = index
+        self.ring_bytes = ring_bytes
+        self.calls = 0
+        self.alive = False
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._jobs: Optional[ShmRing] = None
+        self._results: Optional[ShmRing] = None
+        self._process = None
+        self._conns: List[Any] = []
+        self._tx = self._rx = -1
+        self._seq = 0
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._backlog: Deque[Tuple[Tuple[bytes, bytes], Optional[asyncio.Future], int]] = collections.deque()
+        self._results_limit = 0
+        self._reported_tail = 0
+        self._bell_scheduled = False
+
+    def start(self, loop: asyncio.AbstractEventLoop) -> None:
+        self._loop = loop
+        self._jobs = ShmRing(self.ring_bytes)
+        self._results = ShmRing(self.ring_bytes)
+        # spawn, not fork: the engine process has threads and a running loop. Pipe
+        # connections are passed to the child by multiprocessing; only their fds are
+        # used (raw doorbell messages, no pickling).
+        ctx = multiprocessing.get_context("spawn")
+        to_worker_r, to_worker_w = ctx.Pipe(duplex=False)
+        from_worker_r, from_worker_w = ctx.Pipe(duplex=False)
+        self._process = ctx.Process(
+            target=_process_worker_main,
+            args=(self._jobs.name, self._results.name, self._jobs.capacity, to_worker_r, from_worker_w),
+            name=f"media-worker-{self.index}",
+            daemon=True,
+        )
+        self._process.start()
+        to_worker_r.close()
+        from_worker_w.close()
+        self._conns = [to_worker_w, from_worker_r]
+        self._tx, self._rx = to_worker_w.fileno(), from_worker_r.fileno()
+        os.set_blocking(self._rx, False)
+        loop.add_reader(self._rx, self._on_readable)
+        self.alive = True
+
+    def submit(self, slot: int, op: int, encoding: int, swap: bool, rate: int, wire_rate: int, payload: bytes) -> Optional[asyncio.Future]:
+        if not self.alive:
+            raise MediaWorkerError(f"media worker {self.index} is not running")
+        self._seq += 1
+        fut = None if op == OP_FORGET else self._loop.create_future()
+        parts = (_JOB.pack(self._seq, slot, op, encoding, int(bool(swap)), rate, wire_rate), payload)
+        if self._backlog or not self._jobs.try_put(parts):
+            self._backlog.append((parts, fut, self._seq))
+        elif fut is not None:
+            self._pending[self._seq] = fut
+        self._ring_bell()
+        return fut
+
+    def _ring_bell(self) -> None:
+        if not self._bell_scheduled:
+            self._bell_scheduled = True
+            self._loop.call_soon(self._send_bell)
+
+    def _send_bell(self) -> None:
+        self._bell_scheduled = False
+        if not self.alive:
+            return
+        try:
+            os.write(self._tx, _BELL.pack(self._jobs.head, self._results.tail))
+            self._reported_tail = self._results.tail
+        except OSError:
+            self._fail(MediaWorkerError(f"media worker {self.index} pipe closed"))
+
+    def _on_readable(self) -> None:
+        try:
+            bells = _read_bells(self._rx)
+        except OSError:
+            bells = None
+        if bells is None:
+            self._fail(MediaWorkerError(f"media worker {self.index} exited"))
+            return
+        for head, tail in bells:
+            self._results_limit = max(self._results_limit, head)
+            self._jobs.tail = max(self._jobs.tail, tail)
+        while True:
+            record = self._results.get(self._results_limit)
+            if record is None:
+                break
+            seq, rate, rms, dc = _RESULT.unpack_from(record)
+            fut = self._pending.pop(seq, None)
+            if fut is not None and not fut.done():
+                if rms < 0:
+                    fut.set_exception(MediaWorkerError("media job failed in worker"))
+                else:
+                    fut.set_result((record[_RESULT.size:], rate, rms, dc))
+        moved = False
+        while self._backlog and self._jobs.try_put(self._backlog[0][0]):
+            _, fut, seq = self._backlog.popleft()
+            if fut is not None:
+                self._pending[seq] = fut
+            moved = True
+        if moved or self._results.tail - self._reported_tail > self._results.capacity // 4:
+            self._ring_bell()
+
+    def _fail(self, error: Exception, *, expected: bool = False) -> None:
+        if not self.alive:
+            return
+        self.alive = False
+        if not expected:
+            logger.error("Media worker stopped; its calls fall back to inline DSP", worker=self.index, error=str(error))
+        try:
+            self._loop.remove_reader(self._rx)
+        except Exception:
+            pass
+        pending = list(self._pending.values()) + [fut for _, fut, _ in self._backlog if fut is not None]
+        self._pending.clear()
+        self._backlog.clear()
+        for fut in pending:
+            if not fut.done():
+                fut.set_exception(error)
+
+    async def close(self) -> None:
+        if self._loop is not None and self.alive:
+            self._fail(MediaWorkerError("media workers closing"), expected=True)
+        # Closing our end of the job pipe is the worker's signal to exit.
+        for conn in self._conns:
+            conn.close()
+        self._conns = []
+        self._tx = self._rx = -1
+        if self._process is not None:
+            await asyncio.get_running_loop().run_in_executor(None, self._process.join, 5)
+            if self._process.is_alive():
+                self._process.terminate()
+        for ring in (self._jobs, self._results):
+            if ring is not None:
+                ring.close()
+
+    def depth(self) -> int:
+        return len(self._pending) + len(self._backlog)
+
+
+class _ThreadWorker:
+    """One worker thread with a FIFO job queue."""
+
+    _STOP = object()
+
+    def __init__(self, index: int) -> None:
+        self.index = index
+        self.calls = 0
+        self.alive = False
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queue: "queue.SimpleQueue[Any]" = queue.SimpleQueue()
+        self._thread: Optional[threading.Thread] = None
+        self._depth = 0
+
+    def start(self, loop: asyncio.AbstractEventLoop) -> None:
+        self._loop = loop
+        self._thread = threading.Thread(target=self._main, name=f"media-worker-{self.index}", daemon=True)
+        self._thread.start()
+        self.alive = True
+
+    def submit(self, slot: int, op: int, encoding: int, swap: bool, rate: int, wire_rate: int, payload: bytes) -> Optional[asyncio.Future]:
+        if not self.alive:
+            raise MediaWorkerError(f"media worker {self.index} is not running")
+        fut = None if op == OP_FORGET else self._loop.create_future()
+        self._depth += fut is not None
+        self._queue.put((fut, slot, op, encoding, swap, rate, wire_rate, payload))
+        return fut
+
+    def _main(self) -> None:
+        chains: Dict[int, MediaChain] = {}
+        encodings = {_ENC_PCM: "slin16", _ENC_ULAW: "ulaw", _ENC_OTHER: ""}
+        while True:
+            job = self._queue.get()
+            if job is self._STOP:
+                return
+            fut, slot, op, enc, swap, rate, wire_rate, payload = job
+            try:
+                out = _run(chains, slot, op, encodings[enc], swap, rate, wire_rate, payload)
+                error = None
+            except Exception as exc:
+                out, error = None, exc
+            if fut is not None:
+                self._loop.call_soon_threadsafe(self._resolve, fut, out, error)
+
+    def _resolve(self, fut: asyncio.Future, out, error) -> None:
+        self._depth -= 1
+        if fut.done():
+            return
+        if error is not None:
+            fut.set_exception(MediaWorkerError(f"media job failed: {error}"))
+        else:
+            fut.set_result(out)
+
+    async def close(self) -> None:
+        if self._thread is not None:
+            self.alive = False
+            self._queue.put(self._STOP)
+            await asyncio.get_running_loop().run_in_executor(None, self._thread.join, 5)
+
+    def depth(self) -> int:
+        return self._depth
+
+
+class MediaWorkerPool:
+    """Routes each call's DSP stages to a pinned worker."""
+
+    def __init__(
+        self,
+        *,
+        mode: str = "process",
+        workers: int = 2,
+        ring_bytes: int = 1 << 20,
+        stages: Sequence[str] = ("provider_out",),
+    ) -> None:
+        mode = (mode or "process").strip().lower()
+        if mode not in ("process", "thread"):
+            raise ValueError(f"Unknown media_workers.mode: {mode!r} (expected 'process' or 'thread')")
+        unknown = set(stages) - set(STAGES)
+        if unknown:
+            raise ValueError(f"Unknown media_workers.stages: {sorted(unknown)} (expected {list(STAGES)})")
+        self.mode = mode
+        self.stages = frozenset(stages)
+        count = max(1, int(workers))
+        if mode == "process":
+            self._workers: List[Any] = [_ProcessWorker(i, ring_bytes) for i in range(count)]
+        else:
+            self._workers = [_ThreadWorker(i) for i in range(count)]
+        self._calls: Dict[str, Tuple[Any, int]] = {}
+        self._next_slot = 0
+        self.started = False
+
+    @classmethod
+    def from_config(cls, cfg: Any) -> Optional["MediaWorkerPool"]:
+        if not cfg or not getattr(cfg, "enabled", False):
+            return None
+        return cls(
+            mode=getattr(cfg, "mode", "process"),
+            workers=getattr(cfg, "workers", 2),
+            ring_bytes=int(getattr(cfg, "ring_kb", 1024)) * 1024,
+            stages=tuple(getattr(cfg, "stages", None) or ("provider_out",)),
+        )
+
+    def handles(self, stage: str) -> bool:
+        return self.started and stage in self.stages
+
+    async def start(self) -> None:
+        loop = asyncio.get_running_loop()
+        for worker in self._workers:
+            worker.start(loop)
+        self.started = True
+        logger.info("Media workers started", mode=self.mode, workers=len(self._workers), stages=sorted(self.stages))
+
+    async def close(self) -> None:
+        self.started = False
+        for worker in self._workers:
+            await worker.close()
+        self._calls.clear()
+
+    def _route(self, call_id: str) -> Tuple[Any, int]:
+        entry = self._calls.get(call_id)
+        if entry is None or not entry[0].alive:
+            live = [w for w in self._workers if w.alive]
+            if not live:
+                raise MediaWorkerError("no media workers running")
+            worker = min(live, key=lambda w: w.calls)
+            self._next_slot = (self._next_slot + 1) & 0xFFFFFFFF
+            entry = self._calls[call_id] = (worker, self._next_slot)
+            worker.calls += 1
+        return entry
+
+    async def ingress(self, call_id: str, audio: bytes, encoding: str, rate: int, swap: bool) -> Tuple[bytes, int, int, int]:
+        """Offloaded ``condition_ingress``: (pcm, rate, rms, dc)."""
+        worker, slot = self._route(call_id)
+        return await worker.submit(slot, OP_INGRESS, _encoding_code(encoding), swap, int(rate or 0), 0, audio)
+
+    async def provider_out(self, call_id: str, chunk: bytes, encoding: str, rate: int, wire_rate: int) -> Tuple[bytes, int, int, int]:
+        """Offloaded ``MediaChain.provider_out``: (chunk, rate, rms, dc)."""
+        worker, slot = self._route(call_id)
+        return await worker.submit(
+            slot, OP_PROVIDER_OUT, _encoding_code(encoding), False, int(rate or 0), int(wire_rate or 0), chunk
+        )
+
+    def forget(self, call_id: str) -> None:
+        entry = self._calls.pop(call_id, None)
+        if entry is None:
+            return
+        worker, slot = entry
+        worker.calls -= 1
+        if worker.alive:
+            try:
+                worker.submit(slot, OP_FORGET, 0, False, 0, 0, b"")
+            except MediaWorkerError:
+                pass
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "mode": self.mode,
+            "stages": sorted(self.stages),
+            "workers": [
+                {"index": w.index, "alive": w.alive, "calls": w.calls, "queued": w.depth()} for w in self._workers
+            ],
+        }
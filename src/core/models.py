@@ -155,6 +155,7 @@ class CallSession:
     # Call history tracking (Milestone 21)
     tool_calls: List[Dict[str, Any]] = field(default_factory=list)  # [{name, params, result, timestamp, duration_ms}]
     turn_latencies_ms: List[float] = field(default_factory=list)    # Per-turn latency tracking
+    latency_trace: Dict[str, Any] = field(default_factory=dict)      # Waterfall summary from core.tracing
     barge_in_count: int = 0                                          # Total barge-in attempts
     error_message: Optional[str] = None                              # Error if call failed
     transfer_destination: Optional[str] = None                       # Transfer target if transferred
@@ -7,10 +7,14 @@ token-aware gating.
 """
 
 import asyncio
+import hashlib
 import time
 import os
 import inspect
-from typing import Optional, Dict, TYPE_CHECKING
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Optional, Dict, List, Set, TYPE_CHECKING
 import structlog
 
 from src.core.session_store import SessionStore
@@ -21,6 +25,60 @@ if TYPE_CHECKING:  # pragma: no cover - typing only
 
 logger = structlog.get_logger(__name__)
 
+# Cached media files are named by shard and content hash so identical prompts share one
+# file and each engine shard only ever sweeps its own files in the shared media dir.
+_CACHE_FILE_PREFIX = "audio-cache-"
+# μ-law @ 8kHz: 20ms frames of 160 bytes; segments are cut on frame boundaries.
+_FRAME_BYTES = 160
+
+
+def _digest(audio_bytes: bytes) -> str:
+    return hashlib.blake2b(audio_bytes, digest_size=16).hexdigest()
+
+
+def _write_file(file_path: str, audio_bytes: bytes) -> None:
+    with open(file_path, 'wb') as f:
+        f.write(audio_bytes)
+
+
+def _remove_files(paths: List[str]) -> int:
+    removed = 0
+    for path in paths:
+        try:
+            os.remove(path)
+            removed += 1
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning("Error cleaning up audio file", file_path=path, error=str(e))
+    return removed
+
+
+@dataclass
+class _CachedMedia:
+    """A content-addressed media file shared by every playback of identical audio."""
+    path: str
+    size: int
+    ready: "asyncio.Future"
+    refs: int = 0
+    last_used: float = field(default_factory=time.time)
+
+    @property
+    def written(self) -> bool:
+        return self.ready.done() and not self.ready.cancelled() and self.ready.exception() is None
+
+
+@dataclass
+class _SegmentChain:
+    """Remaining sound files of a long response, played back-to-back via PlaybackFinished."""
+    playback_id: str
+    call_id: str
+    pending: List["asyncio.Task"]
+    index: int = 0
+
+    def segment_id(self, index: int) -> str:
+        return self.playback_id if index == 0 else f"{self.playback_id}-seg{index}"
+
 
 class PlaybackManager:
     """
@@ -32,6 +90,12 @@ class PlaybackManager:
     - Handle token/refcount gating
     - Track active playbacks
     - Provide fallback mechanisms
+
+    File I/O never runs on the event loop: media files are written and deleted on a
+    small dedicated thread pool. Identical audio (greetings, wait/farewell prompts) is
+    written once and reused by content hash, released files are deleted in background
+    batches, and long responses can be split into segments so playback starts as soon
+    as the first one is on disk.
     """
     
     def __init__(
@@ -40,11 +104,45 @@ class PlaybackManager:
         ari_client,
         media_dir: str = "/mnt/asterisk_media/ai-generated",
         conversation_coordinator: Optional["ConversationCoordinator"] = None,
+        media_cache_bytes: Optional[int] = None,
+        segment_seconds: Optional[float] = None,
+        cleanup_interval_sec: Optional[float] = None,
+        cache_ttl_sec: float = 600.0,
+        shard_index: int = 0,
     ):
         self.session_store = session_store
         self.ari_client = ari_client
         self.media_dir = media_dir
         self.conversation_coordinator = conversation_coordinator
+
+        if media_cache_bytes is None:
+            media_cache_bytes = int(float(os.getenv("PLAYBACK_MEDIA_CACHE_MB", "16")) * 1024 * 1024)
+        if segment_seconds is None:
+            segment_seconds = float(os.getenv("PLAYBACK_SEGMENT_SECONDS", "0"))
+        if cleanup_interval_sec is None:
+            cleanup_interval_sec = float(os.getenv("PLAYBACK_CLEANUP_INTERVAL_SECONDS", "2.0"))
+        self._cache_limit_bytes = max(0, int(media_cache_bytes))
+        self._segment_bytes = max(0, int(segment_seconds * 8000) // _FRAME_BYTES * _FRAME_BYTES)
+        self._cleanup_interval_sec = max(0.05, float(cleanup_interval_sec))
+        self._cache_ttl_sec = float(cache_ttl_sec)
+
+        # Writes that gate time-to-first-audio get their own pool; later segments and
+        # deletes queue on a background worker so they never delay another call's start.
+        self._io_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="playback-io")
+        self._background_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="playback-bg")
+        # Content hash -> cached file, least recently used first.
+        self._media_cache: "OrderedDict[str, _CachedMedia]" = OrderedDict()
+        self._cache_paths: Dict[str, str] = {}
+        self._cache_bytes = 0
+        self._pending_deletes: List[str] = []
+        self._cleanup_task: Optional[asyncio.Task] = None
+        self._orphans_swept = False
+        self._started_at = time.time()
+        self._cache_prefix = f"{_CACHE_FILE_PREFIX}s{int(shard_index)}-"
+        # Logical playback_id -> remaining segments, and ARI segment id -> logical playback_id.
+        self._chains: Dict[str, _SegmentChain] = {}
+        self._segment_owner: Dict[str, str] = {}
+        self._release_tasks: Set[asyncio.Task] = set()
         
         # Ensure media directory exists
         # Note: Directory should be set up with setgid bit by preflight.sh
@@ -99,7 +197,9 @@ class PlaybackManager:
         self._playback_seq = 0
 
         logger.info("PlaybackManager initialized",
-                   media_dir=self.media_dir)
+                   media_dir=self.media_dir,
+                   media_cache_bytes=self._cache_limit_bytes,
+                   segment_bytes=self._segment_bytes)
     
     async def play_audio(self, call_id: str, audio_bytes: bytes, 
                         playback_type: str = "response") -> Optional[str]:
@@ -126,10 +226,14 @@ class PlaybackManager:
             # Generate deterministic playback ID
             playback_id = self._generate_playback_id(call_id, playback_type)
             
-            # Create audio file
-            audio_file = await self._create_audio_file(audio_bytes, playback_id)
+            # Create audio file (only the first segment when the response is split;
+            # the rest are written in the background while it plays)
+            segments = self._split_segments(audio_bytes)
+            audio_file = await self._create_audio_file(segments[0], playback_id)
             if not audio_file:
                 return None
+            if len(segments) > 1:
+                self._start_chain(call_id, playback_id, segments[1:])
             
             # Set TTS gating before playing (via coordinator if available)
             gating_success = True
@@ -146,6 +250,8 @@ class PlaybackManager:
                 )
                 if self.conversation_coordinator:
                     await self.conversation_coordinator.update_conversation_state(call_id, "listening")
+                await self._abort_chain(playback_id)
+                await self._cleanup_audio_file(audio_file)
                 return None
             
             # Create playback reference
@@ -173,15 +279,18 @@ class PlaybackManager:
                     await self.conversation_coordinator.update_conversation_state(call_id, "listening")
                 else:
                     await self.session_store.clear_gating_token(call_id, playback_id)
+                await self._abort_chain(playback_id)
+                await self._cleanup_audio_file(audio_file)
                 return None
             
             # Schedule token-aware fallback to ensure gating is cleared even if PlaybackFinished is missed
-            await self._schedule_gating_fallback(call_id, playback_id, len(audio_bytes))
+            await self._schedule_gating_fallback(call_id, playback_id, len(audio_bytes), segments=len(segments))
             
             logger.info("🔊 AUDIO PLAYBACK - Started",
                        call_id=call_id,
                        playback_id=playback_id,
                        audio_size=len(audio_bytes),
+                       segments=len(segments),
                        playback_type=playback_type)
             
             return playback_id
@@ -212,6 +321,20 @@ class PlaybackManager:
                              playback_id=playback_id)
                 return False
             
+            # Clean up audio file
+            await self._cleanup_audio_file(playback_ref.audio_file)
+
+            # Segmented responses: gating belongs to the logical playback and stays
+            # held until the last segment finishes.
+            segment_id = playback_id
+            playback_id = self._segment_owner.pop(segment_id, segment_id)
+            if await self._advance_chain(playback_id):
+                logger.debug("🔊 PlaybackFinished - Segment completed, next segment started",
+                            playback_id=playback_id,
+                            segment_id=segment_id,
+                            call_id=playback_ref.call_id)
+                return True
+            
             # Clear TTS gating token
             if self.conversation_coordinator:
                 success = await self.conversation_coordinator.on_tts_end(
@@ -227,9 +350,6 @@ class PlaybackManager:
                 success = await self.session_store.clear_gating_token(
                     playback_ref.call_id, playback_id)
             
-            # Clean up audio file
-            await self._cleanup_audio_file(playback_ref.audio_file)
-            
             logger.info("🔊 PlaybackFinished - Audio playback completed",
                        playback_id=playback_id,
                        call_id=playback_ref.call_id,
@@ -258,14 +378,14 @@ class PlaybackManager:
         (which stops playback and clears gating tokens).
 
         Completion conditions:
-        - PlaybackRef removed from SessionStore, OR
+        - PlaybackRef removed from SessionStore (and no segments left to play), OR
         - Gating token cleared for this playback_id.
         """
         try:
             deadline = time.time() + max(0.0, float(timeout_sec))
             while time.time() < deadline:
                 playback_ref = await self.session_store.get_playback(playback_id)
-                if not playback_ref:
+                if not playback_ref and playback_id not in self._chains:
                     return True
                 session = await self.session_store.get_by_call_id(call_id)
                 if session:
@@ -291,16 +411,21 @@ class PlaybackManager:
         suffix = f"-{self._playback_seq}" if self._playback_seq else ""
         return f"{playback_type}:{call_id}:{ts}{suffix}"
     
-    async def _create_audio_file(self, audio_bytes: bytes, playback_id: str) -> Optional[str]:
-        """Create audio file from bytes."""
+    async def _create_audio_file(self, audio_bytes: bytes, playback_id: str,
+                                 background: bool = False) -> Optional[str]:
+        """Create audio file from bytes, reusing an identical cached file when possible."""
         try:
-            # Generate unique filename
-            filename = f"audio-{playback_id.replace(':', '-')}.ulaw"
-            file_path = os.path.join(self.media_dir, filename)
-            
-            # Write audio data
-            with open(file_path, 'wb') as f:
-                f.write(audio_bytes)
+            loop = asyncio.get_running_loop()
+            executor = self._background_executor if background else self._io_executor
+            if self._cache_limit_bytes <= 0:
+                # Generate unique filename
+                filename = f"audio-{playback_id.replace(':', '-')}.ulaw"
+                file_path = os.path.join(self.media_dir, filename)
+                await loop.run_in_executor(executor, _write_file, file_path, audio_bytes)
+            else:
+                # Hashing runs at ~1 GB/s (well under a thread hop for a spoken response),
+                # so cache hits never leave the loop.
+                file_path = await self._acquire_cached_file(_digest(audio_bytes), audio_bytes, executor)
             
             # Set file permissions for Asterisk readability via group
             # Files inherit group ownership from setgid directory (set up by preflight.sh)
@@ -319,6 +444,151 @@ class PlaybackManager:
                         error=str(e),
                         exc_info=True)
             return None
+
+    async def _acquire_cached_file(self, digest: str, audio_bytes: bytes, executor: ThreadPoolExecutor) -> str:
+        """Return the cached file for this content, writing it once if needed.
+
+        Concurrent requests for the same content share the in-flight write. Each
+        successful call holds a reference that ``_cleanup_audio_file`` releases.
+        """
+        entry = self._media_cache.get(digest)
+        if entry is None:
+            filename = f"{self._cache_prefix}{digest}.ulaw"
+            file_path = os.path.join(self.media_dir, filename)
+            loop = asyncio.get_running_loop()
+            entry = _CachedMedia(
+                path=file_path,
+                size=len(audio_bytes),
+                ready=loop.run_in_executor(executor, _write_file, file_path, audio_bytes),
+            )
+            self._media_cache[digest] = entry
+            self._cache_paths[file_path] = digest
+            self._cache_bytes += entry.size
+        else:
+            self._media_cache.move_to_end(digest)
+        entry.refs += 1
+        entry.last_used = time.time()
+        try:
+            await asyncio.shield(entry.ready)
+        except BaseException:
+            entry.refs -= 1
+            if entry.ready.done() and not entry.written:
+                # Failed write: forget it so the next request retries, and remove any partial file.
+                if self._media_cache.get(digest) is entry:
+                    self._drop_cache_entry(digest, entry)
+                    self._queue_delete(entry.path)
+            raise
+        self._evict_cache()
+        return entry.path
+
+    def _drop_cache_entry(self, digest: str, entry: _CachedMedia) -> None:
+        if self._media_cache.get(digest) is entry:
+            del self._media_cache[digest]
+            self._cache_paths.pop(entry.path, None)
+            self._cache_bytes -= entry.size
+
+    def _evict_cache(self, now: Optional[float] = None) -> None:
+        """Queue unreferenced cache files for deletion when over budget or idle past the TTL."""
+        for digest, entry in list(self._media_cache.items()):
+            over_budget = self._cache_bytes > self._cache_limit_bytes
+            expired = now is not None and now - entry.last_used > self._cache_ttl_sec
+            if not over_budget and not expired:
+                if now is None:
+                    break
+                continue
+            if entry.refs > 0 or not entry.ready.done():
+                continue
+            self._drop_cache_entry(digest, entry)
+            self._queue_delete(entry.path)
+
+    def _split_segments(self, audio_bytes: bytes) -> List[bytes]:
+        """Split long audio into frame-aligned segments; a short tail joins the last segment."""
+        size = self._segment_bytes
+        if not size or len(audio_bytes) < size * 2:
+            return [audio_bytes]
+        segments = [audio_bytes[i:i + size] for i in range(0, len(audio_bytes), size)]
+        if len(segments[-1]) < size // 2:
+            tail = segments.pop()
+            segments[-1] += tail
+        return segments
+
+    def _start_chain(self, call_id: str, playback_id: str, segments: List[bytes]) -> None:
+        """Write the remaining segments in the background; they play as earlier ones finish."""
+        pending = [
+            asyncio.ensure_future(self._create_audio_file(segment, f"{playback_id}-seg{i}", background=True))
+            for i, segment in enumerate(segments, start=1)
+        ]
+        self._chains[playback_id] = _SegmentChain(playback_id=playback_id, call_id=call_id, pending=pending)
+        self._segment_owner[playback_id] = playback_id
+
+    async def _advance_chain(self, playback_id: str) -> bool:
+        """Start the next segment of a chained playback. False when the chain is done or aborted."""
+        chain = self._chains.get(playback_id)
+        if chain is None:
+            return False
+        if chain.index >= len(chain.pending):
+            self._chains.pop(playback_id, None)
+            return False
+
+        session = await self.session_store.get_by_call_id(chain.call_id)
+        if not session or playback_id not in (getattr(session, "tts_tokens", set()) or set()):
+            # Barge-in, hangup or the gating fallback already ended this response.
+            await self._abort_chain(playback_id)
+            return False
+
+        audio_file = await chain.pending[chain.index]
+        chain.index += 1
+        if not audio_file:
+            await self._abort_chain(playback_id)
+            return False
+
+        segment_id = chain.segment_id(chain.index)
+        self._segment_owner[segment_id] = playback_id
+        await self.session_store.add_playback(PlaybackRef(
+            playback_id=segment_id,
+            call_id=chain.call_id,
+            channel_id=session.caller_channel_id,
+            bridge_id=session.bridge_id,
+            media_uri=f"sound:ai-generated/{os.path.basename(audio_file).replace('.ulaw', '')}",
+            audio_file=audio_file,
+        ))
+        if await self._play_via_ari(session, audio_file, segment_id):
+            return True
+
+        await self.session_store.pop_playback(segment_id)
+        self._segment_owner.pop(segment_id, None)
+        await self._cleanup_audio_file(audio_file)
+        await self._abort_chain(playback_id)
+        return False
+
+    async def _abort_chain(self, playback_id: str) -> None:
+        """Drop the unplayed segments of a chained playback and release their files."""
+        chain = self._chains.pop(playback_id, None)
+        if chain is None:
+            return
+        self._segment_owner.pop(chain.segment_id(chain.index), None)
+        for task in chain.pending[chain.index:]:
+            if task.done():
+                if not task.cancelled() and task.result():
+                    await self._cleanup_audio_file(task.result())
+            else:
+                release = asyncio.ensure_future(self._release_when_written(task))
+                self._release_tasks.add(release)
+                release.add_done_callback(self._release_tasks.discard)
+        logger.debug("Segmented playback stopped early",
+                    playback_id=playback_id,
+                    call_id=chain.call_id,
+                    played_segments=chain.index + 1,
+                    total_segments=len(chain.pending) + 1)
+
+    async def _release_when_written(self, task: "asyncio.Task") -> None:
+        audio_file = await task
+        if audio_file:
+            await self._cleanup_audio_file(audio_file)
+
+    def _active_segment_id(self, playback_id: str) -> str:
+        chain = self._chains.get(playback_id)
+        return chain.segment_id(chain.index) if chain else playback_id
     
     async def _play_via_ari(self, session: CallSession, audio_file: str, 
                            playback_id: str) -> bool:
@@ -394,18 +664,97 @@ class PlaybackManager:
             return False
     
     async def _cleanup_audio_file(self, audio_file: str) -> None:
-        """Clean up audio file after playback."""
+        """Release an audio file after playback.
+
+        Cached files stay on disk for reuse until evicted; everything else is queued
+        and deleted in the next background batch.
+        """
         try:
-            if os.path.exists(audio_file):
-                os.remove(audio_file)
-                logger.debug("Audio file cleaned up",
-                           file_path=audio_file)
+            digest = self._cache_paths.get(audio_file)
+            entry = self._media_cache.get(digest) if digest else None
+            if entry is not None:
+                entry.refs = max(0, entry.refs - 1)
+                entry.last_used = time.time()
+                self._evict_cache()
+            else:
+                self._queue_delete(audio_file)
         except Exception as e:
             logger.warning("Error cleaning up audio file",
                          file_path=audio_file,
                          error=str(e))
+
+    def _queue_delete(self, audio_file: str) -> None:
+        self._pending_deletes.append(audio_file)
+        if self._cleanup_task is None or self._cleanup_task.done():
+            self._cleanup_task = asyncio.ensure_future(self._cleanup_loop())
+
+    async def _cleanup_loop(self) -> None:
+        """Background sweeper: batch-deletes released files and expires idle cache entries."""
+        try:
+            while self._pending_deletes or self._media_cache:
+                await asyncio.sleep(self._cleanup_interval_sec)
+                self._evict_cache(now=time.time())
+                await self.flush_pending_deletes()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning("Playback media cleanup loop failed", error=str(e), exc_info=True)
+
+    async def flush_pending_deletes(self) -> int:
+        """Delete all queued audio files now (one executor hop per batch)."""
+        batch, self._pending_deletes = self._pending_deletes, []
+        if not self._orphans_swept:
+            # Cache files left behind by a previous process of this shard are never
+            # referenced again; other shards' files in the same dir are left alone.
+            self._orphans_swept = True
+            batch.extend(await asyncio.get_running_loop().run_in_executor(
+                self._background_executor, self._find_orphaned_cache_files))
+        if not batch:
+            return 0
+        removed = await asyncio.get_running_loop().run_in_executor(self._background_executor, _remove_files, batch)
+        logger.debug("Audio files cleaned up", requested=len(batch), removed=removed)
+        return removed
+
+    def _find_orphaned_cache_files(self) -> List[str]:
+        orphans = []
+        try:
+            with os.scandir(self.media_dir) as entries:
+                for item in entries:
+                    if not item.name.startswith(self._cache_prefix) or item.path in self._cache_paths:
+                        continue
+                    try:
+                        if item.stat().st_mtime < self._started_at:
+                            orphans.append(item.path)
+                    except OSError:
+                        continue
+        except OSError:
+            pass
+        return orphans
+
+    async def close(self) -> None:
+        """Stop background cleanup and delete every unreferenced media file."""
+        for playback_id in list(self._chains):
+            await self._abort_chain(playback_id)
+        if self._release_tasks:
+            await asyncio.gather(*self._release_tasks, return_exceptions=True)
+        if self._cleanup_task and not self._cleanup_task.done():
+            self._cleanup_task.cancel()
+            try:
+                await self._cleanup_task
+            except asyncio.CancelledError:
+                pass
+        for digest, entry in list(self._media_cache.items()):
+            if entry.refs == 0 and entry.ready.done():
+                self._drop_cache_entry(digest, entry)
+                self._pending_deletes.append(entry.path)
+        try:
+            await self.flush_pending_deletes()
+        finally:
+            self._io_executor.shutdown(wait=False)
+            self._background_executor.shutdown(wait=False)
     
-    async def _schedule_gating_fallback(self, call_id: str, playback_id: str, audio_size: int) -> None:
+    async def _schedule_gating_fallback(self, call_id: str, playback_id: str, audio_size: int,
+                                        segments: int = 1) -> None:
         """
         Schedule a token-aware fallback to ensure gating is cleared even if PlaybackFinished is missed.
         
@@ -413,6 +762,7 @@ class PlaybackManager:
             call_id: Call ID
             playback_id: Playback ID
             audio_size: Size of audio in bytes (μ-law @ 8kHz)
+            segments: Number of chained sound files the audio was split into
         """
         try:
             # Calculate audio duration: 8kHz uLaw = 8000 samples/sec = 1 byte per sample
@@ -423,6 +773,8 @@ class PlaybackManager:
             # Full agent mode: Streaming has lower latency, use shorter margin
             is_pipeline = playback_id.startswith("pipeline-")
             fallback_delay = audio_duration + (2.5 if is_pipeline else 0.5)  # safety margin
+            # Each chained segment adds a PlaybackFinished round trip and a file open in Asterisk.
+            fallback_delay += 0.25 * max(0, segments - 1)
             
             logger.info("[TIMER] Scheduled: action=gating_fallback",
                         call_id=call_id,
@@ -453,16 +805,19 @@ class PlaybackManager:
         try:
             await asyncio.sleep(delay)
             
-            # Check if playback is still active
-            playback_ref = await self.session_store.get_playback(playback_id)
-            if playback_ref:
+            # Check if playback is still active (for segmented audio: the segment now playing)
+            active_id = self._active_segment_id(playback_id)
+            playback_ref = await self.session_store.get_playback(active_id)
+            if playback_ref or playback_id in self._chains:
                 # PlaybackFinished may have been missed. Clean up gating and local playback tracking
                 # so we don't leak playbacks/gating for long-running calls.
                 popped_ref = None
                 try:
-                    popped_ref = await self.session_store.pop_playback(playback_id)
+                    popped_ref = await self.session_store.pop_playback(active_id)
                 except Exception:
                     popped_ref = None
+                self._segment_owner.pop(active_id, None)
+                await self._abort_chain(playback_id)
 
                 # Best-effort: cleanup the audio file if we have it.
                 try:
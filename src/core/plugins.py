@@ -0,0 +1,181 @@
+"""
+Lazy plugin registry for provider and pipeline adapter implementations.
+
+Provider modules pull in vendor SDKs (google-auth, websockets clients, numpy-heavy
+DSP) at import time. The engine used to import all of them unconditionally, so every
+replica paid for providers its config never uses. Implementations are now named
+here as ``"<module>:<attribute>"`` specs and imported on first ``load``; the engine
+loads what the active config references at startup and the rest on first use.
+
+LazyRegistry is the dict the engine keeps provider templates/factories in: entries
+can be deferred, then built explicitly with ``build`` (the engine does that after
+importing the module off the event loop) or, failing that, on first lookup by name.
+
+StartupTimeline records how long each startup phase took, for /health.
+"""
+
+from __future__ import annotations
+
+import importlib
+import threading
+import time
+from typing import Any, Callable, Dict, List, Mapping, Optional
+
+# Specs are relative to the top-level package ("src" in this repo).
+_ROOT_PACKAGE = __name__.rsplit(".", 2)[0]
+
+
+class PluginRegistry:
+    """Name -> ``"module:attribute"`` spec, imported on first load and then cached."""
+
+    def __init__(self, kind: str, specs: Mapping[str, str]) -> None:
+        self.kind = kind
+        self._specs: Dict[str, str] = dict(specs)
+        self._loaded: Dict[str, Any] = {}
+        self._import_ms: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def register(self, name: str, spec: str) -> None:
+        self._specs[name] = spec
+        self._loaded.pop(name, None)
+
+    def names(self) -> List[str]:
+        return list(self._specs)
+
+    def is_loaded(self, name: str) -> bool:
+        return name in self._loaded
+
+    def load(self, name: str) -> Any:
+        loaded = self._loaded.get(name)
+        if loaded is not None:
+            return loaded
+        spec = self._specs.get(name)
+        if spec is None:
+            raise KeyError(f"Unknown {self.kind} plugin: {name}")
+        module_name, _, attribute = spec.partition(":")
+        if module_name.startswith("."):
+            module_name = _ROOT_PACKAGE + module_name
+        with self._lock:
+            loaded = self._loaded.get(name)
+            if loaded is None:
+                started = time.perf_counter()
+                module = importlib.import_module(module_name)
+                loaded = getattr(module, attribute) if attribute else module
+                self._import_ms[name] = round((time.perf_counter() - started) * 1000.0, 2)
+                self._loaded[name] = loaded
+        return loaded
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "loaded": {name: self._import_ms.get(name, 0.0) for name in self._loaded},
+            "available": [name for name in self._specs if name not in self._loaded],
+        }
+
+
+PROVIDERS = PluginRegistry(
+    "provider",
+    {
+        "local": ".providers.local:LocalProvider",
+        "deepgram": ".providers.deepgram:DeepgramProvider",
+        "openai_realtime": ".providers.openai_realtime:OpenAIRealtimeProvider",
+        "google_live": ".providers.google_live:GoogleLiveProvider",
+        "elevenlabs_agent": ".providers.elevenlabs_agent:ElevenLabsAgentProvider",
+    },
+)
+
+PIPELINE_ADAPTERS = PluginRegistry(
+    "pipeline_adapter",
+    {
+        "LocalSTTAdapter": ".pipelines.local:LocalSTTAdapter",
+        "LocalLLMAdapter": ".pipelines.local:LocalLLMAdapter",
+        "LocalTTSAdapter": ".pipelines.local:LocalTTSAdapter",
+        "DeepgramSTTAdapter": ".pipelines.deepgram:DeepgramSTTAdapter",
+        "DeepgramTTSAdapter": ".pipelines.deepgram:DeepgramTTSAdapter",
+        "DeepgramFluxSTTAdapter": ".pipelines.deepgram_flux:DeepgramFluxSTTAdapter",
+        "OpenAISTTAdapter": ".pipelines.openai:OpenAISTTAdapter",
+        "OpenAILLMAdapter": ".pipelines.openai:OpenAILLMAdapter",
+        "OpenAITTSAdapter": ".pipelines.openai:OpenAITTSAdapter",
+        "GoogleSTTAdapter": ".pipelines.google:GoogleSTTAdapter",
+        "GoogleLLMAdapter": ".pipelines.google:GoogleLLMAdapter",
+        "GoogleTTSAdapter": ".pipelines.google:GoogleTTSAdapter",
+        "ElevenLabsTTSAdapter": ".pipelines.elevenlabs:ElevenLabsTTSAdapter",
+        "GroqSTTAdapter": ".pipelines.groq:GroqSTTAdapter",
+        "GroqTTSAdapter": ".pipelines.groq:GroqTTSAdapter",
+        "TelnyxLLMAdapter": ".pipelines.telnyx:TelnyxLLMAdapter",
+        "OllamaLLMAdapter": ".pipelines.ollama:OllamaLLMAdapter",
+    },
+)
+
+
+class LazyRegistry(dict):
+    """
+    A dict whose deferred entries are built on first lookup by name.
+
+    ``defer(name, build)`` registers a builder; ``build(name)``, ``name in d``,
+    ``d[name]`` and ``d.get(name)`` run it once (it is expected to populate the dict). Several
+    registries can share one ``deferred`` mapping when one builder fills all of
+    them (provider templates and factories). Iteration and len() only cover
+    entries that have been built.
+    """
+
+    def __init__(self, deferred: Optional[Dict[str, Callable[[], Any]]] = None) -> None:
+        super().__init__()
+        self.deferred: Dict[str, Callable[[], Any]] = deferred if deferred is not None else {}
+
+    def defer(self, name: str, build: Callable[[], Any]) -> None:
+        self.deferred[name] = build
+
+    def build(self, name: Any) -> None:
+        if not self.deferred or not isinstance(name, str):
+            return
+        build = self.deferred.pop(name, None)
+        if build is not None:
+            build()
+
+    def __contains__(self, name: object) -> bool:
+        self.build(name)  # type: ignore[arg-type]
+        return super().__contains__(name)
+
+    def __getitem__(self, name: str) -> Any:
+        self.build(name)
+        return super().__getitem__(name)
+
+    def get(self, name: str, default: Any = None) -> Any:
+        self.build(name)
+        return super().get(name, default)
+
+    def pop(self, name: str, *default: Any) -> Any:
+        # Dropping a deferred entry never builds it.
+        self.deferred.pop(name, None)
+        return super().pop(name, *default)
+
+    def clear(self) -> None:
+        self.deferred.clear()
+        super().clear()
+
+
+class StartupTimeline:
+    """Wall-clock duration of each startup phase; ``mark(name)`` closes the phase that just ended."""
+
+    def __init__(self) -> None:
+        self.started = time.perf_counter()
+        self._last = self.started
+        self.phases: Dict[str, float] = {}
+        self.ready_ms: Optional[float] = None
+
+    def mark(self, name: str) -> None:
+        now = time.perf_counter()
+        self.phases[name] = round((now - self._last) * 1000.0, 2)
+        self._last = now
+
+    def mark_ready(self) -> None:
+        if self.ready_ms is None:
+            self.ready_ms = round((time.perf_counter() - self.started) * 1000.0, 2)
+
+    def report(self) -> Dict[str, Any]:
+        return {
+            "phases_ms": dict(self.phases),
+            "time_to_ready_ms": self.ready_ms,
+            "providers": PROVIDERS.stats(),
+            "pipeline_adapters": PIPELINE_ADAPTERS.stats(),
+        }
@@ -0,0 +1,739 @@
+"""
+Durable post-call job queue (SQLite).
+
+Post-call side effects (summary/transcript emails, webhooks) used to run as
+fire-and-forget tasks in the hung-up call's context: a burst of hangups became a
+burst of threads and outbound connections, and anything in flight was lost on
+restart. Those sends are now recorded as jobs and executed by a small worker pool.
+
+Persistence mirrors the outbound dialer store:
+- Same SQLite database as Call History (WAL + busy_timeout)
+- Thread lock around short transactions, async facade via run_in_executor
+  (one long-lived connection per store rather than one per statement)
+- Atomic leasing; a job leased by a process that died becomes eligible again when
+  its lease expires. The lease is renewed while the job runs, and each claim gets a
+  ``lease_id`` that guards the finishing update, so a worker that lost its lease
+  cannot finalize a job another worker has re-leased
+
+Delivery semantics are at-least-once:
+- ``idempotency_key`` is unique, so enqueueing the same send twice is a no-op
+- Failed jobs are retried with exponential backoff (full jitter)
+- Jobs that exhaust ``max_attempts`` or raise ``PermanentJobError`` are dead-lettered
+  and stay visible in the Admin UI until retried or deleted
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import hashlib
+import json
+import os
+import random
+import sqlite3
+import threading
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional
+
+import structlog
+from prometheus_client import Counter, Gauge, Histogram
+
+logger = structlog.get_logger(__name__)
+
+JOB_PENDING = "pending"
+JOB_RUNNING = "running"
+JOB_DONE = "done"
+JOB_DEAD = "dead"
+JOB_STATES = (JOB_PENDING, JOB_RUNNING, JOB_DONE, JOB_DEAD)
+
+_JOBS_TOTAL = Counter(
+    "ai_agent_post_call_jobs_total",
+    "Post-call job attempts by outcome",
+    labelnames=("kind", "outcome"),  # done | retry | dead
+)
+_JOB_SECONDS = Histogram(
+    "ai_agent_post_call_job_seconds",
+    "Post-call job attempt duration",
+    labelnames=("kind",),
+    buckets=(0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0),
+)
+_JOBS_INFLIGHT = Gauge(
+    "ai_agent_post_call_jobs_inflight",
+    "Post-call jobs currently executing",
+)
+
+JobHandler = Callable[[Dict[str, Any]], Awaitable[Any]]
+
+
+class PermanentJobError(Exception):
+    """Raised by a job handler when retrying cannot succeed (e.g. webhook 4xx, rejected recipient)."""
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _iso(dt: datetime) -> str:
+    # Fixed-width timestamps so lexical comparison in SQL matches time order.
+    return dt.isoformat(timespec="microseconds")
+
+
+def idempotency_key(*parts: Any) -> str:
+    """Stable key for one logical send (e.g. label, call id, recipient, subject)."""
+    raw = "|".join("" if p is None else str(p) for p in parts)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:32]
+
+
+def _row_to_job(row: sqlite3.Row) -> Dict[str, Any]:
+    job = dict(row)
+    try:
+        job["payload"] = json.loads(job.pop("payload_json") or "{}")
+    except Exception:
+        job["payload"] = {}
+    return job
+
+
+class PostCallJobStore:
+    _CREATE_TABLES_SQL = [
+        """
+        CREATE TABLE IF NOT EXISTS post_call_jobs (
+            id TEXT PRIMARY KEY,
+            kind TEXT NOT NULL,
+            idempotency_key TEXT NOT NULL UNIQUE,
+            call_id TEXT,
+            payload_json TEXT NOT NULL,
+            state TEXT NOT NULL DEFAULT 'pending', -- pending|running|done|dead
+            attempts INTEGER NOT NULL DEFAULT 0,
+            max_attempts INTEGER NOT NULL DEFAULT 6,
+            next_run_at_utc TEXT NOT NULL,
+            leased_until_utc TEXT,
+            lease_id TEXT,
+            last_error TEXT,
+            created_at_utc TEXT NOT NULL,
+            updated_at_utc TEXT NOT NULL,
+            finished_at_utc TEXT
+        )
+        """,
+        "CREATE INDEX IF NOT EXISTS idx_post_call_jobs_state_next ON post_call_jobs(state, next_run_at_utc)",
+        "CREATE INDEX IF NOT EXISTS idx_post_call_jobs_call ON post_call_jobs(call_id)",
+    ]
+
+    def __init__(self, db_path: Optional[str] = None):
+        self._db_path = db_path or os.getenv("CALL_HISTORY_DB_PATH", "data/call_history.db")
+        self._enabled = str(os.getenv("CALL_HISTORY_ENABLED", "true")).strip().lower() not in ("0", "false", "no")
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._initialized = False
+
+        if self._enabled:
+            self._init_db()
+
+    @property
+    def enabled(self) -> bool:
+        return self._enabled
+
+    def _init_db(self) -> None:
+        try:
+            db_dir = os.path.dirname(self._db_path)
+            if db_dir:
+                Path(db_dir).mkdir(parents=True, exist_ok=True)
+            with self._connection() as conn:
+                cur = conn.cursor()
+                for stmt in self._CREATE_TABLES_SQL:
+                    cur.execute(stmt)
+                self._ensure_schema_sync(conn)
+                conn.commit()
+                self._initialized = True
+                logger.info("Post-call job table initialized", db_path=self._db_path)
+        except Exception as exc:
+            logger.error("Failed to initialize post-call job table", error=str(exc), exc_info=True)
+            self._enabled = False
+
+    def _ensure_schema_sync(self, conn: sqlite3.Connection) -> None:
+        """Add columns missing from tables created by older versions."""
+        cols = {str(r[1]) for r in conn.execute("PRAGMA table_info(post_call_jobs)").fetchall()}
+        if "lease_id" not in cols:
+            conn.execute("ALTER TABLE post_call_jobs ADD COLUMN lease_id TEXT")
+
+    def _get_connection(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self._db_path, timeout=30.0, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL;")
+        conn.execute("PRAGMA synchronous=NORMAL;")
+        conn.execute("PRAGMA busy_timeout=30000;")
+        return conn
+
+    @contextlib.contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        """
+        The store's long-lived connection, under the store lock.
+
+        Unlike the other stores this keeps one connection open: every post-call send
+        writes its job row three times, and opening/closing a WAL connection per
+        statement (which checkpoints on last close) costs ~50x the statement itself.
+        """
+        with self._lock:
+            if self._conn is None:
+                self._conn = self._get_connection()
+            try:
+                yield self._conn
+            except Exception:
+                try:
+                    self._conn.rollback()
+                except Exception:
+                    pass
+                raise
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    async def _run(self, fn):
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, fn)
+
+    def _require_enabled(self) -> None:
+        if not self._enabled:
+            raise RuntimeError("PostCallJobStore disabled (CALL_HISTORY_ENABLED=false)")
+
+    # ---------------------------------------------------------------------
+    # Producer / worker side
+    # ---------------------------------------------------------------------
+
+    def enqueue_sync(
+        self,
+        kind: str,
+        payload: Dict[str, Any],
+        *,
+        idempotency_key: str,
+        call_id: Optional[str] = None,
+        max_attempts: int = 6,
+    ) -> Dict[str, Any]:
+        """Insert a pending job; returns ``{"id", "created"}`` (created=False when the key already exists)."""
+        self._require_enabled()
+        now = _iso(_utcnow())
+        job_id = str(uuid.uuid4())
+        payload_json = json.dumps(payload, separators=(",", ":"), default=str)
+        with self._connection() as conn:
+            cur = conn.execute(
+                """
+                INSERT OR IGNORE INTO post_call_jobs (
+                    id, kind, idempotency_key, call_id, payload_json, state, attempts, max_attempts,
+                    next_run_at_utc, created_at_utc, updated_at_utc
+                ) VALUES (?, ?, ?, ?, ?, 'pending', 0, ?, ?, ?, ?)
+                """,
+                (job_id, kind, idempotency_key, call_id, payload_json, max(1, int(max_attempts)), now, now, now),
+            )
+            created = cur.rowcount == 1
+            if not created:
+                row = conn.execute(
+                    "SELECT id FROM post_call_jobs WHERE idempotency_key = ?", (idempotency_key,)
+                ).fetchone()
+                job_id = str(row["id"]) if row else job_id
+            conn.commit()
+            return {"id": job_id, "created": created}
+
+    async def enqueue(self, kind: str, payload: Dict[str, Any], **kwargs: Any) -> Dict[str, Any]:
+        return await self._run(lambda: self.enqueue_sync(kind, payload, **kwargs))
+
+    def claim_sync(self, *, limit: int, lease_seconds: float) -> List[Dict[str, Any]]:
+        """
+        Atomically lease up to N due jobs (pending, or running with an expired lease).
+
+        Notes:
+        - Avoids SQLite RETURNING for compatibility with older distros (same as outbound leasing).
+        - ``attempts`` is incremented at claim time so a crash mid-send still counts.
+        - Each returned job carries the ``lease_id`` of this claim; pass it to
+          ``renew_sync``/``complete_sync``/``fail_sync``.
+        """
+        if not self._enabled or limit <= 0:
+            return []
+        now_dt = _utcnow()
+        now = _iso(now_dt)
+        lease_until = _iso(now_dt + timedelta(seconds=max(1.0, float(lease_seconds))))
+        lease_id = uuid.uuid4().hex
+        with self._connection() as conn:
+            cur = conn.cursor()
+            cur.execute("BEGIN IMMEDIATE")
+            rows = cur.execute(
+                """
+                SELECT id FROM post_call_jobs
+                WHERE (state = 'pending' AND next_run_at_utc <= ?)
+                   OR (state = 'running' AND leased_until_utc IS NOT NULL AND leased_until_utc < ?)
+                ORDER BY next_run_at_utc ASC
+                LIMIT ?
+                """,
+                (now, now, int(limit)),
+            ).fetchall()
+            job_ids = [str(r["id"]) for r in rows]
+            if not job_ids:
+                conn.commit()
+                return []
+            placeholders = ",".join(["?"] * len(job_ids))
+            cur.execute(
+                f"""
+                UPDATE post_call_jobs
+                SET state = 'running', attempts = attempts + 1, leased_until_utc = ?, lease_id = ?,
+                    updated_at_utc = ?
+                WHERE id IN ({placeholders})
+                """,
+                [lease_until, lease_id, now, *job_ids],
+            )
+            conn.commit()
+            data_rows = conn.execute(
+                f"SELECT * FROM post_call_jobs WHERE id IN ({placeholders})", job_ids
+            ).fetchall()
+            by_id = {str(r["id"]): _row_to_job(r) for r in data_rows}
+            return [by_id[j] for j in job_ids if j in by_id]
+
+    def _finish_sync(self, job_id: str, sql: str, params: tuple) -> bool:
+        with self._connection() as conn:
+            cur = conn.execute(sql, (*params, job_id))
+            conn.commit()
+            return cur.rowcount == 1
+
+    def _leased_update_sync(self, job_id: str, lease_id: str, sql: str, params: tuple) -> bool:
+        """Update a running job; False when it is no longer held under ``lease_id``."""
+        return self._finish_sync(job_id, sql, (*params, lease_id))
+
+    def renew_sync(self, job_id: str, lease_id: str, *, lease_seconds: float) -> bool:
+        """Extend a running job's lease; False when the lease expired and the job was claimed again."""
+        now_dt = _utcnow()
+        lease_until = _iso(now_dt + timedelta(seconds=max(1.0, float(lease_seconds))))
+        return self._leased_update_sync(
+            job_id,
+            lease_id,
+            """
+            UPDATE post_call_jobs
+            SET leased_until_utc = ?, updated_at_utc = ?
+            WHERE lease_id = ? AND id = ? AND state = 'running'
+            """,
+            (lease_until, _iso(now_dt)),
+        )
+
+    def complete_sync(self, job_id: str, lease_id: str) -> bool:
+        now = _iso(_utcnow())
+        return self._leased_update_sync(
+            job_id,
+            lease_id,
+            """
+            UPDATE post_call_jobs
+            SET state = 'done', leased_until_utc = NULL, lease_id = NULL, last_error = NULL, updated_at_utc = ?,
+                finished_at_utc = ?
+            WHERE lease_id = ? AND id = ? AND state = 'running'
+            """,
+            (now, now),
+        )
+
+    def fail_sync(self, job_id: str, lease_id: str, error: str, *, retry_in_seconds: Optional[float]) -> bool:
+        """Record a failed attempt: reschedule when ``retry_in_seconds`` is set, dead-letter otherwise."""
+        now_dt = _utcnow()
+        now = _iso(now_dt)
+        error = (error or "")[:2000]
+        if retry_in_seconds is None:
+            return self._leased_update_sync(
+                job_id,
+                lease_id,
+                """
+                UPDATE post_call_jobs
+                SET state = 'dead', leased_until_utc = NULL, lease_id = NULL, last_error = ?, updated_at_utc = ?,
+                    finished_at_utc = ?
+                WHERE lease_id = ? AND id = ? AND state = 'running'
+                """,
+                (error, now, now),
+            )
+        next_run = _iso(now_dt + timedelta(seconds=max(0.0, float(retry_in_seconds))))
+        return self._leased_update_sync(
+            job_id,
+            lease_id,
+            """
+            UPDATE post_call_jobs
+            SET state = 'pending', leased_until_utc = NULL, lease_id = NULL, last_error = ?, next_run_at_utc = ?,
+                updated_at_utc = ?
+            WHERE lease_id = ? AND id = ? AND state = 'running'
+            """,
+            (error, next_run, now),
+        )
+
+    def release_sync(self, job_ids: List[str]) -> int:
+        """Return claimed-but-unstarted jobs to pending (shutdown); their claim does not count as an attempt."""
+        if not job_ids or not self._enabled:
+            return 0
+        now = _iso(_utcnow())
+        placeholders = ",".join(["?"] * len(job_ids))
+        with self._connection() as conn:
+            cur = conn.execute(
+                f"""
+                UPDATE post_call_jobs
+                SET state = 'pending', attempts = MAX(attempts - 1, 0), leased_until_utc = NULL, lease_id = NULL,
+                    updated_at_utc = ?
+                WHERE state = 'running' AND id IN ({placeholders})
+                """,
+                [now, *job_ids],
+            )
+            conn.commit()
+            return cur.rowcount
+
+    def purge_finished_sync(self, *, older_than_days: float) -> int:
+        """Delete done jobs older than the retention window (dead jobs are kept for review)."""
+        if not self._enabled or older_than_days <= 0:
+            return 0
+        cutoff = _iso(_utcnow() - timedelta(days=float(older_than_days)))
+        with self._connection() as conn:
+            cur = conn.execute(
+                "DELETE FROM post_call_jobs WHERE state = 'done' AND finished_at_utc < ?", (cutoff,)
+            )
+            conn.commit()
+            return cur.rowcount
+
+    # ---------------------------------------------------------------------
+    # Admin UI
+    # ---------------------------------------------------------------------
+
+    async def list_jobs(
+        self,
+        *,
+        state: Optional[str] = None,
+        kind: Optional[str] = None,
+        call_id: Optional[str] = None,
+        page: int = 1,
+        page_size: int = 50,
+    ) -> Dict[str, Any]:
+        self._require_enabled()
+        page = max(1, int(page))
+        page_size = max(1, min(200, int(page_size)))
+
+        def _sync():
+            where: List[str] = []
+            params: List[Any] = []
+            if state:
+                where.append("state = ?")
+                params.append(state)
+            if kind:
+                where.append("kind = ?")
+                params.append(kind)
+            if call_id:
+                where.append("call_id = ?")
+                params.append(call_id)
+            clause = f"WHERE {' AND '.join(where)}" if where else ""
+            with self._connection() as conn:
+                total = conn.execute(f"SELECT COUNT(*) FROM post_call_jobs {clause}", params).fetchone()[0]
+                rows = conn.execute(
+                    f"SELECT * FROM post_call_jobs {clause} ORDER BY created_at_utc DESC LIMIT ? OFFSET ?",
+                    [*params, page_size, (page - 1) * page_size],
+                ).fetchall()
+            return {
+                "jobs": [_row_to_job(r) for r in rows],
+                "total": int(total),
+                "page": page,
+                "page_size": page_size,
+            }
+
+        return await self._run(_sync)
+
+    async def stats(self) -> Dict[str, Any]:
+        self._require_enabled()
+
+        def _sync():
+            with self._connection() as conn:
+                rows = conn.execute(
+                    "SELECT kind, state, COUNT(*) AS n FROM post_call_jobs GROUP BY kind, state"
+                ).fetchall()
+            by_state = {s: 0 for s in JOB_STATES}
+            by_kind: Dict[str, Dict[str, int]] = {}
+            for r in rows:
+                by_state[str(r["state"])] = by_state.get(str(r["state"]), 0) + int(r["n"])
+                by_kind.setdefault(str(r["kind"]), {})[str(r["state"])] = int(r["n"])
+            return {"by_state": by_state, "by_kind": by_kind}
+
+        return await self._run(_sync)
+
+    async def retry(self, job_id: str) -> bool:
+        """Requeue a dead job now with a fresh attempt budget."""
+        self._require_enabled()
+        now = _iso(_utcnow())
+        return await self._run(
+            lambda: self._finish_sync(
+                job_id,
+                """
+                UPDATE post_call_jobs
+                SET state = 'pending', attempts = 0, next_run_at_utc = ?, updated_at_utc = ?, finished_at_utc = NULL
+                WHERE id = ? AND state = 'dead'
+                """,
+                (now, now),
+            )
+        )
+
+    async def delete(self, job_id: str) -> bool:
+        """Delete a job that is not currently running."""
+        self._require_enabled()
+        return await self._run(
+            lambda: self._finish_sync(job_id, "DELETE FROM post_call_jobs WHERE id = ? AND state != 'running'", ())
+        )
+
+
+class PostCallJobQueue:
+    """
+    Bounded worker pool over ``PostCallJobStore``.
+
+    One dispatcher task leases due jobs (only as many as there are idle workers) and
+    ``workers`` tasks execute them through the handler registered for their kind.
+    Enqueue wakes the dispatcher, so a job normally starts within milliseconds; the
+    poll interval only bounds how late retries and jobs from other processes start.
+    """
+
+    def __init__(
+        self,
+        store: PostCallJobStore,
+        *,
+        workers: int = 4,
+        max_attempts: int = 6,
+        backoff_base_sec: float = 5.0,
+        backoff_max_sec: float = 900.0,
+        poll_interval_sec: float = 2.0,
+        lease_sec: float = 300.0,
+        retention_days: float = 7.0,
+    ) -> None:
+        self.store = store
+        self.workers = max(1, int(workers))
+        self.max_attempts = max(1, int(max_attempts))
+        self.backoff_base_sec = max(0.0, float(backoff_base_sec))
+        self.backoff_max_sec = max(self.backoff_base_sec, float(backoff_max_sec))
+        self.poll_interval_sec = max(0.01, float(poll_interval_sec))
+        self.lease_sec = max(1.0, float(lease_sec))
+        self.retention_days = float(retention_days)
+        self._handlers: Dict[str, JobHandler] = {}
+        self._wake = asyncio.Event()
+        self._ready: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+        self._busy = 0
+        self._running = False
+
+    @classmethod
+    def from_config(cls, config: Any, store: Optional[PostCallJobStore] = None) -> Optional["PostCallJobQueue"]:
+        """Build from the ``post_call_jobs`` config section; None when disabled."""
+        if config is not None and not getattr(config, "enabled", True):
+            return None
+        store = store or get_post_call_job_store()
+        if not store.enabled:
+            return None
+        if config is None:
+            return cls(store)
+        return cls(
+            store,
+            workers=config.workers,
+            max_attempts=config.max_attempts,
+            backoff_base_sec=config.backoff_base_sec,
+            backoff_max_sec=config.backoff_max_sec,
+            poll_interval_sec=config.poll_interval_sec,
+            lease_sec=config.lease_sec,
+            retention_days=config.retention_days,
+        )
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    def register(self, kind: str, handler: JobHandler) -> None:
+        self._handlers[kind] = handler
+
+    async def enqueue(
+        self,
+        kind: str,
+        payload: Dict[str, Any],
+        *,
+        idempotency_key: str,
+        call_id: Optional[str] = None,
+    ) -> Optional[str]:
+        """Persist a job and wake the dispatcher; returns the job id (existing id for a duplicate key)."""
+        result = await self.store.enqueue(
+            kind,
+            payload,
+            idempotency_key=idempotency_key,
+            call_id=call_id,
+            max_attempts=self.max_attempts,
+        )
+        if result["created"]:
+            logger.info("Post-call job queued", call_id=call_id, kind=kind, job_id=result["id"])
+        else:
+            logger.info("Post-call job already queued", call_id=call_id, kind=kind, job_id=result["id"])
+        self._wake.set()
+        return result["id"]
+
+    def backoff_seconds(self, attempts: int) -> float:
+        """Exponential backoff with full jitter for the retry after attempt N (1-based)."""
+        ceiling = min(self.backoff_max_sec, self.backoff_base_sec * (2 ** max(0, attempts - 1)))
+        return random.uniform(ceiling / 2.0, ceiling)
+
+    async def start(self) -> None:
+        if self._running:
+            return
+        self._running = True
+        self._ready = asyncio.Queue()
+        self._tasks = [asyncio.create_task(self._dispatch_loop(), name="post-call-jobs-dispatch")]
+        self._tasks += [
+            asyncio.create_task(self._worker(), name=f"post-call-jobs-worker-{i}") for i in range(self.workers)
+        ]
+        logger.info("Post-call job queue started", workers=self.workers, kinds=sorted(self._handlers))
+
+    async def stop(self, timeout: float = 10.0) -> None:
+        """Stop leasing, let in-flight jobs finish (up to ``timeout``) and return unstarted jobs to pending."""
+        if not self._running:
+            return
+        self._running = False
+        self._wake.set()
+        dispatcher, workers = self._tasks[0], self._tasks[1:]
+        dispatcher.cancel()
+        unstarted: List[str] = []
+        while self._ready is not None and not self._ready.empty():
+            job = self._ready.get_nowait()
+            if job is not None:
+                unstarted.append(job["id"])
+        for _ in workers:
+            self._ready.put_nowait(None)
+        done, pending = await asyncio.wait(workers, timeout=max(0.0, timeout))
+        for task in pending:
+            # Still leased: picked up again after restart once the lease expires.
+            task.cancel()
+        await asyncio.gather(dispatcher, *workers, return_exceptions=True)
+        if unstarted:
+            await self.store._run(lambda: self.store.release_sync(unstarted))
+        await self.store._run(self.store.close)
+        self._tasks = []
+        logger.info("Post-call job queue stopped", interrupted=len(pending), released=len(unstarted))
+
+    async def _dispatch_loop(self) -> None:
+        last_purge = 0.0
+        while self._running:
+            try:
+                self._wake.clear()
+                free = self.workers - self._busy - self._ready.qsize()
+                if free > 0:
+                    jobs = await self.store._run(
+                        lambda: self.store.claim_sync(limit=free, lease_seconds=self.lease_sec)
+                    )
+                    for job in jobs:
+                        self._ready.put_nowait(job)
+                    if len(jobs) == free:
+                        # Possibly more due; look again as soon as a worker frees up.
+                        await self._wait_wake(self.poll_interval_sec)
+                        continue
+                if time.monotonic() - last_purge > 3600.0:
+                    last_purge = time.monotonic()
+                    purged = await self.store._run(
+                        lambda: self.store.purge_finished_sync(older_than_days=self.retention_days)
+                    )
+                    if purged:
+                        logger.info("Purged finished post-call jobs", count=purged)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.warning("Post-call job dispatch failed", exc_info=True)
+            await self._wait_wake(self.poll_interval_sec)
+
+    async def _wait_wake(self, timeout: float) -> None:
+        try:
+            await asyncio.wait_for(self._wake.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+
+    async def _worker(self) -> None:
+        while True:
+            job = await self._ready.get()
+            if job is None:
+                return
+            self._busy += 1
+            _JOBS_INFLIGHT.inc()
+            try:
+                await self._execute(job)
+            finally:
+                self._busy -= 1
+                _JOBS_INFLIGHT.dec()
+                self._wake.set()
+
+    async def _execute(self, job: Dict[str, Any]) -> None:
+        kind = str(job.get("kind") or "")
+        job_id = str(job["id"])
+        lease_id = str(job.get("lease_id") or "")
+        attempts = int(job.get("attempts") or 1)
+        max_attempts = int(job.get("max_attempts") or self.max_attempts)
+        log = logger.bind(call_id=job.get("call_id"), kind=kind, job_id=job_id, attempt=attempts)
+        handler = self._handlers.get(kind)
+        started = time.monotonic()
+        try:
+            if handler is None:
+                raise PermanentJobError(f"no handler registered for job kind {kind!r}")
+            renewer = asyncio.create_task(self._renew_lease(job_id, lease_id, log))
+            try:
+                # The lease is renewed while the handler runs; the timeout only bounds a hung send.
+                await asyncio.wait_for(handler(job.get("payload") or {}), timeout=self.lease_sec * 0.8)
+            finally:
+                renewer.cancel()
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            error = f"{type(exc).__name__}: {exc}" if str(exc) else type(exc).__name__
+            permanent = isinstance(exc, PermanentJobError)
+            if permanent or attempts >= max_attempts:
+                if await self.store._run(lambda: self.store.fail_sync(job_id, lease_id, error, retry_in_seconds=None)):
+                    _JOBS_TOTAL.labels(kind, "dead").inc()
+                    log.warning("Post-call job dead-lettered", error=error, permanent=permanent)
+                else:
+                    log.warning("Post-call job lease lost; failure not recorded", error=error)
+            else:
+                delay = self.backoff_seconds(attempts)
+                if await self.store._run(lambda: self.store.fail_sync(job_id, lease_id, error, retry_in_seconds=delay)):
+                    _JOBS_TOTAL.labels(kind, "retry").inc()
+                    log.info("Post-call job failed; retry scheduled", error=error, retry_in_seconds=round(delay, 1))
+                else:
+                    log.warning("Post-call job lease lost; failure not recorded", error=error)
+        else:
+            if await self.store._run(lambda: self.store.complete_sync(job_id, lease_id)):
+                _JOBS_TOTAL.labels(kind, "done").inc()
+                log.debug("Post-call job done")
+            else:
+                log.warning("Post-call job lease lost; completion not recorded")
+        finally:
+            _JOB_SECONDS.labels(kind).observe(time.monotonic() - started)
+
+    async def _renew_lease(self, job_id: str, lease_id: str, log: Any) -> None:
+        """Keep a running job's lease ahead of expiry until cancelled, or until it is lost."""
+        while True:
+            await asyncio.sleep(self.lease_sec / 3.0)
+            try:
+                renewed = await self.store._run(
+                    lambda: self.store.renew_sync(job_id, lease_id, lease_seconds=self.lease_sec)
+                )
+            except Exception:
+                log.warning("Post-call job lease renewal failed", exc_info=True)
+                continue
+            if not renewed:
+                log.warning("Post-call job lease lost; another worker may run it again")
+                return
+
+
+_job_store: Optional[PostCallJobStore] = None
+_job_queue: Optional[PostCallJobQueue] = None
+
+
+def get_post_call_job_store() -> PostCallJobStore:
+    global _job_store
+    if _job_store is None:
+        _job_store = PostCallJobStore()
+    return _job_store
+
+
+def get_post_call_queue() -> Optional[PostCallJobQueue]:
+    """The engine's running job queue, or None (callers then send inline)."""
+    queue = _job_queue
+    return queue if queue is not None and queue.running else None
+
+
+def set_post_call_queue(queue: Optional[PostCallJobQueue]) -> None:
+    global _job_queue
+    _job_queue = queue
@@ -0,0 +1,146 @@
+"""
+Precompiled per-context session setup ("session bundles").
+
+Much of what a new call sets up depends only on configuration: the negotiated
+TransportProfile, the context's prompt template, its effective in-call tool allowlist
+and the config snapshot handed to tool execution. It is the same for every call that
+shares (config, provider, audio profile, context), so SessionBundleCache builds it once
+per key. The engine keys bundles by its config hash and invalidates the cache on
+/reload; invalidation swaps the whole cache in one assignment, so a call sees either
+the old bundles or the new ones, never a mix.
+
+What stays per call: caller-specific prompt substitution (a join over the pre-split
+template), a copy of the TransportProfile, and the provider config clone (providers
+mutate their config during a call).
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import functools
+import re
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Mapping, Optional, Tuple
+
+from .transport_orchestrator import ContextConfig, TransportProfile
+
+_PLACEHOLDER = re.compile(r"\{([\w.]+)\}")
+
+
+class PromptTemplate:
+    """
+    A prompt/greeting split once into literals and ``{placeholder}`` keys.
+
+    Rendering matches Engine._apply_prompt_template_substitution: exact key first, then
+    dot notation as underscores (``{patient.name}`` -> ``patient_name``); unknown
+    placeholders are left as-is.
+    """
+
+    __slots__ = ("text", "_parts")
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+        # Literals at even indexes, placeholder keys at odd indexes.
+        self._parts = tuple(_PLACEHOLDER.split(text))
+
+    @property
+    def static(self) -> bool:
+        return len(self._parts) == 1
+
+    def render(self, substitutions: Mapping[str, str]) -> str:
+        if self.static:
+            return self.text
+        out = []
+        for index, part in enumerate(self._parts):
+            if index % 2 == 0:
+                out.append(part)
+            elif part in substitutions:
+                out.append(substitutions[part])
+            else:
+                underscore_key = part.replace(".", "_")
+                out.append(substitutions[underscore_key] if underscore_key in substitutions else "{" + part + "}")
+        return "".join(out)
+
+
+@functools.lru_cache(maxsize=256)
+def compile_prompt(text: str) -> PromptTemplate:
+    return PromptTemplate(text)
+
+
+@dataclass(frozen=True)
+class ContextBundle:
+    """Config-derived state for one AI_CONTEXT (None when the call has no context)."""
+
+    name: Optional[str]
+    config: Optional[ContextConfig]
+    prompt: Optional[PromptTemplate]
+    in_call_tools: Optional[Tuple[str, ...]]
+
+
+@dataclass(frozen=True)
+class SessionBundle:
+    """Config-derived state for (provider, audio profile, context)."""
+
+    provider_name: str
+    transport: TransportProfile
+    context: ContextBundle
+
+    def new_transport(self) -> TransportProfile:
+        """A per-call copy; sessions own their TransportProfile."""
+        return dataclasses.replace(self.transport)
+
+
+class _Generation:
+    __slots__ = ("sessions", "contexts", "snapshots")
+
+    def __init__(self) -> None:
+        self.sessions: Dict[Hashable, SessionBundle] = {}
+        self.contexts: Dict[Hashable, ContextBundle] = {}
+        self.snapshots: Dict[Hashable, Any] = {}
+
+
+class SessionBundleCache:
+    """Build-once cache of session bundles, context bundles and config snapshots."""
+
+    def __init__(self, max_entries: int = 1024) -> None:
+        self.max_entries = max_entries
+        self._gen = _Generation()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def _get(self, table: Dict[Hashable, Any], key: Hashable, build: Callable[[], Any]) -> Any:
+        value = table.get(key)
+        if value is not None:
+            self.hits += 1
+            return value
+        self.misses += 1
+        value = build()
+        # Keys come from channel variables; never let a misbehaving dialplan grow this unbounded.
+        if len(table) >= self.max_entries:
+            table.clear()
+        table[key] = value
+        return value
+
+    def session(self, key: Hashable, build: Callable[[], SessionBundle]) -> SessionBundle:
+        return self._get(self._gen.sessions, key, build)
+
+    def context(self, key: Hashable, build: Callable[[], ContextBundle]) -> ContextBundle:
+        return self._get(self._gen.contexts, key, build)
+
+    def snapshot(self, key: Hashable, build: Callable[[], Any]) -> Any:
+        """A shared, read-only value (e.g. the config dict given to tool execution)."""
+        return self._get(self._gen.snapshots, key, build)
+
+    def invalidate(self) -> None:
+        self._gen = _Generation()
+        self.invalidations += 1
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "sessions": len(self._gen.sessions),
+            "contexts": len(self._gen.contexts),
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+        }
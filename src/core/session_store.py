@@ -3,17 +3,55 @@ SessionStore - Centralized, atomic state management for call sessions.
 
 This replaces the dict soup (active_calls, caller_channels, active_playbacks)
 with a single, thread-safe store that enforces invariants.
+
+Reads are lock-free: every mutation runs to completion without awaiting, so a
+reader on the event loop always sees a consistent snapshot. The lock only
+serializes multi-key mutations. Secondary indexes (outbound campaign, provider,
+status) are maintained on upsert/remove so counts never scan all sessions, and
+media paths hold a SessionRef instead of looking the session up per frame.
 """
 
 import asyncio
 import time
-from typing import Optional, Dict, Set, List
+from typing import Any, Optional, Dict, Set, List, Tuple
 import structlog
 
 from src.core.models import CallSession, PlaybackRef, ProviderSession
 
 logger = structlog.get_logger(__name__)
 
+# Secondary indexes: name -> key extracted from a session (None = not indexed).
+_INDEXES = {
+    "outbound": lambda s: True if getattr(s, "is_outbound", False) else None,
+    "campaign": lambda s: getattr(s, "outbound_campaign_id", None) if getattr(s, "is_outbound", False) else None,
+    "provider": lambda s: s.provider_name,
+    "status": lambda s: s.status,
+}
+
+
+class SessionRef:
+    """
+    Cached session handle for per-frame media paths.
+
+    ``get()`` re-resolves only when a session was added, replaced or removed
+    since the last call; otherwise it is an integer compare.
+    """
+
+    __slots__ = ("_store", "call_id", "_session", "_epoch")
+
+    def __init__(self, store: "SessionStore", call_id: str):
+        self._store = store
+        self.call_id = call_id
+        self._session: Optional[CallSession] = None
+        self._epoch = -1
+
+    def get(self) -> Optional[CallSession]:
+        store = self._store
+        if self._epoch != store._epoch:
+            self._session = store._sessions_by_call_id.get(self.call_id)
+            self._epoch = store._epoch
+        return self._session
+
 
 class SessionStore:
     """
@@ -24,6 +62,8 @@ class SessionStore:
     - A call has two channel entries (caller/local), both share call_id
     - Gating is token/refcount-based per call
     - All operations are atomic
+
+    Indexes reflect each session as of its last upsert_call.
     """
     
     def __init__(self):
@@ -32,8 +72,16 @@ class SessionStore:
         self._sessions_by_channel_id: Dict[str, CallSession] = {}
         self._playbacks: Dict[str, PlaybackRef] = {}
         self._provider_sessions: Dict[str, ProviderSession] = {}
+
+        # Channel ids and index keys each call is filed under, for clean removal
+        self._channel_keys: Dict[str, Set[str]] = {}
+        self._index_keys: Dict[str, Tuple[Any, ...]] = {}
+        self._indexes: Dict[str, Dict[Any, Set[str]]] = {name: {} for name in _INDEXES}
+        self._playbacks_by_call: Dict[str, Set[str]] = {}
+        # Bumped whenever a call_id starts or stops resolving to a session object
+        self._epoch = 0
         
-        # Thread safety
+        # Serializes multi-key mutations; reads never take it
         self._lock = asyncio.Lock()
         
         logger.info("SessionStore initialized")
@@ -42,37 +90,66 @@ class SessionStore:
         """Add or update a call session atomically."""
         async with self._lock:
             # Store by call_id (canonical)
+            if self._sessions_by_call_id.get(session.call_id) is not session:
+                self._epoch += 1
             self._sessions_by_call_id[session.call_id] = session
             
-            # Store by caller_channel_id
-            self._sessions_by_channel_id[session.caller_channel_id] = session
-            
-            # Store by local_channel_id if present
-            if session.local_channel_id:
-                self._sessions_by_channel_id[session.local_channel_id] = session
-            
-            # Store by external_media_id if present
-            if session.external_media_id:
-                self._sessions_by_channel_id[session.external_media_id] = session
-            
-            # Store by audiosocket_channel_id if present
-            if session.audiosocket_channel_id:
-                self._sessions_by_channel_id[session.audiosocket_channel_id] = session
+            # Store by caller, local, external media and AudioSocket channel ids
+            channel_keys = self._channel_keys.setdefault(session.call_id, set())
+            for channel_id in (
+                session.caller_channel_id,
+                session.local_channel_id,
+                session.external_media_id,
+                session.audiosocket_channel_id,
+            ):
+                if channel_id:
+                    self._sessions_by_channel_id[channel_id] = session
+                    channel_keys.add(channel_id)
+
+            self._reindex(session.call_id, tuple(key(session) for key in _INDEXES.values()))
             
             logger.debug("Call session upserted",
                         call_id=session.call_id,
                         caller_channel_id=session.caller_channel_id,
                         local_channel_id=session.local_channel_id)
     
+    def _reindex(self, call_id: str, keys: Tuple[Any, ...]) -> None:
+        previous = self._index_keys.get(call_id)
+        if previous == keys:
+            return
+        for position, index in enumerate(self._indexes.values()):
+            old = previous[position] if previous else None
+            new = keys[position]
+            if old == new:
+                continue
+            if old is not None:
+                members = index.get(old)
+                if members is not None:
+                    members.discard(call_id)
+                    if not members:
+                        del index[old]
+            if new is not None:
+                index.setdefault(new, set()).add(call_id)
+        if any(key is not None for key in keys):
+            self._index_keys[call_id] = keys
+        else:
+            self._index_keys.pop(call_id, None)
+
     async def get_by_call_id(self, call_id: str) -> Optional[CallSession]:
         """Get session by canonical call_id."""
-        async with self._lock:
-            return self._sessions_by_call_id.get(call_id)
+        return self._sessions_by_call_id.get(call_id)
     
     async def get_by_channel_id(self, channel_id: str) -> Optional[CallSession]:
         """Get session by any channel_id (caller, local, external_media)."""
-        async with self._lock:
-            return self._sessions_by_channel_id.get(channel_id)
+        return self._sessions_by_channel_id.get(channel_id)
+
+    def peek_by_call_id(self, call_id: str) -> Optional[CallSession]:
+        """Synchronous get_by_call_id for hot paths that cannot await."""
+        return self._sessions_by_call_id.get(call_id)
+
+    def ref(self, call_id: str) -> SessionRef:
+        """Return a cached handle to the session for ``call_id`` (see SessionRef)."""
+        return SessionRef(self, call_id)
     
     async def remove_call(self, call_id: str) -> Optional[CallSession]:
         """Remove a call session and all its channel mappings."""
@@ -80,15 +157,24 @@ class SessionStore:
             session = self._sessions_by_call_id.pop(call_id, None)
             if not session:
                 return None
+            self._epoch += 1
             
-            # Remove all channel mappings
-            self._sessions_by_channel_id.pop(session.caller_channel_id, None)
-            if session.local_channel_id:
-                self._sessions_by_channel_id.pop(session.local_channel_id, None)
-            if session.external_media_id:
-                self._sessions_by_channel_id.pop(session.external_media_id, None)
-            if session.audiosocket_channel_id:
-                self._sessions_by_channel_id.pop(session.audiosocket_channel_id, None)
+            # Remove every channel mapping the call was filed under that still points at it
+            channel_keys = self._channel_keys.pop(call_id, set())
+            channel_keys.update(
+                channel_id
+                for channel_id in (
+                    session.caller_channel_id,
+                    session.local_channel_id,
+                    session.external_media_id,
+                    session.audiosocket_channel_id,
+                )
+                if channel_id
+            )
+            for channel_id in channel_keys:
+                if self._sessions_by_channel_id.get(channel_id) is session:
+                    del self._sessions_by_channel_id[channel_id]
+            self._reindex(call_id, (None,) * len(_INDEXES))
             
             logger.debug("Call session removed",
                         call_id=call_id,
@@ -200,7 +286,11 @@ class SessionStore:
     async def add_playback(self, playback_ref: PlaybackRef) -> None:
         """Add a playback reference."""
         async with self._lock:
+            previous = self._playbacks.get(playback_ref.playback_id)
+            if previous is not None:
+                self._discard_playback_index(previous)
             self._playbacks[playback_ref.playback_id] = playback_ref
+            self._playbacks_by_call.setdefault(playback_ref.call_id, set()).add(playback_ref.playback_id)
             logger.debug("Playback reference added",
                         playback_id=playback_ref.playback_id,
                         call_id=playback_ref.call_id)
@@ -210,75 +300,82 @@ class SessionStore:
         async with self._lock:
             playback_ref = self._playbacks.pop(playback_id, None)
             if playback_ref:
+                self._discard_playback_index(playback_ref)
                 logger.debug("Playback reference removed",
                            playback_id=playback_id,
                            call_id=playback_ref.call_id)
             return playback_ref
+
+    def _discard_playback_index(self, playback_ref: PlaybackRef) -> None:
+        members = self._playbacks_by_call.get(playback_ref.call_id)
+        if members is not None:
+            members.discard(playback_ref.playback_id)
+            if not members:
+                del self._playbacks_by_call[playback_ref.call_id]
     
     async def get_playback(self, playback_id: str) -> Optional[PlaybackRef]:
         """Get a playback reference without removing it."""
-        async with self._lock:
-            return self._playbacks.get(playback_id)
+        return self._playbacks.get(playback_id)
 
     async def list_playbacks_for_call(self, call_id: str) -> List[str]:
         """List playback IDs associated with a given call_id."""
-        async with self._lock:
-            return [pid for pid, pref in self._playbacks.items() if pref.call_id == call_id]
+        return list(self._playbacks_by_call.get(call_id, ()))
     
     async def list_active_calls(self) -> List[str]:
         """Get list of active call IDs."""
-        async with self._lock:
-            return list(self._sessions_by_call_id.keys())
+        return list(self._sessions_by_call_id.keys())
     
     async def get_all_sessions(self) -> List[CallSession]:
         """Get all active sessions."""
-        async with self._lock:
-            return list(self._sessions_by_call_id.values())
+        return list(self._sessions_by_call_id.values())
 
     async def count_active_outbound_calls(self, campaign_id: Optional[str] = None) -> int:
         """Count active outbound calls (optionally scoped to a campaign)."""
-        async with self._lock:
-            count = 0
-            for session in self._sessions_by_call_id.values():
-                if not getattr(session, "is_outbound", False):
-                    continue
-                if campaign_id and getattr(session, "outbound_campaign_id", None) != campaign_id:
-                    continue
-                count += 1
-            return count
+        if campaign_id:
+            return len(self._indexes["campaign"].get(campaign_id, ()))
+        return len(self._indexes["outbound"].get(True, ()))
+
+    def count_by_provider(self, provider_name: str) -> int:
+        """Count active calls whose session uses ``provider_name``."""
+        return len(self._indexes["provider"].get(provider_name, ()))
+
+    def count_by_status(self, status: str) -> int:
+        """Count active calls currently in ``status``."""
+        return len(self._indexes["status"].get(status, ()))
     
     async def get_session_stats(self) -> Dict[str, any]:
         """Get statistics about active sessions including per-call details."""
-        async with self._lock:
-            # Build list of active call details for Admin UI topology
-            active_sessions = []
-            for call_id, session in self._sessions_by_call_id.items():
-                active_sessions.append({
-                    "call_id": call_id,
-                    "provider": session.provider_name,
-                    "pipeline": session.pipeline_name,
-                    "context": session.context_name,
-                    "status": session.status,
-                    "conversation_state": session.conversation_state,
-                })
-            
-            return {
-                "active_calls": len(self._sessions_by_call_id),
-                "active_playbacks": len(self._playbacks),
-                "provider_sessions": len(self._provider_sessions),
-                "sessions": active_sessions,
-            }
+        # Build list of active call details for Admin UI topology
+        active_sessions = []
+        for call_id, session in self._sessions_by_call_id.items():
+            active_sessions.append({
+                "call_id": call_id,
+                "provider": session.provider_name,
+                "pipeline": session.pipeline_name,
+                "context": session.context_name,
+                "status": session.status,
+                "conversation_state": session.conversation_state,
+            })
+        
+        return {
+            "active_calls": len(self._sessions_by_call_id),
+            "active_playbacks": len(self._playbacks),
+            "provider_sessions": len(self._provider_sessions),
+            "outbound_calls": len(self._indexes["outbound"].get(True, ())),
+            "by_provider": {name: len(calls) for name, calls in self._indexes["provider"].items()},
+            "by_status": {status: len(calls) for status, calls in self._indexes["status"].items()},
+            "sessions": active_sessions,
+        }
     
     async def cleanup_expired_sessions(self, max_age_seconds: float = 3600) -> int:
         """Clean up sessions older than max_age_seconds."""
-        # First pass: identify expired calls while holding lock
-        async with self._lock:
-            current_time = time.time()
-            expired_calls = []
-            
-            for call_id, session in self._sessions_by_call_id.items():
-                if current_time - session.created_at > max_age_seconds:
-                    expired_calls.append(call_id)
+        # First pass: identify expired calls from the current snapshot
+        current_time = time.time()
+        expired_calls = [
+            call_id
+            for call_id, session in self._sessions_by_call_id.items()
+            if current_time - session.created_at > max_age_seconds
+        ]
         
         # Second pass: remove expired calls (each remove_call acquires its own lock)
         for call_id in expired_calls:
@@ -0,0 +1,133 @@
+"""
+ARI app sharding: several ai-engine processes on one host split the calls of one
+Asterisk box.
+
+Every shard subscribes to the front-door Stasis app (the one the dialplan uses) and
+to its own shard app (``<app>-shard-<index>``). A caller channel entering the front
+door is handled by the shard its channel id hashes to; everything a shard originates
+(ExternalMedia/AudioSocket legs, outbound calls) enters its own shard app, so it
+comes back to the same process. Stasis re-entries from the dialplan carry a call or
+attempt id in their args and are routed through owner records in the StateBackend.
+
+Per-process ports are split too: the AudioSocket and health ports are offset by the
+shard index and the ExternalMedia RTP port range is partitioned.
+"""
+
+from __future__ import annotations
+
+import zlib
+from dataclasses import dataclass
+from typing import Any, Callable, Tuple
+
+import structlog
+
+from .state_backend import StateBackend
+
+logger = structlog.get_logger(__name__)
+
+# Owner records outlive any sane call; they are deleted on cleanup and expire after a crash.
+OWNER_TTL_SEC = 6 * 3600
+
+
+def shard_for(key: str, shard_count: int) -> int:
+    """Stable shard index for ``key`` (CRC-32, identical in every process)."""
+    if shard_count <= 1:
+        return 0
+    return zlib.crc32(str(key).encode("utf-8")) % shard_count
+
+
+@dataclass(frozen=True)
+class ShardInfo:
+    index: int = 0
+    count: int = 1
+    app_name: str = "asterisk-ai-voice-agent"
+
+    def __post_init__(self) -> None:
+        if self.count < 1 or not 0 <= self.index < self.count:
+            raise ValueError(f"Invalid shard {self.index} of {self.count}")
+
+    @classmethod
+    def from_config(cls, cluster_config: Any, app_name: str) -> "ShardInfo":
+        return cls(
+            index=int(getattr(cluster_config, "shard_index", 0) or 0),
+            count=int(getattr(cluster_config, "shard_count", 1) or 1),
+            app_name=app_name,
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return self.count > 1
+
+    @property
+    def member(self) -> str:
+        return str(self.index)
+
+    @property
+    def origination_app(self) -> str:
+        """Stasis app for channels this shard originates."""
+        return f"{self.app_name}-shard-{self.index}" if self.enabled else self.app_name
+
+    def owns(self, key: str) -> bool:
+        return shard_for(key, self.count) == self.index
+
+    def port(self, base_port: int) -> int:
+        return int(base_port) + self.index
+
+    def port_range(self, start: int, end: int) -> Tuple[int, int]:
+        """This shard's slice of an inclusive port range."""
+        if not self.enabled:
+            return (start, end)
+        if start == end:
+            return (self.port(start), self.port(start))
+        size = end - start + 1
+        if size < self.count:
+            raise ValueError(f"port range {start}-{end} is too small for {self.count} shards")
+        block = size // self.count
+        first = start + self.index * block
+        last = end if self.index == self.count - 1 else first + block - 1
+        return (first, last)
+
+
+def owner_key(key: str) -> str:
+    return f"owner:{key}"
+
+
+class ShardRouter:
+    """Decides whether this shard handles a StasisStart and records call ownership."""
+
+    def __init__(self, shard: ShardInfo, backend: StateBackend, is_local: Callable[[str], bool]):
+        self.shard = shard
+        self.backend = backend
+        self._is_local = is_local
+
+    async def owns_stasis_start(self, event: dict) -> bool:
+        if not self.shard.enabled:
+            return True
+        application = event.get("application")
+        if application == self.shard.origination_app:
+            return True
+        if application and application != self.shard.app_name:
+            return False
+
+        # Re-entries (outbound AMD, agent actions) name the call or attempt they belong to.
+        args = event.get("args") or []
+        for arg in args[1:]:
+            arg = str(arg or "").strip()
+            if not arg:
+                continue
+            if self._is_local(arg):
+                return True
+            owner = await self.backend.get(owner_key(arg))
+            if owner is not None:
+                return int(owner) == self.shard.index
+
+        channel_id = str((event.get("channel") or {}).get("id") or "")
+        return self.shard.owns(channel_id)
+
+    async def claim(self, key: str) -> None:
+        if self.shard.enabled and key:
+            await self.backend.set(owner_key(key), self.shard.index, ttl_sec=OWNER_TTL_SEC)
+
+    async def release(self, key: str) -> None:
+        if self.shard.enabled and key:
+            await self.backend.delete(owner_key(key))
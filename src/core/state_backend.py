@@ -0,0 +1,257 @@
+"""
+Shared engine state for cluster mode (several ai-engine processes, one Asterisk).
+
+Per-call state (SessionStore, ConversationCoordinator, provider sessions) stays in
+the process that owns the call: ARI sharding routes every Stasis entry for a call to
+one shard. What has to agree across shards lives behind StateBackend:
+
+- owner records (call_id / outbound attempt -> shard) so Stasis re-entries from the
+  dialplan reach the shard holding the call
+- per-shard load reports with an atomic reserve, used for outbound campaign capacity
+  and the cluster-wide active call count
+- shard heartbeats
+
+MemoryStateBackend is the default (single process). SQLiteStateBackend shares a WAL
+database file between engine processes on one host, in the same short-transaction +
+executor style as the Call History and outbound stores.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+
+class StateBackend(ABC):
+    """Cross-process engine state. Values are JSON-serializable; TTLs are seconds."""
+
+    name = "base"
+
+    async def start(self) -> None:
+        """Open resources (idempotent)."""
+
+    async def close(self) -> None:
+        """Release resources."""
+
+    @abstractmethod
+    async def get(self, key: str) -> Any:
+        """Return the live value for ``key`` or None."""
+
+    @abstractmethod
+    async def set(self, key: str, value: Any, *, ttl_sec: Optional[float] = None) -> None:
+        """Store ``value`` under ``key``, optionally expiring after ``ttl_sec``."""
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        """Remove ``key`` if present."""
+
+    @abstractmethod
+    async def report_load(self, scope: str, member: str, load: int, *, ttl_sec: float) -> None:
+        """Publish ``member``'s current load in ``scope`` (expires unless refreshed)."""
+
+    @abstractmethod
+    async def loads(self, scope: str) -> Dict[str, int]:
+        """Live load reports in ``scope`` by member."""
+
+    @abstractmethod
+    async def try_reserve(self, scope: str, member: str, load: int, *, limit: int, ttl_sec: float) -> bool:
+        """
+        Atomically publish ``load`` for ``member`` and, if the scope total stays within
+        ``limit`` after adding one, record ``load + 1`` and return True.
+        """
+
+    async def total_load(self, scope: str) -> int:
+        return sum((await self.loads(scope)).values())
+
+
+class MemoryStateBackend(StateBackend):
+    """In-process backend; the default when the engine runs as a single process."""
+
+    name = "memory"
+
+    def __init__(self) -> None:
+        self._kv: Dict[str, Tuple[Any, Optional[float]]] = {}
+        self._loads: Dict[str, Dict[str, Tuple[int, float]]] = {}
+
+    async def get(self, key: str) -> Any:
+        entry = self._kv.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at is not None and expires_at <= time.time():
+            self._kv.pop(key, None)
+            return None
+        return value
+
+    async def set(self, key: str, value: Any, *, ttl_sec: Optional[float] = None) -> None:
+        self._kv[key] = (value, time.time() + ttl_sec if ttl_sec else None)
+
+    async def delete(self, key: str) -> None:
+        self._kv.pop(key, None)
+
+    async def report_load(self, scope: str, member: str, load: int, *, ttl_sec: float) -> None:
+        self._loads.setdefault(scope, {})[member] = (int(load), time.time() + ttl_sec)
+
+    async def loads(self, scope: str) -> Dict[str, int]:
+        now = time.time()
+        members = self._loads.get(scope, {})
+        for member in [m for m, (_, expires_at) in members.items() if expires_at <= now]:
+            del members[member]
+        return {member: load for member, (load, _) in members.items()}
+
+    async def try_reserve(self, scope: str, member: str, load: int, *, limit: int, ttl_sec: float) -> bool:
+        await self.report_load(scope, member, load, ttl_sec=ttl_sec)
+        if await self.total_load(scope) + 1 > limit:
+            return False
+        await self.report_load(scope, member, load + 1, ttl_sec=ttl_sec)
+        return True
+
+
+class SQLiteStateBackend(StateBackend):
+    """Backend shared by engine processes on one host through a SQLite file."""
+
+    name = "sqlite"
+
+    _CREATE_TABLES_SQL = [
+        """
+        CREATE TABLE IF NOT EXISTS engine_state_kv (
+            key TEXT PRIMARY KEY,
+            value TEXT NOT NULL,
+            expires_at REAL
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS engine_state_load (
+            scope TEXT NOT NULL,
+            member TEXT NOT NULL,
+            load INTEGER NOT NULL,
+            expires_at REAL NOT NULL,
+            PRIMARY KEY (scope, member)
+        )
+        """,
+    ]
+
+    def __init__(self, db_path: str) -> None:
+        self._db_path = db_path
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _get_connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            db_dir = os.path.dirname(self._db_path)
+            if db_dir:
+                Path(db_dir).mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self._db_path, timeout=30.0, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL;")
+            conn.execute("PRAGMA synchronous=NORMAL;")
+            conn.execute("PRAGMA busy_timeout=30000;")
+            for stmt in self._CREATE_TABLES_SQL:
+                conn.execute(stmt)
+            self._conn = conn
+        return self._conn
+
+    async def _run(self, fn):
+        def locked():
+            with self._lock:
+                return fn(self._get_connection())
+
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, locked)
+
+    async def start(self) -> None:
+        await self._run(lambda conn: None)
+        logger.info("Engine state backend ready", backend=self.name, db_path=self._db_path)
+
+    async def close(self) -> None:
+        def _close():
+            with self._lock:
+                if self._conn is not None:
+                    self._conn.close()
+                    self._conn = None
+
+        await asyncio.get_event_loop().run_in_executor(None, _close)
+
+    async def get(self, key: str) -> Any:
+        def _sync(conn):
+            row = conn.execute(
+                "SELECT value FROM engine_state_kv WHERE key = ? AND (expires_at IS NULL OR expires_at > ?)",
+                (key, time.time()),
+            ).fetchone()
+            return json.loads(row[0]) if row else None
+
+        return await self._run(_sync)
+
+    async def set(self, key: str, value: Any, *, ttl_sec: Optional[float] = None) -> None:
+        payload = json.dumps(value)
+        expires_at = time.time() + ttl_sec if ttl_sec else None
+        await self._run(
+            lambda conn: conn.execute(
+                "INSERT OR REPLACE INTO engine_state_kv (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, payload, expires_at),
+            )
+        )
+
+    async def delete(self, key: str) -> None:
+        await self._run(lambda conn: conn.execute("DELETE FROM engine_state_kv WHERE key = ?", (key,)))
+
+    @staticmethod
+    def _upsert_load(conn: sqlite3.Connection, scope: str, member: str, load: int, expires_at: float) -> None:
+        conn.execute(
+            "INSERT OR REPLACE INTO engine_state_load (scope, member, load, expires_at) VALUES (?, ?, ?, ?)",
+            (scope, member, int(load), expires_at),
+        )
+
+    async def report_load(self, scope: str, member: str, load: int, *, ttl_sec: float) -> None:
+        await self._run(lambda conn: self._upsert_load(conn, scope, member, load, time.time() + ttl_sec))
+
+    async def loads(self, scope: str) -> Dict[str, int]:
+        def _sync(conn):
+            rows = conn.execute(
+                "SELECT member, load FROM engine_state_load WHERE scope = ? AND expires_at > ?",
+                (scope, time.time()),
+            ).fetchall()
+            return {str(member): int(load) for member, load in rows}
+
+        return await self._run(_sync)
+
+    async def try_reserve(self, scope: str, member: str, load: int, *, limit: int, ttl_sec: float) -> bool:
+        def _sync(conn):
+            now = time.time()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._upsert_load(conn, scope, member, load, now + ttl_sec)
+                (total,) = conn.execute(
+                    "SELECT COALESCE(SUM(load), 0) FROM engine_state_load WHERE scope = ? AND expires_at > ?",
+                    (scope, now),
+                ).fetchone()
+                reserved = int(total) + 1 <= int(limit)
+                if reserved:
+                    self._upsert_load(conn, scope, member, load + 1, now + ttl_sec)
+                conn.execute("COMMIT")
+                return reserved
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+
+        return await self._run(_sync)
+
+
+def create_state_backend(cluster_config: Any = None) -> StateBackend:
+    """Build the backend selected by ``cluster.state_backend`` (memory | sqlite)."""
+    kind = str(getattr(cluster_config, "state_backend", None) or "memory").strip().lower()
+    if kind == "memory":
+        return MemoryStateBackend()
+    if kind == "sqlite":
+        return SQLiteStateBackend(str(getattr(cluster_config, "state_db_path", None) or "data/engine_state.db"))
+    raise ValueError(f"Unknown cluster.state_backend: {kind!r} (expected 'memory' or 'sqlite')")
@@ -25,6 +25,8 @@ from src.audio.resampler import (
 )
 from src.core.session_store import SessionStore
 from src.core.models import CallSession, PlaybackRef
+from src.core.loop_monitor import timed_stage
+from src.logging_config import get_hot_logger, hot_path
 from .adaptive_streaming import (
     StreamCharacterizer,
     AdaptiveBufferController,
@@ -37,6 +39,7 @@ if TYPE_CHECKING:  # pragma: no cover - typing only
     from src.core.playback_manager import PlaybackManager
 
 logger = structlog.get_logger(__name__)
+hot_log = get_hot_logger(__name__)
 
 _JITTER_SENTINEL = object()
 
@@ -142,6 +145,7 @@ class StreamingPlaybackManager:
         audiosocket_server: Optional[Any] = None,
         audio_diag_callback: Optional[Callable[[str, str, bytes, str, int], Awaitable[None]]] = None,
         audio_capture_manager: Optional[Any] = None,
+        tracer: Optional[Any] = None,
     ):
         self.session_store = session_store
         self.ari_client = ari_client
@@ -153,6 +157,7 @@ class StreamingPlaybackManager:
         self.audiosocket_server = audiosocket_server
         self.audio_diag_callback = audio_diag_callback
         self.audio_capture_manager = audio_capture_manager
+        self.tracer = tracer
         self.audiosocket_format: str = "ulaw"  # default format expected by dialplan
         # Debug: when True, send frames to all AudioSocket conns for the call
         self.audiosocket_broadcast_debug: bool = bool(self.streaming_config.get('audiosocket_broadcast_debug', False))
@@ -1039,6 +1044,7 @@ class StreamingPlaybackManager:
         except Exception as e:
             logger.error("Error in pacer loop", call_id=call_id, stream_id=stream_id, error=str(e), exc_info=True)
     
+    @timed_stage("drain_next_frame")
     async def _drain_next_frame(
         self,
         call_id: str,
@@ -1414,6 +1420,7 @@ class StreamingPlaybackManager:
                     pass
         return "sent"
     
+    @timed_stage("process_audio_chunk")
     async def _process_audio_chunk(self, call_id: str, chunk: bytes) -> Optional[bytes]:
         """Process audio chunk for streaming transport."""
         if not chunk:
@@ -2052,50 +2059,50 @@ class StreamingPlaybackManager:
                                 pre_w.extend(working[:needw])
                     except Exception:
                         pass
-                try:
-                    if isinstance(info.get('tap_first_window_post'), bytearray) and back_pcm:
-                        post_w = info['tap_first_window_post']
-                        if len(post_w) < win_bytes:
-                            needw2 = win_bytes - len(post_w)
-                            post_w.extend(back_pcm[:needw2])
-                            if not info.get('tap_first_window_done'):
-                                pre_w = info.get('tap_first_window_pre') or bytearray()
-                                post_w = info.get('tap_first_window_post') or bytearray()
-                                if len(pre_w) >= win_bytes and len(post_w) >= win_bytes:
-                                    sid = str(info.get('stream_id', 'seg'))
-                                    # Write 200ms snapshots
-                                    try:
-                                        fnp200 = os.path.join(self.diag_out_dir, f"pre_compand_pcm16_{call_id}_{sid}_first200ms.wav")
-                                        with wave.open(fnp200, 'wb') as wf:
-                                            wf.setnchannels(1)
-                                            wf.setsampwidth(2)
-                                            wf.setframerate(win_rate)
-                                            wf.writeframes(bytes(pre_w[:win_bytes]))
+                    try:
+                        if isinstance(info.get('tap_first_window_post'), bytearray) and back_pcm:
+                            post_w = info['tap_first_window_post']
+                            if len(post_w) < win_bytes:
+                                needw2 = win_bytes - len(post_w)
+                                post_w.extend(back_pcm[:needw2])
+                                if not info.get('tap_first_window_done'):
+                                    pre_w = info.get('tap_first_window_pre') or bytearray()
+                                    post_w = info.get('tap_first_window_post') or bytearray()
+                                    if len(pre_w) >= win_bytes and len(post_w) >= win_bytes:
+                                        sid = str(info.get('stream_id', 'seg'))
+                                        # Write 200ms snapshots
                                         try:
-                                            os.chmod(fnp200, 0o600)
+                                            fnp200 = os.path.join(self.diag_out_dir, f"pre_compand_pcm16_{call_id}_{sid}_first200ms.wav")
+                                            with wave.open(fnp200, 'wb') as wf:
+                                                wf.setnchannels(1)
+                                                wf.setsampwidth(2)
+                                                wf.setframerate(win_rate)
+                                                wf.writeframes(bytes(pre_w[:win_bytes]))
+                                            try:
+                                                os.chmod(fnp200, 0o600)
+                                            except Exception:
+                                                pass
+                                            logger.info("Wrote pre-compand 200ms snapshot", call_id=call_id, stream_id=sid, path=fnp200, bytes=win_bytes, rate=win_rate, snapshot="first200ms")
                                         except Exception:
-                                            pass
-                                        logger.info("Wrote pre-compand 200ms snapshot", call_id=call_id, stream_id=sid, path=fnp200, bytes=win_bytes, rate=win_rate, snapshot="first200ms")
-                                    except Exception:
-                                        logger.warning("Failed 200ms pre snapshot", call_id=call_id, stream_id=sid, rate=win_rate, exc_info=True)
-                                    try:
-                                        fnq200 = os.path.join(self.diag_out_dir, f"post_compand_pcm16_{call_id}_{sid}_first200ms.wav")
-                                        with wave.open(fnq200, 'wb') as wf:
-                                            wf.setnchannels(1)
-                                            wf.setsampwidth(2)
-                                            wf.setframerate(win_rate)
-                                            wf.writeframes(bytes(post_w[:win_bytes]))
+                                            logger.warning("Failed 200ms pre snapshot", call_id=call_id, stream_id=sid, rate=win_rate, exc_info=True)
                                         try:
-                                            os.chmod(fnq200, 0o600)
+                                            fnq200 = os.path.join(self.diag_out_dir, f"post_compand_pcm16_{call_id}_{sid}_first200ms.wav")
+                                            with wave.open(fnq200, 'wb') as wf:
+                                                wf.setnchannels(1)
+                                                wf.setsampwidth(2)
+                                                wf.setframerate(win_rate)
+                                                wf.writeframes(bytes(post_w[:win_bytes]))
+                                            try:
+                                                os.chmod(fnq200, 0o600)
+                                            except Exception:
+                                                pass
+                                            logger.info("Wrote post-compand 200ms snapshot", call_id=call_id, stream_id=sid, path=fnq200, bytes=win_bytes, rate=win_rate, snapshot="first200ms")
                                         except Exception:
-                                            pass
-                                        logger.info("Wrote post-compand 200ms snapshot", call_id=call_id, stream_id=sid, path=fnq200, bytes=win_bytes, rate=win_rate, snapshot="first200ms")
-                                    except Exception:
-                                        logger.warning("Failed 200ms post snapshot", call_id=call_id, stream_id=sid, rate=win_rate, exc_info=True)
-                                    info['tap_first_window_done'] = True
-                except Exception:
-                    logger.debug("First-window snapshot failed (ulaw)", call_id=call_id, exc_info=True)
-                    return ulaw_bytes
+                                            logger.warning("Failed 200ms post snapshot", call_id=call_id, stream_id=sid, rate=win_rate, exc_info=True)
+                                        info['tap_first_window_done'] = True
+                    except Exception:
+                        logger.debug("First-window snapshot failed (ulaw)", call_id=call_id, exc_info=True)
+                        return ulaw_bytes
                 return pcm16le_to_mulaw(working)
             # Otherwise target PCM16, apply optional envelope/limiter, with optional (or auto) egress byteswap
             # Short attack envelope to avoid hot-start clicks on PCM path too
@@ -2343,6 +2350,7 @@ class StreamingPlaybackManager:
             logger.error("SILENCE TRIM FAILED", error=str(e), exc_info=True)
             return pcm_bytes
 
+    @hot_path
     def _apply_normalizer(self, pcm_bytes: bytes, target_rms: int, max_gain_db: float) -> bytes:
         """Apply simple RMS-based make-up gain to PCM16 LE audio.
 
@@ -2353,7 +2361,7 @@ class StreamingPlaybackManager:
         """
         # Entry diagnostics
         try:
-            logger.debug(
+            hot_log.debug(
                 "NORMALIZER FUNCTION ENTRY",
                 pcm_bytes_len=(len(pcm_bytes) if pcm_bytes else 0),
                 target_rms=int(target_rms),
@@ -2363,7 +2371,7 @@ class StreamingPlaybackManager:
             pass
         if not pcm_bytes or target_rms <= 0:
             try:
-                logger.debug(
+                hot_log.debug(
                     "NORMALIZER EARLY RETURN #1",
                     empty_pcm=(not bool(pcm_bytes)),
                     invalid_target=bool(target_rms <= 0),
@@ -2376,7 +2384,7 @@ class StreamingPlaybackManager:
             buf = array.array('h')
             buf.frombytes(pcm_bytes)
             try:
-                logger.debug(
+                hot_log.debug(
                     "NORMALIZER BUFFER DECODED",
                     buf_itemsize=int(buf.itemsize),
                     buf_len=int(len(buf)),
@@ -2385,7 +2393,7 @@ class StreamingPlaybackManager:
                 pass
             if buf.itemsize != 2 or len(buf) == 0:
                 try:
-                    logger.debug(
+                    hot_log.debug(
                         "NORMALIZER EARLY RETURN #2",
                         wrong_itemsize=bool(buf.itemsize != 2),
                         empty_buffer=bool(len(buf) == 0),
@@ -2407,7 +2415,7 @@ class StreamingPlaybackManager:
             gain = min(desired, max_lin)
             # Diagnostics: always log RMS/gain decision for RCA
             try:
-                logger.debug(
+                hot_log.debug(
                     "NORMALIZER RMS CHECK",
                     current_rms=int(rms),
                     target_rms=int(target_rms),
@@ -2419,13 +2427,13 @@ class StreamingPlaybackManager:
             if gain <= 1.01:
                 # Avoid tiny changes to reduce CPU
                 try:
-                    logger.debug("NORMALIZER SKIPPED - gain too small", gain=round(gain, 3), current_rms=int(rms))
+                    hot_log.debug("NORMALIZER SKIPPED - gain too small", gain=round(gain, 3), current_rms=int(rms))
                 except Exception:
                     pass
                 return pcm_bytes
             try:
                 gain_db = 20.0 * math.log10(max(1e-6, gain))
-                logger.debug("Normalizer applied", target_rms=target_rms, current_rms=int(rms), gain_db=round(gain_db, 2))
+                hot_log.debug("Normalizer applied", target_rms=target_rms, current_rms=int(rms), gain_db=round(gain_db, 2))
             except Exception:
                 pass
             # Apply and clip
@@ -2476,6 +2484,7 @@ class StreamingPlaybackManager:
         except Exception:
             return pcm_bytes
 
+    @hot_path
     async def _send_audio_chunk(
         self,
         call_id: str,
@@ -2487,11 +2496,17 @@ class StreamingPlaybackManager:
     ) -> bool:
         """Send audio chunk via configured streaming transport."""
         try:
-            session = await self.session_store.get_by_call_id(call_id)
+            stream_info = self.active_streams.get(call_id, {})
+            # One cached SessionRef per active stream instead of a store lookup per chunk
+            session_ref = stream_info.get("session_ref")
+            if session_ref is None:
+                session_ref = self.session_store.ref(call_id)
+                if call_id in self.active_streams:
+                    stream_info["session_ref"] = session_ref
+            session = session_ref.get()
             if not session:
                 logger.warning("Cannot stream audio - session not found", call_id=call_id)
                 return False
-            stream_info = self.active_streams.get(call_id, {})
             if self.audio_diag_callback:
                 try:
                     effective_fmt = (
@@ -2519,7 +2534,7 @@ class StreamingPlaybackManager:
                         self.active_streams[call_id] = info
                     except Exception:
                         pass
-                    logger.debug("Streaming diagnostics callback failed", call_id=call_id, exc_info=True)
+                    hot_log.debug("Streaming diagnostics callback failed", call_id=call_id, exc_info=True)
 
             if self.audio_transport == "externalmedia":
                 if not self.rtp_server:
@@ -2572,6 +2587,9 @@ class StreamingPlaybackManager:
                             info = self.active_streams[call_id]
                             info['tx_bytes'] = int(info.get('tx_bytes', 0)) + len(rtp_chunk)
                             info['tx_total_bytes'] = int(info.get('tx_total_bytes', 0) or 0) + len(rtp_chunk)
+                            if not info.get('first_frame_observed'):
+                                info['first_frame_observed'] = True
+                                self._trace_first_frame(call_id)
                     except Exception:
                         pass
                 return success
@@ -2594,7 +2612,7 @@ class StreamingPlaybackManager:
                             int(target_rate or self.sample_rate),
                         )
                     except Exception:
-                        logger.debug("Outbound audio capture failed", call_id=call_id, exc_info=True)
+                        hot_log.debug("Outbound audio capture failed", call_id=call_id, exc_info=True)
                 # One-time debug for first outbound frame to identify codec/format
                 if call_id not in self._first_send_logged:
                     fmt = (
@@ -2663,7 +2681,7 @@ class StreamingPlaybackManager:
                                 except Exception:
                                     logger.warning("Failed to write post-compand tap snapshot", call_id=call_id, stream_id=stream_id, path=fn2, rate=rate, snapshot="first", exc_info=True)
                     except Exception:
-                        logger.debug("Per-segment tap snapshot failed", call_id=call_id, stream_id=stream_id, exc_info=True)
+                        hot_log.debug("Per-segment tap snapshot failed", call_id=call_id, stream_id=stream_id, exc_info=True)
                 if self.audiosocket_broadcast_debug:
                     conns = list(set(getattr(session, 'audiosocket_conns', []) or []))
                     sent = 0
@@ -2674,7 +2692,7 @@ class StreamingPlaybackManager:
                         logger.warning("AudioSocket broadcast send failed (no recipients)", call_id=call_id, stream_id=stream_id)
                         return False
                     if len(conns) > 1:
-                        logger.debug("AudioSocket broadcast sent", call_id=call_id, stream_id=stream_id, recipients=len(conns))
+                        hot_log.debug("AudioSocket broadcast sent", call_id=call_id, stream_id=stream_id, recipients=len(conns))
                     return True
                 # Normal single-conn send
                 success = await self.audiosocket_server.send_audio(conn_id, chunk)
@@ -2697,6 +2715,7 @@ class StreamingPlaybackManager:
                         first_s = max(0.0, time.time() - start_time)
                         _STREAM_FIRST_FRAME_SECONDS.labels(pb_type).observe(first_s)
                         self.active_streams[call_id]['first_frame_observed'] = True
+                        self._trace_first_frame(call_id)
                 except Exception:
                     pass
                 return success
@@ -2714,6 +2733,10 @@ class StreamingPlaybackManager:
                         exc_info=True)
             return False
 
+    def _trace_first_frame(self, call_id: str) -> None:
+        if self.tracer is not None:
+            self.tracer.get(call_id).mark("audio.first_frame", once=True)
+
     def _remove_dc_from_pcm16(
         self,
         call_id: str,
@@ -0,0 +1,519 @@
+"""Per-call latency tracing (turn waterfalls).
+
+Prometheus histograms say how slow turns are on average; a call trace says why
+one particular turn took 2.4 s. Each call gets a trace (random trace id) with a
+root ``call`` span, a ``call.setup`` span with one child per ARI setup step, and
+one ``turn`` span per response. Stage spans and instant marks (VAD end of
+speech, STT final, LLM, tools, TTS first byte, first outbound frame) hang off
+the open turn, so every span carries the call id and turn number.
+
+Caller-side events that happen before the engine starts responding
+(``vad.end_of_speech``, ``stt.final``) are held as pending marks and attached to
+the turn that consumes them; the turn starts at the earliest of them, so a
+turn's waterfall begins where the caller stopped talking.
+
+When the call ends the trace is summarized (setup steps and per-turn stage
+offsets, stored in call history) and, if an exporter is configured, handed to a
+background thread that writes it as OTLP/JSON (``ExportTraceServiceRequest``)
+to a JSON-lines file or POSTs it to an OTLP/HTTP collector.
+
+Overhead is bounded: recording a span is one object and a ``time_ns()`` call on
+the event loop, spans per call are capped (``max_spans_per_call``), unsampled
+calls get a no-op trace, and the export queue drops whole traces instead of
+blocking when the exporter falls behind.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import queue
+import random
+import threading
+import time
+import urllib.request
+from typing import Any, Dict, List, Optional
+
+from prometheus_client import Counter
+
+from src.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+_SPANS = Counter(
+    "ai_agent_trace_spans_total",
+    "Spans recorded by per-call latency tracing",
+)
+_DROPPED = Counter(
+    "ai_agent_trace_dropped_total",
+    "Spans or call traces dropped by per-call latency tracing",
+    labelnames=("reason",),  # span_limit | queue_full | export_error
+)
+_EXPORTED = Counter(
+    "ai_agent_trace_exported_calls_total",
+    "Call traces written by the trace exporter",
+)
+
+# Caller-side events recorded before the turn they belong to has started.
+PRECURSORS = frozenset({"vad.end_of_speech", "stt.final"})
+_PRECURSOR_MAX_AGE_NS = 30 * 1_000_000_000
+# Marks that end a turn's response time, most to least direct.
+_RESPONSE_MARKS = ("audio.first_frame", "provider.first_audio", "tts.first_byte")
+
+
+def _ms(ns: int) -> float:
+    return round(ns / 1_000_000.0, 1)
+
+
+def _attr_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def _attributes(attrs: Optional[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    return [{"key": k, "value": _attr_value(v)} for k, v in (attrs or {}).items() if v is not None]
+
+
+class Span:
+    """One timed operation; ``end()`` is idempotent. Usable as a context manager."""
+
+    __slots__ = ("trace", "name", "span_id", "parent_id", "start_ns", "end_ns", "attrs", "_step")
+
+    def __init__(
+        self, trace: "CallTrace", name: str, span_id: int, parent_id: int, start_ns: int, attrs: Optional[Dict[str, Any]]
+    ):
+        self.trace = trace
+        self.name = name
+        self.span_id = span_id
+        self.parent_id = parent_id
+        self.start_ns = start_ns
+        self.end_ns = 0
+        self.attrs = attrs
+        self._step: Optional[Span] = None
+
+    def set(self, **attrs: Any) -> None:
+        if attrs:
+            if self.attrs is None:
+                self.attrs = {}
+            self.attrs.update(attrs)
+
+    def end(self, **attrs: Any) -> None:
+        if self.end_ns:
+            return
+        if self._step is not None:
+            self._step.end()
+            self._step = None
+        self.set(**attrs)
+        self.end_ns = time.time_ns()
+
+    def step(self, name: str, **attrs: Any) -> "Span":
+        """End the previous sequential child (if any) and start the next one."""
+        if self._step is not None:
+            self._step.end()
+        self._step = self.trace._record(name, self.span_id, time.time_ns(), attrs or None)
+        return self._step
+
+    @property
+    def duration_ms(self) -> Optional[float]:
+        return _ms(self.end_ns - self.start_ns) if self.end_ns else None
+
+    def __enter__(self) -> "Span":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is not None and exc_type is not GeneratorExit:
+            self.end(error=exc_type.__name__)
+        else:
+            self.end()
+
+
+class _NoopSpan:
+    """Stands in for spans of unsampled calls and spans over the per-call cap."""
+
+    __slots__ = ()
+    name = ""
+    duration_ms = None
+
+    def set(self, **attrs: Any) -> None:
+        pass
+
+    def end(self, **attrs: Any) -> None:
+        pass
+
+    def step(self, name: str, **attrs: Any) -> "_NoopSpan":
+        return self
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        pass
+
+
+NOOP_SPAN = _NoopSpan()
+
+
+class CallTrace:
+    """Spans for one call. All methods are called from the event loop."""
+
+    enabled = True
+
+    def __init__(self, call_id: str, *, max_spans: int = 512, attrs: Optional[Dict[str, Any]] = None) -> None:
+        self.call_id = call_id
+        self.trace_id = random.getrandbits(128) or 1
+        # Span ids: random per-trace prefix + sequence number (unique within the trace).
+        self._id_base = (random.getrandbits(39) + 1) << 24
+        self.max_spans = max(8, int(max_spans))
+        self.spans: List[Span] = []
+        self.dropped = 0
+        self.turn = 0
+        self.root = Span(self, "call", self._id_base, 0, time.time_ns(), {"call_id": call_id, **(attrs or {})})
+        self.spans.append(self.root)
+        self._turn_span: Optional[Span] = None
+        self._last_turn: Optional[Span] = None
+        self._turn_first = 0
+        self._turn_once: set = set()
+        self._pending: Dict[str, tuple] = {}
+
+    # -- recording -----------------------------------------------------
+    def _record(self, name: str, parent_id: int, start_ns: int, attrs: Optional[Dict[str, Any]]):
+        if len(self.spans) >= self.max_spans:
+            self.dropped += 1
+            _DROPPED.labels("span_limit").inc()
+            return NOOP_SPAN
+        span = Span(self, name, self._id_base + len(self.spans), parent_id, start_ns, attrs)
+        self.spans.append(span)
+        return span
+
+    def _parent_id(self) -> int:
+        return (self._turn_span or self.root).span_id
+
+    def start_span(self, name: str, **attrs: Any):
+        """Start a span under the open turn (or the call) and return it; call ``end()``."""
+        return self._record(name, self._parent_id(), time.time_ns(), attrs or None)
+
+    span = start_span  # ``with trace.span("tool.execute", tool=name): ...``
+
+    def mark(self, name: str, *, once: bool = False, open_turn: bool = False, **attrs: Any) -> None:
+        """Record an instant event.
+
+        ``once`` keeps only the first occurrence per turn (first byte, first frame);
+        when the turn has already ended (playback outlives the code that produced
+        it) the mark still goes to that turn. ``open_turn`` starts a turn if none
+        is open (providers that report only their output). Precursor events with
+        no open turn wait for the next one.
+        """
+        parent_id = 0
+        if self._turn_span is None:
+            if name in PRECURSORS:
+                self._pending[name] = (time.time_ns(), attrs or None)
+                return
+            if open_turn:
+                self.begin_turn()
+            elif once and self._last_turn is not None:
+                parent_id = self._last_turn.span_id
+        if once:
+            if name in self._turn_once:
+                return
+            self._turn_once.add(name)
+        now = time.time_ns()
+        span = self._record(name, parent_id or self._parent_id(), now, attrs or None)
+        if span is not NOOP_SPAN:
+            span.end_ns = now
+
+    def begin_turn(self, **attrs: Any) -> int:
+        if self._turn_span is not None:
+            self.end_turn()
+        self.turn += 1
+        now = time.time_ns()
+        pending = sorted(
+            (ts, name, a) for name, (ts, a) in self._pending.items() if now - ts <= _PRECURSOR_MAX_AGE_NS
+        )
+        self._pending.clear()
+        self._turn_once = set()
+        self._last_turn = None
+        start = pending[0][0] if pending else now
+        self._turn_first = len(self.spans)
+        turn = self._record("turn", self.root.span_id, start, {"turn": self.turn, **attrs})
+        self._turn_span = turn if turn is not NOOP_SPAN else None
+        for ts, name, a in pending:
+            span = self._record(name, self._parent_id(), ts, a)
+            if span is not NOOP_SPAN:
+                span.end_ns = ts
+        return self.turn
+
+    def end_turn(self, **attrs: Any) -> None:
+        turn = self._turn_span
+        if turn is None:
+            return
+        self._turn_span = None
+        self._last_turn = turn
+        # Stage spans left open by early returns end with their turn.
+        for span in self.spans[self._turn_first:]:
+            if not span.end_ns and span.parent_id == turn.span_id:
+                span.end()
+        turn.end(**attrs)
+
+    def finish(self) -> Dict[str, Any]:
+        _SPANS.inc(len(self.spans))
+        self.end_turn()
+        for span in self.spans:
+            if not span.end_ns:
+                span.end()
+        return self.summary()
+
+    # -- views ---------------------------------------------------------
+    def summary(self) -> Dict[str, Any]:
+        """Compact per-call waterfall for call history."""
+        children: Dict[int, List[Span]] = {}
+        for span in self.spans[1:]:
+            children.setdefault(span.parent_id, []).append(span)
+
+        out: Dict[str, Any] = {"trace_id": f"{self.trace_id:032x}", "spans": len(self.spans), "dropped": self.dropped}
+        setup = next((s for s in children.get(self.root.span_id, ()) if s.name == "call.setup"), None)
+        if setup is not None:
+            out["setup_ms"] = setup.duration_ms
+            out["setup"] = {s.name: s.duration_ms for s in children.get(setup.span_id, ())}
+
+        turns = []
+        for turn in children.get(self.root.span_id, ()):
+            if turn.name != "turn":
+                continue
+            stages = []
+            stack = list(children.get(turn.span_id, ()))
+            while stack:
+                span = stack.pop()
+                stack.extend(children.get(span.span_id, ()))
+                stage: Dict[str, Any] = {"name": span.name, "at_ms": _ms(span.start_ns - turn.start_ns)}
+                if span.end_ns != span.start_ns:
+                    stage["ms"] = span.duration_ms
+                if span.attrs:
+                    stage.update({k: v for k, v in span.attrs.items() if k in ("tool", "speculative", "error")})
+                stages.append(stage)
+            stages.sort(key=lambda s: s["at_ms"])
+            # Response time: first audio sent to the caller, else the earliest output we saw.
+            at = {s["name"]: s["at_ms"] for s in reversed(stages)}
+            first_out = next((at[n] for n in _RESPONSE_MARKS if n in at), None)
+            turns.append(
+                {
+                    "turn": (turn.attrs or {}).get("turn"),
+                    "total_ms": turn.duration_ms,
+                    "response_ms": first_out,
+                    "stages": stages,
+                }
+            )
+        if turns:
+            out["turns"] = turns
+            ranked = [t for t in turns if t["response_ms"] is not None]
+            if ranked:
+                slowest = max(ranked, key=lambda t: t["response_ms"])
+                out["slowest_turn"] = slowest["turn"]
+                out["max_response_ms"] = slowest["response_ms"]
+        return out
+
+    def to_otlp(self, service_name: str = "ai-engine") -> Dict[str, Any]:
+        """OTLP/JSON ``ExportTraceServiceRequest`` for this call."""
+        trace_id = f"{self.trace_id:032x}"
+        turn_of: Dict[int, int] = {}
+        spans = []
+        for span in self.spans:
+            turn = turn_of.get(span.parent_id)
+            if span.name == "turn":
+                turn = (span.attrs or {}).get("turn")
+                turn_of[span.span_id] = turn
+            elif turn is not None:
+                turn_of[span.span_id] = turn
+            attrs = {"call.id": self.call_id}
+            if turn is not None:
+                attrs["call.turn"] = turn
+            attrs.update(span.attrs or {})
+            entry = {
+                "traceId": trace_id,
+                "spanId": f"{span.span_id:016x}",
+                "name": span.name,
+                "kind": 1,  # SPAN_KIND_INTERNAL
+                "startTimeUnixNano": str(span.start_ns),
+                "endTimeUnixNano": str(span.end_ns or span.start_ns),
+                "attributes": _attributes(attrs),
+            }
+            if span.parent_id:
+                entry["parentSpanId"] = f"{span.parent_id:016x}"
+            spans.append(entry)
+        return {
+            "resourceSpans": [
+                {
+                    "resource": {"attributes": _attributes({"service.name": service_name})},
+                    "scopeSpans": [{"scope": {"name": "ai_agent.call_trace"}, "spans": spans}],
+                }
+            ]
+        }
+
+
+class _NoopTrace:
+    """Trace for unsampled calls (and lookups of unknown calls): records nothing."""
+
+    enabled = False
+    call_id = ""
+    turn = 0
+
+    def start_span(self, name: str, **attrs: Any) -> _NoopSpan:
+        return NOOP_SPAN
+
+    span = start_span
+
+    def mark(self, name: str, **attrs: Any) -> None:
+        pass
+
+    def begin_turn(self, **attrs: Any) -> int:
+        return 0
+
+    def end_turn(self, **attrs: Any) -> None:
+        pass
+
+    def finish(self) -> Dict[str, Any]:
+        return {}
+
+
+NOOP_TRACE = _NoopTrace()
+
+
+class FileSpanExporter:
+    """Appends one OTLP/JSON request per call to a JSON-lines file."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def export(self, payload: Dict[str, Any]) -> None:
+        line = json.dumps(payload, separators=(",", ":"))
+        with open(self.path, "a", encoding="utf-8") as fh:
+            fh.write(line + "\n")
+
+
+class OTLPHttpSpanExporter:
+    """POSTs OTLP/JSON to a collector's ``/v1/traces`` endpoint."""
+
+    def __init__(self, endpoint: str, *, timeout_sec: float = 5.0, headers: Optional[Dict[str, str]] = None) -> None:
+        endpoint = endpoint.rstrip("/")
+        self.url = endpoint if endpoint.endswith("/v1/traces") else f"{endpoint}/v1/traces"
+        self.timeout_sec = timeout_sec
+        self.headers = {"Content-Type": "application/json", **(headers or {})}
+
+    def export(self, payload: Dict[str, Any]) -> None:
+        body = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+        request = urllib.request.Request(self.url, data=body, headers=self.headers, method="POST")
+        with urllib.request.urlopen(request, timeout=self.timeout_sec) as resp:
+            resp.read()
+
+
+class Tracer:
+    """Creates, looks up and finishes call traces; owns the export thread."""
+
+    def __init__(
+        self,
+        *,
+        enabled: bool = True,
+        sample_rate: float = 1.0,
+        max_spans_per_call: int = 512,
+        exporter: Optional[Any] = None,
+        queue_size: int = 256,
+        service_name: str = "ai-engine",
+    ) -> None:
+        self.enabled = bool(enabled)
+        self.sample_rate = min(1.0, max(0.0, float(sample_rate)))
+        self.max_spans_per_call = int(max_spans_per_call)
+        self.exporter = exporter
+        self.service_name = service_name
+        self._traces: Dict[str, CallTrace] = {}
+        self._queue: "queue.Queue[Optional[CallTrace]]" = queue.Queue(maxsize=max(1, int(queue_size)))
+        self._thread: Optional[threading.Thread] = None
+
+    @classmethod
+    def from_config(cls, cfg: Any) -> "Tracer":
+        if cfg is None:
+            return cls()
+        exporter = None
+        kind = str(getattr(cfg, "exporter", "none") or "none").lower()
+        try:
+            if kind == "file":
+                exporter = FileSpanExporter(getattr(cfg, "file_path", "data/traces/spans.jsonl"))
+            elif kind == "otlp_http":
+                exporter = OTLPHttpSpanExporter(getattr(cfg, "otlp_endpoint", "http://127.0.0.1:4318"))
+        except Exception:
+            logger.warning("Trace exporter unavailable; keeping call-history summaries only", exporter=kind, exc_info=True)
+        return cls(
+            enabled=getattr(cfg, "enabled", True),
+            sample_rate=getattr(cfg, "sample_rate", 1.0),
+            max_spans_per_call=getattr(cfg, "max_spans_per_call", 512),
+            exporter=exporter,
+            queue_size=getattr(cfg, "queue_size", 256),
+        )
+
+    def start_call(self, call_id: str, **attrs: Any):
+        if not self.enabled or not call_id:
+            return NOOP_TRACE
+        existing = self._traces.get(call_id)
+        if existing is not None:
+            return existing
+        if self.sample_rate < 1.0 and random.random() >= self.sample_rate:
+            return NOOP_TRACE
+        trace = CallTrace(call_id, max_spans=self.max_spans_per_call, attrs=attrs or None)
+        self._traces[call_id] = trace
+        return trace
+
+    def get(self, call_id: Optional[str]):
+        return self._traces.get(call_id, NOOP_TRACE) if call_id else NOOP_TRACE
+
+    def finish_call(self, call_id: str) -> Optional[Dict[str, Any]]:
+        """End the call's trace; returns its summary (None if the call was not traced)."""
+        trace = self._traces.pop(call_id, None)
+        if trace is None:
+            return None
+        summary = trace.finish()
+        if self.exporter is not None:
+            self._submit(trace)
+        return summary
+
+    @property
+    def active_calls(self) -> int:
+        return len(self._traces)
+
+    def _submit(self, trace: CallTrace) -> None:
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._export_loop, name="call-trace-export", daemon=True)
+            self._thread.start()
+        try:
+            self._queue.put_nowait(trace)
+        except queue.Full:
+            _DROPPED.labels("queue_full").inc()
+
+    def _export_loop(self) -> None:
+        while True:
+            trace = self._queue.get()
+            if trace is None:
+                return
+            try:
+                self.exporter.export(trace.to_otlp(self.service_name))
+                _EXPORTED.inc()
+            except Exception as exc:
+                _DROPPED.labels("export_error").inc()
+                logger.debug("Call trace export failed", call_id=trace.call_id, error=str(exc))
+
+    def close(self, timeout: float = 2.0) -> None:
+        """Flush queued traces and stop the export thread."""
+        thread = self._thread
+        if thread is None:
+            return
+        self._thread = None
+        try:
+            self._queue.put(None, timeout=timeout)
+        except queue.Full:
+            return
+        thread.join(timeout)
@@ -1,5 +1,12 @@
 """
 Enhanced VAD Manager - integrates WebRTC VAD and energy-based detection under a feature flag.
+
+With ``batch_enabled`` the manager stops scoring frames one await at a time:
+frames submitted by every call during one event-loop tick are stacked into a
+2-D array and scored together (RMS energy, adaptive thresholds, smoothing and
+confidence as array operations over struct-of-arrays per-call state). Results
+are identical to the per-frame path; only WebRTC's ``is_speech`` still runs
+once per frame, since it is a C call with no batch entry point.
 """
 
 from __future__ import annotations
@@ -7,9 +14,11 @@ from __future__ import annotations
 import asyncio
 import audioop
 from dataclasses import dataclass
-from typing import Dict, Optional, Any
+from types import SimpleNamespace
+from typing import Dict, List, Optional, Any, Tuple
 import time
 
+import numpy as np
 import structlog
 from prometheus_client import Counter, Gauge, Histogram
 from .call_context_analyzer import CallContextAnalyzer
@@ -45,6 +54,21 @@ _VAD_ADAPTIVE_THRESHOLD = Gauge(
 )
 
 
+def _observe_many(histogram: Histogram, values: np.ndarray) -> None:
+    """Histogram.observe for a whole batch: one bucket increment per bucket, not per value."""
+    try:
+        bounds, buckets, total = histogram._upper_bounds, histogram._buckets, histogram._sum
+    except AttributeError:  # pragma: no cover - prometheus_client internals moved
+        for value in values.tolist():
+            histogram.observe(value)
+        return
+    counts = np.bincount(np.searchsorted(bounds, values, side="left"), minlength=len(bounds))
+    for bucket, count in zip(buckets, counts.tolist()):
+        if count:
+            bucket.inc(count)
+    total.inc(float(values.sum()))
+
+
 @dataclass
 class VADResult:
     is_speech: bool
@@ -86,6 +110,68 @@ class AdaptiveThreshold:
         self.noise_floor = 0.0
 
 
+class _BatchVADState:
+    """Struct-of-arrays per-call VAD state for batch mode (one slot per call)."""
+
+    _INT_FIELDS = ("frame_count", "speech_frames", "silence_frames", "base_threshold",
+                   "current_threshold", "noise_sum", "noise_count", "total_frames", "speech_total")
+    _FLOAT_FIELDS = ("avg_energy", "noise_level", "last_adaptation_time")
+
+    def __init__(self, capacity: int = 64) -> None:
+        self.slots: Dict[str, int] = {}
+        self._free: List[int] = []
+        self.capacity = 0
+        self.is_speaking = np.zeros(0, dtype=bool)
+        for name in self._INT_FIELDS:
+            setattr(self, name, np.zeros(0, dtype=np.int64))
+        for name in self._FLOAT_FIELDS:
+            setattr(self, name, np.zeros(0, dtype=np.float64))
+        self._grow(capacity)
+
+    def _grow(self, capacity: int) -> None:
+        extra = capacity - self.capacity
+        self.is_speaking = np.concatenate([self.is_speaking, np.zeros(extra, dtype=bool)])
+        for name in self._INT_FIELDS:
+            setattr(self, name, np.concatenate([getattr(self, name), np.zeros(extra, dtype=np.int64)]))
+        for name in self._FLOAT_FIELDS:
+            setattr(self, name, np.concatenate([getattr(self, name), np.zeros(extra, dtype=np.float64)]))
+        self._free.extend(range(capacity - 1, self.capacity - 1, -1))
+        self.capacity = capacity
+
+    def slot(self, call_id: str, base_threshold: int) -> int:
+        index = self.slots.get(call_id)
+        if index is not None:
+            return index
+        if not self._free:
+            self._grow(self.capacity * 2)
+        index = self._free.pop()
+        self.slots[call_id] = index
+        self.is_speaking[index] = False
+        for name in self._INT_FIELDS:
+            getattr(self, name)[index] = 0
+        self.base_threshold[index] = base_threshold
+        self.current_threshold[index] = base_threshold
+        self.avg_energy[index] = 0.0
+        self.noise_level[index] = 0.5
+        self.last_adaptation_time[index] = time.time()
+        return index
+
+    def release(self, call_id: str) -> None:
+        index = self.slots.pop(call_id, None)
+        if index is not None:
+            self._free.append(index)
+
+    def call_stats(self, index: int) -> Dict[str, float]:
+        total = int(self.total_frames[index])
+        return {
+            "total_frames": total,
+            "speech_frames": int(self.speech_total[index]),
+            "avg_energy": float(self.avg_energy[index]),
+            "noise_level": float(self.noise_level[index]),
+            "speech_ratio": int(self.speech_total[index]) / total if total else 0.0,
+        }
+
+
 class EnhancedVADManager:
     """Feature-flagged enhanced VAD manager used for barge-in heuristics."""
 
@@ -99,6 +185,7 @@ class EnhancedVADManager:
         webrtc_aggressiveness: int = 1,
         min_speech_frames: int = 2,
         max_silence_frames: int = 15,
+        batch_enabled: bool = False,
     ) -> None:
         self.energy_threshold = energy_threshold
         self.confidence_threshold = confidence_threshold
@@ -131,7 +218,28 @@ class EnhancedVADManager:
         self.context_analyzer = CallContextAnalyzer()
         self._adaptation_interval = 100  # Adapt every 100 frames (2 seconds)
 
+        # Batch mode: frames queued this loop tick, scored together on the next
+        self.batch_enabled = batch_enabled
+        self._batch_state = _BatchVADState() if batch_enabled else None
+        self._batch_pending: List[Tuple[str, bytes, int, asyncio.Future]] = []
+        self._batch_scheduled = False
+
+    async def process_batch(self, frames: List[Tuple[str, bytes, int]]) -> List[VADResult]:
+        """Score ``(call_id, frame, sample_rate)`` items, in order per call, with one await."""
+        if not self.batch_enabled:
+            return [await self.process_frame(call_id, frame, rate) for call_id, frame, rate in frames]
+        if not frames:
+            return []
+        return list(await asyncio.gather(*[self._submit(call_id, frame, rate) for call_id, frame, rate in frames]))
+
+    async def process_frames(self, call_id: str, frames: List[bytes], sample_rate: int = 8000) -> List[VADResult]:
+        """Score consecutive frames of one call."""
+        return await self.process_batch([(call_id, frame, sample_rate) for frame in frames])
+
     async def process_frame(self, call_id: str, audio_frame_pcm16: bytes, sample_rate: int = 8000) -> VADResult:
+        if self.batch_enabled:
+            return await self._submit(call_id, audio_frame_pcm16, sample_rate)
+
         if len(audio_frame_pcm16) < 320:
             audio_frame_pcm16 = audio_frame_pcm16.ljust(320, b"\x00")
             
@@ -179,6 +287,159 @@ class EnhancedVADManager:
         self._update_call_stats(call_id, result)
         return result
 
+    def _submit(self, call_id: str, frame: bytes, sample_rate: int) -> asyncio.Future:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        if len(frame) < 320:
+            frame = frame.ljust(320, b"\x00")
+        elif len(frame) % 2:
+            future.set_exception(audioop.error("not a whole number of frames"))
+            return future
+        self._batch_pending.append((call_id, frame, sample_rate, future))
+        if not self._batch_scheduled:
+            self._batch_scheduled = True
+            loop.call_soon(self._flush_batch)
+        return future
+
+    def _flush_batch(self) -> None:
+        """Score everything submitted since the last flush, in per-call frame order."""
+        pending, self._batch_pending = self._batch_pending, []
+        self._batch_scheduled = False
+        # Round k holds each call's k-th frame, so state updates stay sequential per
+        # call while each round is vectorized across calls; lengths must match to stack.
+        rounds: Dict[Tuple[int, int], List[Tuple[str, bytes, int, asyncio.Future]]] = {}
+        depth: Dict[str, int] = {}
+        for entry in pending:
+            k = depth.get(entry[0], 0)
+            depth[entry[0]] = k + 1
+            rounds.setdefault((k, len(entry[1])), []).append(entry)
+        for key in sorted(rounds):
+            entries = rounds[key]
+            try:
+                self._score_round(entries)
+            except Exception as exc:
+                logger.debug("Enhanced VAD - batch scoring failed", exc_info=True, frames=len(entries))
+                for entry in entries:
+                    if not entry[3].done():
+                        entry[3].set_exception(exc)
+
+    def _score_round(self, entries: List[Tuple[str, bytes, int, asyncio.Future]]) -> None:
+        state = self._batch_state
+        n = len(entries)
+        idx = np.fromiter(
+            (state.slot(call_id, self.base_energy_threshold) for call_id, _, _, _ in entries), dtype=np.intp, count=n
+        )
+
+        state.frame_count[idx] += 1
+        if self.adaptive_threshold_enabled:
+            for p in np.flatnonzero(state.frame_count[idx] % self._adaptation_interval == 0):
+                self._adapt_slot(entries[p][0], int(idx[p]))
+
+        # Same arithmetic as audioop.rms: exact integer sum of squares, then sqrt.
+        samples = np.frombuffer(b"".join(entry[1] for entry in entries), dtype=np.int16).reshape(n, -1)
+        wide = samples.astype(np.int64)
+        energy = np.sqrt(np.einsum("ij,ij->i", wide, wide) / samples.shape[1]).astype(np.int64)
+
+        webrtc = np.zeros(n, dtype=bool)
+        if self.webrtc_vad:
+            is_speech = self.webrtc_vad.is_speech
+            for p, (call_id, frame, rate, _) in enumerate(entries):
+                if rate in WEBRTC_SUPPORTED_RATES:
+                    try:
+                        webrtc[p] = is_speech(frame, rate)
+                    except Exception:
+                        logger.debug("Enhanced VAD - WebRTC processing error", exc_info=True, sample_rate=rate)
+
+        if self.adaptive_threshold_enabled:
+            threshold = np.maximum(state.current_threshold[idx], state.base_threshold[idx])
+        else:
+            threshold = np.full(n, self.base_energy_threshold, dtype=np.int64)
+        energy_result = energy >= threshold
+        raw = webrtc | energy_result
+
+        if self.adaptive_threshold_enabled:
+            # AdaptiveThreshold.update: learn the noise floor from the first 100 non-speech frames.
+            learn = ~raw & (state.noise_count[idx] < 100)
+            learning = idx[learn]
+            state.noise_sum[learning] += energy[learn]
+            state.noise_count[learning] += 1
+            ready = learning[state.noise_count[learning] >= 10]
+            if ready.size:
+                floor = state.noise_sum[ready] / state.noise_count[ready]
+                target = np.maximum(state.base_threshold[ready], (floor * 2.5).astype(np.int64))
+                rate = self.noise_adaptation_rate
+                state.current_threshold[ready] = (
+                    state.current_threshold[ready] * (1 - rate) + target * rate
+                ).astype(np.int64)
+
+        speech_frames = np.where(raw, state.speech_frames[idx] + 1, 0)
+        silence_frames = np.where(raw, 0, state.silence_frames[idx] + 1)
+        speaking = state.is_speaking[idx]
+        started = raw & ~speaking & (speech_frames >= self.min_speech_frames)
+        ended = ~raw & speaking & (silence_frames >= self.max_silence_frames)
+        speaking = (speaking | started) & ~ended
+        state.speech_frames[idx] = speech_frames
+        state.silence_frames[idx] = silence_frames
+        state.is_speaking[idx] = speaking
+        for p in np.flatnonzero(started | ended):
+            logger.debug(
+                "Enhanced VAD - Speech started" if started[p] else "Enhanced VAD - Speech ended",
+                call_id=entries[p][0],
+                frames=int(speech_frames[p] if started[p] else silence_frames[p]),
+            )
+
+        ratio = np.minimum(energy / np.maximum(threshold, 1), 3.0)
+        confidence = np.where(webrtc, 0.4, 0.0)
+        confidence = confidence + np.where(energy_result, 0.4 * (ratio / 3.0), 0.0)
+        confidence = np.minimum(confidence + np.where(webrtc == energy_result, 0.2, 0.0), 1.0)
+
+        total = state.total_frames[idx] + 1
+        state.total_frames[idx] = total
+        state.speech_total[idx] += speaking
+        state.avg_energy[idx] = (state.avg_energy[idx] * (total - 1) + energy) / total
+        noise_level = state.noise_level[idx]
+        quiet = ~speaking & (energy > 0)
+        state.noise_level[idx] = np.where(
+            quiet, noise_level * 0.9 + np.minimum(energy / self.energy_threshold, 1.0) * 0.1, noise_level
+        )
+
+        try:
+            speech_count = int(speaking.sum())
+            if speech_count:
+                _VAD_FRAMES_TOTAL.labels("speech").inc(speech_count)
+            if n - speech_count:
+                _VAD_FRAMES_TOTAL.labels("silence").inc(n - speech_count)
+            _observe_many(_VAD_CONFIDENCE_HISTOGRAM, confidence)
+            _VAD_ADAPTIVE_THRESHOLD.set(int(threshold[-1]))
+        except Exception:
+            logger.debug("Enhanced VAD - metrics update failed", exc_info=True)
+
+        for entry, is_speech, conf, level, webrtc_result in zip(
+            entries, speaking.tolist(), confidence.tolist(), energy.tolist(), webrtc.tolist()
+        ):
+            if not entry[3].done():
+                entry[3].set_result(
+                    VADResult(is_speech=is_speech, confidence=conf, energy_level=level, webrtc_result=webrtc_result)
+                )
+
+    def _adapt_slot(self, call_id: str, index: int) -> None:
+        """Batch-mode counterpart of _adapt_vad_parameters for one call's slot."""
+        state = self._batch_state
+        now = time.time()
+        if now - state.last_adaptation_time[index] < 5.0:
+            return
+        state.last_adaptation_time[index] = now
+        adaptive = SimpleNamespace(
+            base_threshold=int(state.base_threshold[index]),
+            current_threshold=int(state.current_threshold[index]),
+        )
+        try:
+            self._apply_adaptation(call_id, adaptive, state.call_stats(index))
+        except Exception as e:
+            logger.debug("VAD parameter adaptation error", call_id=call_id, error=str(e))
+        state.base_threshold[index] = adaptive.base_threshold
+        state.current_threshold[index] = adaptive.current_threshold
+
     def _get_call_state(self, call_id: str) -> Dict[str, Any]:
         """Get or create per-call state to avoid global mutations."""
         if call_id not in self._call_states:
@@ -240,6 +501,8 @@ class EnhancedVADManager:
             # Remove per-call state completely
             self._call_states.pop(call_id, None)
             self._call_stats.pop(call_id, None)
+            if self._batch_state is not None:
+                self._batch_state.release(call_id)
             logger.debug("VAD call state cleaned up", call_id=call_id)
 
     async def _adapt_vad_parameters(self, call_id: str) -> None:
@@ -256,40 +519,41 @@ class EnhancedVADManager:
             
             # Get current call statistics
             call_stats = self._call_stats.get(call_id, {})
-            
-            # Analyze call conditions
-            conditions = self.context_analyzer.analyze_call_conditions(call_id, call_stats)
-            
-            adaptive = call_state['adaptive_threshold']
-            current_base = int(adaptive.base_threshold)
-            target_multiplier = 1.0
-
-            if conditions.noise_level > 0.7:
-                target_multiplier = 1.3
-            elif conditions.noise_level < 0.3:
-                target_multiplier = 0.8
-
-            desired_base = int(self.base_energy_threshold * target_multiplier)
-
-            # Smooth transitions to avoid oscillation between extremes
-            smoothed_base = int(current_base * 0.8 + desired_base * 0.2)
-
-            if abs(smoothed_base - current_base) >= 10:
-                adaptive.base_threshold = max(1, smoothed_base)
-                adaptive.current_threshold = int(adaptive.current_threshold * 0.8 + adaptive.base_threshold * 0.2)
-                logger.debug(
-                    "🧠 VAD adaptive threshold updated",
-                    call_id=call_id,
-                    noise_level=conditions.noise_level,
-                    previous_base=current_base,
-                    new_base=adaptive.base_threshold,
-                )
-
-            # Note: WebRTC VAD is shared, so we don't adapt it per-call to avoid conflicts
-                    
+            self._apply_adaptation(call_id, call_state['adaptive_threshold'], call_stats)
         except Exception as e:
             logger.debug("VAD parameter adaptation error", call_id=call_id, error=str(e))
 
+    def _apply_adaptation(self, call_id: str, adaptive: Any, call_stats: Dict[str, float]) -> None:
+        """Nudge one call's base/current thresholds toward its analyzed noise level."""
+        # Analyze call conditions
+        conditions = self.context_analyzer.analyze_call_conditions(call_id, call_stats)
+
+        current_base = int(adaptive.base_threshold)
+        target_multiplier = 1.0
+
+        if conditions.noise_level > 0.7:
+            target_multiplier = 1.3
+        elif conditions.noise_level < 0.3:
+            target_multiplier = 0.8
+
+        desired_base = int(self.base_energy_threshold * target_multiplier)
+
+        # Smooth transitions to avoid oscillation between extremes
+        smoothed_base = int(current_base * 0.8 + desired_base * 0.2)
+
+        if abs(smoothed_base - current_base) >= 10:
+            adaptive.base_threshold = max(1, smoothed_base)
+            adaptive.current_threshold = int(adaptive.current_threshold * 0.8 + adaptive.base_threshold * 0.2)
+            logger.debug(
+                "🧠 VAD adaptive threshold updated",
+                call_id=call_id,
+                noise_level=conditions.noise_level,
+                previous_base=current_base,
+                new_base=adaptive.base_threshold,
+            )
+
+        # Note: WebRTC VAD is shared, so we don't adapt it per-call to avoid conflicts
+
     def _update_call_stats(self, call_id: str, result: VADResult) -> None:
         """Update call statistics for adaptive behavior."""
         if call_id not in self._call_stats:
@@ -1,12 +1,14 @@
 import asyncio
 import contextlib
 import copy
+import functools
 import logging
 import math
 import os
 import random
 import signal
 import struct
+import threading
 import time
 import uuid
 import audioop
@@ -44,28 +46,35 @@ from .config import (
     OpenAIRealtimeProviderConfig,
 )
 from .pipelines import PipelineOrchestrator, PipelineOrchestratorError, PipelineResolution
-from .logging_config import get_logger, configure_logging
+from .logging_config import forget_hot_log_key, get_hot_logger, get_logger, configure_logging, hot_path
 from .rtp_server import RTPServer
 from .audio.audiosocket_server import AudioSocketServer
 from .audio.resampler import resample_audio
 from .providers.base import AIProviderInterface
-from .providers.deepgram import DeepgramProvider
-from .providers.local import LocalProvider
-from .providers.openai_realtime import OpenAIRealtimeProvider
-from .providers.google_live import GoogleLiveProvider
-from .providers.elevenlabs_agent import ElevenLabsAgentProvider
 from .providers.elevenlabs_config import ElevenLabsAgentConfig
-from .core import SessionStore, PlaybackManager, ConversationCoordinator
+from .core import SessionRef, SessionStore, PlaybackManager, ConversationCoordinator
 from .core.vad_manager import EnhancedVADManager, VADResult
 from .core.streaming_playback_manager import StreamingPlaybackManager
+from .core.loop_monitor import LoopMonitor, collect_profile, timed_stage
+from .core.media_workers import MediaWorkerPool, condition_ingress
+from .core.tracing import Tracer
+from .core.plugins import PROVIDERS, LazyRegistry, StartupTimeline
+from .config.diff import ConfigDiff, diff_configs
+from .core.session_bundles import ContextBundle, SessionBundle, SessionBundleCache, compile_prompt
+from .core.local_ai_pool import close_shared_pools, shared_pool, shared_pool_stats
 from .core.transport_orchestrator import TransportOrchestrator, TransportProfile
 from .core.models import CallSession
 from .core.outbound_store import get_outbound_store
+from .core.post_call_jobs import PostCallJobQueue, set_post_call_queue
+from .core.device_state_cache import DeviceStateCache, set_device_state_cache
+from .core.sharding import ShardInfo, ShardRouter
+from .core.state_backend import create_state_backend
 from .utils.audio_capture import AudioCaptureManager
 from src.pipelines.base import LLMResponse
 from src.tools.telephony.hangup_policy import resolve_hangup_policy, text_contains_marker_word, normalize_marker_list
 
 logger = get_logger(__name__)
+hot_log = get_hot_logger(__name__)
 
 # -----------------------------------------------------------------------------
 # Environment variable resolution helper
@@ -120,6 +129,10 @@ _TURN_RESPONSE_SECONDS = Histogram(
     labelnames=("pipeline", "provider"),
 )
 
+# Consecutive 20 ms speech frames before a speech->silence edge counts as end of
+# speech in the call trace (ignores clicks and single-frame VAD flips).
+_TRACE_MIN_SPEECH_FRAMES = 5
+
 # Config exposure gauges (per call at session start)
 _CFG_BARGE_MS = Gauge(
     "ai_agent_config_barge_in_ms",
@@ -192,31 +205,43 @@ _cleanup_lock = asyncio.Lock()  # Lock to make cleanup guard atomic (AAVA-148)
 class Engine:
     """The main application engine."""
 
-    def __init__(self, config: AppConfig):
+    def __init__(self, config: AppConfig, startup: Optional[StartupTimeline] = None):
         self.config = config
+        # Startup phase timings (reported on /health); main() passes one that already covers config load.
+        self.startup = startup or StartupTimeline()
         self._start_time = time.time()  # Track engine start time for uptime
         self._config_hash = self._compute_config_hash()
         self._config_loaded_at = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+        # Cluster mode: this process is one shard of several sharing the Asterisk box.
+        self.shard = ShardInfo.from_config(getattr(config, "cluster", None), config.asterisk.app_name)
+        self.state_backend = create_state_backend(getattr(config, "cluster", None))
+        self._cluster_heartbeat_task: Optional[asyncio.Task] = None
         base_url = f"{config.asterisk.scheme}://{config.asterisk.host}:{config.asterisk.port}/ari"
         self.ari_client = ARIClient(
             username=config.asterisk.username,
             password=config.asterisk.password,
             base_url=base_url,
             app_name=config.asterisk.app_name,
-            ssl_verify=config.asterisk.ssl_verify
+            ssl_verify=config.asterisk.ssl_verify,
+            shard_app=self.shard.origination_app if self.shard.enabled else None,
         )
         # Set engine reference for event propagation
         self.ari_client.engine = self
         
         # Initialize core components
         self.session_store = SessionStore()
+        self.shard_router = ShardRouter(self.shard, self.state_backend, self._is_local_call_key)
         self.conversation_coordinator = ConversationCoordinator(self.session_store)
         self.playback_manager = PlaybackManager(
             self.session_store,
             self.ari_client,
             conversation_coordinator=self.conversation_coordinator,
+            shard_index=self.shard.index,
         )
         self.conversation_coordinator.set_playback_manager(self.playback_manager)
+        # Event-loop lag / slow-callback instrumentation (started with the engine).
+        self.loop_monitor = LoopMonitor()
+        self._profile_lock = asyncio.Lock()
         # Attended transfer (warm transfer w/ agent DTMF acceptance) runtime state.
         # These are intentionally in-memory only (per-engine-instance) to avoid schema churn.
         self._ari_playback_waiters: Dict[str, asyncio.Future] = {}
@@ -232,6 +257,8 @@ class Engine:
         self.outbound_store = get_outbound_store()
         self._outbound_scheduler_task: Optional[asyncio.Task] = None
         self._outbound_last_dial_ts: Dict[str, float] = {}
+        # Shard load reports for campaign capacity outlive a scheduler tick, not a dead shard.
+        self._outbound_load_ttl_sec = 15.0
         self._outbound_attempt_meta_by_attempt_id: Dict[str, Dict[str, Any]] = {}
         self._outbound_attempt_meta_by_channel_id: Dict[str, Dict[str, Any]] = {}
         self._outbound_awaiting_amd_channel_ids: Set[str] = set()
@@ -315,6 +342,22 @@ class Engine:
             base_dir=capture_dir,
             keep_files=keep_captures,
         )
+        # Optional per-call DSP offload (media_workers.enabled); None keeps everything inline.
+        self.media_workers: Optional[MediaWorkerPool] = MediaWorkerPool.from_config(
+            getattr(config, "media_workers", None)
+        )
+        # Per-call latency waterfalls (summaries in call history, optional OTLP/JSON export).
+        self.tracer = Tracer.from_config(getattr(config, "tracing", None))
+        # Durable post-call emails/webhooks (None: sent inline from the hung-up call's tasks).
+        self.post_call_jobs: Optional[PostCallJobQueue] = PostCallJobQueue.from_config(
+            getattr(config, "post_call_jobs", None)
+        )
+        # Extension device/endpoint state from ARI events, for check_extension_status lookups.
+        self.device_state_cache: Optional[DeviceStateCache] = DeviceStateCache.from_config(
+            getattr(config, "device_state_cache", None), self.ari_client
+        )
+        # Config-derived call setup (transport, context prompt/tools), rebuilt after /reload.
+        self.session_bundles = SessionBundleCache()
         self.streaming_playback_manager = StreamingPlaybackManager(
             self.session_store,
             self.ari_client,
@@ -324,6 +367,7 @@ class Engine:
             audio_transport=self.config.audio_transport,
             audio_diag_callback=self._update_audio_diagnostics_by_call,
             audio_capture_manager=self.audio_capture,
+            tracer=self.tracer,
         )
         # Pre-seed audiosocket_format from YAML so provider audits use correct value
         try:
@@ -352,13 +396,17 @@ class Engine:
         
         # Provider templates are safe to use for readiness/capability inspection, but
         # MUST NOT be used for per-call sessions (providers keep call-specific state).
-        self.providers: Dict[str, AIProviderInterface] = {}
+        # Providers the config does not reference at startup are deferred: imported off the
+        # event loop once the engine is up (or when a call asks for one first).
+        self.providers: Dict[str, AIProviderInterface] = LazyRegistry()
         # Factories for creating per-call provider instances (supports concurrent calls).
-        self.provider_factories: Dict[str, Callable[[], AIProviderInterface]] = {}
+        self.provider_factories: Dict[str, Callable[[], AIProviderInterface]] = LazyRegistry(self.providers.deferred)
         # Active provider instances keyed by call_id (one provider instance per call).
         self._call_providers: Dict[str, AIProviderInterface] = {}
         # Single-flight start tasks keyed by call_id (prevents duplicate start_session races).
         self._provider_start_tasks: Dict[str, asyncio.Task] = {}
+        # Single-flight off-loop builds of deferred providers keyed by provider name.
+        self._provider_warmups: Dict[str, asyncio.Task] = {}
         # Track static codec/sample-rate validation issues per provider
         self.provider_alignment_issues: Dict[str, List[str]] = {}
         # Per-call provider streaming queues (AgentAudio -> streaming playback)
@@ -419,11 +467,13 @@ class Engine:
                     webrtc_aggressiveness=int(getattr(vad_cfg, "webrtc_aggressiveness", 1)),
                     min_speech_frames=int(getattr(vad_cfg, "webrtc_start_frames", 2)),
                     max_silence_frames=int(getattr(vad_cfg, "webrtc_end_silence_frames", 15)),
+                    batch_enabled=bool(getattr(vad_cfg, "batch_enabled", False)),
                 )
                 logger.info(
                     "Enhanced VAD enabled",
                     energy_threshold=self.vad_manager.energy_threshold,
                     confidence_threshold=self.vad_manager.confidence_threshold,
+                    batch_enabled=self.vad_manager.batch_enabled,
                 )
                 logger.info(
                     "🎯 WebRTC VAD settings",
@@ -487,6 +537,8 @@ class Engine:
         self._call_bg_tasks: Dict[str, Set[asyncio.Task]] = {}
         # Track calls where a pipeline was explicitly requested via AI_PROVIDER
         self._pipeline_forced: Dict[str, bool] = {}
+        # Cached session handles for the inbound media path (one per call, not a lookup per frame)
+        self._media_session_refs: Dict[str, SessionRef] = {}
         # Cache for called_number variables (DIALED_NUMBER, __FROM_DID) from ChannelVarSet events
         # These are set early in dialplan but may not be available via GET when StasisStart fires
         self._called_number_cache: Dict[str, str] = {}  # channel_id -> called_number
@@ -554,19 +606,115 @@ class Engine:
         """Default event handler for unhandled ARI events."""
         logger.debug("Received unhandled ARI event", event_type=event.get("type"), ari_event=event)
 
+    def _media_session(self, call_id: str) -> Optional[CallSession]:
+        """Resolve the session for an inbound media frame through a cached SessionRef."""
+        ref = self._media_session_refs.get(call_id)
+        if ref is None:
+            ref = self._media_session_refs[call_id] = self.session_store.ref(call_id)
+        session = ref.get()
+        if session is None:
+            self._media_session_refs.pop(call_id, None)
+            forget_hot_log_key(call_id)
+        return session
+
     async def _save_session(self, session: CallSession, *, new: bool = False) -> None:
         """Persist session updates and keep coordinator metrics in sync."""
         await self.session_store.upsert_call(session)
+        if new:
+            await self.shard_router.claim(session.call_id)
         if self.conversation_coordinator:
             if new:
                 await self.conversation_coordinator.register_call(session)
             else:
                 await self.conversation_coordinator.sync_from_session(session)
 
+    def _is_local_call_key(self, key: str) -> bool:
+        """True when ``key`` is a call or outbound attempt held by this process."""
+        return (
+            self.session_store.peek_by_call_id(key) is not None
+            or key in self._outbound_attempt_meta_by_attempt_id
+        )
+
+    async def _cluster_heartbeat_loop(self) -> None:
+        """Publish this shard's liveness and active call count to the state backend."""
+        interval = float(getattr(self.config.cluster, "heartbeat_interval_sec", 2.0) or 2.0)
+        ttl = interval * 3
+        try:
+            while True:
+                try:
+                    active = len(await self.session_store.list_active_calls())
+                    await self.state_backend.report_load("calls", self.shard.member, active, ttl_sec=ttl)
+                    await self.state_backend.set(
+                        f"shard:{self.shard.index}",
+                        {"app": self.shard.origination_app, "pid": os.getpid(), "active_calls": active},
+                        ttl_sec=ttl,
+                    )
+                except Exception:
+                    logger.debug("Cluster heartbeat failed", shard=self.shard.index, exc_info=True)
+                await asyncio.sleep(interval)
+        except asyncio.CancelledError:
+            pass
+
+    async def _cluster_status(self) -> Dict[str, Any]:
+        status: Dict[str, Any] = {
+            "shard_index": self.shard.index,
+            "shard_count": self.shard.count,
+            "state_backend": self.state_backend.name,
+        }
+        if self.shard.enabled:
+            try:
+                loads = await self.state_backend.loads("calls")
+                status["live_shards"] = sorted(int(member) for member in loads)
+                status["cluster_active_calls"] = sum(loads.values())
+            except Exception:
+                logger.debug("Cluster status read failed", exc_info=True)
+        return status
+
+    async def _start_cluster(self) -> None:
+        backend = getattr(self, "state_backend", None)
+        if backend is None:
+            return
+        await backend.start()
+        if self.shard.enabled:
+            logger.info(
+                "Cluster shard configured",
+                shard_index=self.shard.index,
+                shard_count=self.shard.count,
+                shard_app=self.shard.origination_app,
+                state_backend=backend.name,
+            )
+            if backend.name == "memory":
+                logger.warning(
+                    "cluster.state_backend=memory is process-local; shards cannot share owner records "
+                    "or outbound capacity. Use state_backend=sqlite."
+                )
+            self._cluster_heartbeat_task = asyncio.create_task(self._cluster_heartbeat_loop())
+
+    async def _start_media_workers(self) -> None:
+        pool = getattr(self, "media_workers", None)
+        if pool is None:
+            return
+        try:
+            await pool.start()
+        except Exception:
+            logger.error("Media workers failed to start; DSP stays inline", exc_info=True)
+            await pool.close()
+            return
+        # WAV captures are disk writes on the audio path; move them off the loop too.
+        self.audio_capture.start_background_writer()
+
     async def start(self):
         """Start the engine and ARI reconnect supervisor."""
+        startup = self.startup = getattr(self, "startup", None) or StartupTimeline()
+        startup.mark("engine_init")
+        # 0) Shared state first: shards consult it from the first StasisStart on.
+        await self._start_cluster()
+        startup.mark("cluster")
+        await self._start_media_workers()
+        startup.mark("media_workers")
         # 1) Load providers first (low risk)
         await self._load_providers()
+        startup.mark("providers")
         
         # Initialize tool calling system
         try:
@@ -583,6 +731,7 @@ class Engine:
             logger.info("✅ Tool calling system initialized", tool_count=len(tool_registry.list_tools()))
         except Exception as e:
             logger.warning(f"Failed to initialize tool calling system: {e}", exc_info=True)
+        startup.mark("tools")
 
         # Initialize MCP tools (experimental)
         try:
@@ -596,6 +745,7 @@ class Engine:
                 logger.info("✅ MCP tools initialized")
         except Exception as e:
             logger.warning("Failed to initialize MCP tools", error=str(e), exc_info=True)
+        startup.mark("mcp")
 
         # Start modular pipeline orchestrator to prepare per-call component lookups.
         # Note: Full agent providers (deepgram, google_live, openai_realtime, elevenlabs_agent, local)
@@ -615,12 +765,17 @@ class Engine:
                 "Unexpected error starting pipeline orchestrator - falling back to direct provider mode",
                 error=str(exc),
             )
+        startup.mark("pipelines")
 
         # 2) Start health server EARLY so diagnostics are available even if transport/ARI fail
         try:
             asyncio.create_task(self._start_health_server())
         except Exception:
             logger.debug("Health server failed to start", exc_info=True)
+        try:
+            self.loop_monitor.start()
+        except Exception:
+            logger.debug("Event loop monitor failed to start", exc_info=True)
 
         # 3) Log transport and downstream modes
         logger.info("Runtime modes", audio_transport=self.config.audio_transport, downstream_mode=self.config.downstream_mode)
@@ -632,7 +787,7 @@ class Engine:
                     raise ValueError("AudioSocket configuration not found")
 
                 host = self.config.audiosocket.host
-                port = self.config.audiosocket.port
+                port = self.shard.port(self.config.audiosocket.port)
                 self.audio_socket_server = AudioSocketServer(
                     host=host,
                     port=port,
@@ -640,6 +795,10 @@ class Engine:
                     on_audio=self._audiosocket_handle_audio,
                     on_disconnect=self._audiosocket_handle_disconnect,
                     on_dtmf=self._audiosocket_handle_dtmf,
+                    frame_ms=self.config.streaming.chunk_size_ms,
+                    egress_coalesce_ms=self.config.audiosocket.egress_coalesce_ms,
+                    egress_high_watermark_ms=self.config.audiosocket.egress_high_watermark_ms,
+                    egress_low_watermark_ms=self.config.audiosocket.egress_low_watermark_ms,
                 )
                 await self.audio_socket_server.start()
                 logger.info("AudioSocket server listening", host=host, port=port)
@@ -686,10 +845,13 @@ class Engine:
                         sample_rate = 8000
                 
                 
-                port_range = self._parse_port_range(
-                    getattr(self.config.external_media, "port_range", None),
-                    rtp_port,
+                port_range = self.shard.port_range(
+                    *self._parse_port_range(
+                        getattr(self.config.external_media, "port_range", None),
+                        rtp_port,
+                    )
                 )
+                rtp_port = port_range[0] if self.shard.enabled else rtp_port
                 allowed_remote_hosts = getattr(self.config.external_media, "allowed_remote_hosts", None)
                 if not allowed_remote_hosts:
                     try:
@@ -797,9 +959,12 @@ class Engine:
                 logger.error("Failed to start ExternalMedia RTP transport", error=str(exc), exc_info=True)
                 self.rtp_server = None
 
+        startup.mark("transport")
+
         # 6) Start ARI reconnect supervisor (initial connect happens in the background).
         # This avoids a startup race after host reboot where Asterisk/ARI isn't ready yet.
         self.ari_client.add_event_handler("PlaybackFinished", self._on_playback_finished)
+        await self._start_device_state_cache()
         if not self._ari_listener_task or self._ari_listener_task.done():
             self._ari_listener_task = asyncio.create_task(self.ari_client.start_listening())
             self._ari_listener_task.add_done_callback(self._on_ari_listener_task_done)
@@ -818,7 +983,41 @@ class Engine:
                 self._outbound_scheduler_task = asyncio.create_task(self._outbound_scheduler_loop())
         except Exception:
             logger.debug("Failed to start outbound scheduler task", exc_info=True)
-        logger.info("Engine started and listening for calls.")
+        await self._start_post_call_jobs()
+        startup.mark("ari_supervisor")
+        startup.mark_ready()
+        logger.info("Engine started and listening for calls.", startup_ms=startup.ready_ms, phases_ms=startup.phases)
+        self._schedule_provider_warmup()
+
+    async def _start_post_call_jobs(self) -> None:
+        """Start the post-call job workers; jobs left unfinished by a previous run resume here."""
+        queue = getattr(self, "post_call_jobs", None)
+        if queue is None or queue.running:
+            return
+        try:
+            from src.tools.business.email_dispatcher import run_email_job
+            from src.tools.http.generic_webhook import run_webhook_job
+
+            queue.register("email", run_email_job)
+            queue.register("webhook", run_webhook_job)
+            await queue.start()
+            set_post_call_queue(queue)
+        except Exception:
+            logger.warning("Failed to start post-call job queue; post-call sends run inline", exc_info=True)
+
+    async def _start_device_state_cache(self) -> None:
+        """Track configured extensions' device states; the cache reconciles once ARI connects."""
+        cache = getattr(self, "device_state_cache", None)
+        if cache is None or cache.running:
+            return
+        try:
+            from src.tools.telephony.check_extension_status import configured_device_state_ids
+
+            cache.track(configured_device_state_ids(getattr(self.config, "tools", None) or {}))
+            await cache.start()
+            set_device_state_cache(cache)
+        except Exception:
+            logger.warning("Failed to start device state cache; extension status uses live ARI", exc_info=True)
 
     def _on_ari_listener_task_done(self, task: "asyncio.Task") -> None:
         """Log background ARI listener task failures (prevents swallowed exceptions)."""
@@ -1063,17 +1262,42 @@ class Engine:
                             if str(meta.get("campaign_id") or "") == campaign_id
                         )
                         active_outbound = await self.session_store.count_active_outbound_calls(campaign_id=campaign_id)
-                        capacity = max_concurrent - inflight - active_outbound
-                        if capacity <= 0:
-                            continue
-
                         min_interval = int(campaign.get("min_interval_seconds_between_calls") or 0)
-                        last_ts = float(self._outbound_last_dial_ts.get(campaign_id, 0.0) or 0.0)
+                        last_ts = await self._outbound_last_dial(campaign_id)
                         if min_interval > 0 and (time.time() - last_ts) < float(min_interval):
                             continue
 
+                        if self.shard.enabled:
+                            # max_concurrent is per campaign across all shards: reserve one slot
+                            # against the load every shard publishes (expires with the shard).
+                            capacity_scope = f"outbound:{campaign_id}"
+                            local_load = inflight + active_outbound
+                            reserved = await self.state_backend.try_reserve(
+                                capacity_scope,
+                                self.shard.member,
+                                local_load,
+                                limit=max_concurrent,
+                                ttl_sec=self._outbound_load_ttl_sec,
+                            )
+                            if not reserved:
+                                continue
+                            capacity = 1
+                        else:
+                            capacity = max_concurrent - inflight - active_outbound
+                            if capacity <= 0:
+                                continue
+
                         leads = await self.outbound_store.lease_pending_leads(campaign_id, limit=min(capacity, 1))
                         if not leads:
+                            if self.shard.enabled:
+                                await self.state_backend.report_load(
+                                    capacity_scope,
+                                    self.shard.member,
+                                    local_load,
+                                    ttl_sec=self._outbound_load_ttl_sec,
+                                )
+                                # Another shard's calls keep the campaign running.
+                                inflight += await self.state_backend.total_load(capacity_scope) - local_load
                             await self._outbound_maybe_mark_campaign_completed(
                                 campaign,
                                 inflight=inflight,
@@ -1136,8 +1360,9 @@ class Engine:
                                 self._outbound_attempt_meta_by_attempt_id.pop(attempt_id, None)
                                 continue
 
+                            await self.shard_router.claim(attempt_id)
                             await self._outbound_originate_attempt(campaign, lead, attempt_id)
-                            self._outbound_last_dial_ts[campaign_id] = time.time()
+                            await self._outbound_mark_dialed(campaign_id)
                             # Respect pacing: only one lead per tick for MVP.
                             break
                     except Exception as e:
@@ -1168,6 +1393,18 @@ class Engine:
         except Exception:
             logger.error("Outbound scheduler crashed", exc_info=True)
 
+    async def _outbound_last_dial(self, campaign_id: str) -> float:
+        """Last dial time for campaign pacing (cluster-wide when sharded)."""
+        if self.shard.enabled:
+            return float(await self.state_backend.get(f"outbound_last_dial:{campaign_id}") or 0.0)
+        return float(self._outbound_last_dial_ts.get(campaign_id, 0.0) or 0.0)
+
+    async def _outbound_mark_dialed(self, campaign_id: str) -> None:
+        now_ts = time.time()
+        self._outbound_last_dial_ts[campaign_id] = now_ts
+        if self.shard.enabled:
+            await self.state_backend.set(f"outbound_last_dial:{campaign_id}", now_ts, ttl_sec=86400)
+
     async def _outbound_originate_attempt(self, campaign: Dict[str, Any], lead: Dict[str, Any], attempt_id: str) -> None:
         """Originate a leased+marked lead via configurable Local/ routing (FreePBX, ViciDial, generic)."""
         campaign_id = str(campaign.get("id") or "")
@@ -1308,7 +1545,7 @@ class Engine:
 
         resp = await self.ari_client.originate_channel(
             endpoint=endpoint,
-            app=self.config.asterisk.app_name,
+            app=self.shard.origination_app,
             app_args=app_args,
             timeout=60,
             caller_id=caller_id_header,
@@ -1886,6 +2123,21 @@ class Engine:
         sessions = await self.session_store.get_all_sessions()
         for session in sessions:
             await self._cleanup_call(session.call_id)
+        # Let in-flight post-call sends finish; queued ones stay in SQLite for the next start.
+        queue = getattr(self, "post_call_jobs", None)
+        if queue is not None:
+            set_post_call_queue(None)
+            try:
+                await queue.stop(timeout=10.0)
+                from src.tools.business.smtp_client import close_pool
+
+                await asyncio.get_running_loop().run_in_executor(None, close_pool)
+            except Exception:
+                logger.debug("Post-call job queue stop error", exc_info=True)
+        cache = getattr(self, "device_state_cache", None)
+        if cache is not None:
+            set_device_state_cache(None)
+            await cache.stop()
         await self.ari_client.disconnect()
         task = getattr(self, "_ari_listener_task", None)
         if task and not task.done():
@@ -1909,6 +2161,41 @@ class Engine:
             await self.pipeline_orchestrator.stop()
         except Exception:
             logger.debug("Pipeline orchestrator stop error", exc_info=True)
+        try:
+            await self.loop_monitor.stop()
+        except Exception:
+            logger.debug("Event loop monitor stop error", exc_info=True)
+        try:
+            await close_shared_pools()
+        except Exception:
+            logger.debug("Local AI Server pool close error", exc_info=True)
+        task = getattr(self, "_cluster_heartbeat_task", None)
+        if task and not task.done():
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        try:
+            backend = getattr(self, "state_backend", None)
+            if backend is not None:
+                await backend.close()
+        except Exception:
+            logger.debug("State backend close error", exc_info=True)
+        try:
+            pool = getattr(self, "media_workers", None)
+            if pool is not None:
+                await pool.close()
+                await asyncio.get_running_loop().run_in_executor(None, self.audio_capture.stop_background_writer)
+        except Exception:
+            logger.debug("Media workers close error", exc_info=True)
+        try:
+            await asyncio.get_running_loop().run_in_executor(None, self.tracer.close)
+        except Exception:
+            logger.debug("Trace exporter close error", exc_info=True)
+        # Flush queued media deletes and drop cached playback files.
+        try:
+            await self.playback_manager.close()
+        except Exception:
+            logger.debug("Playback manager close error", exc_info=True)
         # Stop MCP servers last (best-effort)
         try:
             if self.mcp_manager:
@@ -1917,167 +2204,28 @@ class Engine:
             logger.debug("MCP manager stop error", exc_info=True)
         logger.info("Engine stopped.")
 
+    # Pipeline adapter suffixes - these are loaded by PipelineOrchestrator, not Engine
+    _PIPELINE_ADAPTER_SUFFIXES = ('_stt', '_llm', '_tts')
+
     async def _load_providers(self):
         """Load and initialize AI providers from the configuration."""
-        # Pipeline adapter suffixes - these are loaded by PipelineOrchestrator, not Engine
-        ADAPTER_SUFFIXES = ('_stt', '_llm', '_tts')
-        
         # Provider templates are for readiness/capability checks only.
         # Per-call provider sessions are created via provider_factories.
         self.providers.clear()
         self.provider_factories.clear()
         
         logger.info("Loading AI providers...", provider_names=list(self.config.providers.keys()))
+        in_use = self._providers_in_use()
         for name, provider_config_data in self.config.providers.items():
-            # Skip pipeline adapters - they're handled by PipelineOrchestrator
-            if any(name.endswith(suffix) for suffix in ADAPTER_SUFFIXES):
-                logger.debug("Skipping pipeline adapter '%s' (loaded by PipelineOrchestrator)", name)
-                continue
-            if isinstance(provider_config_data, dict) and not provider_config_data.get("enabled", True):
-                logger.info("Provider '%s' disabled in configuration; skipping initialization.", name)
-                continue
-            try:
-                issues = self._audit_provider_config(name, provider_config_data)
-                if issues:
-                    self.provider_alignment_issues[name] = issues
-                elif name in self.provider_alignment_issues:
-                    self.provider_alignment_issues.pop(name, None)
-                if name == "local":
-                    # Resolve env vars like ${LOCAL_WS_URL:-ws://127.0.0.1:8765}
-                    resolved_config = _resolve_config_env_vars(provider_config_data)
-                    config = LocalProviderConfig(**resolved_config)
-                    provider = LocalProvider(config, self.on_provider_event)
-                    self.providers[name] = provider
-                    # Per-call factory (supports concurrent calls).
-                    self.provider_factories[name] = lambda cfg=config: LocalProvider(self._clone_config(cfg), self.on_provider_event)
-                    logger.info(f"Provider '{name}' loaded successfully.")
-
-                    # Provide initial greeting from global LLM config
-                    try:
-                        if hasattr(provider, 'set_initial_greeting'):
-                            provider.set_initial_greeting(getattr(self.config.llm, 'initial_greeting', None))
-                    except Exception:
-                        logger.debug("Failed to set initial greeting on LocalProvider", exc_info=True)
-
-                    runtime_issues = self._describe_provider_alignment(name, provider)
-                    if runtime_issues:
-                        self.provider_alignment_issues.setdefault(name, []).extend(runtime_issues)
-                elif name == "deepgram":
-                    deepgram_config = self._build_deepgram_config(provider_config_data)
-                    if not deepgram_config:
-                        continue
-
-                    # Validate OpenAI dependency for Deepgram
-                    if not self.config.llm.api_key:
-                        logger.error("Deepgram provider requires OpenAI API key in LLM config")
-                        continue
-
-                    provider = DeepgramProvider(deepgram_config, self.config.llm, self.on_provider_event)
-                    # Set session store for turn latency tracking (Milestone 21)
-                    provider.set_session_store(self.session_store)
-                    self.providers[name] = provider
-                    # Per-call factory (supports concurrent calls).
-                    self.provider_factories[name] = lambda cfg=deepgram_config: DeepgramProvider(self._clone_config(cfg), self.config.llm, self.on_provider_event)
-                    logger.info("Provider 'deepgram' loaded successfully with OpenAI LLM dependency.")
-
-                    runtime_issues = self._describe_provider_alignment(name, provider)
-                    if runtime_issues:
-                        self.provider_alignment_issues.setdefault(name, []).extend(runtime_issues)
-                elif name == "openai_realtime":
-                    openai_cfg = self._build_openai_realtime_config(provider_config_data)
-                    if not openai_cfg:
-                        continue
-
-                    provider = OpenAIRealtimeProvider(
-                        openai_cfg,
-                        self.on_provider_event,
-                        gating_manager=self.audio_gating_manager
-                    )
-                    # Set session store for turn latency tracking (Milestone 21)
-                    provider._session_store = self.session_store
-                    self.providers[name] = provider
-                    # Per-call factory (supports concurrent calls).
-                    self.provider_factories[name] = (
-                        lambda cfg=openai_cfg: OpenAIRealtimeProvider(self._clone_config(cfg), self.on_provider_event, gating_manager=self.audio_gating_manager)
-                    )
-                    logger.info(
-                        "Provider 'openai_realtime' loaded successfully",
-                        audio_gating_enabled=self.audio_gating_manager is not None
-                    )
-
-                    runtime_issues = self._describe_provider_alignment(name, provider)
-                    if runtime_issues:
-                        self.provider_alignment_issues.setdefault(name, []).extend(runtime_issues)
-                elif name == "google_live":
-                    # google_live uses GoogleProviderConfig like the pipeline adapters
-                    try:
-                        # SECURITY: API key ONLY from environment variables, never from YAML
-                        merged = dict(provider_config_data)
-                        merged['api_key'] = os.getenv('GOOGLE_API_KEY') or ''
-                        google_cfg = GoogleProviderConfig(**merged)
-                        # Note: Don't skip for missing API key - let is_ready() handle it
-                        if not google_cfg.api_key:
-                            logger.warning("Google Live provider API key missing (GOOGLE_API_KEY) - provider will show as Not Ready")
-                    except Exception as e:
-                        logger.error(f"Failed to build GoogleProviderConfig for google_live: {e}", exc_info=True)
-                        continue
-
-                    hangup_policy = resolve_hangup_policy(getattr(self.config, "tools", None))
-                    provider = GoogleLiveProvider(
-                        google_cfg,
-                        self.on_provider_event,
-                        gating_manager=self.audio_gating_manager,
-                        hangup_policy=hangup_policy,
-                    )
-                    # Set session store for turn latency tracking (Milestone 21)
-                    provider._session_store = self.session_store
-                    self.providers[name] = provider
-                    # Per-call factory (supports concurrent calls).
-                    self.provider_factories[name] = (
-                        lambda cfg=google_cfg, policy=hangup_policy: GoogleLiveProvider(
-                            self._clone_config(cfg),
-                            self.on_provider_event,
-                            gating_manager=self.audio_gating_manager,
-                            hangup_policy=policy,
-                        )
-                    )
-                    logger.info(
-                        "Provider 'google_live' loaded successfully",
-                        audio_gating_enabled=self.audio_gating_manager is not None
-                    )
-
-                    runtime_issues = self._describe_provider_alignment(name, provider)
-                    if runtime_issues:
-                        self.provider_alignment_issues.setdefault(name, []).extend(runtime_issues)
-                elif name == "elevenlabs_agent":
-                    elevenlabs_cfg = self._build_elevenlabs_config(provider_config_data)
-                    if not elevenlabs_cfg:
-                        continue
-
-                    provider = ElevenLabsAgentProvider(
-                        elevenlabs_cfg, 
-                        self.on_provider_event,
-                    )
-                    # Set session store for turn latency tracking (Milestone 21)
-                    provider._session_store = self.session_store
-                    self.providers[name] = provider
-                    # Per-call factory (supports concurrent calls).
-                    self.provider_factories[name] = (
-                        lambda cfg=elevenlabs_cfg: ElevenLabsAgentProvider(self._clone_config(cfg), self.on_provider_event)
-                    )
-                    logger.info(
-                        "Provider 'elevenlabs_agent' loaded successfully"
-                    )
-
-                    runtime_issues = self._describe_provider_alignment(name, provider)
-                    if runtime_issues:
-                        self.provider_alignment_issues.setdefault(name, []).extend(runtime_issues)
-                else:
-                    logger.warning(f"Unknown provider type: {name}")
-                    continue
-                    
-            except Exception as e:
-                logger.error(f"Failed to load provider '{name}': {e}", exc_info=True)
+            if name in in_use or name not in PROVIDERS.names():
+                self._load_provider(name, provider_config_data)
+            else:
+                # Selectable per call (AI_PROVIDER) but unused by default_provider/contexts:
+                # import and build it on first lookup.
+                self._defer_provider(name)
+        deferred = sorted(getattr(self.providers, "deferred", None) or ())
+        if deferred:
+            logger.info("Providers deferred until first use", providers=deferred)
         
         # Validate that default provider is available.
         # Note: default_provider may also point at a pipeline name for pipeline-first deployments.
@@ -2091,35 +2239,7 @@ class Engine:
 
             # Validate provider connectivity (full agent mode)
             for provider_name, provider in self.providers.items():
-                # Check basic readiness - providers must have is_ready() and return True
-                try:
-                    if hasattr(provider, 'is_ready'):
-                        ready = provider.is_ready()
-                        if not ready:
-                            logger.warning(
-                                "⚠️ Provider NOT ready - missing API key or config",
-                                provider=provider_name,
-                                hint="Check that API key is set in ai-agent.yaml or .env"
-                            )
-                        else:
-                            logger.info(
-                                "✅ Provider validated and ready",
-                                provider=provider_name,
-                                type=provider.__class__.__name__
-                            )
-                    else:
-                        logger.warning(
-                            "⚠️ Provider missing is_ready() method",
-                            provider=provider_name,
-                            type=provider.__class__.__name__
-                        )
-                except Exception as exc:
-                        logger.error(
-                            "❌ Provider readiness check failed",
-                            provider=provider_name,
-                            error=str(exc),
-                            exc_info=True
-                        )
+                self._check_provider_ready(provider_name, provider)
 
         elif default_target in available_pipelines:
             logger.info(
@@ -2148,6 +2268,271 @@ class Engine:
                         provider=provider_name,
                     )
 
+    @staticmethod
+    def _check_provider_ready(provider_name: str, provider: Any) -> None:
+        """Log whether a loaded provider template reports itself ready."""
+        # Check basic readiness - providers must have is_ready() and return True
+        try:
+            if hasattr(provider, 'is_ready'):
+                ready = provider.is_ready()
+                if not ready:
+                    logger.warning(
+                        "⚠️ Provider NOT ready - missing API key or config",
+                        provider=provider_name,
+                        hint="Check that API key is set in ai-agent.yaml or .env"
+                    )
+                else:
+                    logger.info(
+                        "✅ Provider validated and ready",
+                        provider=provider_name,
+                        type=provider.__class__.__name__
+                    )
+            else:
+                logger.warning(
+                    "⚠️ Provider missing is_ready() method",
+                    provider=provider_name,
+                    type=provider.__class__.__name__
+                )
+        except Exception as exc:
+                logger.error(
+                    "❌ Provider readiness check failed",
+                    provider=provider_name,
+                    error=str(exc),
+                    exc_info=True
+                )
+
+    def _providers_in_use(self) -> Set[str]:
+        """Providers the config selects without a per-call override: default_provider and contexts."""
+        names = {getattr(self.config, "default_provider", None)}
+        for context in (getattr(self.config, "contexts", None) or {}).values():
+            provider = context.get("provider") if isinstance(context, dict) else getattr(context, "provider", None)
+            names.add(provider)
+        return {name for name in names if name}
+
+    def _defer_provider(self, name: str) -> None:
+        self.providers.defer(name, functools.partial(self._load_deferred_provider, name))
+
+    def _load_deferred_provider(self, name: str) -> None:
+        provider_config_data = (self.config.providers or {}).get(name)
+        if provider_config_data is None:
+            return
+        started = time.perf_counter()
+        loaded = self._load_provider(name, provider_config_data)
+        logger.info(
+            "Deferred provider loaded",
+            provider=name,
+            loaded=loaded,
+            elapsed_ms=round((time.perf_counter() - started) * 1000, 2),
+        )
+        provider = dict.get(self.providers, name)
+        if loaded and provider is not None:
+            self._check_provider_ready(name, provider)
+
+    def _schedule_provider_warmup(self) -> None:
+        """Build every deferred provider in the background, one at a time."""
+        if not getattr(self.providers, "deferred", None):
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return  # no loop (offline config checks): lookups still build on demand
+        loop.create_task(self._warm_deferred_providers())
+
+    async def _warm_deferred_providers(self) -> None:
+        for name in sorted(getattr(self.providers, "deferred", None) or ()):
+            try:
+                await self._ensure_provider_loaded(name)
+            except Exception:
+                logger.warning("Deferred provider warm-up failed", provider=name, exc_info=True)
+
+    async def _ensure_provider_loaded(self, name: str) -> None:
+        """Build deferred provider ``name`` with its import run off the event loop.
+
+        A plain lookup (``name in self.providers``) would import the provider's SDK on
+        the loop and stall every call's audio pacing; awaiting this first avoids that.
+        """
+        deferred = getattr(self.providers, "deferred", None)
+        if not deferred or name not in deferred:
+            return
+        warmups = getattr(self, "_provider_warmups", None)
+        if warmups is None:
+            warmups = self._provider_warmups = {}
+        task = warmups.get(name)
+        if task is None:
+            task = asyncio.create_task(self._warm_provider(name))
+            warmups[name] = task
+            task.add_done_callback(lambda _t, n=name: warmups.pop(n, None))
+        await asyncio.shield(task)
+
+    async def _warm_provider(self, name: str) -> None:
+        if name in PROVIDERS.names():
+            try:
+                await asyncio.get_running_loop().run_in_executor(None, PROVIDERS.load, name)
+            except Exception as exc:
+                # _load_provider reports the import error when the build below retries it.
+                logger.debug("Deferred provider import failed", provider=name, error=str(exc))
+        self.providers.build(name)
+
+    def _load_provider(self, name: str, provider_config_data: Any) -> bool:
+        """Build the readiness template and per-call factory for one provider; True when loaded."""
+        # Skip pipeline adapters - they're handled by PipelineOrchestrator
+        if any(name.endswith(suffix) for suffix in self._PIPELINE_ADAPTER_SUFFIXES):
+            logger.debug("Skipping pipeline adapter '%s' (loaded by PipelineOrchestrator)", name)
+            return False
+        if isinstance(provider_config_data, dict) and not provider_config_data.get("enabled", True):
+            logger.info("Provider '%s' disabled in configuration; skipping initialization.", name)
+            return False
+        try:
+            # Imported on first load (src/core/plugins.py); None for unknown provider names.
+            provider_cls = PROVIDERS.load(name) if name in PROVIDERS.names() else None
+            issues = self._audit_provider_config(name, provider_config_data)
+            if issues:
+                self.provider_alignment_issues[name] = issues
+            elif name in self.provider_alignment_issues:
+                self.provider_alignment_issues.pop(name, None)
+            if name == "local":
+                # Resolve env vars like ${LOCAL_WS_URL:-ws://127.0.0.1:8765}
+                resolved_config = _resolve_config_env_vars(provider_config_data)
+                config = LocalProviderConfig(**resolved_config)
+                provider = provider_cls(config, self.on_provider_event)
+                self.providers[name] = provider
+                pool = shared_pool(config)
+                if pool is not None:
+                    # Warm in the background; calls fall back to dedicated sockets meanwhile.
+                    asyncio.create_task(pool.start())
+                # Per-call factory (supports concurrent calls).
+                self.provider_factories[name] = lambda cfg=config: provider_cls(self._clone_config(cfg), self.on_provider_event)
+                logger.info(f"Provider '{name}' loaded successfully.")
+
+                # Provide initial greeting from global LLM config
+                try:
+                    if hasattr(provider, 'set_initial_greeting'):
+                        provider.set_initial_greeting(getattr(self.config.llm, 'initial_greeting', None))
+                except Exception:
+                    logger.debug("Failed to set initial greeting on LocalProvider", exc_info=True)
+
+                runtime_issues = self._describe_provider_alignment(name, provider)
+                if runtime_issues:
+                    self.provider_alignment_issues.setdefault(name, []).extend(runtime_issues)
+            elif name == "deepgram":
+                deepgram_config = self._build_deepgram_config(provider_config_data)
+                if not deepgram_config:
+                    return False
+
+                # Validate OpenAI dependency for Deepgram
+                if not self.config.llm.api_key:
+                    logger.error("Deepgram provider requires OpenAI API key in LLM config")
+                    return False
+
+                provider = provider_cls(deepgram_config, self.config.llm, self.on_provider_event)
+                # Set session store for turn latency tracking (Milestone 21)
+                provider.set_session_store(self.session_store)
+                self.providers[name] = provider
+                # Per-call factory (supports concurrent calls).
+                self.provider_factories[name] = lambda cfg=deepgram_config: provider_cls(self._clone_config(cfg), self.config.llm, self.on_provider_event)
+                logger.info("Provider 'deepgram' loaded successfully with OpenAI LLM dependency.")
+
+                runtime_issues = self._describe_provider_alignment(name, provider)
+                if runtime_issues:
+                    self.provider_alignment_issues.setdefault(name, []).extend(runtime_issues)
+            elif name == "openai_realtime":
+                openai_cfg = self._build_openai_realtime_config(provider_config_data)
+                if not openai_cfg:
+                    return False
+
+                provider = provider_cls(
+                    openai_cfg,
+                    self.on_provider_event,
+                    gating_manager=self.audio_gating_manager
+                )
+                # Set session store for turn latency tracking (Milestone 21)
+                provider._session_store = self.session_store
+                self.providers[name] = provider
+                # Per-call factory (supports concurrent calls).
+                self.provider_factories[name] = (
+                    lambda cfg=openai_cfg: provider_cls(self._clone_config(cfg), self.on_provider_event, gating_manager=self.audio_gating_manager)
+                )
+                logger.info(
+                    "Provider 'openai_realtime' loaded successfully",
+                    audio_gating_enabled=self.audio_gating_manager is not None
+                )
+
+                runtime_issues = self._describe_provider_alignment(name, provider)
+                if runtime_issues:
+                    self.provider_alignment_issues.setdefault(name, []).extend(runtime_issues)
+            elif name == "google_live":
+                # google_live uses GoogleProviderConfig like the pipeline adapters
+                try:
+                    # SECURITY: API key ONLY from environment variables, never from YAML
+                    merged = dict(provider_config_data)
+                    merged['api_key'] = os.getenv('GOOGLE_API_KEY') or ''
+                    google_cfg = GoogleProviderConfig(**merged)
+                    # Note: Don't skip for missing API key - let is_ready() handle it
+                    if not google_cfg.api_key:
+                        logger.warning("Google Live provider API key missing (GOOGLE_API_KEY) - provider will show as Not Ready")
+                except Exception as e:
+                    logger.error(f"Failed to build GoogleProviderConfig for google_live: {e}", exc_info=True)
+                    return False
+
+                hangup_policy = resolve_hangup_policy(getattr(self.config, "tools", None))
+                provider = provider_cls(
+                    google_cfg,
+                    self.on_provider_event,
+                    gating_manager=self.audio_gating_manager,
+                    hangup_policy=hangup_policy,
+                )
+                # Set session store for turn latency tracking (Milestone 21)
+                provider._session_store = self.session_store
+                self.providers[name] = provider
+                # Per-call factory (supports concurrent calls).
+                self.provider_factories[name] = (
+                    lambda cfg=google_cfg, policy=hangup_policy: provider_cls(
+                        self._clone_config(cfg),
+                        self.on_provider_event,
+                        gating_manager=self.audio_gating_manager,
+                        hangup_policy=policy,
+                    )
+                )
+                logger.info(
+                    "Provider 'google_live' loaded successfully",
+                    audio_gating_enabled=self.audio_gating_manager is not None
+                )
+
+                runtime_issues = self._describe_provider_alignment(name, provider)
+                if runtime_issues:
+                    self.provider_alignment_issues.setdefault(name, []).extend(runtime_issues)
+            elif name == "elevenlabs_agent":
+                elevenlabs_cfg = self._build_elevenlabs_config(provider_config_data)
+                if not elevenlabs_cfg:
+                    return False
+
+                provider = provider_cls(
+                    elevenlabs_cfg, 
+                    self.on_provider_event,
+                )
+                # Set session store for turn latency tracking (Milestone 21)
+                provider._session_store = self.session_store
+                self.providers[name] = provider
+                # Per-call factory (supports concurrent calls).
+                self.provider_factories[name] = (
+                    lambda cfg=elevenlabs_cfg: provider_cls(self._clone_config(cfg), self.on_provider_event)
+                )
+                logger.info(
+                    "Provider 'elevenlabs_agent' loaded successfully"
+                )
+
+                runtime_issues = self._describe_provider_alignment(name, provider)
+                if runtime_issues:
+                    self.provider_alignment_issues.setdefault(name, []).extend(runtime_issues)
+            else:
+                logger.warning(f"Unknown provider type: {name}")
+                return False
+                
+        except Exception as e:
+            logger.error(f"Failed to load provider '{name}': {e}", exc_info=True)
+            return False
+        return True
+
     def _is_caller_channel(self, channel: dict) -> bool:
         """Check if this is a caller channel (SIP, PJSIP, etc.)"""
         channel_name = channel.get('name', '')
@@ -2184,6 +2569,14 @@ class Engine:
 
     async def _handle_stasis_start(self, event: dict):
         """Handle StasisStart events - Hybrid ARI approach with single handler."""
+        if not await self.shard_router.owns_stasis_start(event):
+            logger.debug(
+                "StasisStart belongs to another shard",
+                channel_id=(event.get("channel") or {}).get("id"),
+                application=event.get("application"),
+                shard=self.shard.index,
+            )
+            return
         logger.info("🎯 HYBRID ARI - StasisStart event received", event_data=event)
         channel = event.get('channel', {})
         channel_id = channel.get('id')
@@ -2282,7 +2675,7 @@ class Engine:
 
         try:
             response = await self.ari_client.create_external_media_channel(
-                app=self.config.asterisk.app_name,
+                app=self.shard.origination_app,
                 external_host=external_host,
                 format=codec,
                 direction=direction,
@@ -2532,10 +2925,13 @@ class Engine:
         if existing_session:
             logger.warning("🎯 HYBRID ARI - Caller already in progress", channel_id=caller_channel_id)
             return
-        
+
+        # Latency waterfall: one child span per setup step (ended by the next step).
+        setup = self.tracer.start_call(caller_channel_id, outbound=bool(is_outbound)).start_span("call.setup")
         try:
             # Answer the caller (inbound) or skip (outbound already answered)
             if not is_outbound:
+                setup.step("ari.answer")
                 logger.info("🎯 HYBRID ARI - Step 1: Answering caller channel", channel_id=caller_channel_id)
                 await self.ari_client.answer_channel(caller_channel_id)
                 logger.info("🎯 HYBRID ARI - Step 1: ✅ Caller channel answered", channel_id=caller_channel_id)
@@ -2544,6 +2940,7 @@ class Engine:
             
             # Create bridge immediately (use default bridge_type to prevent simple_bridge optimization)
             logger.info("🎯 HYBRID ARI - Step 2: Creating bridge immediately", channel_id=caller_channel_id)
+            setup.step("ari.bridge_create")
             bridge_id = await self.ari_client.create_bridge()  # Uses default: mixing,dtmf_events,proxy_media
             if not bridge_id:
                 raise RuntimeError("Failed to create mixing bridge")
@@ -2555,6 +2952,7 @@ class Engine:
             logger.info("🎯 HYBRID ARI - Step 3: Adding caller to bridge", 
                        channel_id=caller_channel_id, 
                        bridge_id=bridge_id)
+            setup.step("ari.bridge_add")
             caller_success = await self.ari_client.add_channel_to_bridge(bridge_id, caller_channel_id)
             if not caller_success:
                 raise RuntimeError("Failed to add caller channel to bridge")
@@ -2564,6 +2962,7 @@ class Engine:
             self.bridges[caller_channel_id] = bridge_id
             
             # Create CallSession and store in SessionStore
+            setup.step("session.create")
             session = CallSession(
                 call_id=caller_channel_id,
                 caller_channel_id=caller_channel_id,
@@ -2694,6 +3093,7 @@ class Engine:
                        bridge_id=bridge_id)
 
             # Resolve transport profile from dialplan hints/config defaults
+            setup.step("transport.resolve")
             try:
                 await self._hydrate_transport_from_dialplan(session, caller_channel_id)
             except Exception:
@@ -2715,6 +3115,7 @@ class Engine:
             # Values:
             #   - openai_realtime | deepgram → full agent override
             #   - customX (any other token) → pipeline name
+            setup.step("route.select")
             ai_provider_value = None
             try:
                 resp = await self.ari_client.send_command(
@@ -2743,6 +3144,8 @@ class Engine:
             )
 
             pipeline_resolution = None
+            if resolved_provider:
+                await self._ensure_provider_loaded(resolved_provider)
             if resolved_provider and resolved_provider in self.providers:
                 # Full agent override for this call
                 previous = session.provider_name
@@ -2905,6 +3308,7 @@ class Engine:
                 logger.debug("Failed to emit RCA_CALL_START", call_id=caller_channel_id, exc_info=True)
             
             # Step 5: Create ExternalMedia channel or originate Local channel
+            setup.step("media.channel")
             if self.config.audio_transport == "externalmedia":
                 logger.info("🎯 EXTERNAL MEDIA - Step 5: Creating ExternalMedia channel", channel_id=caller_channel_id)
                 external_media_id = await self._start_external_media_channel(caller_channel_id)
@@ -2950,8 +3354,10 @@ class Engine:
             else:
                 logger.info("🎯 HYBRID ARI - Step 5: Originating AudioSocket channel", channel_id=caller_channel_id)
                 await self._originate_audiosocket_channel_hybrid(caller_channel_id)
-            
+            setup.end()
+
         except Exception as e:
+            setup.end(error=type(e).__name__)
             logger.error("🎯 HYBRID ARI - Failed to handle caller StasisStart", 
                         caller_channel_id=caller_channel_id, 
                         error=str(e), exc_info=True)
@@ -3431,13 +3837,22 @@ class Engine:
         - {lead_id}: Outbound lead/contact ID (default: "")
         
         Unknown placeholders are left as-is (safe fallback).
-        Uses regex-based substitution to handle partial matches correctly.
+        Templates are split once (``{word}`` and ``{word.subword}``) and cached by text.
         """
         if not text:
             return text
-        
-        import re
-        
+        try:
+            return compile_prompt(text).render(self._prompt_substitutions(session))
+        except Exception as e:
+            logger.debug(
+                "Prompt template substitution failed, leaving unchanged",
+                call_id=session.call_id,
+                error=str(e),
+            )
+            return text
+
+    def _prompt_substitutions(self, session: CallSession) -> Dict[str, str]:
+        """Template variables for prompts/greetings (see _apply_prompt_template_substitution)."""
         substitutions = {
             "caller_name": getattr(session, 'caller_name', None) or "there",
             "caller_number": getattr(session, 'caller_number', None) or "unknown",
@@ -3455,28 +3870,7 @@ class Engine:
             # Don't override built-in variables
             if key not in substitutions:
                 substitutions[key] = str(value) if value else ""
-        
-        def replace_match(match):
-            key = match.group(1)
-            # Try exact match first
-            if key in substitutions:
-                return substitutions[key]
-            # Convert dot notation to underscore (e.g., patient.name -> patient_name)
-            underscore_key = key.replace('.', '_')
-            if underscore_key in substitutions:
-                return substitutions[underscore_key]
-            return match.group(0)  # Leave unknown as-is
-        
-        try:
-            # Match both {word} and {word.subword} patterns
-            return re.sub(r'\{([\w.]+)\}', replace_match, text)
-        except Exception as e:
-            logger.debug(
-                "Prompt template substitution failed, leaving unchanged",
-                call_id=session.call_id,
-                error=str(e),
-            )
-            return text
+        return substitutions
 
     async def _wait_for_attended_transfer_dtmf(
         self,
@@ -3511,14 +3905,39 @@ class Engine:
             local_cfg = providers.get("local") if isinstance(providers, dict) else None
             if not isinstance(local_cfg, dict) or not bool(local_cfg.get("enabled", True)):
                 return None
+            local_cfg = _resolve_config_env_vars(local_cfg)
             ws_url = str(local_cfg.get("base_url") or local_cfg.get("ws_url") or "").strip()
             if not ws_url:
                 return None
             auth_token = str(local_cfg.get("auth_token") or "").strip() or None
 
-            async with websockets.connect(ws_url, open_timeout=float(timeout_sec), ping_interval=None) as ws:
+            from .audio.local_ai_frames import (
+                FRAME_KIND_TTS_AUDIO,
+                call_hash,
+                decode_frame,
+                negotiate_message,
+                negotiated_version,
+            )
+
+            binary_frames = bool(local_cfg.get("binary_frames", True))
+            framed_audio: Dict[tuple, bytes] = {}
+            ws = None
+            if binary_frames:
+                try:
+                    pool = shared_pool(LocalProviderConfig(**local_cfg))
+                    if pool is not None and pool.ws_url == ws_url:
+                        ws = await pool.open_channel(call_id, timeout=float(timeout_sec))
+                except Exception:
+                    logger.debug("Local AI Server pool unavailable for TTS", call_id=call_id, exc_info=True)
+            if ws is None:
+                ws = await websockets.connect(ws_url, open_timeout=float(timeout_sec), ping_interval=None)
                 if auth_token:
                     await ws.send(json.dumps({"type": "auth", "auth_token": auth_token}))
+                if binary_frames:
+                    # Pipelined: answered before the tts_response, ignored by older servers.
+                    await ws.send(negotiate_message())
+            frames_version = getattr(ws, "frames_version", None)
+            try:
                 await ws.send(
                     json.dumps(
                         {
@@ -3533,14 +3952,29 @@ class Engine:
                 while time.time() < deadline:
                     msg = await asyncio.wait_for(ws.recv(), timeout=max(0.1, float(deadline - time.time())))
                     if isinstance(msg, bytes):
+                        if frames_version is not None:
+                            try:
+                                frame = decode_frame(msg)
+                            except ValueError:
+                                continue
+                            if frame.kind == FRAME_KIND_TTS_AUDIO:
+                                framed_audio[(frame.call_hash, frame.seq)] = frame.payload
                         continue
                     try:
                         data = json.loads(msg)
                     except Exception:
                         continue
+                    if data.get("type") == "negotiate_response":
+                        frames_version = negotiated_version(data)
+                        continue
+                    if data.get("type") == "tts_response" and data.get("audio_transport") == "frame":
+                        key = (call_hash(data.get("call_id") or ""), data.get("frame_seq"))
+                        return framed_audio.get(key) or None
                     if data.get("type") == "tts_response" and data.get("audio_data"):
                         return base64.b64decode(data["audio_data"])
                 return None
+            finally:
+                await ws.close()
         except Exception:
             logger.debug("Local AI Server TTS failed", call_id=call_id, exc_info=True)
             return None
@@ -3995,7 +4429,7 @@ class Engine:
         # This prevents Asterisk from trying to connect to 0.0.0.0 (invalid destination)
         if advertise_host in ("0.0.0.0", "::"):
             advertise_host = "127.0.0.1"
-        port = self.config.audiosocket.port
+        port = self.shard.port(self.config.audiosocket.port)
         # Match channel interface codec to YAML audiosocket.format
         codec = "slin"
         try:
@@ -4013,7 +4447,7 @@ class Engine:
 
         orig_params = {
             "endpoint": endpoint,
-            "app": self.config.asterisk.app_name,
+            "app": self.shard.origination_app,
             "timeout": "30",
             "channelVars": {
                 "AUDIOSOCKET_UUID": audio_uuid,
@@ -4553,6 +4987,16 @@ class Engine:
             except Exception:
                 logger.debug("Pipeline cleanup failed", call_id=call_id, exc_info=True)
 
+            self._media_session_refs.pop(call_id, None)
+            try:
+                await self.shard_router.release(call_id)
+            except Exception:
+                logger.debug("Shard owner release failed", call_id=call_id, exc_info=True)
+
+            pool = getattr(self, "media_workers", None)
+            if pool is not None:
+                pool.forget(call_id)
+
             # Clear per-call resample states to prevent unbounded memory growth
             self._resample_state_provider_in.pop(call_id, None)
             self._resample_state_provider_out.pop(call_id, None)
@@ -4694,6 +5138,12 @@ class Engine:
             # Clean up call start time after post-call tools have used it
             _call_start_times.pop(call_id, None)
 
+            # Close the latency trace; its waterfall summary goes into call history.
+            try:
+                session.latency_trace = self.tracer.finish_call(call_id) or {}
+            except Exception:
+                logger.debug("Failed to finish call trace", call_id=call_id, exc_info=True)
+
             # Persist call to history before removing session (Milestone 21)
             try:
                 await self._persist_call_history(session, call_id)
@@ -4769,10 +5219,15 @@ class Engine:
             logger.info("Call cleanup completed", call_id=call_id)
         except Exception as exc:
             logger.error("Error cleaning up call", identifier=channel_or_call_id, error=str(exc), exc_info=True)
+            if resolved_call_id:
+                self.tracer.finish_call(resolved_call_id)
         finally:
             # Clean up in-memory guard
             if resolved_call_id:
                 _cleanup_in_progress.discard(resolved_call_id)
+            else:
+                # Setup failed before a session existed; drop its trace.
+                self.tracer.finish_call(channel_or_call_id)
 
     async def _persist_call_history(self, session: CallSession, call_id: str) -> None:
         """Persist call record to history database (Milestone 21)."""
@@ -4833,6 +5288,7 @@ class Engine:
                 caller_audio_format=session.caller_audio_format,
                 codec_alignment_ok=session.codec_alignment_ok,
                 barge_in_count=barge_in_count,
+                latency_trace=getattr(session, 'latency_trace', None) or {},
             )
             
             saved = await store.save(record)
@@ -5129,6 +5585,7 @@ class Engine:
                     pass
                 session.status = "audiosocket_bound"
                 await self._save_session(session)
+            self.tracer.get(caller_channel_id).mark("audiosocket.bound", once=True)
 
             logger.info(
                 "AudioSocket connection bound to caller",
@@ -5141,6 +5598,8 @@ class Engine:
             logger.error("Error binding AudioSocket UUID", conn_id=conn_id, uuid=uuid_str, error=str(exc), exc_info=True)
             return False
 
+    @hot_path
+    @timed_stage("audiosocket_handle_audio")
     async def _audiosocket_handle_audio(self, conn_id: str, audio_bytes: bytes) -> None:
         """Forward inbound AudioSocket audio to the active provider for the bound call."""
         # Track every frame for diagnostics
@@ -5161,26 +5620,26 @@ class Engine:
                     pass
 
             if not caller_channel_id:
-                logger.debug("AudioSocket audio received for unknown connection", conn_id=conn_id, bytes=len(audio_bytes))
+                hot_log.debug("AudioSocket audio received for unknown connection", conn_id=conn_id, bytes=len(audio_bytes))
                 return
 
             # Track frame count per call
             self._audiosocket_frame_count[caller_channel_id] = self._audiosocket_frame_count.get(caller_channel_id, 0) + 1
             frame_num = self._audiosocket_frame_count[caller_channel_id]
             
-            # Keep this low-volume; per-frame info logs can cause IO/CPU jitter and degrade audio.
-            if frame_num <= 3 or frame_num % 250 == 0:
-                logger.debug(
-                    "🎤 AUDIOSOCKET RX - Frame received",
-                    call_id=caller_channel_id,
-                    frame_num=frame_num,
-                    frame_bytes=len(audio_bytes),
-                    conn_id=conn_id,
-                )
+            # hot_log keeps this low-volume (first frames, then every 250th per call); per-frame
+            # logs can cause IO/CPU jitter and degrade audio.
+            hot_log.debug(
+                "🎤 AUDIOSOCKET RX - Frame received",
+                call_id=caller_channel_id,
+                frame_num=frame_num,
+                frame_bytes=len(audio_bytes),
+                conn_id=conn_id,
+            )
 
-            session = await self.session_store.get_by_call_id(caller_channel_id)
+            session = self._media_session(caller_channel_id)
             if not session:
-                logger.debug("No session for caller; dropping AudioSocket audio", conn_id=conn_id, caller_channel_id=caller_channel_id)
+                hot_log.debug("No session for caller; dropping AudioSocket audio", conn_id=conn_id, caller_channel_id=caller_channel_id)
                 return
 
             # Media-path confirmation: first inbound audio frame observed.
@@ -5192,7 +5651,7 @@ class Engine:
                     await self._save_session(session)
                     logger.info("Media RX confirmed (AudioSocket)", call_id=caller_channel_id)
             except Exception:
-                logger.debug("Failed to set media_rx_confirmed (AudioSocket)", call_id=caller_channel_id, exc_info=True)
+                hot_log.debug("Failed to set media_rx_confirmed (AudioSocket)", call_id=caller_channel_id, exc_info=True)
 
             diagnostics_flags = session.audio_diagnostics
             if "inbound_first_frame" not in diagnostics_flags:
@@ -5224,7 +5683,7 @@ class Engine:
                             rms_swapped = audioop.rms(swapped, 2)
                         except Exception:
                             rms_swapped = 0
-                        logger.info(
+                        hot_log.info(
                             "AudioSocket frame probe",
                             call_id=caller_channel_id,
                             audiosocket_format=as_fmt,
@@ -5257,7 +5716,7 @@ class Engine:
                             rms_pcm = audioop.rms(pcm, 2)
                         except Exception:
                             rms_pcm = 0
-                        logger.info(
+                        hot_log.info(
                             "AudioSocket frame probe",
                             call_id=caller_channel_id,
                             audiosocket_format=as_fmt,
@@ -5298,36 +5757,21 @@ class Engine:
             except Exception:
                 # Safe fallback based on transport type
                 if self.config.audio_transport == "audiosocket":
-                    profile_fmt = "slin16"
-                    profile_rate = 16000
-                else:
-                    profile_fmt = "ulaw"
-                    profile_rate = 8000
-            pcm_bytes, pcm_rate = self._wire_to_pcm16(audio_bytes, profile_fmt, swap_needed_flag, profile_rate)
-            # Remove DC bias ONLY (disable IIR DC-block filter - causes audio degradation)
-            try:
-                if pcm_bytes:
-                    try:
-                        mean = int(audioop.avg(pcm_bytes, 2))
-                    except Exception:
-                        mean = 0
-                    if mean:
-                        try:
-                            pcm_bytes = audioop.bias(pcm_bytes, 2, -mean)
-                        except Exception:
-                            pass
-                    # DC-block IIR filter DISABLED - was causing progressive audio level collapse
-                    # Symptoms: Audio started strong (RMS 4000) but degraded to near-silence (RMS 16)
-                    # Root cause: Stateful filter accumulated error, over-attenuated speech
-                    # Keep simple DC offset removal (audioop.bias) above, skip IIR filter
-            except Exception:
-                logger.debug("Inbound DC conditioning failed", call_id=caller_channel_id, exc_info=True)
+                    profile_fmt = "slin16"
+                    profile_rate = 16000
+                else:
+                    profile_fmt = "ulaw"
+                    profile_rate = 8000
+            # PCM16 with DC bias removed (no IIR DC-block filter: it collapsed levels over a call).
+            pcm_bytes, pcm_rate, in_rms, in_dc = await self._condition_ingress(
+                session.call_id, audio_bytes, profile_fmt, swap_needed_flag, profile_rate
+            )
             try:
                 if pcm_bytes:
-                    self._update_audio_diagnostics(session, "transport_in", pcm_bytes, "slin16", pcm_rate)
+                    self._record_audio_diagnostics(session, "transport_in", "slin16", pcm_rate, in_rms, in_dc)
                     self.audio_capture.append_pcm16(session.call_id, "caller_inbound", pcm_bytes, pcm_rate)
             except Exception:
-                logger.debug("Inbound diagnostics update failed", call_id=caller_channel_id, exc_info=True)
+                hot_log.debug("Inbound diagnostics update failed", call_id=caller_channel_id, exc_info=True)
 
             # CRITICAL FIX: Check for pipeline mode FIRST before routing to monolithic providers
             if self._pipeline_forced.get(caller_channel_id):
@@ -5389,7 +5833,7 @@ class Engine:
                         last = float(mon.get("last_ts", 0.0) or 0.0)
                         if now - last >= 1.0:
                             mon["last_ts"] = now
-                            logger.debug(
+                            hot_log.debug(
                                 "Pipeline barge-in monitor (AudioSocket)",
                                 call_id=caller_channel_id,
                                 tts_elapsed_ms=tts_elapsed_ms,
@@ -5446,7 +5890,7 @@ class Engine:
                             q.put_nowait(pcm16)
                         return
                     except asyncio.QueueFull:
-                        logger.debug("Pipeline queue full; dropping AudioSocket frame", call_id=caller_channel_id)
+                        hot_log.debug("Pipeline queue full; dropping AudioSocket frame", call_id=caller_channel_id)
                         return
 
             # Unconditional continuous-input forward: Deepgram/OpenAI Realtime expect raw audio flow
@@ -5498,7 +5942,7 @@ class Engine:
                     # CRITICAL: Google Live requires continuous audio stream (like WebRTC)
                     # Send SILENCE frames instead of blocking to maintain stream continuity
                     # This prevents echo while keeping VAD healthy
-                    logger.debug(
+                    hot_log.debug(
                         "🔇 GATING ACTIVE - Sending silence frame for Google Live (TTS playing)",
                         call_id=caller_channel_id,
                         audio_capture_enabled=session.audio_capture_enabled,
@@ -5592,24 +6036,23 @@ class Engine:
                         if not speaking:
                             pcm_bytes = b"\x00" * len(pcm_bytes)
                     except Exception:
-                        logger.debug("Upstream squelch failed", call_id=caller_channel_id, exc_info=True)
+                        hot_log.debug("Upstream squelch failed", call_id=caller_channel_id, exc_info=True)
                 
                 # Forward to provider
-                if frame_num <= 3 or frame_num % 250 == 0:
-                    logger.debug(
-                        "📤 CONTINUOUS INPUT - Forwarding frame to provider",
-                        call_id=caller_channel_id,
-                        provider=provider_name,
-                        frame_num=frame_num,
-                        frame_bytes=len(audio_bytes),
-                        pcm_bytes=len(pcm_bytes),
-                        gating_active=needs_gating and not session.audio_capture_enabled,
-                        is_silence=needs_gating and not session.audio_capture_enabled,
-                    )
+                hot_log.debug(
+                    "📤 CONTINUOUS INPUT - Forwarding frame to provider",
+                    call_id=caller_channel_id,
+                    provider=provider_name,
+                    frame_num=frame_num,
+                    frame_bytes=len(audio_bytes),
+                    pcm_bytes=len(pcm_bytes),
+                    gating_active=needs_gating and not session.audio_capture_enabled,
+                    is_silence=needs_gating and not session.audio_capture_enabled,
+                )
                 try:
                     self._update_audio_diagnostics(session, "provider_in", pcm_bytes, "slin16", pcm_rate)
                 except Exception:
-                    logger.debug("Provider input diagnostics update failed (unconditional)", call_id=caller_channel_id, exc_info=True)
+                    hot_log.debug("Provider input diagnostics update failed (unconditional)", call_id=caller_channel_id, exc_info=True)
                 try:
                     prov_payload, prov_enc, prov_rate = self._encode_for_provider(
                         session.call_id,
@@ -5618,16 +6061,15 @@ class Engine:
                         pcm_bytes,
                         pcm_rate,
                     )
-                    if frame_num <= 3 or frame_num % 250 == 0:
-                        logger.debug(
-                            "📤 CONTINUOUS INPUT - Encoded for provider",
-                            call_id=caller_channel_id,
-                            provider=provider_name,
-                            frame_num=frame_num,
-                            prov_payload_bytes=len(prov_payload),
-                            prov_enc=prov_enc,
-                            prov_rate=prov_rate,
-                        )
+                    hot_log.debug(
+                        "📤 CONTINUOUS INPUT - Encoded for provider",
+                        call_id=caller_channel_id,
+                        provider=provider_name,
+                        frame_num=frame_num,
+                        prov_payload_bytes=len(prov_payload),
+                        prov_enc=prov_enc,
+                        prov_rate=prov_rate,
+                    )
                     try:
                         self.audio_capture.append_encoded(
                             session.call_id,
@@ -5637,7 +6079,7 @@ class Engine:
                             prov_rate,
                         )
                     except Exception:
-                        logger.debug(
+                        hot_log.debug(
                             "Provider input capture failed (unconditional)",
                             call_id=session.call_id,
                             exc_info=True,
@@ -5647,23 +6089,21 @@ class Engine:
                     # Google Live needs to know audio is already at provider_rate to skip resampling
                     try:
                         await provider.send_audio(prov_payload, prov_rate, prov_enc)
-                        if frame_num <= 3 or frame_num % 250 == 0:
-                            logger.debug(
-                                "✅ CONTINUOUS INPUT - Frame sent to provider",
-                                call_id=caller_channel_id,
-                                provider=provider_name,
-                                frame_num=frame_num,
-                            )
+                        hot_log.debug(
+                            "✅ CONTINUOUS INPUT - Frame sent to provider",
+                            call_id=caller_channel_id,
+                            provider=provider_name,
+                            frame_num=frame_num,
+                        )
                     except TypeError:
                         # Fallback for providers with old signature (audio_chunk only)
                         await provider.send_audio(prov_payload)
-                        if frame_num <= 3 or frame_num % 250 == 0:
-                            logger.debug(
-                                "✅ CONTINUOUS INPUT - Frame sent to provider (legacy signature)",
-                                call_id=caller_channel_id,
-                                provider=provider_name,
-                                frame_num=frame_num,
-                            )
+                        hot_log.debug(
+                            "✅ CONTINUOUS INPUT - Frame sent to provider (legacy signature)",
+                            call_id=caller_channel_id,
+                            provider=provider_name,
+                            frame_num=frame_num,
+                        )
                 except Exception as e:
                     logger.error(
                         "❌ CONTINUOUS INPUT - Provider forward error",
@@ -5682,10 +6122,10 @@ class Engine:
                         source="audiosocket",
                     )
                 except Exception:
-                    logger.debug("Provider barge-in fallback check failed (AudioSocket)", call_id=caller_channel_id, exc_info=True)
+                    hot_log.debug("Provider barge-in fallback check failed (AudioSocket)", call_id=caller_channel_id, exc_info=True)
                 return
             else:
-                logger.debug(
+                hot_log.debug(
                     "⚠️ CONTINUOUS INPUT - Block skipped",
                     call_id=caller_channel_id,
                     continuous_input=continuous_input,
@@ -5706,7 +6146,7 @@ class Engine:
                 except Exception:
                     elapsed_ms = post_guard_ms
                 if elapsed_ms < post_guard_ms:
-                    logger.debug(
+                    hot_log.debug(
                         "Dropping inbound during post-TTS protection window",
                         call_id=caller_channel_id,
                         elapsed_ms=elapsed_ms,
@@ -5719,7 +6159,7 @@ class Engine:
                 try:
                     vad_result = await self._run_enhanced_vad(session, audio_bytes)
                 except Exception:
-                    logger.debug(
+                    hot_log.debug(
                         "Enhanced VAD processing error",
                         call_id=caller_channel_id,
                         exc_info=True,
@@ -5779,7 +6219,7 @@ class Engine:
                         # Diagnostics on the PCM payload we are about to send
                         self._update_audio_diagnostics(session, "provider_in", pcm_bytes, "slin16", pcm_rate)
                     except Exception:
-                        logger.debug("Provider input diagnostics update failed (continuous-input)", call_id=caller_channel_id, exc_info=True)
+                        hot_log.debug("Provider input diagnostics update failed (continuous-input)", call_id=caller_channel_id, exc_info=True)
                     try:
                         prov_payload, prov_enc, prov_rate = self._encode_for_provider(
                             session.call_id,
@@ -5797,11 +6237,11 @@ class Engine:
                                 prov_rate,
                             )
                         except Exception:
-                            logger.debug("Provider input capture failed (continuous-input)", call_id=session.call_id, exc_info=True)
+                            hot_log.debug("Provider input capture failed (continuous-input)", call_id=session.call_id, exc_info=True)
                         # CRITICAL: Pass encoding and sample_rate to provider
                         # Google Live needs these to correctly interpret audio format
                         # Other providers with single-param signature will ignore extras
-                        logger.debug(
+                        hot_log.debug(
                             "Sending audio to provider",
                             call_id=session.call_id,
                             provider=provider_name,
@@ -5821,7 +6261,7 @@ class Engine:
                             # Fallback for providers with old signature (audio_chunk only)
                             await provider.send_audio(prov_payload)
                     except Exception:
-                        logger.debug("Provider continuous-input forward error", call_id=caller_channel_id, exc_info=True)
+                        hot_log.debug("Provider continuous-input forward error", call_id=caller_channel_id, exc_info=True)
                     return
                 # Protection window from TTS start to avoid initial self-echo (applies when not using continuous-input)
                 now = time.time()
@@ -5842,7 +6282,7 @@ class Engine:
                 try:
                     if provider_name == "openai_realtime" and getattr(session, 'tts_started_ts', 0.0) > 0.0:
                         initial_protect = 5000  # 5 seconds to prevent echo feedback loop
-                        logger.debug(
+                        hot_log.debug(
                             "Extended TTS protection for OpenAI Realtime (echo prevention)",
                             call_id=caller_channel_id,
                             protect_ms=initial_protect,
@@ -5860,13 +6300,13 @@ class Engine:
                 except Exception:
                     pass
                 if tts_elapsed_ms < initial_protect:
-                    logger.debug("Dropping inbound during initial TTS protection window",
+                    hot_log.debug("Dropping inbound during initial TTS protection window",
                                  conn_id=conn_id, caller_channel_id=caller_channel_id,
                                  tts_elapsed_ms=tts_elapsed_ms, protect_ms=initial_protect)
                     return
                 # If barge-in disabled and no continuous-input path, drop
                 if not cfg or not getattr(cfg, 'enabled', True):
-                    logger.debug("Dropping inbound AudioSocket audio during TTS playback (barge-in disabled)",
+                    hot_log.debug("Dropping inbound AudioSocket audio during TTS playback (barge-in disabled)",
                                  conn_id=conn_id, caller_channel_id=caller_channel_id, bytes=len(audio_bytes))
                     return
                 # Barge-in detection: accumulate candidate window based on multi-criteria (VAD + energy)
@@ -5943,7 +6383,7 @@ class Engine:
                 # Engine-level barge-in causes double-cancellation (both systems fighting)
                 provider_name = getattr(session, 'provider_name', None)
                 if should_trigger and provider_name == 'openai_realtime':
-                    logger.debug(
+                    hot_log.debug(
                         "Local barge-in detected for OpenAI Realtime - sending cancellation to server",
                         call_id=caller_channel_id,
                         energy=energy,
@@ -5955,7 +6395,7 @@ class Engine:
                         if provider and hasattr(provider, 'cancel_response'):
                             await provider.cancel_response()
                     except Exception:
-                        logger.debug("Failed to cancel OpenAI response", call_id=caller_channel_id, exc_info=True)
+                        hot_log.debug("Failed to cancel OpenAI response", call_id=caller_channel_id, exc_info=True)
                     
                     # Reset candidate counter but don't trigger local playback stops
                     session.barge_in_candidate_ms = 0
@@ -6006,7 +6446,7 @@ class Engine:
                             self.conversation_coordinator.note_audio_during_tts(caller_channel_id)
                         except Exception:
                             pass
-                    logger.debug(
+                    hot_log.debug(
                         "Dropping inbound during TTS",
                         call_id=caller_channel_id,
                         candidate_ms=session.barge_in_candidate_ms,
@@ -6033,7 +6473,7 @@ class Engine:
                             q.put_nowait(pcm16)
                         return
                     except asyncio.QueueFull:
-                        logger.debug("Pipeline queue full; dropping AudioSocket frame", call_id=caller_channel_id)
+                        hot_log.debug("Pipeline queue full; dropping AudioSocket frame", call_id=caller_channel_id)
                         return
 
             # Enhanced VAD Audio Filtering with continuous delivery
@@ -6082,7 +6522,7 @@ class Engine:
                     else:
                         silence_len = len(pcm_bytes) if pcm_bytes else len(audio_bytes) * 2
                         pcm_payload = b"\x00" * silence_len
-                        logger.debug(
+                        hot_log.debug(
                             "🎤 VAD - Replacing frame with silence",
                             call_id=caller_channel_id,
                             confidence=f"{vad_result.confidence:.2f}",
@@ -6097,7 +6537,7 @@ class Engine:
             except Exception:
                 post_guard_rms = 0
             try:
-                logger.info(
+                hot_log.info(
                     "Inbound PCM guard RMS",
                     call_id=caller_channel_id,
                     pre_guard_pcm_rms=pre_guard_rms,
@@ -6109,7 +6549,7 @@ class Engine:
             # DEBUG: Audio routing state (OpenAI troubleshooting)
             provider_name = session.provider_name or self.config.default_provider
             if provider_name == "openai_realtime":
-                logger.debug(
+                hot_log.debug(
                     "🎤 AUDIO ROUTING - Ready to forward",
                     call_id=caller_channel_id,
                     audio_capture_enabled=getattr(session, 'audio_capture_enabled', None),
@@ -6134,7 +6574,7 @@ class Engine:
             
             # DEBUG: Provider ready check (OpenAI troubleshooting)
             if provider_name == "openai_realtime":
-                logger.debug(
+                hot_log.debug(
                     "🎤 AUDIO ROUTING - Provider ready",
                     call_id=caller_channel_id,
                     provider_name=provider_name,
@@ -6142,7 +6582,7 @@ class Engine:
             try:
                 self._update_audio_diagnostics(session, "provider_in", pcm_payload, "slin16", payload_rate)
             except Exception:
-                logger.debug("Provider input diagnostics update failed", call_id=caller_channel_id, exc_info=True)
+                hot_log.debug("Provider input diagnostics update failed", call_id=caller_channel_id, exc_info=True)
 
             provider_payload, provider_encoding, provider_rate = self._encode_for_provider(
                 session.call_id,
@@ -6170,12 +6610,12 @@ class Engine:
                     provider_rate,
                 )
             except Exception:
-                logger.debug("Provider input capture failed", call_id=session.call_id, exc_info=True)
+                hot_log.debug("Provider input capture failed", call_id=session.call_id, exc_info=True)
             await provider.send_audio(provider_payload)
             
             # DEBUG: Confirm audio sent (OpenAI troubleshooting)
             if provider_name == "openai_realtime":
-                logger.debug(
+                hot_log.debug(
                     "🎤 AUDIO ROUTING - Sent to provider",
                     call_id=caller_channel_id,
                     provider_name=provider_name,
@@ -6184,6 +6624,7 @@ class Engine:
         except Exception as exc:
             logger.error("Error handling AudioSocket audio", conn_id=conn_id, error=str(exc), exc_info=True)
 
+    @hot_path
     async def _run_enhanced_vad(self, session: CallSession, audio_bytes: bytes) -> Optional[VADResult]:
         """Normalize inbound AudioSocket audio to PCM16 @ 8 kHz 20 ms frames and run enhanced VAD."""
         if not self.vad_manager or not audio_bytes:
@@ -6235,7 +6676,7 @@ class Engine:
             else:
                 pcm16 = pcm_src
         except Exception:
-            logger.debug(
+            hot_log.debug(
                 "Enhanced VAD conversion failed",
                 call_id=session.call_id,
                 exc_info=True,
@@ -6252,13 +6693,22 @@ class Engine:
         result: Optional[VADResult] = None
         stats = vad_state.setdefault("stats", {"frames": 0, "speech_frames": 0})
 
-        while len(frame_buffer) >= 320:
-            frame = bytes(frame_buffer[:320])
-            del frame_buffer[:320]
-            result = await self.vad_manager.process_frame(session.call_id, frame)
+        whole = len(frame_buffer) - len(frame_buffer) % 320
+        frames = [bytes(frame_buffer[i:i + 320]) for i in range(0, whole, 320)]
+        del frame_buffer[:whole]
+        speech_run = vad_state.get("speech_run", 0)
+        # One await for the whole chunk; in batch mode it joins every other call's frames.
+        for result in await self.vad_manager.process_frames(session.call_id, frames):
             stats["frames"] = stats.get("frames", 0) + 1
             if result.is_speech:
                 stats["speech_frames"] = stats.get("speech_frames", 0) + 1
+                speech_run += 1
+            elif speech_run:
+                # Speech -> silence after a real utterance: where the next turn's waterfall starts.
+                if speech_run >= _TRACE_MIN_SPEECH_FRAMES:
+                    self.tracer.get(session.call_id).mark("vad.end_of_speech")
+                speech_run = 0
+        vad_state["speech_run"] = speech_run
 
         if result:
             try:
@@ -6276,6 +6726,7 @@ class Engine:
 
         return result
 
+    @hot_path
     async def _run_enhanced_vad_pcm16(self, session: CallSession, pcm16_bytes: bytes, src_rate_hz: int) -> Optional[VADResult]:
         """Run enhanced VAD on known PCM16 input (used by ExternalMedia RTP path)."""
         if not self.vad_manager or not pcm16_bytes:
@@ -6306,13 +6757,22 @@ class Engine:
         result: Optional[VADResult] = None
         stats = vad_state.setdefault("stats", {"frames": 0, "speech_frames": 0})
 
-        while len(frame_buffer) >= 320:
-            frame = bytes(frame_buffer[:320])
-            del frame_buffer[:320]
-            result = await self.vad_manager.process_frame(session.call_id, frame)
+        whole = len(frame_buffer) - len(frame_buffer) % 320
+        frames = [bytes(frame_buffer[i:i + 320]) for i in range(0, whole, 320)]
+        del frame_buffer[:whole]
+        speech_run = vad_state.get("speech_run", 0)
+        # One await for the whole chunk; in batch mode it joins every other call's frames.
+        for result in await self.vad_manager.process_frames(session.call_id, frames):
             stats["frames"] = stats.get("frames", 0) + 1
             if result.is_speech:
                 stats["speech_frames"] = stats.get("speech_frames", 0) + 1
+                speech_run += 1
+            elif speech_run:
+                # Speech -> silence after a real utterance: where the next turn's waterfall starts.
+                if speech_run >= _TRACE_MIN_SPEECH_FRAMES:
+                    self.tracer.get(session.call_id).mark("vad.end_of_speech")
+                speech_run = 0
+        vad_state["speech_run"] = speech_run
 
         if result:
             try:
@@ -6612,6 +7072,15 @@ class Engine:
             except Exception:
                 logger.debug("Failed to enumerate playbacks during barge-in", call_id=call_id, exc_info=True)
 
+            # Drop speech the provider is still synthesizing for the interrupted turn (local provider).
+            try:
+                provider = self._call_providers.get(call_id) or self.providers.get(session.provider_name)
+                cancel_tts = getattr(provider, "cancel_tts", None)
+                if cancel_tts is not None:
+                    await cancel_tts(call_id)
+            except Exception:
+                logger.debug("Provider TTS cancel failed during barge-in", call_id=call_id, exc_info=True)
+
             # Clear any platform gating tokens (pipelines/file playback only).
             try:
                 tokens = list(getattr(session, "tts_tokens", set()) or [])
@@ -6730,6 +7199,8 @@ class Engine:
         except Exception as exc:
             logger.error("Error handling AudioSocket DTMF", conn_id=conn_id, error=str(exc), exc_info=True)
 
+    @hot_path
+    @timed_stage("on_rtp_audio")
     async def _on_rtp_audio(self, caller_channel_id: str, ssrc: int, pcm_16k: bytes) -> None:
         """Route inbound ExternalMedia RTP audio to the active provider.
 
@@ -6737,9 +7208,9 @@ class Engine:
         Do not infer SSRC→call mappings in the engine; that is not concurrency-safe.
         """
         try:
-            session = await self.session_store.get_by_call_id(caller_channel_id)
+            session = self._media_session(caller_channel_id)
             if not session:
-                logger.debug(
+                hot_log.debug(
                     "No session for call; dropping RTP audio",
                     caller_channel_id=caller_channel_id,
                     ssrc=ssrc,
@@ -6764,12 +7235,12 @@ class Engine:
                     await self._save_session(session)
                     logger.info("Media RX confirmed (ExternalMedia)", call_id=caller_channel_id)
             except Exception:
-                logger.debug("Failed to set media_rx_confirmed (ExternalMedia)", call_id=caller_channel_id, exc_info=True)
+                hot_log.debug("Failed to set media_rx_confirmed (ExternalMedia)", call_id=caller_channel_id, exc_info=True)
 
             # Check for pipeline mode FIRST (before continuous_input provider routing)
             # Pipeline adapters need audio in their queue, not sent to monolithic providers
             pipeline_forced = self._pipeline_forced.get(caller_channel_id)
-            logger.debug(
+            hot_log.debug(
                 "RTP audio routing check",
                 call_id=caller_channel_id,
                 pipeline_forced=pipeline_forced,
@@ -6829,7 +7300,7 @@ class Engine:
                         last = float(mon.get("last_ts", 0.0) or 0.0)
                         if now - last >= 1.0:
                             mon["last_ts"] = now
-                            logger.debug(
+                            hot_log.debug(
                                 "Pipeline barge-in monitor (RTP)",
                                 call_id=caller_channel_id,
                                 tts_elapsed_ms=tts_elapsed_ms,
@@ -6875,7 +7346,7 @@ class Engine:
                 if q:
                     try:
                         q.put_nowait(pcm_16k)  # Pipeline expects PCM16@16kHz
-                        logger.debug("RTP audio routed to pipeline queue", call_id=caller_channel_id, bytes=len(pcm_16k))
+                        hot_log.debug("RTP audio routed to pipeline queue", call_id=caller_channel_id, bytes=len(pcm_16k))
                     except Exception as exc:
                         logger.warning("Pipeline queue full or unavailable (RTP)", call_id=caller_channel_id, error=str(exc))
                     return  # Done - don't route to monolithic provider
@@ -6926,7 +7397,7 @@ class Engine:
                 
                 if needs_gating and not session.audio_capture_enabled:
                     # Send SILENCE instead of dropping to maintain Google Live's stream
-                    logger.debug(
+                    hot_log.debug(
                         "🔇 GATING ACTIVE - Sending silence frame for Google Live (TTS playing)",
                         call_id=caller_channel_id,
                         provider=provider_name,
@@ -6935,7 +7406,7 @@ class Engine:
                     pcm_16k = b'\x00' * len(pcm_16k)
                 elif not needs_gating and not session.audio_capture_enabled:
                     # For other providers, can safely drop audio during TTS
-                    logger.debug(
+                    hot_log.debug(
                         "Dropping RTP audio for continuous provider during TTS playback",
                         call_id=caller_channel_id,
                         provider=provider_name,
@@ -6964,12 +7435,12 @@ class Engine:
                             prov_rate,
                         )
                     except Exception:
-                        logger.debug("Provider input capture failed (continuous-input RTP)", call_id=session.call_id, exc_info=True)
+                        hot_log.debug("Provider input capture failed (continuous-input RTP)", call_id=session.call_id, exc_info=True)
                     # CRITICAL: Pass sample_rate and encoding to provider
                     # Google Live needs these to avoid double resampling
                     await provider.send_audio(prov_payload, sample_rate=prov_rate, encoding=prov_enc)
                 except Exception as exc:
-                    logger.debug("Continuous-input RTP forward error", call_id=caller_channel_id, error=str(exc))
+                    hot_log.debug("Continuous-input RTP forward error", call_id=caller_channel_id, error=str(exc))
 
                 # Provider-owned mode: local VAD fallback may flush local output (never cancels provider).
                 try:
@@ -6981,7 +7452,7 @@ class Engine:
                         source="externalmedia",
                     )
                 except Exception:
-                    logger.debug("Provider barge-in fallback check failed (ExternalMedia/continuous)", call_id=caller_channel_id, exc_info=True)
+                    hot_log.debug("Provider barge-in fallback check failed (ExternalMedia/continuous)", call_id=caller_channel_id, exc_info=True)
                 return
 
             # Below: standard gating/barge-in logic for hybrid (P2) providers only
@@ -6998,7 +7469,7 @@ class Engine:
                 except Exception:
                     elapsed_ms = post_guard_ms
                 if elapsed_ms < post_guard_ms:
-                    logger.debug(
+                    hot_log.debug(
                         "Dropping inbound RTP during post-TTS protection window",
                         call_id=caller_channel_id,
                         elapsed_ms=elapsed_ms,
@@ -7010,7 +7481,7 @@ class Engine:
             if hasattr(session, 'audio_capture_enabled') and not session.audio_capture_enabled:
                 cfg = getattr(self.config, 'barge_in', None)
                 if not cfg or not getattr(cfg, 'enabled', True):
-                    logger.debug("Dropping inbound RTP during TTS playback (barge-in disabled)",
+                    hot_log.debug("Dropping inbound RTP during TTS playback (barge-in disabled)",
                                  ssrc=ssrc, caller_channel_id=caller_channel_id, bytes=len(pcm_16k))
                     return
 
@@ -7031,7 +7502,7 @@ class Engine:
                 except Exception:
                     pass
                 if tts_elapsed_ms < initial_protect:
-                    logger.debug("Dropping inbound RTP during initial TTS protection window",
+                    hot_log.debug("Dropping inbound RTP during initial TTS protection window",
                                  ssrc=ssrc, caller_channel_id=caller_channel_id,
                                  tts_elapsed_ms=tts_elapsed_ms, protect_ms=initial_protect)
                     return
@@ -7082,8 +7553,12 @@ class Engine:
                             self.conversation_coordinator.note_audio_during_tts(caller_channel_id)
                         except Exception:
                             pass
-                    logger.debug("Dropping inbound RTP during TTS (candidate_ms=%d, energy=%d)",
-                                 session.barge_in_candidate_ms, energy)
+                    hot_log.debug(
+                        "Dropping inbound RTP during TTS",
+                        call_id=caller_channel_id,
+                        candidate_ms=session.barge_in_candidate_ms,
+                        energy=energy,
+                    )
                     return
 
             # If a pipeline was explicitly requested for this call, route to pipeline queue
@@ -7099,7 +7574,7 @@ class Engine:
                         q.put_nowait(pcm_16k)
                         return
                     except asyncio.QueueFull:
-                        logger.debug("Pipeline queue full; dropping RTP frame", call_id=caller_channel_id)
+                        hot_log.debug("Pipeline queue full; dropping RTP frame", call_id=caller_channel_id)
                         return
 
             provider_name = session.provider_name or self.config.default_provider
@@ -7107,7 +7582,7 @@ class Engine:
             if not provider or not hasattr(provider, 'send_audio'):
                 if not provider and caller_channel_id not in self._provider_start_tasks and not getattr(session, "provider_session_active", False):
                     self._kickoff_provider_session_start(caller_channel_id)
-                logger.debug("Provider unavailable for RTP audio", provider=provider_name)
+                hot_log.debug("Provider unavailable for RTP audio", provider=provider_name)
                 return
             if not getattr(session, "provider_session_active", False):
                 return
@@ -7124,7 +7599,7 @@ class Engine:
                     source="externalmedia",
                 )
             except Exception:
-                logger.debug("Provider barge-in fallback check failed (ExternalMedia)", call_id=caller_channel_id, exc_info=True)
+                hot_log.debug("Provider barge-in fallback check failed (ExternalMedia)", call_id=caller_channel_id, exc_info=True)
         except Exception as exc:
             logger.error("Error handling RTP audio", ssrc=ssrc, error=str(exc), exc_info=True)
 
@@ -7707,6 +8182,8 @@ class Engine:
                         )
                 except Exception:
                     logger.debug("Output suppression check failed", call_id=call_id, exc_info=True)
+                # Full-agent providers only report their output: the first chunk opens the turn.
+                self.tracer.get(call_id).mark("provider.first_audio", once=True, open_turn=True)
                 encoding = event.get("encoding")
                 if isinstance(encoding, bytes):
                     try:
@@ -7734,10 +8211,13 @@ class Engine:
                 # Initialize diag vars outside try block to avoid UnboundLocalError
                 diag_encoding = encoding or ""
                 diag_rate = sample_rate_int or 0
+                # With provider_out offloaded, levels are measured by the media worker below.
+                media_pool = self.media_workers if self.media_workers and self.media_workers.handles("provider_out") else None
                 try:
                     diag_encoding = fmt_entry.get("encoding") or encoding or (session.transport_profile.format if session.transport_profile else "")
                     diag_rate = int(fmt_entry.get("sample_rate") or sample_rate_int or (session.transport_profile.sample_rate if session.transport_profile else 0))
-                    self._update_audio_diagnostics(session, "provider_out", chunk, diag_encoding, diag_rate)
+                    if media_pool is None:
+                        self._update_audio_diagnostics(session, "provider_out", chunk, diag_encoding, diag_rate)
                 except Exception:
                     logger.debug("Provider audio diagnostics update failed", call_id=call_id, exc_info=True)
                 try:
@@ -7789,7 +8269,19 @@ class Engine:
                 except Exception:
                     transport_encoding = ""
                 out_chunk = chunk
-                if enc in ("linear16", "pcm16", "slin", "slin16") and rate and wire_rate and rate != wire_rate:
+                if media_pool is not None:
+                    try:
+                        worker_enc = enc if enc in ("linear16", "pcm16", "slin", "slin16") else (self._canonicalize_encoding(enc) or enc)
+                        out_chunk, _, out_rms, out_dc = await media_pool.provider_out(call_id, chunk, worker_enc, rate, wire_rate)
+                        self._record_audio_diagnostics(
+                            session, "provider_out", self._canonicalize_encoding(diag_encoding) or "slin16", diag_rate, out_rms, out_dc
+                        )
+                    except Exception:
+                        logger.debug("Media worker provider_out failed; processing inline", call_id=call_id, exc_info=True)
+                        media_pool = None
+                        out_chunk = chunk
+                        self._update_audio_diagnostics(session, "provider_out", chunk, diag_encoding, diag_rate)
+                if media_pool is None and enc in ("linear16", "pcm16", "slin", "slin16") and rate and wire_rate and rate != wire_rate:
                     try:
                         prov_out_state = self._resample_state_provider_out.get(call_id)
                         out_chunk, prov_out_state = resample_audio(chunk, rate, wire_rate, state=prov_out_state)
@@ -8085,6 +8577,7 @@ class Engine:
                         )
                 except Exception:
                     logger.debug("Failed clearing output suppression on AgentAudioDone", call_id=call_id, exc_info=True)
+                self.tracer.get(call_id).end_turn()
                 continuous = bool(getattr(self.streaming_playback_manager, 'continuous_stream', False))
                 q = self._provider_stream_queues.get(call_id)
                 if continuous:
@@ -8961,6 +9454,9 @@ class Engine:
                     )
                     use_streaming = False
             stream_format = stt_options.get("stream_format", "pcm16_16k")
+            if use_streaming and (llm_options or {}).get("speculative"):
+                # Speculative LLM turns feed on interim transcripts.
+                stt_options.setdefault("interim_results", True)
             if use_streaming:
                 try:
                     logger.info(
@@ -9022,6 +9518,7 @@ class Engine:
                         self._last_transcript_ts[call_id] = time.time()
                     except Exception:
                         pass
+                    self.tracer.get(call_id).mark("stt.final")
                     try:
                         transcript_queue.put_nowait(transcript)
                     except asyncio.QueueFull:
@@ -9103,6 +9600,7 @@ class Engine:
                             try:
                                 # Record time when a final transcript arrives
                                 self._last_transcript_ts[call_id] = time.time()
+                                self.tracer.get(call_id).mark("stt.final")
                                 transcript_queue.put_nowait(final)
                             except asyncio.QueueFull:
                                 try:
@@ -9133,6 +9631,34 @@ class Engine:
                 # Track conversation history to include prior messages
                 # AAVA-85 FIX: Initialize from session to preserve greeting
                 conversation_history: List[Dict[str, str]] = list(session.conversation_history or [])
+                turn_active = False
+
+                async def speculative_generate(text: str) -> Any:
+                    return await pipeline.llm_adapter.generate(
+                        call_id,
+                        text,
+                        {"prior_messages": list(conversation_history)},
+                        llm_options,
+                    )
+
+                # Speculative turns: start the LLM on stable interim transcripts (streaming STT only).
+                speculation = None
+                if use_streaming and (llm_options or {}).get("speculative"):
+                    from src.pipelines.speculation import SpeculativeGenerator
+
+                    speculation = SpeculativeGenerator.from_options(call_id, speculative_generate, llm_options)
+
+                def on_partial(text: str) -> None:
+                    if speculation is None or turn_active:
+                        return
+                    speculation.on_partial(" ".join([*pending_segments, text]).strip())
+
+                if speculation is not None:
+                    try:
+                        pipeline.stt_adapter.set_partial_listener(call_id, on_partial)
+                    except Exception:
+                        logger.debug("STT adapter does not report interim transcripts", call_id=call_id, exc_info=True)
+                        speculation = None
 
                 async def cancel_flush() -> None:
                     nonlocal flush_task
@@ -9156,16 +9682,25 @@ class Engine:
                     # System prompt only in first turn (when history is empty)
                     context_for_llm = {"prior_messages": list(conversation_history)}
                     
-                    try:
-                        llm_result = await pipeline.llm_adapter.generate(
-                            call_id,
-                            transcript_text,
-                            context_for_llm,  # Include conversation history
-                            llm_options,  # Use context-injected options (includes system_prompt)
-                        )
-                    except Exception:
-                        logger.debug("LLM generate failed", call_id=call_id, exc_info=True)
-                        return
+                    trace = self.tracer.get(call_id)
+                    # Adapters return whole responses, so this span runs to the last token.
+                    llm_span = trace.start_span("llm.generate")
+                    llm_result = await speculation.take(transcript_text) if speculation is not None else None
+                    if llm_result is not None:
+                        llm_span.set(speculative=True)
+                    else:
+                        try:
+                            llm_result = await pipeline.llm_adapter.generate(
+                                call_id,
+                                transcript_text,
+                                context_for_llm,  # Include conversation history
+                                llm_options,  # Use context-injected options (includes system_prompt)
+                            )
+                        except Exception as exc:
+                            llm_span.end(error=type(exc).__name__)
+                            logger.debug("LLM generate failed", call_id=call_id, exc_info=True)
+                            return
+                    llm_span.end()
 
                     # Handle structured LLM response with tool calls
                     if isinstance(llm_result, LLMResponse):
@@ -9354,10 +9889,12 @@ class Engine:
                                 playback_id = stream_id
                                 first_tts_ts: Optional[float] = None
 
+                                tts_span = trace.start_span("tts.synthesize")
                                 async for tts_chunk in pipeline.tts_adapter.synthesize(call_id, response_text, pipeline.tts_options):
                                     if not tts_chunk:
                                         continue
                                     if first_tts_ts is None:
+                                        trace.mark("tts.first_byte", once=True)
                                         first_tts_ts = time.time()
                                         turn_latency_ms = (first_tts_ts - turn_start_time) * 1000
                                         session.turn_latencies_ms.append(turn_latency_ms)
@@ -9367,6 +9904,7 @@ class Engine:
                                         except Exception:
                                             pass
                                     await stream_q.put(tts_chunk)
+                                tts_span.end()
 
                                 # End-of-segment sentinel
                                 try:
@@ -9388,9 +9926,11 @@ class Engine:
                                 try:
                                     tts_bytes = bytearray()
                                     first_tts_ts = None
+                                    tts_span = trace.start_span("tts.synthesize", fallback=True)
                                     async for tts_chunk in pipeline.tts_adapter.synthesize(call_id, response_text, pipeline.tts_options):
                                         if tts_chunk:
                                             if first_tts_ts is None:
+                                                trace.mark("tts.first_byte", once=True)
                                                 first_tts_ts = time.time()
                                                 turn_latency_ms = (first_tts_ts - turn_start_time) * 1000
                                                 session.turn_latencies_ms.append(turn_latency_ms)
@@ -9400,6 +9940,7 @@ class Engine:
                                                 except Exception:
                                                     pass
                                             tts_bytes.extend(tts_chunk)
+                                    tts_span.end()
                                     if tts_bytes:
                                         playback_id = await self.playback_manager.play_audio(call_id, bytes(tts_bytes), "pipeline-tts")
                                 except Exception:
@@ -9417,6 +9958,7 @@ class Engine:
                             # downstream_mode=file: keep existing pipeline file playback behavior
                             tts_bytes = bytearray()
                             first_tts_ts: Optional[float] = None
+                            tts_span = trace.start_span("tts.synthesize")
                             try:
                                 async for tts_chunk in pipeline.tts_adapter.synthesize(
                                     call_id,
@@ -9425,6 +9967,7 @@ class Engine:
                                 ):
                                     if tts_chunk:
                                         if first_tts_ts is None:
+                                            trace.mark("tts.first_byte", once=True)
                                             first_tts_ts = time.time()
                                             # Track turn latency for call history (Milestone 21)
                                             turn_latency_ms = (first_tts_ts - turn_start_time) * 1000
@@ -9435,7 +9978,9 @@ class Engine:
                                             except Exception:
                                                 pass
                                         tts_bytes.extend(tts_chunk)
-                            except Exception:
+                                tts_span.end()
+                            except Exception as exc:
+                                tts_span.end(error=type(exc).__name__)
                                 logger.debug("TTS synth failed", call_id=call_id, exc_info=True)
                                 # If TTS fails but we have tools, continue to tools
                                 if not tool_calls:
@@ -9499,6 +10044,7 @@ class Engine:
                                 if tool:
                                     logger.info("Executing pipeline tool", tool=name, call_id=call_id)
                                     _tool_start = time.time()
+                                    tool_span = trace.start_span("tool.execute", tool=name)
                                     # Slow-response UX (pipeline only): speak a waiting message if the tool takes too long.
                                     slow_threshold_ms = int(getattr(tool, "slow_response_threshold_ms", 0) or 0)
                                     slow_message = str(getattr(tool, "slow_response_message", "") or "").strip()
@@ -9525,6 +10071,7 @@ class Engine:
                                             except Exception:
                                                 logger.debug("Failed to speak slow-response message", call_id=call_id, exc_info=True)
                                     result = await tool_task
+                                    tool_span.end()
                                     tool_duration_ms = (time.time() - _tool_start) * 1000
                                     logger.info("Tool execution result", tool=name, result=result)
 
@@ -9661,6 +10208,7 @@ class Engine:
                                                             logger.info("Executing follow-up tool", tool=next_name, call_id=call_id)
                                                             slow_threshold_ms = int(getattr(next_tool, "slow_response_threshold_ms", 0) or 0)
                                                             slow_message = str(getattr(next_tool, "slow_response_message", "") or "").strip()
+                                                            next_span = trace.start_span("tool.execute", tool=next_name)
                                                             next_task = asyncio.create_task(next_tool.execute(next_args, tool_ctx))
                                                             if slow_threshold_ms > 0 and slow_message:
                                                                 done, _pending = await asyncio.wait(
@@ -9684,6 +10232,7 @@ class Engine:
                                                                     except Exception:
                                                                         logger.debug("Failed to speak slow-response message", call_id=call_id, exc_info=True)
                                                             next_result = await next_task
+                                                            next_span.end()
                                                             if next_result.get("will_hangup"):
                                                                 farewell = next_result.get("message", "Goodbye!")
                                                                 conversation_history.append({"role": "assistant", "content": farewell})
@@ -9710,7 +10259,7 @@ class Engine:
                                 logger.error("Tool execution failed", tool=name, error=str(e), exc_info=True)
 
                 async def maybe_respond(force: bool, from_flush: bool = False) -> None:
-                    nonlocal pending_segments, flush_task
+                    nonlocal pending_segments, flush_task, turn_active
                     if not pending_segments:
                         if from_flush:
                             flush_task = None
@@ -9748,7 +10297,16 @@ class Engine:
                         flush_task = None
                     else:
                         await cancel_flush()
-                    await run_turn(aggregated)
+                    turn_active = True
+                    trace = self.tracer.get(call_id)
+                    trace.begin_turn()
+                    try:
+                        await run_turn(aggregated)
+                    finally:
+                        trace.end_turn()
+                        turn_active = False
+                        if speculation is not None:
+                            speculation.cancel()
                     pending_segments.clear()
 
                 async def schedule_flush() -> None:
@@ -9783,6 +10341,10 @@ class Engine:
                     pass
                 finally:
                     await cancel_flush()
+                    if speculation is not None:
+                        speculation.cancel()
+                        pipeline.stt_adapter.set_partial_listener(call_id, None)
+                        logger.info("Speculative LLM summary", call_id=call_id, **speculation.stats)
 
             ingest_task = asyncio.create_task(ingest_audio())
 
@@ -9794,9 +10356,11 @@ class Engine:
 
                 try:
                     await pipeline.stt_adapter.start_stream(call_id, stt_options)
+                    # dialog_worker first: it registers the interim-transcript listener
+                    # before the sender pushes any audio.
+                    dialog_task = asyncio.create_task(dialog_worker())
                     stt_send_task = asyncio.create_task(stt_sender())
                     stt_recv_task = asyncio.create_task(stt_receiver())
-                    dialog_task = asyncio.create_task(dialog_worker())
 
                     if stt_send_task:
                         await stt_send_task
@@ -10079,6 +10643,7 @@ class Engine:
             if provider_name:
                 normalized = str(provider_name).strip()
                 previous = getattr(session, "provider_name", None)
+                await self._ensure_provider_loaded(normalized)
                 # If the selected provider is a monolithic provider, force it onto the session so
                 # later pipeline-default logic doesn't override it.
                 if normalized in self.providers and previous != normalized:
@@ -10111,29 +10676,10 @@ class Engine:
             )
             return
         
-        # Get provider capabilities
-        provider_caps = None
-        try:
-            if hasattr(provider, 'get_capabilities'):
-                provider_caps = provider.get_capabilities()
-        except Exception as exc:
-            logger.debug(
-                "Failed to get provider capabilities",
-                call_id=session.call_id,
-                provider=provider_name,
-                error=str(exc),
-            )
-        
-        # Resolve transport profile
+        # Resolve transport profile (negotiated once per provider/profile/context, see _session_bundle)
         try:
-            # Pass provider config so orchestrator can read actual provider requirements
-            provider_cfg = getattr(provider, "config", None) if provider else None
-            transport = self.transport_orchestrator.resolve_transport(
-                provider_name=provider_name,
-                provider_caps=provider_caps,
-                channel_vars=channel_vars,
-                provider_config=provider_cfg,
-            )
+            bundle = self._session_bundle(session, provider_name, provider, channel_vars)
+            transport = bundle.new_transport()
             
             # Store transport in session (keep as object, not dict, for legacy code compatibility)
             session.transport_profile = transport
@@ -10182,7 +10728,7 @@ class Engine:
                 transport_context=transport.context if hasattr(transport, "context") else None,
             )
             if transport.context:
-                context_config = self.transport_orchestrator.get_context_config(transport.context)
+                context_config = bundle.context.config
                 logger.debug(
                     "Context config loaded",
                     call_id=session.call_id,
@@ -10226,10 +10772,9 @@ class Engine:
                                     else greeting_to_apply
                                 ),
                             )
-                        if context_config.prompt:
-                            prompt_to_apply = context_config.prompt
+                        if bundle.context.prompt is not None:
                             # Apply template substitution for caller context variables
-                            prompt_to_apply = self._apply_prompt_template_substitution(prompt_to_apply, session)
+                            prompt_to_apply = bundle.context.prompt.render(self._prompt_substitutions(session))
                             if getattr(session, "is_outbound", False) and getattr(session, "outbound_custom_vars", None):
                                 prompt_to_apply = self._append_outbound_custom_vars_to_prompt(
                                     prompt_to_apply,
@@ -10381,14 +10926,19 @@ class Engine:
     
     def _compute_config_hash(self) -> str:
         """Compute a hash of the current config for pending-changes detection."""
+        return self._hash_config(self.config)
+
+    @staticmethod
+    def _hash_config(config: Any) -> str:
+        """Hash a config object; pure, so /reload can run it off the event loop."""
         import hashlib
         import json
         try:
             # Convert config to dict and hash it
-            if hasattr(self.config, 'model_dump'):
-                config_dict = self.config.model_dump()
-            elif hasattr(self.config, 'dict'):
-                config_dict = self.config.dict()
+            if hasattr(config, 'model_dump'):
+                config_dict = config.model_dump()
+            elif hasattr(config, 'dict'):
+                config_dict = config.dict()
             else:
                 config_dict = {}
             
@@ -10458,14 +11008,19 @@ class Engine:
         fmt, rate = mapping.get(frame_len, ("slin16" if frame_len % 2 == 0 else "ulaw", 8000))
         return fmt, rate
 
-    def _wire_to_pcm16(
+    async def _condition_ingress(
         self,
+        call_id: str,
         audio_bytes: bytes,
         wire_fmt: str,
         swap_needed: bool,
         wire_rate: int,
-    ) -> Tuple[bytes, int]:
-        """Convert wire-format audio to PCM16 little-endian."""
+    ) -> Tuple[bytes, int, int, int]:
+        """
+        Wire-format audio -> DC-free PCM16 little-endian plus its (rms, dc_offset).
+
+        Runs on the call's media worker when ``ingress`` is offloaded, inline otherwise.
+        """
         canonical = self._canonicalize_encoding(wire_fmt) or "ulaw"
         rate = wire_rate or 0
         if rate <= 0:
@@ -10474,19 +11029,13 @@ class Engine:
             except Exception:
                 inferred_rate = 0
             rate = inferred_rate or 8000
-        pcm = audio_bytes
-        try:
-            if canonical in ("ulaw", "mulaw", "g711_ulaw", "mu-law"):
-                pcm = audioop.ulaw2lin(audio_bytes, 2)
-                rate = 8000
-            else:
-                if swap_needed:
-                    pcm = audioop.byteswap(audio_bytes, 2)
-                else:
-                    pcm = audio_bytes
-        except Exception:
-            pcm = b""
-        return pcm or b"", rate
+        pool = self.media_workers
+        if pool is not None and pool.handles("ingress"):
+            try:
+                return await pool.ingress(call_id, audio_bytes, canonical, rate, swap_needed)
+            except Exception:
+                hot_log.debug("Media worker ingress failed; conditioning inline", call_id=call_id, exc_info=True)
+        return condition_ingress(audio_bytes, canonical, rate, swap_needed)
 
     def _encode_for_provider(
         self,
@@ -10753,6 +11302,22 @@ class Engine:
                 pcm = audio_bytes
             rms = audioop.rms(pcm, 2) if pcm else 0
             dc_offset = audioop.avg(pcm, 2) if pcm else 0
+        except Exception:
+            logger.debug("Audio diagnostics update failed", call_id=session.call_id, stage=stage, exc_info=True)
+            return
+        self._record_audio_diagnostics(session, stage, canonical, sample_rate, rms, dc_offset)
+
+    def _record_audio_diagnostics(
+        self,
+        session: CallSession,
+        stage: str,
+        canonical: str,
+        sample_rate: int,
+        rms: int,
+        dc_offset: int,
+    ) -> None:
+        """Publish already-measured levels (media workers measure them off-loop)."""
+        try:
             session.audio_diagnostics[stage] = {
                 "rms": rms,
                 "dc_offset": dc_offset,
@@ -11168,6 +11733,120 @@ class Engine:
 
         bg_task.add_done_callback(_done)
 
+    def _bundle_cache(self) -> SessionBundleCache:
+        cache = getattr(self, "session_bundles", None)
+        if cache is None:
+            cache = self.session_bundles = SessionBundleCache()
+        return cache
+
+    def _session_bundle(
+        self,
+        session: CallSession,
+        provider_name: str,
+        provider: Optional[AIProviderInterface],
+        channel_vars: Dict[str, str],
+    ) -> SessionBundle:
+        """Negotiated transport + context bundle, built once per (config, provider, profile, context)."""
+
+        def build() -> SessionBundle:
+            provider_caps = None
+            try:
+                if hasattr(provider, 'get_capabilities'):
+                    provider_caps = provider.get_capabilities()
+            except Exception as exc:
+                logger.debug(
+                    "Failed to get provider capabilities",
+                    call_id=session.call_id,
+                    provider=provider_name,
+                    error=str(exc),
+                )
+            # Pass provider config so orchestrator can read actual provider requirements
+            transport = self.transport_orchestrator.resolve_transport(
+                provider_name=provider_name,
+                provider_caps=provider_caps,
+                channel_vars=channel_vars,
+                provider_config=getattr(provider, "config", None) if provider else None,
+            )
+            return SessionBundle(
+                provider_name=provider_name,
+                transport=transport,
+                context=self._context_bundle(transport.context),
+            )
+
+        # Only the shared provider template is config-derived; a per-call instance may
+        # already carry call-specific overrides.
+        if provider is not self.providers.get(provider_name):
+            return build()
+        key = (
+            self._config_hash,
+            provider_name,
+            channel_vars.get("AI_AUDIO_PROFILE"),
+            channel_vars.get("AI_CONTEXT"),
+        )
+        return self._bundle_cache().session(key, build)
+
+    def _context_bundle(self, context_name: Optional[str]) -> ContextBundle:
+        """Context config, compiled prompt and effective in-call tool allowlist for a context."""
+        from src.tools.registry import tool_registry
+
+        key = (self._config_hash, tool_registry.generation, context_name)
+        return self._bundle_cache().context(key, lambda: self._build_context_bundle(context_name))
+
+    def _build_context_bundle(self, context_name: Optional[str]) -> ContextBundle:
+        context_config = self.transport_orchestrator.get_context_config(context_name)
+        if not context_config:
+            return ContextBundle(name=context_name, config=None, prompt=None, in_call_tools=None)
+
+        # Register per-context in-call HTTP tools if defined
+        in_call_http_tools_cfg = getattr(context_config, "in_call_http_tools", None)
+        allowed_in_call_http_tool_names: list[str] = []
+
+        if isinstance(in_call_http_tools_cfg, dict) and in_call_http_tools_cfg:
+            try:
+                from src.tools.registry import tool_registry
+                tool_registry.initialize_in_call_http_tools_from_config(
+                    in_call_http_tools_cfg,
+                    cache_key=f"context:{context_name}",
+                )
+                logger.debug(
+                    "Registered per-context in-call HTTP tools",
+                    context=context_name,
+                    tool_count=len(in_call_http_tools_cfg),
+                )
+                allowed_in_call_http_tool_names = list(in_call_http_tools_cfg.keys())
+            except Exception as e:
+                logger.warning(f"Failed to register context in-call HTTP tools: {e}", context=context_name)
+        elif isinstance(in_call_http_tools_cfg, (list, tuple)) and in_call_http_tools_cfg:
+            allowed_in_call_http_tool_names = [str(x) for x in in_call_http_tools_cfg if str(x).strip()]
+
+        # Context tool allowlisting:
+        # - Combine global tools with context-specific tools (Milestone 24),
+        #   respecting context opt-outs.
+        # - Also include per-context in-call HTTP tool wrappers.
+        allowed = list(getattr(context_config, "tools", None) or [])
+        if allowed_in_call_http_tool_names:
+            allowed.extend(allowed_in_call_http_tool_names)
+        try:
+            from src.tools.base import ToolPhase
+            from src.tools.registry import tool_registry
+
+            disabled_global = list(getattr(context_config, "disable_global_in_call_tools") or [])
+            tools = tool_registry.get_tools_for_context(
+                ToolPhase.IN_CALL,
+                context_tool_names=allowed,
+                disabled_global_tools=disabled_global,
+            )
+            in_call_tools = tuple(t.definition.name for t in tools)
+        except Exception:
+            in_call_tools = tuple(allowed)
+
+        prompt = compile_prompt(context_config.prompt) if context_config.prompt else None
+        return ContextBundle(name=context_name, config=context_config, prompt=prompt, in_call_tools=in_call_tools)
+
+    def _config_snapshot(self) -> Dict[str, Any]:
+        """``self.config`` as a plain dict, shared read-only by every call of this config."""
+        return self._bundle_cache().snapshot(("config", self._config_hash), lambda: self.config.dict())
+
     def _apply_provider_overrides(self, provider: AIProviderInterface, session: CallSession) -> None:
         """Apply per-call overrides (greeting/prompt/target format) to a provider instance."""
         overrides = {}
@@ -11385,7 +12064,8 @@ class Engine:
                         except Exception:
                             as_fmt = None
                         if as_fmt in ('ulaw', 'mulaw', 'g711_ulaw'):
-                            provider.set_input_mode('mulaw8k')
+                            # Inbound µ-law is decoded to PCM16 before it is forwarded to the provider.
+                            provider.set_input_mode('pcm16_8k')
                         elif as_fmt in ('slin16', 'linear16', 'pcm16'):
                             # slin16 is 16kHz PCM16, set correct input mode
                             provider.set_input_mode('pcm16_16k')
@@ -11402,7 +12082,8 @@ class Engine:
             provider_context = {}
             try:
                 if session.context_name:
-                    context_config = self.transport_orchestrator.get_context_config(session.context_name)
+                    context_bundle = self._context_bundle(session.context_name)
+                    context_config = context_bundle.config
                     logger.debug(
                         "Building provider context",
                         call_id=call_id,
@@ -11412,49 +12093,7 @@ class Engine:
                         has_tools_attr=hasattr(context_config, 'tools') if context_config else False,
                     )
                     if context_config:
-                        # Register per-context in-call HTTP tools if defined
-                        in_call_http_tools_cfg = getattr(context_config, "in_call_http_tools", None)
-                        allowed_in_call_http_tool_names: list[str] = []
-
-                        if isinstance(in_call_http_tools_cfg, dict) and in_call_http_tools_cfg:
-                            try:
-                                from src.tools.registry import tool_registry
-                                tool_registry.initialize_in_call_http_tools_from_config(
-                                    in_call_http_tools_cfg,
-                                    cache_key=f"context:{session.context_name}",
-                                )
-                                logger.debug(
-                                    "Registered per-context in-call HTTP tools",
-                                    call_id=call_id,
-                                    context=session.context_name,
-                                    tool_count=len(in_call_http_tools_cfg),
-                                )
-                                allowed_in_call_http_tool_names = list(in_call_http_tools_cfg.keys())
-                            except Exception as e:
-                                logger.warning(f"Failed to register context in-call HTTP tools: {e}", call_id=call_id)
-                        elif isinstance(in_call_http_tools_cfg, (list, tuple)) and in_call_http_tools_cfg:
-                            allowed_in_call_http_tool_names = [str(x) for x in in_call_http_tools_cfg if str(x).strip()]
-                        
-                        # Context tool allowlisting:
-                        # - Combine global tools with context-specific tools (Milestone 24),
-                        #   respecting context opt-outs.
-                        # - Also include per-context in-call HTTP tool wrappers.
-                        allowed = list(getattr(context_config, "tools", None) or [])
-                        if allowed_in_call_http_tool_names:
-                            allowed.extend(allowed_in_call_http_tool_names)
-                        try:
-                            from src.tools.base import ToolPhase
-                            from src.tools.registry import tool_registry
-
-                            disabled_global = list(getattr(context_config, "disable_global_in_call_tools") or [])
-                            tools = tool_registry.get_tools_for_context(
-                                ToolPhase.IN_CALL,
-                                context_tool_names=allowed,
-                                disabled_global_tools=disabled_global,
-                            )
-                            provider_context["tools"] = [t.definition.name for t in tools]
-                        except Exception:
-                            provider_context["tools"] = allowed
+                        provider_context["tools"] = list(context_bundle.in_call_tools or ())
                         try:
                             # Persist tool allowlist on session so provider-agnostic tools (e.g., hangup_call)
                             # can decide whether follow-up tools like request_transcript are actually available.
@@ -11500,7 +12139,8 @@ class Engine:
                     provider._called_number = getattr(session, 'called_number', None)
                     provider._session_store = self.session_store
                     provider._ari_client = self.ari_client
-                    provider._full_config = self.config.dict()  # Convert Pydantic model to dict
+                    # Plain-dict config for tool execution; one shared read-only snapshot per config.
+                    provider._full_config = self._config_snapshot()
                     logger.debug(
                         "Injected tool execution context into provider",
                         call_id=call_id,
@@ -11509,7 +12149,8 @@ class Engine:
                 except Exception as e:
                     logger.warning(f"Failed to inject tool context: {e}", call_id=call_id)
 
-            await provider.start_session(call_id, context=provider_context if provider_context else None)
+            with self.tracer.get(call_id).span("provider.start", provider=provider_name):
+                await provider.start_session(call_id, context=provider_context if provider_context else None)
             logger.info("Provider session started", call_id=call_id, provider=provider_name)
             # If provider supports an explicit greeting (e.g., LocalProvider), trigger it now
             try:
@@ -11616,6 +12257,7 @@ class Engine:
             # (similar to /mcp/status) and should not include secrets or PII.
             app.router.add_get('/tools/definitions', self._tools_definitions_handler)
             app.router.add_get('/sessions/stats', self._sessions_stats_handler)
+            app.router.add_get('/debug/profile', self._debug_profile_handler)
             runner = web.AppRunner(app)
             await runner.setup()
             # Host/port configurable via YAML health block with environment overrides (AAVA-30)
@@ -11633,6 +12275,7 @@ class Engine:
             except Exception:
                 health_host = '127.0.0.1'
                 health_port = 15000
+            health_port = self.shard.port(health_port)
             site = web.TCPSite(runner, health_host, health_port)
             await site.start()
             self._health_runner = runner
@@ -11725,6 +12368,51 @@ class Engine:
             logger.debug("Sessions stats handler failed", error=str(exc), exc_info=True)
             return web.json_response({"active_calls": 0, "error": "internal_error"}, status=500)
 
+    async def _debug_profile_handler(self, request):
+        """Sample Python stacks for N seconds and return collapsed stacks (py-spy/flamegraph format).
+
+        Query params: seconds (default 10, max 60), interval_ms (default 5),
+        threads=loop|all (default loop), lineno=0|1 (default 1).
+
+        SECURITY: Requires localhost or HEALTH_API_TOKEN.
+        """
+        # SECURITY: Stacks expose code paths and call identifiers
+        if not self._is_request_authorized(request):
+            return web.json_response(
+                {"error": "Forbidden: requires localhost or valid HEALTH_API_TOKEN"},
+                status=403
+            )
+        try:
+            seconds = float(request.query.get("seconds", "10"))
+            interval_ms = float(request.query.get("interval_ms", "5"))
+        except ValueError:
+            return web.json_response({"error": "seconds and interval_ms must be numbers"}, status=400)
+        if not (0 < seconds <= 60) or not (1 <= interval_ms <= 1000):
+            return web.json_response({"error": "seconds must be in (0, 60], interval_ms in [1, 1000]"}, status=400)
+        threads = request.query.get("threads", "loop")
+        lineno = request.query.get("lineno", "1") not in ("0", "false")
+        if self._profile_lock.locked():
+            return web.json_response({"error": "A profile is already running"}, status=409)
+        async with self._profile_lock:
+            try:
+                thread_id = None if threads == "all" else (self.loop_monitor.loop_thread_id or threading.get_ident())
+                loop = asyncio.get_running_loop()
+                collapsed = await loop.run_in_executor(
+                    None,
+                    functools.partial(
+                        collect_profile,
+                        seconds,
+                        interval_sec=interval_ms / 1000.0,
+                        thread_id=thread_id,
+                        lineno=lineno,
+                    ),
+                )
+                logger.info("Debug profile collected", seconds=seconds, threads=threads, stacks=collapsed.count("\n"))
+                return web.Response(text=collapsed, content_type="text/plain")
+            except Exception as exc:
+                logger.debug("Debug profile handler failed", error=str(exc), exc_info=True)
+                return web.json_response({"error": "internal_error"}, status=500)
+
     async def _mcp_status_handler(self, request):
         """Return MCP server/tool status for Admin UI (sanitized)."""
         try:
@@ -11859,7 +12547,8 @@ class Engine:
                     except Exception:
                         pass
                 if tool:
-                    result = await tool.execute(parameters, context)
+                    with self.tracer.get(call_id).span("tool.execute", tool=function_name):
+                        result = await tool.execute(parameters, context)
 
                     # Handle special tools
                     if function_name == "hangup_call" and result.get("will_hangup"):
@@ -12333,7 +13022,7 @@ class Engine:
                     "bind_host": getattr(self.config.audiosocket, 'host', None) if self.config.audiosocket else None,
                     "advertise_host": (getattr(self.config.audiosocket, 'advertise_host', None) 
                                        or getattr(self.config.audiosocket, 'host', None)) if self.config.audiosocket else None,
-                    "port": getattr(self.config.audiosocket, 'port', None) if self.config.audiosocket else None,
+                    "port": self.shard.port(self.config.audiosocket.port) if self.config.audiosocket else None,
                     "active_connections": (self.audio_socket_server.get_connection_count() if self.audio_socket_server else 0),
                 },
                 "external_media": {
@@ -12344,6 +13033,7 @@ class Engine:
                     "port_range": getattr(self.config.external_media, 'port_range', None) if self.config.external_media else None,
                 },
                 "config_warnings": self._compute_nat_warnings(),
+                "cluster": await self._cluster_status(),
                 "audiosocket_listening": audiosocket_listening,
                 "conversation": {
                     "gating_active": conversation_summary.get("gating_active", 0),
@@ -12353,6 +13043,13 @@ class Engine:
                 },
                 "streaming": {},
                 "streaming_details": [],
+                "local_ai_pool": shared_pool_stats(),
+                "media_workers": self.media_workers.stats() if self.media_workers else None,
+                "session_bundles": self._bundle_cache().stats(),
+                "startup": {
+                    **self.startup.report(),
+                    "deferred_providers": sorted(getattr(self.providers, "deferred", None) or ()),
+                },
             }
             return web.json_response(payload)
         except Exception as exc:
@@ -12409,11 +13106,147 @@ class Engine:
             logger.debug("Metrics handler failed", error=str(exc), exc_info=True)
             return web.Response(text="metrics_error", status=500)
 
+    # Top-level sections that feed TransportOrchestrator (profiles/contexts and the legacy streaming profile).
+    _TRANSPORT_SECTIONS = ("profiles", "contexts", "audio_transport", "audiosocket", "streaming")
+    # Providers whose templates/factories are built from other top-level sections.
+    _PROVIDER_RELOAD_DEPENDENCIES = {
+        "llm": ("local", "deepgram", "openai_realtime", "elevenlabs_agent"),
+        "tools": ("google_live",),
+    }
+    # Sections bound at startup (listeners, ARI connection, worker pools); a reload only reports them.
+    _RESTART_ONLY_SECTIONS = ("asterisk", "external_media", "audiosocket", "health", "cluster", "media_workers", "tracing", "post_call_jobs", "device_state_cache")
+
+    def _prepare_reload(self, old_config: Any) -> Tuple[Any, ConfigDiff, str, Any]:
+        """Load, diff and pre-build a new configuration.
+
+        Runs in a worker thread: it only parses YAML and builds new objects, it never
+        touches live engine state. Returns (new_config, diff, config_hash, orchestrator),
+        where orchestrator is a rebuilt TransportOrchestrator, None when the transport
+        sections are unchanged, or the exception raised while building it.
+        """
+        from .config import load_config
+
+        new_config = load_config()
+        diff = diff_configs(old_config, new_config)
+        if diff.empty:
+            return new_config, diff, self._hash_config(new_config), None
+        orchestrator: Any = None
+        if diff.changed(*self._TRANSPORT_SECTIONS):
+            try:
+                orchestrator = TransportOrchestrator(new_config.model_dump())
+            except Exception as exc:
+                orchestrator = exc
+        return new_config, diff, self._hash_config(new_config), orchestrator
+
+    def _reload_providers(self, diff: ConfigDiff, changes: List[str], errors: List[str]) -> None:
+        """Rebuild provider templates/factories affected by the diff.
+
+        Per-call provider instances already handed to in-flight calls are untouched;
+        only new calls get instances from the rebuilt factories.
+        """
+        section = diff.section("providers")
+        names = list(section.touched)
+        for dependency, dependents in self._PROVIDER_RELOAD_DEPENDENCIES.items():
+            if diff.changed(dependency):
+                names.extend(n for n in dependents if n in self.config.providers and n not in names)
+
+        for name in section.removed:
+            had = self.providers.pop(name, None) is not None
+            self.provider_factories.pop(name, None)
+            self.provider_alignment_issues.pop(name, None)
+            if had:
+                changes.append(f"Provider '{name}' removed")
+
+        deferred = getattr(self.providers, "deferred", None)
+        in_use = self._providers_in_use()
+        for name in names:
+            was_deferred = deferred is not None and name in deferred
+            existed = self.providers.pop(name, None) is not None or was_deferred
+            self.provider_factories.pop(name, None)
+            self.provider_alignment_issues.pop(name, None)
+            if (was_deferred or not existed) and name not in in_use and name in PROVIDERS.names():
+                # New or never used yet: keep it lazy, the next lookup builds it from the new config.
+                self._defer_provider(name)
+                changes.append(f"Provider '{name}' updated (loads in the background)")
+                continue
+            try:
+                loaded = self._load_provider(name, self.config.providers[name])
+            except Exception as exc:
+                logger.debug("Error reloading provider", provider=name, error=str(exc), exc_info=True)
+                errors.append(f"Error reloading provider '{name}' (see server logs)")
+                continue
+            if loaded:
+                changes.append(f"Provider '{name}' {'reloaded' if existed else 'added'}")
+            elif existed:
+                changes.append(f"Provider '{name}' unloaded (disabled or invalid config)")
+        self._schedule_provider_warmup()
+
+    def _reload_tools(self, old_config: Any, diff: ConfigDiff, changes: List[str]) -> None:
+        """Re-register HTTP tools whose config changed.
+
+        Tool instances live in the process-wide registry, so changed definitions are
+        also what in-flight calls execute from here on.
+        """
+        from src.tools.registry import tool_registry
+
+        new_config = self.config
+        if diff.changed("tools"):
+            section = diff.section("tools")
+            old_tools = getattr(old_config, "tools", None) or {}
+            stale = [n for n in section.removed + section.changed if isinstance(old_tools.get(n), dict)]
+            tool_registry.unregister_many(stale)
+            touched = {n: new_config.tools[n] for n in section.touched}
+            if touched:
+                tool_registry.initialize_http_tools_from_config(touched)
+            changes.append(f"HTTP tools reloaded ({len(stale)} removed/changed, {len(touched)} added/changed)")
+
+        if diff.changed("in_call_tools"):
+            section = diff.section("in_call_tools")
+            tool_registry.unregister_many(section.removed + section.changed)
+            tool_registry.forget_in_call_init(["global"])
+            if new_config.in_call_tools:
+                tool_registry.initialize_in_call_http_tools_from_config(new_config.in_call_tools, cache_key="global")
+            changes.append(f"In-call HTTP tools reloaded ({len(new_config.in_call_tools or {})})")
+
+        if diff.changed("contexts"):
+            # Per-context in-call HTTP tools register lazily on the next call for that context.
+            section = diff.section("contexts")
+            tool_registry.forget_in_call_init(f"context:{name}" for name in section.removed + section.changed)
+
+    async def _build_pipelines(
+        self, new_config: Any, diff: ConfigDiff, errors: List[str]
+    ) -> Optional[PipelineOrchestrator]:
+        """Build and start a PipelineOrchestrator for new_config when pipeline or provider config changed.
+
+        Runs before the config swap (validation may touch the network), so calls arriving
+        meanwhile keep the old config and pipelines. Returns None when nothing changed or
+        the rebuild failed.
+        """
+        if not diff.changed("pipelines", "active_pipeline", "providers"):
+            return None
+        orchestrator = PipelineOrchestrator(new_config)
+        try:
+            await orchestrator.start()
+        except PipelineOrchestratorError as exc:
+            logger.debug("Pipeline orchestrator rebuild failed", error=str(exc), exc_info=True)
+            errors.append("Error rebuilding pipelines; previous pipelines kept (see server logs)")
+            return None
+        return orchestrator
+
+    def _swap_pipelines(self, orchestrator: PipelineOrchestrator, changes: List[str]) -> None:
+        """Make a started orchestrator live; it takes over in-flight calls' pipelines."""
+        old = getattr(self, "pipeline_orchestrator", None)
+        adopted = orchestrator.adopt_assignments(old) if old is not None else 0
+        self.pipeline_orchestrator = orchestrator
+        changes.append(f"Pipelines rebuilt ({adopted} in-flight call(s) keep their pipeline)")
+
     async def _reload_handler(self, request):
         """Hot-reload configuration without restarting the engine.
         
-        Reloads ai-agent.yaml and reinitializes providers with new settings.
-        Active calls continue uninterrupted - changes apply to new calls only.
+        Parses ai-agent.yaml off the event loop, diffs it against the live config and
+        rebuilds only what changed (providers, pipelines, tools, transport/contexts).
+        Active calls continue uninterrupted - they keep their provider instances,
+        pipelines and session bundles; changes apply to new calls.
         
         POST /reload
         Returns JSON with reload status and what changed.
@@ -12426,17 +13259,26 @@ class Engine:
                 {"success": False, "error": "Forbidden: requires localhost or valid HEALTH_API_TOKEN"},
                 status=403
             )
-        
+
+        lock = getattr(self, "_reload_lock", None)
+        if lock is None:
+            lock = self._reload_lock = asyncio.Lock()
+        async with lock:
+            return await self._reload(time.perf_counter())
+
+    async def _reload(self, started: float):
+        """Body of POST /reload; callers hold _reload_lock."""
         try:
             logger.info("🔄 Configuration reload requested")
             changes = []
             errors = []
             
-            # Step 1: Reload configuration from YAML
-            from .config import load_config
+            # Step 1: Load, diff and pre-build in a worker thread so calls keep streaming.
+            old_config = self.config
             try:
-                new_config = load_config()
-                changes.append("Configuration file reloaded")
+                new_config, diff, config_hash, transport = await asyncio.get_running_loop().run_in_executor(
+                    None, self._prepare_reload, old_config
+                )
             except Exception as e:
                 logger.debug("Failed to load config on reload", error=str(e), exc_info=True)
                 errors.append("Failed to load config (see server logs)")
@@ -12445,63 +13287,66 @@ class Engine:
                     "message": "Failed to reload configuration",
                     "errors": errors
                 }, status=500)
+
+            if diff.empty:
+                logger.info("✅ Configuration reload: no changes")
+                return web.json_response({
+                    "success": True,
+                    "message": "Configuration unchanged",
+                    "changes": [],
+                    "errors": [],
+                    "duration_ms": round((time.perf_counter() - started) * 1000, 2),
+                })
             
-            # Step 2: Compare and update provider configurations
-            old_providers = set(self.providers.keys()) if self.providers else set()
-            
-            # Update config reference
-            old_config = self.config
+            # Step 1b: Pipelines (validation may touch the network, so this awaits before anything is swapped)
+            try:
+                pipelines = await self._build_pipelines(new_config, diff, errors)
+            except Exception as e:
+                pipelines = None
+                errors.append(f"Error rebuilding pipelines: {str(e)}")
+
+            # Step 2: Swap the config reference; from here on everything runs on the loop without awaiting
+            # until MCP tools are reloaded, so a new call sees either the old state or the new one.
             self.config = new_config
             # Recompute config hash after reload so health endpoint shows current state
-            self._config_hash = self._compute_config_hash()
+            self._config_hash = config_hash
             self._config_loaded_at = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
             changes.append("Configuration updated")
+            changes.extend(diff.summary())
+            if pipelines is not None:
+                self._swap_pipelines(pipelines, changes)
 
-            # Step 2b: Rebuild TransportOrchestrator so contexts/profiles changes apply to new calls.
-            # The orchestrator is created once at startup and otherwise holds stale copies of profiles/contexts.
-            try:
-                cfg_dict = new_config.dict() if hasattr(new_config, "dict") else new_config.__dict__
-                self.transport_orchestrator = TransportOrchestrator(cfg_dict)
-                changes.append("TransportOrchestrator rebuilt (profiles/contexts refreshed)")
-            except Exception as e:
-                logger.debug("Error rebuilding TransportOrchestrator", error=str(e), exc_info=True)
+            # Step 2b: TransportOrchestrator holds copies of profiles/contexts; it was rebuilt off-loop if they changed.
+            if isinstance(transport, Exception):
+                logger.debug("Error rebuilding TransportOrchestrator", error=str(transport))
                 errors.append("Error rebuilding TransportOrchestrator (see server logs)")
+            elif transport is not None:
+                self.transport_orchestrator = transport
+                changes.append("TransportOrchestrator rebuilt (profiles/contexts refreshed)")
+            # New calls rebuild their session bundles (transport, prompts, tools) from the new config.
+            self._bundle_cache().invalidate()
             
-            # Step 3: Reinitialize providers that have changed
+            # Step 3: Rebuild only the providers whose config (or a section they depend on) changed
             try:
-                # Re-register providers with new config
-                new_providers_config = getattr(new_config, 'providers', {})
-                
-                for provider_name, provider_config in new_providers_config.items():
-                    if not getattr(provider_config, 'enabled', True):
-                        continue
-                    
-                    # Check if provider exists and needs update
-                    if provider_name in self.providers:
-                        # Provider exists - check if config changed
-                        old_prov_config = getattr(old_config, 'providers', {}).get(provider_name)
-                        if old_prov_config != provider_config:
-                            changes.append(f"Provider '{provider_name}' configuration updated")
-                    else:
-                        changes.append(f"Provider '{provider_name}' detected (restart needed to add)")
-                
-                # Check for removed providers
-                for old_name in old_providers:
-                    if old_name not in new_providers_config:
-                        changes.append(f"Provider '{old_name}' removed from config (restart needed)")
-                        
+                self._reload_providers(diff, changes, errors)
             except Exception as e:
                 errors.append(f"Error updating providers: {str(e)}")
+
+            # Step 3b: Re-register changed HTTP tools
+            try:
+                self._reload_tools(old_config, diff, changes)
+            except Exception as e:
+                errors.append(f"Error reloading tools: {str(e)}")
             
             # Step 4: Update contexts
             try:
-                if hasattr(new_config, 'contexts') and new_config.contexts:
+                if diff.changed("contexts") and new_config.contexts:
                     self.contexts = new_config.contexts
                     changes.append(f"Contexts updated ({len(new_config.contexts)} contexts)")
             except Exception as e:
                 errors.append(f"Error updating contexts: {str(e)}")
 
-            # Step 4b: Reload MCP tools (best-effort; applies to new calls)
+            # Step 4a: Reload MCP tools (best-effort; applies to new calls)
             try:
                 old_mcp = getattr(old_config, "mcp", None)
                 new_mcp = getattr(new_config, "mcp", None)
@@ -12542,13 +13387,10 @@ class Engine:
             except Exception as e:
                 errors.append(f"Error reloading MCP tools: {str(e)}")
             
-            # Step 5: Update prompts
-            try:
-                if hasattr(new_config, 'prompts') and new_config.prompts:
-                    self.prompts = new_config.prompts
-                    changes.append(f"Prompts updated ({len(new_config.prompts)} prompts)")
-            except Exception as e:
-                errors.append(f"Error updating prompts: {str(e)}")
+            # Step 5: Sections bound at startup
+            restart_needed = [name for name in self._RESTART_ONLY_SECTIONS if diff.changed(name)]
+            if restart_needed:
+                changes.append(f"Restart needed to apply: {', '.join(restart_needed)}")
             
             logger.info("✅ Configuration reload completed", changes=changes, errors=errors)
             
@@ -12557,6 +13399,7 @@ class Engine:
                 "message": "Configuration reloaded" if not errors else "Reload completed with errors",
                 "changes": changes,
                 "errors": errors,
+                "duration_ms": round((time.perf_counter() - started) * 1000, 2),
                 "note": "Changes apply to new calls. Active calls use previous config."
             })
             
@@ -12570,7 +13413,9 @@ class Engine:
 
 
 async def main():
+    startup = StartupTimeline()
     config = load_config()
+    startup.mark("load_config")
     # Initialize structured logging according to YAML-configured level (default INFO)
     try:
         level_name = str(getattr(getattr(config, 'logging', None), 'level', 'info')).upper()
@@ -12593,7 +13438,7 @@ async def main():
     
     logger.info("✅ Configuration validation passed")
     
-    engine = Engine(config)
+    engine = Engine(config, startup=startup)
 
     shutdown_event = asyncio.Event()
     loop = asyncio.get_event_loop()
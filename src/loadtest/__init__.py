@@ -0,0 +1,24 @@
+"""
+Call load generator and replay harness.
+
+Drives a real ``Engine`` with N simultaneous simulated calls and no Asterisk: a fake
+ARI server (REST + events WebSocket), simulated AudioSocket and ExternalMedia RTP
+legs, and a scripted local STT/LLM/TTS server. Reports turn latency percentiles,
+pacing jitter, dropped frames and engine CPU/memory. See
+``scripts/benchmarks/bench_call_load.py`` for the command-line entry point.
+"""
+
+from .fake_ari import FakeAsterisk, MediaLeg
+from .fake_local_ai import AgentScript, ScriptedLocalAI
+from .harness import LoadScenario, compare_reports, format_report, run_load
+
+__all__ = [
+    'AgentScript',
+    'FakeAsterisk',
+    'LoadScenario',
+    'MediaLeg',
+    'ScriptedLocalAI',
+    'compare_reports',
+    'format_report',
+    'run_load',
+]
@@ -0,0 +1,87 @@
+"""
+Caller and agent audio for the load harness.
+
+Everything on the simulated wire is 8 kHz mono PCM16 (AudioSocket ``slin``) or
+µ-law (RTP), in 20 ms frames. Caller turns are either replayed from recordings
+(any WAV; converted to 8 kHz mono PCM16) or synthesized from a seed, so a run is
+reproducible without shipping audio files.
+"""
+
+from __future__ import annotations
+
+import audioop
+import math
+import random
+import wave
+from typing import List, Sequence
+
+SAMPLE_RATE = 8000
+FRAME_MS = 20
+FRAME_SAMPLES = SAMPLE_RATE * FRAME_MS // 1000
+FRAME_BYTES = FRAME_SAMPLES * 2  # PCM16
+
+# A frame whose RMS is above this counts as speech (caller turns and agent replies
+# are generated well above it; digital silence and comfort noise stay below).
+VOICED_RMS = 300
+
+
+def silence(ms: int) -> bytes:
+    return b"\x00" * (SAMPLE_RATE * ms // 1000 * 2)
+
+
+def tone(ms: int, freq: float = 440.0, amplitude: int = 6000) -> bytes:
+    samples = SAMPLE_RATE * ms // 1000
+    step = 2.0 * math.pi * freq / SAMPLE_RATE
+    return b"".join(
+        int(amplitude * math.sin(step * n)).to_bytes(2, "little", signed=True) for n in range(samples)
+    )
+
+
+def synthetic_utterance(ms: int, seed: int) -> bytes:
+    """Speech-like PCM16: a few seeded partials under a syllable-rate envelope."""
+    rng = random.Random(seed)
+    partials = [(rng.uniform(110.0, 240.0) * k, rng.uniform(0.3, 1.0) / k) for k in (1, 2, 3)]
+    syllable_hz = rng.uniform(3.0, 5.0)
+    samples = SAMPLE_RATE * ms // 1000
+    out = bytearray()
+    for n in range(samples):
+        t = n / SAMPLE_RATE
+        envelope = 0.55 + 0.45 * math.sin(2.0 * math.pi * syllable_hz * t)
+        value = sum(gain * math.sin(2.0 * math.pi * freq * t) for freq, gain in partials)
+        out += int(4500 * envelope * value).to_bytes(2, "little", signed=True)
+    return bytes(out)
+
+
+def load_wav(path: str) -> bytes:
+    """Read a WAV file as 8 kHz mono PCM16."""
+    with wave.open(path, "rb") as wav:
+        channels, width, rate = wav.getnchannels(), wav.getsampwidth(), wav.getframerate()
+        pcm = wav.readframes(wav.getnframes())
+    if width != 2:
+        pcm = audioop.lin2lin(pcm, width, 2)
+    if channels == 2:
+        pcm = audioop.tomono(pcm, 2, 0.5, 0.5)
+    elif channels != 1:
+        raise ValueError(f"{path}: {channels}-channel audio is not supported")
+    if rate != SAMPLE_RATE:
+        pcm, _ = audioop.ratecv(pcm, 2, 1, rate, SAMPLE_RATE, None)
+    return pcm
+
+
+def caller_turns(paths: Sequence[str] = (), *, turns: int = 3, utterance_ms: int = 1200, seed: int = 0) -> List[bytes]:
+    """One PCM16 buffer per caller turn: the given recordings, or seeded synthetic speech."""
+    if paths:
+        return [load_wav(path) for path in paths]
+    return [synthetic_utterance(utterance_ms, seed * 1000 + turn) for turn in range(turns)]
+
+
+def split_frames(pcm: bytes, frame_bytes: int = FRAME_BYTES) -> List[bytes]:
+    """Fixed-size frames; the last one is zero-padded."""
+    frames = [pcm[i : i + frame_bytes] for i in range(0, len(pcm), frame_bytes)]
+    if frames and len(frames[-1]) < frame_bytes:
+        frames[-1] = frames[-1] + b"\x00" * (frame_bytes - len(frames[-1]))
+    return frames
+
+
+def is_voiced(pcm16: bytes) -> bool:
+    return bool(pcm16) and audioop.rms(pcm16, 2) > VOICED_RMS
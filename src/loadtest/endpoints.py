@@ -0,0 +1,208 @@
+"""
+Simulated Asterisk media legs for the load harness.
+
+``AudioSocketLeg`` is the TCP client Asterisk's AudioSocket channel opens to the
+engine (UUID handshake, then TLV audio frames); ``RTPLeg`` is the UDP peer of an
+ExternalMedia channel. Both carry 20 ms caller frames towards the engine and time
+every agent frame that comes back, which is what turn latency, pacing jitter and
+dropped-frame figures are computed from.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import audioop
+import random
+import struct
+import uuid
+from typing import Any, List, Optional, Tuple
+
+from .audio import SAMPLE_RATE, VOICED_RMS
+from .fake_ari import MediaLeg
+
+TYPE_TERMINATE = 0x00
+TYPE_UUID = 0x01
+TYPE_AUDIO = 0x10
+
+# Agent frames further apart than this belong to different bursts (replies).
+_BURST_GAP_SEC = 0.2
+
+
+class _Leg:
+    """Wire codec, agent-audio accounting and waiting helpers shared by both legs."""
+
+    def __init__(self, leg: MediaLeg) -> None:
+        self.leg = leg
+        codec = (leg.codec or "slin").lower()
+        self.ulaw = codec in ("ulaw", "mulaw", "g711_ulaw")
+        self.closed = asyncio.Event()
+        self.agent_voiced_ms = 0.0
+        self.jitter_ms: List[float] = []
+        self.bursts: List[float] = []  # arrival time of the first frame of each agent burst
+        self._last_voiced_at: Optional[float] = None
+        self._last_frame_at: Optional[float] = None
+        self._last_frame_ms = 0.0
+        self._voiced = asyncio.Event()
+
+    # -- caller -> engine ---------------------------------------------------
+
+    def encode(self, pcm16: bytes) -> bytes:
+        return audioop.lin2ulaw(pcm16, 2) if self.ulaw else pcm16
+
+    async def send(self, pcm16: bytes) -> None:
+        raise NotImplementedError
+
+    # -- engine -> caller ---------------------------------------------------
+
+    def _on_agent_audio(self, payload: bytes, now: float) -> None:
+        pcm16 = audioop.ulaw2lin(payload, 2) if self.ulaw else payload
+        frame_ms = len(pcm16) / 2 / SAMPLE_RATE * 1000.0
+        if self._last_frame_at is not None and now - self._last_frame_at < _BURST_GAP_SEC:
+            self.jitter_ms.append(abs((now - self._last_frame_at) * 1000.0 - self._last_frame_ms))
+        self._last_frame_at, self._last_frame_ms = now, frame_ms
+        if pcm16 and audioop.rms(pcm16, 2) > VOICED_RMS:
+            if self._last_voiced_at is None or now - self._last_voiced_at >= _BURST_GAP_SEC:
+                self.bursts.append(now)
+            self.agent_voiced_ms += frame_ms
+            self._last_voiced_at = now
+            self._voiced.set()
+
+    async def wait_agent_audio(self, after: float, timeout: float) -> float:
+        """Arrival time (loop clock) of the first agent burst that starts after ``after``."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while True:
+            started = next((t for t in self.bursts if t > after), None)
+            if started is not None:
+                return started
+            self._voiced.clear()
+            remaining = deadline - loop.time()
+            if remaining <= 0 or self.closed.is_set():
+                raise asyncio.TimeoutError
+            await asyncio.wait_for(self._voiced.wait(), remaining)
+
+    async def wait_agent_quiet(self, quiet_ms: int, timeout: float) -> None:
+        """Wait until no voiced agent audio has arrived for ``quiet_ms``."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        quiet = quiet_ms / 1000.0
+        while True:
+            last = self._last_voiced_at or 0.0
+            remaining = last + quiet - loop.time()
+            if remaining <= 0:
+                return
+            if loop.time() + remaining > deadline:
+                raise asyncio.TimeoutError
+            await asyncio.sleep(remaining)
+
+    async def close(self) -> None:
+        self.closed.set()
+
+
+class AudioSocketLeg(_Leg):
+    """Asterisk's side of an AudioSocket channel."""
+
+    def __init__(self, leg: MediaLeg) -> None:
+        super().__init__(leg)
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._task: Optional[asyncio.Task] = None
+
+    async def connect(self) -> None:
+        self._reader, self._writer = await asyncio.open_connection(self.leg.host, self.leg.port)
+        payload = uuid.UUID(self.leg.uuid).bytes
+        self._writer.write(bytes([TYPE_UUID]) + len(payload).to_bytes(2, "big") + payload)
+        await self._writer.drain()
+        self._task = asyncio.create_task(self._read_loop())
+
+    async def send(self, pcm16: bytes) -> None:
+        if self._writer is None or self.closed.is_set():
+            return
+        payload = self.encode(pcm16)
+        self._writer.write(bytes([TYPE_AUDIO]) + len(payload).to_bytes(2, "big") + payload)
+        await self._writer.drain()
+
+    async def _read_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            while True:
+                header = await self._reader.readexactly(3)
+                payload = await self._reader.readexactly(int.from_bytes(header[1:], "big"))
+                if header[0] == TYPE_AUDIO:
+                    self._on_agent_audio(payload, loop.time())
+                elif header[0] == TYPE_TERMINATE:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            self.closed.set()
+
+    async def close(self) -> None:
+        if self.closed.is_set() and self._writer is None:
+            return
+        self.closed.set()
+        writer, self._writer = self._writer, None
+        if writer is not None:
+            try:
+                writer.write(bytes([TYPE_TERMINATE, 0, 0]))
+                writer.close()
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+        if self._task is not None:
+            self._task.cancel()
+
+
+class _RTPProtocol(asyncio.DatagramProtocol):
+    def __init__(self, leg: "RTPLeg") -> None:
+        self.leg = leg
+
+    def datagram_received(self, data: bytes, addr: Tuple[str, int]) -> None:
+        if len(data) > 12:
+            self.leg._on_agent_audio(data[12:], asyncio.get_running_loop().time())
+
+
+class RTPLeg(_Leg):
+    """Asterisk's side of an ExternalMedia (UnicastRTP) channel."""
+
+    def __init__(self, leg: MediaLeg, seed: int = 0) -> None:
+        super().__init__(leg)
+        rng = random.Random(seed)
+        self.ssrc = rng.getrandbits(32)
+        self._seq = rng.getrandbits(16)
+        self._timestamp = rng.getrandbits(32)
+        self._transport: Optional[asyncio.DatagramTransport] = None
+        self.local_address: Optional[Tuple[str, int]] = None
+
+    async def bind(self) -> "RTPLeg":
+        loop = asyncio.get_running_loop()
+        self._transport, _ = await loop.create_datagram_endpoint(
+            lambda: _RTPProtocol(self), local_addr=("127.0.0.1", 0), remote_addr=(self.leg.host, self.leg.port)
+        )
+        self.local_address = self._transport.get_extra_info("sockname")[:2]
+        return self
+
+    async def connect(self) -> None:
+        if self._transport is None:
+            await self.bind()
+
+    async def send(self, pcm16: bytes) -> None:
+        if self._transport is None or self.closed.is_set():
+            return
+        header = struct.pack("!BBHII", 0x80, 0 if self.ulaw else 11, self._seq, self._timestamp, self.ssrc)
+        self._seq = (self._seq + 1) & 0xFFFF
+        self._timestamp = (self._timestamp + len(pcm16) // 2) & 0xFFFFFFFF
+        self._transport.sendto(header + self.encode(pcm16))
+
+    async def close(self) -> None:
+        self.closed.set()
+        if self._transport is not None:
+            self._transport.close()
+            self._transport = None
+
+
+async def open_leg(leg: MediaLeg, seed: int = 0) -> Any:
+    """``FakeAsterisk.media_factory``: the simulated endpoint for a media leg."""
+    if leg.kind == "rtp":
+        return await RTPLeg(leg, seed).bind()
+    return AudioSocketLeg(leg)
@@ -0,0 +1,355 @@
+"""
+Fake Asterisk for the load harness: ARI REST, the events websocket, and the media
+legs Asterisk would open towards the engine.
+
+Covers what the inbound call flow uses: answer, bridges, channel variables,
+AudioSocket origination and ExternalMedia channels, hangup. Anything else gets the
+reply Asterisk gives when nothing needs to happen (204, or 404 for unknown GETs)
+and is counted in ``requests`` so a run shows which ARI calls the engine made.
+
+Media legs: when the engine originates ``AudioSocket/host:port/uuid/c(codec)`` or
+creates an ExternalMedia channel, ``media_factory`` builds the simulated endpoint
+(see ``endpoints``), which connects to the engine before the channel's StasisStart
+is sent, as on a real PBX. ``media_for(caller)`` returns the endpoint once the
+engine has bridged it with that caller.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+from aiohttp import web
+
+
+@dataclass
+class MediaLeg:
+    kind: str  # "audiosocket" | "rtp"
+    channel_id: str
+    host: str
+    port: int
+    codec: str
+    uuid: str = ""
+
+
+@dataclass
+class _Channel:
+    id: str
+    name: str
+    variables: Dict[str, str] = field(default_factory=dict)
+    caller_number: str = ""
+    state: str = "Ring"
+    media: Any = None
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "name": self.name,
+            "state": self.state,
+            "caller": {"name": self.caller_number, "number": self.caller_number},
+            "connected": {"name": "", "number": ""},
+            "dialplan": {"context": "from-ai-agent", "exten": "s", "priority": 1},
+            "language": "en",
+        }
+
+
+class FakeAsterisk:
+    """ARI server that answers the engine like Asterisk and hands media legs to the harness."""
+
+    def __init__(
+        self,
+        *,
+        app_name: str = "asterisk-ai-voice-agent",
+        media_factory: Optional[Callable[[MediaLeg], Awaitable[Any]]] = None,
+    ) -> None:
+        self.app_name = app_name
+        self.media_factory = media_factory
+        self.channels: Dict[str, _Channel] = {}
+        self.bridges: Dict[str, Set[str]] = {}
+        self.requests: Counter = Counter()
+        self.hangups: Counter = Counter()
+        self.port: Optional[int] = None
+        self._subscribers: List[Tuple[Set[str], web.WebSocketResponse]] = []
+        self._connected = asyncio.Event()
+        self._media_waiters: Dict[str, asyncio.Future] = {}
+        self._next_id = 0
+        self._epoch = int(time.time())
+        self._runner: Optional[web.AppRunner] = None
+        self._tasks: Set[asyncio.Task] = set()
+
+    # -- lifecycle -----------------------------------------------------------
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> int:
+        app = web.Application()
+        app.router.add_get("/ari/asterisk/info", self._info)
+        app.router.add_get("/ari/events", self._events)
+        app.router.add_post("/ari/channels", self._originate)
+        app.router.add_post("/ari/channels/externalMedia", self._external_media)
+        app.router.add_get("/ari/channels/{id}", self._get_channel)
+        app.router.add_delete("/ari/channels/{id}", self._hangup)
+        app.router.add_get("/ari/channels/{id}/variable", self._get_variable)
+        app.router.add_post("/ari/channels/{id}/variable", self._set_variable)
+        app.router.add_post("/ari/bridges", self._create_bridge)
+        app.router.add_post("/ari/bridges/{id}/addChannel", self._add_to_bridge)
+        app.router.add_post("/ari/bridges/{id}/removeChannel", self._remove_from_bridge)
+        app.router.add_delete("/ari/bridges/{id}", self._destroy_bridge)
+        app.router.add_route("*", "/ari/{tail:.*}", self._fallback)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        self.port = site._server.sockets[0].getsockname()[1]
+        return self.port
+
+    async def stop(self) -> None:
+        for task in list(self._tasks):
+            task.cancel()
+        for _, ws in list(self._subscribers):
+            await ws.close()
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def wait_connected(self, timeout: float) -> None:
+        """Wait for the engine's events websocket."""
+        await asyncio.wait_for(self._connected.wait(), timeout)
+
+    # -- calls ---------------------------------------------------------------
+
+    async def place_call(self, caller_number: str, variables: Optional[Dict[str, str]] = None) -> str:
+        """An inbound PJSIP call entering the app, like the dialplan's Stasis()."""
+        channel = self._new_channel(f"PJSIP/loadgen-{caller_number}", caller_number=caller_number)
+        channel.variables.update(variables or {})
+        self._media_waiters[channel.id] = asyncio.get_running_loop().create_future()
+        await self._emit("StasisStart", channel, application=self.app_name, args=[])
+        return channel.id
+
+    async def media_for(self, caller_id: str, timeout: float) -> Any:
+        """The media endpoint the engine bridged with this caller."""
+        return await asyncio.wait_for(asyncio.shield(self._media_waiters[caller_id]), timeout)
+
+    async def hangup_call(self, channel_id: str) -> None:
+        """The caller hangs up."""
+        channel = self.channels.get(channel_id)
+        if channel is not None:
+            await self._destroy(channel, cause=16)
+
+    # -- ARI handlers --------------------------------------------------------
+
+    async def _info(self, request: web.Request) -> web.Response:
+        self._count(request, "asterisk/info")
+        return web.json_response({"system": {"version": "loadgen", "entity_id": "fake"}})
+
+    async def _events(self, request: web.Request) -> web.WebSocketResponse:
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        entry = (set(request.query.get("app", "").split(",")), ws)
+        self._subscribers.append(entry)
+        self._connected.set()
+        try:
+            async for _ in ws:
+                pass
+        finally:
+            self._subscribers.remove(entry)
+            if not self._subscribers:
+                self._connected.clear()
+        return ws
+
+    async def _originate(self, request: web.Request) -> web.Response:
+        self._count(request, "channels")
+        body = await self._body(request)
+        endpoint = request.query.get("endpoint", "")
+        app = request.query.get("app", self.app_name)
+        if not endpoint.startswith("AudioSocket/"):
+            channel = self._new_channel(f"{endpoint.split('@')[0]}-{self._next_id:08x}")
+            channel.variables.update(body.get("variables") or body.get("channelVars") or {})
+            return web.json_response(channel.to_json())
+        # AudioSocket/<host>:<port>/<uuid>/c(<codec>)
+        target, audio_uuid, *rest = endpoint[len("AudioSocket/") :].split("/")
+        host, _, port = target.rpartition(":")
+        codec = rest[0][2:-1] if rest and rest[0].startswith("c(") else "slin"
+        channel = self._new_channel(f"AudioSocket/{target}-{audio_uuid}")
+        channel.variables.update(body.get("channelVars") or {})
+        leg = MediaLeg("audiosocket", channel.id, host, int(port), codec, uuid=audio_uuid)
+        self._spawn(self._connect_leg(channel, leg, app))
+        return web.json_response(channel.to_json())
+
+    async def _external_media(self, request: web.Request) -> web.Response:
+        self._count(request, "channels/externalMedia")
+        body = await self._body(request)
+        params = {**request.query, **body}
+        host, _, port = str(params.get("external_host", "")).rpartition(":")
+        channel = self._new_channel(f"UnicastRTP/{host}:{port}-{self._next_id:08x}")
+        leg = MediaLeg("rtp", channel.id, host, int(port), str(params.get("format") or "ulaw"))
+        channel.media = await self._build_media(leg)
+        local = getattr(channel.media, "local_address", None) or ("127.0.0.1", 0)
+        channel.variables.update({"UNICASTRTP_LOCAL_ADDRESS": local[0], "UNICASTRTP_LOCAL_PORT": str(local[1])})
+        self._spawn(self._connect_leg(channel, leg, str(params.get("app") or self.app_name)))
+        payload = channel.to_json()
+        payload["channelvars"] = dict(channel.variables)
+        return web.json_response(payload)
+
+    async def _get_channel(self, request: web.Request) -> web.Response:
+        self._count(request, "channels/{id}")
+        channel = self.channels.get(request.match_info["id"])
+        if channel is None:
+            return web.json_response({"message": "Channel not found"}, status=404)
+        return web.json_response(channel.to_json())
+
+    async def _hangup(self, request: web.Request) -> web.Response:
+        self._count(request, "channels/{id}")
+        channel = self.channels.get(request.match_info["id"])
+        if channel is None:
+            return web.json_response({"message": "Channel not found"}, status=404)
+        self.hangups[channel.id] += 1
+        self._spawn(self._destroy(channel, cause=16))
+        return web.Response(status=204)
+
+    async def _get_variable(self, request: web.Request) -> web.Response:
+        self._count(request, "channels/{id}/variable")
+        channel = self.channels.get(request.match_info["id"])
+        value = channel.variables.get(request.query.get("variable", "")) if channel else None
+        if value is None:
+            return web.json_response({"message": "Provided variable was not found"}, status=404)
+        return web.json_response({"value": value})
+
+    async def _set_variable(self, request: web.Request) -> web.Response:
+        self._count(request, "channels/{id}/variable")
+        channel = self.channels.get(request.match_info["id"])
+        if channel is None:
+            return web.json_response({"message": "Channel not found"}, status=404)
+        params = {**request.query, **(await self._body(request))}
+        channel.variables[str(params.get("variable", ""))] = str(params.get("value", ""))
+        return web.Response(status=204)
+
+    async def _create_bridge(self, request: web.Request) -> web.Response:
+        self._count(request, "bridges")
+        self._next_id += 1
+        bridge_id = f"loadgen-bridge-{self._next_id}"
+        self.bridges[bridge_id] = set()
+        return web.json_response({"id": bridge_id, "technology": "simple_bridge", "channels": []})
+
+    async def _add_to_bridge(self, request: web.Request) -> web.Response:
+        self._count(request, "bridges/{id}/addChannel")
+        members = self.bridges.get(request.match_info["id"])
+        params = {**request.query, **(await self._body(request))}
+        channel_id = str(params.get("channel", ""))
+        if members is None or channel_id not in self.channels:
+            return web.json_response({"message": "Bridge or channel not found"}, status=404)
+        members.add(channel_id)
+        self._match_media(members)
+        return web.Response(status=204)
+
+    async def _remove_from_bridge(self, request: web.Request) -> web.Response:
+        self._count(request, "bridges/{id}/removeChannel")
+        params = {**request.query, **(await self._body(request))}
+        self.bridges.get(request.match_info["id"], set()).discard(str(params.get("channel", "")))
+        return web.Response(status=204)
+
+    async def _destroy_bridge(self, request: web.Request) -> web.Response:
+        self._count(request, "bridges/{id}")
+        self.bridges.pop(request.match_info["id"], None)
+        return web.Response(status=204)
+
+    async def _fallback(self, request: web.Request) -> web.Response:
+        parts = request.match_info["tail"].split("/")
+        # channels/<id>/answer -> channels/{id}/answer, so counts group by operation
+        template = "/".join("{id}" if i == 1 and len(parts) > 1 else part for i, part in enumerate(parts))
+        self._count(request, template)
+        if request.method == "GET":
+            return web.json_response({"message": "Not found"}, status=404)
+        if parts[-1] in ("play", "record", "snoop"):
+            self._next_id += 1
+            return web.json_response({"id": f"loadgen-{parts[-1]}-{self._next_id}"}, status=201)
+        if len(parts) >= 3 and parts[0] == "channels" and parts[2] == "answer":
+            channel = self.channels.get(parts[1])
+            if channel is not None:
+                channel.state = "Up"
+        return web.Response(status=204)
+
+    # -- internals -----------------------------------------------------------
+
+    def _new_channel(self, name: str, *, caller_number: str = "") -> _Channel:
+        self._next_id += 1
+        channel = _Channel(id=f"{self._epoch}.{self._next_id}", name=name, caller_number=caller_number)
+        self.channels[channel.id] = channel
+        return channel
+
+    async def _build_media(self, leg: MediaLeg) -> Any:
+        if self.media_factory is None:
+            return None
+        return await self.media_factory(leg)
+
+    async def _connect_leg(self, channel: _Channel, leg: MediaLeg, app: str) -> None:
+        if channel.media is None:
+            channel.media = await self._build_media(leg)
+        connect = getattr(channel.media, "connect", None)
+        if connect is not None:
+            await connect()
+        channel.state = "Up"
+        if channel.id in self.channels:
+            await self._emit("StasisStart", channel, application=app, args=[])
+
+    def _match_media(self, members: Set[str]) -> None:
+        media = next((self.channels[c].media for c in members if self.channels[c].media is not None), None)
+        if media is None:
+            return
+        for channel_id in members:
+            waiter = self._media_waiters.get(channel_id)
+            if waiter is not None and not waiter.done():
+                waiter.set_result(media)
+
+    async def _destroy(self, channel: _Channel, *, cause: int) -> None:
+        if self.channels.pop(channel.id, None) is None:
+            return
+        waiter = self._media_waiters.pop(channel.id, None)
+        if waiter is not None and not waiter.done():
+            waiter.cancel()
+        for members in self.bridges.values():
+            members.discard(channel.id)
+        if channel.media is not None:
+            await channel.media.close()
+        channel.state = "Down"
+        await self._emit("ChannelHangupRequest", channel, cause=cause)
+        await self._emit("StasisEnd", channel, application=self.app_name)
+        await self._emit("ChannelDestroyed", channel, cause=cause, cause_txt="Normal Clearing")
+
+    async def _emit(self, event_type: str, channel: _Channel, **fields: Any) -> None:
+        event = {
+            "type": event_type,
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S.000+0000", time.gmtime()),
+            "channel": channel.to_json(),
+            "asterisk_id": "loadgen",
+            **fields,
+        }
+        message = json.dumps(event)
+        application = fields.get("application")
+        for apps, ws in list(self._subscribers):
+            if application and application not in apps:
+                continue
+            try:
+                await ws.send_str(message)
+            except ConnectionError:
+                pass
+
+    def _spawn(self, coro: Awaitable[Any]) -> None:
+        task = asyncio.ensure_future(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def _count(self, request: web.Request, template: str) -> None:
+        self.requests[f"{request.method} {template}"] += 1
+
+    @staticmethod
+    async def _body(request: web.Request) -> Dict[str, Any]:
+        if not request.can_read_body:
+            return {}
+        try:
+            body = await request.json()
+        except (ValueError, json.JSONDecodeError):
+            return {}
+        return body if isinstance(body, dict) else {}
@@ -0,0 +1,267 @@
+"""
+Scripted stand-in for local_ai_server (``mode: full``) for the load harness.
+
+Speaks the same WebSocket protocol as the real server, including auth, binary
+frame negotiation and multiplexing (so the engine's shared pool runs its normal
+path), but replaces the models with a script:
+
+- STT: energy endpointing. A caller turn ends once ``endpoint_ms`` of silence has
+  been received after it; ``stt_ms`` later the server sends a final ``stt_result``.
+- LLM: after ``llm_ms`` a canned ``llm_response``.
+- TTS: after ``tts_ms`` a ``reply_ms`` tone as µ-law 8 kHz; greetings (``tts_request``)
+  get a ``greeting_ms`` tone.
+
+Delays are fixed, so whatever the caller measures beyond ``AgentScript.turn_ms`` is
+the engine's own latency.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import audioop
+import base64
+import json
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+from websockets.asyncio.server import serve
+from websockets.exceptions import ConnectionClosed
+
+from ..audio.local_ai_frames import (
+    FRAME_FLAG_END,
+    FRAME_FLAG_RESPONSE,
+    FRAME_KIND_AUDIO,
+    FRAME_KIND_TTS_AUDIO,
+    call_hash,
+    decode_frame,
+    encode_frame,
+)
+from .audio import VOICED_RMS, tone
+
+_STT_RATE = 16000
+_STT_CHUNK = _STT_RATE * 20 // 1000 * 2  # 20 ms of PCM16 @ 16 kHz
+
+
+@dataclass
+class AgentScript:
+    endpoint_ms: int = 300
+    min_speech_ms: int = 100
+    stt_ms: int = 60
+    llm_ms: int = 250
+    tts_ms: int = 120
+    reply_ms: int = 1500
+    greeting_ms: int = 1000
+
+    @property
+    def turn_ms(self) -> int:
+        """Scripted part of a turn: end of caller speech to the first agent audio byte."""
+        return self.endpoint_ms + self.stt_ms + self.llm_ms + self.tts_ms
+
+
+class _Call:
+    def __init__(self, call_id: str, ws: Any) -> None:
+        self.call_id = call_id
+        self.ws = ws
+        self.voiced_ms = 0
+        self.silent_ms = 0
+        self.turns = 0
+        self.reply: Optional[asyncio.Task] = None
+
+
+class _Connection:
+    def __init__(self, ws: Any) -> None:
+        self.ws = ws
+        self.frames_version: Optional[int] = None
+        self.multiplex = False
+        self.call_id: Optional[str] = None  # unframed / dedicated connections
+        self.by_hash: Dict[int, str] = {}
+        self.seq = 0
+
+
+class ScriptedLocalAI:
+    """WebSocket server answering the engine's local provider from an ``AgentScript``."""
+
+    def __init__(self, script: Optional[AgentScript] = None, *, multiplex: bool = True) -> None:
+        self.script = script or AgentScript()
+        self.multiplex = multiplex
+        self.calls: Dict[str, _Call] = {}
+        self.connections = 0
+        self.utterances = 0
+        self.replies = 0
+        self.greetings = 0
+        self._server = None
+        self._tones: Dict[int, bytes] = {}
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        self._server = await serve(self.handler, host, port, max_size=None)
+        port = self._server.sockets[0].getsockname()[1]
+        return f"ws://{host}:{port}"
+
+    async def stop(self) -> None:
+        for call in list(self.calls.values()):
+            self._end(call)
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "connections": self.connections,
+            "utterances": self.utterances,
+            "replies": self.replies,
+            "greetings": self.greetings,
+        }
+
+    # -- protocol -----------------------------------------------------------
+
+    async def handler(self, ws: Any) -> None:
+        self.connections += 1
+        conn = _Connection(ws)
+        try:
+            async for raw in ws:
+                if isinstance(raw, bytes):
+                    self._on_frame(conn, raw)
+                else:
+                    await self._on_message(conn, json.loads(raw))
+        except ConnectionClosed:
+            pass
+        finally:
+            for call in [c for c in self.calls.values() if c.ws is ws]:
+                self._end(call)
+
+    async def _on_message(self, conn: _Connection, msg: Dict[str, Any]) -> None:
+        kind = msg.get("type")
+        call_id = msg.get("call_id")
+        if call_id and not conn.multiplex:
+            conn.call_id = call_id
+        if kind == "auth":
+            await conn.ws.send(json.dumps({"type": "auth_response", "status": "ok"}))
+        elif kind == "negotiate":
+            conn.frames_version = 1
+            conn.multiplex = self.multiplex and bool(msg.get("multiplex"))
+            await conn.ws.send(
+                json.dumps(
+                    {
+                        "type": "negotiate_response",
+                        "binary_frames": {"version": 1, "codecs": ["pcm16le", "mulaw"], "header_bytes": 16},
+                        "multiplex": conn.multiplex,
+                    }
+                )
+            )
+        elif kind == "status":
+            await conn.ws.send(json.dumps({"type": "status_response", "status": "healthy"}))
+        elif kind == "set_mode":
+            if call_id:
+                conn.by_hash[call_hash(call_id)] = call_id
+            await conn.ws.send(json.dumps({"type": "mode_ready", "mode": msg.get("mode"), "call_id": call_id}))
+        elif kind == "audio" and call_id:
+            self._on_audio(conn, call_id, base64.b64decode(msg.get("data") or ""))
+        elif kind == "tts_request":
+            asyncio.create_task(self._greet(conn, call_id or conn.call_id or "", msg.get("text") or ""))
+        elif kind == "barge_in" and call_id in self.calls:
+            reply = self.calls[call_id].reply
+            if reply is not None:
+                reply.cancel()
+        elif kind == "call_end" and call_id in self.calls:
+            self._end(self.calls[call_id])
+
+    def _on_frame(self, conn: _Connection, raw: bytes) -> None:
+        try:
+            frame = decode_frame(raw)
+        except ValueError:
+            return
+        if frame.kind != FRAME_KIND_AUDIO:
+            return
+        call_id = conn.by_hash.get(frame.call_hash) or conn.call_id
+        if call_id:
+            self._on_audio(conn, call_id, frame.payload)
+
+    # -- scripted STT/LLM/TTS -----------------------------------------------
+
+    def _on_audio(self, conn: _Connection, call_id: str, pcm16k: bytes) -> None:
+        call = self.calls.get(call_id)
+        if call is None:
+            call = self.calls[call_id] = _Call(call_id, conn.ws)
+        call.ws = conn.ws
+        # Endpointing runs on audio time, not arrival time: the engine batches upstream
+        # audio, and a turn must end on ``endpoint_ms`` of received silence.
+        for offset in range(0, len(pcm16k) - _STT_CHUNK + 1, _STT_CHUNK):
+            if audioop.rms(pcm16k[offset : offset + _STT_CHUNK], 2) > VOICED_RMS:
+                call.voiced_ms += 20
+                call.silent_ms = 0
+            elif call.voiced_ms:
+                call.silent_ms += 20
+                if call.silent_ms >= self.script.endpoint_ms:
+                    self._endpoint(conn, call)
+
+    def _endpoint(self, conn: _Connection, call: _Call) -> None:
+        if call.voiced_ms >= self.script.min_speech_ms:
+            self.utterances += 1
+            call.turns += 1
+            call.reply = asyncio.create_task(self._reply(conn, call, call.turns))
+        call.voiced_ms = 0
+        call.silent_ms = 0
+
+    async def _reply(self, conn: _Connection, call: _Call, turn: int) -> None:
+        script = self.script
+        try:
+            await asyncio.sleep(script.stt_ms / 1000.0)
+            await self._send_json(call, {"type": "stt_result", "text": f"caller turn {turn}", "is_final": True})
+            await asyncio.sleep(script.llm_ms / 1000.0)
+            await self._send_json(call, {"type": "llm_response", "text": f"Scripted reply {turn}."})
+            await asyncio.sleep(script.tts_ms / 1000.0)
+            audio = self._tone(script.reply_ms)
+            if conn.frames_version is None:
+                await call.ws.send(audio)
+            else:
+                await call.ws.send(self._frame(conn, call.call_id, audio, FRAME_FLAG_END))
+            self.replies += 1
+        except (ConnectionClosed, asyncio.CancelledError):
+            pass
+
+    async def _greet(self, conn: _Connection, call_id: str, text: str) -> None:
+        await asyncio.sleep(self.script.tts_ms / 1000.0)
+        audio = self._tone(self.script.greeting_ms)
+        response: Dict[str, Any] = {
+            "type": "tts_response",
+            "text": text,
+            "call_id": call_id,
+            "encoding": "mulaw",
+            "sample_rate_hz": 8000,
+            "byte_length": len(audio),
+        }
+        try:
+            if conn.frames_version is None:
+                response["audio_data"] = base64.b64encode(audio).decode("ascii")
+            else:
+                response["audio_transport"] = "frame"
+                response["frame_seq"] = conn.seq
+                await conn.ws.send(self._frame(conn, call_id, audio, FRAME_FLAG_END | FRAME_FLAG_RESPONSE))
+            await conn.ws.send(json.dumps(response))
+            self.greetings += 1
+        except ConnectionClosed:
+            pass
+
+    async def _send_json(self, call: _Call, payload: Dict[str, Any]) -> None:
+        payload["call_id"] = call.call_id
+        payload["mode"] = "full"
+        await call.ws.send(json.dumps(payload))
+
+    def _frame(self, conn: _Connection, call_id: str, audio: bytes, flags: int) -> bytes:
+        seq = conn.seq
+        conn.seq = (seq + 1) & 0xFFFFFFFF
+        return encode_frame(
+            FRAME_KIND_TTS_AUDIO, audio, call_hash=call_hash(call_id), seq=seq, codec="mulaw", rate_hz=8000, flags=flags
+        )
+
+    def _tone(self, ms: int) -> bytes:
+        audio = self._tones.get(ms)
+        if audio is None:
+            audio = self._tones[ms] = audioop.lin2ulaw(tone(ms), 2)
+        return audio
+
+    def _end(self, call: _Call) -> None:
+        self.calls.pop(call.call_id, None)
+        if call.reply is not None and not call.reply.done():
+            call.reply.cancel()
@@ -0,0 +1,474 @@
+"""
+Load harness: N simulated callers against a real engine process, no Asterisk needed.
+
+``run_load(scenario)`` starts the scripted local AI server and the fake Asterisk in
+this process, the engine (``Engine`` with the scenario's config, patched to point at
+the fakes) in a child process, and then places ``scenario.calls`` inbound calls at
+a fixed arrival interval. Each simulated caller waits out the greeting, then plays
+its turns: caller audio paced at 20 ms, measure the time from the last caller frame
+to the first agent frame, wait for the agent to finish, next turn. Silence is sent
+between turns like a real trunk.
+
+Everything that shapes timing is fixed by the scenario (audio, seed, arrival
+interval, scripted AI delays), so two runs of the same scenario on the same box are
+comparable and ``compare_reports`` can flag a regression against a saved baseline.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import collections
+import multiprocessing
+import os
+import signal
+import socket
+import tempfile
+from dataclasses import asdict, dataclass, field
+from typing import Any, Deque, Dict, List, Optional, Sequence, Tuple
+
+import yaml
+
+from .audio import FRAME_MS, caller_turns, silence, split_frames
+from .endpoints import open_leg
+from .fake_ari import FakeAsterisk
+from .fake_local_ai import AgentScript, ScriptedLocalAI
+
+_SILENCE_FRAME = silence(FRAME_MS)
+_AGENT_QUIET_MS = 400
+_ARI_USER = "loadgen"
+_CONTEXT = "loadgen"
+
+
+@dataclass
+class LoadScenario:
+    calls: int = 10
+    transport: str = "audiosocket"  # audiosocket | externalmedia
+    turns: int = 3
+    audio: Sequence[str] = ()  # one WAV per caller turn; seeded synthetic speech when empty
+    utterance_ms: int = 1200
+    arrival_ms: int = 100  # gap between call arrivals
+    seed: int = 0
+    config_path: str = "config/ai-agent.example.yaml"
+    script: AgentScript = field(default_factory=AgentScript)
+    turn_timeout_sec: float = 15.0
+    startup_timeout_sec: float = 60.0
+    engine_log_level: str = "ERROR"
+
+
+@dataclass
+class CallResult:
+    index: int
+    first_audio_ms: Optional[float] = None
+    turn_ms: List[float] = field(default_factory=list)
+    jitter_ms: List[float] = field(default_factory=list)
+    agent_audio_ms: float = 0.0
+    expected_agent_audio_ms: float = 0.0
+    late_caller_frames: int = 0
+    timeouts: int = 0
+    error: Optional[str] = None
+
+
+# ---------------------------------------------------------------------------
+# Engine child process
+# ---------------------------------------------------------------------------
+
+
+def _run_engine(config_path: str, env: Dict[str, str], log_level: str, workdir: str) -> None:
+    os.environ.update(env)
+
+    import logging
+
+    from ..config import load_config
+    from ..engine import Engine
+    from ..logging_config import configure_logging
+
+    # Relative state paths (e.g. the learned provider pattern cache under data/) land in
+    # the run's scratch directory, so every run starts cold and the repo stays clean.
+    os.chdir(workdir)
+
+    async def serve() -> None:
+        config = load_config(config_path)
+        configure_logging(log_level=getattr(logging, log_level.upper(), logging.ERROR))
+        engine = Engine(config)
+        stopping = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, stopping.set)
+        service = loop.create_task(engine.start())
+        await stopping.wait()
+        await engine.stop(graceful_timeout=2.0)
+        service.cancel()
+
+    asyncio.run(serve())
+
+
+class EngineProcess:
+    """The engine under test, in its own process so its CPU and memory are its own."""
+
+    def __init__(self, config_path: str, env: Dict[str, str], workdir: str, log_level: str = "ERROR") -> None:
+        self._args = (config_path, env, log_level, workdir)
+        self.process: Optional[multiprocessing.process.BaseProcess] = None
+
+    @property
+    def pid(self) -> Optional[int]:
+        return self.process.pid if self.process is not None else None
+
+    def start(self) -> None:
+        self.process = multiprocessing.get_context("spawn").Process(
+            target=_run_engine, args=self._args, name="loadgen-engine", daemon=True
+        )
+        self.process.start()
+
+    def stop(self, timeout: float = 10.0) -> None:
+        if self.process is None or not self.process.is_alive():
+            return
+        os.kill(self.process.pid, signal.SIGTERM)
+        self.process.join(timeout)
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join()
+
+    def cpu_seconds(self) -> Optional[float]:
+        """User + system CPU time from /proc (None off Linux or once the process is gone)."""
+        try:
+            with open(f"/proc/{self.pid}/stat") as fh:
+                fields = fh.read().rsplit(")", 1)[1].split()
+        except OSError:
+            return None
+        return (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+
+    def memory_mb(self) -> Dict[str, float]:
+        """Current (VmRSS) and peak (VmHWM) resident set size in MB."""
+        usage: Dict[str, float] = {}
+        try:
+            with open(f"/proc/{self.pid}/status") as fh:
+                for line in fh:
+                    key, _, value = line.partition(":")
+                    if key in ("VmRSS", "VmHWM"):
+                        usage[key] = int(value.split()[0]) / 1024.0
+        except OSError:
+            pass
+        return usage
+
+
+# ---------------------------------------------------------------------------
+# Simulated caller
+# ---------------------------------------------------------------------------
+
+
+class _CallerPacer:
+    """Sends one 20 ms frame per tick: queued caller speech, otherwise silence."""
+
+    def __init__(self, leg: Any) -> None:
+        self.leg = leg
+        self.late_frames = 0
+        self._queue: Deque[Tuple[bytes, Optional[asyncio.Future]]] = collections.deque()
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+    async def speak(self, pcm16: bytes) -> float:
+        """Queue a turn; returns when its last frame went out (loop clock)."""
+        frames = split_frames(pcm16)
+        done = asyncio.get_running_loop().create_future()
+        for frame in frames[:-1]:
+            self._queue.append((frame, None))
+        self._queue.append((frames[-1], done))
+        return await done
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        interval = FRAME_MS / 1000.0
+        deadline = loop.time()
+        while not self.leg.closed.is_set():
+            frame, done = self._queue.popleft() if self._queue else (_SILENCE_FRAME, None)
+            await self.leg.send(frame)
+            if done is not None and not done.done():
+                done.set_result(loop.time())
+            deadline += interval
+            delay = deadline - loop.time()
+            if delay < -interval:
+                self.late_frames += 1
+            await asyncio.sleep(max(0.0, delay))
+
+
+async def _run_call(
+    index: int,
+    fake: FakeAsterisk,
+    turns: List[bytes],
+    scenario: LoadScenario,
+    start_at: float,
+) -> CallResult:
+    loop = asyncio.get_running_loop()
+    result = CallResult(index)
+    await asyncio.sleep(max(0.0, start_at - loop.time()))
+    placed = loop.time()
+    caller_id = await fake.place_call(f"1555{index:06d}", {"AI_CONTEXT": _CONTEXT})
+    timeout = scenario.turn_timeout_sec
+    script = scenario.script
+    try:
+        leg = await fake.media_for(caller_id, timeout)
+    except asyncio.TimeoutError:
+        result.error = "no media leg"
+        await fake.hangup_call(caller_id)
+        return result
+
+    pacer = _CallerPacer(leg)
+    pacer.start()
+    try:
+        greeted = await leg.wait_agent_audio(placed, timeout)
+        result.first_audio_ms = (greeted - placed) * 1000.0
+        result.expected_agent_audio_ms += script.greeting_ms
+        await leg.wait_agent_quiet(_AGENT_QUIET_MS, timeout)
+        for turn in range(scenario.turns):
+            ended = await pacer.speak(turns[(index + turn) % len(turns)])
+            answered = await leg.wait_agent_audio(ended, timeout)
+            result.turn_ms.append((answered - ended) * 1000.0)
+            result.expected_agent_audio_ms += script.reply_ms
+            await leg.wait_agent_quiet(_AGENT_QUIET_MS, timeout)
+    except asyncio.TimeoutError:
+        result.timeouts += 1
+        result.error = "agent audio timeout"
+    finally:
+        await pacer.stop()
+        await fake.hangup_call(caller_id)
+    result.jitter_ms = list(leg.jitter_ms)
+    result.agent_audio_ms = leg.agent_voiced_ms
+    result.late_caller_frames = pacer.late_frames
+    return result
+
+
+# ---------------------------------------------------------------------------
+# Run + report
+# ---------------------------------------------------------------------------
+
+
+def _free_ports(count: int = 1) -> int:
+    """First port of ``count`` consecutive free TCP/UDP ports on 127.0.0.1."""
+    for _ in range(50):
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as probe:
+            probe.bind(("127.0.0.1", 0))
+            base = probe.getsockname()[1]
+        if base + count > 65535:
+            continue
+        try:
+            for port in range(base, base + count):
+                for kind in (socket.SOCK_STREAM, socket.SOCK_DGRAM):
+                    with socket.socket(socket.AF_INET, kind) as sock:
+                        sock.bind(("127.0.0.1", port))
+        except OSError:
+            continue
+        return base
+    raise RuntimeError(f"no run of {count} free ports found")
+
+
+def write_engine_config(scenario: LoadScenario, path: str, *, local_ws_url: str, media_port: int) -> None:
+    """The scenario's config with the local provider, transport and ports pointed at the fakes."""
+    with open(scenario.config_path) as fh:
+        raw = yaml.safe_load(fh) or {}
+    raw["default_provider"] = "local"
+    raw["audio_transport"] = scenario.transport
+    raw["downstream_mode"] = "stream"
+    # Cloud pipelines would need real credentials; the harness drives the local provider only.
+    raw["pipelines"] = {"default": {"options": {role: {"ws_url": local_ws_url} for role in ("stt", "llm", "tts")}}}
+    raw.pop("active_pipeline", None)
+    # The local provider only greets when the call's context carries a greeting.
+    greeting = (raw.get("llm") or {}).get("initial_greeting") or "Hello, how can I help you today?"
+    raw.setdefault("contexts", {})[_CONTEXT] = {"provider": "local", "greeting": greeting}
+    local = raw.setdefault("providers", {}).setdefault("local", {})
+    local.update({"enabled": True, "ws_url": local_ws_url})
+    raw.setdefault("audiosocket", {}).update({"host": "127.0.0.1", "port": media_port})
+    raw.setdefault("external_media", {}).update(
+        {
+            "rtp_host": "127.0.0.1",
+            "rtp_port": media_port,
+            "port_range": f"{media_port}:{media_port + scenario.calls + 4}",
+            "allowed_remote_hosts": ["127.0.0.1"],
+        }
+    )
+    with open(path, "w") as fh:
+        yaml.safe_dump(raw, fh, sort_keys=False)
+
+
+def percentiles(values: Sequence[float], points: Sequence[int] = (50, 95, 99)) -> Dict[str, Optional[float]]:
+    """Nearest-rank percentiles plus max, rounded to 0.1."""
+    if not values:
+        return {**{f"p{p}": None for p in points}, "max": None}
+    ordered = sorted(values)
+    out = {f"p{p}": round(ordered[max(0, -(-p * len(ordered) // 100) - 1)], 1) for p in points}
+    out["max"] = round(ordered[-1], 1)
+    return out
+
+
+def summarize(
+    scenario: LoadScenario,
+    results: Sequence[CallResult],
+    *,
+    wall_sec: float,
+    engine_cpu_sec: Optional[float],
+    engine_memory: Dict[str, float],
+    ari_requests: Dict[str, int],
+    local_ai: Dict[str, int],
+) -> Dict[str, Any]:
+    turn_ms = [ms for r in results for ms in r.turn_ms]
+    turn_ms_scripted = scenario.script.turn_ms
+    dropped = sum(
+        max(0, round((r.expected_agent_audio_ms - r.agent_audio_ms) / FRAME_MS)) for r in results
+    )
+    return {
+        "scenario": {
+            "calls": scenario.calls,
+            "transport": scenario.transport,
+            "turns": scenario.turns,
+            "arrival_ms": scenario.arrival_ms,
+            "seed": scenario.seed,
+            "audio": list(scenario.audio) or "synthetic",
+            "script": asdict(scenario.script),
+        },
+        "calls": {
+            "completed": sum(1 for r in results if r.error is None),
+            "failed": sum(1 for r in results if r.error is not None),
+            "errors": dict(collections.Counter(r.error for r in results if r.error)),
+        },
+        "turns": {"completed": len(turn_ms), "timeouts": sum(r.timeouts for r in results)},
+        "first_audio_ms": percentiles([r.first_audio_ms for r in results if r.first_audio_ms is not None]),
+        "turn_latency_ms": percentiles(turn_ms),
+        # Turn latency minus the scripted endpointing/STT/LLM/TTS delays: the engine's share.
+        "engine_turn_overhead_ms": percentiles([ms - turn_ms_scripted for ms in turn_ms]),
+        "pacing_jitter_ms": percentiles([ms for r in results for ms in r.jitter_ms]),
+        "dropped_frames": dropped,
+        "agent_audio_sec": round(sum(r.agent_audio_ms for r in results) / 1000.0, 2),
+        "late_caller_frames": sum(r.late_caller_frames for r in results),
+        "engine": {
+            "cpu_percent": round(100.0 * engine_cpu_sec / wall_sec, 1) if engine_cpu_sec is not None else None,
+            "rss_mb": round(engine_memory["VmRSS"], 1) if "VmRSS" in engine_memory else None,
+            "peak_rss_mb": round(engine_memory["VmHWM"], 1) if "VmHWM" in engine_memory else None,
+        },
+        "wall_sec": round(wall_sec, 2),
+        "ari_requests": dict(sorted(ari_requests.items())),
+        "local_ai": local_ai,
+    }
+
+
+async def run_load(scenario: LoadScenario) -> Dict[str, Any]:
+    """Run one scenario end to end and return its report (see ``summarize``)."""
+    if scenario.transport not in ("audiosocket", "externalmedia"):
+        raise ValueError(f"unsupported transport: {scenario.transport}")
+    loop = asyncio.get_running_loop()
+    local_ai = ScriptedLocalAI(scenario.script)
+    fake = FakeAsterisk(media_factory=lambda leg: open_leg(leg, seed=scenario.seed))
+    engine: Optional[EngineProcess] = None
+    with tempfile.TemporaryDirectory(prefix="aava-loadgen-") as tmp:
+        try:
+            local_ws_url = await local_ai.start()
+            ari_port = await fake.start()
+            config_path = os.path.join(tmp, "ai-agent.yaml")
+            write_engine_config(
+                scenario, config_path, local_ws_url=local_ws_url, media_port=_free_ports(scenario.calls + 5)
+            )
+            env = {
+                "ASTERISK_HOST": "127.0.0.1",
+                "ASTERISK_ARI_PORT": str(ari_port),
+                "ASTERISK_ARI_SCHEME": "http",
+                "ASTERISK_ARI_USERNAME": _ARI_USER,
+                "ASTERISK_ARI_PASSWORD": _ARI_USER,
+                "CALL_HISTORY_DB_PATH": os.path.join(tmp, "call_history.db"),
+                "HEALTH_BIND_HOST": "127.0.0.1",
+                "HEALTH_BIND_PORT": str(_free_ports()),
+                "LOCAL_WS_URL": local_ws_url,
+            }
+            engine = EngineProcess(config_path, env, tmp, scenario.engine_log_level)
+            engine.start()
+            await fake.wait_connected(scenario.startup_timeout_sec)
+
+            turns = caller_turns(scenario.audio, turns=scenario.turns, utterance_ms=scenario.utterance_ms, seed=scenario.seed)
+            started = loop.time()
+            cpu_before = engine.cpu_seconds()
+            results = await asyncio.gather(
+                *(
+                    _run_call(i, fake, turns, scenario, started + i * scenario.arrival_ms / 1000.0)
+                    for i in range(scenario.calls)
+                )
+            )
+            wall = loop.time() - started
+            cpu_after = engine.cpu_seconds()
+            memory = engine.memory_mb()
+            cpu = cpu_after - cpu_before if cpu_before is not None and cpu_after is not None else None
+            return summarize(
+                scenario,
+                results,
+                wall_sec=wall,
+                engine_cpu_sec=cpu,
+                engine_memory=memory,
+                ari_requests=dict(fake.requests),
+                local_ai=local_ai.stats(),
+            )
+        finally:
+            if engine is not None:
+                await loop.run_in_executor(None, engine.stop)
+            await fake.stop()
+            await local_ai.stop()
+
+
+# Metrics compared against a baseline: (report path, higher is worse).
+_REGRESSION_METRICS: Tuple[Tuple[str, ...], ...] = (
+    ("turn_latency_ms", "p95"),
+    ("engine_turn_overhead_ms", "p95"),
+    ("first_audio_ms", "p95"),
+    ("pacing_jitter_ms", "p99"),
+    ("engine", "cpu_percent"),
+    ("engine", "peak_rss_mb"),
+)
+
+
+def compare_reports(report: Dict[str, Any], baseline: Dict[str, Any], tolerance: float = 0.2) -> List[str]:
+    """Regressions of ``report`` against ``baseline``: metrics worse by more than ``tolerance``."""
+    problems: List[str] = []
+    for path in _REGRESSION_METRICS:
+        current, previous = report, baseline
+        for key in path:
+            current = (current or {}).get(key)
+            previous = (previous or {}).get(key)
+        if current is None or previous is None:
+            continue
+        # A small absolute floor keeps near-zero baselines (jitter, overhead) from flapping.
+        if current > previous * (1.0 + tolerance) + 5.0:
+            problems.append(f"{'.'.join(path)}: {previous} -> {current}")
+    for key in ("dropped_frames", "late_caller_frames"):
+        if report.get(key, 0) > baseline.get(key, 0):
+            problems.append(f"{key}: {baseline.get(key, 0)} -> {report.get(key, 0)}")
+    if report["calls"]["failed"] > baseline.get("calls", {}).get("failed", 0):
+        problems.append(f"calls.failed: {baseline['calls']['failed']} -> {report['calls']['failed']}")
+    return problems
+
+
+def format_report(report: Dict[str, Any]) -> str:
+    scenario = report["scenario"]
+    lines = [
+        f"calls={scenario['calls']} transport={scenario['transport']} turns={scenario['turns']} "
+        f"arrival={scenario['arrival_ms']}ms seed={scenario['seed']} wall={report['wall_sec']}s",
+        f"calls completed={report['calls']['completed']} failed={report['calls']['failed']} "
+        f"turns completed={report['turns']['completed']} timeouts={report['turns']['timeouts']}",
+        f"{'metric':<26} {'p50':>8} {'p95':>8} {'p99':>8} {'max':>8}",
+    ]
+    for key in ("first_audio_ms", "turn_latency_ms", "engine_turn_overhead_ms", "pacing_jitter_ms"):
+        row = report[key]
+        lines.append(
+            f"{key:<26} " + " ".join(f"{'-' if row[p] is None else row[p]:>8}" for p in ("p50", "p95", "p99", "max"))
+        )
+    engine = report["engine"]
+    lines.append(
+        f"dropped_frames={report['dropped_frames']} late_caller_frames={report['late_caller_frames']} "
+        f"agent_audio={report['agent_audio_sec']}s"
+    )
+    lines.append(f"engine cpu={engine['cpu_percent']}% rss={engine['rss_mb']}MB peak_rss={engine['peak_rss_mb']}MB")
+    return "\n".join(lines)
@@ -4,6 +4,12 @@ Structured Logging Configuration
 This module configures structured logging using the 'structlog' library.
 It sets up processors for adding timestamps, log levels, correlation IDs,
 and renders logs in JSON (default) or colorized console format based on env.
+
+Per-frame code paths log through a HotLogger (see get_hot_logger), which
+short-circuits disabled levels before any event dict is built, samples each
+callsite first-N-then-every-M per call and rate-limits it with a token bucket,
+so log volume stays bounded however many calls are active. Functions marked
+with @hot_path are checked by tests/test_hot_path_logging.py.
 """
 
 import os
@@ -13,6 +19,8 @@ import contextvars
 import uuid
 import time
 import datetime
+import weakref
+from typing import Any, Dict, Optional
 
 import structlog
 from structlog import dev as structlog_dev
@@ -146,6 +154,150 @@ def add_local_timestamp(logger, method_name, event_dict):
     event_dict["timestamp"] = datetime.datetime.now().astimezone().isoformat()
     return event_dict
 
+# Hot-path log governor defaults; configure_logging() applies LOG_HOT_PATH_* overrides.
+_HOT_PATH = {
+    "sampling": True,
+    "first": 3,
+    "every": 250,
+    "rate": 20.0,
+    "burst": 50.0,
+    # Level short-circuit is only trusted once stdlib levels are configured.
+    "level_gate": False,
+}
+# Per-callsite key tables are cleared past this size (calls not forgotten on cleanup).
+_HOT_PATH_MAX_KEYS = 4096
+_hot_loggers: "weakref.WeakSet[HotLogger]" = weakref.WeakSet()
+
+
+def hot_path(func):
+    """Mark a per-frame function: its debug/info logs must go through a HotLogger."""
+    func.__hot_path__ = True
+    return func
+
+
+class _Callsite:
+    __slots__ = ("counts", "tokens", "stamp", "emitted", "suppressed")
+
+    def __init__(self, burst: float):
+        self.counts: Dict[Any, int] = {}
+        self.tokens = burst
+        self.stamp = time.monotonic()
+        self.emitted = 0
+        self.suppressed = 0
+
+
+class HotLogger:
+    """
+    Governed structlog logger for per-frame paths.
+
+    debug/info calls are dropped before reaching structlog when the level is
+    disabled. Otherwise each callsite (event string) emits the first N calls
+    per call_id and then every M-th, within a per-callsite token bucket. The
+    next emitted line carries ``suppressed=<count>`` for what was skipped.
+    Warnings and errors are not governed; use the regular module logger.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        first: Optional[int] = None,
+        every: Optional[int] = None,
+        rate: Optional[float] = None,
+        burst: Optional[float] = None,
+    ):
+        self.name = name
+        self._log = structlog.get_logger(name)
+        self._std = logging.getLogger(name)
+        self._first = first
+        self._every = every
+        self._rate = rate
+        self._burst = burst
+        self._sites: Dict[str, _Callsite] = {}
+        _hot_loggers.add(self)
+
+    def debug(self, event: str, **kw) -> None:
+        if self._allow(logging.DEBUG, event, kw):
+            self._log.debug(event, **kw)
+
+    def info(self, event: str, **kw) -> None:
+        if self._allow(logging.INFO, event, kw):
+            self._log.info(event, **kw)
+
+    def _allow(self, level: int, event: str, kw: Dict[str, Any]) -> bool:
+        settings = _HOT_PATH
+        if settings["level_gate"] and not self._std.isEnabledFor(level):
+            return False
+        if not settings["sampling"]:
+            return True
+        burst = self._burst if self._burst is not None else settings["burst"]
+        site = self._sites.get(event)
+        if site is None:
+            site = self._sites[event] = _Callsite(burst)
+
+        key = kw.get("call_id")
+        count = site.counts.get(key, 0) + 1
+        if count == 1 and len(site.counts) >= _HOT_PATH_MAX_KEYS:
+            site.counts.clear()
+        site.counts[key] = count
+        first = self._first if self._first is not None else settings["first"]
+        every = self._every if self._every is not None else settings["every"]
+        if count > first and (every <= 0 or count % every):
+            site.suppressed += 1
+            return False
+
+        now = time.monotonic()
+        rate = self._rate if self._rate is not None else settings["rate"]
+        tokens = min(burst, site.tokens + (now - site.stamp) * rate)
+        site.stamp = now
+        if tokens < 1.0:
+            site.tokens = tokens
+            site.suppressed += 1
+            return False
+        site.tokens = tokens - 1.0
+        site.emitted += 1
+        if site.suppressed:
+            kw["suppressed"] = site.suppressed
+            site.suppressed = 0
+        return True
+
+    def forget(self, key: Any) -> None:
+        """Drop per-call sampling counters for ``key`` (e.g. a finished call_id)."""
+        for site in self._sites.values():
+            site.counts.pop(key, None)
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        return {
+            event: {"emitted": site.emitted, "suppressed": site.suppressed}
+            for event, site in self._sites.items()
+        }
+
+
+def get_hot_logger(name: str, **limits) -> HotLogger:
+    """Get a HotLogger for per-frame paths (limits override the LOG_HOT_PATH_* defaults)."""
+    return HotLogger(name, **limits)
+
+
+def forget_hot_log_key(key: Any) -> None:
+    """Release per-call sampling state in every HotLogger once a call ends."""
+    for hot_logger in list(_hot_loggers):
+        hot_logger.forget(key)
+
+
+def configure_hot_path_logging(
+    *,
+    sampling: Optional[bool] = None,
+    first: Optional[int] = None,
+    every: Optional[int] = None,
+    rate: Optional[float] = None,
+    burst: Optional[float] = None,
+) -> None:
+    """Override the process-wide HotLogger defaults."""
+    for key, value in (("sampling", sampling), ("first", first), ("every", every), ("rate", rate), ("burst", burst)):
+        if value is not None:
+            _HOT_PATH[key] = value
+
+
 def configure_logging(log_level="INFO", log_to_file=False, log_file_path="service.log", service_name="ai-engine"):
     """
     Set up structured logging with enhanced context for troubleshooting.
@@ -156,6 +308,9 @@ def configure_logging(log_level="INFO", log_to_file=False, log_file_path="servic
       - LOG_COLOR:  0|1 (console only; default: 1)
       - LOG_TO_FILE: 0|1 (default: 0)
       - LOG_FILE_PATH: path (default: service.log)
+      - LOG_HOT_PATH_SAMPLING: 0|1 (default: 1; 0 = per-frame logs unsampled)
+      - LOG_HOT_PATH_FIRST / LOG_HOT_PATH_EVERY: per-call sampling (default: 3 / 250)
+      - LOG_HOT_PATH_RATE / LOG_HOT_PATH_BURST: lines/sec per callsite (default: 20 / 50)
     """
     # Read env overrides
     env_level = os.getenv("LOG_LEVEL")
@@ -186,6 +341,18 @@ def configure_logging(log_level="INFO", log_to_file=False, log_file_path="servic
             event_dict.pop("exc_info", None)
         return event_dict
 
+    try:
+        configure_hot_path_logging(
+            sampling=os.getenv("LOG_HOT_PATH_SAMPLING", "1").strip().lower() not in ("0", "false", "no", "off"),
+            first=int(os.getenv("LOG_HOT_PATH_FIRST", _HOT_PATH["first"])),
+            every=int(os.getenv("LOG_HOT_PATH_EVERY", _HOT_PATH["every"])),
+            rate=float(os.getenv("LOG_HOT_PATH_RATE", _HOT_PATH["rate"])),
+            burst=float(os.getenv("LOG_HOT_PATH_BURST", _HOT_PATH["burst"])),
+        )
+    except ValueError:
+        pass
+    _HOT_PATH["level_gate"] = True
+
     # Derive numeric level for stdlib root logger
     try:
         level_value = getattr(logging, log_level_upper, logging.INFO) if isinstance(log_level, str) else int(log_level)
@@ -1,30 +1,16 @@
-"""Pipeline orchestration package exports."""
+"""Pipeline orchestration package exports.
+
+Adapter classes are resolved on first attribute access so importing the package
+(and the orchestrator) does not import every vendor adapter family.
+"""
 
-from .google import (
-    GoogleSTTAdapter,
-    GoogleLLMAdapter,
-    GoogleTTSAdapter,
-)
-from .local import (
-    LocalSTTAdapter,
-    LocalLLMAdapter,
-    LocalTTSAdapter,
-)
-from .openai import (
-    OpenAISTTAdapter,
-    OpenAILLMAdapter,
-    OpenAITTSAdapter,
-)
-from .telnyx import (
-    TelnyxLLMAdapter,
-)
 from .orchestrator import (
     PipelineOrchestrator,
     PipelineOrchestratorError,
     PipelineResolution,
 )
 
-__all__ = [
+_LAZY_ADAPTERS = (
     "GoogleSTTAdapter",
     "GoogleLLMAdapter",
     "GoogleTTSAdapter",
@@ -35,6 +21,19 @@ __all__ = [
     "OpenAILLMAdapter",
     "OpenAITTSAdapter",
     "TelnyxLLMAdapter",
+)
+
+
+def __getattr__(name):
+    if name in _LAZY_ADAPTERS:
+        from ..core.plugins import PIPELINE_ADAPTERS
+
+        return PIPELINE_ADAPTERS.load(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = [
+    *_LAZY_ADAPTERS,
     "PipelineOrchestrator",
     "PipelineOrchestratorError",
     "PipelineResolution",
@@ -14,7 +14,7 @@ import asyncio
 import os
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import AsyncIterator, Dict, Any, Optional, List, Union
+from typing import AsyncIterator, Callable, Dict, Any, Optional, List, Union
 
 try:
     import aiohttp
@@ -280,6 +280,27 @@ class STTComponent(Component):
     ) -> str:
         """Return a transcript for the provided PCM16 audio buffer."""
 
+    def set_partial_listener(self, call_id: str, listener: Optional[Callable[[str], None]]) -> None:
+        """Register (or clear, with None) a callback for interim transcripts of a streaming call.
+
+        Only streaming adapters that receive interim results call it; the listener
+        runs on the adapter's receive loop and must not block.
+        """
+        listeners = self.__dict__.setdefault("_partial_listeners", {})
+        if listener is None:
+            listeners.pop(call_id, None)
+        else:
+            listeners[call_id] = listener
+
+    def _emit_partial(self, call_id: str, text: str) -> None:
+        listener = self.__dict__.get("_partial_listeners", {}).get(call_id)
+        if listener is None or not text:
+            return
+        try:
+            listener(text)
+        except Exception:
+            pass
+
 
 class LLMComponent(Component):
     """Language model component."""
@@ -400,6 +400,8 @@ class DeepgramSTTAdapter(STTComponent):
             "sample_rate": str(merged.get("sample_rate", 16000)),
             "channels": "1",
         }
+        if merged.get("interim_results"):
+            query_params["interim_results"] = "true"
         existing = dict(parse_qsl(parsed.query))
         existing.update(query_params)
         ws_url = urlunparse(parsed._replace(path=path, query=urlencode(existing)))
@@ -529,6 +531,8 @@ class DeepgramSTTAdapter(STTComponent):
                             speech_final=speech_final,
                         )
 
+                        if not is_final:
+                            self._emit_partial(call_id, transcript.strip())
                         # Only queue final transcripts
                         if is_final and transcript.strip():
                             try:
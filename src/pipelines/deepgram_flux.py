@@ -401,6 +401,8 @@ class DeepgramFluxSTTAdapter(STTComponent):
                             is_final=is_final,
                         )
                         
+                        if not is_final:
+                            self._emit_partial(call_id, transcript.strip())
                         # Only queue final transcripts
                         if is_final:
                             try:
@@ -12,8 +12,18 @@ import asyncio
 import base64
 import json
 import time
+import uuid
 import audioop
 from ..audio.resampler import resample_audio
+from ..audio.local_ai_frames import (
+    FRAME_KIND_AUDIO,
+    FRAME_KIND_TTS_AUDIO,
+    call_hash,
+    decode_frame,
+    encode_frame,
+    negotiate_message,
+    negotiated_version,
+)
 from dataclasses import dataclass
 from typing import Any, AsyncIterator, Dict, Optional, Tuple
 
@@ -22,6 +32,7 @@ from websockets.asyncio.client import ClientConnection
 from websockets.exceptions import ConnectionClosed, ConnectionClosedError
 
 from ..config import AppConfig, LocalProviderConfig
+from ..core.local_ai_pool import LocalAIConnectionPool
 
 # Reconnection constants
 _MAX_RECONNECT_ATTEMPTS = 3
@@ -55,6 +66,9 @@ class _LocalSessionState:
     result_queue: Optional[asyncio.Queue] = None
     receiver_task: Optional[asyncio.Task] = None
     send_lock: Optional[asyncio.Lock] = None
+    # Binary audio frames agreed with the server (None = base64 JSON audio)
+    frames_version: Optional[int] = None
+    frame_seq: int = 0
 
 
 class _LocalAdapterBase:
@@ -68,8 +82,10 @@ class _LocalAdapterBase:
         pipeline_defaults: Optional[Dict[str, Any]],
         *,
         default_mode: str,
+        pool: Optional[LocalAIConnectionPool] = None,
     ):
         self.component_key = component_key
+        self._pool = pool
         self._app_config = app_config
         self._provider_config = provider_config
         self._provider_defaults = provider_config.model_dump()
@@ -130,16 +146,27 @@ class _LocalAdapterBase:
             mode=mode,
         )
 
+        auth_token = (merged.get("auth_token") or "").strip()
+        pool = self._pool
+        if pool is not None and (
+            (pool.ws_url, pool.auth_token) != (ws_url, auth_token) or not merged.get("binary_frames", True)
+        ):
+            pool = None  # pipeline overrides the server or opts out of frames
+
         try:
-            websocket = await asyncio.wait_for(
-                websockets.connect(
-                    ws_url,
-                    ping_interval=None,
-                    ping_timeout=None,
-                    max_size=None,
-                ),
-                timeout=connect_timeout,
-            )
+            if pool is not None:
+                # Pooled channels arrive authenticated and negotiated.
+                websocket = await pool.open_channel(call_id, timeout=connect_timeout)
+            else:
+                websocket = await asyncio.wait_for(
+                    websockets.connect(
+                        ws_url,
+                        ping_interval=None,
+                        ping_timeout=None,
+                        max_size=None,
+                    ),
+                    timeout=connect_timeout,
+                )
         except Exception as exc:
             logger.error(
                 "Failed to connect to local AI server",
@@ -150,8 +177,7 @@ class _LocalAdapterBase:
             raise
 
         # Optional auth handshake for local-ai-server.
-        auth_token = (merged.get("auth_token") or "").strip()
-        if auth_token:
+        if auth_token and pool is None:
             try:
                 await websocket.send(
                     json.dumps(
@@ -195,6 +221,11 @@ class _LocalAdapterBase:
         )
         self._sessions[call_id] = session
 
+        if pool is not None:
+            session.frames_version = websocket.frames_version
+        elif merged.get("binary_frames", True):
+            # Answered before mode_ready; servers without frame support ignore it.
+            await session.websocket.send(negotiate_message())
         await self._send_json(
             session,
             {
@@ -432,6 +463,9 @@ class _LocalAdapterBase:
                 )
                 continue
             msg_type = message.get("type")
+            if msg_type == "negotiate_response":
+                session.frames_version = negotiated_version(message)
+                continue
             if msg_type != "mode_ready":
                 logger.debug(
                     "Unexpected JSON payload during handshake",
@@ -501,6 +535,25 @@ class _LocalAdapterBase:
         )
         return "unknown", message
 
+    def _audio_message(self, session: _LocalSessionState, pcm16: bytes, rate: int) -> Any:
+        """STT audio as a binary frame when negotiated, else the base64 JSON message."""
+        if session.frames_version is not None:
+            seq = session.frame_seq
+            session.frame_seq = (seq + 1) & 0xFFFFFFFF
+            return encode_frame(
+                FRAME_KIND_AUDIO, pcm16, call_hash=call_hash(session.call_id), seq=seq, rate_hz=rate
+            )
+        return json.dumps(
+            {
+                "type": "audio",
+                "mode": "stt",
+                "call_id": session.call_id,
+                "rate": rate,
+                "format": "pcm16le",
+                "data": base64.b64encode(pcm16).decode("ascii"),
+            }
+        )
+
     async def _ensure_session(self, call_id: str, options: Dict[str, Any]) -> _LocalSessionState:
         session = self._sessions.get(call_id)
         if session and session.websocket.state.name == "OPEN":
@@ -526,6 +579,8 @@ class LocalSTTAdapter(_LocalAdapterBase, STTComponent):
         app_config: AppConfig,
         provider_config: LocalProviderConfig,
         options: Optional[Dict[str, Any]] = None,
+        *,
+        pool: Optional[LocalAIConnectionPool] = None,
     ):
         super().__init__(
             component_key,
@@ -533,6 +588,7 @@ class LocalSTTAdapter(_LocalAdapterBase, STTComponent):
             provider_config,
             options,
             default_mode="stt",
+            pool=pool,
         )
         self._resample_states: Dict[str, Optional[tuple]] = {}
 
@@ -607,7 +663,7 @@ class LocalSTTAdapter(_LocalAdapterBase, STTComponent):
             component=self.component_key,
             call_id=call_id,
             pcm16_bytes=len(pcm16),
-            base64_size=len(base64.b64encode(pcm16).decode("ascii")),
+            binary_frames=session.frames_version is not None,
         )
         
         payload = {
@@ -632,7 +688,7 @@ class LocalSTTAdapter(_LocalAdapterBase, STTComponent):
                     # Use retry logic
                     await self._send_json_with_retry(call_id, payload, session.options)
                 else:
-                    await self._send_json(session, payload)
+                    await session.websocket.send(self._audio_message(session, pcm16, 16000))
         except (ConnectionClosed, ConnectionClosedError) as exc:
             logger.warning(
                 "STT send_audio connection closed, will retry on next audio",
@@ -729,6 +785,7 @@ class LocalSTTAdapter(_LocalAdapterBase, STTComponent):
                         call_id=session.call_id,
                         transcript_preview=(message.get("text") or "")[:80],
                     )
+                    self._emit_partial(session.call_id, (message.get("text") or "").strip())
                     continue
                 text = (message.get("text") or "")
                 try:
@@ -789,15 +846,7 @@ class LocalSTTAdapter(_LocalAdapterBase, STTComponent):
             bytes=len(audio_pcm16),
             rate=sample_rate_hz,
         )
-        payload = {
-            "type": "audio",
-            "mode": "stt",
-            "call_id": call_id,
-            "rate": sample_rate_hz,
-            "data": base64.b64encode(audio_pcm16).decode("ascii"),
-        }
-
-        await self._send_json(session, payload)
+        await session.websocket.send(self._audio_message(session, audio_pcm16, sample_rate_hz))
         # STT should use its own response timeout
         timeout = float(merged.get("response_timeout_sec", 5.0))
         started_at = time.perf_counter()
@@ -852,6 +901,8 @@ class LocalLLMAdapter(_LocalAdapterBase, LLMComponent):
         app_config: AppConfig,
         provider_config: LocalProviderConfig,
         options: Optional[Dict[str, Any]] = None,
+        *,
+        pool: Optional[LocalAIConnectionPool] = None,
     ):
         super().__init__(
             component_key,
@@ -859,6 +910,7 @@ class LocalLLMAdapter(_LocalAdapterBase, LLMComponent):
             provider_config,
             options,
             default_mode="llm",
+            pool=pool,
         )
 
     async def generate(
@@ -888,12 +940,16 @@ class LocalLLMAdapter(_LocalAdapterBase, LLMComponent):
             call_id=call_id,
             transcript_preview=(transcript or "")[:80],
         )
+        # A cancelled request (e.g. a discarded speculative turn) still gets answered by
+        # the server; the request_id echo lets this call skip that stale response.
+        request_id = uuid.uuid4().hex
         payload = {
             "type": "llm_request",
             "call_id": call_id,
             "mode": "llm",
             "text": transcript,
             "context": context.get("messages") or context,
+            "request_id": request_id,
         }
 
         # Use retry logic for LLM send
@@ -948,6 +1004,8 @@ class LocalLLMAdapter(_LocalAdapterBase, LLMComponent):
                     continue
                 if message.get("type") != "llm_response":
                     continue
+                if message.get("request_id") not in (None, request_id):
+                    continue
 
                 response = message.get("text", "").strip()
                 latency_ms = (time.perf_counter() - started_at) * 1000.0
@@ -979,6 +1037,8 @@ class LocalTTSAdapter(_LocalAdapterBase, TTSComponent):
         app_config: AppConfig,
         provider_config: LocalProviderConfig,
         options: Optional[Dict[str, Any]] = None,
+        *,
+        pool: Optional[LocalAIConnectionPool] = None,
     ):
         super().__init__(
             component_key,
@@ -986,6 +1046,7 @@ class LocalTTSAdapter(_LocalAdapterBase, TTSComponent):
             provider_config,
             options,
             default_mode="tts",
+            pool=pool,
         )
 
     async def synthesize(
@@ -1079,6 +1140,9 @@ class LocalTTSAdapter(_LocalAdapterBase, TTSComponent):
                     
                 if kind == "json":
                     msg_type = message.get("type")
+                    if msg_type == "tts_response" and message.get("audio_transport") == "frame":
+                        # Trailer for the frame already yielded (or an empty synthesis).
+                        break
                     if msg_type == "tts_response" and message.get("audio_data"):
                         decoded = base64.b64decode(message["audio_data"])
                         latency_ms = (time.perf_counter() - started_at) * 1000.0
@@ -1103,6 +1167,22 @@ class LocalTTSAdapter(_LocalAdapterBase, TTSComponent):
                     continue
 
                 if kind == "binary":
+                    response_frame = False
+                    if session.frames_version is not None:
+                        try:
+                            frame = decode_frame(message)
+                        except ValueError as exc:
+                            logger.warning(
+                                "Dropping malformed TTS frame",
+                                component=self.component_key,
+                                call_id=call_id,
+                                error=str(exc),
+                            )
+                            continue
+                        if frame.kind != FRAME_KIND_TTS_AUDIO:
+                            continue
+                        response_frame = frame.response
+                        message = frame.payload
                     latency_ms = (time.perf_counter() - started_at) * 1000.0
                     logger.info(
                         "Local TTS audio chunk received",
@@ -1113,6 +1193,9 @@ class LocalTTSAdapter(_LocalAdapterBase, TTSComponent):
                     )
                     yielded_audio = True
                     yield message
+                    if response_frame:
+                        # Consume the tts_response that follows so the next turn does not read it.
+                        continue
                     # Assume the local server sends a single binary payload per request.
                     break
         except Exception as exc:
@@ -28,20 +28,24 @@ from ..config import (
 )
 from ..logging_config import get_logger
 from .base import Component, STTComponent, LLMComponent, TTSComponent
-from .deepgram import DeepgramSTTAdapter, DeepgramTTSAdapter
-from .deepgram_flux import DeepgramFluxSTTAdapter
-from .elevenlabs import ElevenLabsTTSAdapter
-from .google import GoogleLLMAdapter, GoogleSTTAdapter, GoogleTTSAdapter
-from .local import LocalLLMAdapter, LocalSTTAdapter, LocalTTSAdapter
-from .ollama import OllamaLLMAdapter
-from .openai import OpenAISTTAdapter, OpenAILLMAdapter, OpenAITTSAdapter
-from .groq import GroqSTTAdapter, GroqTTSAdapter
-from .telnyx import TelnyxLLMAdapter
+from ..core.local_ai_pool import shared_pool
+from ..core.plugins import PIPELINE_ADAPTERS
 
 logger = get_logger(__name__)
 
 ComponentFactory = Callable[[str, Dict[str, Any]], Component]
 _PLACEHOLDER_FACTORY_ATTR = "_ava_placeholder_role"
+_ADAPTER_FACTORY_ATTR = "_ava_adapter"
+
+
+def _adapter_factory(adapter: str) -> Callable[[ComponentFactory], ComponentFactory]:
+    """Tag a factory with the PIPELINE_ADAPTERS plugin it builds (imported on first use)."""
+
+    def decorator(factory: ComponentFactory) -> ComponentFactory:
+        setattr(factory, _ADAPTER_FACTORY_ATTR, adapter)
+        return factory
+
+    return decorator
 
 
 class PipelineOrchestratorError(Exception):
@@ -236,6 +240,8 @@ class PipelineOrchestrator:
         self._enabled: bool = bool(getattr(config, "pipelines", {}) or {})
         self._active_pipeline_name: Optional[str] = getattr(config, "active_pipeline", None)
         self._invalid_pipelines: Dict[str, str] = {}
+        # Pipeline name -> ResponseCache, for pipelines with options.response_cache enabled.
+        self._response_caches: Dict[str, Any] = {}
 
     @property
     def started(self) -> bool:
@@ -284,6 +290,9 @@ class PipelineOrchestrator:
             )
             self._active_pipeline_name = fallback
 
+        # Import only the adapter families the valid pipelines use, before the first call needs them.
+        self._preload_adapters(valid_pipelines)
+
         # Phase 2: Validate connectivity for valid pipelines
         validation_results = {}
         for name, entry in valid_pipelines.items():
@@ -392,6 +401,20 @@ class PipelineOrchestrator:
         for adapter in (resolution.stt_adapter, resolution.llm_adapter, resolution.tts_adapter):
             await self._shutdown_component(adapter, call_id)
 
+    def adopt_assignments(self, other: "PipelineOrchestrator") -> int:
+        """Take over another orchestrator's per-call pipelines (config reload).
+
+        In-flight calls keep the adapters they were assigned, and release_pipeline on
+        this orchestrator shuts them down when the call ends.
+        """
+        adopted = 0
+        for call_id, resolution in list(other._assignments.items()):
+            if call_id not in self._assignments:
+                self._assignments[call_id] = resolution
+                adopted += 1
+        other._assignments.clear()
+        return adopted
+
     def register_factory(self, component_key: str, factory: ComponentFactory) -> None:
         self._registry[component_key] = factory
 
@@ -653,11 +676,12 @@ class PipelineOrchestrator:
         # Merge provider config with pipeline options at runtime
         base_config = dict(provider_config)
         
+        @_adapter_factory("OllamaLLMAdapter")
         def factory(component_key: str, options: Dict[str, Any]) -> Component:
             # Provider config from YAML takes precedence, runtime options can override
             merged = dict(base_config)
             merged.update(options or {})
-            return OllamaLLMAdapter(
+            return PIPELINE_ADAPTERS.load("OllamaLLMAdapter")(
                 self.config,
                 merged,
             )
@@ -668,13 +692,16 @@ class PipelineOrchestrator:
         provider_config: LocalProviderConfig,
     ) -> ComponentFactory:
         config_payload = provider_config.model_dump()
+        pool = shared_pool(provider_config)
 
+        @_adapter_factory("LocalSTTAdapter")
         def factory(component_key: str, options: Dict[str, Any]) -> Component:
-            return LocalSTTAdapter(
+            return PIPELINE_ADAPTERS.load("LocalSTTAdapter")(
                 component_key,
                 self.config,
                 LocalProviderConfig(**config_payload),
                 options,
+                pool=pool,
             )
 
         return factory
@@ -684,13 +711,16 @@ class PipelineOrchestrator:
         provider_config: LocalProviderConfig,
     ) -> ComponentFactory:
         config_payload = provider_config.model_dump()
+        pool = shared_pool(provider_config)
 
+        @_adapter_factory("LocalLLMAdapter")
         def factory(component_key: str, options: Dict[str, Any]) -> Component:
-            return LocalLLMAdapter(
+            return PIPELINE_ADAPTERS.load("LocalLLMAdapter")(
                 component_key,
                 self.config,
                 LocalProviderConfig(**config_payload),
                 options,
+                pool=pool,
             )
 
         return factory
@@ -700,13 +730,16 @@ class PipelineOrchestrator:
         provider_config: LocalProviderConfig,
     ) -> ComponentFactory:
         config_payload = provider_config.model_dump()
+        pool = shared_pool(provider_config)
 
+        @_adapter_factory("LocalTTSAdapter")
         def factory(component_key: str, options: Dict[str, Any]) -> Component:
-            return LocalTTSAdapter(
+            return PIPELINE_ADAPTERS.load("LocalTTSAdapter")(
                 component_key,
                 self.config,
                 LocalProviderConfig(**config_payload),
                 options,
+                pool=pool,
             )
 
         return factory
@@ -719,8 +752,9 @@ class PipelineOrchestrator:
     ) -> ComponentFactory:
         config_payload = provider_config.model_dump()
 
+        @_adapter_factory("DeepgramSTTAdapter")
         def factory(component_key: str, options: Dict[str, Any]) -> Component:
-            return DeepgramSTTAdapter(
+            return PIPELINE_ADAPTERS.load("DeepgramSTTAdapter")(
                 component_key,
                 self.config,
                 DeepgramProviderConfig(**config_payload),
@@ -735,8 +769,9 @@ class PipelineOrchestrator:
     ) -> ComponentFactory:
         config_payload = provider_config.model_dump()
 
+        @_adapter_factory("DeepgramFluxSTTAdapter")
         def factory(component_key: str, options: Dict[str, Any]) -> Component:
-            return DeepgramFluxSTTAdapter(
+            return PIPELINE_ADAPTERS.load("DeepgramFluxSTTAdapter")(
                 component_key,
                 self.config,
                 DeepgramProviderConfig(**config_payload),
@@ -751,8 +786,9 @@ class PipelineOrchestrator:
     ) -> ComponentFactory:
         config_payload = provider_config.model_dump()
 
+        @_adapter_factory("OpenAISTTAdapter")
         def factory(component_key: str, options: Dict[str, Any]) -> Component:
-            return OpenAISTTAdapter(
+            return PIPELINE_ADAPTERS.load("OpenAISTTAdapter")(
                 component_key,
                 self.config,
                 OpenAIProviderConfig(**config_payload),
@@ -767,8 +803,9 @@ class PipelineOrchestrator:
     ) -> ComponentFactory:
         config_payload = provider_config.model_dump()
 
+        @_adapter_factory("OpenAILLMAdapter")
         def factory(component_key: str, options: Dict[str, Any]) -> Component:
-            return OpenAILLMAdapter(
+            return PIPELINE_ADAPTERS.load("OpenAILLMAdapter")(
                 component_key,
                 self.config,
                 OpenAIProviderConfig(**config_payload),
@@ -783,8 +820,9 @@ class PipelineOrchestrator:
     ) -> ComponentFactory:
         config_payload = provider_config.model_dump()
 
+        @_adapter_factory("TelnyxLLMAdapter")
         def factory(component_key: str, options: Dict[str, Any]) -> Component:
-            return TelnyxLLMAdapter(
+            return PIPELINE_ADAPTERS.load("TelnyxLLMAdapter")(
                 component_key,
                 self.config,
                 TelnyxLLMProviderConfig(**config_payload),
@@ -799,8 +837,9 @@ class PipelineOrchestrator:
     ) -> ComponentFactory:
         config_payload = provider_config.model_dump()
 
+        @_adapter_factory("OpenAITTSAdapter")
         def factory(component_key: str, options: Dict[str, Any]) -> Component:
-            return OpenAITTSAdapter(
+            return PIPELINE_ADAPTERS.load("OpenAITTSAdapter")(
                 component_key,
                 self.config,
                 OpenAIProviderConfig(**config_payload),
@@ -815,8 +854,9 @@ class PipelineOrchestrator:
     ) -> ComponentFactory:
         config_payload = provider_config.model_dump()
 
+        @_adapter_factory("DeepgramTTSAdapter")
         def factory(component_key: str, options: Dict[str, Any]) -> Component:
-            return DeepgramTTSAdapter(
+            return PIPELINE_ADAPTERS.load("DeepgramTTSAdapter")(
                 component_key,
                 self.config,
                 DeepgramProviderConfig(**config_payload),
@@ -831,8 +871,9 @@ class PipelineOrchestrator:
     ) -> ComponentFactory:
         config_payload = provider_config.model_dump()
 
+        @_adapter_factory("GoogleSTTAdapter")
         def factory(component_key: str, options: Dict[str, Any]) -> Component:
-            return GoogleSTTAdapter(
+            return PIPELINE_ADAPTERS.load("GoogleSTTAdapter")(
                 component_key,
                 self.config,
                 GoogleProviderConfig(**config_payload),
@@ -847,8 +888,9 @@ class PipelineOrchestrator:
     ) -> ComponentFactory:
         config_payload = provider_config.model_dump()
 
+        @_adapter_factory("GoogleLLMAdapter")
         def factory(component_key: str, options: Dict[str, Any]) -> Component:
-            return GoogleLLMAdapter(
+            return PIPELINE_ADAPTERS.load("GoogleLLMAdapter")(
                 component_key,
                 self.config,
                 GoogleProviderConfig(**config_payload),
@@ -863,8 +905,9 @@ class PipelineOrchestrator:
     ) -> ComponentFactory:
         config_payload = provider_config.model_dump()
 
+        @_adapter_factory("GoogleTTSAdapter")
         def factory(component_key: str, options: Dict[str, Any]) -> Component:
-            return GoogleTTSAdapter(
+            return PIPELINE_ADAPTERS.load("GoogleTTSAdapter")(
                 component_key,
                 self.config,
                 GoogleProviderConfig(**config_payload),
@@ -880,8 +923,9 @@ class PipelineOrchestrator:
         """Create factory for ElevenLabs TTS adapter."""
         config_payload = provider_config.model_dump()
 
+        @_adapter_factory("ElevenLabsTTSAdapter")
         def factory(component_key: str, options: Dict[str, Any]) -> Component:
-            return ElevenLabsTTSAdapter(
+            return PIPELINE_ADAPTERS.load("ElevenLabsTTSAdapter")(
                 component_key,
                 self.config,
                 ElevenLabsProviderConfig(**config_payload),
@@ -1199,8 +1243,9 @@ class PipelineOrchestrator:
     def _make_groq_stt_factory(self, provider_config: GroqSTTProviderConfig) -> ComponentFactory:
         config_payload = provider_config.model_dump()
 
+        @_adapter_factory("GroqSTTAdapter")
         def factory(component_key: str, options: Dict[str, Any]) -> Component:
-            return GroqSTTAdapter(
+            return PIPELINE_ADAPTERS.load("GroqSTTAdapter")(
                 component_key,
                 self.config,
                 GroqSTTProviderConfig(**config_payload),
@@ -1212,8 +1257,9 @@ class PipelineOrchestrator:
     def _make_groq_tts_factory(self, provider_config: GroqTTSProviderConfig) -> ComponentFactory:
         config_payload = provider_config.model_dump()
 
+        @_adapter_factory("GroqTTSAdapter")
         def factory(component_key: str, options: Dict[str, Any]) -> Component:
-            return GroqTTSAdapter(
+            return PIPELINE_ADAPTERS.load("GroqTTSAdapter")(
                 component_key,
                 self.config,
                 GroqTTSProviderConfig(**config_payload),
@@ -1255,6 +1301,21 @@ class PipelineOrchestrator:
             if getattr(factory, _PLACEHOLDER_FACTORY_ATTR, None):
                 raise PipelineOrchestratorError(self._format_placeholder_error(pipeline_name, key))
 
+    def _preload_adapters(self, pipelines: Dict[str, PipelineEntry]) -> None:
+        for name, entry in pipelines.items():
+            for key in (entry.stt, entry.llm, entry.tts):
+                try:
+                    adapter = getattr(self._resolve_factory(key), _ADAPTER_FACTORY_ATTR, None)
+                    if adapter:
+                        PIPELINE_ADAPTERS.load(adapter)
+                except Exception as exc:
+                    logger.warning(
+                        "Failed to import pipeline adapter",
+                        pipeline=name,
+                        component=key,
+                        error=str(exc),
+                    )
+
     def _format_placeholder_error(self, pipeline_name: str, component_key: str) -> str:
         role = "unknown"
         provider = None
@@ -1424,6 +1485,13 @@ class PipelineOrchestrator:
         llm_adapter = self._build_component(entry.llm, llm_options)
         tts_adapter = self._build_component(entry.tts, tts_options)
 
+        cache = self._response_cache(pipeline_name, options_map.get("response_cache"))
+        if cache is not None:
+            from .response_cache import CachedLLMComponent, CachedTTSComponent
+
+            llm_adapter = CachedLLMComponent(llm_adapter, cache)
+            tts_adapter = CachedTTSComponent(tts_adapter, cache)
+
         primary_provider = self._derive_primary_provider(entry)
 
         return PipelineResolution(
@@ -1441,6 +1509,25 @@ class PipelineOrchestrator:
             primary_provider=primary_provider,
         )
 
+    def _response_cache(self, pipeline_name: str, options: Optional[Dict[str, Any]]) -> Optional[Any]:
+        """Shared response cache for a pipeline, or None when it is not enabled."""
+        if not (options or {}).get("enabled"):
+            return None
+        cache = self._response_caches.get(pipeline_name)
+        if cache is None:
+            from .response_cache import ResponseCache, ResponseCacheConfig
+
+            cache = ResponseCache(ResponseCacheConfig.from_options(options))
+            self._response_caches[pipeline_name] = cache
+            logger.info(
+                "Pipeline response cache enabled",
+                pipeline=pipeline_name,
+                ttl_sec=cache.config.ttl_sec,
+                similarity=cache.config.similarity,
+                max_entries=cache.config.max_entries,
+            )
+        return cache
+
     async def _shutdown_component(self, component: Component, call_id: str) -> None:
         try:
             await component.close_call(call_id)
@@ -0,0 +1,365 @@
+"""
+Response cache for repeated caller intents.
+
+FAQ-style call flows (opening hours, addresses, ATIS information) answer the same
+questions all day. When a pipeline enables ``options.response_cache``, the
+orchestrator wraps the call's LLM and TTS adapters so that a caller utterance
+similar enough to one already answered returns the stored reply text, and the
+TTS adapter replays the audio it rendered for that reply instead of synthesizing
+it again.
+
+Matching is CPU-only: utterances are normalized, exact matches are a dict lookup,
+and near matches are scored by cosine similarity over word and character-trigram
+counts. Entries are namespaced by the system prompt, tool allowlist, model, a
+configurable ``version`` string and the conversation so far (``prior_messages``),
+so a context or prompt change never serves a reply written for the old prompt and
+a reply that depends on one caller's history is never served to another caller;
+in practice hits come from turns that follow the same greeting. Replies that carried tool calls are never
+cached, and they mark their utterance as a tool intent so a later plain-text
+answer to a similar utterance is not cached either.
+
+    pipelines:
+      faq:
+        options:
+          response_cache:
+            enabled: true
+            ttl_sec: 3600
+            similarity: 0.9
+            max_entries: 256
+            min_words: 2
+            exclude_patterns: ["transfer", "\\bagent\\b"]
+            version: "2024-06"
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import re
+import time
+from collections import Counter as TermCounter
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, Union
+
+import structlog
+from prometheus_client import Counter, Gauge
+
+from .base import LLMComponent, LLMResponse, TTSComponent
+
+logger = structlog.get_logger(__name__)
+
+_CACHE_LOOKUPS = Counter(
+    "ai_agent_response_cache_lookups_total",
+    "Pipeline response cache lookups by result (exact/similar hit, miss, excluded, tool intent)",
+    labelnames=("result",),
+)
+_CACHE_AUDIO = Counter(
+    "ai_agent_response_cache_audio_total",
+    "TTS requests for cached replies, by whether pre-rendered audio was replayed",
+    labelnames=("result",),
+)
+_CACHE_ENTRIES = Gauge(
+    "ai_agent_response_cache_entries",
+    "Cached caller utterances across all pipeline response caches",
+)
+
+_PUNCTUATION = re.compile(r"[^\w\s']+")
+# Dropped before matching: they change the wording, not the question.
+_FILLERS = frozenset({"um", "uh", "er", "erm", "hmm", "please", "so", "well", "like", "okay", "ok"})
+
+
+def normalize_utterance(text: str) -> str:
+    words = _PUNCTUATION.sub(" ", (text or "").lower()).split()
+    return " ".join(w for w in words if w not in _FILLERS)
+
+
+def utterance_vector(normalized: str) -> Dict[str, float]:
+    """Word unigrams plus character trigrams; words weigh more so one swapped word matters."""
+    terms: TermCounter = TermCounter()
+    for word in normalized.split():
+        terms["w:" + word] += 2
+    padded = f" {normalized} "
+    for i in range(len(padded) - 2):
+        terms["c:" + padded[i : i + 3]] += 1
+    return dict(terms)
+
+
+def cosine(a: Dict[str, float], b: Dict[str, float]) -> float:
+    if len(a) > len(b):
+        a, b = b, a
+    dot = sum(value * b.get(term, 0.0) for term, value in a.items())
+    if not dot:
+        return 0.0
+    norm = math.sqrt(sum(v * v for v in a.values())) * math.sqrt(sum(v * v for v in b.values()))
+    return dot / norm if norm else 0.0
+
+
+@dataclass
+class ResponseCacheConfig:
+    enabled: bool = False
+    ttl_sec: float = 3600.0
+    similarity: float = 0.9
+    max_entries: int = 256
+    min_words: int = 2
+    exclude_patterns: List[str] = field(default_factory=list)
+    version: str = ""
+
+    @classmethod
+    def from_options(cls, options: Optional[Dict[str, Any]]) -> "ResponseCacheConfig":
+        options = dict(options or {})
+        patterns = options.get("exclude_patterns") or []
+        if isinstance(patterns, str):
+            patterns = [patterns]
+        return cls(
+            enabled=bool(options.get("enabled", False)),
+            ttl_sec=float(options.get("ttl_sec", 3600.0)),
+            similarity=float(options.get("similarity", 0.9)),
+            max_entries=max(1, int(options.get("max_entries", 256))),
+            min_words=max(1, int(options.get("min_words", 2))),
+            exclude_patterns=[str(p) for p in patterns],
+            version=str(options.get("version", "") or ""),
+        )
+
+
+@dataclass
+class _Entry:
+    utterance: str
+    vector: Dict[str, float]
+    text: str
+    tool_intent: bool
+    created_at: float
+
+
+class ResponseCache:
+    """Per-pipeline cache shared by every call's cached LLM/TTS adapters."""
+
+    def __init__(self, config: ResponseCacheConfig, *, clock=time.monotonic):
+        self.config = config
+        self._clock = clock
+        self._excluded = [re.compile(p, re.IGNORECASE) for p in config.exclude_patterns]
+        # namespace -> normalized utterance -> entry (LRU order per namespace)
+        self._entries: Dict[str, "OrderedDict[str, _Entry]"] = {}
+        # (reply text, TTS options signature) -> rendered chunks
+        self._audio: "OrderedDict[Tuple[str, str], List[bytes]]" = OrderedDict()
+        self._reply_refs: TermCounter = TermCounter()
+
+    def namespace(self, options: Optional[Dict[str, Any]], context: Optional[Dict[str, Any]] = None) -> str:
+        """Key for everything that changes what the LLM would answer besides the utterance."""
+        options = options or {}
+        context = context or {}
+        material = json.dumps(
+            [
+                str(options.get("system_prompt") or context.get("system_prompt") or ""),
+                sorted(str(t) for t in (options.get("tools") or [])),
+                str(options.get("model") or ""),
+                self.config.version,
+                context.get("prior_messages") or [],
+            ],
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha1(material.encode("utf-8")).hexdigest()[:16]
+
+    def lookup(self, namespace: str, utterance: str) -> Optional[str]:
+        normalized = self._cacheable(utterance)
+        if normalized is None:
+            _CACHE_LOOKUPS.labels("excluded").inc()
+            return None
+        entry, result = self._match(namespace, normalized)
+        if entry is not None and entry.tool_intent:
+            result, entry = "tool_intent", None
+        _CACHE_LOOKUPS.labels(result).inc()
+        if entry is None:
+            return None
+        self._entries[namespace].move_to_end(entry.utterance)
+        return entry.text
+
+    def store(self, namespace: str, utterance: str, result: Union[str, LLMResponse, None]) -> None:
+        normalized = self._cacheable(utterance)
+        if normalized is None or result is None:
+            return
+        if isinstance(result, LLMResponse):
+            text, tool_intent = (result.text or "").strip(), bool(result.tool_calls)
+        else:
+            text, tool_intent = str(result).strip(), False
+        if not text and not tool_intent:
+            return
+        existing, _ = self._match(namespace, normalized)
+        if existing is not None and existing.tool_intent and not tool_intent:
+            return
+        bucket = self._entries.setdefault(namespace, OrderedDict())
+        if normalized in bucket:
+            self._drop(bucket, normalized)
+        bucket[normalized] = _Entry(
+            utterance=normalized,
+            vector=utterance_vector(normalized),
+            text="" if tool_intent else text,
+            tool_intent=tool_intent,
+            created_at=self._clock(),
+        )
+        if not tool_intent:
+            self._reply_refs[text] += 1
+        while len(bucket) > self.config.max_entries:
+            self._drop(bucket, next(iter(bucket)))
+        self._update_gauge()
+
+    def audio_for(self, text: str, signature: str) -> Optional[List[bytes]]:
+        key = (text.strip(), signature)
+        chunks = self._audio.get(key)
+        if chunks is not None:
+            self._audio.move_to_end(key)
+        return chunks
+
+    def is_cached_reply(self, text: str) -> bool:
+        return self._reply_refs.get(text.strip(), 0) > 0
+
+    def store_audio(self, text: str, signature: str, chunks: List[bytes]) -> None:
+        if not chunks or not self.is_cached_reply(text):
+            return
+        self._audio[(text.strip(), signature)] = list(chunks)
+        while len(self._audio) > self.config.max_entries:
+            self._audio.popitem(last=False)
+
+    def __len__(self) -> int:
+        return sum(len(bucket) for bucket in self._entries.values())
+
+    def _cacheable(self, utterance: str) -> Optional[str]:
+        if any(pattern.search(utterance or "") for pattern in self._excluded):
+            return None
+        normalized = normalize_utterance(utterance)
+        if len(normalized.split()) < self.config.min_words:
+            return None
+        return normalized
+
+    def _match(self, namespace: str, normalized: str) -> Tuple[Optional[_Entry], str]:
+        bucket = self._entries.get(namespace)
+        if not bucket:
+            return None, "miss"
+        self._expire(bucket)
+        entry = bucket.get(normalized)
+        if entry is not None:
+            return entry, "exact_hit"
+        vector = utterance_vector(normalized)
+        best, best_score = None, 0.0
+        for candidate in bucket.values():
+            score = cosine(vector, candidate.vector)
+            if score > best_score:
+                best, best_score = candidate, score
+        if best is not None and best_score >= self.config.similarity:
+            return best, "similar_hit"
+        return None, "miss"
+
+    def _expire(self, bucket: "OrderedDict[str, _Entry]") -> None:
+        cutoff = self._clock() - self.config.ttl_sec
+        for key in [k for k, e in bucket.items() if e.created_at < cutoff]:
+            self._drop(bucket, key)
+        self._update_gauge()
+
+    def _drop(self, bucket: "OrderedDict[str, _Entry]", key: str) -> None:
+        entry = bucket.pop(key)
+        if entry.tool_intent:
+            return
+        self._reply_refs[entry.text] -= 1
+        if self._reply_refs[entry.text] <= 0:
+            del self._reply_refs[entry.text]
+            for audio_key in [k for k in self._audio if k[0] == entry.text]:
+                del self._audio[audio_key]
+
+    def _update_gauge(self) -> None:
+        try:
+            _CACHE_ENTRIES.set(len(self))
+        except Exception:
+            pass
+
+
+def _tts_signature(options: Optional[Dict[str, Any]]) -> str:
+    return json.dumps(options or {}, sort_keys=True, default=str)
+
+
+class _CachedComponent:
+    """Forwards lifecycle calls and attribute access to the wrapped adapter."""
+
+    def __init__(self, inner, cache: ResponseCache):
+        self._inner = inner
+        self._cache = cache
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._inner, name)
+
+    def __repr__(self) -> str:
+        return f"<Cached {self._inner!r}>"
+
+    async def start(self) -> None:
+        await self._inner.start()
+
+    async def stop(self) -> None:
+        await self._inner.stop()
+
+    async def open_call(self, call_id: str, options: Dict[str, Any]) -> None:
+        await self._inner.open_call(call_id, options)
+
+    async def close_call(self, call_id: str) -> None:
+        await self._inner.close_call(call_id)
+
+    async def validate_connectivity(self, options: Dict[str, Any]) -> Dict[str, Any]:
+        return await self._inner.validate_connectivity(options)
+
+
+class CachedLLMComponent(_CachedComponent, LLMComponent):
+    """LLM adapter that answers repeated utterances from the response cache."""
+
+    async def generate(
+        self,
+        call_id: str,
+        transcript: str,
+        context: Dict[str, Any],
+        options: Dict[str, Any],
+    ) -> Union[str, LLMResponse]:
+        if not (transcript or "").strip():
+            # Tool-result continuations and other transcript-less turns.
+            return await self._inner.generate(call_id, transcript, context, options)
+        namespace = self._cache.namespace(options, context)
+        cached = self._cache.lookup(namespace, transcript)
+        if cached is not None:
+            logger.info(
+                "Pipeline response served from cache",
+                call_id=call_id,
+                transcript_preview=transcript[:80],
+                response_preview=cached[:80],
+            )
+            return LLMResponse(text=cached, metadata={"response_cache": "hit"})
+        result = await self._inner.generate(call_id, transcript, context, options)
+        self._cache.store(namespace, transcript, result)
+        return result
+
+
+class CachedTTSComponent(_CachedComponent, TTSComponent):
+    """TTS adapter that replays audio already rendered for a cached reply."""
+
+    async def synthesize(
+        self,
+        call_id: str,
+        text: str,
+        options: Dict[str, Any],
+    ) -> AsyncIterator[bytes]:
+        if not self._cache.is_cached_reply(text or ""):
+            async for chunk in self._inner.synthesize(call_id, text, options):
+                yield chunk
+            return
+        signature = _tts_signature(options)
+        chunks = self._cache.audio_for(text, signature)
+        if chunks is not None:
+            _CACHE_AUDIO.labels("hit").inc()
+            for chunk in chunks:
+                yield chunk
+            return
+        _CACHE_AUDIO.labels("miss").inc()
+        rendered: List[bytes] = []
+        async for chunk in self._inner.synthesize(call_id, text, options):
+            if chunk:
+                rendered.append(bytes(chunk))
+            yield chunk
+        # Only a fully rendered reply is stored (barge-in closes the generator early).
+        self._cache.store_audio(text, signature, rendered)
@@ -0,0 +1,231 @@
+"""
+Speculative LLM generation on interim transcripts.
+
+Streaming STT adapters report interim (partial) transcripts well before the final
+one. Once the same interim text has been seen a few times in a row it is unlikely
+to change, so the pipeline runner can start ``LLMComponent.generate`` on it in the
+background. When the final transcript arrives and matches the speculated text the
+running (or finished) generation is committed as the turn's response; when it
+diverges the speculation is cancelled and the turn runs normally.
+
+Enabled per pipeline through the LLM options::
+
+    options:
+      llm:
+        speculative: true
+        speculative_stable_partials: 2   # identical partials before starting
+        speculative_min_words: 3         # don't speculate on fragments
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import re
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+import structlog
+from prometheus_client import Counter, Histogram
+
+from .base import LLMResponse
+
+logger = structlog.get_logger(__name__)
+
+_SPECULATIVE_STARTS = Counter(
+    "ai_agent_speculative_llm_starts_total",
+    "Speculative LLM generations started from stable interim transcripts",
+)
+_SPECULATIVE_OUTCOMES = Counter(
+    "ai_agent_speculative_llm_outcomes_total",
+    "Speculative LLM outcomes (hit/miss at the final transcript, superseded by a newer interim)",
+    labelnames=("outcome",),
+)
+_SPECULATIVE_WASTED_TOKENS = Counter(
+    "ai_agent_speculative_llm_wasted_tokens_total",
+    "Output tokens generated by discarded speculative LLM requests (estimated when not reported)",
+)
+_SPECULATIVE_SAVED_SECONDS = Histogram(
+    "ai_agent_speculative_llm_saved_seconds",
+    "LLM time already spent by a committed speculation when the final transcript arrived",
+    buckets=(0.05, 0.1, 0.2, 0.3, 0.5, 0.75, 1.0, 1.5, 2.0, 3.0),
+)
+
+_PUNCTUATION = re.compile(r"[^\w\s']+")
+
+
+def normalize_transcript(text: str) -> str:
+    """Case/punctuation/whitespace-insensitive form used to compare transcripts."""
+    return " ".join(_PUNCTUATION.sub(" ", (text or "").lower()).split())
+
+
+def estimate_output_tokens(result: Any) -> int:
+    """Tokens produced by a generate() result: reported usage, else ~4 chars per token."""
+    text = result
+    if isinstance(result, LLMResponse):
+        usage = (result.metadata or {}).get("usage") or {}
+        for key in ("completion_tokens", "output_tokens"):
+            try:
+                if usage.get(key) is not None:
+                    return int(usage[key])
+            except (TypeError, ValueError):
+                pass
+        text = result.text
+    return int(math.ceil(len(str(text or "").strip()) / 4.0))
+
+
+class SpeculativeGenerator:
+    """Per-call speculation state: at most one background generation at a time.
+
+    ``generate`` is called with the speculated transcript and must return the same
+    value ``LLMComponent.generate`` would for it (the runner binds call id, context
+    and options).
+    """
+
+    def __init__(
+        self,
+        call_id: str,
+        generate: Callable[[str], Awaitable[Any]],
+        *,
+        stable_partials: int = 2,
+        min_words: int = 3,
+    ):
+        self.call_id = call_id
+        self._generate = generate
+        self.stable_partials = max(1, int(stable_partials))
+        self.min_words = max(1, int(min_words))
+        self._candidate = ""
+        self._candidate_count = 0
+        self._text = ""
+        self._key = ""
+        self._task: Optional[asyncio.Task] = None
+        self._started_at = 0.0
+        self._finished_at: Optional[float] = None
+        self.stats: Dict[str, float] = {
+            "started": 0,
+            "hits": 0,
+            "misses": 0,
+            "superseded": 0,
+            "wasted_tokens": 0,
+            "saved_seconds": 0.0,
+        }
+
+    @classmethod
+    def from_options(
+        cls,
+        call_id: str,
+        generate: Callable[[str], Awaitable[Any]],
+        options: Optional[Dict[str, Any]],
+    ) -> Optional["SpeculativeGenerator"]:
+        """Build a generator when ``speculative`` is enabled in the LLM options."""
+        options = options or {}
+        if not options.get("speculative", False):
+            return None
+        return cls(
+            call_id,
+            generate,
+            stable_partials=options.get("speculative_stable_partials", 2),
+            min_words=options.get("speculative_min_words", 3),
+        )
+
+    @property
+    def active(self) -> bool:
+        return self._task is not None
+
+    @property
+    def text(self) -> str:
+        return self._text
+
+    def on_partial(self, text: str) -> None:
+        """Feed an interim transcript; starts or restarts speculation once it is stable."""
+        key = normalize_transcript(text)
+        if not key:
+            return
+        if key == self._candidate:
+            self._candidate_count += 1
+        else:
+            self._candidate = key
+            self._candidate_count = 1
+        if self._candidate_count < self.stable_partials or key == self._key:
+            return
+        if len(key.split()) < self.min_words:
+            return
+        if self._task is not None:
+            self._discard("superseded")
+        self._start(text.strip(), key)
+
+    async def take(self, final_text: str) -> Optional[Any]:
+        """Commit the speculation if it matches ``final_text``; None means run the turn normally."""
+        if self._task is None:
+            return None
+        task, key = self._task, self._key
+        if normalize_transcript(final_text) != key:
+            self._discard("miss")
+            return None
+        saved = (self._finished_at or time.monotonic()) - self._started_at
+        self._task = None
+        self._text = self._key = ""
+        try:
+            result = await task
+        except asyncio.CancelledError:
+            if not task.cancelled():
+                raise
+            result = None
+        except Exception:
+            result = None
+        if result is None:
+            logger.debug("Speculative LLM generation failed; running the turn normally", call_id=self.call_id)
+            _SPECULATIVE_OUTCOMES.labels("miss").inc()
+            self.stats["misses"] += 1
+            return None
+        _SPECULATIVE_OUTCOMES.labels("hit").inc()
+        _SPECULATIVE_SAVED_SECONDS.observe(max(0.0, saved))
+        self.stats["hits"] += 1
+        self.stats["saved_seconds"] += max(0.0, saved)
+        logger.info(
+            "Speculative LLM response committed",
+            call_id=self.call_id,
+            saved_ms=round(saved * 1000.0, 1),
+            transcript_preview=final_text[:80],
+        )
+        return result
+
+    def cancel(self) -> None:
+        """Drop any in-flight speculation (call teardown, turn boundary)."""
+        if self._task is not None:
+            self._discard("superseded")
+        self._candidate = ""
+        self._candidate_count = 0
+
+    def _start(self, text: str, key: str) -> None:
+        self._text, self._key = text, key
+        self._started_at = time.monotonic()
+        self._finished_at = None
+        self._task = asyncio.create_task(self._generate(text))
+        self._task.add_done_callback(self._on_done)
+        _SPECULATIVE_STARTS.inc()
+        self.stats["started"] += 1
+        logger.debug("Speculative LLM generation started", call_id=self.call_id, transcript_preview=text[:80])
+
+    def _on_done(self, task: asyncio.Task) -> None:
+        if task is self._task:
+            self._finished_at = time.monotonic()
+
+    def _discard(self, outcome: str) -> None:
+        task = self._task
+        self._task = None
+        self._text = self._key = ""
+        if task is None:
+            return
+        wasted = 0
+        if task.done():
+            if not task.cancelled() and task.exception() is None:
+                wasted = estimate_output_tokens(task.result())
+        else:
+            task.cancel()
+        _SPECULATIVE_OUTCOMES.labels(outcome).inc()
+        self.stats["misses" if outcome == "miss" else "superseded"] += 1
+        if wasted:
+            _SPECULATIVE_WASTED_TOKENS.inc(wasted)
+            self.stats["wasted_tokens"] += wasted
+        logger.debug("Speculative LLM generation discarded", call_id=self.call_id, outcome=outcome, wasted_tokens=wasted)
@@ -1 +1,7 @@
-from .openai_realtime import OpenAIRealtimeProvider
\ No newline at end of file
+def __getattr__(name):
+    # Imported on first use; see src/core/plugins.py.
+    if name == "OpenAIRealtimeProvider":
+        from ..core.plugins import PROVIDERS
+
+        return PROVIDERS.load("openai_realtime")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
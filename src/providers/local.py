@@ -11,6 +11,16 @@ from structlog import get_logger
 import audioop
 from ..config import LocalProviderConfig
 from ..audio.resampler import resample_audio
+from ..core.local_ai_pool import LocalAIChannel, shared_pool
+from ..audio.local_ai_frames import (
+    FRAME_KIND_AUDIO,
+    FRAME_KIND_TTS_AUDIO,
+    call_hash,
+    decode_frame,
+    encode_frame,
+    negotiate_message,
+    negotiated_version,
+)
 from .base import AIProviderInterface
 from ..tools.parser import parse_response_with_tools
 
@@ -49,6 +59,15 @@ class LocalProvider(AIProviderInterface):
         self._was_connected: bool = False
         # Background reconnect task (runs when previously connected server disconnects)
         self._background_reconnect_task: Optional[asyncio.Task] = None
+        # Binary audio frames (negotiated per connection; None = base64 JSON audio)
+        self._binary_frames_enabled: bool = bool(getattr(config, "binary_frames", True))
+        self._frames_version: Optional[int] = None
+        self._frames_call_id: Optional[str] = None
+        self._frame_seq: int = 0
+        # tts_request audio that arrived as a frame, until its tts_response (frame_seq) is read
+        self._tts_frames: Dict[tuple, bytes] = {}
+        # Shared multiplexed connections (None = this provider owns its socket)
+        self._pool = shared_pool(config) if self._binary_frames_enabled else None
 
     def _parse_ws_url(self, ws_url: str) -> tuple:
         """Parse host and port from WebSocket URL."""
@@ -141,7 +160,61 @@ class LocalProvider(AIProviderInterface):
         if data.get("type") != "auth_response" or data.get("status") != "ok":
             raise RuntimeError(f"Auth rejected: {data}")
 
+    async def _negotiate(self) -> None:
+        """Offer binary audio frames; the receive loop switches over on negotiate_response."""
+        self._frames_version = None
+        self._frames_call_id = None
+        self._tts_frames.clear()
+        if not self._binary_frames_enabled or not self.websocket:
+            return
+        try:
+            await self.websocket.send(negotiate_message())
+        except Exception:
+            logger.debug("Failed to send negotiate to Local AI Server", exc_info=True)
+
+    async def _open_channel(self, call_id: str) -> None:
+        """Take a pooled channel for the call; it arrives authenticated and negotiated."""
+        channel = await self._pool.open_channel(call_id, timeout=self.connect_timeout)
+        previous = self.websocket
+        self.websocket = channel
+        self._was_connected = True
+        self._frames_version = channel.frames_version
+        self._frames_call_id = None
+        self._tts_frames.clear()
+        if isinstance(previous, LocalAIChannel) and previous is not channel:
+            await previous.close()
+        self._restart_loops()
+        logger.info(
+            "✅ Local AI Server channel opened from shared pool",
+            call_id=call_id,
+            multiplexed=channel.multiplexed,
+        )
+
+    def _restart_loops(self) -> None:
+        # Cancel old tasks and restart listener/sender loops on new connection
+        if self._listener_task and not self._listener_task.done():
+            self._listener_task.cancel()
+            logger.debug("Cancelled old listener task before restart")
+        if self._sender_task and not self._sender_task.done():
+            self._sender_task.cancel()
+            logger.debug("Cancelled old sender task before restart")
+
+        self._listener_task = asyncio.create_task(self._receive_loop())
+        self._sender_task = asyncio.create_task(self._send_loop())
+
     async def _reconnect(self):
+        if self._pool is not None and self._active_call_id:
+            # Failover: a fresh channel on any healthy pooled connection.
+            try:
+                await self._open_channel(self._active_call_id)
+                return True
+            except Exception as exc:
+                logger.warning(
+                    "Shared pool channel unavailable, reconnecting directly",
+                    call_id=self._active_call_id,
+                    error=str(exc) or type(exc).__name__,
+                )
+
         # HYBRID APPROACH: Quick port check first
         # If port is closed, server is not running at all - skip immediately
         # If port is open, server is starting/running - use retry logic
@@ -195,17 +268,8 @@ class LocalProvider(AIProviderInterface):
                 if self.auth_token:
                     await self._authenticate()
                     logger.info("🔐 Authenticated to Local AI Server", url=self.ws_url)
-                
-                # Cancel old tasks and restart listener/sender loops on new connection
-                if self._listener_task and not self._listener_task.done():
-                    self._listener_task.cancel()
-                    logger.debug("Cancelled old listener task before restart")
-                if self._sender_task and not self._sender_task.done():
-                    self._sender_task.cancel()
-                    logger.debug("Cancelled old sender task before restart")
-                
-                self._listener_task = asyncio.create_task(self._receive_loop())
-                self._sender_task = asyncio.create_task(self._send_loop())
+                await self._negotiate()
+                self._restart_loops()
                 logger.info("✅ Reconnected to Local AI Server, restarting receive loop")
                 return True
                 
@@ -339,6 +403,25 @@ class LocalProvider(AIProviderInterface):
 
     async def start_session(self, call_id: str, context: Optional[Dict[str, Any]] = None):
         try:
+            if self._pool is not None:
+                channel = self.websocket
+                if not (
+                    isinstance(channel, LocalAIChannel)
+                    and channel.call_id == call_id
+                    and channel.state.name == "OPEN"
+                ):
+                    try:
+                        await self._open_channel(call_id)
+                    except Exception as exc:
+                        logger.warning(
+                            "Shared pool unavailable, using a dedicated connection",
+                            call_id=call_id,
+                            error=str(exc) or type(exc).__name__,
+                        )
+                if isinstance(self.websocket, LocalAIChannel) and self.websocket.state.name == "OPEN":
+                    self._active_call_id = call_id
+                    return
+
             # Check if already connected
             if self.websocket and self.websocket.state.name == "OPEN":
                 logger.debug("WebSocket already connected, reusing connection", call_id=call_id)
@@ -411,14 +494,17 @@ class LocalProvider(AIProviderInterface):
                              total_bytes=total_bytes,
                              input_mode=self.input_mode)
                 
-                msg = json.dumps({
-                    "type": "audio", 
-                    "data": base64.b64encode(pcm16k).decode('utf-8'),
-                    "rate": 16000,
-                    "format": "pcm16le",
-                    "call_id": self._active_call_id,
-                    "mode": self._mode  # "stt" for hybrid, "full" for all-local
-                })
+                if self._frames_version is not None and self._active_call_id:
+                    msg = await self._audio_frame(pcm16k)
+                else:
+                    msg = json.dumps({
+                        "type": "audio", 
+                        "data": base64.b64encode(pcm16k).decode('utf-8'),
+                        "rate": 16000,
+                        "format": "pcm16le",
+                        "call_id": self._active_call_id,
+                        "mode": self._mode  # "stt" for hybrid, "full" for all-local
+                    })
                 try:
                     await self.websocket.send(msg)
                     logger.debug("WebSocket batch send successful", 
@@ -431,7 +517,10 @@ class LocalProvider(AIProviderInterface):
                                    code=getattr(e, 'code', None), 
                                    reason=getattr(e, 'reason', None))
                     ok = await self._reconnect()
-                    if ok:
+                    if ok and isinstance(msg, bytes):
+                        # The new connection has not negotiated frames yet; drop this batch.
+                        logger.debug("Dropping framed audio batch across reconnect", frames=len(batch))
+                    elif ok:
                         try:
                             await self.websocket.send(msg)
                             logger.debug("WebSocket resend after reconnect successful", frames=len(batch))
@@ -447,6 +536,21 @@ class LocalProvider(AIProviderInterface):
                 logger.error("Sender loop error", exc_info=True)
                 await asyncio.sleep(0.1)
 
+    async def _audio_frame(self, pcm16k: bytes) -> bytes:
+        """Binary frame for one STT batch; frames carry no mode, so bind the call first."""
+        call_id = self._active_call_id
+        if call_id != self._frames_call_id:
+            await self.websocket.send(
+                json.dumps({"type": "set_mode", "mode": self._mode, "call_id": call_id})
+            )
+            self._frames_call_id = call_id
+            self._frame_seq = 0
+        seq = self._frame_seq
+        self._frame_seq = (seq + 1) & 0xFFFFFFFF
+        return encode_frame(
+            FRAME_KIND_AUDIO, pcm16k, call_hash=call_hash(call_id), seq=seq, rate_hz=16000
+        )
+
     def set_input_mode(self, mode: str):
         # mode: 'mulaw8k' or 'pcm16_8k'
         self.input_mode = mode
@@ -474,6 +578,8 @@ class LocalProvider(AIProviderInterface):
                 "type": "tts_request",
                 "call_id": call_id,
                 "text": greeting_text,
+                # Jump ahead of other calls' long responses in the server's TTS queue.
+                "priority": "high",
             }
 
             await self.websocket.send(json.dumps(tts_message))
@@ -509,11 +615,29 @@ class LocalProvider(AIProviderInterface):
                 except asyncio.QueueEmpty:
                     break
         
+        # A pooled channel is per call: hand its capacity back and end the
+        # server-side session (the shared connection itself stays up).
+        if isinstance(self.websocket, LocalAIChannel):
+            if self._sender_task and not self._sender_task.done():
+                self._sender_task.cancel()
+            await self.websocket.close()
+            logger.info("Provider session stopped, pooled Local AI Server channel released.")
+            return
+
         # DON'T clear the active call ID immediately - keep it for AgentAudio processing
         # The call_id will be cleared when the TTS playback is complete
         # self._active_call_id = None
         logger.info("Provider session stopped, WebSocket connection and listener maintained. Call ID preserved for TTS processing.")
 
+    async def cancel_tts(self, call_id: str) -> None:
+        """Barge-in: drop TTS the Local AI Server still has queued or in flight for this call."""
+        if not self.websocket or self.websocket.state.name != "OPEN":
+            return
+        try:
+            await self.websocket.send(json.dumps({"type": "barge_in", "call_id": call_id}))
+        except Exception:
+            logger.debug("Failed to send barge_in to Local AI Server", call_id=call_id, exc_info=True)
+
     async def clear_active_call_id(self):
         """Clear the active call ID after TTS playback is complete."""
         self._active_call_id = None
@@ -526,12 +650,36 @@ class LocalProvider(AIProviderInterface):
             async for message in self.websocket:
                 # Handle binary messages (raw audio)
                 if isinstance(message, bytes):
+                    # local-ai-server synthesizes µ-law @ 8 kHz; frames state it explicitly.
+                    encoding, sample_rate = "mulaw", 8000
+                    if self._frames_version is not None:
+                        try:
+                            frame = decode_frame(message)
+                        except ValueError as exc:
+                            logger.warning("Dropping malformed audio frame from Local AI Server", error=str(exc))
+                            continue
+                        if frame.kind != FRAME_KIND_TTS_AUDIO:
+                            continue
+                        if frame.response:
+                            # Delivered with its tts_response, which follows right after.
+                            self._tts_frames[(frame.call_hash, frame.seq)] = frame.payload
+                            while len(self._tts_frames) > 32:
+                                self._tts_frames.pop(next(iter(self._tts_frames)))
+                            continue
+                        message = frame.payload
+                        encoding, sample_rate = frame.codec, frame.rate_hz
                     # Safety guard: drop AgentAudio if no active call
                     if self._active_call_id is None:
                         logger.debug("Dropping AgentAudio - no active call", message_size=len(message))
                         continue
                     
-                    audio_event = {'type': 'AgentAudio', 'data': message, 'call_id': self._active_call_id}
+                    audio_event = {
+                        'type': 'AgentAudio',
+                        'data': message,
+                        'call_id': self._active_call_id,
+                        'encoding': encoding,
+                        'sample_rate': sample_rate,
+                    }
                     if self.on_event:
                         await self.on_event(audio_event)
                         # Heuristic: treat each binary message as a complete utterance
@@ -546,8 +694,17 @@ class LocalProvider(AIProviderInterface):
                 elif isinstance(message, str):
                     try:
                         data = json.loads(message)
+                        if data.get("type") == "negotiate_response":
+                            self._frames_version = negotiated_version(data)
+                            logger.info(
+                                "Local AI Server audio transport negotiated",
+                                binary_frames=self._frames_version is not None,
+                            )
+                            continue
                         # Handle TTS responses
                         if data.get("type") == "tts_response":
+                            audio_bytes = self._tts_response_audio(data)
+                            data["audio_bytes"] = audio_bytes
                             # Find the pending TTS response and complete it
                             text = data.get("text", "")
                             if text in self._pending_tts_responses:
@@ -560,40 +717,34 @@ class LocalProvider(AIProviderInterface):
                             else:
                                 logger.warning("TTS response received but no pending request found", text=text[:50])
 
-                            # Additionally, if the TTS response carries base64 audio, decode and emit as AgentAudio
-                            audio_b64 = data.get("audio_data") or data.get("audio")
-                            if audio_b64:
-                                try:
-                                    audio_bytes = base64.b64decode(audio_b64)
-                                except Exception:
-                                    logger.warning("Invalid base64 in tts_response from Local AI Server")
-                                    audio_bytes = b""
-
-                                if audio_bytes and self.on_event:
-                                    target_call_id = data.get("call_id") or self._active_call_id
-                                    if target_call_id:
-                                        try:
-                                            await self.on_event({
-                                                "type": "AgentAudio",
-                                                "data": audio_bytes,
-                                                "call_id": target_call_id,
-                                            })
+                            # Additionally, if the TTS response carries audio, emit it as AgentAudio
+                            if audio_bytes and self.on_event:
+                                target_call_id = data.get("call_id") or self._active_call_id
+                                if target_call_id:
+                                    try:
+                                        await self.on_event({
+                                            "type": "AgentAudio",
+                                            "data": audio_bytes,
+                                            "call_id": target_call_id,
+                                            "encoding": data.get("encoding") or "mulaw",
+                                            "sample_rate": int(data.get("sample_rate_hz") or 8000),
+                                        })
+                                        await self.on_event({
+                                            "type": "AgentAudioDone",
+                                            "call_id": target_call_id,
+                                        })
+                                        # Signal farewell TTS received for hangup coordination
+                                        if text and text.lower() == "goodbye":
                                             await self.on_event({
-                                                "type": "AgentAudioDone",
+                                                "type": "FarewellTTSReceived",
                                                 "call_id": target_call_id,
+                                                "audio_size": len(audio_bytes),
                                             })
-                                            # Signal farewell TTS received for hangup coordination
-                                            if text and text.lower() == "goodbye":
-                                                await self.on_event({
-                                                    "type": "FarewellTTSReceived",
-                                                    "call_id": target_call_id,
-                                                    "audio_size": len(audio_bytes),
-                                                })
-                                                logger.info("🎤 Farewell TTS audio emitted", call_id=target_call_id, audio_size=len(audio_bytes))
-                                        except Exception:
-                                            logger.error("Failed to emit AgentAudio(/Done) for tts_response", exc_info=True)
-                                    else:
-                                        logger.debug("Dropping TTS audio - no active call to attribute", size=len(audio_bytes))
+                                            logger.info("🎤 Farewell TTS audio emitted", call_id=target_call_id, audio_size=len(audio_bytes))
+                                    except Exception:
+                                        logger.error("Failed to emit AgentAudio(/Done) for tts_response", exc_info=True)
+                                else:
+                                    logger.debug("Dropping TTS audio - no active call to attribute", size=len(audio_bytes))
                         elif data.get("type") == "stt_result":
                             # Handle STT result - emit as transcript for conversation history
                             text = data.get("text", "").strip()
@@ -675,6 +826,23 @@ class LocalProvider(AIProviderInterface):
         except Exception:
             logger.error("Error receiving events from Local AI Server", exc_info=True)
 
+    def _tts_response_audio(self, data: Dict[str, Any]) -> bytes:
+        """Audio for a tts_response: inline base64, or the binary frame it names."""
+        if data.get("audio_transport") == "frame":
+            key = (call_hash(data.get("call_id") or ""), data.get("frame_seq"))
+            audio = self._tts_frames.pop(key, None)
+            if audio is None:
+                logger.warning("tts_response names a frame that was not received", frame_seq=data.get("frame_seq"))
+            return audio or b""
+        audio_b64 = data.get("audio_data") or data.get("audio")
+        if not audio_b64:
+            return b""
+        try:
+            return base64.b64decode(audio_b64)
+        except Exception:
+            logger.warning("Invalid base64 in tts_response from Local AI Server")
+            return b""
+
     async def speak(self, text: str):
         # This provider works by streaming STT->LLM->TTS on the server side.
         # Direct speech injection is not the primary mode of operation.
@@ -705,9 +873,8 @@ class LocalProvider(AIProviderInterface):
                 # Wait for response with timeout
                 response_data = await asyncio.wait_for(response_future, timeout=self.response_timeout)
                 
-                if response_data.get("type") == "tts_response" and response_data.get("audio_data"):
-                    # Decode base64 audio data
-                    audio_data = base64.b64decode(response_data["audio_data"])
+                audio_data = response_data.get("audio_bytes")
+                if response_data.get("type") == "tts_response" and audio_data:
                     logger.info("Received TTS audio data", size=len(audio_data))
                     return audio_data
                 else:
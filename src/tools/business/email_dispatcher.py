@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import os
+import smtplib
 from typing import Any, Dict, Optional
 
 import structlog
 
+from src.core.post_call_jobs import PermanentJobError, get_post_call_queue, idempotency_key
 from src.tools.business.resend_client import send_email as send_resend_email
 from src.tools.business.smtp_client import send_email as send_smtp_email
 
@@ -46,8 +48,14 @@ async def send_email(
     call_id: str,
     log_label: str,
     recipient: str,
+    dedupe: bool = True,
+    raise_errors: bool = False,
+    max_retries: Optional[int] = None,
 ) -> Optional[Dict[str, Any]]:
     provider = _provider_from_config(tool_config)
+    opts: Dict[str, Any] = {"dedupe": dedupe, "raise_errors": raise_errors}
+    if max_retries is not None:
+        opts["max_retries"] = max_retries
 
     if provider == "smtp":
         return await send_smtp_email(
@@ -55,6 +63,7 @@ async def send_email(
             call_id=call_id,
             log_label=log_label,
             recipient=recipient,
+            **opts,
         )
 
     if provider == "resend":
@@ -63,6 +72,7 @@ async def send_email(
             call_id=call_id,
             log_label=log_label,
             recipient=recipient,
+            **opts,
         )
 
     if provider == "auto":
@@ -72,6 +82,7 @@ async def send_email(
                 call_id=call_id,
                 log_label=log_label,
                 recipient=recipient,
+                **opts,
             )
         if _resend_configured():
             return await send_resend_email(
@@ -79,8 +90,11 @@ async def send_email(
                 call_id=call_id,
                 log_label=log_label,
                 recipient=recipient,
+                **opts,
             )
         logger.error("No email provider configured (SMTP_HOST or RESEND_API_KEY required)", call_id=call_id)
+        if raise_errors:
+            raise RuntimeError("No email provider configured")
         return None
 
     logger.warning("Unknown email provider; falling back to Resend", call_id=call_id, provider=provider)
@@ -89,5 +103,76 @@ async def send_email(
         call_id=call_id,
         log_label=log_label,
         recipient=recipient,
+        **opts,
     )
 
+
+async def deliver_email(
+    *,
+    email_data: Dict[str, Any],
+    tool_config: Dict[str, Any],
+    call_id: str,
+    log_label: str,
+    recipient: str,
+) -> Optional[Dict[str, Any]]:
+    """
+    Send a post-call email through the durable job queue when it is running.
+
+    The job is keyed by (label, call, recipient, subject), so a repeated request for the
+    same email is a no-op. Without a running queue (disabled, or outside the engine)
+    the email is sent inline as before.
+    """
+    queue = get_post_call_queue()
+    if queue is not None:
+        key = idempotency_key(
+            "email", log_label, call_id, email_data.get("to") or recipient, email_data.get("subject") or ""
+        )
+        try:
+            job_id = await queue.enqueue(
+                "email",
+                {
+                    "email_data": email_data,
+                    "provider": _provider_from_config(tool_config),
+                    "call_id": call_id,
+                    "log_label": log_label,
+                    "recipient": recipient,
+                },
+                idempotency_key=key,
+                call_id=call_id,
+            )
+            return {"queued": True, "job_id": job_id}
+        except Exception:
+            logger.warning("Failed to queue post-call email; sending inline", call_id=call_id, exc_info=True)
+    return await send_email(
+        email_data=email_data,
+        tool_config=tool_config,
+        call_id=call_id,
+        log_label=log_label,
+        recipient=recipient,
+    )
+
+
+def _is_permanent_email_error(exc: Exception) -> bool:
+    if isinstance(exc, (ValueError, smtplib.SMTPRecipientsRefused)):
+        return True
+    code = getattr(exc, "smtp_code", None)
+    return isinstance(code, int) and 500 <= code < 600
+
+
+async def run_email_job(payload: Dict[str, Any]) -> None:
+    """Post-call job handler for kind ``email``: one attempt; the queue owns retries and dead-lettering."""
+    try:
+        await send_email(
+            email_data=dict(payload.get("email_data") or {}),
+            tool_config={"provider": payload.get("provider") or "resend"},
+            call_id=str(payload.get("call_id") or ""),
+            log_label=str(payload.get("log_label") or "Email"),
+            recipient=str(payload.get("recipient") or ""),
+            dedupe=False,
+            raise_errors=True,
+            max_retries=0,
+        )
+    except Exception as exc:
+        if _is_permanent_email_error(exc):
+            raise PermanentJobError(f"{type(exc).__name__}: {exc}") from exc
+        raise
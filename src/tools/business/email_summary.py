@@ -18,7 +18,7 @@ except Exception:
 
 from src.tools.base import Tool, ToolDefinition, ToolCategory, ToolParameter
 from src.tools.context import ToolExecutionContext
-from src.tools.business.email_dispatcher import send_email, resolve_context_value
+from src.tools.business.email_dispatcher import deliver_email, resolve_context_value
 from src.tools.business.email_templates import DEFAULT_SEND_EMAIL_SUMMARY_HTML_TEMPLATE
 from src.tools.business.template_renderer import render_html_template_with_fallback
 
@@ -246,14 +246,14 @@ class SendEmailSummaryTool(Tool):
         return safe.replace("\n", "<br/>\n")
     
     async def _send_email_async(self, email_data: Dict[str, Any], call_id: str, tool_config: Dict[str, Any]):
-        """Send email asynchronously via configured provider."""
+        """Queue the email on the post-call job queue (or send it inline) via the configured provider."""
         try:
             logger.info(
                 "Sending email summary",
                 call_id=call_id,
                 recipient=email_data["to"]
             )
-            await send_email(
+            await deliver_email(
                 email_data=email_data,
                 tool_config=tool_config,
                 call_id=call_id,
@@ -20,7 +20,7 @@ except Exception:
 from src.tools.base import Tool, ToolDefinition, ToolCategory, ToolParameter
 from src.tools.context import ToolExecutionContext
 from src.utils.email_validator import EmailValidator
-from src.tools.business.email_dispatcher import send_email, resolve_context_value
+from src.tools.business.email_dispatcher import deliver_email, resolve_context_value
 from src.tools.business.email_templates import DEFAULT_REQUEST_TRANSCRIPT_HTML_TEMPLATE
 from src.tools.business.template_renderer import render_html_template_with_fallback
 
@@ -402,7 +402,7 @@ class RequestTranscriptTool(Tool):
         return safe.replace("\n", "<br/>\n")
     
     async def _send_transcript_async(self, email_data: Dict[str, Any], call_id: str, tool_config: Dict[str, Any]):
-        """Send transcript email asynchronously via configured provider."""
+        """Queue the transcript email on the post-call job queue (or send it inline) via the configured provider."""
         try:
             logger.info(
                 "Sending transcript",
@@ -410,7 +410,7 @@ class RequestTranscriptTool(Tool):
                 recipient=email_data["to"],
                 bcc=email_data.get("bcc")
             )
-            await send_email(
+            await deliver_email(
                 email_data=email_data,
                 tool_config=tool_config,
                 call_id=call_id,
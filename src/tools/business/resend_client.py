@@ -85,21 +85,28 @@ async def send_email(
     log_label: str,
     recipient: str,
     max_retries: int = 3,
+    dedupe: bool = True,
+    raise_errors: bool = False,
 ) -> Optional[Dict[str, Any]]:
     """
     Send email via Resend with a simple process-wide rate limiter.
 
     Resend enforces 2 requests/second on many plans; outbound tooling can trigger multiple
     email sends back-to-back (summary + transcript). We serialize + retry to avoid 429s.
+    ``dedupe``/``raise_errors`` behave as in ``smtp_client.send_email``.
     """
     if resend is None:
         logger.error("Resend SDK not available (pip install resend)", call_id=call_id)
+        if raise_errors:
+            raise RuntimeError("Resend SDK not available")
         return None
     if not _ensure_api_key():
         logger.error("RESEND_API_KEY not configured", call_id=call_id)
+        if raise_errors:
+            raise RuntimeError("RESEND_API_KEY not configured")
         return None
 
-    if not await _dedupe_should_send(email_data, call_id=call_id, log_label=log_label, recipient=recipient):
+    if dedupe and not await _dedupe_should_send(email_data, call_id=call_id, log_label=log_label, recipient=recipient):
         logger.info(
             f"{log_label} duplicate suppressed",
             call_id=call_id,
@@ -138,6 +145,8 @@ async def send_email(
                 call_id=call_id,
                 recipient=recipient,
                 error=str(exc),
-                exc_info=True,
+                exc_info=not raise_errors,
             )
+            if raise_errors:
+                raise
             return None
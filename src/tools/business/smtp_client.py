@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import os
 import smtplib
 import ssl
+import threading
 import time
 from email.message import EmailMessage
 from email.utils import make_msgid
@@ -125,7 +127,7 @@ def _build_message(email_data: Dict[str, Any]) -> EmailMessage:
     return msg
 
 
-def _smtp_send_sync(msg: EmailMessage) -> None:
+def _smtp_settings() -> Dict[str, Any]:
     host = str(os.getenv("SMTP_HOST") or "").strip()
     if not host:
         raise RuntimeError("SMTP_HOST not configured")
@@ -149,34 +151,161 @@ def _smtp_send_sync(msg: EmailMessage) -> None:
     else:
         port = 465 if tls_mode == "smtps" else 587
 
-    timeout_s = float(os.getenv("SMTP_TIMEOUT_SECONDS", "10") or "10")
-    tls_verify = str(os.getenv("SMTP_TLS_VERIFY", "true") or "true").strip().lower() in {"1", "true", "yes", "on"}
-
+    return {
+        "host": host,
+        "port": port,
+        "tls_mode": tls_mode,
+        "username": username,
+        "password": password,
+        "timeout_s": float(os.getenv("SMTP_TIMEOUT_SECONDS", "10") or "10"),
+        "tls_verify": str(os.getenv("SMTP_TLS_VERIFY", "true") or "true").strip().lower()
+        in {"1", "true", "yes", "on"},
+    }
+
+
+@functools.lru_cache(maxsize=2)
+def _ssl_context(tls_verify: bool) -> ssl.SSLContext:
+    # Loading the CA bundle costs tens of ms of CPU; build each variant once.
     context = ssl.create_default_context()
     if not tls_verify:
         context.check_hostname = False
         context.verify_mode = ssl.CERT_NONE
+    return context
 
-    recipients = getattr(msg, "_aava_all_recipients", None)  # type: ignore[attr-defined]
-    if not recipients:
-        recipients = _as_addr_list(msg.get("To")) + _as_addr_list(msg.get("Cc")) + _as_addr_list(msg.get("Bcc"))
 
-    if tls_mode == "smtps":
-        with smtplib.SMTP_SSL(host=host, port=port, timeout=timeout_s, context=context) as smtp:
+def _smtp_connect(settings: Dict[str, Any]) -> smtplib.SMTP:
+    host, port, timeout_s = settings["host"], settings["port"], settings["timeout_s"]
+    if settings["tls_mode"] == "smtps":
+        smtp: smtplib.SMTP = smtplib.SMTP_SSL(
+            host=host, port=port, timeout=timeout_s, context=_ssl_context(settings["tls_verify"])
+        )
+    else:
+        smtp = smtplib.SMTP(host=host, port=port, timeout=timeout_s)
+    try:
+        smtp.ehlo()
+        if settings["tls_mode"] == "starttls":
+            smtp.starttls(context=_ssl_context(settings["tls_verify"]))
             smtp.ehlo()
-            if username and password:
-                smtp.login(username, password)
+        if settings["username"] and settings["password"]:
+            smtp.login(settings["username"], settings["password"])
+    except Exception:
+        smtp.close()
+        raise
+    return smtp
+
+
+class _SMTPConnectionPool:
+    """
+    Keeps authenticated SMTP sessions open between sends.
+
+    Each new session costs a TCP, TLS and AUTH handshake; a burst of post-call emails
+    reuses up to SMTP_POOL_SIZE idle sessions instead (0 disables pooling). Sessions
+    idle longer than SMTP_POOL_IDLE_SECONDS are closed, since servers drop them anyway,
+    and a reused session the server already dropped is replaced once per send.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._idle: list[tuple[tuple, smtplib.SMTP, float]] = []
+
+    @staticmethod
+    def _max_idle() -> int:
+        try:
+            return max(0, int(os.getenv("SMTP_POOL_SIZE", "4") or "4"))
+        except Exception:
+            return 4
+
+    @staticmethod
+    def _idle_seconds() -> float:
+        try:
+            return float(os.getenv("SMTP_POOL_IDLE_SECONDS", "30") or "30")
+        except Exception:
+            return 30.0
+
+    @staticmethod
+    def _key(settings: Dict[str, Any]) -> tuple:
+        return tuple(settings[k] for k in ("host", "port", "tls_mode", "username", "password", "tls_verify"))
+
+    @staticmethod
+    def _discard(smtp: smtplib.SMTP) -> None:
+        try:
+            smtp.quit()
+        except Exception:
+            try:
+                smtp.close()
+            except Exception:
+                pass
+
+    def _acquire(self, key: tuple) -> Optional[smtplib.SMTP]:
+        now = time.monotonic()
+        max_age = self._idle_seconds()
+        stale: list[smtplib.SMTP] = []
+        found: Optional[smtplib.SMTP] = None
+        with self._lock:
+            keep = []
+            for entry in self._idle:
+                if now - entry[2] > max_age:
+                    stale.append(entry[1])
+                elif found is None and entry[0] == key:
+                    found = entry[1]
+                else:
+                    keep.append(entry)
+            self._idle = keep
+        for smtp in stale:
+            self._discard(smtp)
+        return found
+
+    def _release(self, key: tuple, smtp: smtplib.SMTP) -> None:
+        with self._lock:
+            if len(self._idle) < self._max_idle():
+                self._idle.append((key, smtp, time.monotonic()))
+                return
+        self._discard(smtp)
+
+    def send(self, msg: EmailMessage, recipients: list[str], settings: Dict[str, Any]) -> None:
+        key = self._key(settings)
+        smtp = self._acquire(key)
+        if smtp is not None:
+            try:
+                smtp.send_message(msg, to_addrs=recipients)
+                self._release(key, smtp)
+                return
+            except (smtplib.SMTPServerDisconnected, ConnectionError):
+                self._discard(smtp)
+            except Exception:
+                self._discard(smtp)
+                raise
+        smtp = _smtp_connect(settings)
+        try:
             smtp.send_message(msg, to_addrs=recipients)
-        return
+        except Exception:
+            self._discard(smtp)
+            raise
+        self._release(key, smtp)
+
+    def close(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for _, smtp, _ in idle:
+            self._discard(smtp)
 
-    with smtplib.SMTP(host=host, port=port, timeout=timeout_s) as smtp:
-        smtp.ehlo()
-        if tls_mode == "starttls":
-            smtp.starttls(context=context)
-            smtp.ehlo()
-        if username and password:
-            smtp.login(username, password)
-        smtp.send_message(msg, to_addrs=recipients)
+
+_pool = _SMTPConnectionPool()
+
+
+def close_pool() -> None:
+    """Close pooled SMTP sessions (engine shutdown)."""
+    _pool.close()
+
+
+def _smtp_send_sync(msg: EmailMessage) -> None:
+    settings = _smtp_settings()
+
+    recipients = getattr(msg, "_aava_all_recipients", None)  # type: ignore[attr-defined]
+    if not recipients:
+        recipients = _as_addr_list(msg.get("To")) + _as_addr_list(msg.get("Cc")) + _as_addr_list(msg.get("Bcc"))
+
+    _pool.send(msg, recipients, settings)
 
 
 async def send_email(
@@ -186,15 +315,26 @@ async def send_email(
     log_label: str,
     recipient: str,
     max_retries: int = 1,
+    dedupe: bool = True,
+    raise_errors: bool = False,
 ) -> Optional[Dict[str, Any]]:
+    """
+    Send email via SMTP over a pooled session.
+
+    ``dedupe=False`` skips the in-memory duplicate window (the post-call job queue
+    dedupes durably and must be able to resend after a failed attempt), and
+    ``raise_errors=True`` raises the final error instead of logging it and returning None.
+    """
     if not _smtp_configured():
         logger.error(
             "SMTP not configured (SMTP_HOST missing). Set SMTP_HOST in .env and force-recreate ai_engine to apply env_file changes.",
             call_id=call_id,
         )
+        if raise_errors:
+            raise RuntimeError("SMTP_HOST not configured")
         return None
 
-    if not await _dedupe_should_send(email_data, call_id=call_id, log_label=log_label, recipient=recipient):
+    if dedupe and not await _dedupe_should_send(email_data, call_id=call_id, log_label=log_label, recipient=recipient):
         logger.info(
             f"{log_label} duplicate suppressed",
             call_id=call_id,
@@ -203,7 +343,13 @@ async def send_email(
         )
         return {"skipped": True}
 
-    msg = _build_message(email_data)
+    try:
+        msg = _build_message(email_data)
+    except ValueError:
+        if raise_errors:
+            raise
+        logger.error(f"Invalid {log_label.lower()} email data", call_id=call_id, recipient=recipient, exc_info=True)
+        return None
 
     for attempt in range(max_retries + 1):
         await _limiter.wait_turn()
@@ -235,6 +381,8 @@ async def send_email(
                 call_id=call_id,
                 recipient=recipient,
                 error=str(exc),
-                exc_info=True,
+                exc_info=not raise_errors,
             )
+            if raise_errors:
+                raise
             return None
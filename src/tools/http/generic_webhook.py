@@ -1,7 +1,8 @@
 """
 Generic Webhook Tool - Post-call webhook notifications.
 
-Sends call data to external systems after call ends (fire-and-forget).
+Sends call data to external systems after call ends (via the post-call job queue
+when it is running, otherwise fire-and-forget).
 """
 
 import os
@@ -9,11 +10,12 @@ import re
 import json
 import logging
 import time
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 from dataclasses import dataclass, field
 
 import aiohttp
 
+from src.core.post_call_jobs import PermanentJobError, get_post_call_queue, idempotency_key
 from src.tools.base import PostCallTool, ToolDefinition, ToolCategory, ToolPhase
 from src.tools.context import PostCallContext
 from src.tools.http.debug_trace import (
@@ -31,6 +33,64 @@ try:
 except ImportError:  # pragma: no cover
     openai = None
 
+_ENV_PATTERN = re.compile(r'\$\{([A-Z_][A-Z0-9_]*)\}')
+
+
+def _resolve_env(text: str, *, json_escape: bool = False) -> str:
+    """Replace ${VAR_NAME} with the environment value (JSON-escaped inside payloads)."""
+    def env_replacer(match):
+        value = os.environ.get(match.group(1), "")
+        return json.dumps(value)[1:-1] if json_escape else value
+
+    return _ENV_PATTERN.sub(env_replacer, text)
+
+
+def _resolve_request_env(request: Dict[str, Any]) -> Dict[str, Any]:
+    resolved = dict(request)
+    resolved["url"] = _resolve_env(request["url"])
+    resolved["headers"] = {k: _resolve_env(v) for k, v in (request.get("headers") or {}).items()}
+    if request.get("body_env") and request.get("body"):
+        resolved["body"] = _resolve_env(request["body"], json_escape=True)
+    return resolved
+
+
+async def _send_request(request: Dict[str, Any]) -> Tuple[int, str]:
+    """Send a resolved webhook request; returns (status, body text). Transport errors propagate."""
+    timeout = aiohttp.ClientTimeout(total=float(request.get("timeout_ms") or 5000) / 1000.0)
+    async with aiohttp.ClientSession(timeout=timeout) as session:
+        async with session.request(
+            method=request.get("method") or "POST",
+            url=request["url"],
+            headers=request.get("headers") or {},
+            data=request.get("body"),
+        ) as response:
+            status = response.status
+            body_text = ""
+            try:
+                body_text = await response.text()
+            except Exception as e:
+                logger.debug(f"Failed to read response body: {e}")
+            return status, body_text
+
+
+async def run_webhook_job(payload: Dict[str, Any]) -> None:
+    """
+    Post-call job handler for kind ``webhook``.
+
+    Non-2xx responses raise so the queue retries them; 4xx other than 408/429 will not
+    succeed on retry and are dead-lettered immediately.
+    """
+    request = _resolve_request_env(payload)
+    name = request.get("name") or "webhook"
+    status, body_text = await _send_request(request)
+    if 200 <= status < 300:
+        logger.info(f"Webhook sent successfully: {name} status={status}")
+        return
+    error = f"{name} returned status={status} body={(body_text or '')[:200]}"
+    if 400 <= status < 500 and status not in (408, 429):
+        raise PermanentJobError(error)
+    raise RuntimeError(error)
+
 
 @dataclass
 class WebhookConfig:
@@ -62,7 +122,8 @@ class GenericWebhookTool(PostCallTool):
     Generic webhook tool for post-call notifications.
     
     Configured via YAML, sends call data to external endpoints
-    after the call ends. Fire-and-forget (no retry).
+    after the call ends. With the post-call job queue running the request is queued
+    durably and retried with backoff; otherwise it is sent once, fire-and-forget.
     
     Example config:
     ```yaml
@@ -132,10 +193,13 @@ class GenericWebhookTool(PostCallTool):
             if self.config.generate_summary and not context.summary:
                 context.summary = await self._generate_summary(context)
             
-            # Build request
-            url = self._substitute_variables(self.config.url, context)
+            # Build request. With the post-call job queue running, ${ENV} references are left
+            # in place and resolved when the job runs, so secrets are never persisted.
+            queue = get_post_call_queue()
+            resolve_env = queue is None
+            url = self._substitute_variables(self.config.url, context, resolve_env=resolve_env)
             headers = {
-                k: self._substitute_variables(v, context)
+                k: self._substitute_variables(v, context, resolve_env=resolve_env)
                 for k, v in self.config.headers.items()
             }
             
@@ -146,7 +210,7 @@ class GenericWebhookTool(PostCallTool):
             # Build payload
             payload = None
             if self.config.payload_template:
-                payload = self._build_payload(context)
+                payload = self._build_payload(context, resolve_env=resolve_env)
             else:
                 # Default payload using context's to_payload_dict
                 payload = json.dumps(context.to_payload_dict())
@@ -178,62 +242,75 @@ class GenericWebhookTool(PostCallTool):
                     ),
                     getattr(context, "call_id", None),
                 )
+
+            request = {
+                "name": self.config.name,
+                "method": self.config.method,
+                "url": url,
+                "headers": headers,
+                "body": payload,
+                "body_env": bool(self.config.payload_template),
+                "timeout_ms": self.config.timeout_ms,
+                "call_id": getattr(context, "call_id", None),
+            }
+            if queue is not None:
+                try:
+                    await queue.enqueue(
+                        "webhook",
+                        request,
+                        idempotency_key=idempotency_key("webhook", self.config.name, request["call_id"]),
+                        call_id=request["call_id"],
+                    )
+                    logger.info(f"Webhook queued: {self.config.name} {self.config.method} {self._redact_url(url)}")
+                    return
+                except Exception as e:
+                    logger.warning(f"Failed to queue webhook, sending inline: {self.config.name} error={e}")
+                    request = _resolve_request_env(request)
+                    url = request["url"]
             
             logger.info(f"Sending webhook: {self.config.name} {self.config.method} {self._redact_url(url)}")
             
             # Make request (fire-and-forget)
-            timeout = aiohttp.ClientTimeout(total=self.config.timeout_ms / 1000.0)
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                async with session.request(
-                    method=self.config.method,
-                    url=url,
-                    headers=headers,
-                    data=payload,
-                ) as response:
-                    status = response.status
-                    body_text = ""
-                    try:
-                        body_text = await response.text()
-                    except Exception as e:
-                        logger.debug(f"Failed to read response body: {e}")
-                    
-                    if 200 <= status < 300:
-                        logger.info(f"Webhook sent successfully: {self.config.name} status={status}")
-                        if debug_enabled(logger):
-                            elapsed_ms = round((time.monotonic() - started) * 1000, 2)
-                            logger.debug(
-                                "[HTTP_TOOL_TRACE] response_ok post_call tool=%s status=%s elapsed_ms=%s body_preview=%s call_id=%s",
-                                self.config.name,
-                                status,
-                                elapsed_ms,
-                                preview(body_text),
-                                getattr(context, "call_id", None),
-                            )
-                    else:
-                        # Log but don't fail (fire-and-forget)
-                        body_preview = (body_text[:200] if body_text else "")
-                        logger.warning(
-                            f"Webhook returned non-2xx: {self.config.name} status={status} body={body_preview}"
-                        )
-                        if debug_enabled(logger):
-                            elapsed_ms = round((time.monotonic() - started) * 1000, 2)
-                            logger.debug(
-                                "[HTTP_TOOL_TRACE] response_non_2xx post_call tool=%s status=%s elapsed_ms=%s body_preview=%s call_id=%s",
-                                self.config.name,
-                                status,
-                                elapsed_ms,
-                                preview(body_text),
-                                getattr(context, "call_id", None),
-                            )
+            status, body_text = await _send_request(request)
+            if 200 <= status < 300:
+                logger.info(f"Webhook sent successfully: {self.config.name} status={status}")
+                if debug_enabled(logger):
+                    elapsed_ms = round((time.monotonic() - started) * 1000, 2)
+                    logger.debug(
+                        "[HTTP_TOOL_TRACE] response_ok post_call tool=%s status=%s elapsed_ms=%s body_preview=%s call_id=%s",
+                        self.config.name,
+                        status,
+                        elapsed_ms,
+                        preview(body_text),
+                        getattr(context, "call_id", None),
+                    )
+            else:
+                # Log but don't fail (fire-and-forget)
+                body_preview = (body_text[:200] if body_text else "")
+                logger.warning(
+                    f"Webhook returned non-2xx: {self.config.name} status={status} body={body_preview}"
+                )
+                if debug_enabled(logger):
+                    elapsed_ms = round((time.monotonic() - started) * 1000, 2)
+                    logger.debug(
+                        "[HTTP_TOOL_TRACE] response_non_2xx post_call tool=%s status=%s elapsed_ms=%s body_preview=%s call_id=%s",
+                        self.config.name,
+                        status,
+                        elapsed_ms,
+                        preview(body_text),
+                        getattr(context, "call_id", None),
+                    )
         
         except aiohttp.ClientError as e:
             logger.warning(f"Webhook request failed: {self.config.name} error={e}")
         except Exception as e:
             logger.error(f"Webhook unexpected error: {self.config.name} error={e}", exc_info=True)
     
-    def _build_payload(self, context: PostCallContext) -> str:
+    def _build_payload(self, context: PostCallContext, *, resolve_env: bool = True) -> str:
         """
         Build payload from template with variable substitution.
+
+        With ``resolve_env=False`` ${ENV} references are kept for ``_resolve_env`` at send time.
         """
         template = self.config.payload_template or "{}"
         
@@ -265,17 +342,12 @@ class GenericWebhookTool(PostCallTool):
                     result = result.replace(placeholder, escaped)
         
         # Environment variables: ${VAR_NAME}
-        env_pattern = r'\$\{([A-Z_][A-Z0-9_]*)\}'
-        def env_replacer(match):
-            var_name = match.group(1)
-            value = os.environ.get(var_name, "")
-            return json.dumps(value)[1:-1]  # Escape for JSON
-        
-        result = re.sub(env_pattern, env_replacer, result)
+        if resolve_env:
+            result = _resolve_env(result, json_escape=True)
         
         return result
     
-    def _substitute_variables(self, template: str, context: PostCallContext) -> str:
+    def _substitute_variables(self, template: str, context: PostCallContext, *, resolve_env: bool = True) -> str:
         """
         Substitute variables in URL/headers.
         """
@@ -298,12 +370,8 @@ class GenericWebhookTool(PostCallTool):
             result = result.replace(placeholder, value)
         
         # Environment variables: ${VAR_NAME}
-        env_pattern = r'\$\{([A-Z_][A-Z0-9_]*)\}'
-        def env_replacer(match):
-            var_name = match.group(1)
-            return os.environ.get(var_name, "")
-        
-        result = re.sub(env_pattern, env_replacer, result)
+        if resolve_env:
+            result = _resolve_env(result)
         
         return result
     
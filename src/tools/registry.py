@@ -41,7 +41,21 @@ class ToolRegistry:
             cls._instance._tools: Dict[str, Tool] = {}
             cls._instance._initialized = False
             cls._instance._in_call_http_init_cache: Set[str] = set()
+            # Bumped on every register/unregister; keys the compiled-schema memo below
+            # and the engine's per-context session bundles.
+            cls._instance.generation = 0
+            cls._instance._compiled: Dict[tuple, List[Any]] = {}
         return cls._instance
+
+    def _changed(self) -> None:
+        self.generation += 1
+        self._compiled = {}
+
+    def _memo(self, key: tuple, build) -> List[Any]:
+        compiled = self._compiled.get(key)
+        if compiled is None:
+            compiled = self._compiled[key] = build()
+        return list(compiled)
     
     def register(self, tool_class: Type[Tool]) -> None:
         """
@@ -60,6 +74,7 @@ class ToolRegistry:
             logger.warning(f"Tool {tool_name} already registered, overwriting")
         
         self._tools[tool_name] = tool
+        self._changed()
         logger.info(f"✅ Registered tool: {tool_name} ({tool.definition.category.value})")
 
     def register_instance(self, tool: Tool) -> None:
@@ -70,6 +85,7 @@ class ToolRegistry:
         if tool_name in self._tools:
             logger.warning(f"Tool {tool_name} already registered, overwriting")
         self._tools[tool_name] = tool
+        self._changed()
         logger.info(f"✅ Registered tool: {tool_name} ({tool.definition.category.value})")
 
     def get(self, name: str) -> Optional[Tool]:
@@ -129,6 +145,7 @@ class ToolRegistry:
         """Unregister a tool by exact name (no alias resolution)."""
         if name in self._tools:
             self._tools.pop(name, None)
+            self._changed()
             logger.info(f"🗑️ Unregistered tool: {name}")
             return True
         return False
@@ -261,6 +278,22 @@ class ToolRegistry:
         Returns:
             List of tools to execute for this context and phase
         """
+        key = (
+            "context",
+            phase,
+            tuple(context_tool_names) if context_tool_names else (),
+            tuple(disabled_global_tools) if disabled_global_tools else (),
+        )
+        return self._memo(
+            key, lambda: self._resolve_tools_for_context(phase, context_tool_names, disabled_global_tools)
+        )
+
+    def _resolve_tools_for_context(
+        self,
+        phase: ToolPhase,
+        context_tool_names: Optional[List[str]],
+        disabled_global_tools: Optional[List[str]],
+    ) -> List[Tool]:
         disabled = set(disabled_global_tools or [])
         
         # Start with global tools for this phase (minus opt-outs)
@@ -303,6 +336,20 @@ class ToolRegistry:
             tools.append(tool)
         return tools
 
+    def _schemas_filtered(self, fmt: str, tool_names: Optional[List[str]]) -> List[Dict]:
+        """
+        Provider schemas for ``tool_names``, built once per registry generation.
+
+        The schema dicts are shared between calls and must be treated as read-only.
+        """
+        names = None if tool_names is None else tuple(tool_names)
+
+        def build() -> List[Dict]:
+            method = f"to_{fmt}_schema"
+            return [getattr(tool.definition, method)() for tool in self._iter_tools_filtered(names)]
+
+        return self._memo(("schema", fmt, names), build)
+
     def to_deepgram_schema(self) -> List[Dict]:
         """
         Export all tools in Deepgram Voice Agent format.
@@ -313,7 +360,7 @@ class ToolRegistry:
         return [tool.definition.to_deepgram_schema() for tool in self._tools.values()]
 
     def to_deepgram_schema_filtered(self, tool_names: Optional[List[str]]) -> List[Dict]:
-        return [tool.definition.to_deepgram_schema() for tool in self._iter_tools_filtered(tool_names)]
+        return self._schemas_filtered("deepgram", tool_names)
     
     def to_openai_schema(self) -> List[Dict]:
         """
@@ -325,7 +372,7 @@ class ToolRegistry:
         return [tool.definition.to_openai_schema() for tool in self._tools.values()]
 
     def to_openai_schema_filtered(self, tool_names: Optional[List[str]]) -> List[Dict]:
-        return [tool.definition.to_openai_schema() for tool in self._iter_tools_filtered(tool_names)]
+        return self._schemas_filtered("openai", tool_names)
     
     def to_openai_realtime_schema(self) -> List[Dict]:
         """
@@ -337,7 +384,7 @@ class ToolRegistry:
         return [tool.definition.to_openai_realtime_schema() for tool in self._tools.values()]
 
     def to_openai_realtime_schema_filtered(self, tool_names: Optional[List[str]]) -> List[Dict]:
-        return [tool.definition.to_openai_realtime_schema() for tool in self._iter_tools_filtered(tool_names)]
+        return self._schemas_filtered("openai_realtime", tool_names)
     
     def to_elevenlabs_schema(self) -> List[Dict]:
         """
@@ -349,7 +396,7 @@ class ToolRegistry:
         return [tool.definition.to_elevenlabs_schema() for tool in self._tools.values()]
 
     def to_elevenlabs_schema_filtered(self, tool_names: Optional[List[str]]) -> List[Dict]:
-        return [tool.definition.to_elevenlabs_schema() for tool in self._iter_tools_filtered(tool_names)]
+        return self._schemas_filtered("elevenlabs", tool_names)
     
     def to_prompt_text(self) -> str:
         """
@@ -585,6 +632,11 @@ After outputting a tool call, provide a brief spoken response.
         if in_call_tool_count > 0:
             logger.info(f"📞 Initialized {in_call_tool_count} in-call HTTP tools from config")
         self._in_call_http_init_cache.add(effective_key)
+
+    def forget_in_call_init(self, cache_keys: Iterable[str]) -> None:
+        """Allow in-call HTTP tools to be initialized again for these cache keys (config reload)."""
+        for key in cache_keys:
+            self._in_call_http_init_cache.discard(key)
     
     def list_tools(self) -> List[str]:
         """
@@ -602,6 +654,7 @@ After outputting a tool call, provide a brief spoken response.
         Mainly for testing purposes.
         """
         self._tools.clear()
+        self._changed()
         self._initialized = False
         self._in_call_http_init_cache.clear()
         logger.info("Cleared all registered tools")
@@ -7,6 +7,8 @@ Purpose (AAVA-53):
 
 Notes:
 - Uses ARI deviceStates API (GET /ari/deviceStates/{deviceStateName}).
+- Answered from the engine's device state cache (src/core/device_state_cache.py) when it
+  holds a fresh entry; live ARI probes are the fallback and refresh the cache.
 - Device state name is usually "<TECH>/<EXT>" (e.g., "PJSIP/2765" or "SIP/6000").
 - Tech selection should be configurable per extension via Admin UI (stored under tools.extensions.internal).
 """
@@ -18,6 +20,7 @@ from urllib.parse import quote
 
 import structlog
 
+from src.core.device_state_cache import get_device_state_cache
 from src.tools.base import Tool, ToolDefinition, ToolParameter, ToolCategory, ToolPhase
 from src.tools.context import ToolExecutionContext
 
@@ -170,6 +173,33 @@ def _resolve_device_state_id(
     return "", ""
 
 
+def configured_device_state_ids(tools_config: Dict[str, Any]) -> List[str]:
+    """
+    Device state names for configured Live Agents and extension transfer destinations.
+
+    The engine tracks these in the device state cache so the first lookup is already warm.
+    Extensions whose tech can only be auto-detected are learned on first lookup instead.
+    """
+    if not isinstance(tools_config, dict):
+        return []
+    extensions_cfg = ((tools_config.get("extensions") or {}).get("internal") or {})
+    destinations = ((tools_config.get("transfer") or {}).get("destinations") or {})
+    if not isinstance(extensions_cfg, dict):
+        extensions_cfg = {}
+    extensions = [str(k) for k in extensions_cfg]
+    if isinstance(destinations, dict):
+        for key in destinations:
+            ext, _, _ = _resolve_transfer_destination_extension(target=str(key), destinations=destinations)
+            if ext:
+                extensions.append(ext)
+    ids: List[str] = []
+    for extension in extensions:
+        resolved_id, _ = _resolve_device_state_id(extension=extension, extensions_config=extensions_cfg)
+        if resolved_id and resolved_id not in ids:
+            ids.append(resolved_id)
+    return ids
+
+
 async def _probe_endpoint(
     *,
     context: ToolExecutionContext,
@@ -187,6 +217,11 @@ async def _probe_endpoint(
     extension = (extension or "").strip()
     if not tech or not extension:
         return None
+    cache = get_device_state_cache()
+    if cache is not None:
+        known, cached = cache.get_endpoint(tech, extension)
+        if known:
+            return cached
     try:
         resp = await context.ari_client.send_command(
             method="GET",
@@ -207,6 +242,28 @@ async def _probe_endpoint(
     # Only treat this as a valid endpoint if it resembles the Endpoint model.
     if "technology" not in resp or "resource" not in resp:
         return None
+    if cache is not None:
+        cache.store_endpoint(resp)
+    return resp
+
+
+async def _query_device_state(*, context: ToolExecutionContext, device_state_id: str) -> Any:
+    """
+    GET deviceStates/{device_state_id}, answered from the device state cache when fresh.
+
+    ARI errors propagate to the caller (as with a direct send_command).
+    """
+    cache = get_device_state_cache()
+    if cache is not None:
+        cached = cache.get_device_state(device_state_id)
+        if cached is not None:
+            return cached
+    resp = await context.ari_client.send_command(
+        method="GET",
+        resource=f"deviceStates/{quote(device_state_id, safe='')}",
+    )
+    if cache is not None and isinstance(resp, dict) and resp.get("state"):
+        cache.store_device_state(str(resp.get("name") or device_state_id), str(resp["state"]))
     return resp
 
 
@@ -342,17 +399,11 @@ class CheckExtensionStatusTool(Tool):
                 "target": target,
             }
 
-        # ARI expects deviceStateName in the URL path, so URL-encode slashes.
-        encoded = quote(resolved_id, safe="") if resolved_id else ""
-
         device_state_error: Optional[str] = None
         device_state_resp: Optional[Dict[str, Any]] = None
         try:
-            if encoded:
-                device_state_resp = await context.ari_client.send_command(
-                    method="GET",
-                    resource=f"deviceStates/{encoded}",
-                )
+            if resolved_id:
+                device_state_resp = await _query_device_state(context=context, device_state_id=resolved_id)
         except Exception as exc:
             device_state_error = str(exc)
             logger.warning(
@@ -383,11 +434,7 @@ class CheckExtensionStatusTool(Tool):
                         continue
                     try:
                         candidate_id = f"{candidate}/{extension}"
-                        encoded_candidate = quote(candidate_id, safe="")
-                        candidate_resp = await context.ari_client.send_command(
-                            method="GET",
-                            resource=f"deviceStates/{encoded_candidate}",
-                        )
+                        candidate_resp = await _query_device_state(context=context, device_state_id=candidate_id)
                     except Exception:
                         logger.debug(
                             "ARI fallback probe failed",
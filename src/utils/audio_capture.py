@@ -1,7 +1,8 @@
 import os
+import queue
 import wave
 import threading
-from typing import Dict, Tuple, Optional
+from typing import Any, Dict, Tuple, Optional
 
 import audioop
 
@@ -15,6 +16,9 @@ class AudioCaptureManager:
         self._lock = threading.Lock()
         # key -> (wave.Wave_write, sample_rate)
         self._handles: Dict[Tuple[str, str], Tuple[wave.Wave_write, int]] = {}
+        # Optional writer thread (media workers): appends/closes are queued in order.
+        self._writer_queue: Optional["queue.SimpleQueue[Any]"] = None
+        self._writer_thread: Optional[threading.Thread] = None
         try:
             os.makedirs(self.base_dir, mode=0o700, exist_ok=True)
             try:
@@ -42,9 +46,47 @@ class AudioCaptureManager:
             pass
         return wf
 
+    def start_background_writer(self) -> None:
+        """Write WAV files from a dedicated thread instead of the caller's (event loop) thread."""
+        if self._writer_thread is not None:
+            return
+        self._writer_queue = queue.SimpleQueue()
+        self._writer_thread = threading.Thread(target=self._writer_main, name="audio-capture-writer", daemon=True)
+        self._writer_thread.start()
+
+    def stop_background_writer(self, timeout: float = 5.0) -> None:
+        """Flush queued writes and return to synchronous writes."""
+        thread, q = self._writer_thread, self._writer_queue
+        if thread is None or q is None:
+            return
+        q.put(None)
+        thread.join(timeout)
+        self._writer_thread = None
+        self._writer_queue = None
+
+    def _writer_main(self) -> None:
+        q = self._writer_queue
+        while True:
+            job = q.get()
+            if job is None:
+                return
+            try:
+                if job[0] == "append":
+                    self._append_pcm16_now(*job[1:])
+                else:
+                    self._close_call_now(job[1])
+            except Exception:
+                pass
+
     def append_pcm16(self, call_id: str, stream_name: str, pcm16: bytes, sample_rate: int) -> None:
         if not pcm16:
             return
+        if self._writer_queue is not None:
+            self._writer_queue.put(("append", call_id, stream_name, bytes(pcm16), sample_rate))
+            return
+        self._append_pcm16_now(call_id, stream_name, pcm16, sample_rate)
+
+    def _append_pcm16_now(self, call_id: str, stream_name: str, pcm16: bytes, sample_rate: int) -> None:
         key = (call_id, stream_name)
         with self._lock:
             handle = self._handles.get(key)
@@ -111,6 +153,12 @@ class AudioCaptureManager:
             )
 
     def close_call(self, call_id: str) -> None:
+        if self._writer_queue is not None:
+            self._writer_queue.put(("close", call_id))
+            return
+        self._close_call_now(call_id)
+
+    def _close_call_now(self, call_id: str) -> None:
         keys_to_close = []
         with self._lock:
             for key, (wf, _rate) in list(self._handles.items()):
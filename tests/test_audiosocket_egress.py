@@ -0,0 +1,175 @@
+import asyncio
+import uuid
+
+from src.audio.audiosocket_egress import AudioSocketEgress
+from src.audio.audiosocket_server import TYPE_AUDIO, TYPE_ERROR, TYPE_UUID, AudioSocketServer
+
+FRAME = 160  # 20 ms of 8 kHz μ-law
+WIRE = 3 + FRAME
+
+
+class _FakeTransport:
+    def __init__(self):
+        self.writes = []
+        self.buffered = 0
+        self.closing = False
+
+    def write(self, data):
+        self.writes.append(bytes(data))
+
+    def get_write_buffer_size(self):
+        return self.buffered
+
+    def is_closing(self):
+        return self.closing
+
+
+def _frames(data):
+    out = []
+    while data:
+        assert data[0] == TYPE_AUDIO
+        length = int.from_bytes(data[1:3], "big")
+        out.append(data[3 : 3 + length])
+        data = data[3 + length :]
+    return out
+
+
+async def test_frames_queued_in_one_tick_share_a_write():
+    transport = _FakeTransport()
+    egress = AudioSocketEgress(transport)
+
+    for i in range(3):
+        assert egress.send(bytes([i]) * FRAME)
+    assert transport.writes == []
+    await asyncio.sleep(0)
+
+    assert len(transport.writes) == 1
+    assert _frames(transport.writes[0]) == [bytes([i]) * FRAME for i in range(3)]
+    assert egress.stats["writes"] == 1 and egress.stats["frames"] == 3
+
+    # The buffer is reused (and grown when needed) for later flushes.
+    egress.send(b"\x07" * 5000)
+    await asyncio.sleep(0)
+    assert _frames(transport.writes[1]) == [b"\x07" * 5000]
+
+
+async def test_backpressure_drops_stale_frames_and_resumes_below_low_watermark():
+    transport = _FakeTransport()
+    egress = AudioSocketEgress(transport, high_watermark_ms=100, low_watermark_ms=40)
+    assert (egress.high_frames, egress.low_frames) == (5, 2)
+
+    egress.send(b"\x00" * FRAME)
+    await asyncio.sleep(0)
+    transport.buffered = 5 * WIRE  # peer stopped reading: 100 ms stuck in the socket buffer
+
+    for i in range(1, 7):
+        egress.send(bytes([i]) * FRAME)
+    assert egress.congested
+    assert egress.pending_frames == 2
+    assert egress.stats["dropped"] == 4 and egress.stats["congestion_events"] == 1
+    assert egress.queued_frames() == 7
+    egress.flush()
+    assert len(transport.writes) == 1  # nothing handed to the transport while congested
+
+    transport.buffered = 2 * WIRE
+    egress.flush()
+    assert not egress.congested
+    assert _frames(transport.writes[-1]) == [b"\x05" * FRAME, b"\x06" * FRAME]
+
+    egress.close()
+    assert not egress.send(b"\x00" * FRAME)
+
+
+async def test_long_coalesce_window_keeps_newest_audio():
+    transport = _FakeTransport()
+    egress = AudioSocketEgress(transport, coalesce_ms=500, high_watermark_ms=60, low_watermark_ms=20)
+
+    for i in range(5):
+        egress.send(bytes([i]) * FRAME)
+    assert egress.pending_frames == 3
+    egress.flush()
+    assert _frames(transport.writes[0]) == [bytes([i]) * FRAME for i in (2, 3, 4)]
+    egress.close()
+
+
+async def test_close_writes_pending_frames_even_while_backpressured():
+    transport = _FakeTransport()
+    egress = AudioSocketEgress(transport, high_watermark_ms=100, low_watermark_ms=40)
+    egress.send(b"\x00" * FRAME)
+    await asyncio.sleep(0)
+    transport.buffered = 5 * WIRE
+
+    egress.send(b"\x01" * FRAME)
+    egress.send(b"\x02" * FRAME)
+    assert egress.congested and egress.pending_frames == 2
+    egress.close()
+    # The tail of the prompt is handed over on hangup instead of being discarded.
+    assert _frames(transport.writes[-1]) == [b"\x01" * FRAME, b"\x02" * FRAME]
+    assert egress.pending_frames == 0
+    await asyncio.sleep(0)
+    assert len(transport.writes) == 2
+
+
+async def test_server_sends_audio_through_egress_over_loopback():
+    bound = asyncio.Event()
+
+    async def on_uuid(conn_id, call_uuid):
+        bound.set()
+        return True
+
+    async def on_audio(conn_id, payload):
+        return None
+
+    server = AudioSocketServer("127.0.0.1", 0, on_uuid=on_uuid, on_audio=on_audio)
+    await server.start()
+    try:
+        reader, writer = await asyncio.open_connection("127.0.0.1", server.port)
+        writer.write(bytes([TYPE_UUID]) + (16).to_bytes(2, "big") + uuid.uuid4().bytes)
+        await writer.drain()
+        await asyncio.wait_for(bound.wait(), 2)
+        conn_id = next(iter(server._conn_to_uuid))
+
+        for i in range(4):
+            assert await server.send_audio(conn_id, bytes([i]) * FRAME)
+        received = _frames(await asyncio.wait_for(reader.readexactly(4 * WIRE), 2))
+        assert received == [bytes([i]) * FRAME for i in range(4)]
+        assert server.get_egress(conn_id).stats["writes"] == 1
+
+        # Frames queued right before a disconnect still reach the peer.
+        assert await server.send_audio(conn_id, b"\x09" * FRAME)
+        await server.disconnect(conn_id)
+        assert _frames(await asyncio.wait_for(reader.readexactly(WIRE), 2)) == [b"\x09" * FRAME]
+        assert server.get_egress(conn_id) is None
+        assert not await server.send_audio(conn_id, b"\x00" * FRAME)
+        writer.close()
+    finally:
+        await server.stop()
+
+
+async def test_error_frame_follows_coalesced_audio():
+    async def on_uuid(conn_id, call_uuid):
+        return True
+
+    async def on_audio(conn_id, payload):
+        return None
+
+    server = AudioSocketServer("127.0.0.1", 0, on_uuid=on_uuid, on_audio=on_audio, egress_coalesce_ms=500)
+    await server.start()
+    try:
+        reader, writer = await asyncio.open_connection("127.0.0.1", server.port)
+        for _ in range(100):
+            if server._egress:
+                break
+            await asyncio.sleep(0.01)
+        conn_id = next(iter(server._egress))
+        assert await server.send_audio(conn_id, b"\x07" * FRAME)
+
+        # A frame before the UUID handshake is answered with an error frame.
+        writer.write(bytes([TYPE_AUDIO]) + (0).to_bytes(2, "big"))
+        await writer.drain()
+        data = await asyncio.wait_for(reader.read(), 2)
+        assert _frames(data[:WIRE]) == [b"\x07" * FRAME]
+        assert data[WIRE] == TYPE_ERROR and data[WIRE + 3 :] == b"missing-uuid"
+        writer.close()
+    finally:
+        await server.stop()
@@ -78,3 +78,192 @@ async def test_call_history_list_count_filter_parity(tmp_path, monkeypatch):
     assert listed[0].call_id == "call-1"
 
 
+def _stats_record(call_id, start, **overrides):
+    from src.core.call_history import CallRecord
+
+    fields = dict(
+        call_id=call_id,
+        caller_number="1001",
+        start_time=start,
+        end_time=start + timedelta(seconds=30),
+        duration_seconds=30.0,
+        provider_name="deepgram",
+        context_name="demo",
+        outcome="completed",
+        avg_turn_latency_ms=200.0,
+        total_turns=2,
+    )
+    fields.update(overrides)
+    return CallRecord(**fields)
+
+
+def _comparable(stats):
+    # SQL does not define an order for tied top-caller counts.
+    return {**stats, "top_callers": sorted(stats["top_callers"], key=lambda c: (c["number"], c["count"]))}
+
+
+@pytest.mark.asyncio
+async def test_call_history_rollup_stats_match_raw_aggregation(tmp_path, monkeypatch):
+    monkeypatch.setenv("CALL_HISTORY_ENABLED", "true")
+    monkeypatch.setenv("CALL_HISTORY_ROLLUP_HOURLY_DAYS", "0")
+
+    from src.core.call_history import CallHistoryStore
+
+    store = CallHistoryStore(db_path=str(tmp_path / "call_history.db"))
+    base = datetime(2026, 1, 10, 12, 15, tzinfo=timezone.utc)
+    records = [
+        _stats_record("call-1", base, caller_number="1001", duration_seconds=10.0),
+        _stats_record("call-2", base + timedelta(minutes=50), caller_number="1001", outcome="transferred",
+                      tool_calls=[{"name": "transfer"}, {"name": "hangup_call"}]),
+        _stats_record("call-3", base + timedelta(hours=5), caller_number="1002", pipeline_name="local_hybrid",
+                      provider_name="local", duration_seconds=95.5, barge_in_count=3),
+        _stats_record("call-4", base + timedelta(days=1, hours=2), caller_number=None, context_name=None,
+                      outcome="error", tool_calls=[{"name": "transfer"}]),
+    ]
+    for record in records:
+        assert await store.save(record) is True
+
+    ranges = [
+        (None, None),
+        (base + timedelta(minutes=20), None),
+        (None, base + timedelta(hours=5, minutes=1)),
+        (base + timedelta(minutes=40), base + timedelta(days=1, hours=2, minutes=30)),
+        (base + timedelta(minutes=1), base + timedelta(minutes=2)),
+    ]
+    for start, end in ranges:
+        raw = await store.get_stats(start_date=start, end_date=end, use_rollups=False)
+        rolled = await store.get_stats(start_date=start, end_date=end)
+        assert _comparable(rolled) == _comparable(raw)
+
+    full = await store.get_stats()
+    assert full["total_calls"] == 4
+    assert full["top_tools"] == {"transfer": 2, "hangup_call": 1}
+    assert full["pipelines"] == {"local_hybrid": 1}
+    assert full["calls_per_day"] == [{"date": "2026-01-11", "count": 1}, {"date": "2026-01-10", "count": 3}]
+
+    # Deletes repair the affected buckets.
+    first = await store.get_by_call_id("call-1")
+    assert await store.delete(first.id) is True
+    assert await store.delete_before(base + timedelta(hours=1)) == 1
+    assert _comparable(await store.get_stats()) == _comparable(await store.get_stats(use_rollups=False))
+    assert (await store.get_stats())["total_calls"] == 2
+
+    # Compaction into daily buckets keeps totals and ranged answers exact.
+    store._rollup_hourly_days = 1
+    assert await store.compact_rollups() > 0
+    for start, end in ranges:
+        rolled = await store.get_stats(start_date=start, end_date=end)
+        raw = await store.get_stats(start_date=start, end_date=end, use_rollups=False)
+        assert _comparable(rolled) == _comparable(raw)
+
+
+@pytest.mark.asyncio
+async def test_call_history_rollups_backfill_existing_records(tmp_path, monkeypatch):
+    monkeypatch.setenv("CALL_HISTORY_ENABLED", "true")
+    monkeypatch.setenv("CALL_HISTORY_ROLLUPS_ENABLED", "false")
+    db_path = str(tmp_path / "call_history.db")
+
+    from src.core.call_history import CallHistoryStore
+
+    legacy = CallHistoryStore(db_path=db_path)
+    now = datetime.now(timezone.utc)
+    for i in range(3):
+        assert await legacy.save(_stats_record(f"call-{i}", now - timedelta(days=i * 20))) is True
+
+    monkeypatch.setenv("CALL_HISTORY_ROLLUPS_ENABLED", "true")
+    store = CallHistoryStore(db_path=db_path)
+    stats = await store.get_stats()
+    assert stats["total_calls"] == 3
+    assert _comparable(stats) == _comparable(await store.get_stats(use_rollups=False))
+
+
+@pytest.mark.asyncio
+async def test_call_history_keyset_pagination_and_iteration(tmp_path, monkeypatch):
+    monkeypatch.setenv("CALL_HISTORY_ENABLED", "true")
+
+    from src.core.call_history import CallHistoryStore
+
+    store = CallHistoryStore(db_path=str(tmp_path / "call_history.db"))
+    base = datetime(2026, 2, 1, 9, 0, tzinfo=timezone.utc)
+    for i in range(23):
+        # Two calls share each start_time so the id tiebreaker is exercised.
+        start = base + timedelta(minutes=i // 2)
+        outcome = "error" if i % 5 == 0 else "completed"
+        assert await store.save(_stats_record(f"call-{i:02d}", start, outcome=outcome)) is True
+
+    seen = []
+    cursor = None
+    while True:
+        page, cursor = await store.list_page(limit=5, cursor=cursor, include_details=False)
+        seen.extend(page)
+        if cursor is None:
+            break
+    assert len(seen) == 23
+    assert len({r.id for r in seen}) == 23
+    keys = [(r.start_time, r.id) for r in seen]
+    assert keys == sorted(keys, reverse=True)
+    assert {r.call_id for r in seen} == {r.call_id for r in await store.list(limit=100)}
+
+    ascending = [r.call_id async for r in store.iter_records(batch_size=4, order_dir="ASC", outcome="error")]
+    assert ascending == ["call-00", "call-05", "call-10", "call-15", "call-20"]
+
+    with pytest.raises(ValueError):
+        await store.list_page(cursor="not-a-cursor")
+
+
+@pytest.mark.asyncio
+async def test_call_history_transcript_search(tmp_path, monkeypatch):
+    monkeypatch.setenv("CALL_HISTORY_ENABLED", "true")
+    db_path = str(tmp_path / "call_history.db")
+
+    from src.core.call_history import CallHistoryStore
+
+    store = CallHistoryStore(db_path=db_path)
+    base = datetime(2026, 3, 1, 10, 0, tzinfo=timezone.utc)
+    records = [
+        _stats_record("call-refund", base, provider_name="deepgram", conversation_history=[
+            {"role": "assistant", "content": "How can I help?"},
+            {"role": "user", "content": "I want a refund for my last order"},
+            {"role": "user", "content": "The refund is overdue, I was refunded nothing"},
+        ]),
+        _stats_record("call-hours", base + timedelta(minutes=5), provider_name="local", conversation_history=[
+            {"role": "user", "content": "What are your opening hours?"},
+        ]),
+        _stats_record("call-transfer", base + timedelta(minutes=10), provider_name="local", conversation_history=[
+            {"role": "user", "content": "Refund department please"},
+        ], tool_calls=[{"name": "blind_transfer", "params": {"target": "billing_queue"}, "message": "ok"}]),
+    ]
+    for record in records:
+        assert await store.save(record) is True
+
+    hits, total = await store.search_transcripts("refund")
+    assert total == 2
+    assert hits[0].record.call_id == "call-refund"  # more matching turns rank first
+    assert hits[0].match_count == 2
+    assert "<mark>refund</mark>" in hits[0].snippet
+    assert hits[0].record.conversation_history == []  # summary columns only
+
+    # Combines with call-level filters; tool names/arguments are searchable.
+    hits, total = await store.search_transcripts("refund", provider_name="local")
+    assert total == 1 and hits[0].record.call_id == "call-transfer"
+    hits, _ = await store.search_transcripts("billing_queue")
+    assert hits[0].kind == "tool" and hits[0].record.call_id == "call-transfer"
+
+    # Prefix matching and FTS syntax characters in user input are safe.
+    assert (await store.search_transcripts("open*"))[1] == 1
+    assert (await store.search_transcripts('hours" OR (')) == ([], 0)
+
+    # Index follows deletes.
+    transfer = await store.get_by_call_id("call-transfer")
+    assert await store.delete(transfer.id) is True
+    assert (await store.search_transcripts("billing_queue"))[1] == 0
+    assert await store.delete_before(base + timedelta(minutes=1)) == 1
+    assert (await store.search_transcripts("refund"))[1] == 0
+
+    # Existing databases are backfilled when search is (re-)enabled.
+    monkeypatch.setenv("CALL_HISTORY_SEARCH_ENABLED", "false")
+    CallHistoryStore(db_path=db_path)
+    monkeypatch.setenv("CALL_HISTORY_SEARCH_ENABLED", "true")
+    reopened = CallHistoryStore(db_path=db_path)
+    hits, total = await reopened.search_transcripts("opening hours")
+    assert total == 1 and hits[0].record.call_id == "call-hours"
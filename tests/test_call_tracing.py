@@ -0,0 +1,139 @@
+import json
+import sqlite3
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.config import TracingConfig
+from src.core.tracing import NOOP_TRACE, CallTrace, FileSpanExporter, Tracer
+
+
+def _turn_stages(summary, turn=1):
+    return {s["name"]: s for s in summary["turns"][turn - 1]["stages"]}
+
+
+def test_turn_waterfall_starts_at_end_of_speech():
+    trace = CallTrace("call-1")
+    setup = trace.start_span("call.setup")
+    setup.step("ari.answer")
+    setup.step("ari.bridge_create")
+    setup.end()
+
+    trace.mark("vad.end_of_speech")
+    time.sleep(0.002)
+    trace.mark("stt.final")
+    trace.begin_turn()
+    with trace.span("llm.generate"):
+        time.sleep(0.002)
+    tts = trace.start_span("tts.synthesize")
+    trace.mark("tts.first_byte", once=True)
+    trace.mark("tts.first_byte", once=True)
+    trace.end_turn()  # tts span left open by an early return
+    trace.mark("audio.first_frame", once=True)  # playback outlives run_turn
+
+    summary = trace.finish()
+    assert set(summary["setup"]) == {"ari.answer", "ari.bridge_create"}
+    assert summary["turns"][0]["turn"] == 1
+    stages = _turn_stages(summary)
+    assert stages["vad.end_of_speech"]["at_ms"] == 0.0
+    assert stages["stt.final"]["at_ms"] >= 2.0
+    assert stages["llm.generate"]["ms"] >= 2.0
+    assert tts.end_ns
+    assert [s["name"] for s in summary["turns"][0]["stages"]].count("tts.first_byte") == 1
+    assert summary["turns"][0]["response_ms"] == stages["audio.first_frame"]["at_ms"]
+    assert summary["slowest_turn"] == 1
+
+
+def test_provider_output_opens_turns_and_span_cap_bounds_memory():
+    trace = CallTrace("call-2", max_spans=10)
+    for _ in range(3):
+        trace.mark("provider.first_audio", once=True, open_turn=True)
+        trace.mark("provider.first_audio", once=True, open_turn=True)
+        trace.end_turn()
+    assert trace.turn == 3
+    for _ in range(20):
+        trace.start_span("tool.execute", tool="lookup").end()
+    assert len(trace.spans) == 10  # call + 3 turns + 3 marks + 3 tool spans
+    assert trace.finish()["dropped"] == 17
+
+
+def test_otlp_export_links_spans_by_call_and_turn():
+    trace = CallTrace("call-3")
+    trace.begin_turn()
+    trace.start_span("tool.execute", tool="transfer").end()
+    trace.end_turn()
+    trace.finish()
+
+    payload = trace.to_otlp("ai-engine")
+    spans = payload["resourceSpans"][0]["scopeSpans"][0]["spans"]
+    assert {s["traceId"] for s in spans} == {f"{trace.trace_id:032x}"}
+    by_name = {s["name"]: s for s in spans}
+    assert "parentSpanId" not in by_name["call"]
+    assert by_name["tool.execute"]["parentSpanId"] == by_name["turn"]["spanId"]
+    attrs = {a["key"]: a["value"] for a in by_name["tool.execute"]["attributes"]}
+    assert attrs["call.id"] == {"stringValue": "call-3"}
+    assert attrs["call.turn"] == {"intValue": "1"}
+    assert int(by_name["call"]["endTimeUnixNano"]) >= int(by_name["call"]["startTimeUnixNano"])
+
+
+def test_tracer_exports_finished_calls_to_file(tmp_path):
+    path = tmp_path / "traces" / "spans.jsonl"
+    tracer = Tracer(exporter=FileSpanExporter(str(path)))
+    trace = tracer.start_call("call-4")
+    assert tracer.get("call-4") is trace
+    trace.mark("stt.final")
+    trace.begin_turn()
+    trace.end_turn()
+
+    summary = tracer.finish_call("call-4")
+    tracer.close()
+    assert summary["turns"][0]["turn"] == 1
+    assert tracer.get("call-4") is NOOP_TRACE
+    assert tracer.finish_call("call-4") is None
+    lines = path.read_text().splitlines()
+    assert len(lines) == 1
+    assert json.loads(lines[0])["resourceSpans"][0]["scopeSpans"][0]["spans"][0]["name"] == "call"
+
+
+def test_disabled_or_unsampled_calls_get_noop_trace():
+    assert Tracer.from_config(TracingConfig(enabled=False)).start_call("c") is NOOP_TRACE
+    tracer = Tracer.from_config(TracingConfig(sample_rate=0.0))
+    trace = tracer.start_call("c")
+    assert trace is NOOP_TRACE
+    with trace.span("llm.generate") as span:
+        span.step("x")
+    assert tracer.finish_call("c") is None
+
+
+@pytest.mark.asyncio
+async def test_latency_trace_round_trips_through_call_history(tmp_path, monkeypatch):
+    monkeypatch.setenv("CALL_HISTORY_ENABLED", "true")
+    db_path = str(tmp_path / "call_history.db")
+
+    from src.core.call_history import CallHistoryStore, CallRecord
+
+    # A database created before the column existed is migrated in place.
+    conn = sqlite3.connect(db_path)
+    conn.execute(CallHistoryStore._CREATE_TABLE_SQL.replace("latency_trace TEXT,", ""))
+    conn.execute(
+        "INSERT INTO call_records (id, call_id, start_time, end_time) "
+        "VALUES ('old', 'call-old', '2024-01-01T00:00:00', '2024-01-01T00:01:00')"
+    )
+    conn.commit()
+    conn.close()
+
+    store = CallHistoryStore(db_path=db_path)
+    trace = CallTrace("call-5")
+    trace.mark("stt.final")
+    trace.begin_turn()
+    trace.mark("tts.first_byte", once=True)
+    summary = trace.finish()
+
+    now = datetime.now(timezone.utc)
+    record = CallRecord(call_id="call-5", start_time=now, end_time=now + timedelta(seconds=3), latency_trace=summary)
+    assert await store.save(record)
+
+    loaded = await store.get_by_call_id("call-5")
+    assert loaded.latency_trace == summary
+    assert (await store.get_by_call_id("call-old")).latency_trace == {}
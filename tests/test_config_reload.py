@@ -0,0 +1,147 @@
+import json
+import types
+
+import pytest
+
+from src.config import load_config
+from src.config.diff import diff_configs
+from src.core.local_ai_pool import close_shared_pools
+from src.core.transport_orchestrator import TransportOrchestrator
+from src.engine import Engine
+from src.pipelines import PipelineOrchestrator
+
+EXAMPLE = "config/ai-agent.example.yaml"
+CONTEXT = "demo_project_expert"
+
+
+@pytest.fixture
+def load(monkeypatch):
+    monkeypatch.setenv("ASTERISK_ARI_USERNAME", "test")
+    monkeypatch.setenv("ASTERISK_ARI_PASSWORD", "test")
+    return lambda: load_config(EXAMPLE)
+
+
+def test_diff_configs_reports_keyed_changes(load):
+    old, new = load(), load()
+    assert diff_configs(old, new).empty
+
+    new.providers["deepgram"]["model"] = "nova-3"
+    del new.providers["google_live"]
+    new.contexts[CONTEXT]["prompt"] = "Be brief."
+    new.llm.initial_greeting = "Hi there"
+
+    diff = diff_configs(old, new)
+    assert diff.sections == ("providers", "llm", "contexts")
+    providers = diff.section("providers")
+    assert (providers.added, providers.removed, providers.changed) == ((), ("google_live",), ("deepgram",))
+    assert diff.section("contexts").touched == (CONTEXT,)
+    assert not diff.section("pipelines")
+    assert "providers removed: google_live" in diff.summary()
+    assert "llm changed" in diff.summary()
+
+
+def _engine(config):
+    engine = Engine.__new__(Engine)
+    engine.config = config
+    engine.providers = {name: object() for name in config.providers}
+    engine.provider_factories = {name: object() for name in config.providers}
+    engine.provider_alignment_issues = {}
+    engine._config_hash = engine._compute_config_hash()
+    engine.transport_orchestrator = TransportOrchestrator(config.model_dump())
+    engine.mcp_manager = None
+    return engine
+
+
+def test_reload_providers_rebuilds_changed_and_dependents_only(load):
+    old, new = load(), load()
+    new.providers["deepgram"]["model"] = "nova-3"
+    del new.providers["google_live"]
+    new.llm.initial_greeting = "Hi there"
+
+    engine = _engine(old)
+    before = dict(engine.providers)
+    loaded = []
+
+    def fake_load(name, data):
+        loaded.append(name)
+        engine.providers[name] = ("rebuilt", name)
+        return True
+
+    engine._load_provider = fake_load
+    engine.config = new
+    changes, errors = [], []
+    engine._reload_providers(diff_configs(old, new), changes, errors)
+
+    # deepgram changed; local and openai_realtime are built from the llm section.
+    assert loaded == ["deepgram", "local", "openai_realtime"]
+    assert "google_live" not in engine.providers and "google_live" not in engine.provider_factories
+    assert engine.providers["openai"] is before["openai"]
+    assert not errors and "Provider 'google_live' removed" in changes
+
+
+async def test_reload_applies_context_change_without_touching_providers(load, monkeypatch):
+    old, new = load(), load()
+    new.contexts[CONTEXT]["prompt"] = "Be brief."
+    engine = _engine(old)
+    before = dict(engine.providers)
+    bundle_cache = engine._bundle_cache()
+
+    monkeypatch.setattr("src.config.load_config", lambda: new)
+    response = await engine._reload(0.0)
+    body = json.loads(response.body)
+
+    assert body["success"], body
+    assert f"contexts changed: {CONTEXT}" in body["changes"]
+    assert engine.config is new
+    assert engine._config_hash == Engine._hash_config(new)
+    assert engine.transport_orchestrator.get_context_config(CONTEXT).prompt == "Be brief."
+    assert engine.providers == before
+    assert bundle_cache.stats()["invalidations"] == 1
+
+    # A second reload of the same file is a no-op.
+    body = json.loads((await engine._reload(0.0)).body)
+    assert body["message"] == "Configuration unchanged"
+
+
+async def test_reload_starts_new_pipelines_before_swapping_config(load, monkeypatch):
+    old, new = load(), load()
+    new.active_pipeline = "local_only"
+    engine = _engine(old)
+    previous = PipelineOrchestrator(old)
+    engine.pipeline_orchestrator = previous
+    seen = []
+
+    async def start(orchestrator):
+        # Calls arriving while the new pipelines validate still get the old config and pipelines.
+        seen.append((orchestrator.config, engine.config, engine.pipeline_orchestrator))
+
+    monkeypatch.setattr(PipelineOrchestrator, "start", start)
+    monkeypatch.setattr("src.config.load_config", lambda: new)
+    try:
+        body = json.loads((await engine._reload(0.0)).body)
+    finally:
+        # The orchestrators register the local provider's process-wide connection pool.
+        await close_shared_pools()
+
+    assert body["success"], body
+    assert seen == [(new, old, previous)]
+    assert engine.config is new
+    assert engine.pipeline_orchestrator is not previous
+    assert engine.pipeline_orchestrator.config is new
+
+
+async def test_pipeline_orchestrator_adopts_in_flight_assignments():
+    config = types.SimpleNamespace(providers={}, pipelines={}, active_pipeline=None)
+    old, new = PipelineOrchestrator(config), PipelineOrchestrator(config)
+    closed = []
+    adapter = types.SimpleNamespace(close_call=lambda call_id: _closed(closed, call_id))
+    old._assignments["call-1"] = types.SimpleNamespace(stt_adapter=adapter, llm_adapter=adapter, tts_adapter=adapter)
+
+    assert new.adopt_assignments(old) == 1
+    assert not old._assignments
+    await new.release_pipeline("call-1")
+    assert closed == ["call-1"] * 3
+
+
+async def _closed(closed, call_id):
+    closed.append(call_id)
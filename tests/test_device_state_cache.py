@@ -0,0 +1,170 @@
+import asyncio
+from urllib.parse import unquote
+
+import pytest
+from prometheus_client import REGISTRY
+
+from src.core.device_state_cache import DeviceStateCache, get_device_state_cache, set_device_state_cache
+from src.tools.context import ToolExecutionContext
+from src.tools.telephony.check_extension_status import CheckExtensionStatusTool, configured_device_state_ids
+
+
+class _FakeARI:
+    """ARI stand-in: REST state for deviceStates/endpoints plus an event source."""
+
+    def __init__(self):
+        self.is_connected = True
+        self.event_handlers = {}
+        self.device_states = {}
+        self.endpoints = {}
+        self.calls = []
+
+    def add_event_handler(self, event_type, handler):
+        self.event_handlers.setdefault(event_type, []).append(handler)
+
+    async def emit(self, event_type, **payload):
+        for handler in self.event_handlers.get(event_type, []):
+            await handler({"type": event_type, **payload})
+
+    def set_endpoint(self, tech, resource, state="online", channel_ids=()):
+        self.endpoints[f"{tech}/{resource}"] = {
+            "technology": tech, "resource": resource, "state": state, "channel_ids": list(channel_ids),
+        }
+
+    async def send_command(self, method, resource, data=None, params=None):
+        self.calls.append(resource)
+        if resource == "endpoints":
+            return list(self.endpoints.values())
+        if resource.startswith("endpoints/"):
+            found = self.endpoints.get(resource[len("endpoints/"):])
+            return dict(found) if found else {"message": "Endpoint not found"}
+        if resource.startswith("deviceStates/"):
+            name = unquote(resource[len("deviceStates/"):])
+            return {"name": name, "state": self.device_states.get(name, "INVALID")}
+        raise AssertionError(f"unexpected ARI call: {method} {resource}")
+
+
+TOOLS_CONFIG = {
+    "extensions": {"internal": {"6000": {"name": "Support", "dial_string": "SIP/6000"}}},
+    "transfer": {"destinations": {"sales": {"type": "extension", "target": "6001"}}},
+}
+
+
+@pytest.fixture
+def ari():
+    fake = _FakeARI()
+    fake.device_states = {"SIP/6000": "NOT_INUSE", "PJSIP/2765": "NOT_INUSE"}
+    fake.set_endpoint("SIP", "6000")
+    fake.set_endpoint("PJSIP", "2765")
+    return fake
+
+
+@pytest.fixture
+async def cache(ari):
+    c = DeviceStateCache(ari, reconcile_interval_sec=60.0, max_age_sec=60.0)
+    yield c
+    set_device_state_cache(None)
+    await c.stop()
+
+
+async def _reconciled(ari, count=1, timeout=3.0):
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while ari.calls.count("endpoints") < count:
+        assert loop.time() < deadline, "reconcile did not run"
+        await asyncio.sleep(0.01)
+    await asyncio.sleep(0.01)  # let the device state refreshes of this pass finish
+
+
+def _context(ari, internal=None):
+    tools = dict(TOOLS_CONFIG)
+    if internal is not None:
+        tools["extensions"] = {"internal": internal}
+    return ToolExecutionContext(call_id="call-1", ari_client=ari, config={"tools": tools})
+
+
+@pytest.mark.asyncio
+async def test_tool_answers_from_events_without_ari_round_trips(ari, cache):
+    assert configured_device_state_ids(TOOLS_CONFIG) == ["SIP/6000"]
+    cache.track(configured_device_state_ids(TOOLS_CONFIG))
+    await cache.start()
+    set_device_state_cache(cache)
+    assert get_device_state_cache() is cache
+    await _reconciled(ari)
+    assert "deviceStates/SIP%2F6000" in ari.calls
+
+    tool = CheckExtensionStatusTool()
+    ari.calls.clear()
+    result = await tool.execute({"extension": "support"}, _context(ari))
+    assert (result["device_state"], result["available"], result["endpoint_state"]) == ("NOT_INUSE", True, "online")
+
+    # The agent picks up: Asterisk pushes the change, the next lookup sees it from memory.
+    await ari.emit("DeviceStateChanged", device_state={"name": "SIP/6000", "state": "INUSE"})
+    await ari.emit("EndpointStateChange", endpoint={
+        "technology": "SIP", "resource": "6000", "state": "online", "channel_ids": ["SIP/6000-0001"],
+    })
+    result = await tool.execute({"extension": "6000"}, _context(ari))
+    assert (result["device_state"], result["available"]) == ("INUSE", False)
+    assert result["endpoint_channel_ids"] == ["SIP/6000-0001"]
+    assert ari.calls == []
+    assert REGISTRY.get_sample_value(
+        "ai_agent_device_state_cache_events_total", {"type": "DeviceStateChanged"}
+    ) >= 1
+
+
+@pytest.mark.asyncio
+async def test_auto_detected_extensions_are_learned_on_first_lookup(ari, cache):
+    await cache.start()
+    set_device_state_cache(cache)
+    await _reconciled(ari)
+
+    tool = CheckExtensionStatusTool()
+    ari.calls.clear()
+    first = await tool.execute({"extension": "2765"}, _context(ari, internal={}))
+    assert (first["device_state_id"], first["available"]) == ("PJSIP/2765", True)
+    # Endpoint tech detection comes from the reconciled endpoint list; only the device state is fetched.
+    assert ari.calls == ["deviceStates/PJSIP%2F2765"]
+
+    ari.calls.clear()
+    second = await tool.execute({"extension": "2765"}, _context(ari, internal={}))
+    assert second["available"] is True
+    assert ari.calls == []
+
+    # Endpoints ARI does not have are known absent: no SIP/2765 probe when recovering from INVALID.
+    assert cache.get_endpoint("SIP", "2765") == (True, None)
+
+
+@pytest.mark.asyncio
+async def test_reconcile_repairs_missed_events_and_stale_entries_fall_back_to_ari(ari, cache):
+    cache.track(["SIP/6000"])
+    await cache.start()
+    set_device_state_cache(cache)
+    await _reconciled(ari)
+    corrections = REGISTRY.get_sample_value(
+        "ai_agent_device_state_cache_corrections_total", {"kind": "device"}
+    ) or 0.0
+
+    # Events are not delivered while the WebSocket is down: lookups miss, tools probe live.
+    ari.is_connected = False
+    ari.device_states["SIP/6000"] = "UNAVAILABLE"
+    assert cache.get_device_state("SIP/6000") is None
+    assert cache.get_endpoint("SIP", "6000") == (False, None)
+
+    # Reconnecting triggers a reconcile that repairs the missed change.
+    ari.is_connected = True
+    await _reconciled(ari, count=2)
+    assert cache.get_device_state("sip/6000") == {"name": "SIP/6000", "state": "UNAVAILABLE"}
+    assert REGISTRY.get_sample_value(
+        "ai_agent_device_state_cache_corrections_total", {"kind": "device"}
+    ) == corrections + 1
+
+    cache.max_age_sec = 0.05
+    await asyncio.sleep(0.1)
+    assert cache.get_device_state("SIP/6000") is None
+    cache.update_metrics()
+    assert REGISTRY.get_sample_value("ai_agent_device_state_cache_staleness_seconds") >= 0.1
+
+    ari.calls.clear()
+    result = await CheckExtensionStatusTool().execute({"extension": "6000"}, _context(ari))
+    assert result["device_state"] == "UNAVAILABLE"
+    assert "deviceStates/SIP%2F6000" in ari.calls
@@ -0,0 +1,389 @@
+"""
+Cluster mode: ARI app sharding, the shared state backend, and a multi-process run of
+shards against a fake ARI.
+"""
+
+import asyncio
+import json
+import multiprocessing
+import time
+from collections import Counter
+
+import pytest
+from aiohttp import web
+
+from src.core.sharding import ShardInfo, ShardRouter, owner_key, shard_for
+from src.core.state_backend import MemoryStateBackend, SQLiteStateBackend, create_state_backend
+
+APP = "asterisk-ai-voice-agent"
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+async def backend(request, tmp_path):
+    if request.param == "memory":
+        state = MemoryStateBackend()
+    else:
+        state = SQLiteStateBackend(str(tmp_path / "engine_state.db"))
+    await state.start()
+    yield state
+    await state.close()
+
+
+def test_shard_for_is_stable_and_balanced():
+    channel_ids = [f"1712345678.{n}" for n in range(4000)]
+    counts = Counter(shard_for(cid, 4) for cid in channel_ids)
+    assert set(counts) == {0, 1, 2, 3}
+    assert max(counts.values()) < 1.1 * min(counts.values())
+    assert shard_for("1712345678.7", 4) == shard_for("1712345678.7", 4)
+    assert shard_for("anything", 1) == 0
+
+
+def test_ports_are_partitioned_per_shard():
+    shards = [ShardInfo(index=i, count=3, app_name=APP) for i in range(3)]
+    assert [s.port(8090) for s in shards] == [8090, 8091, 8092]
+    ranges = [s.port_range(18080, 18099) for s in shards]
+    assert ranges == [(18080, 18085), (18086, 18091), (18092, 18099)]
+    assert [s.port_range(18080, 18080) for s in shards] == [(18080, 18080), (18081, 18081), (18082, 18082)]
+    assert ShardInfo(app_name=APP).port_range(18080, 18099) == (18080, 18099)
+    with pytest.raises(ValueError):
+        shards[0].port_range(18080, 18081)
+    with pytest.raises(ValueError):
+        ShardInfo(index=3, count=3)
+
+
+def test_single_shard_keeps_the_front_door_app():
+    assert ShardInfo(app_name=APP).origination_app == APP
+    assert ShardInfo(index=1, count=2, app_name=APP).origination_app == f"{APP}-shard-1"
+
+
+async def test_router_routes_front_door_shard_apps_and_reentries(backend):
+    shards = [ShardInfo(index=i, count=2, app_name=APP) for i in range(2)]
+    local = {0: set(), 1: set()}
+    routers = [ShardRouter(s, backend, local[s.index].__contains__) for s in shards]
+
+    async def owners(event):
+        return [i for i, router in enumerate(routers) if await router.owns_stasis_start(event)]
+
+    caller = {"application": APP, "channel": {"id": "1712345678.1"}, "args": []}
+    assert await owners(caller) == [shard_for("1712345678.1", 2)]
+
+    originated = {"application": f"{APP}-shard-1", "channel": {"id": "1712345678.2"}, "args": ["outbound", "a1"]}
+    assert await owners(originated) == [1]
+
+    # Dialplan re-entry into the front door: owner record wins over the channel hash.
+    channel_id = next(cid for cid in (f"9.{n}" for n in range(100)) if shard_for(cid, 2) == 0)
+    await routers[1].claim("attempt-7")
+    reentry = {"application": APP, "channel": {"id": channel_id}, "args": ["outbound_amd", "attempt-7", "HUMAN"]}
+    assert await owners(reentry) == [1]
+    await routers[1].release("attempt-7")
+    assert await backend.get(owner_key("attempt-7")) is None
+    assert await owners(reentry) == [0]
+
+    # A call created on shard 1 is held locally and published as owned (Engine._save_session).
+    local[1].add("call-9")
+    await routers[1].claim("call-9")
+    action = {"application": APP, "channel": {"id": channel_id}, "args": ["transfer", "call-9"]}
+    assert await owners(action) == [1]
+
+
+async def test_try_reserve_caps_the_scope_total(backend):
+    assert await backend.try_reserve("outbound:c1", "0", 1, limit=3, ttl_sec=30)
+    assert await backend.try_reserve("outbound:c1", "1", 0, limit=3, ttl_sec=30)
+    assert not await backend.try_reserve("outbound:c1", "1", 1, limit=3, ttl_sec=30)
+    assert await backend.loads("outbound:c1") == {"0": 2, "1": 1}
+    # A shard that finished its calls publishes a lower load and frees capacity.
+    await backend.report_load("outbound:c1", "0", 0, ttl_sec=30)
+    assert await backend.try_reserve("outbound:c1", "1", 1, limit=3, ttl_sec=30)
+    assert await backend.total_load("outbound:c1") == 2
+
+
+async def test_expired_entries_are_ignored(backend):
+    await backend.set("owner:x", 1, ttl_sec=0.05)
+    await backend.report_load("calls", "0", 5, ttl_sec=0.05)
+    await backend.set("keep", {"a": 1})
+    assert await backend.get("owner:x") == 1
+    await asyncio.sleep(0.1)
+    assert await backend.get("owner:x") is None
+    assert await backend.loads("calls") == {}
+    assert await backend.get("keep") == {"a": 1}
+
+
+def test_create_state_backend_from_config(tmp_path):
+    from src.config import ClusterConfig
+
+    assert isinstance(create_state_backend(ClusterConfig()), MemoryStateBackend)
+    cfg = ClusterConfig(state_backend="sqlite", state_db_path=str(tmp_path / "s.db"))
+    assert isinstance(create_state_backend(cfg), SQLiteStateBackend)
+    with pytest.raises(ValueError):
+        create_state_backend(ClusterConfig(state_backend="etcd"))
+
+
+def test_cluster_env_overrides(monkeypatch):
+    from src.config.defaults import apply_cluster_defaults
+
+    monkeypatch.setenv("AI_ENGINE_SHARD_COUNT", "4")
+    monkeypatch.setenv("AI_ENGINE_SHARD_INDEX", "2")
+    monkeypatch.setenv("AI_ENGINE_STATE_BACKEND", "SQLite")
+    config_data = {"cluster": {"shard_count": 1, "state_db_path": "/var/lib/aava/state.db"}}
+    apply_cluster_defaults(config_data)
+    assert config_data["cluster"] == {
+        "shard_count": 4,
+        "shard_index": 2,
+        "state_backend": "sqlite",
+        "state_db_path": "/var/lib/aava/state.db",
+    }
+
+
+# ---------------------------------------------------------------------------
+# Multi-process: N shard processes with the real ARIClient, ShardRouter and SQLite
+# backend against one fake ARI.
+# ---------------------------------------------------------------------------
+
+
+class FakeARI:
+    """Just enough ARI: /asterisk/info, the events websocket, answer/hangup/originate."""
+
+    def __init__(self):
+        self.subscribers = []  # (apps, ws)
+        self.hangups = Counter()  # channel_id -> DELETE count
+        self.handled_by = {}  # channel_id -> ARI username
+        self.live_originated = set()
+        self.max_live_originated = 0
+        self.originated_by = Counter()
+        self.origin_app = {}
+        self.all_done = asyncio.Event()
+        self.expected = 0
+        self._next_id = 0
+        self.runner = None
+        self.port = None
+
+    async def start(self):
+        app = web.Application()
+        app.router.add_get("/ari/asterisk/info", self._info)
+        app.router.add_get("/ari/events", self._events)
+        app.router.add_post("/ari/channels", self._originate)
+        app.router.add_post("/ari/channels/{id}/answer", self._no_content)
+        app.router.add_delete("/ari/channels/{id}", self._hangup)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        await site.start()
+        self.port = site._server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        for _, ws in self.subscribers:
+            await ws.close()
+        await self.runner.cleanup()
+
+    @staticmethod
+    def _user(request):
+        import base64
+
+        auth = request.headers.get("Authorization", "")
+        return base64.b64decode(auth.split(" ", 1)[1]).decode().split(":", 1)[0]
+
+    async def _info(self, request):
+        return web.json_response({"system": {"version": "fake"}})
+
+    async def _no_content(self, request):
+        return web.Response(status=204)
+
+    async def _events(self, request):
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        entry = (set(request.query.get("app", "").split(",")), ws)
+        self.subscribers.append(entry)
+        async for _ in ws:
+            pass
+        self.subscribers.remove(entry)
+        return ws
+
+    async def stasis_start(self, channel_id, application, args=()):
+        message = json.dumps({
+            "type": "StasisStart",
+            "application": application,
+            "args": list(args),
+            "channel": {"id": channel_id, "name": f"PJSIP/test-{channel_id}"},
+        })
+        for apps, ws in list(self.subscribers):
+            if application in apps:
+                await ws.send_str(message)
+
+    async def _originate(self, request):
+        app = request.query["app"]
+        args = request.query.get("appArgs", "").split(",")
+        self._next_id += 1
+        channel_id = f"out-{self._next_id}"
+        self.originated_by[app] += 1
+        self.origin_app[channel_id] = app
+        self.live_originated.add(channel_id)
+        self.max_live_originated = max(self.max_live_originated, len(self.live_originated))
+        asyncio.get_running_loop().call_later(
+            0.01, lambda: asyncio.ensure_future(self.stasis_start(channel_id, app, args))
+        )
+        return web.json_response({"id": channel_id})
+
+    async def _hangup(self, request):
+        channel_id = request.match_info["id"]
+        self.hangups[channel_id] += 1
+        self.handled_by.setdefault(channel_id, self._user(request))
+        self.live_originated.discard(channel_id)
+        if self.expected and sum(self.hangups.values()) >= self.expected:
+            self.all_done.set()
+        return web.Response(status=204)
+
+
+def _shard_worker(index, count, ari_port, db_path, mode, params, stop_event):
+    """One ai-engine shard process."""
+    import os
+
+    os.environ["LOG_LEVEL"] = "error"
+    from src.logging_config import configure_logging
+
+    configure_logging()
+    asyncio.run(_shard_main(index, count, ari_port, db_path, mode, params, stop_event))
+
+
+async def _shard_main(index, count, ari_port, db_path, mode, params, stop_event):
+    from src.ari_client import ARIClient
+
+    shard = ShardInfo(index=index, count=count, app_name=APP)
+    backend = SQLiteStateBackend(db_path)
+    await backend.start()
+    held = set()
+    router = ShardRouter(shard, backend, held.__contains__)
+    ari = ARIClient(
+        f"shard-{index}",
+        "secret",
+        f"http://127.0.0.1:{ari_port}/ari",
+        APP,
+        shard_app=shard.origination_app if shard.enabled else None,
+    )
+    state = {"load": 0}
+    scope = "outbound:campaign-1"
+
+    async def on_stasis_start(event):
+        if not await router.owns_stasis_start(event):
+            return
+        channel_id = event["channel"]["id"]
+        held.add(channel_id)
+        await router.claim(channel_id)
+        await ari.answer_channel(channel_id)
+        if mode == "inbound":
+            for _ in range(params["frames"]):
+                # Stand-in for per-frame media work that holds this shard's event loop.
+                time.sleep(params["frame_work_sec"])
+                await asyncio.sleep(0)
+        else:
+            await asyncio.sleep(params["call_sec"])
+        await ari.hangup_channel(channel_id)
+        await router.release(channel_id)
+        held.discard(channel_id)
+        if mode == "outbound":
+            state["load"] -= 1
+
+    async def dial(attempts):
+        # Like Engine._outbound_scheduler_loop: the dialer is the only writer of this
+        # shard's load and republishes it every tick.
+        for n in range(attempts):
+            while not await backend.try_reserve(scope, shard.member, state["load"], limit=params["limit"], ttl_sec=30):
+                await asyncio.sleep(0.005)
+            state["load"] += 1
+            attempt_id = f"{index}-{n}"
+            await router.claim(attempt_id)
+            await ari.originate_channel(
+                endpoint="PJSIP/lead", app=shard.origination_app, app_args=f"outbound,{attempt_id}"
+            )
+        while True:
+            await backend.report_load(scope, shard.member, state["load"], ttl_sec=30)
+            await asyncio.sleep(0.005)
+
+    ari.add_event_handler("StasisStart", on_stasis_start)
+    await ari.connect()
+    listener = asyncio.create_task(ari.start_listening())
+    dialer = asyncio.create_task(dial(params["attempts"])) if mode == "outbound" else None
+    while not stop_event.is_set():
+        await asyncio.sleep(0.02)
+    if dialer:
+        dialer.cancel()
+    await ari.disconnect()
+    listener.cancel()
+    await backend.close()
+
+
+async def _run_cluster(tmp_path, count, mode, params, on_ready):
+    fake = FakeARI()
+    await fake.start()
+    # forkserver: one clean server process imports the engine modules once; shards fork from it.
+    ctx = multiprocessing.get_context("forkserver")
+    ctx.set_forkserver_preload(["src.ari_client", "src.core.sharding", "src.logging_config"])
+    stop_event = ctx.Event()
+    db_path = str(tmp_path / f"state-{mode}-{count}.db")
+    workers = [
+        ctx.Process(target=_shard_worker, args=(i, count, fake.port, db_path, mode, params, stop_event))
+        for i in range(count)
+    ]
+    for worker in workers:
+        worker.start()
+    try:
+        deadline = time.monotonic() + 60
+        while len(fake.subscribers) < count:
+            assert time.monotonic() < deadline, "shards did not connect to the fake ARI"
+            await asyncio.sleep(0.05)
+        started = time.perf_counter()
+        await on_ready(fake)
+        await asyncio.wait_for(fake.all_done.wait(), timeout=60)
+        return fake, time.perf_counter() - started
+    finally:
+        stop_event.set()
+        # Keep serving while shards close their websockets.
+        deadline = time.monotonic() + 10
+        while any(w.is_alive() for w in workers) and time.monotonic() < deadline:
+            await asyncio.sleep(0.05)
+        for worker in workers:
+            if worker.is_alive():
+                worker.terminate()
+        await fake.stop()
+
+
+@pytest.mark.slow
+@pytest.mark.integration
+async def test_inbound_calls_scale_with_shard_count(tmp_path):
+    calls = [f"1712345678.{n}" for n in range(48)]
+    params = {"frames": 10, "frame_work_sec": 0.005}
+
+    async def place_calls(fake):
+        fake.expected = len(calls)
+        for channel_id in calls:
+            await fake.stasis_start(channel_id, APP)
+
+    elapsed = {}
+    for count in (1, 2, 4):
+        fake, elapsed[count] = await _run_cluster(tmp_path, count, "inbound", params, place_calls)
+        # Every caller channel was handled by exactly one shard: the one its id hashes to.
+        assert set(fake.hangups) == set(calls)
+        assert set(fake.hangups.values()) == {1}
+        assert all(fake.handled_by[cid] == f"shard-{shard_for(cid, count)}" for cid in calls)
+
+        # Throughput tracks the busiest shard's share, i.e. scales linearly with balanced hashing.
+        busiest = max(Counter(shard_for(cid, count) for cid in calls).values())
+        ideal_speedup = len(calls) / busiest
+        assert elapsed[1] / elapsed[count] >= 0.75 * ideal_speedup, elapsed
+
+
+@pytest.mark.slow
+@pytest.mark.integration
+async def test_outbound_capacity_is_global_across_shards(tmp_path):
+    params = {"attempts": 6, "limit": 3, "call_sec": 0.05}
+
+    async def expect_calls(fake):
+        fake.expected = 3 * params["attempts"]
+
+    fake, _ = await _run_cluster(tmp_path, 3, "outbound", params, expect_calls)
+    assert sum(fake.originated_by.values()) == 3 * params["attempts"]
+    assert fake.max_live_originated <= params["limit"]
+    # Originated channels enter the originating shard's app and come back to it.
+    assert set(fake.handled_by) == set(fake.origin_app)
+    for channel_id, user in fake.handled_by.items():
+        assert fake.origin_app[channel_id] == f"{APP}-{user}"
+    assert set(fake.originated_by) == {f"{APP}-shard-{i}" for i in range(3)}
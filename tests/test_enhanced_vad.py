@@ -433,5 +433,91 @@ class TestVADIntegration:
         await vad_manager.reset_call(call_id)
 
 
+class TestBatchVAD:
+    """Batch mode must score exactly like the per-frame path."""
+
+    @staticmethod
+    def _managers():
+        kwargs = dict(
+            energy_threshold=1500,
+            adaptive_threshold_enabled=True,
+            min_speech_frames=2,
+            max_silence_frames=5,
+        )
+        scalar = EnhancedVADManager(**kwargs)
+        batch = EnhancedVADManager(batch_enabled=True, **kwargs)
+        # webrtcvad keeps state across calls, so its answers depend on frame order.
+        scalar.webrtc_vad = batch.webrtc_vad = None
+        return scalar, batch
+
+    @staticmethod
+    def _streams(calls, frames):
+        import numpy as np
+
+        rng = np.random.default_rng(1)
+        streams = {}
+        for call in range(calls):
+            chunks = []
+            for _ in range(frames):
+                amplitude = rng.choice([50, 300, 3000, 9000])
+                samples = 160 if rng.random() < 0.9 else 240
+                audio = rng.normal(0, amplitude, samples).clip(-32768, 32767).astype(np.int16)
+                chunks.append(audio.tobytes())
+            streams[f"call-{call}"] = chunks
+        return streams
+
+    @pytest.mark.asyncio
+    async def test_interleaved_batches_match_per_frame(self):
+        scalar, batch = self._managers()
+        streams = self._streams(calls=12, frames=120)
+
+        expected = {
+            call_id: [await scalar.process_frame(call_id, frame) for frame in frames]
+            for call_id, frames in streams.items()
+        }
+
+        # Calls submit uneven chunks concurrently, so one flush mixes several
+        # frames of one call with single frames of others.
+        got = {call_id: [] for call_id in streams}
+        position = dict.fromkeys(streams, 0)
+        step = 0
+        while any(position[c] < len(streams[c]) for c in streams):
+            pending = []
+            for index, call_id in enumerate(streams):
+                size = (index + step) % 4
+                chunk = streams[call_id][position[call_id]:position[call_id] + size]
+                position[call_id] += len(chunk)
+                if chunk:
+                    pending.append((call_id, asyncio.ensure_future(batch.process_frames(call_id, chunk))))
+            for call_id, future in pending:
+                got[call_id].extend(await future)
+            step += 1
+
+        assert got == expected
+        state = batch._batch_state
+        for call_id in streams:
+            stats = state.call_stats(state.slots[call_id])
+            assert stats == pytest.approx(scalar._call_stats[call_id])
+
+    @pytest.mark.asyncio
+    async def test_process_batch_and_reset(self):
+        scalar, batch = self._managers()
+        frames = [("a", b"\x00" * 320, 8000), ("b", b"\x10\x27" * 160, 8000), ("a", b"\x00" * 320, 8000)]
+        assert await batch.process_batch(frames) == await scalar.process_batch(frames)
+        assert await batch.process_batch([]) == []
+
+        state = batch._batch_state
+        assert state.call_stats(state.slots["a"])["total_frames"] == 2
+        released = state.slots["a"]
+        await batch.reset_call("a")
+        assert "a" not in state.slots and "a" not in batch._call_states
+
+        # The released slot is reused from a clean state.
+        result = await batch.process_frame("c", b"\x00" * 320)
+        assert not result.is_speech
+        assert state.slots["c"] == released
+        assert state.call_stats(released)["total_frames"] == 1
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,203 @@
+"""
+Hot-path logging: the HotLogger governor and a lint over @hot_path functions.
+"""
+
+import ast
+import logging
+from pathlib import Path
+
+import pytest
+
+from src import logging_config
+from src.logging_config import HotLogger, forget_hot_log_key
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+GOVERNED_LEVELS = {"debug", "info"}
+UNGOVERNED_LOGGERS = {"logger", "logging", "log", "_logger"}
+# Once-per-call/turn events inside hot functions: diagnostics that must never be sampled away.
+ONE_OFF_EVENTS = {
+    "Media RX confirmed (AudioSocket)",
+    "Media RX confirmed (ExternalMedia)",
+    "🎧 BARGE-IN triggered",
+    "🎧 BARGE-IN (AudioSocket/pipeline) triggered",
+    "🎧 BARGE-IN (RTP/pipeline) triggered",
+    "🎧 BARGE-IN (RTP) triggered",
+    "🎤 USER INTERRUPTING AGENT",
+    "📤 FLUSHING BUFFERED AUDIO (gate opened)",
+    "RTP send deferred; waiting for remote endpoint",
+    "🎵 STREAMING OUTBOUND - First frame",
+    "Wrote pre-compand PCM16 tap snapshot",
+    "Wrote post-compand PCM16 tap snapshot",
+}
+
+
+def _is_hot(node) -> bool:
+    for decorator in node.decorator_list:
+        target = decorator.func if isinstance(decorator, ast.Call) else decorator
+        name = target.attr if isinstance(target, ast.Attribute) else getattr(target, "id", None)
+        if name == "hot_path":
+            return True
+    return False
+
+
+def _receiver(call: ast.Call):
+    value = call.func.value
+    if isinstance(value, ast.Name):
+        return value.id
+    if isinstance(value, ast.Attribute):
+        return value.attr
+    return None
+
+
+def _hot_functions():
+    for path in sorted(SRC.rglob("*.py")):
+        tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
+        for node in ast.walk(tree):
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) and _is_hot(node):
+                yield path, node
+
+
+def test_hot_path_functions_only_log_through_the_governor():
+    violations = []
+    for path, function in _hot_functions():
+        for node in ast.walk(function):
+            if not (isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute)):
+                continue
+            if node.func.attr in GOVERNED_LEVELS and _receiver(node) in UNGOVERNED_LOGGERS:
+                event = node.args[0].value if node.args and isinstance(node.args[0], ast.Constant) else None
+                if node.func.attr == "info" and event in ONE_OFF_EVENTS:
+                    continue
+                violations.append(f"{path.relative_to(SRC.parent)}:{node.lineno} {function.name}")
+    assert not violations, "unsampled debug/info logging in @hot_path functions:\n" + "\n".join(violations)
+
+
+def test_one_off_events_are_not_sampled():
+    governed = set()
+    for path, function in _hot_functions():
+        for node in ast.walk(function):
+            if (
+                isinstance(node, ast.Call)
+                and isinstance(node.func, ast.Attribute)
+                and _receiver(node) == "hot_log"
+                and node.args
+                and isinstance(node.args[0], ast.Constant)
+            ):
+                governed.add(node.args[0].value)
+    assert not governed & ONE_OFF_EVENTS
+
+
+def test_per_frame_media_paths_are_marked_hot():
+    marked = {(path.name, function.name) for path, function in _hot_functions()}
+    assert {
+        ("engine.py", "_on_rtp_audio"),
+        ("engine.py", "_audiosocket_handle_audio"),
+        ("audio_gating_manager.py", "should_forward_audio"),
+        ("streaming_playback_manager.py", "_apply_normalizer"),
+        ("streaming_playback_manager.py", "_send_audio_chunk"),
+    } <= marked
+
+
+@pytest.fixture
+def governed(monkeypatch):
+    settings = dict(logging_config._HOT_PATH, sampling=True, level_gate=True, first=3, every=250, rate=20.0, burst=50.0)
+    monkeypatch.setattr(logging_config, "_HOT_PATH", settings)
+    hot = HotLogger("tests.hot_path")
+    emitted = []
+    monkeypatch.setattr(hot, "_log", type("Sink", (), {
+        "debug": lambda self, event, **kw: emitted.append(("debug", event, kw)),
+        "info": lambda self, event, **kw: emitted.append(("info", event, kw)),
+    })())
+    std = logging.getLogger("tests.hot_path")
+    std.setLevel(logging.DEBUG)
+    yield hot, emitted, settings, std
+    std.setLevel(logging.NOTSET)
+
+
+def test_disabled_level_is_dropped_before_structlog(governed):
+    hot, emitted, _, std = governed
+    std.setLevel(logging.INFO)
+    for _ in range(10):
+        hot.debug("frame", call_id="a")
+    hot.info("frame", call_id="a")
+    assert [level for level, _, _ in emitted] == ["info"]
+    assert hot.stats()["frame"]["emitted"] == 1
+
+
+def test_first_n_then_every_m_per_call(governed):
+    hot, emitted, _, _ = governed
+    for _ in range(500):
+        hot.debug("frame", call_id="a")
+        hot.debug("frame", call_id="b")
+    per_call = [kw["call_id"] for _, _, kw in emitted]
+    # frames 1-3, 250 and 500 of each call
+    assert per_call.count("a") == per_call.count("b") == 5
+    assert emitted[-2][2]["suppressed"] == 2 * 249
+
+    forget_hot_log_key("a")
+    hot.debug("frame", call_id="a")
+    assert emitted[-1][2]["call_id"] == "a"
+
+
+def test_token_bucket_bounds_volume_across_calls(governed):
+    hot, emitted, settings, _ = governed
+    settings.update(rate=0.0, burst=10.0)
+    for n in range(1000):
+        hot.debug("call started", call_id=f"call-{n}")
+    assert len(emitted) == 10
+    assert hot.stats()["call started"]["suppressed"] == 990
+
+
+def test_sampling_can_be_switched_off(governed):
+    hot, emitted, settings, _ = governed
+    settings["sampling"] = False
+    for _ in range(300):
+        hot.debug("frame", call_id="a")
+    assert len(emitted) == 300
+
+
+def test_governed_calls_pass_fields_as_keywords():
+    # HotLogger.debug/info take (event, **kw); printf-style args raise TypeError per frame.
+    violations = []
+    for path in sorted(SRC.rglob("*.py")):
+        tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
+        for node in ast.walk(tree):
+            if not (isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute)):
+                continue
+            if node.func.attr in GOVERNED_LEVELS and _receiver(node) == "hot_log" and len(node.args) != 1:
+                violations.append(f"{path.relative_to(SRC.parent)}:{node.lineno}")
+    assert not violations, "hot_log calls with positional fields:\n" + "\n".join(violations)
+
+
+@pytest.mark.asyncio
+async def test_rtp_frames_below_barge_in_threshold_are_dropped_quietly(monkeypatch):
+    import time
+    import types
+
+    from src import engine as engine_module
+    from src.engine import Engine
+
+    session = types.SimpleNamespace(
+        call_id="call-1", ssrc=1234, media_rx_confirmed=True, audio_capture_enabled=False,
+        tts_started_ts=time.time() - 5.0, tts_ended_ts=0.0, barge_in_candidate_ms=0,
+        conversation_state="speaking", provider_name="local", vad_state={},
+    )
+    engine = Engine.__new__(Engine)
+    engine._media_session = lambda call_id: session
+    engine._pipeline_forced = {}
+    engine._pipeline_queues = {}
+    engine._call_providers = {}
+    engine.providers = {}
+    engine.rtp_server = None
+    engine.conversation_coordinator = None
+    engine.config = types.SimpleNamespace(
+        default_provider="local",
+        barge_in=types.SimpleNamespace(enabled=True, initial_protection_ms=200, energy_threshold=1000, min_ms=250),
+    )
+    dropped, errors = [], []
+    monkeypatch.setattr(engine_module.hot_log, "debug", lambda event, **kw: dropped.append((event, kw)))
+    monkeypatch.setattr(engine_module.logger, "error", lambda event, **kw: errors.append(event))
+
+    await engine._on_rtp_audio("call-1", 1234, b"\x00\x00" * 320)
+
+    assert errors == []
+    assert ("Dropping inbound RTP during TTS", {"call_id": "call-1", "candidate_ms": 0, "energy": 0}) in dropped
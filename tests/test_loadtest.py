@@ -0,0 +1,103 @@
+import asyncio
+import base64
+import json
+import wave
+
+import pytest
+import websockets
+
+from src.loadtest import AgentScript, LoadScenario, ScriptedLocalAI, compare_reports, run_load
+from src.loadtest.audio import FRAME_BYTES, caller_turns, is_voiced, load_wav, silence, split_frames, synthetic_utterance, tone
+from src.loadtest.harness import percentiles
+
+
+def test_caller_audio_is_seeded_and_framed(tmp_path):
+    assert caller_turns(turns=2, seed=3) == caller_turns(turns=2, seed=3)
+    assert caller_turns(turns=1, seed=3) != caller_turns(turns=1, seed=4)
+    frames = split_frames(synthetic_utterance(1010, seed=1))
+    assert len(frames) == 51 and all(len(f) == FRAME_BYTES for f in frames)
+    assert all(is_voiced(f) for f in frames[:-1])
+    assert not is_voiced(silence(20))
+
+    # 16 kHz stereo recording -> 8 kHz mono PCM16
+    path = tmp_path / "caller.wav"
+    pcm8k = tone(500)
+    with wave.open(str(path), "wb") as wav:
+        wav.setnchannels(2)
+        wav.setsampwidth(2)
+        wav.setframerate(16000)
+        stereo = b"".join(pcm8k[i : i + 2] * 4 for i in range(0, len(pcm8k), 2))
+        wav.writeframes(stereo)
+    assert abs(len(load_wav(str(path))) - len(pcm8k)) <= 4
+    assert caller_turns([str(path)]) == [load_wav(str(path))]
+
+
+def test_percentiles_and_regression_check():
+    assert percentiles([]) == {"p50": None, "p95": None, "p99": None, "max": None}
+    assert percentiles(list(range(1, 101))) == {"p50": 50, "p95": 95, "p99": 99, "max": 100}
+
+    def report(p95, dropped=0, failed=0):
+        return {
+            "turn_latency_ms": {"p95": p95},
+            "engine": {"cpu_percent": 20.0},
+            "dropped_frames": dropped,
+            "late_caller_frames": 0,
+            "calls": {"failed": failed},
+        }
+
+    baseline = report(800.0)
+    assert compare_reports(report(900.0), baseline) == []
+    assert compare_reports(report(1100.0), baseline) == ["turn_latency_ms.p95: 800.0 -> 1100.0"]
+    assert compare_reports(report(800.0, dropped=3, failed=1), baseline) == [
+        "dropped_frames: 0 -> 3",
+        "calls.failed: 0 -> 1",
+    ]
+
+
+async def test_scripted_local_ai_endpoints_and_replies():
+    script = AgentScript(endpoint_ms=100, stt_ms=10, llm_ms=10, tts_ms=10, reply_ms=200)
+    server = ScriptedLocalAI(script)
+    url = await server.start()
+    try:
+        async with websockets.connect(url) as ws:
+            await ws.send(json.dumps({"type": "auth", "auth_token": "x"}))
+            assert json.loads(await ws.recv())["type"] == "auth_response"
+
+            speech = tone(300, amplitude=8000)
+            pcm16k = b"".join(speech[i : i + 2] * 2 for i in range(0, len(speech), 2))
+            for chunk in (pcm16k, silence(240) * 2):
+                await ws.send(
+                    json.dumps({"type": "audio", "call_id": "c1", "data": base64.b64encode(chunk).decode("ascii")})
+                )
+
+            kinds = []
+            while "audio" not in kinds:
+                message = await asyncio.wait_for(ws.recv(), 2)
+                if isinstance(message, bytes):
+                    kinds.append("audio")
+                    assert len(message) == 8000 * script.reply_ms // 1000
+                else:
+                    kinds.append(json.loads(message)["type"])
+            assert kinds == ["stt_result", "llm_response", "audio"]
+    finally:
+        await server.stop()
+    assert server.stats()["utterances"] == 1 and server.stats()["replies"] == 1
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("transport", ["audiosocket", "externalmedia"])
+async def test_run_load_drives_engine_end_to_end(transport):
+    script = AgentScript(endpoint_ms=200, stt_ms=20, llm_ms=50, tts_ms=20, reply_ms=400, greeting_ms=300)
+    report = await run_load(
+        LoadScenario(calls=2, transport=transport, turns=1, utterance_ms=600, arrival_ms=50, script=script)
+    )
+
+    assert report["calls"] == {"completed": 2, "failed": 0, "errors": {}}
+    assert report["turns"] == {"completed": 2, "timeouts": 0}
+    assert report["turn_latency_ms"]["p50"] >= script.turn_ms
+    assert report["first_audio_ms"]["max"] is not None
+    assert report["dropped_frames"] == 0
+    assert report["local_ai"]["greetings"] == 2 and report["local_ai"]["replies"] == 2
+    assert report["engine"]["peak_rss_mb"] > 0
+    media = "POST channels" if transport == "audiosocket" else "POST channels/externalMedia"
+    assert report["ari_requests"][media] == 2
@@ -0,0 +1,253 @@
+import asyncio
+import base64
+import importlib
+import importlib.util
+import json
+import os
+import sys
+
+import pytest
+import websockets
+from websockets.asyncio.server import serve
+
+from src.audio import local_ai_frames as frames
+
+LOCAL_AI_DIR = os.path.join(os.path.dirname(__file__), "..", "local_ai_server")
+
+# local_ai_server is not a package; load its protocol contract by path.
+_spec = importlib.util.spec_from_file_location(
+    "local_ai_protocol_contract", os.path.join(LOCAL_AI_DIR, "protocol_contract.py")
+)
+contract = importlib.util.module_from_spec(_spec)
+sys.modules[_spec.name] = contract
+_spec.loader.exec_module(contract)
+
+
+def test_engine_and_server_frames_are_byte_identical():
+    assert frames.FRAME_HEADER.format == contract.FRAME_HEADER.format
+    assert frames.FRAME_CODECS == contract.FRAME_CODECS
+    for name in ("FRAME_KIND_AUDIO", "FRAME_KIND_TTS_AUDIO", "FRAME_FLAG_END", "FRAME_FLAG_RESPONSE"):
+        assert getattr(frames, name) == getattr(contract, name)
+    assert frames.call_hash("1712345678.42") == contract.call_hash("1712345678.42")
+
+    kwargs = dict(call_hash=frames.call_hash("c1"), seq=7, codec="mulaw", rate_hz=8000, flags=3)
+    engine_bytes = frames.encode_frame(frames.FRAME_KIND_TTS_AUDIO, b"\xff" * 160, **kwargs)
+    assert engine_bytes == contract.encode_frame(contract.FRAME_KIND_TTS_AUDIO, b"\xff" * 160, **kwargs)
+    assert len(engine_bytes) == 16 + 160
+
+    frame = contract.decode_frame(engine_bytes)
+    assert (frame.kind, frame.codec, frame.rate_hz, frame.seq) == (2, "mulaw", 8000, 7)
+    assert frame.end and frame.response and frame.payload == b"\xff" * 160
+
+
+def test_malformed_frames_and_negotiation():
+    with pytest.raises(ValueError):
+        frames.decode_frame(b"\x01\x01")
+    with pytest.raises(ValueError):
+        frames.decode_frame(b"\x09" + b"\x00" * 15)
+    with pytest.raises(ValueError):
+        contract.decode_frame(bytes([1, 1, 7, 0]) + b"\x00" * 12)  # unknown codec
+
+    offer = json.loads(frames.negotiate_message())
+    agreed = contract.negotiate_binary_frames(offer["binary_frames"])
+    assert agreed == {"version": 1, "codecs": ["pcm16le", "mulaw"], "header_bytes": 16}
+    assert frames.negotiated_version({"binary_frames": agreed}) == 1
+    assert contract.negotiate_binary_frames({"versions": [9]}) is None
+    assert frames.negotiated_version({"binary_frames": None}) is None
+
+
+@pytest.fixture
+def frame_server(monkeypatch):
+    # local_ai_server uses flat imports; the repo-root config/ directory would shadow its config.py.
+    monkeypatch.syspath_prepend(LOCAL_AI_DIR)
+    monkeypatch.delitem(sys.modules, "config", raising=False)
+    server_module = importlib.import_module("server")
+    heard = []
+
+    class FrameServer(server_module.LocalAIServer):
+        async def _process_stt_stream(self, session, audio_data, input_rate):
+            heard.append((session.call_id, audio_data, input_rate))
+            return [{"is_partial": True, "text": f"{len(audio_data)} bytes"}]
+
+        async def process_tts(self, text, *, session=None, call_id=None, priority=None):
+            return text.encode("ascii") * 10
+
+    server = FrameServer(server_module.LocalAIConfig(mock_models=True))
+    return server, heard
+
+
+async def _recv_json(ws):
+    while True:
+        message = await asyncio.wait_for(ws.recv(), 5)
+        if isinstance(message, str):
+            return json.loads(message)
+
+
+@pytest.mark.asyncio
+async def test_multiplexed_calls_share_one_connection(frame_server):
+    server, heard = frame_server
+    ws_server = await serve(server.handler, "127.0.0.1", 0)
+    url = f"ws://127.0.0.1:{ws_server.sockets[0].getsockname()[1]}"
+    try:
+        async with websockets.connect(url) as ws:
+            await ws.send(frames.negotiate_message(multiplex=True))
+            negotiated = await _recv_json(ws)
+            assert negotiated["type"] == "negotiate_response"
+            assert negotiated["multiplex"] is True
+            assert frames.negotiated_version(negotiated) == 1
+
+            for call_id in ("call-a", "call-b"):
+                await ws.send(json.dumps({"type": "set_mode", "mode": "stt", "call_id": call_id}))
+                assert (await _recv_json(ws))["call_id"] == call_id
+
+            # Interleaved frames land on their own call's session.
+            for seq, (call_id, size) in enumerate([("call-b", 640), ("call-a", 320), ("call-b", 64)]):
+                await ws.send(
+                    frames.encode_frame(
+                        frames.FRAME_KIND_AUDIO, b"\x01" * size, call_hash=frames.call_hash(call_id), seq=seq
+                    )
+                )
+                result = await _recv_json(ws)
+                assert (result["type"], result["call_id"], result["text"]) == ("stt_result", call_id, f"{size} bytes")
+            # µ-law frames are decoded to PCM16 before STT.
+            await ws.send(
+                frames.encode_frame(
+                    frames.FRAME_KIND_AUDIO,
+                    b"\xff" * 160,
+                    call_hash=frames.call_hash("call-a"),
+                    seq=3,
+                    codec="mulaw",
+                    rate_hz=8000,
+                )
+            )
+            assert (await _recv_json(ws))["text"] == "320 bytes"
+            assert [(c, len(a), r) for c, a, r in heard] == [
+                ("call-b", 640, 16000),
+                ("call-a", 320, 16000),
+                ("call-b", 64, 16000),
+                ("call-a", 320, 8000),
+            ]
+
+            # TTS audio comes back as a frame tagged with the call, then a JSON trailer.
+            await ws.send(json.dumps({"type": "tts_request", "text": "hi", "call_id": "call-b"}))
+            frame = frames.decode_frame(await asyncio.wait_for(ws.recv(), 5))
+            response = await _recv_json(ws)
+            assert frame.kind == frames.FRAME_KIND_TTS_AUDIO
+            assert frame.call_hash == frames.call_hash("call-b")
+            assert frame.codec == "mulaw" and frame.end and frame.response
+            assert frame.payload == b"hi" * 10
+            assert "audio_data" not in response
+            assert response["audio_transport"] == "frame"
+            assert (response["call_id"], response["frame_seq"]) == ("call-b", frame.seq)
+            assert response["byte_length"] == 20
+            contract.validate_payload(response)
+
+            await ws.send(json.dumps({"type": "call_end", "call_id": "call-b"}))
+            await ws.send(
+                frames.encode_frame(frames.FRAME_KIND_AUDIO, b"\x01" * 32, call_hash=frames.call_hash("call-b"), seq=4)
+            )
+            await ws.send(json.dumps({"type": "status"}))
+            assert (await _recv_json(ws))["type"] == "status_response"
+            assert len(heard) == 4  # frames for an ended call are dropped
+    finally:
+        ws_server.close()
+        await server.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_json_audio_unchanged_without_negotiation(frame_server):
+    server, heard = frame_server
+    ws_server = await serve(server.handler, "127.0.0.1", 0)
+    url = f"ws://127.0.0.1:{ws_server.sockets[0].getsockname()[1]}"
+    try:
+        async with websockets.connect(url) as ws:
+            await ws.send(json.dumps({"type": "tts_request", "text": "ok", "call_id": "legacy"}))
+            response = await _recv_json(ws)
+            assert response["audio_data"] and "audio_transport" not in response
+            await ws.send(json.dumps({"type": "set_mode", "mode": "stt", "call_id": "legacy"}))
+            await _recv_json(ws)
+            await ws.send(b"\x01" * 100)  # bare PCM16, no frame header
+            assert (await _recv_json(ws))["text"] == "100 bytes"
+    finally:
+        ws_server.close()
+        await server.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_tts_replies_keep_request_order(frame_server):
+    server, _ = frame_server
+
+    async def slow_first(text, *, session=None, call_id=None, priority=None):
+        # The long first sentence finishes after the short one behind it.
+        await asyncio.sleep(0.2 if text == "first sentence, quite long" else 0.0)
+        return text.encode("ascii")
+
+    server.process_tts = slow_first
+    ws_server = await serve(server.handler, "127.0.0.1", 0)
+    url = f"ws://127.0.0.1:{ws_server.sockets[0].getsockname()[1]}"
+    try:
+        async with websockets.connect(url) as ws:
+            for text in ("first sentence, quite long", "ok.", "third."):
+                await ws.send(json.dumps({"type": "tts_request", "text": text, "call_id": "ordered"}))
+            replies = [(await _recv_json(ws))["text"] for _ in range(3)]
+            assert replies == ["first sentence, quite long", "ok.", "third."]
+    finally:
+        ws_server.close()
+        await server.shutdown()
+
+
+class _Messages:
+    """Stands in for the provider's websocket: yields the given messages, then ends."""
+
+    def __init__(self, messages):
+        self._messages = list(messages)
+
+    def __aiter__(self):
+        return self._iter()
+
+    async def _iter(self):
+        for message in self._messages:
+            yield message
+
+
+async def test_local_provider_agent_audio_states_its_format():
+    from src.config import LocalProviderConfig
+    from src.core.local_ai_pool import close_shared_pools
+    from src.providers.local import LocalProvider
+
+    events = []
+
+    async def on_event(event):
+        events.append(event)
+
+    def provider_for(messages, frames_version):
+        events.clear()
+        provider = LocalProvider(LocalProviderConfig(ws_url="ws://127.0.0.1:1"), on_event)
+        provider._active_call_id = "call-1"
+        provider._frames_version = frames_version
+        provider.websocket = _Messages(messages)
+        return provider
+
+    async def formats(messages, frames_version=None):
+        await provider_for(messages, frames_version)._receive_loop()
+        return [(e["data"], e["encoding"], e["sample_rate"]) for e in events if e["type"] == "AgentAudio"]
+
+    try:
+        # Binary: raw bytes before negotiation, and framed audio carrying its own codec/rate.
+        assert await formats([b"\x7f" * 4]) == [(b"\x7f" * 4, "mulaw", 8000)]
+        framed = frames.encode_frame(
+            frames.FRAME_KIND_TTS_AUDIO, b"\x01\x00" * 4, call_hash=frames.call_hash("call-1"), seq=1,
+            codec="pcm16le", rate_hz=16000,
+        )
+        assert await formats([framed], frames_version=1) == [(b"\x01\x00" * 4, "pcm16le", 16000)]
+
+        # JSON tts_response: inline base64 audio with and without explicit format fields.
+        audio = base64.b64encode(b"\x7f" * 4).decode()
+        assert await formats([
+            json.dumps({"type": "tts_response", "call_id": "call-1", "text": "a", "audio_data": audio,
+                        "encoding": "pcm16le", "sample_rate_hz": 16000}),
+            json.dumps({"type": "tts_response", "call_id": "call-1", "text": "b", "audio_data": audio}),
+        ]) == [(b"\x7f" * 4, "pcm16le", 16000), (b"\x7f" * 4, "mulaw", 8000)]
+    finally:
+        # Providers register the process-wide connection pool for their URL.
+        await close_shared_pools()
@@ -0,0 +1,181 @@
+import asyncio
+import importlib
+import json
+import os
+import sys
+import time
+
+import pytest
+import websockets
+from websockets.asyncio.server import serve
+
+LOCAL_AI_DIR = os.path.join(os.path.dirname(__file__), "..", "local_ai_server")
+
+
+class FakeLlama:
+    """Stands in for llama_cpp.Llama: answers with the model file it was "loaded" from."""
+
+    def __init__(self, path):
+        self.name = os.path.basename(path)
+
+    def __call__(self, prompt, **kwargs):
+        time.sleep(0.005)
+        return {"choices": [{"text": f"reply from {self.name}"}]}
+
+
+@pytest.fixture
+def local_ai(monkeypatch):
+    # local_ai_server uses flat imports; the repo-root config/ directory would shadow its config.py.
+    monkeypatch.syspath_prepend(LOCAL_AI_DIR)
+    monkeypatch.delitem(sys.modules, "config", raising=False)
+    server_module = importlib.import_module("server")
+
+    class SwapServer(server_module.LocalAIServer):
+        async def _load_llm_model(self):
+            await asyncio.sleep(0.3)  # a multi-GB GGUF takes a while to map and warm up
+            self.llm_model = FakeLlama(self.llm_model_path)
+
+    return server_module, SwapServer
+
+
+async def _turn(ws, text="hello"):
+    await ws.send(json.dumps({"type": "llm_request", "text": text}))
+    reply = json.loads(await asyncio.wait_for(ws.recv(), 5))
+    assert reply["type"] == "llm_response"
+    return reply["text"]
+
+
+@pytest.mark.asyncio
+async def test_switch_model_under_load_has_no_failed_requests(local_ai):
+    server_module, SwapServer = local_ai
+    front = SwapServer(server_module.LocalAIConfig(llm_model_path="/models/a.gguf"))
+    await front.load_stages(["llm"])
+    ws_server = await serve(front.handler, "127.0.0.1", 0)
+    url = f"ws://127.0.0.1:{ws_server.sockets[0].getsockname()[1]}"
+
+    replies = []
+    stop = asyncio.Event()
+
+    async def caller():
+        while not stop.is_set():
+            async with websockets.connect(url) as ws:
+                for _ in range(3):
+                    replies.append(await _turn(ws))
+
+    try:
+        long_call = await websockets.connect(url)
+        assert await _turn(long_call) == "reply from a.gguf"
+
+        callers = [asyncio.create_task(caller()) for _ in range(8)]
+        await asyncio.sleep(0.2)
+        async with websockets.connect(url) as admin:
+            await admin.send(json.dumps({"type": "switch_model", "llm_model_path": "/models/b.gguf"}))
+            switched = json.loads(await asyncio.wait_for(admin.recv(), 10))
+        assert switched["status"] == "success"
+        assert switched["strategy"] == "blue_green"
+        assert switched["generation"] == 2
+        assert switched["draining_connections"] >= 1
+
+        await asyncio.sleep(0.3)
+        stop.set()
+        await asyncio.gather(*callers)
+
+        # Zero failures: every turn got a real model answer, never the fallback text.
+        assert replies and set(replies) <= {"reply from a.gguf", "reply from b.gguf"}
+        assert "reply from b.gguf" in replies
+
+        # The call that was live during the swap stays on the old model until it ends.
+        assert await _turn(long_call) == "reply from a.gguf"
+        old = front.retired[0]
+        async with websockets.connect(url) as ws:
+            assert await _turn(ws) == "reply from b.gguf"
+            await ws.send(json.dumps({"type": "status"}))
+            status = json.loads(await asyncio.wait_for(ws.recv(), 5))
+        assert status["model_swap"]["generation"] == 2
+        assert status["model_swap"]["draining"] == [{"generation": 1, "connections": 1}]
+
+        await long_call.close()
+        for _ in range(50):
+            if not front.retired:
+                break
+            await asyncio.sleep(0.1)
+        assert front.retired == []
+        assert old.llm_model is None
+        assert front.active.llm_model.name == "b.gguf"
+    finally:
+        ws_server.close()
+        await front.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_swap_refused_when_it_would_exceed_memory(local_ai, monkeypatch, tmp_path):
+    server_module, SwapServer = local_ai
+    big_model = tmp_path / "big.gguf"
+    big_model.write_bytes(b"\0" * 4096)
+    monkeypatch.setattr(sys.modules["model_manager"], "available_memory_bytes", lambda: 1024)
+
+    front = SwapServer(
+        server_module.LocalAIConfig(llm_model_path="/models/a.gguf", swap_memory_headroom_mb=0)
+    )
+    await front.load_stages(["llm"])
+    try:
+        response = await front.model_manager.switch_model({"llm_model_path": str(big_model)})
+        assert response["status"] == "error"
+        assert "refused" in response["message"]
+        assert front.active is front
+        assert front.llm_model.name == "a.gguf"
+        assert front.last_swap["status"] == "refused"
+    finally:
+        await front.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_pooled_connections_move_to_the_new_generation(local_ai):
+    from src.core.local_ai_pool import LocalAIConnectionPool
+
+    server_module, SwapServer = local_ai
+    front = SwapServer(server_module.LocalAIConfig(llm_model_path="/models/a.gguf"))
+    await front.load_stages(["llm"])
+    ws_server = await serve(front.handler, "127.0.0.1", 0)
+    url = f"ws://127.0.0.1:{ws_server.sockets[0].getsockname()[1]}"
+    pool = LocalAIConnectionPool(url, size=1, health_interval_sec=0.05)
+
+    async def _wait_for(predicate):
+        for _ in range(100):
+            if predicate():
+                return
+            await asyncio.sleep(0.05)
+        raise AssertionError("condition not reached")
+
+    try:
+        await pool.start()
+        live_call = await pool.open_channel("live-call")
+        assert await _turn(live_call) == "reply from a.gguf"
+        old_connection = live_call._connection
+
+        response = await front.model_manager.switch_model({"llm_model_path": "/models/b.gguf"})
+        assert (response["strategy"], response["generation"]) == ("blue_green", 2)
+
+        # The health loop notices the swap and opens a connection on the new generation.
+        await _wait_for(lambda: pool.stats()["generation"] == 2 and pool.stats()["connections"] == 1)
+        assert old_connection.stale and old_connection.alive
+        new_call = await pool.open_channel("new-call")
+        assert new_call._connection is not old_connection
+        assert await _turn(new_call) == "reply from b.gguf"
+
+        # The call that was live during the swap keeps its old connection and model.
+        assert await _turn(live_call) == "reply from a.gguf"
+
+        # Once it hangs up the old connection closes and the old generation is freed
+        # right away instead of at the drain timeout.
+        old = front.retired[0]
+        await live_call.close()
+        await _wait_for(lambda: not front.retired)
+        assert not old_connection.alive
+        assert old.llm_model is None
+        assert pool.stats()["recycled_total"] == 1
+        assert await _turn(new_call) == "reply from b.gguf"
+    finally:
+        await pool.close()
+        ws_server.close()
+        await front.shutdown()
@@ -0,0 +1,305 @@
+import asyncio
+import base64
+import json
+
+import pytest
+from websockets.asyncio.server import serve
+from websockets.exceptions import ConnectionClosedError
+
+from src.audio import local_ai_frames as frames
+from src.config import AppConfig, LocalProviderConfig
+from src.core.local_ai_pool import (
+    LocalAIChannel,
+    LocalAIConnectionPool,
+    LocalAIPoolExhausted,
+    close_shared_pools,
+    shared_pool_stats,
+)
+from src.pipelines.local import LocalTTSAdapter
+from src.providers.local import LocalProvider
+
+
+class StubLocalAI:
+    """Just enough of local_ai_server's protocol to exercise the pool."""
+
+    def __init__(self, *, multiplex=True, auth_token=None):
+        self.multiplex = multiplex
+        self.auth_token = auth_token
+        self.connections = []
+        self.auths = 0
+        self.ended = []
+
+    async def handler(self, ws):
+        self.connections.append(ws)
+        framed = False
+        calls = {}
+        seq = 0
+        async for raw in ws:
+            if isinstance(raw, bytes):
+                frame = frames.decode_frame(raw)
+                call_id = calls.get(frame.call_hash)
+                await ws.send(json.dumps({"type": "stt_result", "call_id": call_id, "text": f"{len(frame.payload)} bytes"}))
+                continue
+            msg = json.loads(raw)
+            kind, call_id = msg["type"], msg.get("call_id")
+            if kind == "auth":
+                self.auths += 1
+                ok = msg.get("auth_token") == self.auth_token
+                await ws.send(json.dumps({"type": "auth_response", "status": "ok" if ok else "error"}))
+            elif kind == "negotiate":
+                framed = True
+                await ws.send(
+                    json.dumps(
+                        {
+                            "type": "negotiate_response",
+                            "binary_frames": {"version": 1, "codecs": ["pcm16le", "mulaw"], "header_bytes": 16},
+                            "multiplex": self.multiplex and bool(msg.get("multiplex")),
+                        }
+                    )
+                )
+            elif kind == "status":
+                await ws.send(json.dumps({"type": "status_response", "status": "healthy"}))
+            elif kind == "set_mode":
+                calls[frames.call_hash(call_id or "")] = call_id
+                await ws.send(json.dumps({"type": "mode_ready", "mode": msg.get("mode"), "call_id": call_id}))
+            elif kind == "tts_request":
+                audio = msg["text"].encode("ascii")
+                if not framed:
+                    await ws.send(
+                        json.dumps(
+                            {"type": "tts_response", "call_id": call_id, "audio_data": base64.b64encode(audio).decode()}
+                        )
+                    )
+                    continue
+                seq += 1
+                await ws.send(
+                    frames.encode_frame(
+                        frames.FRAME_KIND_TTS_AUDIO,
+                        audio,
+                        call_hash=frames.call_hash(call_id or ""),
+                        seq=seq,
+                        codec="mulaw",
+                        rate_hz=8000,
+                        flags=frames.FRAME_FLAG_END | frames.FRAME_FLAG_RESPONSE,
+                    )
+                )
+                await ws.send(
+                    json.dumps(
+                        {
+                            "type": "tts_response",
+                            "text": msg["text"],
+                            "call_id": call_id,
+                            "audio_transport": "frame",
+                            "frame_seq": seq,
+                        }
+                    )
+                )
+            elif kind == "call_end":
+                self.ended.append(call_id)
+
+
+@pytest.fixture
+async def stub():
+    servers = []
+
+    async def start(**kwargs):
+        local_ai = StubLocalAI(**kwargs)
+        server = await serve(local_ai.handler, "127.0.0.1", 0)
+        servers.append(server)
+        return local_ai, f"ws://127.0.0.1:{server.sockets[0].getsockname()[1]}"
+
+    yield start
+    for server in servers:
+        server.close()
+        await server.wait_closed()
+
+
+async def _tts(channel, text):
+    await channel.send(json.dumps({"type": "tts_request", "text": text}))
+    frame = frames.decode_frame(await asyncio.wait_for(channel.recv(), 2))
+    trailer = json.loads(await asyncio.wait_for(channel.recv(), 2))
+    assert frame.call_hash == frames.call_hash(channel.call_id)
+    assert (trailer["call_id"], trailer["frame_seq"]) == (channel.call_id, frame.seq)
+    return frame.payload
+
+
+async def _wait_for(predicate):
+    for _ in range(100):
+        if predicate():
+            return
+        await asyncio.sleep(0.02)
+    raise AssertionError("condition not reached")
+
+
+@pytest.mark.asyncio
+async def test_calls_multiplex_over_a_few_authenticated_connections(stub):
+    local_ai, url = await stub(auth_token="s3cret")
+    pool = LocalAIConnectionPool(url, auth_token="s3cret", size=2, max_channels_per_connection=8)
+    try:
+        await pool.start()
+        assert len(local_ai.connections) == 2 and local_ai.auths == 2
+
+        channels = await asyncio.gather(*(pool.open_channel(f"call-{n}") for n in range(6)))
+        replies = await asyncio.gather(*(_tts(ch, f"hello {ch.call_id}") for ch in channels))
+        assert replies == [f"hello call-{n}".encode() for n in range(6)]
+        assert all(ch.multiplexed and ch.frames_version == 1 for ch in channels)
+
+        # A second component for the same call gets its own server session; the
+        # channel hides the wire id from its caller in both directions.
+        extra = [await pool.open_channel("call-0") for _ in range(2)]
+        assert [ch.wire_id for ch in extra] == ["call-0", "call-0#2"]
+        assert extra[0]._connection is not channels[0]._connection
+        assert await _tts(extra[1], "second component") == b"second component"
+        await extra[1].send(json.dumps({"type": "set_mode", "mode": "stt"}))
+        assert json.loads(await extra[1].recv())["call_id"] == "call-0"
+        await extra[1].send(
+            frames.encode_frame(frames.FRAME_KIND_AUDIO, b"\x01" * 64, call_hash=frames.call_hash("call-0"), seq=0)
+        )
+        assert json.loads(await asyncio.wait_for(extra[1].recv(), 2)) == {
+            "type": "stt_result",
+            "call_id": "call-0",
+            "text": "64 bytes",
+        }
+
+        # Still two sockets for eight channels; utilization is visible.
+        assert len(local_ai.connections) == 2 and local_ai.auths == 2
+        stats = pool.stats()
+        assert (stats["connections"], stats["channels"], stats["capacity"]) == (2, 8, 16)
+        assert stats["utilization"] == 0.5 and stats["multiplex"] is True
+
+        for ch in channels + extra:
+            await ch.close()
+        await _wait_for(lambda: len(local_ai.ended) == 8)
+        assert sorted(local_ai.ended) == sorted(ch.wire_id for ch in channels + extra)
+        assert pool.stats()["channels"] == 0
+    finally:
+        await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_lost_connection_fails_over_to_a_healthy_one(stub):
+    local_ai, url = await stub()
+    pool = LocalAIConnectionPool(url, size=2, health_interval_sec=0.05)
+    try:
+        await pool.start()
+        a, b = await pool.open_channel("a"), await pool.open_channel("b")
+        assert a._connection is not b._connection
+
+        dropped = local_ai.connections[0]
+        lost, survivor = (a, b) if a._connection.websocket.local_address == dropped.remote_address else (b, a)
+        await dropped.close()
+        with pytest.raises(ConnectionClosedError):
+            await asyncio.wait_for(lost.recv(), 2)
+        assert lost.state.name == "CLOSED"
+        assert pool.failovers == 1
+
+        # Callers reconnect by taking a new channel; it is ready at once.
+        replacement = await pool.open_channel(lost.call_id, timeout=0.5)
+        assert await _tts(replacement, "back") == b"back"
+        assert await _tts(survivor, "unaffected") == b"unaffected"
+
+        # The health loop tops the pool back up.
+        await _wait_for(lambda: pool.stats()["connections"] == 2)
+        assert len(local_ai.connections) == 3
+    finally:
+        await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_acquire_waits_for_capacity_and_slow_consumers_drop_oldest(stub):
+    _, url = await stub()
+    pool = LocalAIConnectionPool(url, size=1, max_channels_per_connection=2, channel_queue_max=2)
+    try:
+        a, b = await pool.open_channel("a"), await pool.open_channel("b")
+        with pytest.raises(LocalAIPoolExhausted):
+            await pool.open_channel("c", timeout=0.1)
+
+        waiter = asyncio.create_task(pool.open_channel("c", timeout=2))
+        await asyncio.sleep(0.05)
+        assert not waiter.done()
+        await b.close()
+        c = await asyncio.wait_for(waiter, 2)
+        assert c.call_id == "c" and pool.stats()["acquire_waits_total"] == 2
+
+        # Nobody reads channel a: its queue keeps the newest two messages.
+        for mode in ("m1", "m2", "m3", "m4", "m5"):
+            await a.send(json.dumps({"type": "set_mode", "mode": mode}))
+        await _wait_for(lambda: pool.dropped_messages == 3)
+        assert [json.loads(await a.recv())["mode"] for _ in range(2)] == ["m4", "m5"]
+        assert await _tts(c, "not blocked") == b"not blocked"
+    finally:
+        await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_server_without_multiplex_gets_dedicated_connections(stub):
+    local_ai, url = await stub(multiplex=False)
+    pool = LocalAIConnectionPool(url, size=2)
+    try:
+        a = await pool.open_channel("a")
+        b = await pool.open_channel("b")
+        assert not a.multiplexed and not b.multiplexed
+        # Probe socket + one socket per channel.
+        assert len(local_ai.connections) == 3
+        # The consumer sees the negotiate_response, as on an unpooled socket.
+        assert json.loads(await a.recv())["type"] == "negotiate_response"
+        assert a.frames_version == 1
+
+        stats = pool.stats()
+        assert (stats["multiplex"], stats["connections"], stats["dedicated_connections"]) == (False, 0, 2)
+        await a.close()
+        await _wait_for(lambda: local_ai.connections[1].state.name == "CLOSED")
+        assert pool.stats()["dedicated_connections"] == 1
+    finally:
+        await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_tts_adapter_uses_pooled_channels(stub):
+    local_ai, url = await stub()
+    pool = LocalAIConnectionPool(url, size=1)
+    app_config = AppConfig(
+        default_provider="local",
+        providers={"local": {"enabled": True, "ws_url": url}},
+        asterisk={"host": "127.0.0.1", "username": "ari", "password": "secret"},
+        llm={"initial_greeting": "hi", "prompt": "prompt", "model": "local-llm"},
+        audio_transport="audiosocket",
+        downstream_mode="file",
+    )
+    adapter = LocalTTSAdapter(
+        "local_tts", app_config, LocalProviderConfig(ws_url=url, response_timeout_sec=2), {}, pool=pool
+    )
+    try:
+
+        async def speak(call_id):
+            await adapter.open_call(call_id, {})
+            return b"".join([chunk async for chunk in adapter.synthesize(call_id, f"hi {call_id}", {})])
+
+        audio = await asyncio.gather(*(speak(f"call-{n}") for n in range(3)))
+        assert audio == [b"hi call-0", b"hi call-1", b"hi call-2"]
+        assert len(local_ai.connections) == 1
+        await adapter.stop()
+        await _wait_for(lambda: sorted(local_ai.ended) == ["call-0", "call-1", "call-2"])
+    finally:
+        await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_provider_sessions_share_the_process_pool(stub):
+    local_ai, url = await stub()
+    config = LocalProviderConfig(ws_url=url, pool_size=1, response_timeout_sec=2)
+    providers = [LocalProvider(config, None) for _ in range(2)]
+    try:
+        for n, provider in enumerate(providers):
+            await provider.start_session(f"call-{n}")
+            assert isinstance(provider.websocket, LocalAIChannel)
+        assert await providers[1].text_to_speech("pooled") == b"pooled"
+        assert len(local_ai.connections) == 1
+        assert shared_pool_stats()[0]["channels"] == 2
+
+        for provider in providers:
+            await provider.stop_session()
+        await _wait_for(lambda: sorted(local_ai.ended) == ["call-0", "call-1"])
+        assert shared_pool_stats()[0]["channels"] == 0
+    finally:
+        await close_shared_pools()
@@ -0,0 +1,197 @@
+import asyncio
+import importlib.util
+import json
+import os
+import sys
+
+import pytest
+import websockets
+from websockets.asyncio.server import serve
+
+# local_ai_server uses flat imports and is not a package; load the module by path.
+_spec = importlib.util.spec_from_file_location(
+    "local_ai_supervisor",
+    os.path.join(os.path.dirname(__file__), "..", "local_ai_server", "supervisor.py"),
+)
+supervisor = importlib.util.module_from_spec(_spec)
+sys.modules[_spec.name] = supervisor
+_spec.loader.exec_module(supervisor)
+
+
+def test_parse_worker_pools():
+    assert supervisor.parse_worker_pools("") == {}
+    assert supervisor.parse_worker_pools("1") == {}
+    assert supervisor.parse_worker_pools("4") == {"any": 4}
+    assert supervisor.parse_worker_pools("stt=4, llm=1,tts=0") == {"stt": 4, "llm": 1}
+    with pytest.raises(ValueError):
+        supervisor.parse_worker_pools("gpu=2")
+
+
+def test_plan_and_rendezvous_affinity():
+    plan = supervisor.plan_workers({"stt": 3, "llm": 1}, base_port=9000)
+    assert [w.port for w in plan["stt"]] + [w.port for w in plan["llm"]] == [9000, 9001, 9002, 9003]
+
+    stt = plan["stt"]
+    first = {f"call-{i}": supervisor.rank_workers(stt, f"call-{i}")[0].name for i in range(300)}
+    assert first == {key: supervisor.rank_workers(stt, key)[0].name for key in first}
+    assert set(first.values()) == {"stt-0", "stt-1", "stt-2"}
+
+    # Losing a worker only moves the calls that were on it.
+    survivors = [w for w in stt if w.name != "stt-1"]
+    for key, name in first.items():
+        if name != "stt-1":
+            assert supervisor.rank_workers(survivors, key)[0].name == name
+
+
+def test_merge_status_aggregates_workers():
+    a, b = supervisor.plan_workers({"any": 2}, base_port=9000)["any"]
+
+    def status(loaded, queue_depth, p95):
+        return {
+            "type": "status_response",
+            "status": "ok",
+            "models": {"stt": {"loaded": True}, "tts": {"loaded": loaded}},
+            "tts_executor": {"queue_depth": queue_depth, "running": 1, "max_queue_depth": queue_depth,
+                             "service_time_ms": {"p95": p95}, "queue_wait_ms": {}},
+            "config": {"degraded": False},
+        }
+
+    merged = supervisor.merge_status([(a, status(True, 2, 300.0)), (b, status(False, 3, 500.0))])
+    assert merged["models"]["stt"]["loaded"] is True
+    assert merged["models"]["tts"]["loaded"] is False
+    assert merged["tts_executor"]["queue_depth"] == 5
+    assert merged["tts_executor"]["running"] == 2
+    assert merged["tts_executor"]["service_time_ms"]["p95"] == 500.0
+    assert [w["name"] for w in merged["workers"]] == ["any-0", "any-1"]
+
+    offline = supervisor.merge_status([(a, status(True, 0, 1.0)), (b, None)])
+    assert offline["config"]["degraded"] is True
+    assert offline["workers"][1]["ready"] is False
+
+
+async def _fake_worker(name, received):
+    async def handler(websocket):
+        async for message in websocket:
+            data = json.loads(message)
+            received.append((name, data["type"]))
+            if data["type"] == "status":
+                reply = {"type": "status_response", "status": "ok", "models": {}, "config": {}, "worker": name}
+            elif data["type"] == "barge_in":
+                continue
+            else:
+                reply = {"type": "echo", "worker": name, "call_id": data.get("call_id")}
+            await websocket.send(json.dumps(reply))
+
+    return await serve(handler, "127.0.0.1", 0)
+
+
+@pytest.mark.asyncio
+async def test_front_door_routes_by_stage_with_call_affinity():
+    received = []
+    plan = supervisor.plan_workers({"stt": 2, "tts": 1}, base_port=0)
+    servers = []
+    for worker in plan["stt"] + plan["tts"]:
+        server = await _fake_worker(worker.name, received)
+        worker.port = server.sockets[0].getsockname()[1]
+        worker.ready = True
+        servers.append(server)
+
+    front = supervisor.FrontDoor(plan)
+    front_server = await serve(front.handler, "127.0.0.1", 0)
+    url = f"ws://127.0.0.1:{front_server.sockets[0].getsockname()[1]}"
+    try:
+        expected_stt = supervisor.rank_workers(plan["stt"], "call-1")[0].name
+        for _ in range(2):
+            async with websockets.connect(url) as ws:
+                await ws.send(json.dumps({"type": "set_mode", "mode": "stt", "call_id": "call-1"}))
+                assert json.loads(await ws.recv())["worker"] == expected_stt
+                await ws.send(json.dumps({"type": "tts_request", "text": "hi", "call_id": "call-1"}))
+                assert json.loads(await ws.recv())["worker"] == "tts-0"
+                await ws.send(json.dumps({"type": "barge_in", "call_id": "call-1"}))
+
+                await ws.send(json.dumps({"type": "status"}))
+                status = json.loads(await ws.recv())
+                assert [w["name"] for w in status["workers"]] == ["stt-0", "stt-1", "tts-0"]
+                assert all(w["ready"] for w in status["workers"])
+        await asyncio.sleep(0.05)
+    finally:
+        front_server.close()
+        for server in servers:
+            server.close()
+
+    # barge_in reaches every worker the connection uses (full-mode TTS runs in the STT worker).
+    assert received.count((expected_stt, "barge_in")) == 2
+    assert received.count(("tts-0", "barge_in")) == 2
+
+
+def _free_port() -> int:
+    import socket
+
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class _StubServer:
+    """Just enough of LocalAIServer for the supervisor and ``run_worker``."""
+
+    kroko_embedded = False
+
+    def __init__(self):
+        from types import SimpleNamespace
+
+        self.config = SimpleNamespace(
+            ws_host="127.0.0.1",
+            ws_port=_free_port(),
+            ws_auth_token=None,
+            worker_base_port=_free_port(),
+            worker_preload=False,
+        )
+        self.active = self
+
+    def after_fork(self, name):
+        pass
+
+    async def initialize_models(self):
+        pass
+
+    async def handler(self, websocket):
+        await websocket.wait_closed()
+
+    async def shutdown(self):
+        pass
+
+
+def test_workers_are_forked_by_a_fork_server_and_restarted():
+    with open(supervisor.__file__) as source:
+        assert "_set_running_loop" not in source.read()
+
+    sup = supervisor.Supervisor(_StubServer(), {"any": 1})
+    # Forked here, while no event loop is running in this process.
+    sup.start_fork_server()
+    (worker,) = sup.workers
+
+    async def until(predicate):
+        deadline = asyncio.get_running_loop().time() + 15.0
+        while not predicate():
+            assert asyncio.get_running_loop().time() < deadline
+            await asyncio.sleep(0.05)
+
+    async def scenario():
+        running = asyncio.create_task(sup.run())
+        await until(lambda: worker.ready)
+        first = worker.pid
+        assert first not in (None, os.getpid(), sup._fork_server_pid)
+
+        os.kill(first, 9)
+        await until(lambda: worker.ready and worker.pid != first)
+        assert worker.restarts == 1
+        _, writer = await asyncio.open_connection("127.0.0.1", worker.port)
+        writer.close()
+
+        running.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await running
+        assert sup._fork_server_pid is None
+
+    asyncio.run(scenario())
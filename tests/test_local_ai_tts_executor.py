@@ -0,0 +1,208 @@
+import asyncio
+import importlib.util
+import os
+import sys
+import time
+
+import pytest
+
+# local_ai_server uses flat imports and is not a package; load the module by path.
+_spec = importlib.util.spec_from_file_location(
+    "local_ai_tts_executor",
+    os.path.join(os.path.dirname(__file__), "..", "local_ai_server", "tts_executor.py"),
+)
+tts_executor = importlib.util.module_from_spec(_spec)
+sys.modules[_spec.name] = tts_executor
+_spec.loader.exec_module(tts_executor)
+
+TTSExecutor = tts_executor.TTSExecutor
+TTSCancelledError = tts_executor.TTSCancelledError
+
+
+def _blocking_synth(text, seconds=0.3):
+    # Stands in for backend.synthesize(): holds the calling thread like a model does.
+    time.sleep(seconds)
+    return text.encode()
+
+
+async def _stt_partial_ticks(stop: asyncio.Event, latencies: list) -> None:
+    """Emulate STT partial emission: one 20 ms audio frame processed per tick."""
+    interval = 0.02
+    while not stop.is_set():
+        t0 = time.perf_counter()
+        await asyncio.sleep(interval)
+        latencies.append(time.perf_counter() - t0 - interval)
+
+
+async def _measure_partials_during(tts_coro_factory) -> float:
+    stop = asyncio.Event()
+    latencies = []
+    ticker = asyncio.create_task(_stt_partial_ticks(stop, latencies))
+    await asyncio.sleep(0.05)
+    await tts_coro_factory()
+    await asyncio.sleep(0.05)
+    stop.set()
+    await ticker
+    return max(latencies)
+
+
+@pytest.mark.asyncio
+async def test_stt_partial_latency_unaffected_while_tts_runs():
+    async def on_loop():
+        # Previous behavior: synthesize() called directly from the coroutine.
+        _blocking_synth("hello")
+        await asyncio.sleep(0)
+
+    executor = TTSExecutor(threads=2)
+
+    async def off_loop():
+        results = await asyncio.gather(
+            executor.submit(_blocking_synth, "one", session_key="a"),
+            executor.submit(_blocking_synth, "two", session_key="b"),
+        )
+        assert results == [b"one", b"two"]
+
+    try:
+        blocked = await _measure_partials_during(on_loop)
+        offloaded = await _measure_partials_during(off_loop)
+    finally:
+        await executor.shutdown()
+
+    assert blocked >= 0.25
+    assert offloaded < 0.05
+    stats = executor.stats()
+    assert stats["completed"] == 2
+    assert stats["service_time_ms"]["p95"] >= 250
+
+
+@pytest.mark.asyncio
+async def test_high_priority_jumps_queued_requests():
+    executor = TTSExecutor(threads=1)
+    order = []
+
+    def synth(name):
+        order.append(name)
+        time.sleep(0.02)
+        return name
+
+    try:
+        busy = asyncio.create_task(executor.submit(synth, "long-answer"))
+        await asyncio.sleep(0.005)
+        queued = [
+            asyncio.create_task(executor.submit(synth, "normal-1")),
+            asyncio.create_task(executor.submit(synth, "normal-2")),
+            asyncio.create_task(
+                executor.submit(synth, "greeting", priority=tts_executor.PRIORITY_HIGH)
+            ),
+        ]
+        await asyncio.sleep(0)
+        assert executor.stats()["queue_depth"] == 3
+        await asyncio.gather(busy, *queued)
+    finally:
+        await executor.shutdown()
+
+    assert order == ["long-answer", "greeting", "normal-1", "normal-2"]
+
+
+@pytest.mark.asyncio
+async def test_cancel_session_drops_queued_and_running_jobs():
+    executor = TTSExecutor(threads=1)
+    ran = []
+
+    def synth(name):
+        ran.append(name)
+        time.sleep(0.05)
+        return name
+
+    try:
+        running = asyncio.create_task(executor.submit(synth, "running", session_key="call-1"))
+        await asyncio.sleep(0.01)
+        queued = asyncio.create_task(executor.submit(synth, "queued", session_key="call-1"))
+        other = asyncio.create_task(executor.submit(synth, "other", session_key="call-2"))
+        await asyncio.sleep(0)
+
+        assert executor.cancel_session("call-1") == 2
+        with pytest.raises(TTSCancelledError):
+            await running
+        with pytest.raises(TTSCancelledError):
+            await queued
+        assert await other == "other"
+    finally:
+        await executor.shutdown()
+
+    # The queued job never reached a worker; the running one could not be interrupted.
+    assert ran == ["running", "other"]
+    assert executor.stats()["cancelled"] == 2
+
+
+def test_parse_priority():
+    assert tts_executor.parse_priority("HIGH") == tts_executor.PRIORITY_HIGH
+    assert tts_executor.parse_priority(None) == tts_executor.PRIORITY_NORMAL
+    assert tts_executor.parse_priority("bogus", tts_executor.PRIORITY_LOW) == tts_executor.PRIORITY_LOW
+    assert tts_executor.parse_priority(7) == tts_executor.PRIORITY_LOW
+
+
+@pytest.mark.asyncio
+async def test_priority_never_reorders_one_sessions_requests():
+    executor = TTSExecutor(threads=2)
+    order = []
+
+    def synth(name):
+        order.append(name)
+        time.sleep(0.02)
+        return name
+
+    try:
+        # A long first sentence, then a short one that would otherwise jump the queue.
+        jobs = [
+            asyncio.create_task(executor.submit(synth, "call-1 long", session_key="call-1")),
+            asyncio.create_task(
+                executor.submit(
+                    synth, "call-1 short", session_key="call-1", priority=tts_executor.PRIORITY_HIGH
+                )
+            ),
+            asyncio.create_task(executor.submit(synth, "call-1 last", session_key="call-1")),
+        ]
+        await asyncio.sleep(0.005)
+        other = asyncio.create_task(
+            executor.submit(synth, "call-2 greeting", session_key="call-2", priority=tts_executor.PRIORITY_HIGH)
+        )
+        assert await asyncio.gather(*jobs) == ["call-1 long", "call-1 short", "call-1 last"]
+        await other
+    finally:
+        await executor.shutdown()
+
+    assert [name for name in order if name.startswith("call-1")] == [
+        "call-1 long",
+        "call-1 short",
+        "call-1 last",
+    ]
+    # The other call still ran alongside the first one instead of behind all of it.
+    assert order.index("call-2 greeting") < order.index("call-1 last")
+
+
+@pytest.mark.asyncio
+async def test_non_thread_safe_jobs_never_overlap():
+    executor = TTSExecutor(threads=4)
+    active = []
+    peak = []
+
+    def synth(name):
+        active.append(name)
+        peak.append(len(active))
+        time.sleep(0.02)
+        active.remove(name)
+        return name
+
+    try:
+        results = await asyncio.gather(
+            *(
+                executor.submit(synth, f"call-{i}", session_key=f"call-{i}", thread_safe=False)
+                for i in range(4)
+            )
+        )
+    finally:
+        await executor.shutdown()
+
+    assert results == [f"call-{i}" for i in range(4)]
+    assert max(peak) == 1
@@ -0,0 +1,81 @@
+import asyncio
+import threading
+import time
+
+import pytest
+from prometheus_client import REGISTRY
+
+from src.core.loop_monitor import LoopMonitor, collect_profile, timed_stage
+
+
+def _sample(name, labels=None):
+    return REGISTRY.get_sample_value(name, labels or {}) or 0.0
+
+
+async def _hog_the_loop():
+    time.sleep(0.06)  # blocking call on the loop on purpose
+    await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_loop_monitor_measures_lag_and_attributes_slow_callbacks():
+    monitor = LoopMonitor(interval_sec=0.005, slow_callback_sec=0.03, enabled=True)
+    lag_count = _sample("ai_agent_event_loop_lag_seconds_count")
+    slow_label = {"callback": "_hog_the_loop"}
+    slow_before = _sample("ai_agent_event_loop_slow_callbacks_total", slow_label)
+
+    monitor.start()
+    try:
+        await asyncio.sleep(0.02)
+        await asyncio.create_task(_hog_the_loop())
+        await asyncio.sleep(0.02)
+    finally:
+        await monitor.stop()
+
+    assert monitor.samples > 0
+    assert _sample("ai_agent_event_loop_lag_seconds_count") > lag_count
+    assert monitor.max_lag_sec >= 0.03
+    assert monitor.snapshot()["slow_callbacks"]["_hog_the_loop"] == 1
+    assert _sample("ai_agent_event_loop_slow_callbacks_total", slow_label) == slow_before + 1
+
+    # Stopping restores the stock Handle implementation.
+    assert LoopMonitor._original_run is None
+
+
+@pytest.mark.asyncio
+async def test_timed_stage_observes_histogram():
+    @timed_stage("unit_test_stage")
+    async def stage(value):
+        await asyncio.sleep(0)
+        return value * 2
+
+    labels = {"stage": "unit_test_stage"}
+    before = _sample("ai_agent_hot_path_stage_seconds_count", labels)
+    assert await stage(21) == 42
+    assert stage.__name__ == "stage"
+    assert _sample("ai_agent_hot_path_stage_seconds_count", labels) == before + 1
+
+
+def test_collect_profile_returns_collapsed_stacks():
+    stop = threading.Event()
+
+    def busy_worker():
+        while not stop.is_set():
+            sum(range(1000))
+
+    worker = threading.Thread(target=busy_worker, name="busy-worker")
+    worker.start()
+    try:
+        collapsed = collect_profile(0.1, interval_sec=0.002, thread_id=worker.ident)
+    finally:
+        stop.set()
+        worker.join()
+
+    lines = collapsed.strip().splitlines()
+    assert lines
+    for line in lines:
+        stack, count = line.rsplit(" ", 1)
+        assert int(count) > 0
+        frames = stack.split(";")
+        assert frames[0] == "busy-worker"
+        assert any(frame.startswith("busy_worker (tests/test_loop_monitor.py:") for frame in frames)
@@ -0,0 +1,140 @@
+import asyncio
+import audioop
+import math
+import struct
+
+import pytest
+
+from src.audio.resampler import resample_audio
+from src.config import MediaWorkersConfig
+from src.core.media_workers import (
+    MediaChain,
+    MediaWorkerError,
+    MediaWorkerPool,
+    ShmRing,
+    condition_ingress,
+)
+from src.utils.audio_capture import AudioCaptureManager
+
+
+def _tone(samples, rate, freq=440.0, amp=8000, dc=0):
+    return b"".join(
+        struct.pack("<h", int(amp * math.sin(2 * math.pi * freq * i / rate)) + dc) for i in range(samples)
+    )
+
+
+def test_shm_ring_wraps_and_reports_full():
+    ring = ShmRing(4096)
+    try:
+        reader = ShmRing(4096, name=ring.name)
+        try:
+            records = [bytes([i]) * 700 for i in range(20)]
+            got = []
+            for record in records:
+                if not ring.try_put((record,)):
+                    # Consumer drains, then acks its tail back to the producer.
+                    while (item := reader.get(ring.head)) is not None:
+                        got.append(item)
+                    ring.tail = reader.tail
+                    assert ring.try_put((record,))
+            while (item := reader.get(ring.head)) is not None:
+                got.append(item)
+            assert got == records
+            assert ring.head > ring.capacity  # wrapped at least once
+            with pytest.raises(ValueError):
+                ring.try_put((b"x" * ring.max_record,))
+        finally:
+            reader.close()
+    finally:
+        ring.close()
+
+
+def test_provider_out_chain_keeps_resampler_state():
+    chunk = _tone(480, 24000)
+    chain = MediaChain()
+    first, rate, rms, _ = chain.provider_out(chunk, "slin16", 24000, 8000)
+    second, _, _, _ = chain.provider_out(chunk, "slin16", 24000, 8000)
+
+    expected_first, state = resample_audio(chunk, 24000, 8000)
+    expected_second, _ = resample_audio(chunk, 24000, 8000, state=state)
+    assert (first, second, rate) == (expected_first, expected_second, 8000)
+    assert rms == audioop.rms(chunk, 2)
+
+
+def test_condition_ingress_removes_dc_and_decodes_ulaw():
+    pcm, rate, _, dc = condition_ingress(_tone(320, 16000, dc=900), "slin16", 16000, False)
+    assert rate == 16000 and abs(dc) < 5
+
+    ulaw = audioop.lin2ulaw(_tone(160, 8000), 2)
+    pcm, rate, rms, _ = condition_ingress(ulaw, "ulaw", 16000, False)
+    assert rate == 8000 and len(pcm) == 320 and rms > 1000
+
+
+@pytest.mark.parametrize("mode", ["thread", "process"])
+async def test_pool_matches_inline(mode):
+    pool = MediaWorkerPool(mode=mode, workers=2, stages=("ingress", "provider_out"))
+    await pool.start()
+    try:
+        chunks = [_tone(480, 24000, freq=300 + 50 * i) for i in range(6)]
+        inline = {call: MediaChain() for call in ("a", "b", "c")}
+        jobs, expected = [], []
+        for chunk in chunks:
+            for call, chain in inline.items():
+                jobs.append(pool.provider_out(call, chunk, "slin16", 24000, 8000))
+                expected.append(chain.provider_out(chunk, "slin16", 24000, 8000))
+        assert list(await asyncio.gather(*jobs)) == expected
+
+        frame = _tone(320, 16000, dc=500)
+        assert await pool.ingress("a", frame, "slin16", 16000, False) == condition_ingress(frame, "slin16", 16000, False)
+
+        stats = pool.stats()
+        assert sorted(w["calls"] for w in stats["workers"]) == [1, 2]
+        pool.forget("a")
+        assert sum(w["calls"] for w in pool.stats()["workers"]) == 2
+    finally:
+        await pool.close()
+
+
+async def test_dead_process_worker_fails_pending_and_reroutes():
+    pool = MediaWorkerPool(mode="process", workers=2)
+    await pool.start()
+    try:
+        chunk = _tone(480, 24000)
+        await pool.provider_out("call", chunk, "slin16", 24000, 8000)
+        worker, _ = pool._calls["call"]
+        worker._process.kill()
+        with pytest.raises(MediaWorkerError):
+            for _ in range(50):
+                await pool.provider_out("call", chunk, "slin16", 24000, 8000)
+                await asyncio.sleep(0.02)
+        # The call moves to the surviving worker.
+        await pool.provider_out("call", chunk, "slin16", 24000, 8000)
+        assert pool._calls["call"][0] is not worker
+    finally:
+        await pool.close()
+
+
+def test_from_config_is_opt_in_and_validates():
+    assert MediaWorkerPool.from_config(MediaWorkersConfig()) is None
+    pool = MediaWorkerPool.from_config(MediaWorkersConfig(enabled=True, mode="thread", workers=3))
+    assert pool.mode == "thread" and len(pool.stats()["workers"]) == 3
+    assert not pool.handles("provider_out")  # not started yet
+    with pytest.raises(ValueError):
+        MediaWorkerPool(mode="gpu")
+    with pytest.raises(ValueError):
+        MediaWorkerPool(stages=("transcode",))
+
+
+def test_capture_background_writer_preserves_order(tmp_path):
+    capture = AudioCaptureManager(base_dir=str(tmp_path), keep_files=True)
+    capture.start_background_writer()
+    frames = [_tone(160, 8000, freq=200 + i) for i in range(10)]
+    for frame in frames:
+        capture.append_pcm16("call-1", "caller_inbound", frame, 8000)
+    capture.close_call("call-1")
+    capture.stop_background_writer()
+
+    import wave
+
+    with wave.open(str(tmp_path / "call-1" / "caller_inbound.wav"), "rb") as wf:
+        assert wf.readframes(wf.getnframes()) == b"".join(frames)
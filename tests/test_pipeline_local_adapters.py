@@ -67,6 +67,11 @@ class _MockWebSocket:
     def push(self, message):
         self._queue.put_nowait(message)
 
+    def sent_after_negotiate(self):
+        """Messages after the binary-frames offer (this mock never answers it)."""
+        assert json.loads(self.sent[0])["type"] == "negotiate"
+        return self.sent[1:]
+
 
 @pytest.mark.asyncio
 async def test_local_stt_adapter_transcribes(monkeypatch):
@@ -84,7 +89,7 @@ async def test_local_stt_adapter_transcribes(monkeypatch):
     await adapter.start()
     await adapter.open_call("call-1", {"mode": "stt"})
 
-    set_mode_message = json.loads(mock_ws.sent[0])
+    set_mode_message = json.loads(mock_ws.sent_after_negotiate()[0])
     assert set_mode_message == {"type": "set_mode", "mode": "stt", "call_id": "call-1"}
 
     audio_buffer = b"\x01\x02" * 80  # 160 bytes == 20 ms of 8 kHz PCM16
@@ -111,7 +116,7 @@ async def test_local_stt_adapter_transcribes(monkeypatch):
     transcript = await task
     assert transcript == "hello world"
 
-    audio_message = json.loads(mock_ws.sent[1])
+    audio_message = json.loads(mock_ws.sent_after_negotiate()[1])
     assert audio_message["type"] == "audio"
     assert audio_message["mode"] == "stt"
     decoded = base64.b64decode(audio_message["data"])
@@ -144,12 +149,16 @@ async def test_local_llm_adapter_generate(monkeypatch):
     )
     await asyncio.sleep(0)
 
-    mock_ws.push(json.dumps({"type": "llm_response", "text": "assistant reply"}))
+    llm_message = json.loads(mock_ws.sent_after_negotiate()[1])
+    # The answer to an earlier, cancelled request is skipped by request_id.
+    mock_ws.push(json.dumps({"type": "llm_response", "text": "stale reply", "request_id": "earlier"}))
+    mock_ws.push(
+        json.dumps({"type": "llm_response", "text": "assistant reply", "request_id": llm_message["request_id"]})
+    )
 
     response = await request_task
     assert response.text == "assistant reply"
 
-    llm_message = json.loads(mock_ws.sent[1])
     assert llm_message["type"] == "llm_request"
     assert llm_message["call_id"] == "call-2"
     assert llm_message["text"] == "user text"
@@ -190,7 +199,7 @@ async def test_local_tts_adapter_synthesizes(monkeypatch):
 
     assert collected == [audio_bytes]
 
-    tts_message = json.loads(mock_ws.sent[1])
+    tts_message = json.loads(mock_ws.sent_after_negotiate()[1])
     assert tts_message["type"] == "tts_request"
     assert tts_message["call_id"] == "call-3"
     assert tts_message["text"] == "Hello world"
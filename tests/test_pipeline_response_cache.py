@@ -0,0 +1,200 @@
+from prometheus_client import REGISTRY
+
+from src.config import AppConfig
+from src.pipelines.base import LLMComponent, LLMResponse, STTComponent, TTSComponent
+from src.pipelines.orchestrator import PipelineOrchestrator
+from src.pipelines.response_cache import (
+    CachedLLMComponent,
+    CachedTTSComponent,
+    ResponseCache,
+    ResponseCacheConfig,
+    normalize_utterance,
+)
+
+
+def _sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class _CountingLLM(LLMComponent):
+    component_key = "counting_llm"
+
+    def __init__(self, replies=None):
+        self.requests = []
+        self.replies = replies or {}
+
+    async def generate(self, call_id, transcript, context, options):
+        self.requests.append(transcript)
+        return self.replies.get(transcript) or LLMResponse(text=f"answer: {normalize_utterance(transcript)}")
+
+
+class _CountingTTS(TTSComponent):
+    def __init__(self):
+        self.requests = []
+
+    async def synthesize(self, call_id, text, options):
+        self.requests.append(text)
+        yield b"\x01" * 160
+        yield b"\x02" * 160
+
+
+class _NullSTT(STTComponent):
+    async def transcribe(self, call_id, audio_pcm16, sample_rate_hz, options):
+        return ""
+
+
+async def _speak(tts, text, options=None):
+    return [chunk async for chunk in tts.synthesize("c1", text, options or {})]
+
+
+def test_lookup_matches_exact_and_similar_utterances_within_namespace():
+    clock = _Clock()
+    cache = ResponseCache(ResponseCacheConfig(enabled=True, ttl_sec=60), clock=clock)
+    ns = cache.namespace({"system_prompt": "You are the front desk", "tools": ["transfer"]})
+
+    cache.store(ns, "What are your opening hours?", LLMResponse(text="We open at nine."))
+    assert cache.lookup(ns, "um, what are your opening hours") == "We open at nine."
+    assert cache.lookup(ns, "what are your opening hours today") == "We open at nine."
+    # One different word is a different question.
+    cache.store(ns, "what time do you open", "Nine.")
+    assert cache.lookup(ns, "what time do you close") is None
+
+    # A different prompt, tool allowlist or cache version is a different namespace.
+    assert cache.namespace({"system_prompt": "You are the front desk", "tools": ["transfer"]}) == ns
+    assert cache.lookup(cache.namespace({"system_prompt": "You are sales"}), "what are your opening hours") is None
+    bumped = ResponseCache(ResponseCacheConfig(enabled=True, version="2"))
+    assert bumped.namespace({"system_prompt": "You are the front desk", "tools": ["transfer"]}) != ns
+
+    clock.now += 61
+    assert cache.lookup(ns, "what are your opening hours") is None
+    assert len(cache) == 0
+
+
+def test_tool_replies_exclusions_and_short_utterances_are_never_served():
+    cache = ResponseCache(ResponseCacheConfig(enabled=True, exclude_patterns=[r"\bmanager\b"], min_words=2))
+    ns = cache.namespace({})
+    misses = _sample("ai_agent_response_cache_lookups_total", result="tool_intent")
+
+    transfer = LLMResponse(text="Connecting you now.", tool_calls=[{"name": "transfer", "parameters": {}}])
+    cache.store(ns, "transfer me to sales", transfer)
+    assert cache.lookup(ns, "transfer me to sales") is None
+    assert _sample("ai_agent_response_cache_lookups_total", result="tool_intent") == misses + 1
+    # A later plain-text answer to the same intent is not cached over the tool marker.
+    cache.store(ns, "transfer me to sales", "Sure, one moment.")
+    assert cache.lookup(ns, "transfer me to sales") is None
+    assert not cache.is_cached_reply("Sure, one moment.")
+
+    cache.store(ns, "can I talk to a manager", "No.")
+    assert cache.lookup(ns, "can I talk to a manager") is None
+    cache.store(ns, "yes", "Great.")
+    assert cache.lookup(ns, "yes") is None
+
+
+async def test_cached_adapters_skip_llm_and_replay_rendered_audio():
+    cache = ResponseCache(ResponseCacheConfig(enabled=True, max_entries=2))
+    llm, tts = _CountingLLM(), _CountingTTS()
+    cached_llm, cached_tts = CachedLLMComponent(llm, cache), CachedTTSComponent(tts, cache)
+    options = {"system_prompt": "front desk"}
+    audio_hits = _sample("ai_agent_response_cache_audio_total", result="hit")
+
+    first = await cached_llm.generate("c1", "what are your opening hours", {}, options)
+    first_audio = await _speak(cached_tts, first.text)
+    second = await cached_llm.generate("c2", "What are your opening hours?", {}, options)
+    second_audio = await _speak(cached_tts, second.text)
+
+    assert llm.requests == ["what are your opening hours"]
+    assert tts.requests == [first.text]
+    assert second.text == first.text and second.metadata == {"response_cache": "hit"}
+    assert second_audio == first_audio == [b"\x01" * 160, b"\x02" * 160]
+    assert _sample("ai_agent_response_cache_audio_total", result="hit") == audio_hits + 1
+
+    # Text that is not a cached reply (greetings, tool messages) always goes to TTS.
+    await _speak(cached_tts, "Hello and welcome")
+    assert tts.requests[-1] == "Hello and welcome"
+    # Different TTS options render separately.
+    await _speak(cached_tts, first.text, {"voice": "b"})
+    assert tts.requests.count(first.text) == 2
+
+    # Evicting the entry drops its audio too.
+    await cached_llm.generate("c1", "where are you located", {}, options)
+    await cached_llm.generate("c1", "what is your phone number", {}, options)
+    assert not cache.is_cached_reply(first.text)
+    assert cache.audio_for(first.text, "{}") is None
+
+    # Empty transcripts (tool-result continuations) bypass the cache.
+    await cached_llm.generate("c1", "", {}, options)
+    assert llm.requests[-1] == ""
+    assert cached_llm.component_key == "counting_llm"
+
+
+async def test_replies_are_never_shared_across_different_conversation_histories():
+    cache = ResponseCache(ResponseCacheConfig(enabled=True))
+    llm = _CountingLLM()
+
+    async def name_from_history(call_id, transcript, context, options):
+        llm.requests.append(transcript)
+        said = context["prior_messages"][-1]["content"]
+        return LLMResponse(text=f"Your name is {said.rsplit(' ', 1)[-1]}")
+
+    llm.generate = name_from_history
+    cached_llm = CachedLLMComponent(llm, cache)
+    options = {"system_prompt": "front desk"}
+    greeting = {"role": "assistant", "content": "Thanks for calling, how can I help?"}
+
+    def history(name):
+        return {"prior_messages": [greeting, {"role": "user", "content": f"my name is {name}"}]}
+
+    alice = await cached_llm.generate("c1", "what is my name", history("Alice"), options)
+    bob = await cached_llm.generate("c2", "what is my name", history("Bob"), options)
+    assert (alice.text, bob.text) == ("Your name is Alice", "Your name is Bob")
+    assert llm.requests == ["what is my name", "what is my name"]
+
+    # Turns that follow the same conversation (e.g. the first question after the greeting) still hit.
+    llm.generate = _CountingLLM.generate.__get__(llm)
+    first = await cached_llm.generate("c3", "what are your opening hours", {"prior_messages": [greeting]}, options)
+    again = await cached_llm.generate("c4", "what are your opening hours", {"prior_messages": [greeting]}, options)
+    assert again.text == first.text and again.metadata == {"response_cache": "hit"}
+
+
+def test_orchestrator_wraps_adapters_and_shares_cache_across_calls():
+    config = AppConfig(
+        default_provider="local",
+        providers={"local": {"enabled": True}},
+        asterisk={"host": "127.0.0.1", "username": "ari", "password": "secret"},
+        llm={"initial_greeting": "hi", "prompt": "prompt"},
+        pipelines={
+            "faq": {
+                "stt": "stub_stt",
+                "llm": "stub_llm",
+                "tts": "stub_tts",
+                "options": {"response_cache": {"enabled": True, "ttl_sec": 120}},
+            },
+            "plain": {"stt": "stub_stt", "llm": "stub_llm", "tts": "stub_tts"},
+        },
+        active_pipeline="faq",
+    )
+    registry = {
+        "stub_stt": lambda key, options: _NullSTT(),
+        "stub_llm": lambda key, options: _CountingLLM(),
+        "stub_tts": lambda key, options: _CountingTTS(),
+    }
+    orchestrator = PipelineOrchestrator(config, registry=registry)
+    orchestrator._started = True
+
+    first = orchestrator.get_pipeline("call-1", "faq")
+    second = orchestrator.get_pipeline("call-2", "faq")
+    plain = orchestrator.get_pipeline("call-3", "plain")
+
+    assert isinstance(first.llm_adapter, CachedLLMComponent)
+    assert isinstance(first.tts_adapter, CachedTTSComponent)
+    assert first.llm_adapter._cache is second.tts_adapter._cache
+    assert first.llm_adapter._cache.config.ttl_sec == 120
+    assert isinstance(plain.llm_adapter, _CountingLLM)
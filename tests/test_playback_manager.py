@@ -4,6 +4,8 @@ Unit tests for PlaybackManager.
 Tests the audio playback and TTS gating functionality.
 """
 
+import os
+
 import pytest
 import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -230,11 +232,127 @@ class TestPlaybackManager:
     
     @pytest.mark.asyncio
     async def test_audio_file_cleanup(self, playback_manager):
-        """Test audio file cleanup."""
-        with patch('os.path.exists', return_value=True) as mock_exists, \
-             patch('os.remove') as mock_remove:
+        """Test audio file cleanup is batched off the event loop."""
+        with patch('os.remove') as mock_remove:
             
             await playback_manager._cleanup_audio_file("/tmp/test.ulaw")
-            
-            mock_exists.assert_called_once_with("/tmp/test.ulaw")
+            mock_remove.assert_not_called()
+
+            await playback_manager.flush_pending_deletes()
             mock_remove.assert_called_once_with("/tmp/test.ulaw")
+
+
+class TestPlaybackMediaPipeline:
+    """Media cache and segmented (chained) file playback against a real directory."""
+
+    @pytest.fixture
+    async def session_store(self):
+        store = SessionStore()
+        await store.upsert_call(CallSession(
+            call_id="call-1",
+            caller_channel_id="chan-1",
+            bridge_id="bridge-1",
+            provider_name="local",
+        ))
+        return store
+
+    @pytest.fixture
+    def mock_ari_client(self):
+        mock_client = MagicMock()
+        mock_client.play_media_on_bridge_with_id = AsyncMock(return_value=True)
+        mock_client.play_media_on_channel_with_id = AsyncMock(return_value=True)
+        return mock_client
+
+    @pytest.mark.asyncio
+    async def test_identical_audio_reuses_cached_file(self, tmp_path, session_store, mock_ari_client):
+        manager = PlaybackManager(session_store, mock_ari_client, str(tmp_path), cleanup_interval_sec=0.05)
+        prompt = b"\x7f" * 1600
+
+        first, second = await asyncio.gather(
+            manager._create_audio_file(prompt, "greeting:call-1:1"),
+            manager._create_audio_file(prompt, "greeting:call-2:1"),
+        )
+        assert first == second
+        assert os.path.basename(first).startswith("audio-cache-")
+        assert len(list(tmp_path.iterdir())) == 1
+
+        # Released files stay cached for the next call; distinct content gets its own file.
+        await manager._cleanup_audio_file(first)
+        await manager._cleanup_audio_file(second)
+        assert await manager._create_audio_file(prompt, "greeting:call-3:1") == first
+        other = await manager._create_audio_file(b"\x00" * 1600, "response:call-3:2")
+        assert other != first
+
+        await manager._cleanup_audio_file(first)
+        await manager._cleanup_audio_file(other)
+        await manager.close()
+        assert list(tmp_path.iterdir()) == []
+
+    @pytest.mark.asyncio
+    async def test_long_audio_plays_as_chained_segments(self, tmp_path, session_store, mock_ari_client):
+        manager = PlaybackManager(session_store, mock_ari_client, str(tmp_path),
+                                  media_cache_bytes=0, segment_seconds=1.0)
+        audio = bytes(range(256)) * 100  # 3.2s of μ-law -> segments of 1s, 1s, 1.2s
+
+        playback_id = await manager.play_audio("call-1", audio, "response")
+        assert playback_id is not None
+        assert mock_ari_client.play_media_on_bridge_with_id.await_count == 1
+
+        for index in (1, 2):
+            segment_id = manager._active_segment_id(playback_id)
+            assert await manager.on_playback_finished(segment_id)
+            # Gating is held across segments; the next one is already playing.
+            session = await session_store.get_by_call_id("call-1")
+            assert playback_id in session.tts_tokens
+            assert not await manager.wait_for_playback_end("call-1", playback_id, timeout_sec=0.05)
+            _, media_uri, started_id = mock_ari_client.play_media_on_bridge_with_id.await_args.args
+            assert started_id == f"{playback_id}-seg{index}"
+
+        written = b"".join(
+            open(os.path.join(tmp_path, f"audio-{pid.replace(':', '-')}.ulaw"), "rb").read()
+            for pid in (playback_id, f"{playback_id}-seg1", f"{playback_id}-seg2")
+        )
+        assert written == audio
+
+        assert await manager.on_playback_finished(f"{playback_id}-seg2")
+        session = await session_store.get_by_call_id("call-1")
+        assert playback_id not in session.tts_tokens
+        assert await manager.wait_for_playback_end("call-1", playback_id, timeout_sec=0.05)
+        await manager.close()
+        assert list(tmp_path.iterdir()) == []
+
+    @pytest.mark.asyncio
+    async def test_barge_in_stops_segment_chain(self, tmp_path, session_store, mock_ari_client):
+        manager = PlaybackManager(session_store, mock_ari_client, str(tmp_path),
+                                  media_cache_bytes=0, segment_seconds=1.0)
+        playback_id = await manager.play_audio("call-1", b"\xff" * 40000, "response")
+
+        # Barge-in clears the gating token, then ARI reports the stopped playback.
+        await session_store.clear_gating_token("call-1", playback_id)
+        assert await manager.on_playback_finished(playback_id)
+        assert mock_ari_client.play_media_on_bridge_with_id.await_count == 1
+        assert playback_id not in manager._chains
+
+        await asyncio.sleep(0)
+        await manager.close()
+        assert list(tmp_path.iterdir()) == []
+
+    @pytest.mark.asyncio
+    async def test_orphan_sweep_leaves_other_shards_files_alone(self, tmp_path, session_store, mock_ari_client):
+        # Shards share one media dir: a restarted shard 1 must not delete shard 0's live prompts.
+        own_orphan = tmp_path / "audio-cache-s1-deadbeef.ulaw"
+        other_shard = tmp_path / "audio-cache-s0-deadbeef.ulaw"
+        for path in (own_orphan, other_shard):
+            path.write_bytes(b"\xff" * 160)
+            os.utime(path, (0, 0))
+
+        manager = PlaybackManager(session_store, mock_ari_client, str(tmp_path), shard_index=1)
+        cached = await manager._create_audio_file(b"\x7f" * 1600, "greeting:call-1:1")
+        assert os.path.basename(cached).startswith("audio-cache-s1-")
+
+        assert await manager.flush_pending_deletes() == 1
+        assert not own_orphan.exists()
+        assert other_shard.exists() and os.path.exists(cached)
+        await manager._cleanup_audio_file(cached)
+        await manager.close()
+        assert [p.name for p in tmp_path.iterdir()] == [other_shard.name]
@@ -0,0 +1,130 @@
+import json
+import subprocess
+import sys
+
+import pytest
+
+from src.config import load_config
+from src.core.plugins import PIPELINE_ADAPTERS, PROVIDERS, LazyRegistry, PluginRegistry, StartupTimeline
+from src.engine import Engine
+
+
+def test_plugin_registry_imports_on_first_load():
+    registry = PluginRegistry("test", {"minidom": "xml.dom.minidom:parseString", "session": ".core.session_bundles:SessionBundleCache"})
+    assert not registry.is_loaded("minidom")
+    parse = registry.load("minidom")
+    assert registry.load("minidom") is parse
+    assert registry.load("session").__name__ == "SessionBundleCache"
+    assert set(registry.stats()["loaded"]) == {"minidom", "session"}
+    with pytest.raises(KeyError):
+        registry.load("missing")
+
+
+def test_lazy_registry_builds_deferred_entries_once():
+    providers = LazyRegistry()
+    factories = LazyRegistry(providers.deferred)
+    builds = []
+
+    def build():
+        builds.append(1)
+        providers["p"] = "template"
+        factories["p"] = "factory"
+
+    providers.defer("p", build)
+    providers.defer("q", lambda: builds.append("q"))
+    assert list(providers) == []
+    assert factories.get("p") == "factory"
+    assert "p" in providers and providers["p"] == "template"
+    assert builds == [1]
+
+    # Dropping a deferred entry never builds it.
+    assert providers.pop("q", None) is None and "q" not in providers.deferred
+    assert builds == [1]
+
+
+def test_engine_import_skips_provider_and_adapter_modules():
+    code = (
+        "import json, sys; import src.engine; "
+        "print(json.dumps(sorted(m for m in sys.modules if m.startswith(('src.providers.', 'src.pipelines.')))))"
+    )
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+    modules = set(json.loads(out.strip().splitlines()[-1]))
+    assert modules <= {"src.providers.base", "src.providers.elevenlabs_config", "src.pipelines.base", "src.pipelines.orchestrator"}
+    assert PROVIDERS.names() and PIPELINE_ADAPTERS.names()
+
+
+async def test_load_providers_defers_providers_no_context_uses(monkeypatch):
+    monkeypatch.setenv("ASTERISK_ARI_USERNAME", "test")
+    monkeypatch.setenv("ASTERISK_ARI_PASSWORD", "test")
+    config = load_config("config/ai-agent.example.yaml")
+    config.default_provider = "deepgram"
+    engine = Engine.__new__(Engine)
+    engine.config = config
+    engine.providers = LazyRegistry()
+    engine.provider_factories = LazyRegistry(engine.providers.deferred)
+    engine.provider_alignment_issues = {}
+    loaded = []
+
+    def fake_load(name, data):
+        loaded.append(name)
+        engine.providers[name] = engine.provider_factories[name] = name
+        return True
+
+    engine._load_provider = fake_load
+    await engine._load_providers()
+
+    # deepgram is the default; non-plugin entries (pipeline adapters) go through _load_provider to be skipped.
+    assert "deepgram" in loaded and "google_live" not in loaded
+    assert "google_live" in engine.providers.deferred
+    assert engine.provider_factories.get("google_live") == "google_live"
+    assert loaded[-1] == "google_live" and "google_live" not in engine.providers.deferred
+
+
+async def test_deferred_providers_are_imported_off_loop_and_validated(monkeypatch):
+    import threading
+
+    monkeypatch.setenv("ASTERISK_ARI_USERNAME", "test")
+    monkeypatch.setenv("ASTERISK_ARI_PASSWORD", "test")
+    engine = Engine.__new__(Engine)
+    engine.config = load_config("config/ai-agent.example.yaml")
+    engine.providers = LazyRegistry()
+    engine.provider_factories = LazyRegistry(engine.providers.deferred)
+    import_threads, readiness_checks = [], []
+
+    class Template:
+        def is_ready(self):
+            readiness_checks.append(threading.current_thread())
+            return True
+
+    def fake_import(name):
+        import_threads.append(threading.current_thread())
+
+    def fake_load(name, data):
+        engine.providers[name] = Template()
+        engine.provider_factories[name] = Template
+        return True
+
+    monkeypatch.setattr(PROVIDERS, "load", fake_import)
+    engine._load_provider = fake_load
+    engine._defer_provider("google_live")
+
+    # A call asking for it before the background warm-up gets the same off-loop build.
+    await engine._ensure_provider_loaded("google_live")
+    assert import_threads and import_threads[0] is not threading.main_thread()
+    assert "google_live" not in engine.providers.deferred
+    assert isinstance(engine.providers.get("google_live"), Template)
+    # The startup readiness check still runs for providers built after startup.
+    assert readiness_checks == [threading.main_thread()]
+
+    await engine._warm_deferred_providers()
+    assert len(import_threads) == 1
+
+
+def test_startup_timeline_marks_phases():
+    timeline = StartupTimeline()
+    timeline.mark("load_config")
+    timeline.mark("providers")
+    timeline.mark_ready()
+    report = timeline.report()
+    assert list(report["phases_ms"]) == ["load_config", "providers"]
+    assert report["time_to_ready_ms"] >= sum(report["phases_ms"].values()) - 0.1
@@ -0,0 +1,338 @@
+import asyncio
+import json
+import socketserver
+import sqlite3
+import threading
+
+import pytest
+from aiohttp import web
+
+from src.core.post_call_jobs import (
+    PermanentJobError,
+    PostCallJobQueue,
+    PostCallJobStore,
+    get_post_call_queue,
+    set_post_call_queue,
+)
+from src.tools.business import smtp_client
+from src.tools.business.email_dispatcher import deliver_email, run_email_job
+from src.tools.context import PostCallContext
+from src.tools.http.generic_webhook import GenericWebhookTool, WebhookConfig, run_webhook_job
+
+
+class _SMTPHandler(socketserver.StreamRequestHandler):
+    def _reply(self, line: str) -> None:
+        self.wfile.write(line.encode() + b"\r\n")
+
+    def handle(self):
+        server = self.server.stand_in
+        server.connections += 1
+        self._reply("220 stand-in ESMTP")
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            verb = line.decode().strip().split(" ", 1)[0].upper()
+            if verb in ("EHLO", "HELO"):
+                self._reply("250-stand-in")
+                self._reply("250 8BITMIME")
+            elif verb == "RCPT" and server.reject_rcpt:
+                self._reply("550 5.1.1 mailbox unavailable")
+            elif verb == "DATA":
+                if server.fail_data > 0:
+                    server.fail_data -= 1
+                    self._reply("451 4.3.0 try again later")
+                    continue
+                self._reply("354 go ahead")
+                body = []
+                while True:
+                    data = self.rfile.readline()
+                    if data in (b".\r\n", b""):
+                        break
+                    body.append(data)
+                server.messages.append(b"".join(body).decode())
+                self._reply("250 2.0.0 queued")
+            elif verb == "QUIT":
+                self._reply("221 bye")
+                return
+            else:  # MAIL, RCPT, RSET, NOOP
+                self._reply("250 ok")
+
+
+class _SMTPStandIn:
+    """Local SMTP server that records messages and connection count."""
+
+    def __init__(self):
+        self.connections = 0
+        self.messages = []
+        self.fail_data = 0
+        self.reject_rcpt = False
+        self._server = socketserver.ThreadingTCPServer(("127.0.0.1", 0), _SMTPHandler)
+        self._server.daemon_threads = True
+        self._server.stand_in = self
+        self.port = self._server.server_address[1]
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+
+    def close(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+@pytest.fixture
+def smtp_server(monkeypatch):
+    server = _SMTPStandIn()
+    monkeypatch.setenv("SMTP_HOST", "127.0.0.1")
+    monkeypatch.setenv("SMTP_PORT", str(server.port))
+    monkeypatch.setenv("SMTP_TLS_MODE", "none")
+    monkeypatch.setattr(smtp_client, "_limiter", smtp_client._SMTPRateLimiter(max_per_second=1000))
+    smtp_client.close_pool()
+    yield server
+    smtp_client.close_pool()
+    server.close()
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    monkeypatch.setenv("CALL_HISTORY_ENABLED", "true")
+    return PostCallJobStore(db_path=str(tmp_path / "call_history.db"))
+
+
+@pytest.fixture
+async def queue(store):
+    q = PostCallJobQueue(store, workers=2, backoff_base_sec=0.01, backoff_max_sec=0.02, poll_interval_sec=0.02)
+    q.register("email", run_email_job)
+    q.register("webhook", run_webhook_job)
+    yield q
+    set_post_call_queue(None)
+    await q.stop(timeout=1.0)
+
+
+async def _settle(store, *, timeout=5.0):
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while loop.time() < deadline:
+        counts = (await store.stats())["by_state"]
+        if counts["pending"] == 0 and counts["running"] == 0:
+            return {j["id"]: j for j in (await store.list_jobs(page_size=200))["jobs"]}
+        await asyncio.sleep(0.02)
+    raise AssertionError("jobs did not settle")
+
+
+def _email(subject, to="ops@example.com"):
+    return {"from": "agent@example.com", "to": to, "subject": subject, "text": "call summary"}
+
+
+@pytest.mark.asyncio
+async def test_queued_emails_are_idempotent_and_reuse_one_smtp_session(smtp_server, store, queue):
+    await queue.start()
+    set_post_call_queue(queue)
+    assert get_post_call_queue() is queue
+
+    async def burst(subjects):
+        return [
+            await deliver_email(
+                email_data=_email(subject),
+                tool_config={"provider": "smtp"},
+                call_id="call-1",
+                log_label="Email summary",
+                recipient="ops@example.com",
+            )
+            for subject in subjects
+        ]
+
+    first = await burst(["Call A", "Call B", "Call C", "Call A"])
+    assert all(r["queued"] for r in first)
+    assert first[0]["job_id"] == first[3]["job_id"]
+    await _settle(store)
+    second = await burst(["Call D", "Call E", "Call F", "Call B"])
+    assert second[3]["job_id"] == first[1]["job_id"]  # already sent: not sent again
+
+    jobs = await _settle(store)
+    assert len(jobs) == 6
+    assert {j["state"] for j in jobs.values()} == {"done"}
+    assert len(smtp_server.messages) == 6
+    # At most one session per worker, reused across both bursts.
+    assert 1 <= smtp_server.connections <= queue.workers
+
+
+@pytest.mark.asyncio
+async def test_transient_failures_retry_and_permanent_ones_dead_letter(smtp_server, store, queue):
+    smtp_server.fail_data = 1
+    await queue.start()
+    set_post_call_queue(queue)
+    ok = await deliver_email(
+        email_data=_email("Transcript"), tool_config={"provider": "smtp"},
+        call_id="call-2", log_label="Transcript", recipient="ops@example.com",
+    )
+    jobs = await _settle(store)
+    assert jobs[ok["job_id"]]["state"] == "done"
+    assert jobs[ok["job_id"]]["attempts"] == 2
+    assert len(smtp_server.messages) == 1
+
+    smtp_server.reject_rcpt = True
+    bad = await deliver_email(
+        email_data=_email("Transcript", to="nobody@example.com"), tool_config={"provider": "smtp"},
+        call_id="call-2", log_label="Transcript", recipient="nobody@example.com",
+    )
+    jobs = await _settle(store)
+    assert jobs[bad["job_id"]]["state"] == "dead"
+    assert jobs[bad["job_id"]]["attempts"] == 1
+    assert "SMTPRecipientsRefused" in jobs[bad["job_id"]]["last_error"]
+
+    # A dead job can be retried from the Admin UI with a fresh attempt budget.
+    smtp_server.reject_rcpt = False
+    assert await store.retry(bad["job_id"])
+    jobs = await _settle(store)
+    assert jobs[bad["job_id"]]["state"] == "done"
+    assert len(smtp_server.messages) == 2
+
+
+@pytest.mark.asyncio
+async def test_exhausted_attempts_dead_letter(store):
+    calls = []
+
+    async def flaky(payload):
+        calls.append(payload)
+        raise ConnectionError("endpoint down")
+
+    async def rejected(payload):
+        raise PermanentJobError("bad request")
+
+    q = PostCallJobQueue(store, workers=1, max_attempts=3, backoff_base_sec=0.01, backoff_max_sec=0.01,
+                         poll_interval_sec=0.02)
+    q.register("flaky", flaky)
+    q.register("rejected", rejected)
+    await q.start()
+    try:
+        flaky_id = await q.enqueue("flaky", {"n": 1}, idempotency_key="flaky-1")
+        rejected_id = await q.enqueue("rejected", {}, idempotency_key="rejected-1")
+        jobs = await _settle(store)
+    finally:
+        await q.stop(timeout=1.0)
+    assert len(calls) == 3
+    assert jobs[flaky_id]["state"] == "dead"
+    assert jobs[flaky_id]["attempts"] == 3
+    assert jobs[flaky_id]["last_error"] == "ConnectionError: endpoint down"
+    assert jobs[rejected_id]["attempts"] == 1
+    assert 0.005 <= q.backoff_seconds(1) <= 0.01
+
+
+def test_expired_leases_are_reclaimed_after_a_crash(store):
+    first = store.enqueue_sync("email", {"to": "a"}, idempotency_key="k1", call_id="call-3")
+    again = store.enqueue_sync("email", {"to": "a"}, idempotency_key="k1", call_id="call-3")
+    assert first["created"] and not again["created"] and again["id"] == first["id"]
+
+    claimed = store.claim_sync(limit=5, lease_seconds=60)
+    assert [j["id"] for j in claimed] == [first["id"]]
+    assert claimed[0]["payload"] == {"to": "a"}
+    assert store.claim_sync(limit=5, lease_seconds=60) == []
+
+    # The process holding the lease died: once the lease expires the job is claimable again.
+    conn = sqlite3.connect(store._db_path)
+    conn.execute("UPDATE post_call_jobs SET leased_until_utc = '2000-01-01T00:00:00.000000+00:00'")
+    conn.commit()
+    conn.close()
+    reclaimed = store.claim_sync(limit=5, lease_seconds=60)
+    assert reclaimed[0]["attempts"] == 2
+
+    # Claimed-but-unstarted jobs returned at shutdown do not burn an attempt.
+    assert store.release_sync([first["id"]]) == 1
+    assert store.claim_sync(limit=5, lease_seconds=60)[0]["attempts"] == 2
+
+
+def test_only_the_current_lease_holder_finishes_a_job(store):
+    job = store.enqueue_sync("webhook", {}, idempotency_key="k2")
+    (first,) = store.claim_sync(limit=1, lease_seconds=60)
+    assert store.renew_sync(job["id"], first["lease_id"], lease_seconds=60)
+
+    # The first worker stalled past its lease and another worker re-leased the job.
+    conn = sqlite3.connect(store._db_path)
+    conn.execute("UPDATE post_call_jobs SET leased_until_utc = '2000-01-01T00:00:00.000000+00:00'")
+    conn.commit()
+    conn.close()
+    (second,) = store.claim_sync(limit=1, lease_seconds=60)
+    assert second["lease_id"] != first["lease_id"]
+
+    assert not store.renew_sync(job["id"], first["lease_id"], lease_seconds=60)
+    assert not store.complete_sync(job["id"], first["lease_id"])
+    assert not store.fail_sync(job["id"], first["lease_id"], "late", retry_in_seconds=None)
+    assert store.complete_sync(job["id"], second["lease_id"])
+
+
+@pytest.mark.asyncio
+async def test_running_jobs_keep_their_lease(store):
+    started, release = asyncio.Event(), asyncio.Event()
+
+    async def slow(payload):
+        started.set()
+        await release.wait()
+
+    def leased_until():
+        conn = sqlite3.connect(store._db_path)
+        try:
+            return conn.execute("SELECT leased_until_utc FROM post_call_jobs").fetchone()[0]
+        finally:
+            conn.close()
+
+    q = PostCallJobQueue(store, workers=1, poll_interval_sec=0.02, lease_sec=1.0)
+    q.register("slow", slow)
+    await q.start()
+    try:
+        job_id = await q.enqueue("slow", {}, idempotency_key="slow-1")
+        await asyncio.wait_for(started.wait(), 2)
+        first = leased_until()
+        await asyncio.sleep(0.5)
+        # Renewed while the handler runs, so no other worker can claim it.
+        assert leased_until() > first
+        assert store.claim_sync(limit=1, lease_seconds=1) == []
+        release.set()
+        jobs = await _settle(store)
+    finally:
+        await q.stop(timeout=1.0)
+    assert jobs[job_id]["state"] == "done" and jobs[job_id]["attempts"] == 1
+
+
+@pytest.mark.asyncio
+async def test_queued_webhook_resolves_secrets_at_send_time(store, queue, monkeypatch):
+    received = []
+    statuses = [503, 200, 404]
+
+    async def hook(request):
+        received.append((request.headers.get("Authorization"), json.loads(await request.text())))
+        return web.Response(status=statuses[len(received) - 1])
+
+    app = web.Application()
+    app.router.add_post("/hook", hook)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    monkeypatch.setenv("HOOK_TOKEN", "s3cret")
+    try:
+        await queue.start()
+        set_post_call_queue(queue)
+        tool = GenericWebhookTool(WebhookConfig(
+            name="crm",
+            url=f"http://127.0.0.1:{port}/hook",
+            headers={"Authorization": "Bearer ${HOOK_TOKEN}"},
+            payload_template='{"call_id": "{call_id}", "key": "${HOOK_TOKEN}"}',
+        ))
+        await tool.execute(PostCallContext(call_id="call-4", caller_number="1001"))
+        await tool.execute(PostCallContext(call_id="call-4", caller_number="1001"))  # duplicate post-call run
+        jobs = await _settle(store)
+        await tool.execute(PostCallContext(call_id="call-5", caller_number="1001"))
+        jobs.update(await _settle(store))
+    finally:
+        await runner.cleanup()
+
+    assert received[0] == ("Bearer s3cret", {"call_id": "call-4", "key": "s3cret"})
+    assert len(received) == 3
+    by_call = {j["call_id"]: j for j in jobs.values()}
+    assert (by_call["call-4"]["state"], by_call["call-4"]["attempts"]) == ("done", 2)
+    assert (by_call["call-5"]["state"], by_call["call-5"]["attempts"]) == ("dead", 1)
+
+    conn = sqlite3.connect(store._db_path)
+    persisted = " ".join(r[0] for r in conn.execute("SELECT payload_json FROM post_call_jobs"))
+    conn.close()
+    assert "s3cret" not in persisted
@@ -0,0 +1,143 @@
+import re
+import types
+
+import pytest
+
+from src.core.models import CallSession
+from src.core.session_bundles import PromptTemplate, SessionBundleCache
+from src.core.transport_orchestrator import TransportOrchestrator
+from src.engine import Engine
+from src.tools.base import Tool, ToolCategory, ToolDefinition, ToolPhase
+from src.tools.registry import tool_registry
+
+
+def _legacy_substitute(text, substitutions):
+    def replace_match(match):
+        key = match.group(1)
+        if key in substitutions:
+            return substitutions[key]
+        underscore_key = key.replace(".", "_")
+        if underscore_key in substitutions:
+            return substitutions[underscore_key]
+        return match.group(0)
+
+    return re.sub(r"\{([\w.]+)\}", replace_match, text)
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "You are a helpful agent.",
+        "Hi {caller_name}, calling from {caller_number}.",
+        "{patient.name} / {unknown} / {lead_id}{call_direction} {not closed",
+        "{} {{caller_name}} {caller_name",
+    ],
+)
+def test_prompt_template_matches_regex_substitution(text):
+    subs = {"caller_name": "Ana", "caller_number": "+15550100", "patient_name": "Bo", "lead_id": "", "call_direction": "inbound"}
+    template = PromptTemplate(text)
+    assert template.render(subs) == _legacy_substitute(text, subs)
+    assert template.static == (re.search(r"\{[\w.]+\}", text) is None)
+
+
+def test_bundle_cache_builds_once_and_invalidates_atomically():
+    cache = SessionBundleCache()
+    builds = []
+
+    def build():
+        builds.append(1)
+        return object()
+
+    first = cache.session(("h", "p", None, "sales"), build)
+    assert cache.session(("h", "p", None, "sales"), build) is first
+    assert len(builds) == 1
+
+    cache.invalidate()
+    assert cache.session(("h", "p", None, "sales"), build) is not first
+    assert cache.stats()["invalidations"] == 1
+    assert len(builds) == 2
+
+
+def _tool(name, is_global=False):
+    class _T(Tool):
+        @property
+        def definition(self):
+            return ToolDefinition(
+                name=name,
+                description=name,
+                category=ToolCategory.BUSINESS,
+                phase=ToolPhase.IN_CALL,
+                is_global=is_global,
+            )
+
+        async def execute(self, parameters, context):
+            return {"status": "success"}
+
+    return _T
+
+
+def test_registry_schema_memo_follows_registration():
+    tool_registry.clear()
+    try:
+        tool_registry.register(_tool("tool_a"))
+        first = tool_registry.to_openai_realtime_schema_filtered(["tool_a"])
+        assert tool_registry.to_openai_realtime_schema_filtered(["tool_a"])[0] is first[0]
+
+        tool_registry.register(_tool("tool_b", is_global=True))
+        assert [s["name"] for s in tool_registry.to_deepgram_schema_filtered(["tool_a", "tool_b"])] == ["tool_a", "tool_b"]
+        tools = tool_registry.get_tools_for_context(ToolPhase.IN_CALL, ["tool_a"])
+        assert sorted(t.definition.name for t in tools) == ["tool_a", "tool_b"]
+
+        tool_registry.unregister("tool_b")
+        tools = tool_registry.get_tools_for_context(ToolPhase.IN_CALL, ["tool_a"])
+        assert [t.definition.name for t in tools] == ["tool_a"]
+    finally:
+        tool_registry.clear()
+
+
+def _make_engine(prompt="Hello {caller_name}"):
+    cfg = {
+        "profiles": {
+            "default": "telephony_ulaw_8k",
+            "telephony_ulaw_8k": {
+                "internal_rate_hz": 8000,
+                "transport_out": {"encoding": "ulaw", "sample_rate_hz": 8000},
+                "provider_pref": {"input_encoding": "ulaw", "input_sample_rate_hz": 8000},
+            },
+        },
+        "contexts": {"sales": {"prompt": prompt, "tools": ["tool_a"]}},
+    }
+    engine = Engine.__new__(Engine)
+    engine.providers = {"deepgram": types.SimpleNamespace(config=None)}
+    engine._config_hash = "hash-1"
+    engine.transport_orchestrator = TransportOrchestrator(cfg)
+    return engine
+
+
+def test_engine_session_bundle_is_shared_and_copies_transport():
+    tool_registry.clear()
+    try:
+        tool_registry.register(_tool("tool_a"))
+        engine = _make_engine()
+        session = CallSession(call_id="c1", caller_channel_id="c1", caller_name="Ana")
+        provider = engine.providers["deepgram"]
+        channel_vars = {"AI_CONTEXT": "sales"}
+
+        bundle = engine._session_bundle(session, "deepgram", provider, channel_vars)
+        assert engine._session_bundle(session, "deepgram", provider, channel_vars) is bundle
+        assert bundle.context.in_call_tools == ("tool_a",)
+        assert bundle.context.prompt.render(engine._prompt_substitutions(session)) == "Hello Ana"
+        transport = bundle.new_transport()
+        assert transport == bundle.transport and transport is not bundle.transport
+
+        # A per-call provider instance bypasses the cache.
+        assert engine._session_bundle(session, "deepgram", types.SimpleNamespace(config=None), channel_vars) is not bundle
+
+        # /reload: new hash + invalidation -> rebuilt from the new orchestrator.
+        engine.transport_orchestrator = _make_engine(prompt="Bye {caller_name}").transport_orchestrator
+        engine._config_hash = "hash-2"
+        engine._bundle_cache().invalidate()
+        rebuilt = engine._session_bundle(session, "deepgram", provider, channel_vars)
+        assert rebuilt.context.prompt.render(engine._prompt_substitutions(session)) == "Bye Ana"
+    finally:
+        tool_registry.clear()
@@ -219,3 +219,82 @@ class TestSessionStore:
         stats = await session_store.get_session_stats()
         assert stats["active_calls"] == 1
         assert stats["active_playbacks"] == 1
+
+    @pytest.mark.asyncio
+    async def test_secondary_indexes_follow_upserts(self, session_store):
+        """Counts come from indexes that track mutations at each upsert."""
+        calls = [
+            CallSession(call_id="in_1", caller_channel_id="in_1", provider_name="local"),
+            CallSession(call_id="out_1", caller_channel_id="out_1", provider_name="deepgram",
+                        is_outbound=True, outbound_campaign_id="spring"),
+            CallSession(call_id="out_2", caller_channel_id="out_2", provider_name="deepgram",
+                        is_outbound=True, outbound_campaign_id="spring"),
+            CallSession(call_id="out_3", caller_channel_id="out_3", provider_name="local",
+                        is_outbound=True),
+        ]
+        for session in calls:
+            await session_store.upsert_call(session)
+
+        assert await session_store.count_active_outbound_calls() == 3
+        assert await session_store.count_active_outbound_calls(campaign_id="spring") == 2
+        assert await session_store.count_active_outbound_calls(campaign_id="fall") == 0
+        assert session_store.count_by_provider("deepgram") == 2
+        assert session_store.count_by_status("initializing") == 4
+
+        calls[1].provider_name = "local"
+        calls[1].status = "connected"
+        await session_store.upsert_call(calls[1])
+        await session_store.remove_call("out_2")
+
+        assert await session_store.count_active_outbound_calls(campaign_id="spring") == 1
+        assert session_store.count_by_provider("deepgram") == 0
+        stats = await session_store.get_session_stats()
+        assert stats["outbound_calls"] == 2
+        assert stats["by_provider"] == {"local": 3}
+        assert stats["by_status"] == {"initializing": 2, "connected": 1}
+
+    @pytest.mark.asyncio
+    async def test_session_ref_tracks_replacement_and_removal(self, session_store, sample_session):
+        """A cached SessionRef re-resolves only when the call's session object changes."""
+        ref = session_store.ref("test_call_123")
+        assert ref.get() is None
+
+        await session_store.upsert_call(sample_session)
+        assert ref.get() is sample_session
+        assert session_store.peek_by_call_id("test_call_123") is sample_session
+
+        sample_session.status = "connected"
+        await session_store.upsert_call(sample_session)
+        assert ref.get() is sample_session
+
+        replacement = CallSession(call_id="test_call_123", caller_channel_id="1758498324.399")
+        await session_store.upsert_call(replacement)
+        assert ref.get() is replacement
+
+        await session_store.remove_call("test_call_123")
+        assert ref.get() is None
+
+    @pytest.mark.asyncio
+    async def test_remove_clears_every_channel_the_call_used(self, session_store, sample_session):
+        """Channels replaced during the call are unmapped on removal too."""
+        sample_session.external_media_id = "em_1"
+        await session_store.upsert_call(sample_session)
+        sample_session.external_media_id = "em_2"
+        await session_store.upsert_call(sample_session)
+        assert await session_store.get_by_channel_id("em_1") is sample_session
+
+        await session_store.add_playback(PlaybackRef(
+            playback_id="pb_1",
+            call_id="test_call_123",
+            channel_id="1758498324.399",
+            bridge_id="bridge_123",
+            media_uri="sound:test",
+            audio_file="/tmp/test.ulaw"
+        ))
+        assert await session_store.list_playbacks_for_call("test_call_123") == ["pb_1"]
+
+        await session_store.remove_call("test_call_123")
+        for channel_id in ("1758498324.399", "Local/test@ai-agent-media-fork/n", "em_1", "em_2"):
+            assert await session_store.get_by_channel_id(channel_id) is None
+        await session_store.pop_playback("pb_1")
+        assert await session_store.list_playbacks_for_call("test_call_123") == []
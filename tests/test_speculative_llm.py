@@ -0,0 +1,210 @@
+import asyncio
+
+import pytest
+from prometheus_client import REGISTRY
+
+from src.config import AppConfig
+from src.core.models import CallSession
+from src.engine import Engine
+from src.pipelines.base import LLMComponent, LLMResponse, STTComponent, TTSComponent
+from src.pipelines.speculation import SpeculativeGenerator, estimate_output_tokens, normalize_transcript
+
+
+def _sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+class _ScriptedLLM(LLMComponent):
+    """Answers after a fixed delay; records every request and every cancellation."""
+
+    def __init__(self, delay=0.05):
+        self.delay = delay
+        self.requests = []
+        self.cancelled = []
+
+    async def generate(self, call_id, transcript, context, options):
+        self.requests.append(transcript)
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled.append(transcript)
+            raise
+        return LLMResponse(text=f"reply to {transcript}", metadata={"usage": {"completion_tokens": 7}})
+
+
+class _ScriptedStreamingSTT(STTComponent):
+    """Streaming STT stand-in: each send_audio() plays the next scripted interim/final result."""
+
+    def __init__(self, events):
+        self.events = list(events)
+        self.results = asyncio.Queue()
+
+    async def transcribe(self, call_id, audio_pcm16, sample_rate_hz, options):
+        return ""
+
+    async def start_stream(self, call_id, options):
+        self.options = dict(options)
+
+    async def send_audio(self, call_id, audio, fmt="pcm16_16k"):
+        if not self.events:
+            return
+        kind, text = self.events.pop(0)
+        if kind == "partial":
+            self._emit_partial(call_id, text)
+        else:
+            await self.results.put(text)
+
+    async def iter_results(self, call_id):
+        while True:
+            text = await self.results.get()
+            if text is None:
+                break
+            yield text
+
+    async def stop_stream(self, call_id):
+        await self.results.put(None)
+
+
+class _SilentTTS(TTSComponent):
+    async def synthesize(self, call_id, text, options):
+        yield b"\xff" * 160
+
+
+class _Resolution:
+    def __init__(self, stt, llm, llm_options):
+        self.pipeline_name = "spec"
+        self.stt_adapter = stt
+        self.llm_adapter = llm
+        self.tts_adapter = _SilentTTS()
+        self.stt_options = {"streaming": True, "chunk_ms": 80}
+        self.llm_options = llm_options
+        self.tts_options = {}
+        self.prepared = True
+
+
+async def test_generator_commits_matching_final_and_reports_saved_time():
+    llm = _ScriptedLLM(delay=0.05)
+    spec = SpeculativeGenerator("c1", lambda text: llm.generate("c1", text, {}, {}), stable_partials=2)
+    hits = _sample("ai_agent_speculative_llm_outcomes_total", outcome="hit")
+
+    spec.on_partial("book a table")
+    assert not spec.active  # seen once: not stable yet
+    spec.on_partial("book a table")
+    assert spec.active and spec.text == "book a table"
+    spec.on_partial("book a table")  # still the same speculation
+    await asyncio.sleep(0.08)
+
+    result = await spec.take("Book a table.")
+    assert result.text == "reply to book a table"
+    assert llm.requests == ["book a table"]
+    assert spec.stats["hits"] == 1 and spec.stats["saved_seconds"] >= 0.04
+    assert _sample("ai_agent_speculative_llm_outcomes_total", outcome="hit") == hits + 1
+    assert await spec.take("book a table") is None  # consumed
+
+
+async def test_generator_restarts_on_new_interim_and_cancels_on_divergent_final():
+    llm = _ScriptedLLM(delay=0.05)
+    spec = SpeculativeGenerator("c1", lambda text: llm.generate("c1", text, {}, {}), stable_partials=2)
+    wasted = _sample("ai_agent_speculative_llm_wasted_tokens_total")
+
+    for text in ("what time do", "what time do"):
+        spec.on_partial(text)
+    await asyncio.sleep(0)
+    for text in ("what time do you close", "what time do you close"):
+        spec.on_partial(text)
+    await asyncio.sleep(0)
+    assert llm.cancelled == ["what time do"]
+    assert spec.stats["superseded"] == 1
+
+    await asyncio.sleep(0.08)  # finishes: its output is wasted on a miss
+    assert await spec.take("what time do you open") is None
+    assert spec.stats["misses"] == 1 and spec.stats["wasted_tokens"] == 7
+    assert _sample("ai_agent_speculative_llm_wasted_tokens_total") == wasted + 7
+
+    spec.on_partial("hi")
+    spec.on_partial("hi")
+    assert not spec.active  # below min_words
+
+
+def test_transcript_normalization_and_token_estimate():
+    assert normalize_transcript("  Book a TABLE, please! ") == normalize_transcript("book a table please")
+    assert normalize_transcript("I'm here") == "i'm here"
+    assert estimate_output_tokens(LLMResponse(text="x" * 40)) == 10
+    assert estimate_output_tokens("abcdef") == 2
+    assert SpeculativeGenerator.from_options("c1", None, {}) is None
+    assert SpeculativeGenerator.from_options("c1", None, {"speculative": True, "speculative_min_words": 5}).min_words == 5
+
+
+async def test_pipeline_runner_speculates_on_interim_transcripts(monkeypatch):
+    app_config = AppConfig(
+        **{
+            "default_provider": "local",
+            "providers": {"local": {"enabled": True}},
+            "asterisk": {"host": "127.0.0.1", "port": 8088, "username": "u", "password": "p", "app_name": "ai-voice-agent"},
+            "llm": {"initial_greeting": "", "prompt": "You are helpful", "model": "gpt-4o"},
+            "pipelines": {"spec": {}},
+            "active_pipeline": "spec",
+            "audio_transport": "externalmedia",
+            "downstream_mode": "file",
+        }
+    )
+    engine = Engine(app_config)
+    engine.pipeline_orchestrator._started = True
+
+    stt = _ScriptedStreamingSTT(
+        [
+            # Turn 1: interim settles and matches the final -> committed.
+            ("partial", "book a table"),
+            ("partial", "book a table"),
+            ("final", "Book a table."),
+            # Turn 2: interim settles, but the final diverges -> cancelled and regenerated.
+            ("partial", "what time do"),
+            ("partial", "what time do"),
+            ("final", "what time do you open"),
+        ]
+    )
+    llm = _ScriptedLLM(delay=0.05)
+    resolution = _Resolution(stt, llm, {"speculative": True, "speculative_stable_partials": 2})
+    monkeypatch.setattr(engine.pipeline_orchestrator, "get_pipeline", lambda call_id, name=None: resolution)
+
+    played = []
+
+    async def fake_play_audio(call_id, audio, playback_type):
+        played.append(playback_type)
+        return None
+
+    monkeypatch.setattr(engine.playback_manager, "play_audio", fake_play_audio)
+
+    call_id = "call-spec"
+    session = CallSession(call_id=call_id, caller_channel_id=call_id)
+    session.pipeline_name = "spec"
+    await engine.session_store.upsert_call(session)
+    hits = _sample("ai_agent_speculative_llm_outcomes_total", outcome="hit")
+    misses = _sample("ai_agent_speculative_llm_outcomes_total", outcome="miss")
+
+    await engine._ensure_pipeline_runner(session, forced=True)
+    queue = engine._pipeline_queues[call_id]
+    chunk = b"\x00\x00" * 1280  # 80 ms at 16 kHz: one send_audio per chunk
+
+    for _ in range(3):
+        await queue.put(chunk)
+        await asyncio.sleep(0.02)
+    for _ in range(100):
+        if len(played) == 1:
+            break
+        await asyncio.sleep(0.01)
+    for _ in range(3):
+        await queue.put(chunk)
+        await asyncio.sleep(0.02)
+    await queue.put(None)
+    await asyncio.wait_for(engine._pipeline_tasks[call_id], 5)
+
+    assert stt.options["interim_results"] is True
+    assert llm.requests == ["book a table", "what time do", "what time do you open"]
+    assert llm.cancelled == ["what time do"]
+    assert played == ["pipeline-tts", "pipeline-tts"]
+    assert _sample("ai_agent_speculative_llm_outcomes_total", outcome="hit") == hits + 1
+    assert _sample("ai_agent_speculative_llm_outcomes_total", outcome="miss") == misses + 1
+    history = [m["content"] for m in session.conversation_history]
+    assert history == ["Book a table.", "reply to book a table", "what time do you open", "reply to what time do you open"]
+    await engine._cleanup_call(call_id)
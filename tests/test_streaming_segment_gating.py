@@ -133,3 +133,46 @@ async def test_start_streaming_playback_normalizes_externalmedia_ulaw(monkeypatc
     assert info.get("target_format") == "ulaw"
     assert info.get("target_sample_rate") == 8000
 
+
+
+@pytest.mark.asyncio
+async def test_pcm_source_encodes_to_ulaw_without_diag_taps(monkeypatch):
+    """Regression test: PCM16 -> μ-law egress must not depend on diagnostic taps being enabled."""
+    session_store = SessionStore()
+    call_id = "call-pcm-ulaw"
+    await session_store.upsert_call(
+        CallSession(call_id=call_id, caller_channel_id=call_id, provider_name="pipeline")
+    )
+
+    mgr = StreamingPlaybackManager(
+        session_store=session_store,
+        ari_client=_DummyARI(),
+        conversation_coordinator=None,
+        streaming_config={},
+        audio_transport="audiosocket",
+    )
+    mgr.audiosocket_format = "ulaw"
+
+    class _DummyTask:
+        def cancel(self):
+            return None
+
+    def _fake_create_task(coro):
+        try:
+            coro.close()
+        except Exception:
+            pass
+        return _DummyTask()
+
+    monkeypatch.setattr(asyncio, "create_task", _fake_create_task)
+
+    await mgr.start_streaming_playback(
+        call_id,
+        asyncio.Queue(),
+        playback_type="pipeline-tts",
+        source_encoding="slin16",
+        source_sample_rate=8000,
+    )
+    assert not mgr.diag_enable_taps
+    out = await mgr._process_audio_chunk(call_id, b"\x10\x00" * 160)
+    assert out is not None and len(out) == 160